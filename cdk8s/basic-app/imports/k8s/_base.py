@@ -0,0 +1,92 @@
+# Generated by tools/k8s_codegen.py, shared by the modules in _kinds.
+import abc
+import builtins
+import datetime
+import enum
+import typing
+import jsii
+import publication
+import typing_extensions
+import typeguard
+from importlib.metadata import version as _metadata_package_version
+TYPEGUARD_MAJOR_VERSION = int(_metadata_package_version('typeguard').split('.')[0])
+def check_type(argname: str, value: object, expected_type: typing.Any) -> typing.Any:
+    if TYPEGUARD_MAJOR_VERSION <= 2:
+        return typeguard.check_type(argname=argname, value=value, expected_type=expected_type) # type:ignore
+    else:
+        if isinstance(value, jsii._reference_map.InterfaceDynamicProxy): # pyright: ignore [reportAttributeAccessIssue]
+           pass
+        else:
+            if TYPEGUARD_MAJOR_VERSION == 3:
+                typeguard.config.collection_check_strategy = typeguard.CollectionCheckStrategy.ALL_ITEMS # type:ignore
+                typeguard.check_type(value=value, expected_type=expected_type) # type:ignore
+            else:
+                typeguard.check_type(value=value, expected_type=expected_type, collection_check_strategy=typeguard.CollectionCheckStrategy.ALL_ITEMS) # type:ignore
+import cdk8s as _cdk8s_d3d9af27
+import constructs as _constructs_77d1e7e8
+
+import os
+
+# Whether constructors check their arguments with typeguard. Off under python -O,
+# with CDK8S_TYPECHECK=0 in the environment, or after set_typecheck(False).
+TYPECHECK = __debug__ and os.environ.get("CDK8S_TYPECHECK", "1") != "0"
+
+
+def set_typecheck(enabled: bool) -> None:
+    global TYPECHECK
+    TYPECHECK = enabled
+
+
+# Whether structs are interned: constructing a struct equal to one constructed
+# before returns that instance, so the same selector, port or probe repeated
+# across a chart is kept once. Off unless CDK8S_INTERN=1 or set_interning(True).
+# Interned structs are shared, so lists and maps passed to them must not be
+# changed afterwards.
+INTERN = os.environ.get("CDK8S_INTERN") == "1"
+
+_interned: typing.Dict[typing.Any, typing.Any] = {}
+
+
+def set_interning(enabled: bool) -> None:
+    global INTERN
+    INTERN = enabled
+
+
+def clear_interned() -> None:
+    """Forgets the interned structs, which are kept until then otherwise."""
+    _interned.clear()
+
+
+def _intern_key(value: typing.Any) -> typing.Any:
+    # equal for equal values; anything else, e.g. a struct, is compared by
+    # identity, which for interned structs is the same as by value
+    kind = type(value)
+    if kind is str:
+        return value
+    if kind is list or kind is tuple:
+        return list, tuple([_intern_key(item) for item in value])
+    if kind is dict:
+        return dict, tuple([(key, _intern_key(item)) for key, item in value.items()])
+    if kind is int or kind is float or kind is bool or isinstance(value, enum.Enum):
+        return kind, value
+    return id(value)
+
+
+class Struct:
+    """Base of the generated structs, which keep their fields in __slots__."""
+
+    __slots__ = ()
+
+    def __new__(cls, **kwargs: typing.Any) -> typing.Any:
+        if not INTERN:
+            return super().__new__(cls)
+        key: typing.List[typing.Any] = [cls]
+        for name in sorted(kwargs):
+            value = kwargs[name]
+            if value is not None:
+                key.append(name)
+                key.append(_intern_key(value))
+        instance = _interned.get(tuple(key))
+        if instance is None:
+            instance = _interned[tuple(key)] = super().__new__(cls)
+        return instance
@@ -0,0 +1,126 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NodeAffinity import NodeAffinity
+from .PodAffinity import PodAffinity
+from .PodAntiAffinity import PodAntiAffinity
+
+
+@jsii.data_type(
+    jsii_type="k8s.Affinity",
+    jsii_struct_bases=[],
+    name_mapping={
+        "node_affinity": "nodeAffinity",
+        "pod_affinity": "podAffinity",
+        "pod_anti_affinity": "podAntiAffinity",
+    },
+)
+class Affinity(_base.Struct):
+    __slots__ = (
+        "_value_node_affinity",
+        "_value_pod_affinity",
+        "_value_pod_anti_affinity",
+    )
+
+    def __init__(
+        self,
+        *,
+        node_affinity: typing.Optional[typing.Union["NodeAffinity", typing.Dict[builtins.str, typing.Any]]] = None,
+        pod_affinity: typing.Optional[typing.Union["PodAffinity", typing.Dict[builtins.str, typing.Any]]] = None,
+        pod_anti_affinity: typing.Optional[typing.Union["PodAntiAffinity", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Affinity is a group of affinity scheduling rules.
+
+        :param node_affinity: Describes node affinity scheduling rules for the pod.
+        :param pod_affinity: Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
+        :param pod_anti_affinity: Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
+
+        :schema: io.k8s.api.core.v1.Affinity
+        '''
+        if isinstance(node_affinity, dict):
+            node_affinity = NodeAffinity(**node_affinity)
+        if isinstance(pod_affinity, dict):
+            pod_affinity = PodAffinity(**pod_affinity)
+        if isinstance(pod_anti_affinity, dict):
+            pod_anti_affinity = PodAntiAffinity(**pod_anti_affinity)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b0b5f1aeea5be7ebc9dd226948240c3fe007bf069ec377c716b2c8df75f266a9)
+            check_type(argname="argument node_affinity", value=node_affinity, expected_type=type_hints["node_affinity"])
+            check_type(argname="argument pod_affinity", value=pod_affinity, expected_type=type_hints["pod_affinity"])
+            check_type(argname="argument pod_anti_affinity", value=pod_anti_affinity, expected_type=type_hints["pod_anti_affinity"])
+        self._value_node_affinity = node_affinity
+        self._value_pod_affinity = pod_affinity
+        self._value_pod_anti_affinity = pod_anti_affinity
+
+    @builtins.property
+    def node_affinity(self) -> typing.Optional["NodeAffinity"]:
+        '''Describes node affinity scheduling rules for the pod.
+
+        :schema: io.k8s.api.core.v1.Affinity#nodeAffinity
+        '''
+        result = self._value_node_affinity
+        return typing.cast(typing.Optional["NodeAffinity"], result)
+
+    @builtins.property
+    def pod_affinity(self) -> typing.Optional["PodAffinity"]:
+        '''Describes pod affinity scheduling rules (e.g. co-locate this pod in the same node, zone, etc. as some other pod(s)).
+
+        :schema: io.k8s.api.core.v1.Affinity#podAffinity
+        '''
+        result = self._value_pod_affinity
+        return typing.cast(typing.Optional["PodAffinity"], result)
+
+    @builtins.property
+    def pod_anti_affinity(self) -> typing.Optional["PodAntiAffinity"]:
+        '''Describes pod anti-affinity scheduling rules (e.g. avoid putting this pod in the same node, zone, etc. as some other pod(s)).
+
+        :schema: io.k8s.api.core.v1.Affinity#podAntiAffinity
+        '''
+        result = self._value_pod_anti_affinity
+        return typing.cast(typing.Optional["PodAntiAffinity"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_node_affinity is not None:
+            values["node_affinity"] = self._value_node_affinity
+        if self._value_pod_affinity is not None:
+            values["pod_affinity"] = self._value_pod_affinity
+        if self._value_pod_anti_affinity is not None:
+            values["pod_anti_affinity"] = self._value_pod_anti_affinity
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Affinity(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b0b5f1aeea5be7ebc9dd226948240c3fe007bf069ec377c716b2c8df75f266a9(
+    *,
+    node_affinity: typing.Optional[typing.Union[NodeAffinity, typing.Dict[builtins.str, typing.Any]]] = None,
+    pod_affinity: typing.Optional[typing.Union[PodAffinity, typing.Dict[builtins.str, typing.Any]]] = None,
+    pod_anti_affinity: typing.Optional[typing.Union[PodAntiAffinity, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
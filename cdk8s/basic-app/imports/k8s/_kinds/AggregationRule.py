@@ -0,0 +1,82 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.AggregationRule",
+    jsii_struct_bases=[],
+    name_mapping={"cluster_role_selectors": "clusterRoleSelectors"},
+)
+class AggregationRule(_base.Struct):
+    __slots__ = (
+        "_value_cluster_role_selectors",
+    )
+
+    def __init__(
+        self,
+        *,
+        cluster_role_selectors: typing.Optional[typing.Sequence[typing.Union["LabelSelector", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''AggregationRule describes how to locate ClusterRoles to aggregate into the ClusterRole.
+
+        :param cluster_role_selectors: ClusterRoleSelectors holds a list of selectors which will be used to find ClusterRoles and create the rules. If any of the selectors match, then the ClusterRole's permissions will be added
+
+        :schema: io.k8s.api.rbac.v1.AggregationRule
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c6abea0d97901d2b42508f6bafd4b7f3b8e99dae1eb38751770090a223a1158b)
+            check_type(argname="argument cluster_role_selectors", value=cluster_role_selectors, expected_type=type_hints["cluster_role_selectors"])
+        self._value_cluster_role_selectors = cluster_role_selectors
+
+    @builtins.property
+    def cluster_role_selectors(self) -> typing.Optional[typing.List["LabelSelector"]]:
+        '''ClusterRoleSelectors holds a list of selectors which will be used to find ClusterRoles and create the rules.
+
+        If any of the selectors match, then the ClusterRole's permissions will be added
+
+        :schema: io.k8s.api.rbac.v1.AggregationRule#clusterRoleSelectors
+        '''
+        result = self._value_cluster_role_selectors
+        return typing.cast(typing.Optional[typing.List["LabelSelector"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_cluster_role_selectors is not None:
+            values["cluster_role_selectors"] = self._value_cluster_role_selectors
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "AggregationRule(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c6abea0d97901d2b42508f6bafd4b7f3b8e99dae1eb38751770090a223a1158b(
+    *,
+    cluster_role_selectors: typing.Optional[typing.Sequence[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
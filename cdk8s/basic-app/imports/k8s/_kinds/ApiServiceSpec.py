@@ -0,0 +1,207 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ServiceReference import ServiceReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.ApiServiceSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "group_priority_minimum": "groupPriorityMinimum",
+        "version_priority": "versionPriority",
+        "ca_bundle": "caBundle",
+        "group": "group",
+        "insecure_skip_tls_verify": "insecureSkipTlsVerify",
+        "service": "service",
+        "version": "version",
+    },
+)
+class ApiServiceSpec(_base.Struct):
+    __slots__ = (
+        "_value_group_priority_minimum",
+        "_value_version_priority",
+        "_value_ca_bundle",
+        "_value_group",
+        "_value_insecure_skip_tls_verify",
+        "_value_service",
+        "_value_version",
+    )
+
+    def __init__(
+        self,
+        *,
+        group_priority_minimum: jsii.Number,
+        version_priority: jsii.Number,
+        ca_bundle: typing.Optional[builtins.str] = None,
+        group: typing.Optional[builtins.str] = None,
+        insecure_skip_tls_verify: typing.Optional[builtins.bool] = None,
+        service: typing.Optional[typing.Union["ServiceReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        version: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''APIServiceSpec contains information for locating and communicating with a server.
+
+        Only https is supported, though you are able to disable certificate verification.
+
+        :param group_priority_minimum: GroupPriorityMininum is the priority this group should have at least. Higher priority means that the group is preferred by clients over lower priority ones. Note that other versions of this group might specify even higher GroupPriorityMininum values such that the whole group gets a higher priority. The primary sort is based on GroupPriorityMinimum, ordered highest number to lowest (20 before 10). The secondary sort is based on the alphabetical comparison of the name of the object. (v1.bar before v1.foo) We'd recommend something like: *.k8s.io (except extensions) at 18000 and PaaSes (OpenShift, Deis) are recommended to be in the 2000s
+        :param version_priority: VersionPriority controls the ordering of this API version inside of its group. Must be greater than zero. The primary sort is based on VersionPriority, ordered highest to lowest (20 before 10). Since it's inside of a group, the number can be small, probably in the 10s. In case of equal version priorities, the version string will be used to compute the order inside a group. If the version string is "kube-like", it will sort above non "kube-like" version strings, which are ordered lexicographically. "Kube-like" versions start with a "v", then are followed by a number (the major version), then optionally the string "alpha" or "beta" and another number (the minor version). These are sorted first by GA > beta > alpha (where GA is a version with no suffix such as beta or alpha), and then by comparing major version, then minor version. An example sorted list of versions: v10, v2, v1, v11beta2, v10beta3, v3beta1, v12alpha1, v11alpha2, foo1, foo10.
+        :param ca_bundle: CABundle is a PEM encoded CA bundle which will be used to validate an API server's serving certificate. If unspecified, system trust roots on the apiserver are used.
+        :param group: Group is the API group name this server hosts.
+        :param insecure_skip_tls_verify: InsecureSkipTLSVerify disables TLS certificate verification when communicating with this server. This is strongly discouraged. You should use the CABundle instead.
+        :param service: Service is a reference to the service for this API server. It must communicate on port 443. If the Service is nil, that means the handling for the API groupversion is handled locally on this server. The call will simply delegate to the normal handler chain to be fulfilled.
+        :param version: Version is the API version this server hosts. For example, "v1"
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIServiceSpec
+        '''
+        if isinstance(service, dict):
+            service = ServiceReference(**service)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__f218ab0fc666c93118e68a7a785bfe54888e33ebd68f9d3998ddac4e96d4a04d)
+            check_type(argname="argument group_priority_minimum", value=group_priority_minimum, expected_type=type_hints["group_priority_minimum"])
+            check_type(argname="argument version_priority", value=version_priority, expected_type=type_hints["version_priority"])
+            check_type(argname="argument ca_bundle", value=ca_bundle, expected_type=type_hints["ca_bundle"])
+            check_type(argname="argument group", value=group, expected_type=type_hints["group"])
+            check_type(argname="argument insecure_skip_tls_verify", value=insecure_skip_tls_verify, expected_type=type_hints["insecure_skip_tls_verify"])
+            check_type(argname="argument service", value=service, expected_type=type_hints["service"])
+            check_type(argname="argument version", value=version, expected_type=type_hints["version"])
+        self._value_group_priority_minimum = group_priority_minimum
+        self._value_version_priority = version_priority
+        self._value_ca_bundle = ca_bundle
+        self._value_group = group
+        self._value_insecure_skip_tls_verify = insecure_skip_tls_verify
+        self._value_service = service
+        self._value_version = version
+
+    @builtins.property
+    def group_priority_minimum(self) -> jsii.Number:
+        '''GroupPriorityMininum is the priority this group should have at least.
+
+        Higher priority means that the group is preferred by clients over lower priority ones. Note that other versions of this group might specify even higher GroupPriorityMininum values such that the whole group gets a higher priority. The primary sort is based on GroupPriorityMinimum, ordered highest number to lowest (20 before 10). The secondary sort is based on the alphabetical comparison of the name of the object.  (v1.bar before v1.foo) We'd recommend something like: *.k8s.io (except extensions) at 18000 and PaaSes (OpenShift, Deis) are recommended to be in the 2000s
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIServiceSpec#groupPriorityMinimum
+        '''
+        result = self._value_group_priority_minimum
+        assert result is not None, "Required property 'group_priority_minimum' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def version_priority(self) -> jsii.Number:
+        '''VersionPriority controls the ordering of this API version inside of its group.
+
+        Must be greater than zero. The primary sort is based on VersionPriority, ordered highest to lowest (20 before 10). Since it's inside of a group, the number can be small, probably in the 10s. In case of equal version priorities, the version string will be used to compute the order inside a group. If the version string is "kube-like", it will sort above non "kube-like" version strings, which are ordered lexicographically. "Kube-like" versions start with a "v", then are followed by a number (the major version), then optionally the string "alpha" or "beta" and another number (the minor version). These are sorted first by GA > beta > alpha (where GA is a version with no suffix such as beta or alpha), and then by comparing major version, then minor version. An example sorted list of versions: v10, v2, v1, v11beta2, v10beta3, v3beta1, v12alpha1, v11alpha2, foo1, foo10.
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIServiceSpec#versionPriority
+        '''
+        result = self._value_version_priority
+        assert result is not None, "Required property 'version_priority' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def ca_bundle(self) -> typing.Optional[builtins.str]:
+        '''CABundle is a PEM encoded CA bundle which will be used to validate an API server's serving certificate.
+
+        If unspecified, system trust roots on the apiserver are used.
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIServiceSpec#caBundle
+        '''
+        result = self._value_ca_bundle
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def group(self) -> typing.Optional[builtins.str]:
+        '''Group is the API group name this server hosts.
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIServiceSpec#group
+        '''
+        result = self._value_group
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def insecure_skip_tls_verify(self) -> typing.Optional[builtins.bool]:
+        '''InsecureSkipTLSVerify disables TLS certificate verification when communicating with this server.
+
+        This is strongly discouraged.  You should use the CABundle instead.
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIServiceSpec#insecureSkipTLSVerify
+        '''
+        result = self._value_insecure_skip_tls_verify
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def service(self) -> typing.Optional["ServiceReference"]:
+        '''Service is a reference to the service for this API server.
+
+        It must communicate on port 443. If the Service is nil, that means the handling for the API groupversion is handled locally on this server. The call will simply delegate to the normal handler chain to be fulfilled.
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIServiceSpec#service
+        '''
+        result = self._value_service
+        return typing.cast(typing.Optional["ServiceReference"], result)
+
+    @builtins.property
+    def version(self) -> typing.Optional[builtins.str]:
+        '''Version is the API version this server hosts.
+
+        For example, "v1"
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIServiceSpec#version
+        '''
+        result = self._value_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "group_priority_minimum": self._value_group_priority_minimum,
+            "version_priority": self._value_version_priority,
+        }
+        if self._value_ca_bundle is not None:
+            values["ca_bundle"] = self._value_ca_bundle
+        if self._value_group is not None:
+            values["group"] = self._value_group
+        if self._value_insecure_skip_tls_verify is not None:
+            values["insecure_skip_tls_verify"] = self._value_insecure_skip_tls_verify
+        if self._value_service is not None:
+            values["service"] = self._value_service
+        if self._value_version is not None:
+            values["version"] = self._value_version
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ApiServiceSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__f218ab0fc666c93118e68a7a785bfe54888e33ebd68f9d3998ddac4e96d4a04d(
+    *,
+    group_priority_minimum: jsii.Number,
+    version_priority: jsii.Number,
+    ca_bundle: typing.Optional[builtins.str] = None,
+    group: typing.Optional[builtins.str] = None,
+    insecure_skip_tls_verify: typing.Optional[builtins.bool] = None,
+    service: typing.Optional[typing.Union[ServiceReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    version: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
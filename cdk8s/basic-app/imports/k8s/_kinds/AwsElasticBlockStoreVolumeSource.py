@@ -0,0 +1,146 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.AwsElasticBlockStoreVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "volume_id": "volumeId",
+        "fs_type": "fsType",
+        "partition": "partition",
+        "read_only": "readOnly",
+    },
+)
+class AwsElasticBlockStoreVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_volume_id",
+        "_value_fs_type",
+        "_value_partition",
+        "_value_read_only",
+    )
+
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+        partition: typing.Optional[jsii.Number] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''Represents a Persistent Disk resource in AWS.
+
+        An AWS EBS disk must exist before mounting to a container. The disk must also be in the same AWS zone as the kubelet. An AWS EBS disk can only be mounted as read/write once. AWS EBS volumes support ownership management and SELinux relabeling.
+
+        :param volume_id: volumeID is unique ID of the persistent disk resource in AWS (Amazon EBS volume). More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+        :param fs_type: fsType is the filesystem type of the volume that you want to mount. Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+        :param partition: partition is the partition in the volume that you want to mount. If omitted, the default is to mount by volume name. Examples: For volume /dev/sda1, you specify the partition as "1". Similarly, the volume partition for /dev/sda is "0" (or you can leave the property empty).
+        :param read_only: readOnly value true will force the readOnly setting in VolumeMounts. More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+
+        :schema: io.k8s.api.core.v1.AWSElasticBlockStoreVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__cfdcc8025d63ab999a257c0732b1137f522923a572bda91f7ca61de5c1afd6ec)
+            check_type(argname="argument volume_id", value=volume_id, expected_type=type_hints["volume_id"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument partition", value=partition, expected_type=type_hints["partition"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+        self._value_volume_id = volume_id
+        self._value_fs_type = fs_type
+        self._value_partition = partition
+        self._value_read_only = read_only
+
+    @builtins.property
+    def volume_id(self) -> builtins.str:
+        '''volumeID is unique ID of the persistent disk resource in AWS (Amazon EBS volume).
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+
+        :schema: io.k8s.api.core.v1.AWSElasticBlockStoreVolumeSource#volumeID
+        '''
+        result = self._value_volume_id
+        assert result is not None, "Required property 'volume_id' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the filesystem type of the volume that you want to mount.
+
+        Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+
+        :schema: io.k8s.api.core.v1.AWSElasticBlockStoreVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def partition(self) -> typing.Optional[jsii.Number]:
+        '''partition is the partition in the volume that you want to mount.
+
+        If omitted, the default is to mount by volume name. Examples: For volume /dev/sda1, you specify the partition as "1". Similarly, the volume partition for /dev/sda is "0" (or you can leave the property empty).
+
+        :schema: io.k8s.api.core.v1.AWSElasticBlockStoreVolumeSource#partition
+        '''
+        result = self._value_partition
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly value true will force the readOnly setting in VolumeMounts.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+
+        :schema: io.k8s.api.core.v1.AWSElasticBlockStoreVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "volume_id": self._value_volume_id,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_partition is not None:
+            values["partition"] = self._value_partition
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "AwsElasticBlockStoreVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__cfdcc8025d63ab999a257c0732b1137f522923a572bda91f7ca61de5c1afd6ec(
+    *,
+    volume_id: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+    partition: typing.Optional[jsii.Number] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,180 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.AzureDiskVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "disk_name": "diskName",
+        "disk_uri": "diskUri",
+        "caching_mode": "cachingMode",
+        "fs_type": "fsType",
+        "kind": "kind",
+        "read_only": "readOnly",
+    },
+)
+class AzureDiskVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_disk_name",
+        "_value_disk_uri",
+        "_value_caching_mode",
+        "_value_fs_type",
+        "_value_kind",
+        "_value_read_only",
+    )
+
+    def __init__(
+        self,
+        *,
+        disk_name: builtins.str,
+        disk_uri: builtins.str,
+        caching_mode: typing.Optional[builtins.str] = None,
+        fs_type: typing.Optional[builtins.str] = None,
+        kind: typing.Optional[builtins.str] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''AzureDisk represents an Azure Data Disk mount on the host and bind mount to the pod.
+
+        :param disk_name: diskName is the Name of the data disk in the blob storage.
+        :param disk_uri: diskURI is the URI of data disk in the blob storage.
+        :param caching_mode: cachingMode is the Host Caching mode: None, Read Only, Read Write.
+        :param fs_type: fsType is Filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+        :param kind: kind expected values are Shared: multiple blob disks per storage account Dedicated: single blob disk per storage account Managed: azure managed data disk (only in managed availability set). defaults to shared
+        :param read_only: readOnly Defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. Default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.AzureDiskVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__42545c3f07626c9bf98c297356705624406f44b3ada49253cfa8b75145c9636d)
+            check_type(argname="argument disk_name", value=disk_name, expected_type=type_hints["disk_name"])
+            check_type(argname="argument disk_uri", value=disk_uri, expected_type=type_hints["disk_uri"])
+            check_type(argname="argument caching_mode", value=caching_mode, expected_type=type_hints["caching_mode"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+        self._value_disk_name = disk_name
+        self._value_disk_uri = disk_uri
+        self._value_caching_mode = caching_mode
+        self._value_fs_type = fs_type
+        self._value_kind = kind
+        self._value_read_only = read_only
+
+    @builtins.property
+    def disk_name(self) -> builtins.str:
+        '''diskName is the Name of the data disk in the blob storage.
+
+        :schema: io.k8s.api.core.v1.AzureDiskVolumeSource#diskName
+        '''
+        result = self._value_disk_name
+        assert result is not None, "Required property 'disk_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def disk_uri(self) -> builtins.str:
+        '''diskURI is the URI of data disk in the blob storage.
+
+        :schema: io.k8s.api.core.v1.AzureDiskVolumeSource#diskURI
+        '''
+        result = self._value_disk_uri
+        assert result is not None, "Required property 'disk_uri' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def caching_mode(self) -> typing.Optional[builtins.str]:
+        '''cachingMode is the Host Caching mode: None, Read Only, Read Write.
+
+        :schema: io.k8s.api.core.v1.AzureDiskVolumeSource#cachingMode
+        '''
+        result = self._value_caching_mode
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is Filesystem type to mount.
+
+        Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+
+        :schema: io.k8s.api.core.v1.AzureDiskVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def kind(self) -> typing.Optional[builtins.str]:
+        '''kind expected values are Shared: multiple blob disks per storage account  Dedicated: single blob disk per storage account  Managed: azure managed data disk (only in managed availability set).
+
+        defaults to shared
+
+        :schema: io.k8s.api.core.v1.AzureDiskVolumeSource#kind
+        '''
+        result = self._value_kind
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly Defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.AzureDiskVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "disk_name": self._value_disk_name,
+            "disk_uri": self._value_disk_uri,
+        }
+        if self._value_caching_mode is not None:
+            values["caching_mode"] = self._value_caching_mode
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_kind is not None:
+            values["kind"] = self._value_kind
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "AzureDiskVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__42545c3f07626c9bf98c297356705624406f44b3ada49253cfa8b75145c9636d(
+    *,
+    disk_name: builtins.str,
+    disk_uri: builtins.str,
+    caching_mode: typing.Optional[builtins.str] = None,
+    fs_type: typing.Optional[builtins.str] = None,
+    kind: typing.Optional[builtins.str] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,138 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.AzureFilePersistentVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "secret_name": "secretName",
+        "share_name": "shareName",
+        "read_only": "readOnly",
+        "secret_namespace": "secretNamespace",
+    },
+)
+class AzureFilePersistentVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_secret_name",
+        "_value_share_name",
+        "_value_read_only",
+        "_value_secret_namespace",
+    )
+
+    def __init__(
+        self,
+        *,
+        secret_name: builtins.str,
+        share_name: builtins.str,
+        read_only: typing.Optional[builtins.bool] = None,
+        secret_namespace: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''AzureFile represents an Azure File Service mount on the host and bind mount to the pod.
+
+        :param secret_name: secretName is the name of secret that contains Azure Storage Account Name and Key.
+        :param share_name: shareName is the azure Share Name.
+        :param read_only: readOnly defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+        :param secret_namespace: secretNamespace is the namespace of the secret that contains Azure Storage Account Name and Key default is the same as the Pod.
+
+        :schema: io.k8s.api.core.v1.AzureFilePersistentVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__84f066edf5f8bb2aff501a75543bcd7bb28c293243500d6e69343a9a24263569)
+            check_type(argname="argument secret_name", value=secret_name, expected_type=type_hints["secret_name"])
+            check_type(argname="argument share_name", value=share_name, expected_type=type_hints["share_name"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument secret_namespace", value=secret_namespace, expected_type=type_hints["secret_namespace"])
+        self._value_secret_name = secret_name
+        self._value_share_name = share_name
+        self._value_read_only = read_only
+        self._value_secret_namespace = secret_namespace
+
+    @builtins.property
+    def secret_name(self) -> builtins.str:
+        '''secretName is the name of secret that contains Azure Storage Account Name and Key.
+
+        :schema: io.k8s.api.core.v1.AzureFilePersistentVolumeSource#secretName
+        '''
+        result = self._value_secret_name
+        assert result is not None, "Required property 'secret_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def share_name(self) -> builtins.str:
+        '''shareName is the azure Share Name.
+
+        :schema: io.k8s.api.core.v1.AzureFilePersistentVolumeSource#shareName
+        '''
+        result = self._value_share_name
+        assert result is not None, "Required property 'share_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.AzureFilePersistentVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def secret_namespace(self) -> typing.Optional[builtins.str]:
+        '''secretNamespace is the namespace of the secret that contains Azure Storage Account Name and Key default is the same as the Pod.
+
+        :schema: io.k8s.api.core.v1.AzureFilePersistentVolumeSource#secretNamespace
+        '''
+        result = self._value_secret_namespace
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "secret_name": self._value_secret_name,
+            "share_name": self._value_share_name,
+        }
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_secret_namespace is not None:
+            values["secret_namespace"] = self._value_secret_namespace
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "AzureFilePersistentVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__84f066edf5f8bb2aff501a75543bcd7bb28c293243500d6e69343a9a24263569(
+    *,
+    secret_name: builtins.str,
+    share_name: builtins.str,
+    read_only: typing.Optional[builtins.bool] = None,
+    secret_namespace: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,120 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.AzureFileVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "secret_name": "secretName",
+        "share_name": "shareName",
+        "read_only": "readOnly",
+    },
+)
+class AzureFileVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_secret_name",
+        "_value_share_name",
+        "_value_read_only",
+    )
+
+    def __init__(
+        self,
+        *,
+        secret_name: builtins.str,
+        share_name: builtins.str,
+        read_only: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''AzureFile represents an Azure File Service mount on the host and bind mount to the pod.
+
+        :param secret_name: secretName is the name of secret that contains Azure Storage Account Name and Key.
+        :param share_name: shareName is the azure share Name.
+        :param read_only: readOnly defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.AzureFileVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__94648be721e46971848c0b51f3b1d4399d4a5e674368c83a893121cb3e801106)
+            check_type(argname="argument secret_name", value=secret_name, expected_type=type_hints["secret_name"])
+            check_type(argname="argument share_name", value=share_name, expected_type=type_hints["share_name"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+        self._value_secret_name = secret_name
+        self._value_share_name = share_name
+        self._value_read_only = read_only
+
+    @builtins.property
+    def secret_name(self) -> builtins.str:
+        '''secretName is the  name of secret that contains Azure Storage Account Name and Key.
+
+        :schema: io.k8s.api.core.v1.AzureFileVolumeSource#secretName
+        '''
+        result = self._value_secret_name
+        assert result is not None, "Required property 'secret_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def share_name(self) -> builtins.str:
+        '''shareName is the azure share Name.
+
+        :schema: io.k8s.api.core.v1.AzureFileVolumeSource#shareName
+        '''
+        result = self._value_share_name
+        assert result is not None, "Required property 'share_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.AzureFileVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "secret_name": self._value_secret_name,
+            "share_name": self._value_share_name,
+        }
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "AzureFileVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__94648be721e46971848c0b51f3b1d4399d4a5e674368c83a893121cb3e801106(
+    *,
+    secret_name: builtins.str,
+    share_name: builtins.str,
+    read_only: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
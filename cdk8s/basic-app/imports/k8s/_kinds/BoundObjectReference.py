@@ -0,0 +1,137 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.BoundObjectReference",
+    jsii_struct_bases=[],
+    name_mapping={
+        "api_version": "apiVersion",
+        "kind": "kind",
+        "name": "name",
+        "uid": "uid",
+    },
+)
+class BoundObjectReference(_base.Struct):
+    __slots__ = (
+        "_value_api_version",
+        "_value_kind",
+        "_value_name",
+        "_value_uid",
+    )
+
+    def __init__(
+        self,
+        *,
+        api_version: typing.Optional[builtins.str] = None,
+        kind: typing.Optional[builtins.str] = None,
+        name: typing.Optional[builtins.str] = None,
+        uid: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''BoundObjectReference is a reference to an object that a token is bound to.
+
+        :param api_version: API version of the referent.
+        :param kind: Kind of the referent. Valid kinds are 'Pod' and 'Secret'.
+        :param name: Name of the referent.
+        :param uid: UID of the referent.
+
+        :schema: io.k8s.api.authentication.v1.BoundObjectReference
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__3842071c1f7fa48baa6f58272703081a16a5000ba6ca2a54f8ed32aceb2e5309)
+            check_type(argname="argument api_version", value=api_version, expected_type=type_hints["api_version"])
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+        self._value_api_version = api_version
+        self._value_kind = kind
+        self._value_name = name
+        self._value_uid = uid
+
+    @builtins.property
+    def api_version(self) -> typing.Optional[builtins.str]:
+        '''API version of the referent.
+
+        :schema: io.k8s.api.authentication.v1.BoundObjectReference#apiVersion
+        '''
+        result = self._value_api_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def kind(self) -> typing.Optional[builtins.str]:
+        '''Kind of the referent.
+
+        Valid kinds are 'Pod' and 'Secret'.
+
+        :schema: io.k8s.api.authentication.v1.BoundObjectReference#kind
+        '''
+        result = self._value_kind
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Name of the referent.
+
+        :schema: io.k8s.api.authentication.v1.BoundObjectReference#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def uid(self) -> typing.Optional[builtins.str]:
+        '''UID of the referent.
+
+        :schema: io.k8s.api.authentication.v1.BoundObjectReference#uid
+        '''
+        result = self._value_uid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_api_version is not None:
+            values["api_version"] = self._value_api_version
+        if self._value_kind is not None:
+            values["kind"] = self._value_kind
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_uid is not None:
+            values["uid"] = self._value_uid
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "BoundObjectReference(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__3842071c1f7fa48baa6f58272703081a16a5000ba6ca2a54f8ed32aceb2e5309(
+    *,
+    api_version: typing.Optional[builtins.str] = None,
+    kind: typing.Optional[builtins.str] = None,
+    name: typing.Optional[builtins.str] = None,
+    uid: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
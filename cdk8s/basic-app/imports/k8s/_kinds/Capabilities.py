@@ -0,0 +1,96 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.Capabilities",
+    jsii_struct_bases=[],
+    name_mapping={"add": "add", "drop": "drop"},
+)
+class Capabilities(_base.Struct):
+    __slots__ = (
+        "_value_add",
+        "_value_drop",
+    )
+
+    def __init__(
+        self,
+        *,
+        add: typing.Optional[typing.Sequence[builtins.str]] = None,
+        drop: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''Adds and removes POSIX capabilities from running containers.
+
+        :param add: Added capabilities.
+        :param drop: Removed capabilities.
+
+        :schema: io.k8s.api.core.v1.Capabilities
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__be353859945b18989b92f139f2d1450880c136c416dfb6159bcc2bedd35f5528)
+            check_type(argname="argument add", value=add, expected_type=type_hints["add"])
+            check_type(argname="argument drop", value=drop, expected_type=type_hints["drop"])
+        self._value_add = add
+        self._value_drop = drop
+
+    @builtins.property
+    def add(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Added capabilities.
+
+        :schema: io.k8s.api.core.v1.Capabilities#add
+        '''
+        result = self._value_add
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def drop(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Removed capabilities.
+
+        :schema: io.k8s.api.core.v1.Capabilities#drop
+        '''
+        result = self._value_drop
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_add is not None:
+            values["add"] = self._value_add
+        if self._value_drop is not None:
+            values["drop"] = self._value_drop
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Capabilities(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__be353859945b18989b92f139f2d1450880c136c416dfb6159bcc2bedd35f5528(
+    *,
+    add: typing.Optional[typing.Sequence[builtins.str]] = None,
+    drop: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
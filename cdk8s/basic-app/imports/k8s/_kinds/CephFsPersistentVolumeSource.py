@@ -0,0 +1,181 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .SecretReference import SecretReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.CephFsPersistentVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "monitors": "monitors",
+        "path": "path",
+        "read_only": "readOnly",
+        "secret_file": "secretFile",
+        "secret_ref": "secretRef",
+        "user": "user",
+    },
+)
+class CephFsPersistentVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_monitors",
+        "_value_path",
+        "_value_read_only",
+        "_value_secret_file",
+        "_value_secret_ref",
+        "_value_user",
+    )
+
+    def __init__(
+        self,
+        *,
+        monitors: typing.Sequence[builtins.str],
+        path: typing.Optional[builtins.str] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        secret_file: typing.Optional[builtins.str] = None,
+        secret_ref: typing.Optional[typing.Union["SecretReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        user: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a Ceph Filesystem mount that lasts the lifetime of a pod Cephfs volumes do not support ownership management or SELinux relabeling.
+
+        :param monitors: monitors is Required: Monitors is a collection of Ceph monitors More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it.
+        :param path: path is Optional: Used as the mounted root, rather than the full Ceph tree, default is /.
+        :param read_only: readOnly is Optional: Defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it Default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it
+        :param secret_file: secretFile is Optional: SecretFile is the path to key ring for User, default is /etc/ceph/user.secret More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it.
+        :param secret_ref: secretRef is Optional: SecretRef is reference to the authentication secret for User, default is empty. More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it
+        :param user: user is Optional: User is the rados user name, default is admin More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it.
+
+        :schema: io.k8s.api.core.v1.CephFSPersistentVolumeSource
+        '''
+        if isinstance(secret_ref, dict):
+            secret_ref = SecretReference(**secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__3b5ad69df26a24d2f512ef505faa2117b55637afeef4390b17721af52ec2e212)
+            check_type(argname="argument monitors", value=monitors, expected_type=type_hints["monitors"])
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument secret_file", value=secret_file, expected_type=type_hints["secret_file"])
+            check_type(argname="argument secret_ref", value=secret_ref, expected_type=type_hints["secret_ref"])
+            check_type(argname="argument user", value=user, expected_type=type_hints["user"])
+        self._value_monitors = monitors
+        self._value_path = path
+        self._value_read_only = read_only
+        self._value_secret_file = secret_file
+        self._value_secret_ref = secret_ref
+        self._value_user = user
+
+    @builtins.property
+    def monitors(self) -> typing.List[builtins.str]:
+        '''monitors is Required: Monitors is a collection of Ceph monitors More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it.
+
+        :schema: io.k8s.api.core.v1.CephFSPersistentVolumeSource#monitors
+        '''
+        result = self._value_monitors
+        assert result is not None, "Required property 'monitors' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def path(self) -> typing.Optional[builtins.str]:
+        '''path is Optional: Used as the mounted root, rather than the full Ceph tree, default is /.
+
+        :schema: io.k8s.api.core.v1.CephFSPersistentVolumeSource#path
+        '''
+        result = self._value_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly is Optional: Defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts. More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it
+
+        :default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.CephFSPersistentVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def secret_file(self) -> typing.Optional[builtins.str]:
+        '''secretFile is Optional: SecretFile is the path to key ring for User, default is /etc/ceph/user.secret More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it.
+
+        :schema: io.k8s.api.core.v1.CephFSPersistentVolumeSource#secretFile
+        '''
+        result = self._value_secret_file
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def secret_ref(self) -> typing.Optional["SecretReference"]:
+        '''secretRef is Optional: SecretRef is reference to the authentication secret for User, default is empty.
+
+        More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.CephFSPersistentVolumeSource#secretRef
+        '''
+        result = self._value_secret_ref
+        return typing.cast(typing.Optional["SecretReference"], result)
+
+    @builtins.property
+    def user(self) -> typing.Optional[builtins.str]:
+        '''user is Optional: User is the rados user name, default is admin More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it.
+
+        :schema: io.k8s.api.core.v1.CephFSPersistentVolumeSource#user
+        '''
+        result = self._value_user
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "monitors": self._value_monitors,
+        }
+        if self._value_path is not None:
+            values["path"] = self._value_path
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_secret_file is not None:
+            values["secret_file"] = self._value_secret_file
+        if self._value_secret_ref is not None:
+            values["secret_ref"] = self._value_secret_ref
+        if self._value_user is not None:
+            values["user"] = self._value_user
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CephFsPersistentVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__3b5ad69df26a24d2f512ef505faa2117b55637afeef4390b17721af52ec2e212(
+    *,
+    monitors: typing.Sequence[builtins.str],
+    path: typing.Optional[builtins.str] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    secret_file: typing.Optional[builtins.str] = None,
+    secret_ref: typing.Optional[typing.Union[SecretReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    user: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,268 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.CertificateSigningRequestSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "request": "request",
+        "signer_name": "signerName",
+        "expiration_seconds": "expirationSeconds",
+        "extra": "extra",
+        "groups": "groups",
+        "uid": "uid",
+        "usages": "usages",
+        "username": "username",
+    },
+)
+class CertificateSigningRequestSpec(_base.Struct):
+    __slots__ = (
+        "_value_request",
+        "_value_signer_name",
+        "_value_expiration_seconds",
+        "_value_extra",
+        "_value_groups",
+        "_value_uid",
+        "_value_usages",
+        "_value_username",
+    )
+
+    def __init__(
+        self,
+        *,
+        request: builtins.str,
+        signer_name: builtins.str,
+        expiration_seconds: typing.Optional[jsii.Number] = None,
+        extra: typing.Optional[typing.Mapping[builtins.str, typing.Sequence[builtins.str]]] = None,
+        groups: typing.Optional[typing.Sequence[builtins.str]] = None,
+        uid: typing.Optional[builtins.str] = None,
+        usages: typing.Optional[typing.Sequence[builtins.str]] = None,
+        username: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''CertificateSigningRequestSpec contains the certificate request.
+
+        :param request: request contains an x509 certificate signing request encoded in a "CERTIFICATE REQUEST" PEM block. When serialized as JSON or YAML, the data is additionally base64-encoded.
+        :param signer_name: signerName indicates the requested signer, and is a qualified name. List/watch requests for CertificateSigningRequests can filter on this field using a "spec.signerName=NAME" fieldSelector. Well-known Kubernetes signers are: 1. "kubernetes.io/kube-apiserver-client": issues client certificates that can be used to authenticate to kube-apiserver. Requests for this signer are never auto-approved by kube-controller-manager, can be issued by the "csrsigning" controller in kube-controller-manager. 2. "kubernetes.io/kube-apiserver-client-kubelet": issues client certificates that kubelets use to authenticate to kube-apiserver. Requests for this signer can be auto-approved by the "csrapproving" controller in kube-controller-manager, and can be issued by the "csrsigning" controller in kube-controller-manager. 3. "kubernetes.io/kubelet-serving" issues serving certificates that kubelets use to serve TLS endpoints, which kube-apiserver can connect to securely. Requests for this signer are never auto-approved by kube-controller-manager, and can be issued by the "csrsigning" controller in kube-controller-manager. More details are available at https://k8s.io/docs/reference/access-authn-authz/certificate-signing-requests/#kubernetes-signers Custom signerNames can also be specified. The signer defines: 1. Trust distribution: how trust (CA bundles) are distributed. 2. Permitted subjects: and behavior when a disallowed subject is requested. 3. Required, permitted, or forbidden x509 extensions in the request (including whether subjectAltNames are allowed, which types, restrictions on allowed values) and behavior when a disallowed extension is requested. 4. Required, permitted, or forbidden key usages / extended key usages. 5. Expiration/certificate lifetime: whether it is fixed by the signer, configurable by the admin. 6. Whether or not requests for CA certificates are allowed.
+        :param expiration_seconds: expirationSeconds is the requested duration of validity of the issued certificate. The certificate signer may issue a certificate with a different validity duration so a client must check the delta between the notBefore and and notAfter fields in the issued certificate to determine the actual duration. The v1.22+ in-tree implementations of the well-known Kubernetes signers will honor this field as long as the requested duration is not greater than the maximum duration they will honor per the --cluster-signing-duration CLI flag to the Kubernetes controller manager. Certificate signers may not honor this field for various reasons: 1. Old signer that is unaware of the field (such as the in-tree implementations prior to v1.22) 2. Signer whose configured maximum is shorter than the requested duration 3. Signer whose configured minimum is longer than the requested duration The minimum valid value for expirationSeconds is 600, i.e. 10 minutes.
+        :param extra: extra contains extra attributes of the user that created the CertificateSigningRequest. Populated by the API server on creation and immutable.
+        :param groups: groups contains group membership of the user that created the CertificateSigningRequest. Populated by the API server on creation and immutable.
+        :param uid: uid contains the uid of the user that created the CertificateSigningRequest. Populated by the API server on creation and immutable.
+        :param usages: usages specifies a set of key usages requested in the issued certificate. Requests for TLS client certificates typically request: "digital signature", "key encipherment", "client auth". Requests for TLS serving certificates typically request: "key encipherment", "digital signature", "server auth". Valid values are: "signing", "digital signature", "content commitment", "key encipherment", "key agreement", "data encipherment", "cert sign", "crl sign", "encipher only", "decipher only", "any", "server auth", "client auth", "code signing", "email protection", "s/mime", "ipsec end system", "ipsec tunnel", "ipsec user", "timestamping", "ocsp signing", "microsoft sgc", "netscape sgc"
+        :param username: username contains the name of the user that created the CertificateSigningRequest. Populated by the API server on creation and immutable.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__a33e7e945dc9d389d58598a00c0615e6a0c101c66e3b1019bfbc65ff586ad288)
+            check_type(argname="argument request", value=request, expected_type=type_hints["request"])
+            check_type(argname="argument signer_name", value=signer_name, expected_type=type_hints["signer_name"])
+            check_type(argname="argument expiration_seconds", value=expiration_seconds, expected_type=type_hints["expiration_seconds"])
+            check_type(argname="argument extra", value=extra, expected_type=type_hints["extra"])
+            check_type(argname="argument groups", value=groups, expected_type=type_hints["groups"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+            check_type(argname="argument usages", value=usages, expected_type=type_hints["usages"])
+            check_type(argname="argument username", value=username, expected_type=type_hints["username"])
+        self._value_request = request
+        self._value_signer_name = signer_name
+        self._value_expiration_seconds = expiration_seconds
+        self._value_extra = extra
+        self._value_groups = groups
+        self._value_uid = uid
+        self._value_usages = usages
+        self._value_username = username
+
+    @builtins.property
+    def request(self) -> builtins.str:
+        '''request contains an x509 certificate signing request encoded in a "CERTIFICATE REQUEST" PEM block.
+
+        When serialized as JSON or YAML, the data is additionally base64-encoded.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec#request
+        '''
+        result = self._value_request
+        assert result is not None, "Required property 'request' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def signer_name(self) -> builtins.str:
+        '''signerName indicates the requested signer, and is a qualified name.
+
+        List/watch requests for CertificateSigningRequests can filter on this field using a "spec.signerName=NAME" fieldSelector.
+
+        Well-known Kubernetes signers are:
+
+        1. "kubernetes.io/kube-apiserver-client": issues client certificates that can be used to authenticate to kube-apiserver.
+           Requests for this signer are never auto-approved by kube-controller-manager, can be issued by the "csrsigning" controller in kube-controller-manager.
+        2. "kubernetes.io/kube-apiserver-client-kubelet": issues client certificates that kubelets use to authenticate to kube-apiserver.
+           Requests for this signer can be auto-approved by the "csrapproving" controller in kube-controller-manager, and can be issued by the "csrsigning" controller in kube-controller-manager.
+        3. "kubernetes.io/kubelet-serving" issues serving certificates that kubelets use to serve TLS endpoints, which kube-apiserver can connect to securely.
+           Requests for this signer are never auto-approved by kube-controller-manager, and can be issued by the "csrsigning" controller in kube-controller-manager.
+
+        More details are available at https://k8s.io/docs/reference/access-authn-authz/certificate-signing-requests/#kubernetes-signers
+
+        Custom signerNames can also be specified. The signer defines:
+
+        1. Trust distribution: how trust (CA bundles) are distributed.
+        2. Permitted subjects: and behavior when a disallowed subject is requested.
+        3. Required, permitted, or forbidden x509 extensions in the request (including whether subjectAltNames are allowed, which types, restrictions on allowed values) and behavior when a disallowed extension is requested.
+        4. Required, permitted, or forbidden key usages / extended key usages.
+        5. Expiration/certificate lifetime: whether it is fixed by the signer, configurable by the admin.
+        6. Whether or not requests for CA certificates are allowed.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec#signerName
+        '''
+        result = self._value_signer_name
+        assert result is not None, "Required property 'signer_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def expiration_seconds(self) -> typing.Optional[jsii.Number]:
+        '''expirationSeconds is the requested duration of validity of the issued certificate.
+
+        The certificate signer may issue a certificate with a different validity duration so a client must check the delta between the notBefore and and notAfter fields in the issued certificate to determine the actual duration.
+
+        The v1.22+ in-tree implementations of the well-known Kubernetes signers will honor this field as long as the requested duration is not greater than the maximum duration they will honor per the --cluster-signing-duration CLI flag to the Kubernetes controller manager.
+
+        Certificate signers may not honor this field for various reasons:
+
+        1. Old signer that is unaware of the field (such as the in-tree
+           implementations prior to v1.22)
+        2. Signer whose configured maximum is shorter than the requested duration
+        3. Signer whose configured minimum is longer than the requested duration
+
+        The minimum valid value for expirationSeconds is 600, i.e. 10 minutes.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec#expirationSeconds
+        '''
+        result = self._value_expiration_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def extra(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, typing.List[builtins.str]]]:
+        '''extra contains extra attributes of the user that created the CertificateSigningRequest.
+
+        Populated by the API server on creation and immutable.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec#extra
+        '''
+        result = self._value_extra
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, typing.List[builtins.str]]], result)
+
+    @builtins.property
+    def groups(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''groups contains group membership of the user that created the CertificateSigningRequest.
+
+        Populated by the API server on creation and immutable.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec#groups
+        '''
+        result = self._value_groups
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def uid(self) -> typing.Optional[builtins.str]:
+        '''uid contains the uid of the user that created the CertificateSigningRequest.
+
+        Populated by the API server on creation and immutable.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec#uid
+        '''
+        result = self._value_uid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def usages(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''usages specifies a set of key usages requested in the issued certificate.
+
+        Requests for TLS client certificates typically request: "digital signature", "key encipherment", "client auth".
+
+        Requests for TLS serving certificates typically request: "key encipherment", "digital signature", "server auth".
+
+        Valid values are:
+        "signing", "digital signature", "content commitment",
+        "key encipherment", "key agreement", "data encipherment",
+        "cert sign", "crl sign", "encipher only", "decipher only", "any",
+        "server auth", "client auth",
+        "code signing", "email protection", "s/mime",
+        "ipsec end system", "ipsec tunnel", "ipsec user",
+        "timestamping", "ocsp signing", "microsoft sgc", "netscape sgc"
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec#usages
+        '''
+        result = self._value_usages
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def username(self) -> typing.Optional[builtins.str]:
+        '''username contains the name of the user that created the CertificateSigningRequest.
+
+        Populated by the API server on creation and immutable.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequestSpec#username
+        '''
+        result = self._value_username
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "request": self._value_request,
+            "signer_name": self._value_signer_name,
+        }
+        if self._value_expiration_seconds is not None:
+            values["expiration_seconds"] = self._value_expiration_seconds
+        if self._value_extra is not None:
+            values["extra"] = self._value_extra
+        if self._value_groups is not None:
+            values["groups"] = self._value_groups
+        if self._value_uid is not None:
+            values["uid"] = self._value_uid
+        if self._value_usages is not None:
+            values["usages"] = self._value_usages
+        if self._value_username is not None:
+            values["username"] = self._value_username
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CertificateSigningRequestSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__a33e7e945dc9d389d58598a00c0615e6a0c101c66e3b1019bfbc65ff586ad288(
+    *,
+    request: builtins.str,
+    signer_name: builtins.str,
+    expiration_seconds: typing.Optional[jsii.Number] = None,
+    extra: typing.Optional[typing.Mapping[builtins.str, typing.Sequence[builtins.str]]] = None,
+    groups: typing.Optional[typing.Sequence[builtins.str]] = None,
+    uid: typing.Optional[builtins.str] = None,
+    usages: typing.Optional[typing.Sequence[builtins.str]] = None,
+    username: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,149 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .SecretReference import SecretReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.CinderPersistentVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "volume_id": "volumeId",
+        "fs_type": "fsType",
+        "read_only": "readOnly",
+        "secret_ref": "secretRef",
+    },
+)
+class CinderPersistentVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_volume_id",
+        "_value_fs_type",
+        "_value_read_only",
+        "_value_secret_ref",
+    )
+
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        secret_ref: typing.Optional[typing.Union["SecretReference", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Represents a cinder volume resource in Openstack.
+
+        A Cinder volume must exist before mounting to a container. The volume must also be in the same region as the kubelet. Cinder volumes support ownership management and SELinux relabeling.
+
+        :param volume_id: volumeID used to identify the volume in cinder. More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+        :param fs_type: fsType Filesystem type to mount. Must be a filesystem type supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+        :param read_only: readOnly is Optional: Defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. More info: https://examples.k8s.io/mysql-cinder-pd/README.md Default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+        :param secret_ref: secretRef is Optional: points to a secret object containing parameters used to connect to OpenStack.
+
+        :schema: io.k8s.api.core.v1.CinderPersistentVolumeSource
+        '''
+        if isinstance(secret_ref, dict):
+            secret_ref = SecretReference(**secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__881438521a2ffa8cb492e1a592803eba0118f41d19c6c9b21f89488919c9fe95)
+            check_type(argname="argument volume_id", value=volume_id, expected_type=type_hints["volume_id"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument secret_ref", value=secret_ref, expected_type=type_hints["secret_ref"])
+        self._value_volume_id = volume_id
+        self._value_fs_type = fs_type
+        self._value_read_only = read_only
+        self._value_secret_ref = secret_ref
+
+    @builtins.property
+    def volume_id(self) -> builtins.str:
+        '''volumeID used to identify the volume in cinder.
+
+        More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+
+        :schema: io.k8s.api.core.v1.CinderPersistentVolumeSource#volumeID
+        '''
+        result = self._value_volume_id
+        assert result is not None, "Required property 'volume_id' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType Filesystem type to mount.
+
+        Must be a filesystem type supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+
+        :schema: io.k8s.api.core.v1.CinderPersistentVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly is Optional: Defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts. More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+
+        :default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+
+        :schema: io.k8s.api.core.v1.CinderPersistentVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def secret_ref(self) -> typing.Optional["SecretReference"]:
+        '''secretRef is Optional: points to a secret object containing parameters used to connect to OpenStack.
+
+        :schema: io.k8s.api.core.v1.CinderPersistentVolumeSource#secretRef
+        '''
+        result = self._value_secret_ref
+        return typing.cast(typing.Optional["SecretReference"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "volume_id": self._value_volume_id,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_secret_ref is not None:
+            values["secret_ref"] = self._value_secret_ref
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CinderPersistentVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__881438521a2ffa8cb492e1a592803eba0118f41d19c6c9b21f89488919c9fe95(
+    *,
+    volume_id: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    secret_ref: typing.Optional[typing.Union[SecretReference, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
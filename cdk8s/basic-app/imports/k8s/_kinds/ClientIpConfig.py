@@ -0,0 +1,77 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ClientIpConfig",
+    jsii_struct_bases=[],
+    name_mapping={"timeout_seconds": "timeoutSeconds"},
+)
+class ClientIpConfig(_base.Struct):
+    __slots__ = (
+        "_value_timeout_seconds",
+    )
+
+    def __init__(self, *, timeout_seconds: typing.Optional[jsii.Number] = None) -> None:
+        '''ClientIPConfig represents the configurations of Client IP based session affinity.
+
+        :param timeout_seconds: timeoutSeconds specifies the seconds of ClientIP type session sticky time. The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP". Default value is 10800(for 3 hours).
+
+        :schema: io.k8s.api.core.v1.ClientIPConfig
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__29a449f3b3357364e9fe2eedbf3639c327226f11ef6b646b27d4a54e71dc5c9e)
+            check_type(argname="argument timeout_seconds", value=timeout_seconds, expected_type=type_hints["timeout_seconds"])
+        self._value_timeout_seconds = timeout_seconds
+
+    @builtins.property
+    def timeout_seconds(self) -> typing.Optional[jsii.Number]:
+        '''timeoutSeconds specifies the seconds of ClientIP type session sticky time.
+
+        The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP". Default value is 10800(for 3 hours).
+
+        :schema: io.k8s.api.core.v1.ClientIPConfig#timeoutSeconds
+        '''
+        result = self._value_timeout_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_timeout_seconds is not None:
+            values["timeout_seconds"] = self._value_timeout_seconds
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ClientIpConfig(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__29a449f3b3357364e9fe2eedbf3639c327226f11ef6b646b27d4a54e71dc5c9e(
+    *,
+    timeout_seconds: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
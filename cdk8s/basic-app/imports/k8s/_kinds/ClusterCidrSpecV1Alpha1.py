@@ -0,0 +1,143 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NodeSelector import NodeSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.ClusterCidrSpecV1Alpha1",
+    jsii_struct_bases=[],
+    name_mapping={
+        "per_node_host_bits": "perNodeHostBits",
+        "ipv4": "ipv4",
+        "ipv6": "ipv6",
+        "node_selector": "nodeSelector",
+    },
+)
+class ClusterCidrSpecV1Alpha1(_base.Struct):
+    __slots__ = (
+        "_value_per_node_host_bits",
+        "_value_ipv4",
+        "_value_ipv6",
+        "_value_node_selector",
+    )
+
+    def __init__(
+        self,
+        *,
+        per_node_host_bits: jsii.Number,
+        ipv4: typing.Optional[builtins.str] = None,
+        ipv6: typing.Optional[builtins.str] = None,
+        node_selector: typing.Optional[typing.Union["NodeSelector", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ClusterCIDRSpec defines the desired state of ClusterCIDR.
+
+        :param per_node_host_bits: PerNodeHostBits defines the number of host bits to be configured per node. A subnet mask determines how much of the address is used for network bits and host bits. For example an IPv4 address of 192.168.0.0/24, splits the address into 24 bits for the network portion and 8 bits for the host portion. To allocate 256 IPs, set this field to 8 (a /24 mask for IPv4 or a /120 for IPv6). Minimum value is 4 (16 IPs). This field is immutable.
+        :param ipv4: IPv4 defines an IPv4 IP block in CIDR notation(e.g. "10.0.0.0/8"). At least one of IPv4 and IPv6 must be specified. This field is immutable.
+        :param ipv6: IPv6 defines an IPv6 IP block in CIDR notation(e.g. "fd12:3456:789a:1::/64"). At least one of IPv4 and IPv6 must be specified. This field is immutable.
+        :param node_selector: NodeSelector defines which nodes the config is applicable to. An empty or nil NodeSelector selects all nodes. This field is immutable.
+
+        :schema: io.k8s.api.networking.v1alpha1.ClusterCIDRSpec
+        '''
+        if isinstance(node_selector, dict):
+            node_selector = NodeSelector(**node_selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__fe618ea608b9075a33b355598f43687c5206288062267eb0d99d0a9ca0ab859e)
+            check_type(argname="argument per_node_host_bits", value=per_node_host_bits, expected_type=type_hints["per_node_host_bits"])
+            check_type(argname="argument ipv4", value=ipv4, expected_type=type_hints["ipv4"])
+            check_type(argname="argument ipv6", value=ipv6, expected_type=type_hints["ipv6"])
+            check_type(argname="argument node_selector", value=node_selector, expected_type=type_hints["node_selector"])
+        self._value_per_node_host_bits = per_node_host_bits
+        self._value_ipv4 = ipv4
+        self._value_ipv6 = ipv6
+        self._value_node_selector = node_selector
+
+    @builtins.property
+    def per_node_host_bits(self) -> jsii.Number:
+        '''PerNodeHostBits defines the number of host bits to be configured per node.
+
+        A subnet mask determines how much of the address is used for network bits and host bits. For example an IPv4 address of 192.168.0.0/24, splits the address into 24 bits for the network portion and 8 bits for the host portion. To allocate 256 IPs, set this field to 8 (a /24 mask for IPv4 or a /120 for IPv6). Minimum value is 4 (16 IPs). This field is immutable.
+
+        :schema: io.k8s.api.networking.v1alpha1.ClusterCIDRSpec#perNodeHostBits
+        '''
+        result = self._value_per_node_host_bits
+        assert result is not None, "Required property 'per_node_host_bits' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def ipv4(self) -> typing.Optional[builtins.str]:
+        '''IPv4 defines an IPv4 IP block in CIDR notation(e.g. "10.0.0.0/8"). At least one of IPv4 and IPv6 must be specified. This field is immutable.
+
+        :schema: io.k8s.api.networking.v1alpha1.ClusterCIDRSpec#ipv4
+        '''
+        result = self._value_ipv4
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def ipv6(self) -> typing.Optional[builtins.str]:
+        '''IPv6 defines an IPv6 IP block in CIDR notation(e.g. "fd12:3456:789a:1::/64"). At least one of IPv4 and IPv6 must be specified. This field is immutable.
+
+        :schema: io.k8s.api.networking.v1alpha1.ClusterCIDRSpec#ipv6
+        '''
+        result = self._value_ipv6
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def node_selector(self) -> typing.Optional["NodeSelector"]:
+        '''NodeSelector defines which nodes the config is applicable to.
+
+        An empty or nil NodeSelector selects all nodes. This field is immutable.
+
+        :schema: io.k8s.api.networking.v1alpha1.ClusterCIDRSpec#nodeSelector
+        '''
+        result = self._value_node_selector
+        return typing.cast(typing.Optional["NodeSelector"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "per_node_host_bits": self._value_per_node_host_bits,
+        }
+        if self._value_ipv4 is not None:
+            values["ipv4"] = self._value_ipv4
+        if self._value_ipv6 is not None:
+            values["ipv6"] = self._value_ipv6
+        if self._value_node_selector is not None:
+            values["node_selector"] = self._value_node_selector
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ClusterCidrSpecV1Alpha1(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__fe618ea608b9075a33b355598f43687c5206288062267eb0d99d0a9ca0ab859e(
+    *,
+    per_node_host_bits: jsii.Number,
+    ipv4: typing.Optional[builtins.str] = None,
+    ipv6: typing.Optional[builtins.str] = None,
+    node_selector: typing.Optional[typing.Union[NodeSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,144 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ComponentCondition",
+    jsii_struct_bases=[],
+    name_mapping={
+        "status": "status",
+        "type": "type",
+        "error": "error",
+        "message": "message",
+    },
+)
+class ComponentCondition(_base.Struct):
+    __slots__ = (
+        "_value_status",
+        "_value_type",
+        "_value_error",
+        "_value_message",
+    )
+
+    def __init__(
+        self,
+        *,
+        status: builtins.str,
+        type: builtins.str,
+        error: typing.Optional[builtins.str] = None,
+        message: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Information about the condition of a component.
+
+        :param status: Status of the condition for a component. Valid values for "Healthy": "True", "False", or "Unknown".
+        :param type: Type of condition for a component. Valid value: "Healthy"
+        :param error: Condition error code for a component. For example, a health check error code.
+        :param message: Message about the condition for a component. For example, information about a health check.
+
+        :schema: io.k8s.api.core.v1.ComponentCondition
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__e5c6f493a36d20a0f5c15799a425473df0ef3509854c45bf00c9f2d1df43078b)
+            check_type(argname="argument status", value=status, expected_type=type_hints["status"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument error", value=error, expected_type=type_hints["error"])
+            check_type(argname="argument message", value=message, expected_type=type_hints["message"])
+        self._value_status = status
+        self._value_type = type
+        self._value_error = error
+        self._value_message = message
+
+    @builtins.property
+    def status(self) -> builtins.str:
+        '''Status of the condition for a component.
+
+        Valid values for "Healthy": "True", "False", or "Unknown".
+
+        :schema: io.k8s.api.core.v1.ComponentCondition#status
+        '''
+        result = self._value_status
+        assert result is not None, "Required property 'status' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''Type of condition for a component.
+
+        Valid value: "Healthy"
+
+        :schema: io.k8s.api.core.v1.ComponentCondition#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def error(self) -> typing.Optional[builtins.str]:
+        '''Condition error code for a component.
+
+        For example, a health check error code.
+
+        :schema: io.k8s.api.core.v1.ComponentCondition#error
+        '''
+        result = self._value_error
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def message(self) -> typing.Optional[builtins.str]:
+        '''Message about the condition for a component.
+
+        For example, information about a health check.
+
+        :schema: io.k8s.api.core.v1.ComponentCondition#message
+        '''
+        result = self._value_message
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "status": self._value_status,
+            "type": self._value_type,
+        }
+        if self._value_error is not None:
+            values["error"] = self._value_error
+        if self._value_message is not None:
+            values["message"] = self._value_message
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ComponentCondition(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__e5c6f493a36d20a0f5c15799a425473df0ef3509854c45bf00c9f2d1df43078b(
+    *,
+    status: builtins.str,
+    type: builtins.str,
+    error: typing.Optional[builtins.str] = None,
+    message: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
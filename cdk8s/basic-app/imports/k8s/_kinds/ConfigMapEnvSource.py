@@ -0,0 +1,100 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ConfigMapEnvSource",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name", "optional": "optional"},
+)
+class ConfigMapEnvSource(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_optional",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: typing.Optional[builtins.str] = None,
+        optional: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''ConfigMapEnvSource selects a ConfigMap to populate the environment variables with.
+
+        The contents of the target ConfigMap's Data field will represent the key-value pairs as environment variables.
+
+        :param name: Name of the referent. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+        :param optional: Specify whether the ConfigMap must be defined.
+
+        :schema: io.k8s.api.core.v1.ConfigMapEnvSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__370b1c0b36f05ff3192a8cbbd224accabfbc47a41badefad8eae8d70919df5a8)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument optional", value=optional, expected_type=type_hints["optional"])
+        self._value_name = name
+        self._value_optional = optional
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Name of the referent.
+
+        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+
+        :schema: io.k8s.api.core.v1.ConfigMapEnvSource#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def optional(self) -> typing.Optional[builtins.bool]:
+        '''Specify whether the ConfigMap must be defined.
+
+        :schema: io.k8s.api.core.v1.ConfigMapEnvSource#optional
+        '''
+        result = self._value_optional
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_optional is not None:
+            values["optional"] = self._value_optional
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ConfigMapEnvSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__370b1c0b36f05ff3192a8cbbd224accabfbc47a41badefad8eae8d70919df5a8(
+    *,
+    name: typing.Optional[builtins.str] = None,
+    optional: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,116 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ConfigMapKeySelector",
+    jsii_struct_bases=[],
+    name_mapping={"key": "key", "name": "name", "optional": "optional"},
+)
+class ConfigMapKeySelector(_base.Struct):
+    __slots__ = (
+        "_value_key",
+        "_value_name",
+        "_value_optional",
+    )
+
+    def __init__(
+        self,
+        *,
+        key: builtins.str,
+        name: typing.Optional[builtins.str] = None,
+        optional: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''Selects a key from a ConfigMap.
+
+        :param key: The key to select.
+        :param name: Name of the referent. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+        :param optional: Specify whether the ConfigMap or its key must be defined.
+
+        :schema: io.k8s.api.core.v1.ConfigMapKeySelector
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__e7b538afefcd3178906246a4633aa3edf9a64dc6b4f99e4f91adaab9981d5e5e)
+            check_type(argname="argument key", value=key, expected_type=type_hints["key"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument optional", value=optional, expected_type=type_hints["optional"])
+        self._value_key = key
+        self._value_name = name
+        self._value_optional = optional
+
+    @builtins.property
+    def key(self) -> builtins.str:
+        '''The key to select.
+
+        :schema: io.k8s.api.core.v1.ConfigMapKeySelector#key
+        '''
+        result = self._value_key
+        assert result is not None, "Required property 'key' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Name of the referent.
+
+        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+
+        :schema: io.k8s.api.core.v1.ConfigMapKeySelector#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def optional(self) -> typing.Optional[builtins.bool]:
+        '''Specify whether the ConfigMap or its key must be defined.
+
+        :schema: io.k8s.api.core.v1.ConfigMapKeySelector#optional
+        '''
+        result = self._value_optional
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "key": self._value_key,
+        }
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_optional is not None:
+            values["optional"] = self._value_optional
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ConfigMapKeySelector(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__e7b538afefcd3178906246a4633aa3edf9a64dc6b4f99e4f91adaab9981d5e5e(
+    *,
+    key: builtins.str,
+    name: typing.Optional[builtins.str] = None,
+    optional: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
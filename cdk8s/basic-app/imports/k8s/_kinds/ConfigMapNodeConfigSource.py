@@ -0,0 +1,156 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ConfigMapNodeConfigSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "kubelet_config_key": "kubeletConfigKey",
+        "name": "name",
+        "namespace": "namespace",
+        "resource_version": "resourceVersion",
+        "uid": "uid",
+    },
+)
+class ConfigMapNodeConfigSource(_base.Struct):
+    __slots__ = (
+        "_value_kubelet_config_key",
+        "_value_name",
+        "_value_namespace",
+        "_value_resource_version",
+        "_value_uid",
+    )
+
+    def __init__(
+        self,
+        *,
+        kubelet_config_key: builtins.str,
+        name: builtins.str,
+        namespace: builtins.str,
+        resource_version: typing.Optional[builtins.str] = None,
+        uid: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ConfigMapNodeConfigSource contains the information to reference a ConfigMap as a config source for the Node.
+
+        This API is deprecated since 1.22: https://git.k8s.io/enhancements/keps/sig-node/281-dynamic-kubelet-configuration
+
+        :param kubelet_config_key: KubeletConfigKey declares which key of the referenced ConfigMap corresponds to the KubeletConfiguration structure This field is required in all cases.
+        :param name: Name is the metadata.name of the referenced ConfigMap. This field is required in all cases.
+        :param namespace: Namespace is the metadata.namespace of the referenced ConfigMap. This field is required in all cases.
+        :param resource_version: ResourceVersion is the metadata.ResourceVersion of the referenced ConfigMap. This field is forbidden in Node.Spec, and required in Node.Status.
+        :param uid: UID is the metadata.UID of the referenced ConfigMap. This field is forbidden in Node.Spec, and required in Node.Status.
+
+        :schema: io.k8s.api.core.v1.ConfigMapNodeConfigSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__1e65fe961a56a03c3374ec1160978c65396b145146e3c13dc4180daa47d645b1)
+            check_type(argname="argument kubelet_config_key", value=kubelet_config_key, expected_type=type_hints["kubelet_config_key"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+            check_type(argname="argument resource_version", value=resource_version, expected_type=type_hints["resource_version"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+        self._value_kubelet_config_key = kubelet_config_key
+        self._value_name = name
+        self._value_namespace = namespace
+        self._value_resource_version = resource_version
+        self._value_uid = uid
+
+    @builtins.property
+    def kubelet_config_key(self) -> builtins.str:
+        '''KubeletConfigKey declares which key of the referenced ConfigMap corresponds to the KubeletConfiguration structure This field is required in all cases.
+
+        :schema: io.k8s.api.core.v1.ConfigMapNodeConfigSource#kubeletConfigKey
+        '''
+        result = self._value_kubelet_config_key
+        assert result is not None, "Required property 'kubelet_config_key' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''Name is the metadata.name of the referenced ConfigMap. This field is required in all cases.
+
+        :schema: io.k8s.api.core.v1.ConfigMapNodeConfigSource#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def namespace(self) -> builtins.str:
+        '''Namespace is the metadata.namespace of the referenced ConfigMap. This field is required in all cases.
+
+        :schema: io.k8s.api.core.v1.ConfigMapNodeConfigSource#namespace
+        '''
+        result = self._value_namespace
+        assert result is not None, "Required property 'namespace' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def resource_version(self) -> typing.Optional[builtins.str]:
+        '''ResourceVersion is the metadata.ResourceVersion of the referenced ConfigMap. This field is forbidden in Node.Spec, and required in Node.Status.
+
+        :schema: io.k8s.api.core.v1.ConfigMapNodeConfigSource#resourceVersion
+        '''
+        result = self._value_resource_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def uid(self) -> typing.Optional[builtins.str]:
+        '''UID is the metadata.UID of the referenced ConfigMap. This field is forbidden in Node.Spec, and required in Node.Status.
+
+        :schema: io.k8s.api.core.v1.ConfigMapNodeConfigSource#uid
+        '''
+        result = self._value_uid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "kubelet_config_key": self._value_kubelet_config_key,
+            "name": self._value_name,
+            "namespace": self._value_namespace,
+        }
+        if self._value_resource_version is not None:
+            values["resource_version"] = self._value_resource_version
+        if self._value_uid is not None:
+            values["uid"] = self._value_uid
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ConfigMapNodeConfigSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__1e65fe961a56a03c3374ec1160978c65396b145146e3c13dc4180daa47d645b1(
+    *,
+    kubelet_config_key: builtins.str,
+    name: builtins.str,
+    namespace: builtins.str,
+    resource_version: typing.Optional[builtins.str] = None,
+    uid: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
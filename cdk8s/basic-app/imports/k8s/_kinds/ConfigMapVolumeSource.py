@@ -0,0 +1,146 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .KeyToPath import KeyToPath
+
+
+@jsii.data_type(
+    jsii_type="k8s.ConfigMapVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "default_mode": "defaultMode",
+        "items": "items",
+        "name": "name",
+        "optional": "optional",
+    },
+)
+class ConfigMapVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_default_mode",
+        "_value_items",
+        "_value_name",
+        "_value_optional",
+    )
+
+    def __init__(
+        self,
+        *,
+        default_mode: typing.Optional[jsii.Number] = None,
+        items: typing.Optional[typing.Sequence[typing.Union["KeyToPath", typing.Dict[builtins.str, typing.Any]]]] = None,
+        name: typing.Optional[builtins.str] = None,
+        optional: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''Adapts a ConfigMap into a volume.
+
+        The contents of the target ConfigMap's Data field will be presented in a volume as files using the keys in the Data field as the file names, unless the items element is populated with specific mappings of keys to paths. ConfigMap volumes support ownership management and SELinux relabeling.
+
+        :param default_mode: defaultMode is optional: mode bits used to set permissions on created files by default. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Defaults to 0644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set. Default: 644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+        :param items: items if unspecified, each key-value pair in the Data field of the referenced ConfigMap will be projected into the volume as a file whose name is the key and content is the value. If specified, the listed keys will be projected into the specified paths, and unlisted keys will not be present. If a key is specified which is not present in the ConfigMap, the volume setup will error unless it is marked optional. Paths must be relative and may not contain the '..' path or start with '..'.
+        :param name: Name of the referent. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+        :param optional: optional specify whether the ConfigMap or its keys must be defined.
+
+        :schema: io.k8s.api.core.v1.ConfigMapVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__f732f389aef3745668fe1484c8ff5f95aba0fd695dd9a611adf068af963d4ed6)
+            check_type(argname="argument default_mode", value=default_mode, expected_type=type_hints["default_mode"])
+            check_type(argname="argument items", value=items, expected_type=type_hints["items"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument optional", value=optional, expected_type=type_hints["optional"])
+        self._value_default_mode = default_mode
+        self._value_items = items
+        self._value_name = name
+        self._value_optional = optional
+
+    @builtins.property
+    def default_mode(self) -> typing.Optional[jsii.Number]:
+        '''defaultMode is optional: mode bits used to set permissions on created files by default.
+
+        Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Defaults to 0644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+
+        :default: 644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+
+        :schema: io.k8s.api.core.v1.ConfigMapVolumeSource#defaultMode
+        '''
+        result = self._value_default_mode
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def items(self) -> typing.Optional[typing.List["KeyToPath"]]:
+        '''items if unspecified, each key-value pair in the Data field of the referenced ConfigMap will be projected into the volume as a file whose name is the key and content is the value.
+
+        If specified, the listed keys will be projected into the specified paths, and unlisted keys will not be present. If a key is specified which is not present in the ConfigMap, the volume setup will error unless it is marked optional. Paths must be relative and may not contain the '..' path or start with '..'.
+
+        :schema: io.k8s.api.core.v1.ConfigMapVolumeSource#items
+        '''
+        result = self._value_items
+        return typing.cast(typing.Optional[typing.List["KeyToPath"]], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Name of the referent.
+
+        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+
+        :schema: io.k8s.api.core.v1.ConfigMapVolumeSource#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def optional(self) -> typing.Optional[builtins.bool]:
+        '''optional specify whether the ConfigMap or its keys must be defined.
+
+        :schema: io.k8s.api.core.v1.ConfigMapVolumeSource#optional
+        '''
+        result = self._value_optional
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_default_mode is not None:
+            values["default_mode"] = self._value_default_mode
+        if self._value_items is not None:
+            values["items"] = self._value_items
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_optional is not None:
+            values["optional"] = self._value_optional
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ConfigMapVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__f732f389aef3745668fe1484c8ff5f95aba0fd695dd9a611adf068af963d4ed6(
+    *,
+    default_mode: typing.Optional[jsii.Number] = None,
+    items: typing.Optional[typing.Sequence[typing.Union[KeyToPath, typing.Dict[builtins.str, typing.Any]]]] = None,
+    name: typing.Optional[builtins.str] = None,
+    optional: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,164 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ContainerPort",
+    jsii_struct_bases=[],
+    name_mapping={
+        "container_port": "containerPort",
+        "host_ip": "hostIp",
+        "host_port": "hostPort",
+        "name": "name",
+        "protocol": "protocol",
+    },
+)
+class ContainerPort(_base.Struct):
+    __slots__ = (
+        "_value_container_port",
+        "_value_host_ip",
+        "_value_host_port",
+        "_value_name",
+        "_value_protocol",
+    )
+
+    def __init__(
+        self,
+        *,
+        container_port: jsii.Number,
+        host_ip: typing.Optional[builtins.str] = None,
+        host_port: typing.Optional[jsii.Number] = None,
+        name: typing.Optional[builtins.str] = None,
+        protocol: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ContainerPort represents a network port in a single container.
+
+        :param container_port: Number of port to expose on the pod's IP address. This must be a valid port number, 0 < x < 65536.
+        :param host_ip: What host IP to bind the external port to.
+        :param host_port: Number of port to expose on the host. If specified, this must be a valid port number, 0 < x < 65536. If HostNetwork is specified, this must match ContainerPort. Most containers do not need this.
+        :param name: If specified, this must be an IANA_SVC_NAME and unique within the pod. Each named port in a pod must have a unique name. Name for the port that can be referred to by services.
+        :param protocol: Protocol for port. Must be UDP, TCP, or SCTP. Defaults to "TCP". Default: TCP".
+
+        :schema: io.k8s.api.core.v1.ContainerPort
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ea50a33f53045ef963173d2b69fe4fa77a8142b8ae58ea83960e69f4839c879a)
+            check_type(argname="argument container_port", value=container_port, expected_type=type_hints["container_port"])
+            check_type(argname="argument host_ip", value=host_ip, expected_type=type_hints["host_ip"])
+            check_type(argname="argument host_port", value=host_port, expected_type=type_hints["host_port"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument protocol", value=protocol, expected_type=type_hints["protocol"])
+        self._value_container_port = container_port
+        self._value_host_ip = host_ip
+        self._value_host_port = host_port
+        self._value_name = name
+        self._value_protocol = protocol
+
+    @builtins.property
+    def container_port(self) -> jsii.Number:
+        '''Number of port to expose on the pod's IP address.
+
+        This must be a valid port number, 0 < x < 65536.
+
+        :schema: io.k8s.api.core.v1.ContainerPort#containerPort
+        '''
+        result = self._value_container_port
+        assert result is not None, "Required property 'container_port' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def host_ip(self) -> typing.Optional[builtins.str]:
+        '''What host IP to bind the external port to.
+
+        :schema: io.k8s.api.core.v1.ContainerPort#hostIP
+        '''
+        result = self._value_host_ip
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def host_port(self) -> typing.Optional[jsii.Number]:
+        '''Number of port to expose on the host.
+
+        If specified, this must be a valid port number, 0 < x < 65536. If HostNetwork is specified, this must match ContainerPort. Most containers do not need this.
+
+        :schema: io.k8s.api.core.v1.ContainerPort#hostPort
+        '''
+        result = self._value_host_port
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''If specified, this must be an IANA_SVC_NAME and unique within the pod.
+
+        Each named port in a pod must have a unique name. Name for the port that can be referred to by services.
+
+        :schema: io.k8s.api.core.v1.ContainerPort#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def protocol(self) -> typing.Optional[builtins.str]:
+        '''Protocol for port.
+
+        Must be UDP, TCP, or SCTP. Defaults to "TCP".
+
+        :default: TCP".
+
+        :schema: io.k8s.api.core.v1.ContainerPort#protocol
+        '''
+        result = self._value_protocol
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "container_port": self._value_container_port,
+        }
+        if self._value_host_ip is not None:
+            values["host_ip"] = self._value_host_ip
+        if self._value_host_port is not None:
+            values["host_port"] = self._value_host_port
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_protocol is not None:
+            values["protocol"] = self._value_protocol
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ContainerPort(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ea50a33f53045ef963173d2b69fe4fa77a8142b8ae58ea83960e69f4839c879a(
+    *,
+    container_port: jsii.Number,
+    host_ip: typing.Optional[builtins.str] = None,
+    host_port: typing.Optional[jsii.Number] = None,
+    name: typing.Optional[builtins.str] = None,
+    protocol: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
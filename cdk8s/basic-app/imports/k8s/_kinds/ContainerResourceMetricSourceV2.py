@@ -0,0 +1,117 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .MetricTargetV2 import MetricTargetV2
+
+
+@jsii.data_type(
+    jsii_type="k8s.ContainerResourceMetricSourceV2",
+    jsii_struct_bases=[],
+    name_mapping={"container": "container", "name": "name", "target": "target"},
+)
+class ContainerResourceMetricSourceV2(_base.Struct):
+    __slots__ = (
+        "_value_container",
+        "_value_name",
+        "_value_target",
+    )
+
+    def __init__(
+        self,
+        *,
+        container: builtins.str,
+        name: builtins.str,
+        target: typing.Union["MetricTargetV2", typing.Dict[builtins.str, typing.Any]],
+    ) -> None:
+        '''ContainerResourceMetricSource indicates how to scale on a resource metric known to Kubernetes, as specified in requests and limits, describing each pod in the current scale target (e.g. CPU or memory).  The values will be averaged together before being compared to the target.  Such metrics are built in to Kubernetes, and have special scaling options on top of those available to normal per-pod metrics using the "pods" source.  Only one "target" type should be set.
+
+        :param container: container is the name of the container in the pods of the scaling target.
+        :param name: name is the name of the resource in question.
+        :param target: target specifies the target value for the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2.ContainerResourceMetricSource
+        '''
+        if isinstance(target, dict):
+            target = MetricTargetV2(**target)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b4e84c9f4f18c845b4719ea9f3557e5fb076a9b483c5cb7bcb93a992c8066a28)
+            check_type(argname="argument container", value=container, expected_type=type_hints["container"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument target", value=target, expected_type=type_hints["target"])
+        self._value_container = container
+        self._value_name = name
+        self._value_target = target
+
+    @builtins.property
+    def container(self) -> builtins.str:
+        '''container is the name of the container in the pods of the scaling target.
+
+        :schema: io.k8s.api.autoscaling.v2.ContainerResourceMetricSource#container
+        '''
+        result = self._value_container
+        assert result is not None, "Required property 'container' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''name is the name of the resource in question.
+
+        :schema: io.k8s.api.autoscaling.v2.ContainerResourceMetricSource#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def target(self) -> "MetricTargetV2":
+        '''target specifies the target value for the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2.ContainerResourceMetricSource#target
+        '''
+        result = self._value_target
+        assert result is not None, "Required property 'target' is missing"
+        return typing.cast("MetricTargetV2", result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "container": self._value_container,
+            "name": self._value_name,
+            "target": self._value_target,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ContainerResourceMetricSourceV2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b4e84c9f4f18c845b4719ea9f3557e5fb076a9b483c5cb7bcb93a992c8066a28(
+    *,
+    container: builtins.str,
+    name: builtins.str,
+    target: typing.Union[MetricTargetV2, typing.Dict[builtins.str, typing.Any]],
+) -> None:
+    """Type checking stubs"""
+    pass
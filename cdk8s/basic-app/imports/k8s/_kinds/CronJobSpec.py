@@ -0,0 +1,227 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .JobTemplateSpec import JobTemplateSpec
+
+
+@jsii.data_type(
+    jsii_type="k8s.CronJobSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "job_template": "jobTemplate",
+        "schedule": "schedule",
+        "concurrency_policy": "concurrencyPolicy",
+        "failed_jobs_history_limit": "failedJobsHistoryLimit",
+        "starting_deadline_seconds": "startingDeadlineSeconds",
+        "successful_jobs_history_limit": "successfulJobsHistoryLimit",
+        "suspend": "suspend",
+        "time_zone": "timeZone",
+    },
+)
+class CronJobSpec(_base.Struct):
+    __slots__ = (
+        "_value_job_template",
+        "_value_schedule",
+        "_value_concurrency_policy",
+        "_value_failed_jobs_history_limit",
+        "_value_starting_deadline_seconds",
+        "_value_successful_jobs_history_limit",
+        "_value_suspend",
+        "_value_time_zone",
+    )
+
+    def __init__(
+        self,
+        *,
+        job_template: typing.Union["JobTemplateSpec", typing.Dict[builtins.str, typing.Any]],
+        schedule: builtins.str,
+        concurrency_policy: typing.Optional[builtins.str] = None,
+        failed_jobs_history_limit: typing.Optional[jsii.Number] = None,
+        starting_deadline_seconds: typing.Optional[jsii.Number] = None,
+        successful_jobs_history_limit: typing.Optional[jsii.Number] = None,
+        suspend: typing.Optional[builtins.bool] = None,
+        time_zone: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''CronJobSpec describes how the job execution will look like and when it will actually run.
+
+        :param job_template: Specifies the job that will be created when executing a CronJob.
+        :param schedule: The schedule in Cron format, see https://en.wikipedia.org/wiki/Cron.
+        :param concurrency_policy: Specifies how to treat concurrent executions of a Job. Valid values are: - "Allow" (default): allows CronJobs to run concurrently; - "Forbid": forbids concurrent runs, skipping next run if previous run hasn't finished yet; - "Replace": cancels currently running job and replaces it with a new one
+        :param failed_jobs_history_limit: The number of failed finished jobs to retain. Value must be non-negative integer. Defaults to 1. Default: 1.
+        :param starting_deadline_seconds: Optional deadline in seconds for starting the job if it misses scheduled time for any reason. Missed jobs executions will be counted as failed ones.
+        :param successful_jobs_history_limit: The number of successful finished jobs to retain. Value must be non-negative integer. Defaults to 3. Default: 3.
+        :param suspend: This flag tells the controller to suspend subsequent executions, it does not apply to already started executions. Defaults to false. Default: false.
+        :param time_zone: The time zone name for the given schedule, see https://en.wikipedia.org/wiki/List_of_tz_database_time_zones. If not specified, this will default to the time zone of the kube-controller-manager process. The set of valid time zone names and the time zone offset is loaded from the system-wide time zone database by the API server during CronJob validation and the controller manager during execution. If no system-wide time zone database can be found a bundled version of the database is used instead. If the time zone name becomes invalid during the lifetime of a CronJob or due to a change in host configuration, the controller will stop creating new new Jobs and will create a system event with the reason UnknownTimeZone. More information can be found in https://kubernetes.io/docs/concepts/workloads/controllers/cron-jobs/#time-zones This is beta field and must be enabled via the ``CronJobTimeZone`` feature gate.
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec
+        '''
+        if isinstance(job_template, dict):
+            job_template = JobTemplateSpec(**job_template)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ede2ac625e6994d9a90814ee390559d5afe3fc8cbac21bd43b66df929f6dc946)
+            check_type(argname="argument job_template", value=job_template, expected_type=type_hints["job_template"])
+            check_type(argname="argument schedule", value=schedule, expected_type=type_hints["schedule"])
+            check_type(argname="argument concurrency_policy", value=concurrency_policy, expected_type=type_hints["concurrency_policy"])
+            check_type(argname="argument failed_jobs_history_limit", value=failed_jobs_history_limit, expected_type=type_hints["failed_jobs_history_limit"])
+            check_type(argname="argument starting_deadline_seconds", value=starting_deadline_seconds, expected_type=type_hints["starting_deadline_seconds"])
+            check_type(argname="argument successful_jobs_history_limit", value=successful_jobs_history_limit, expected_type=type_hints["successful_jobs_history_limit"])
+            check_type(argname="argument suspend", value=suspend, expected_type=type_hints["suspend"])
+            check_type(argname="argument time_zone", value=time_zone, expected_type=type_hints["time_zone"])
+        self._value_job_template = job_template
+        self._value_schedule = schedule
+        self._value_concurrency_policy = concurrency_policy
+        self._value_failed_jobs_history_limit = failed_jobs_history_limit
+        self._value_starting_deadline_seconds = starting_deadline_seconds
+        self._value_successful_jobs_history_limit = successful_jobs_history_limit
+        self._value_suspend = suspend
+        self._value_time_zone = time_zone
+
+    @builtins.property
+    def job_template(self) -> "JobTemplateSpec":
+        '''Specifies the job that will be created when executing a CronJob.
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec#jobTemplate
+        '''
+        result = self._value_job_template
+        assert result is not None, "Required property 'job_template' is missing"
+        return typing.cast("JobTemplateSpec", result)
+
+    @builtins.property
+    def schedule(self) -> builtins.str:
+        '''The schedule in Cron format, see https://en.wikipedia.org/wiki/Cron.
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec#schedule
+        '''
+        result = self._value_schedule
+        assert result is not None, "Required property 'schedule' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def concurrency_policy(self) -> typing.Optional[builtins.str]:
+        '''Specifies how to treat concurrent executions of a Job.
+
+        Valid values are: - "Allow" (default): allows CronJobs to run concurrently; - "Forbid": forbids concurrent runs, skipping next run if previous run hasn't finished yet; - "Replace": cancels currently running job and replaces it with a new one
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec#concurrencyPolicy
+        '''
+        result = self._value_concurrency_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def failed_jobs_history_limit(self) -> typing.Optional[jsii.Number]:
+        '''The number of failed finished jobs to retain.
+
+        Value must be non-negative integer. Defaults to 1.
+
+        :default: 1.
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec#failedJobsHistoryLimit
+        '''
+        result = self._value_failed_jobs_history_limit
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def starting_deadline_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Optional deadline in seconds for starting the job if it misses scheduled time for any reason.
+
+        Missed jobs executions will be counted as failed ones.
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec#startingDeadlineSeconds
+        '''
+        result = self._value_starting_deadline_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def successful_jobs_history_limit(self) -> typing.Optional[jsii.Number]:
+        '''The number of successful finished jobs to retain.
+
+        Value must be non-negative integer. Defaults to 3.
+
+        :default: 3.
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec#successfulJobsHistoryLimit
+        '''
+        result = self._value_successful_jobs_history_limit
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def suspend(self) -> typing.Optional[builtins.bool]:
+        '''This flag tells the controller to suspend subsequent executions, it does not apply to already started executions.
+
+        Defaults to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec#suspend
+        '''
+        result = self._value_suspend
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def time_zone(self) -> typing.Optional[builtins.str]:
+        '''The time zone name for the given schedule, see https://en.wikipedia.org/wiki/List_of_tz_database_time_zones. If not specified, this will default to the time zone of the kube-controller-manager process. The set of valid time zone names and the time zone offset is loaded from the system-wide time zone database by the API server during CronJob validation and the controller manager during execution. If no system-wide time zone database can be found a bundled version of the database is used instead. If the time zone name becomes invalid during the lifetime of a CronJob or due to a change in host configuration, the controller will stop creating new new Jobs and will create a system event with the reason UnknownTimeZone. More information can be found in https://kubernetes.io/docs/concepts/workloads/controllers/cron-jobs/#time-zones This is beta field and must be enabled via the ``CronJobTimeZone`` feature gate.
+
+        :schema: io.k8s.api.batch.v1.CronJobSpec#timeZone
+        '''
+        result = self._value_time_zone
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "job_template": self._value_job_template,
+            "schedule": self._value_schedule,
+        }
+        if self._value_concurrency_policy is not None:
+            values["concurrency_policy"] = self._value_concurrency_policy
+        if self._value_failed_jobs_history_limit is not None:
+            values["failed_jobs_history_limit"] = self._value_failed_jobs_history_limit
+        if self._value_starting_deadline_seconds is not None:
+            values["starting_deadline_seconds"] = self._value_starting_deadline_seconds
+        if self._value_successful_jobs_history_limit is not None:
+            values["successful_jobs_history_limit"] = self._value_successful_jobs_history_limit
+        if self._value_suspend is not None:
+            values["suspend"] = self._value_suspend
+        if self._value_time_zone is not None:
+            values["time_zone"] = self._value_time_zone
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CronJobSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ede2ac625e6994d9a90814ee390559d5afe3fc8cbac21bd43b66df929f6dc946(
+    *,
+    job_template: typing.Union[JobTemplateSpec, typing.Dict[builtins.str, typing.Any]],
+    schedule: builtins.str,
+    concurrency_policy: typing.Optional[builtins.str] = None,
+    failed_jobs_history_limit: typing.Optional[jsii.Number] = None,
+    starting_deadline_seconds: typing.Optional[jsii.Number] = None,
+    successful_jobs_history_limit: typing.Optional[jsii.Number] = None,
+    suspend: typing.Optional[builtins.bool] = None,
+    time_zone: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,118 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.CrossVersionObjectReferenceV2",
+    jsii_struct_bases=[],
+    name_mapping={"kind": "kind", "name": "name", "api_version": "apiVersion"},
+)
+class CrossVersionObjectReferenceV2(_base.Struct):
+    __slots__ = (
+        "_value_kind",
+        "_value_name",
+        "_value_api_version",
+    )
+
+    def __init__(
+        self,
+        *,
+        kind: builtins.str,
+        name: builtins.str,
+        api_version: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''CrossVersionObjectReference contains enough information to let you identify the referred resource.
+
+        :param kind: Kind of the referent; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
+        :param name: Name of the referent; More info: http://kubernetes.io/docs/user-guide/identifiers#names
+        :param api_version: API version of the referent.
+
+        :schema: io.k8s.api.autoscaling.v2.CrossVersionObjectReference
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__3af8150f9f5d358140c2abd5fb9f92e0e98dd7941df54ff76043b6eff438e4e5)
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument api_version", value=api_version, expected_type=type_hints["api_version"])
+        self._value_kind = kind
+        self._value_name = name
+        self._value_api_version = api_version
+
+    @builtins.property
+    def kind(self) -> builtins.str:
+        '''Kind of the referent;
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds"
+
+        :schema: io.k8s.api.autoscaling.v2.CrossVersionObjectReference#kind
+        '''
+        result = self._value_kind
+        assert result is not None, "Required property 'kind' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''Name of the referent;
+
+        More info: http://kubernetes.io/docs/user-guide/identifiers#names
+
+        :schema: io.k8s.api.autoscaling.v2.CrossVersionObjectReference#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def api_version(self) -> typing.Optional[builtins.str]:
+        '''API version of the referent.
+
+        :schema: io.k8s.api.autoscaling.v2.CrossVersionObjectReference#apiVersion
+        '''
+        result = self._value_api_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "kind": self._value_kind,
+            "name": self._value_name,
+        }
+        if self._value_api_version is not None:
+            values["api_version"] = self._value_api_version
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CrossVersionObjectReferenceV2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__3af8150f9f5d358140c2abd5fb9f92e0e98dd7941df54ff76043b6eff438e4e5(
+    *,
+    kind: builtins.str,
+    name: builtins.str,
+    api_version: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,258 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .TokenRequest import TokenRequest
+
+
+@jsii.data_type(
+    jsii_type="k8s.CsiDriverSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "attach_required": "attachRequired",
+        "fs_group_policy": "fsGroupPolicy",
+        "pod_info_on_mount": "podInfoOnMount",
+        "requires_republish": "requiresRepublish",
+        "se_linux_mount": "seLinuxMount",
+        "storage_capacity": "storageCapacity",
+        "token_requests": "tokenRequests",
+        "volume_lifecycle_modes": "volumeLifecycleModes",
+    },
+)
+class CsiDriverSpec(_base.Struct):
+    __slots__ = (
+        "_value_attach_required",
+        "_value_fs_group_policy",
+        "_value_pod_info_on_mount",
+        "_value_requires_republish",
+        "_value_se_linux_mount",
+        "_value_storage_capacity",
+        "_value_token_requests",
+        "_value_volume_lifecycle_modes",
+    )
+
+    def __init__(
+        self,
+        *,
+        attach_required: typing.Optional[builtins.bool] = None,
+        fs_group_policy: typing.Optional[builtins.str] = None,
+        pod_info_on_mount: typing.Optional[builtins.bool] = None,
+        requires_republish: typing.Optional[builtins.bool] = None,
+        se_linux_mount: typing.Optional[builtins.bool] = None,
+        storage_capacity: typing.Optional[builtins.bool] = None,
+        token_requests: typing.Optional[typing.Sequence[typing.Union["TokenRequest", typing.Dict[builtins.str, typing.Any]]]] = None,
+        volume_lifecycle_modes: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''CSIDriverSpec is the specification of a CSIDriver.
+
+        :param attach_required: attachRequired indicates this CSI volume driver requires an attach operation (because it implements the CSI ControllerPublishVolume() method), and that the Kubernetes attach detach controller should call the attach volume interface which checks the volumeattachment status and waits until the volume is attached before proceeding to mounting. The CSI external-attacher coordinates with CSI volume driver and updates the volumeattachment status when the attach operation is complete. If the CSIDriverRegistry feature gate is enabled and the value is specified to false, the attach operation will be skipped. Otherwise the attach operation will be called. This field is immutable.
+        :param fs_group_policy: Defines if the underlying volume supports changing ownership and permission of the volume before being mounted. Refer to the specific FSGroupPolicy values for additional details. This field is immutable. Defaults to ReadWriteOnceWithFSType, which will examine each volume to determine if Kubernetes should modify ownership and permissions of the volume. With the default policy the defined fsGroup will only be applied if a fstype is defined and the volume's access mode contains ReadWriteOnce. Default: ReadWriteOnceWithFSType, which will examine each volume to determine if Kubernetes should modify ownership and permissions of the volume. With the default policy the defined fsGroup will only be applied if a fstype is defined and the volume's access mode contains ReadWriteOnce.
+        :param pod_info_on_mount: If set to true, podInfoOnMount indicates this CSI volume driver requires additional pod information (like podName, podUID, etc.) during mount operations. If set to false, pod information will not be passed on mount. Default is false. The CSI driver specifies podInfoOnMount as part of driver deployment. If true, Kubelet will pass pod information as VolumeContext in the CSI NodePublishVolume() calls. The CSI driver is responsible for parsing and validating the information passed in as VolumeContext. The following VolumeConext will be passed if podInfoOnMount is set to true. This list might grow, but the prefix will be used. "csi.storage.k8s.io/pod.name": pod.Name "csi.storage.k8s.io/pod.namespace": pod.Namespace "csi.storage.k8s.io/pod.uid": string(pod.UID) "csi.storage.k8s.io/ephemeral": "true" if the volume is an ephemeral inline volume defined by a CSIVolumeSource, otherwise "false". "csi.storage.k8s.io/ephemeral" is a new feature in Kubernetes 1.16. It is only required for drivers which support both the "Persistent" and "Ephemeral" VolumeLifecycleMode. Other drivers can leave pod info disabled and/or ignore this field. As Kubernetes 1.15 doesn't support this field, drivers can only support one mode when deployed on such a cluster and the deployment determines which mode that is, for example via a command line parameter of the driver. This field is immutable. Default: false. The CSI driver specifies podInfoOnMount as part of driver deployment. If true, Kubelet will pass pod information as VolumeContext in the CSI NodePublishVolume() calls. The CSI driver is responsible for parsing and validating the information passed in as VolumeContext. The following VolumeConext will be passed if podInfoOnMount is set to true. This list might grow, but the prefix will be used. "csi.storage.k8s.io/pod.name": pod.Name "csi.storage.k8s.io/pod.namespace": pod.Namespace "csi.storage.k8s.io/pod.uid": string(pod.UID) "csi.storage.k8s.io/ephemeral": "true" if the volume is an ephemeral inline volume
+        :param requires_republish: RequiresRepublish indicates the CSI driver wants ``NodePublishVolume`` being periodically called to reflect any possible change in the mounted volume. This field defaults to false. Note: After a successful initial NodePublishVolume call, subsequent calls to NodePublishVolume should only update the contents of the volume. New mount points will not be seen by a running container.
+        :param se_linux_mount: SELinuxMount specifies if the CSI driver supports "-o context" mount option. When "true", the CSI driver must ensure that all volumes provided by this CSI driver can be mounted separately with different ``-o context`` options. This is typical for storage backends that provide volumes as filesystems on block devices or as independent shared volumes. Kubernetes will call NodeStage / NodePublish with "-o context=xyz" mount option when mounting a ReadWriteOncePod volume used in Pod that has explicitly set SELinux context. In the future, it may be expanded to other volume AccessModes. In any case, Kubernetes will ensure that the volume is mounted only with a single SELinux context. When "false", Kubernetes won't pass any special SELinux mount options to the driver. This is typical for volumes that represent subdirectories of a bigger shared filesystem. Default is "false". Default: false".
+        :param storage_capacity: If set to true, storageCapacity indicates that the CSI volume driver wants pod scheduling to consider the storage capacity that the driver deployment will report by creating CSIStorageCapacity objects with capacity information. The check can be enabled immediately when deploying a driver. In that case, provisioning new volumes with late binding will pause until the driver deployment has published some suitable CSIStorageCapacity object. Alternatively, the driver can be deployed with the field unset or false and it can be flipped later when storage capacity information has been published. This field was immutable in Kubernetes <= 1.22 and now is mutable.
+        :param token_requests: TokenRequests indicates the CSI driver needs pods' service account tokens it is mounting volume for to do necessary authentication. Kubelet will pass the tokens in VolumeContext in the CSI NodePublishVolume calls. The CSI driver should parse and validate the following VolumeContext: "csi.storage.k8s.io/serviceAccount.tokens": { "": { "token": , "expirationTimestamp": , }, ... } Note: Audience in each TokenRequest should be different and at most one token is empty string. To receive a new token after expiry, RequiresRepublish can be used to trigger NodePublishVolume periodically.
+        :param volume_lifecycle_modes: volumeLifecycleModes defines what kind of volumes this CSI volume driver supports. The default if the list is empty is "Persistent", which is the usage defined by the CSI specification and implemented in Kubernetes via the usual PV/PVC mechanism. The other mode is "Ephemeral". In this mode, volumes are defined inline inside the pod spec with CSIVolumeSource and their lifecycle is tied to the lifecycle of that pod. A driver has to be aware of this because it is only going to get a NodePublishVolume call for such a volume. For more information about implementing this mode, see https://kubernetes-csi.github.io/docs/ephemeral-local-volumes.html A driver can support one or more of these modes and more modes may be added in the future. This field is beta. This field is immutable.
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__17e3bd16387b10ac52d67d9c371444bdd008a79a45fd1fa94cf98f80b9c7070f)
+            check_type(argname="argument attach_required", value=attach_required, expected_type=type_hints["attach_required"])
+            check_type(argname="argument fs_group_policy", value=fs_group_policy, expected_type=type_hints["fs_group_policy"])
+            check_type(argname="argument pod_info_on_mount", value=pod_info_on_mount, expected_type=type_hints["pod_info_on_mount"])
+            check_type(argname="argument requires_republish", value=requires_republish, expected_type=type_hints["requires_republish"])
+            check_type(argname="argument se_linux_mount", value=se_linux_mount, expected_type=type_hints["se_linux_mount"])
+            check_type(argname="argument storage_capacity", value=storage_capacity, expected_type=type_hints["storage_capacity"])
+            check_type(argname="argument token_requests", value=token_requests, expected_type=type_hints["token_requests"])
+            check_type(argname="argument volume_lifecycle_modes", value=volume_lifecycle_modes, expected_type=type_hints["volume_lifecycle_modes"])
+        self._value_attach_required = attach_required
+        self._value_fs_group_policy = fs_group_policy
+        self._value_pod_info_on_mount = pod_info_on_mount
+        self._value_requires_republish = requires_republish
+        self._value_se_linux_mount = se_linux_mount
+        self._value_storage_capacity = storage_capacity
+        self._value_token_requests = token_requests
+        self._value_volume_lifecycle_modes = volume_lifecycle_modes
+
+    @builtins.property
+    def attach_required(self) -> typing.Optional[builtins.bool]:
+        '''attachRequired indicates this CSI volume driver requires an attach operation (because it implements the CSI ControllerPublishVolume() method), and that the Kubernetes attach detach controller should call the attach volume interface which checks the volumeattachment status and waits until the volume is attached before proceeding to mounting.
+
+        The CSI external-attacher coordinates with CSI volume driver and updates the volumeattachment status when the attach operation is complete. If the CSIDriverRegistry feature gate is enabled and the value is specified to false, the attach operation will be skipped. Otherwise the attach operation will be called.
+
+        This field is immutable.
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec#attachRequired
+        '''
+        result = self._value_attach_required
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def fs_group_policy(self) -> typing.Optional[builtins.str]:
+        '''Defines if the underlying volume supports changing ownership and permission of the volume before being mounted.
+
+        Refer to the specific FSGroupPolicy values for additional details.
+
+        This field is immutable.
+
+        Defaults to ReadWriteOnceWithFSType, which will examine each volume to determine if Kubernetes should modify ownership and permissions of the volume. With the default policy the defined fsGroup will only be applied if a fstype is defined and the volume's access mode contains ReadWriteOnce.
+
+        :default: ReadWriteOnceWithFSType, which will examine each volume to determine if Kubernetes should modify ownership and permissions of the volume. With the default policy the defined fsGroup will only be applied if a fstype is defined and the volume's access mode contains ReadWriteOnce.
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec#fsGroupPolicy
+        '''
+        result = self._value_fs_group_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def pod_info_on_mount(self) -> typing.Optional[builtins.bool]:
+        '''If set to true, podInfoOnMount indicates this CSI volume driver requires additional pod information (like podName, podUID, etc.) during mount operations. If set to false, pod information will not be passed on mount. Default is false. The CSI driver specifies podInfoOnMount as part of driver deployment. If true, Kubelet will pass pod information as VolumeContext in the CSI NodePublishVolume() calls. The CSI driver is responsible for parsing and validating the information passed in as VolumeContext. The following VolumeConext will be passed if podInfoOnMount is set to true. This list might grow, but the prefix will be used. "csi.storage.k8s.io/pod.name": pod.Name "csi.storage.k8s.io/pod.namespace": pod.Namespace "csi.storage.k8s.io/pod.uid": string(pod.UID) "csi.storage.k8s.io/ephemeral": "true" if the volume is an ephemeral inline volume defined by a CSIVolumeSource, otherwise "false".
+
+        "csi.storage.k8s.io/ephemeral" is a new feature in Kubernetes 1.16. It is only required for drivers which support both the "Persistent" and "Ephemeral" VolumeLifecycleMode. Other drivers can leave pod info disabled and/or ignore this field. As Kubernetes 1.15 doesn't support this field, drivers can only support one mode when deployed on such a cluster and the deployment determines which mode that is, for example via a command line parameter of the driver.
+
+        This field is immutable.
+
+        :default: false. The CSI driver specifies podInfoOnMount as part of driver deployment. If true, Kubelet will pass pod information as VolumeContext in the CSI NodePublishVolume() calls. The CSI driver is responsible for parsing and validating the information passed in as VolumeContext. The following VolumeConext will be passed if podInfoOnMount is set to true. This list might grow, but the prefix will be used. "csi.storage.k8s.io/pod.name": pod.Name "csi.storage.k8s.io/pod.namespace": pod.Namespace "csi.storage.k8s.io/pod.uid": string(pod.UID) "csi.storage.k8s.io/ephemeral": "true" if the volume is an ephemeral inline volume
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec#podInfoOnMount
+        '''
+        result = self._value_pod_info_on_mount
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def requires_republish(self) -> typing.Optional[builtins.bool]:
+        '''RequiresRepublish indicates the CSI driver wants ``NodePublishVolume`` being periodically called to reflect any possible change in the mounted volume.
+
+        This field defaults to false.
+
+        Note: After a successful initial NodePublishVolume call, subsequent calls to NodePublishVolume should only update the contents of the volume. New mount points will not be seen by a running container.
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec#requiresRepublish
+        '''
+        result = self._value_requires_republish
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def se_linux_mount(self) -> typing.Optional[builtins.bool]:
+        '''SELinuxMount specifies if the CSI driver supports "-o context" mount option.
+
+        When "true", the CSI driver must ensure that all volumes provided by this CSI driver can be mounted separately with different ``-o context`` options. This is typical for storage backends that provide volumes as filesystems on block devices or as independent shared volumes. Kubernetes will call NodeStage / NodePublish with "-o context=xyz" mount option when mounting a ReadWriteOncePod volume used in Pod that has explicitly set SELinux context. In the future, it may be expanded to other volume AccessModes. In any case, Kubernetes will ensure that the volume is mounted only with a single SELinux context.
+
+        When "false", Kubernetes won't pass any special SELinux mount options to the driver. This is typical for volumes that represent subdirectories of a bigger shared filesystem.
+
+        Default is "false".
+
+        :default: false".
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec#seLinuxMount
+        '''
+        result = self._value_se_linux_mount
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def storage_capacity(self) -> typing.Optional[builtins.bool]:
+        '''If set to true, storageCapacity indicates that the CSI volume driver wants pod scheduling to consider the storage capacity that the driver deployment will report by creating CSIStorageCapacity objects with capacity information.
+
+        The check can be enabled immediately when deploying a driver. In that case, provisioning new volumes with late binding will pause until the driver deployment has published some suitable CSIStorageCapacity object.
+
+        Alternatively, the driver can be deployed with the field unset or false and it can be flipped later when storage capacity information has been published.
+
+        This field was immutable in Kubernetes <= 1.22 and now is mutable.
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec#storageCapacity
+        '''
+        result = self._value_storage_capacity
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def token_requests(self) -> typing.Optional[typing.List["TokenRequest"]]:
+        '''TokenRequests indicates the CSI driver needs pods' service account tokens it is mounting volume for to do necessary authentication.
+
+        Kubelet will pass the tokens in VolumeContext in the CSI NodePublishVolume calls. The CSI driver should parse and validate the following VolumeContext: "csi.storage.k8s.io/serviceAccount.tokens": {
+        "": {
+        "token": ,
+        "expirationTimestamp": ,
+        },
+        ...
+        }
+
+        Note: Audience in each TokenRequest should be different and at most one token is empty string. To receive a new token after expiry, RequiresRepublish can be used to trigger NodePublishVolume periodically.
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec#tokenRequests
+        '''
+        result = self._value_token_requests
+        return typing.cast(typing.Optional[typing.List["TokenRequest"]], result)
+
+    @builtins.property
+    def volume_lifecycle_modes(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''volumeLifecycleModes defines what kind of volumes this CSI volume driver supports.
+
+        The default if the list is empty is "Persistent", which is the usage defined by the CSI specification and implemented in Kubernetes via the usual PV/PVC mechanism. The other mode is "Ephemeral". In this mode, volumes are defined inline inside the pod spec with CSIVolumeSource and their lifecycle is tied to the lifecycle of that pod. A driver has to be aware of this because it is only going to get a NodePublishVolume call for such a volume. For more information about implementing this mode, see https://kubernetes-csi.github.io/docs/ephemeral-local-volumes.html A driver can support one or more of these modes and more modes may be added in the future. This field is beta.
+
+        This field is immutable.
+
+        :schema: io.k8s.api.storage.v1.CSIDriverSpec#volumeLifecycleModes
+        '''
+        result = self._value_volume_lifecycle_modes
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_attach_required is not None:
+            values["attach_required"] = self._value_attach_required
+        if self._value_fs_group_policy is not None:
+            values["fs_group_policy"] = self._value_fs_group_policy
+        if self._value_pod_info_on_mount is not None:
+            values["pod_info_on_mount"] = self._value_pod_info_on_mount
+        if self._value_requires_republish is not None:
+            values["requires_republish"] = self._value_requires_republish
+        if self._value_se_linux_mount is not None:
+            values["se_linux_mount"] = self._value_se_linux_mount
+        if self._value_storage_capacity is not None:
+            values["storage_capacity"] = self._value_storage_capacity
+        if self._value_token_requests is not None:
+            values["token_requests"] = self._value_token_requests
+        if self._value_volume_lifecycle_modes is not None:
+            values["volume_lifecycle_modes"] = self._value_volume_lifecycle_modes
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CsiDriverSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__17e3bd16387b10ac52d67d9c371444bdd008a79a45fd1fa94cf98f80b9c7070f(
+    *,
+    attach_required: typing.Optional[builtins.bool] = None,
+    fs_group_policy: typing.Optional[builtins.str] = None,
+    pod_info_on_mount: typing.Optional[builtins.bool] = None,
+    requires_republish: typing.Optional[builtins.bool] = None,
+    se_linux_mount: typing.Optional[builtins.bool] = None,
+    storage_capacity: typing.Optional[builtins.bool] = None,
+    token_requests: typing.Optional[typing.Sequence[typing.Union[TokenRequest, typing.Dict[builtins.str, typing.Any]]]] = None,
+    volume_lifecycle_modes: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
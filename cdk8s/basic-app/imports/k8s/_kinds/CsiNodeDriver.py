@@ -0,0 +1,147 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .VolumeNodeResources import VolumeNodeResources
+
+
+@jsii.data_type(
+    jsii_type="k8s.CsiNodeDriver",
+    jsii_struct_bases=[],
+    name_mapping={
+        "name": "name",
+        "node_id": "nodeId",
+        "allocatable": "allocatable",
+        "topology_keys": "topologyKeys",
+    },
+)
+class CsiNodeDriver(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_node_id",
+        "_value_allocatable",
+        "_value_topology_keys",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: builtins.str,
+        node_id: builtins.str,
+        allocatable: typing.Optional[typing.Union["VolumeNodeResources", typing.Dict[builtins.str, typing.Any]]] = None,
+        topology_keys: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''CSINodeDriver holds information about the specification of one CSI driver installed on a node.
+
+        :param name: This is the name of the CSI driver that this object refers to. This MUST be the same name returned by the CSI GetPluginName() call for that driver.
+        :param node_id: nodeID of the node from the driver point of view. This field enables Kubernetes to communicate with storage systems that do not share the same nomenclature for nodes. For example, Kubernetes may refer to a given node as "node1", but the storage system may refer to the same node as "nodeA". When Kubernetes issues a command to the storage system to attach a volume to a specific node, it can use this field to refer to the node name using the ID that the storage system will understand, e.g. "nodeA" instead of "node1". This field is required.
+        :param allocatable: allocatable represents the volume resources of a node that are available for scheduling. This field is beta.
+        :param topology_keys: topologyKeys is the list of keys supported by the driver. When a driver is initialized on a cluster, it provides a set of topology keys that it understands (e.g. "company.com/zone", "company.com/region"). When a driver is initialized on a node, it provides the same topology keys along with values. Kubelet will expose these topology keys as labels on its own node object. When Kubernetes does topology aware provisioning, it can use this list to determine which labels it should retrieve from the node object and pass back to the driver. It is possible for different nodes to use different topology keys. This can be empty if driver does not support topology.
+
+        :schema: io.k8s.api.storage.v1.CSINodeDriver
+        '''
+        if isinstance(allocatable, dict):
+            allocatable = VolumeNodeResources(**allocatable)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__adf2babe98e03e365ff1231a34008326706969b8f221e55270d116f02fb1c250)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument node_id", value=node_id, expected_type=type_hints["node_id"])
+            check_type(argname="argument allocatable", value=allocatable, expected_type=type_hints["allocatable"])
+            check_type(argname="argument topology_keys", value=topology_keys, expected_type=type_hints["topology_keys"])
+        self._value_name = name
+        self._value_node_id = node_id
+        self._value_allocatable = allocatable
+        self._value_topology_keys = topology_keys
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''This is the name of the CSI driver that this object refers to.
+
+        This MUST be the same name returned by the CSI GetPluginName() call for that driver.
+
+        :schema: io.k8s.api.storage.v1.CSINodeDriver#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def node_id(self) -> builtins.str:
+        '''nodeID of the node from the driver point of view.
+
+        This field enables Kubernetes to communicate with storage systems that do not share the same nomenclature for nodes. For example, Kubernetes may refer to a given node as "node1", but the storage system may refer to the same node as "nodeA". When Kubernetes issues a command to the storage system to attach a volume to a specific node, it can use this field to refer to the node name using the ID that the storage system will understand, e.g. "nodeA" instead of "node1". This field is required.
+
+        :schema: io.k8s.api.storage.v1.CSINodeDriver#nodeID
+        '''
+        result = self._value_node_id
+        assert result is not None, "Required property 'node_id' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def allocatable(self) -> typing.Optional["VolumeNodeResources"]:
+        '''allocatable represents the volume resources of a node that are available for scheduling.
+
+        This field is beta.
+
+        :schema: io.k8s.api.storage.v1.CSINodeDriver#allocatable
+        '''
+        result = self._value_allocatable
+        return typing.cast(typing.Optional["VolumeNodeResources"], result)
+
+    @builtins.property
+    def topology_keys(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''topologyKeys is the list of keys supported by the driver.
+
+        When a driver is initialized on a cluster, it provides a set of topology keys that it understands (e.g. "company.com/zone", "company.com/region"). When a driver is initialized on a node, it provides the same topology keys along with values. Kubelet will expose these topology keys as labels on its own node object. When Kubernetes does topology aware provisioning, it can use this list to determine which labels it should retrieve from the node object and pass back to the driver. It is possible for different nodes to use different topology keys. This can be empty if driver does not support topology.
+
+        :schema: io.k8s.api.storage.v1.CSINodeDriver#topologyKeys
+        '''
+        result = self._value_topology_keys
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+            "node_id": self._value_node_id,
+        }
+        if self._value_allocatable is not None:
+            values["allocatable"] = self._value_allocatable
+        if self._value_topology_keys is not None:
+            values["topology_keys"] = self._value_topology_keys
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CsiNodeDriver(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__adf2babe98e03e365ff1231a34008326706969b8f221e55270d116f02fb1c250(
+    *,
+    name: builtins.str,
+    node_id: builtins.str,
+    allocatable: typing.Optional[typing.Union[VolumeNodeResources, typing.Dict[builtins.str, typing.Any]]] = None,
+    topology_keys: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
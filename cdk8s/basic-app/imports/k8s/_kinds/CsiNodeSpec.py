@@ -0,0 +1,83 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .CsiNodeDriver import CsiNodeDriver
+
+
+@jsii.data_type(
+    jsii_type="k8s.CsiNodeSpec",
+    jsii_struct_bases=[],
+    name_mapping={"drivers": "drivers"},
+)
+class CsiNodeSpec(_base.Struct):
+    __slots__ = (
+        "_value_drivers",
+    )
+
+    def __init__(
+        self,
+        *,
+        drivers: typing.Sequence[typing.Union[CsiNodeDriver, typing.Dict[builtins.str, typing.Any]]],
+    ) -> None:
+        '''CSINodeSpec holds information about the specification of all CSI drivers installed on a node.
+
+        :param drivers: drivers is a list of information of all CSI Drivers existing on a node. If all drivers in the list are uninstalled, this can become empty.
+
+        :schema: io.k8s.api.storage.v1.CSINodeSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__39088f7ceefdd1a9586f416018ad793cc2af5c04145208fe263fc1262780bed0)
+            check_type(argname="argument drivers", value=drivers, expected_type=type_hints["drivers"])
+        self._value_drivers = drivers
+
+    @builtins.property
+    def drivers(self) -> typing.List[CsiNodeDriver]:
+        '''drivers is a list of information of all CSI Drivers existing on a node.
+
+        If all drivers in the list are uninstalled, this can become empty.
+
+        :schema: io.k8s.api.storage.v1.CSINodeSpec#drivers
+        '''
+        result = self._value_drivers
+        assert result is not None, "Required property 'drivers' is missing"
+        return typing.cast(typing.List[CsiNodeDriver], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "drivers": self._value_drivers,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CsiNodeSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__39088f7ceefdd1a9586f416018ad793cc2af5c04145208fe263fc1262780bed0(
+    *,
+    drivers: typing.Sequence[typing.Union[CsiNodeDriver, typing.Dict[builtins.str, typing.Any]]],
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,277 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .SecretReference import SecretReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.CsiPersistentVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "driver": "driver",
+        "volume_handle": "volumeHandle",
+        "controller_expand_secret_ref": "controllerExpandSecretRef",
+        "controller_publish_secret_ref": "controllerPublishSecretRef",
+        "fs_type": "fsType",
+        "node_expand_secret_ref": "nodeExpandSecretRef",
+        "node_publish_secret_ref": "nodePublishSecretRef",
+        "node_stage_secret_ref": "nodeStageSecretRef",
+        "read_only": "readOnly",
+        "volume_attributes": "volumeAttributes",
+    },
+)
+class CsiPersistentVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_driver",
+        "_value_volume_handle",
+        "_value_controller_expand_secret_ref",
+        "_value_controller_publish_secret_ref",
+        "_value_fs_type",
+        "_value_node_expand_secret_ref",
+        "_value_node_publish_secret_ref",
+        "_value_node_stage_secret_ref",
+        "_value_read_only",
+        "_value_volume_attributes",
+    )
+
+    def __init__(
+        self,
+        *,
+        driver: builtins.str,
+        volume_handle: builtins.str,
+        controller_expand_secret_ref: typing.Optional[typing.Union["SecretReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        controller_publish_secret_ref: typing.Optional[typing.Union["SecretReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        fs_type: typing.Optional[builtins.str] = None,
+        node_expand_secret_ref: typing.Optional[typing.Union["SecretReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        node_publish_secret_ref: typing.Optional[typing.Union["SecretReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        node_stage_secret_ref: typing.Optional[typing.Union["SecretReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        volume_attributes: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    ) -> None:
+        '''Represents storage that is managed by an external CSI volume driver (Beta feature).
+
+        :param driver: driver is the name of the driver to use for this volume. Required.
+        :param volume_handle: volumeHandle is the unique volume name returned by the CSI volume plugin’s CreateVolume to refer to the volume on all subsequent calls. Required.
+        :param controller_expand_secret_ref: controllerExpandSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI ControllerExpandVolume call. This is an beta field and requires enabling ExpandCSIVolumes feature gate. This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+        :param controller_publish_secret_ref: controllerPublishSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI ControllerPublishVolume and ControllerUnpublishVolume calls. This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+        :param fs_type: fsType to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs".
+        :param node_expand_secret_ref: nodeExpandSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI NodeExpandVolume call. This is an alpha field and requires enabling CSINodeExpandSecret feature gate. This field is optional, may be omitted if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+        :param node_publish_secret_ref: nodePublishSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI NodePublishVolume and NodeUnpublishVolume calls. This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+        :param node_stage_secret_ref: nodeStageSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI NodeStageVolume and NodeStageVolume and NodeUnstageVolume calls. This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+        :param read_only: readOnly value to pass to ControllerPublishVolumeRequest. Defaults to false (read/write). Default: false (read/write).
+        :param volume_attributes: volumeAttributes of the volume to publish.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource
+        '''
+        if isinstance(controller_expand_secret_ref, dict):
+            controller_expand_secret_ref = SecretReference(**controller_expand_secret_ref)
+        if isinstance(controller_publish_secret_ref, dict):
+            controller_publish_secret_ref = SecretReference(**controller_publish_secret_ref)
+        if isinstance(node_expand_secret_ref, dict):
+            node_expand_secret_ref = SecretReference(**node_expand_secret_ref)
+        if isinstance(node_publish_secret_ref, dict):
+            node_publish_secret_ref = SecretReference(**node_publish_secret_ref)
+        if isinstance(node_stage_secret_ref, dict):
+            node_stage_secret_ref = SecretReference(**node_stage_secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__a4ab30eceffd6722994926b775cdc47f663e43744c6b71a78d0f1642819580a5)
+            check_type(argname="argument driver", value=driver, expected_type=type_hints["driver"])
+            check_type(argname="argument volume_handle", value=volume_handle, expected_type=type_hints["volume_handle"])
+            check_type(argname="argument controller_expand_secret_ref", value=controller_expand_secret_ref, expected_type=type_hints["controller_expand_secret_ref"])
+            check_type(argname="argument controller_publish_secret_ref", value=controller_publish_secret_ref, expected_type=type_hints["controller_publish_secret_ref"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument node_expand_secret_ref", value=node_expand_secret_ref, expected_type=type_hints["node_expand_secret_ref"])
+            check_type(argname="argument node_publish_secret_ref", value=node_publish_secret_ref, expected_type=type_hints["node_publish_secret_ref"])
+            check_type(argname="argument node_stage_secret_ref", value=node_stage_secret_ref, expected_type=type_hints["node_stage_secret_ref"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument volume_attributes", value=volume_attributes, expected_type=type_hints["volume_attributes"])
+        self._value_driver = driver
+        self._value_volume_handle = volume_handle
+        self._value_controller_expand_secret_ref = controller_expand_secret_ref
+        self._value_controller_publish_secret_ref = controller_publish_secret_ref
+        self._value_fs_type = fs_type
+        self._value_node_expand_secret_ref = node_expand_secret_ref
+        self._value_node_publish_secret_ref = node_publish_secret_ref
+        self._value_node_stage_secret_ref = node_stage_secret_ref
+        self._value_read_only = read_only
+        self._value_volume_attributes = volume_attributes
+
+    @builtins.property
+    def driver(self) -> builtins.str:
+        '''driver is the name of the driver to use for this volume.
+
+        Required.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#driver
+        '''
+        result = self._value_driver
+        assert result is not None, "Required property 'driver' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def volume_handle(self) -> builtins.str:
+        '''volumeHandle is the unique volume name returned by the CSI volume plugin’s CreateVolume to refer to the volume on all subsequent calls.
+
+        Required.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#volumeHandle
+        '''
+        result = self._value_volume_handle
+        assert result is not None, "Required property 'volume_handle' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def controller_expand_secret_ref(self) -> typing.Optional["SecretReference"]:
+        '''controllerExpandSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI ControllerExpandVolume call.
+
+        This is an beta field and requires enabling ExpandCSIVolumes feature gate. This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#controllerExpandSecretRef
+        '''
+        result = self._value_controller_expand_secret_ref
+        return typing.cast(typing.Optional["SecretReference"], result)
+
+    @builtins.property
+    def controller_publish_secret_ref(self) -> typing.Optional["SecretReference"]:
+        '''controllerPublishSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI ControllerPublishVolume and ControllerUnpublishVolume calls.
+
+        This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#controllerPublishSecretRef
+        '''
+        result = self._value_controller_publish_secret_ref
+        return typing.cast(typing.Optional["SecretReference"], result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType to mount.
+
+        Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs".
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def node_expand_secret_ref(self) -> typing.Optional["SecretReference"]:
+        '''nodeExpandSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI NodeExpandVolume call.
+
+        This is an alpha field and requires enabling CSINodeExpandSecret feature gate. This field is optional, may be omitted if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#nodeExpandSecretRef
+        '''
+        result = self._value_node_expand_secret_ref
+        return typing.cast(typing.Optional["SecretReference"], result)
+
+    @builtins.property
+    def node_publish_secret_ref(self) -> typing.Optional["SecretReference"]:
+        '''nodePublishSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI NodePublishVolume and NodeUnpublishVolume calls.
+
+        This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#nodePublishSecretRef
+        '''
+        result = self._value_node_publish_secret_ref
+        return typing.cast(typing.Optional["SecretReference"], result)
+
+    @builtins.property
+    def node_stage_secret_ref(self) -> typing.Optional["SecretReference"]:
+        '''nodeStageSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI NodeStageVolume and NodeStageVolume and NodeUnstageVolume calls.
+
+        This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#nodeStageSecretRef
+        '''
+        result = self._value_node_stage_secret_ref
+        return typing.cast(typing.Optional["SecretReference"], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly value to pass to ControllerPublishVolumeRequest.
+
+        Defaults to false (read/write).
+
+        :default: false (read/write).
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def volume_attributes(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''volumeAttributes of the volume to publish.
+
+        :schema: io.k8s.api.core.v1.CSIPersistentVolumeSource#volumeAttributes
+        '''
+        result = self._value_volume_attributes
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "driver": self._value_driver,
+            "volume_handle": self._value_volume_handle,
+        }
+        if self._value_controller_expand_secret_ref is not None:
+            values["controller_expand_secret_ref"] = self._value_controller_expand_secret_ref
+        if self._value_controller_publish_secret_ref is not None:
+            values["controller_publish_secret_ref"] = self._value_controller_publish_secret_ref
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_node_expand_secret_ref is not None:
+            values["node_expand_secret_ref"] = self._value_node_expand_secret_ref
+        if self._value_node_publish_secret_ref is not None:
+            values["node_publish_secret_ref"] = self._value_node_publish_secret_ref
+        if self._value_node_stage_secret_ref is not None:
+            values["node_stage_secret_ref"] = self._value_node_stage_secret_ref
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_volume_attributes is not None:
+            values["volume_attributes"] = self._value_volume_attributes
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CsiPersistentVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__a4ab30eceffd6722994926b775cdc47f663e43744c6b71a78d0f1642819580a5(
+    *,
+    driver: builtins.str,
+    volume_handle: builtins.str,
+    controller_expand_secret_ref: typing.Optional[typing.Union[SecretReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    controller_publish_secret_ref: typing.Optional[typing.Union[SecretReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    fs_type: typing.Optional[builtins.str] = None,
+    node_expand_secret_ref: typing.Optional[typing.Union[SecretReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    node_publish_secret_ref: typing.Optional[typing.Union[SecretReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    node_stage_secret_ref: typing.Optional[typing.Union[SecretReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    volume_attributes: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,171 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LocalObjectReference import LocalObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.CsiVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "driver": "driver",
+        "fs_type": "fsType",
+        "node_publish_secret_ref": "nodePublishSecretRef",
+        "read_only": "readOnly",
+        "volume_attributes": "volumeAttributes",
+    },
+)
+class CsiVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_driver",
+        "_value_fs_type",
+        "_value_node_publish_secret_ref",
+        "_value_read_only",
+        "_value_volume_attributes",
+    )
+
+    def __init__(
+        self,
+        *,
+        driver: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+        node_publish_secret_ref: typing.Optional[typing.Union["LocalObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        volume_attributes: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    ) -> None:
+        '''Represents a source location of a volume to mount, managed by an external CSI driver.
+
+        :param driver: driver is the name of the CSI driver that handles this volume. Consult with your admin for the correct name as registered in the cluster.
+        :param fs_type: fsType to mount. Ex. "ext4", "xfs", "ntfs". If not provided, the empty value is passed to the associated CSI driver which will determine the default filesystem to apply.
+        :param node_publish_secret_ref: nodePublishSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI NodePublishVolume and NodeUnpublishVolume calls. This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secret references are passed.
+        :param read_only: readOnly specifies a read-only configuration for the volume. Defaults to false (read/write). Default: false (read/write).
+        :param volume_attributes: volumeAttributes stores driver-specific properties that are passed to the CSI driver. Consult your driver's documentation for supported values.
+
+        :schema: io.k8s.api.core.v1.CSIVolumeSource
+        '''
+        if isinstance(node_publish_secret_ref, dict):
+            node_publish_secret_ref = LocalObjectReference(**node_publish_secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__65e9dfb99794038b02bcf5d69b1da24f041cc9f271cf98f603749465f2a3c2fe)
+            check_type(argname="argument driver", value=driver, expected_type=type_hints["driver"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument node_publish_secret_ref", value=node_publish_secret_ref, expected_type=type_hints["node_publish_secret_ref"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument volume_attributes", value=volume_attributes, expected_type=type_hints["volume_attributes"])
+        self._value_driver = driver
+        self._value_fs_type = fs_type
+        self._value_node_publish_secret_ref = node_publish_secret_ref
+        self._value_read_only = read_only
+        self._value_volume_attributes = volume_attributes
+
+    @builtins.property
+    def driver(self) -> builtins.str:
+        '''driver is the name of the CSI driver that handles this volume.
+
+        Consult with your admin for the correct name as registered in the cluster.
+
+        :schema: io.k8s.api.core.v1.CSIVolumeSource#driver
+        '''
+        result = self._value_driver
+        assert result is not None, "Required property 'driver' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType to mount.
+
+        Ex. "ext4", "xfs", "ntfs". If not provided, the empty value is passed to the associated CSI driver which will determine the default filesystem to apply.
+
+        :schema: io.k8s.api.core.v1.CSIVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def node_publish_secret_ref(self) -> typing.Optional["LocalObjectReference"]:
+        '''nodePublishSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI NodePublishVolume and NodeUnpublishVolume calls.
+
+        This field is optional, and  may be empty if no secret is required. If the secret object contains more than one secret, all secret references are passed.
+
+        :schema: io.k8s.api.core.v1.CSIVolumeSource#nodePublishSecretRef
+        '''
+        result = self._value_node_publish_secret_ref
+        return typing.cast(typing.Optional["LocalObjectReference"], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly specifies a read-only configuration for the volume.
+
+        Defaults to false (read/write).
+
+        :default: false (read/write).
+
+        :schema: io.k8s.api.core.v1.CSIVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def volume_attributes(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''volumeAttributes stores driver-specific properties that are passed to the CSI driver.
+
+        Consult your driver's documentation for supported values.
+
+        :schema: io.k8s.api.core.v1.CSIVolumeSource#volumeAttributes
+        '''
+        result = self._value_volume_attributes
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "driver": self._value_driver,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_node_publish_secret_ref is not None:
+            values["node_publish_secret_ref"] = self._value_node_publish_secret_ref
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_volume_attributes is not None:
+            values["volume_attributes"] = self._value_volume_attributes
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CsiVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__65e9dfb99794038b02bcf5d69b1da24f041cc9f271cf98f603749465f2a3c2fe(
+    *,
+    driver: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+    node_publish_secret_ref: typing.Optional[typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    volume_attributes: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,178 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.CustomResourceColumnDefinition",
+    jsii_struct_bases=[],
+    name_mapping={
+        "json_path": "jsonPath",
+        "name": "name",
+        "type": "type",
+        "description": "description",
+        "format": "format",
+        "priority": "priority",
+    },
+)
+class CustomResourceColumnDefinition(_base.Struct):
+    __slots__ = (
+        "_value_json_path",
+        "_value_name",
+        "_value_type",
+        "_value_description",
+        "_value_format",
+        "_value_priority",
+    )
+
+    def __init__(
+        self,
+        *,
+        json_path: builtins.str,
+        name: builtins.str,
+        type: builtins.str,
+        description: typing.Optional[builtins.str] = None,
+        format: typing.Optional[builtins.str] = None,
+        priority: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''CustomResourceColumnDefinition specifies a column for server side printing.
+
+        :param json_path: jsonPath is a simple JSON path (i.e. with array notation) which is evaluated against each custom resource to produce the value for this column.
+        :param name: name is a human readable name for the column.
+        :param type: type is an OpenAPI type definition for this column. See https://github.com/OAI/OpenAPI-Specification/blob/master/versions/2.0.md#data-types for details.
+        :param description: description is a human readable description of this column.
+        :param format: format is an optional OpenAPI type definition for this column. The 'name' format is applied to the primary identifier column to assist in clients identifying column is the resource name. See https://github.com/OAI/OpenAPI-Specification/blob/master/versions/2.0.md#data-types for details.
+        :param priority: priority is an integer defining the relative importance of this column compared to others. Lower numbers are considered higher priority. Columns that may be omitted in limited space scenarios should be given a priority greater than 0.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceColumnDefinition
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__67357d094ad4e40c9fcc3d8cbf7b086f1bfc3261b70c6905ae016e7272d48696)
+            check_type(argname="argument json_path", value=json_path, expected_type=type_hints["json_path"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument description", value=description, expected_type=type_hints["description"])
+            check_type(argname="argument format", value=format, expected_type=type_hints["format"])
+            check_type(argname="argument priority", value=priority, expected_type=type_hints["priority"])
+        self._value_json_path = json_path
+        self._value_name = name
+        self._value_type = type
+        self._value_description = description
+        self._value_format = format
+        self._value_priority = priority
+
+    @builtins.property
+    def json_path(self) -> builtins.str:
+        '''jsonPath is a simple JSON path (i.e. with array notation) which is evaluated against each custom resource to produce the value for this column.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceColumnDefinition#jsonPath
+        '''
+        result = self._value_json_path
+        assert result is not None, "Required property 'json_path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''name is a human readable name for the column.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceColumnDefinition#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''type is an OpenAPI type definition for this column.
+
+        See https://github.com/OAI/OpenAPI-Specification/blob/master/versions/2.0.md#data-types for details.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceColumnDefinition#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def description(self) -> typing.Optional[builtins.str]:
+        '''description is a human readable description of this column.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceColumnDefinition#description
+        '''
+        result = self._value_description
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def format(self) -> typing.Optional[builtins.str]:
+        '''format is an optional OpenAPI type definition for this column.
+
+        The 'name' format is applied to the primary identifier column to assist in clients identifying column is the resource name. See https://github.com/OAI/OpenAPI-Specification/blob/master/versions/2.0.md#data-types for details.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceColumnDefinition#format
+        '''
+        result = self._value_format
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def priority(self) -> typing.Optional[jsii.Number]:
+        '''priority is an integer defining the relative importance of this column compared to others.
+
+        Lower numbers are considered higher priority. Columns that may be omitted in limited space scenarios should be given a priority greater than 0.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceColumnDefinition#priority
+        '''
+        result = self._value_priority
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "json_path": self._value_json_path,
+            "name": self._value_name,
+            "type": self._value_type,
+        }
+        if self._value_description is not None:
+            values["description"] = self._value_description
+        if self._value_format is not None:
+            values["format"] = self._value_format
+        if self._value_priority is not None:
+            values["priority"] = self._value_priority
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CustomResourceColumnDefinition(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__67357d094ad4e40c9fcc3d8cbf7b086f1bfc3261b70c6905ae016e7272d48696(
+    *,
+    json_path: builtins.str,
+    name: builtins.str,
+    type: builtins.str,
+    description: typing.Optional[builtins.str] = None,
+    format: typing.Optional[builtins.str] = None,
+    priority: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,105 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .WebhookConversion import WebhookConversion
+
+
+@jsii.data_type(
+    jsii_type="k8s.CustomResourceConversion",
+    jsii_struct_bases=[],
+    name_mapping={"strategy": "strategy", "webhook": "webhook"},
+)
+class CustomResourceConversion(_base.Struct):
+    __slots__ = (
+        "_value_strategy",
+        "_value_webhook",
+    )
+
+    def __init__(
+        self,
+        *,
+        strategy: builtins.str,
+        webhook: typing.Optional[typing.Union["WebhookConversion", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''CustomResourceConversion describes how to convert different versions of a CR.
+
+        :param strategy: strategy specifies how custom resources are converted between versions. Allowed values are: - ``None``: The converter only change the apiVersion and would not touch any other field in the custom resource. - ``Webhook``: API Server will call to an external webhook to do the conversion. Additional information is needed for this option. This requires spec.preserveUnknownFields to be false, and spec.conversion.webhook to be set.
+        :param webhook: webhook describes how to call the conversion webhook. Required when ``strategy`` is set to ``Webhook``.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceConversion
+        '''
+        if isinstance(webhook, dict):
+            webhook = WebhookConversion(**webhook)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__d70408b4791a667462cf9c5081a65101e992ff219dda7178fc0fe4a250937f89)
+            check_type(argname="argument strategy", value=strategy, expected_type=type_hints["strategy"])
+            check_type(argname="argument webhook", value=webhook, expected_type=type_hints["webhook"])
+        self._value_strategy = strategy
+        self._value_webhook = webhook
+
+    @builtins.property
+    def strategy(self) -> builtins.str:
+        '''strategy specifies how custom resources are converted between versions.
+
+        Allowed values are: - ``None``: The converter only change the apiVersion and would not touch any other field in the custom resource. - ``Webhook``: API Server will call to an external webhook to do the conversion. Additional information
+        is needed for this option. This requires spec.preserveUnknownFields to be false, and spec.conversion.webhook to be set.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceConversion#strategy
+        '''
+        result = self._value_strategy
+        assert result is not None, "Required property 'strategy' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def webhook(self) -> typing.Optional["WebhookConversion"]:
+        '''webhook describes how to call the conversion webhook.
+
+        Required when ``strategy`` is set to ``Webhook``.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceConversion#webhook
+        '''
+        result = self._value_webhook
+        return typing.cast(typing.Optional["WebhookConversion"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "strategy": self._value_strategy,
+        }
+        if self._value_webhook is not None:
+            values["webhook"] = self._value_webhook
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CustomResourceConversion(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__d70408b4791a667462cf9c5081a65101e992ff219dda7178fc0fe4a250937f89(
+    *,
+    strategy: builtins.str,
+    webhook: typing.Optional[typing.Union[WebhookConversion, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
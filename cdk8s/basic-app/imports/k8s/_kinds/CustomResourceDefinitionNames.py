@@ -0,0 +1,186 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.CustomResourceDefinitionNames",
+    jsii_struct_bases=[],
+    name_mapping={
+        "kind": "kind",
+        "plural": "plural",
+        "categories": "categories",
+        "list_kind": "listKind",
+        "short_names": "shortNames",
+        "singular": "singular",
+    },
+)
+class CustomResourceDefinitionNames(_base.Struct):
+    __slots__ = (
+        "_value_kind",
+        "_value_plural",
+        "_value_categories",
+        "_value_list_kind",
+        "_value_short_names",
+        "_value_singular",
+    )
+
+    def __init__(
+        self,
+        *,
+        kind: builtins.str,
+        plural: builtins.str,
+        categories: typing.Optional[typing.Sequence[builtins.str]] = None,
+        list_kind: typing.Optional[builtins.str] = None,
+        short_names: typing.Optional[typing.Sequence[builtins.str]] = None,
+        singular: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''CustomResourceDefinitionNames indicates the names to serve this CustomResourceDefinition.
+
+        :param kind: kind is the serialized kind of the resource. It is normally CamelCase and singular. Custom resource instances will use this value as the ``kind`` attribute in API calls.
+        :param plural: plural is the plural name of the resource to serve. The custom resources are served under ``/apis/<group>/<version>/.../<plural>``. Must match the name of the CustomResourceDefinition (in the form ``<names.plural>.<group>``). Must be all lowercase.
+        :param categories: categories is a list of grouped resources this custom resource belongs to (e.g. 'all'). This is published in API discovery documents, and used by clients to support invocations like ``kubectl get all``.
+        :param list_kind: listKind is the serialized kind of the list for this resource. Defaults to "``kind``List". Default: kind`List".
+        :param short_names: shortNames are short names for the resource, exposed in API discovery documents, and used by clients to support invocations like ``kubectl get <shortname>``. It must be all lowercase.
+        :param singular: singular is the singular name of the resource. It must be all lowercase. Defaults to lowercased ``kind``. Default: lowercased ``kind``.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionNames
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__9f1b391925af7e4945bb8d4ea39747ad4716515ac0a5519bb5b63e5039390614)
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument plural", value=plural, expected_type=type_hints["plural"])
+            check_type(argname="argument categories", value=categories, expected_type=type_hints["categories"])
+            check_type(argname="argument list_kind", value=list_kind, expected_type=type_hints["list_kind"])
+            check_type(argname="argument short_names", value=short_names, expected_type=type_hints["short_names"])
+            check_type(argname="argument singular", value=singular, expected_type=type_hints["singular"])
+        self._value_kind = kind
+        self._value_plural = plural
+        self._value_categories = categories
+        self._value_list_kind = list_kind
+        self._value_short_names = short_names
+        self._value_singular = singular
+
+    @builtins.property
+    def kind(self) -> builtins.str:
+        '''kind is the serialized kind of the resource.
+
+        It is normally CamelCase and singular. Custom resource instances will use this value as the ``kind`` attribute in API calls.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionNames#kind
+        '''
+        result = self._value_kind
+        assert result is not None, "Required property 'kind' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def plural(self) -> builtins.str:
+        '''plural is the plural name of the resource to serve.
+
+        The custom resources are served under ``/apis/<group>/<version>/.../<plural>``. Must match the name of the CustomResourceDefinition (in the form ``<names.plural>.<group>``). Must be all lowercase.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionNames#plural
+        '''
+        result = self._value_plural
+        assert result is not None, "Required property 'plural' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def categories(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''categories is a list of grouped resources this custom resource belongs to (e.g. 'all'). This is published in API discovery documents, and used by clients to support invocations like ``kubectl get all``.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionNames#categories
+        '''
+        result = self._value_categories
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def list_kind(self) -> typing.Optional[builtins.str]:
+        '''listKind is the serialized kind of the list for this resource.
+
+        Defaults to "``kind``List".
+
+        :default: kind`List".
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionNames#listKind
+        '''
+        result = self._value_list_kind
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def short_names(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''shortNames are short names for the resource, exposed in API discovery documents, and used by clients to support invocations like ``kubectl get <shortname>``.
+
+        It must be all lowercase.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionNames#shortNames
+        '''
+        result = self._value_short_names
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def singular(self) -> typing.Optional[builtins.str]:
+        '''singular is the singular name of the resource.
+
+        It must be all lowercase. Defaults to lowercased ``kind``.
+
+        :default: lowercased ``kind``.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionNames#singular
+        '''
+        result = self._value_singular
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "kind": self._value_kind,
+            "plural": self._value_plural,
+        }
+        if self._value_categories is not None:
+            values["categories"] = self._value_categories
+        if self._value_list_kind is not None:
+            values["list_kind"] = self._value_list_kind
+        if self._value_short_names is not None:
+            values["short_names"] = self._value_short_names
+        if self._value_singular is not None:
+            values["singular"] = self._value_singular
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CustomResourceDefinitionNames(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__9f1b391925af7e4945bb8d4ea39747ad4716515ac0a5519bb5b63e5039390614(
+    *,
+    kind: builtins.str,
+    plural: builtins.str,
+    categories: typing.Optional[typing.Sequence[builtins.str]] = None,
+    list_kind: typing.Optional[builtins.str] = None,
+    short_names: typing.Optional[typing.Sequence[builtins.str]] = None,
+    singular: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,187 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .CustomResourceConversion import CustomResourceConversion
+from .CustomResourceDefinitionNames import CustomResourceDefinitionNames
+from .CustomResourceDefinitionVersion import CustomResourceDefinitionVersion
+
+
+@jsii.data_type(
+    jsii_type="k8s.CustomResourceDefinitionSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "group": "group",
+        "names": "names",
+        "scope": "scope",
+        "versions": "versions",
+        "conversion": "conversion",
+        "preserve_unknown_fields": "preserveUnknownFields",
+    },
+)
+class CustomResourceDefinitionSpec(_base.Struct):
+    __slots__ = (
+        "_value_group",
+        "_value_names",
+        "_value_scope",
+        "_value_versions",
+        "_value_conversion",
+        "_value_preserve_unknown_fields",
+    )
+
+    def __init__(
+        self,
+        *,
+        group: builtins.str,
+        names: typing.Union[CustomResourceDefinitionNames, typing.Dict[builtins.str, typing.Any]],
+        scope: builtins.str,
+        versions: typing.Sequence[typing.Union["CustomResourceDefinitionVersion", typing.Dict[builtins.str, typing.Any]]],
+        conversion: typing.Optional[typing.Union[CustomResourceConversion, typing.Dict[builtins.str, typing.Any]]] = None,
+        preserve_unknown_fields: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''CustomResourceDefinitionSpec describes how a user wants their resource to appear.
+
+        :param group: group is the API group of the defined custom resource. The custom resources are served under ``/apis/<group>/...``. Must match the name of the CustomResourceDefinition (in the form ``<names.plural>.<group>``).
+        :param names: names specify the resource and kind names for the custom resource.
+        :param scope: scope indicates whether the defined custom resource is cluster- or namespace-scoped. Allowed values are ``Cluster`` and ``Namespaced``.
+        :param versions: versions is the list of all API versions of the defined custom resource. Version names are used to compute the order in which served versions are listed in API discovery. If the version string is "kube-like", it will sort above non "kube-like" version strings, which are ordered lexicographically. "Kube-like" versions start with a "v", then are followed by a number (the major version), then optionally the string "alpha" or "beta" and another number (the minor version). These are sorted first by GA > beta > alpha (where GA is a version with no suffix such as beta or alpha), and then by comparing major version, then minor version. An example sorted list of versions: v10, v2, v1, v11beta2, v10beta3, v3beta1, v12alpha1, v11alpha2, foo1, foo10.
+        :param conversion: conversion defines conversion settings for the CRD.
+        :param preserve_unknown_fields: preserveUnknownFields indicates that object fields which are not specified in the OpenAPI schema should be preserved when persisting to storage. apiVersion, kind, metadata and known fields inside metadata are always preserved. This field is deprecated in favor of setting ``x-preserve-unknown-fields`` to true in ``spec.versions[*].schema.openAPIV3Schema``. See https://kubernetes.io/docs/tasks/access-kubernetes-api/custom-resources/custom-resource-definitions/#pruning-versus-preserving-unknown-fields for details.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionSpec
+        '''
+        if isinstance(names, dict):
+            names = CustomResourceDefinitionNames(**names)
+        if isinstance(conversion, dict):
+            conversion = CustomResourceConversion(**conversion)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__3998b630c25e34db9c60fa9ce393302f885dc2d0aa7e7eddb9228b8dc8335d91)
+            check_type(argname="argument group", value=group, expected_type=type_hints["group"])
+            check_type(argname="argument names", value=names, expected_type=type_hints["names"])
+            check_type(argname="argument scope", value=scope, expected_type=type_hints["scope"])
+            check_type(argname="argument versions", value=versions, expected_type=type_hints["versions"])
+            check_type(argname="argument conversion", value=conversion, expected_type=type_hints["conversion"])
+            check_type(argname="argument preserve_unknown_fields", value=preserve_unknown_fields, expected_type=type_hints["preserve_unknown_fields"])
+        self._value_group = group
+        self._value_names = names
+        self._value_scope = scope
+        self._value_versions = versions
+        self._value_conversion = conversion
+        self._value_preserve_unknown_fields = preserve_unknown_fields
+
+    @builtins.property
+    def group(self) -> builtins.str:
+        '''group is the API group of the defined custom resource.
+
+        The custom resources are served under ``/apis/<group>/...``. Must match the name of the CustomResourceDefinition (in the form ``<names.plural>.<group>``).
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionSpec#group
+        '''
+        result = self._value_group
+        assert result is not None, "Required property 'group' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def names(self) -> CustomResourceDefinitionNames:
+        '''names specify the resource and kind names for the custom resource.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionSpec#names
+        '''
+        result = self._value_names
+        assert result is not None, "Required property 'names' is missing"
+        return typing.cast(CustomResourceDefinitionNames, result)
+
+    @builtins.property
+    def scope(self) -> builtins.str:
+        '''scope indicates whether the defined custom resource is cluster- or namespace-scoped.
+
+        Allowed values are ``Cluster`` and ``Namespaced``.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionSpec#scope
+        '''
+        result = self._value_scope
+        assert result is not None, "Required property 'scope' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def versions(self) -> typing.List["CustomResourceDefinitionVersion"]:
+        '''versions is the list of all API versions of the defined custom resource.
+
+        Version names are used to compute the order in which served versions are listed in API discovery. If the version string is "kube-like", it will sort above non "kube-like" version strings, which are ordered lexicographically. "Kube-like" versions start with a "v", then are followed by a number (the major version), then optionally the string "alpha" or "beta" and another number (the minor version). These are sorted first by GA > beta > alpha (where GA is a version with no suffix such as beta or alpha), and then by comparing major version, then minor version. An example sorted list of versions: v10, v2, v1, v11beta2, v10beta3, v3beta1, v12alpha1, v11alpha2, foo1, foo10.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionSpec#versions
+        '''
+        result = self._value_versions
+        assert result is not None, "Required property 'versions' is missing"
+        return typing.cast(typing.List["CustomResourceDefinitionVersion"], result)
+
+    @builtins.property
+    def conversion(self) -> typing.Optional[CustomResourceConversion]:
+        '''conversion defines conversion settings for the CRD.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionSpec#conversion
+        '''
+        result = self._value_conversion
+        return typing.cast(typing.Optional[CustomResourceConversion], result)
+
+    @builtins.property
+    def preserve_unknown_fields(self) -> typing.Optional[builtins.bool]:
+        '''preserveUnknownFields indicates that object fields which are not specified in the OpenAPI schema should be preserved when persisting to storage.
+
+        apiVersion, kind, metadata and known fields inside metadata are always preserved. This field is deprecated in favor of setting ``x-preserve-unknown-fields`` to true in ``spec.versions[*].schema.openAPIV3Schema``. See https://kubernetes.io/docs/tasks/access-kubernetes-api/custom-resources/custom-resource-definitions/#pruning-versus-preserving-unknown-fields for details.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionSpec#preserveUnknownFields
+        '''
+        result = self._value_preserve_unknown_fields
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "group": self._value_group,
+            "names": self._value_names,
+            "scope": self._value_scope,
+            "versions": self._value_versions,
+        }
+        if self._value_conversion is not None:
+            values["conversion"] = self._value_conversion
+        if self._value_preserve_unknown_fields is not None:
+            values["preserve_unknown_fields"] = self._value_preserve_unknown_fields
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CustomResourceDefinitionSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__3998b630c25e34db9c60fa9ce393302f885dc2d0aa7e7eddb9228b8dc8335d91(
+    *,
+    group: builtins.str,
+    names: typing.Union[CustomResourceDefinitionNames, typing.Dict[builtins.str, typing.Any]],
+    scope: builtins.str,
+    versions: typing.Sequence[typing.Union[CustomResourceDefinitionVersion, typing.Dict[builtins.str, typing.Any]]],
+    conversion: typing.Optional[typing.Union[CustomResourceConversion, typing.Dict[builtins.str, typing.Any]]] = None,
+    preserve_unknown_fields: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,227 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .CustomResourceColumnDefinition import CustomResourceColumnDefinition
+from .CustomResourceSubresources import CustomResourceSubresources
+from .CustomResourceValidation import CustomResourceValidation
+
+
+@jsii.data_type(
+    jsii_type="k8s.CustomResourceDefinitionVersion",
+    jsii_struct_bases=[],
+    name_mapping={
+        "name": "name",
+        "served": "served",
+        "storage": "storage",
+        "additional_printer_columns": "additionalPrinterColumns",
+        "deprecated": "deprecated",
+        "deprecation_warning": "deprecationWarning",
+        "schema": "schema",
+        "subresources": "subresources",
+    },
+)
+class CustomResourceDefinitionVersion(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_served",
+        "_value_storage",
+        "_value_additional_printer_columns",
+        "_value_deprecated",
+        "_value_deprecation_warning",
+        "_value_schema",
+        "_value_subresources",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: builtins.str,
+        served: builtins.bool,
+        storage: builtins.bool,
+        additional_printer_columns: typing.Optional[typing.Sequence[typing.Union[CustomResourceColumnDefinition, typing.Dict[builtins.str, typing.Any]]]] = None,
+        deprecated: typing.Optional[builtins.bool] = None,
+        deprecation_warning: typing.Optional[builtins.str] = None,
+        schema: typing.Optional[typing.Union["CustomResourceValidation", typing.Dict[builtins.str, typing.Any]]] = None,
+        subresources: typing.Optional[typing.Union["CustomResourceSubresources", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''CustomResourceDefinitionVersion describes a version for CRD.
+
+        :param name: name is the version name, e.g. “v1”, “v2beta1”, etc. The custom resources are served under this version at ``/apis/<group>/<version>/...`` if ``served`` is true.
+        :param served: served is a flag enabling/disabling this version from being served via REST APIs.
+        :param storage: storage indicates this version should be used when persisting custom resources to storage. There must be exactly one version with storage=true.
+        :param additional_printer_columns: additionalPrinterColumns specifies additional columns returned in Table output. See https://kubernetes.io/docs/reference/using-api/api-concepts/#receiving-resources-as-tables for details. If no columns are specified, a single column displaying the age of the custom resource is used.
+        :param deprecated: deprecated indicates this version of the custom resource API is deprecated. When set to true, API requests to this version receive a warning header in the server response. Defaults to false. Default: false.
+        :param deprecation_warning: deprecationWarning overrides the default warning returned to API clients. May only be set when ``deprecated`` is true. The default warning indicates this version is deprecated and recommends use of the newest served version of equal or greater stability, if one exists.
+        :param schema: schema describes the schema used for validation, pruning, and defaulting of this version of the custom resource.
+        :param subresources: subresources specify what subresources this version of the defined custom resource have.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion
+        '''
+        if isinstance(schema, dict):
+            schema = CustomResourceValidation(**schema)
+        if isinstance(subresources, dict):
+            subresources = CustomResourceSubresources(**subresources)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__d6df99d714ea39698bb4328abb2c39a68421fd691d72d93bd6ddbb23b90046bf)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument served", value=served, expected_type=type_hints["served"])
+            check_type(argname="argument storage", value=storage, expected_type=type_hints["storage"])
+            check_type(argname="argument additional_printer_columns", value=additional_printer_columns, expected_type=type_hints["additional_printer_columns"])
+            check_type(argname="argument deprecated", value=deprecated, expected_type=type_hints["deprecated"])
+            check_type(argname="argument deprecation_warning", value=deprecation_warning, expected_type=type_hints["deprecation_warning"])
+            check_type(argname="argument schema", value=schema, expected_type=type_hints["schema"])
+            check_type(argname="argument subresources", value=subresources, expected_type=type_hints["subresources"])
+        self._value_name = name
+        self._value_served = served
+        self._value_storage = storage
+        self._value_additional_printer_columns = additional_printer_columns
+        self._value_deprecated = deprecated
+        self._value_deprecation_warning = deprecation_warning
+        self._value_schema = schema
+        self._value_subresources = subresources
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''name is the version name, e.g. “v1”, “v2beta1”, etc. The custom resources are served under this version at ``/apis/<group>/<version>/...`` if ``served`` is true.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def served(self) -> builtins.bool:
+        '''served is a flag enabling/disabling this version from being served via REST APIs.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion#served
+        '''
+        result = self._value_served
+        assert result is not None, "Required property 'served' is missing"
+        return typing.cast(builtins.bool, result)
+
+    @builtins.property
+    def storage(self) -> builtins.bool:
+        '''storage indicates this version should be used when persisting custom resources to storage.
+
+        There must be exactly one version with storage=true.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion#storage
+        '''
+        result = self._value_storage
+        assert result is not None, "Required property 'storage' is missing"
+        return typing.cast(builtins.bool, result)
+
+    @builtins.property
+    def additional_printer_columns(
+        self,
+    ) -> typing.Optional[typing.List[CustomResourceColumnDefinition]]:
+        '''additionalPrinterColumns specifies additional columns returned in Table output.
+
+        See https://kubernetes.io/docs/reference/using-api/api-concepts/#receiving-resources-as-tables for details. If no columns are specified, a single column displaying the age of the custom resource is used.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion#additionalPrinterColumns
+        '''
+        result = self._value_additional_printer_columns
+        return typing.cast(typing.Optional[typing.List[CustomResourceColumnDefinition]], result)
+
+    @builtins.property
+    def deprecated(self) -> typing.Optional[builtins.bool]:
+        '''deprecated indicates this version of the custom resource API is deprecated.
+
+        When set to true, API requests to this version receive a warning header in the server response. Defaults to false.
+
+        :default: false.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion#deprecated
+        '''
+        result = self._value_deprecated
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def deprecation_warning(self) -> typing.Optional[builtins.str]:
+        '''deprecationWarning overrides the default warning returned to API clients.
+
+        May only be set when ``deprecated`` is true. The default warning indicates this version is deprecated and recommends use of the newest served version of equal or greater stability, if one exists.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion#deprecationWarning
+        '''
+        result = self._value_deprecation_warning
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def schema(self) -> typing.Optional["CustomResourceValidation"]:
+        '''schema describes the schema used for validation, pruning, and defaulting of this version of the custom resource.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion#schema
+        '''
+        result = self._value_schema
+        return typing.cast(typing.Optional["CustomResourceValidation"], result)
+
+    @builtins.property
+    def subresources(self) -> typing.Optional["CustomResourceSubresources"]:
+        '''subresources specify what subresources this version of the defined custom resource have.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceDefinitionVersion#subresources
+        '''
+        result = self._value_subresources
+        return typing.cast(typing.Optional["CustomResourceSubresources"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+            "served": self._value_served,
+            "storage": self._value_storage,
+        }
+        if self._value_additional_printer_columns is not None:
+            values["additional_printer_columns"] = self._value_additional_printer_columns
+        if self._value_deprecated is not None:
+            values["deprecated"] = self._value_deprecated
+        if self._value_deprecation_warning is not None:
+            values["deprecation_warning"] = self._value_deprecation_warning
+        if self._value_schema is not None:
+            values["schema"] = self._value_schema
+        if self._value_subresources is not None:
+            values["subresources"] = self._value_subresources
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CustomResourceDefinitionVersion(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__d6df99d714ea39698bb4328abb2c39a68421fd691d72d93bd6ddbb23b90046bf(
+    *,
+    name: builtins.str,
+    served: builtins.bool,
+    storage: builtins.bool,
+    additional_printer_columns: typing.Optional[typing.Sequence[typing.Union[CustomResourceColumnDefinition, typing.Dict[builtins.str, typing.Any]]]] = None,
+    deprecated: typing.Optional[builtins.bool] = None,
+    deprecation_warning: typing.Optional[builtins.str] = None,
+    schema: typing.Optional[typing.Union[CustomResourceValidation, typing.Dict[builtins.str, typing.Any]]] = None,
+    subresources: typing.Optional[typing.Union[CustomResourceSubresources, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
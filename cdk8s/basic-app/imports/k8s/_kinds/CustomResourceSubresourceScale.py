@@ -0,0 +1,118 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.CustomResourceSubresourceScale",
+    jsii_struct_bases=[],
+    name_mapping={
+        "spec_replicas_path": "specReplicasPath",
+        "status_replicas_path": "statusReplicasPath",
+        "label_selector_path": "labelSelectorPath",
+    },
+)
+class CustomResourceSubresourceScale(_base.Struct):
+    __slots__ = (
+        "_value_spec_replicas_path",
+        "_value_status_replicas_path",
+        "_value_label_selector_path",
+    )
+
+    def __init__(
+        self,
+        *,
+        spec_replicas_path: builtins.str,
+        status_replicas_path: builtins.str,
+        label_selector_path: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''CustomResourceSubresourceScale defines how to serve the scale subresource for CustomResources.
+
+        :param spec_replicas_path: specReplicasPath defines the JSON path inside of a custom resource that corresponds to Scale ``spec.replicas``. Only JSON paths without the array notation are allowed. Must be a JSON Path under ``.spec``. If there is no value under the given path in the custom resource, the ``/scale`` subresource will return an error on GET.
+        :param status_replicas_path: statusReplicasPath defines the JSON path inside of a custom resource that corresponds to Scale ``status.replicas``. Only JSON paths without the array notation are allowed. Must be a JSON Path under ``.status``. If there is no value under the given path in the custom resource, the ``status.replicas`` value in the ``/scale`` subresource will default to 0.
+        :param label_selector_path: labelSelectorPath defines the JSON path inside of a custom resource that corresponds to Scale ``status.selector``. Only JSON paths without the array notation are allowed. Must be a JSON Path under ``.status`` or ``.spec``. Must be set to work with HorizontalPodAutoscaler. The field pointed by this JSON path must be a string field (not a complex selector struct) which contains a serialized label selector in string form. More info: https://kubernetes.io/docs/tasks/access-kubernetes-api/custom-resources/custom-resource-definitions#scale-subresource If there is no value under the given path in the custom resource, the ``status.selector`` value in the ``/scale`` subresource will default to the empty string.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceSubresourceScale
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__e504fd18aae767ddb56fbac096bf70df45780d510027e105b410fa62efa0ce33)
+            check_type(argname="argument spec_replicas_path", value=spec_replicas_path, expected_type=type_hints["spec_replicas_path"])
+            check_type(argname="argument status_replicas_path", value=status_replicas_path, expected_type=type_hints["status_replicas_path"])
+            check_type(argname="argument label_selector_path", value=label_selector_path, expected_type=type_hints["label_selector_path"])
+        self._value_spec_replicas_path = spec_replicas_path
+        self._value_status_replicas_path = status_replicas_path
+        self._value_label_selector_path = label_selector_path
+
+    @builtins.property
+    def spec_replicas_path(self) -> builtins.str:
+        '''specReplicasPath defines the JSON path inside of a custom resource that corresponds to Scale ``spec.replicas``. Only JSON paths without the array notation are allowed. Must be a JSON Path under ``.spec``. If there is no value under the given path in the custom resource, the ``/scale`` subresource will return an error on GET.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceSubresourceScale#specReplicasPath
+        '''
+        result = self._value_spec_replicas_path
+        assert result is not None, "Required property 'spec_replicas_path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def status_replicas_path(self) -> builtins.str:
+        '''statusReplicasPath defines the JSON path inside of a custom resource that corresponds to Scale ``status.replicas``. Only JSON paths without the array notation are allowed. Must be a JSON Path under ``.status``. If there is no value under the given path in the custom resource, the ``status.replicas`` value in the ``/scale`` subresource will default to 0.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceSubresourceScale#statusReplicasPath
+        '''
+        result = self._value_status_replicas_path
+        assert result is not None, "Required property 'status_replicas_path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def label_selector_path(self) -> typing.Optional[builtins.str]:
+        '''labelSelectorPath defines the JSON path inside of a custom resource that corresponds to Scale ``status.selector``. Only JSON paths without the array notation are allowed. Must be a JSON Path under ``.status`` or ``.spec``. Must be set to work with HorizontalPodAutoscaler. The field pointed by this JSON path must be a string field (not a complex selector struct) which contains a serialized label selector in string form. More info: https://kubernetes.io/docs/tasks/access-kubernetes-api/custom-resources/custom-resource-definitions#scale-subresource If there is no value under the given path in the custom resource, the ``status.selector`` value in the ``/scale`` subresource will default to the empty string.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceSubresourceScale#labelSelectorPath
+        '''
+        result = self._value_label_selector_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "spec_replicas_path": self._value_spec_replicas_path,
+            "status_replicas_path": self._value_status_replicas_path,
+        }
+        if self._value_label_selector_path is not None:
+            values["label_selector_path"] = self._value_label_selector_path
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CustomResourceSubresourceScale(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__e504fd18aae767ddb56fbac096bf70df45780d510027e105b410fa62efa0ce33(
+    *,
+    spec_replicas_path: builtins.str,
+    status_replicas_path: builtins.str,
+    label_selector_path: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .CustomResourceSubresourceScale import CustomResourceSubresourceScale
+
+
+@jsii.data_type(
+    jsii_type="k8s.CustomResourceSubresources",
+    jsii_struct_bases=[],
+    name_mapping={"scale": "scale", "status": "status"},
+)
+class CustomResourceSubresources(_base.Struct):
+    __slots__ = (
+        "_value_scale",
+        "_value_status",
+    )
+
+    def __init__(
+        self,
+        *,
+        scale: typing.Optional[typing.Union[CustomResourceSubresourceScale, typing.Dict[builtins.str, typing.Any]]] = None,
+        status: typing.Any = None,
+    ) -> None:
+        '''CustomResourceSubresources defines the status and scale subresources for CustomResources.
+
+        :param scale: scale indicates the custom resource should serve a ``/scale`` subresource that returns an ``autoscaling/v1`` Scale object.
+        :param status: status indicates the custom resource should serve a ``/status`` subresource. When enabled: 1. requests to the custom resource primary endpoint ignore changes to the ``status`` stanza of the object. 2. requests to the custom resource ``/status`` subresource ignore changes to anything other than the ``status`` stanza of the object.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceSubresources
+        '''
+        if isinstance(scale, dict):
+            scale = CustomResourceSubresourceScale(**scale)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c50da5aa5369520674d278d624a5847abf90b5ff122b8050299b5990def114cd)
+            check_type(argname="argument scale", value=scale, expected_type=type_hints["scale"])
+            check_type(argname="argument status", value=status, expected_type=type_hints["status"])
+        self._value_scale = scale
+        self._value_status = status
+
+    @builtins.property
+    def scale(self) -> typing.Optional[CustomResourceSubresourceScale]:
+        '''scale indicates the custom resource should serve a ``/scale`` subresource that returns an ``autoscaling/v1`` Scale object.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceSubresources#scale
+        '''
+        result = self._value_scale
+        return typing.cast(typing.Optional[CustomResourceSubresourceScale], result)
+
+    @builtins.property
+    def status(self) -> typing.Any:
+        '''status indicates the custom resource should serve a ``/status`` subresource.
+
+        When enabled: 1. requests to the custom resource primary endpoint ignore changes to the ``status`` stanza of the object. 2. requests to the custom resource ``/status`` subresource ignore changes to anything other than the ``status`` stanza of the object.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceSubresources#status
+        '''
+        result = self._value_status
+        return typing.cast(typing.Any, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_scale is not None:
+            values["scale"] = self._value_scale
+        if self._value_status is not None:
+            values["status"] = self._value_status
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CustomResourceSubresources(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c50da5aa5369520674d278d624a5847abf90b5ff122b8050299b5990def114cd(
+    *,
+    scale: typing.Optional[typing.Union[CustomResourceSubresourceScale, typing.Dict[builtins.str, typing.Any]]] = None,
+    status: typing.Any = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,82 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .JsonSchemaProps import JsonSchemaProps
+
+
+@jsii.data_type(
+    jsii_type="k8s.CustomResourceValidation",
+    jsii_struct_bases=[],
+    name_mapping={"open_apiv3_schema": "openApiv3Schema"},
+)
+class CustomResourceValidation(_base.Struct):
+    __slots__ = (
+        "_value_open_apiv3_schema",
+    )
+
+    def __init__(
+        self,
+        *,
+        open_apiv3_schema: typing.Optional[typing.Union["JsonSchemaProps", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''CustomResourceValidation is a list of validation methods for CustomResources.
+
+        :param open_apiv3_schema: openAPIV3Schema is the OpenAPI v3 schema to use for validation and pruning.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceValidation
+        '''
+        if isinstance(open_apiv3_schema, dict):
+            open_apiv3_schema = JsonSchemaProps(**open_apiv3_schema)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__043bf7c99906ebf978f378e80401b671bd7d527825d3a4d5d96e0c729fdbf9a8)
+            check_type(argname="argument open_apiv3_schema", value=open_apiv3_schema, expected_type=type_hints["open_apiv3_schema"])
+        self._value_open_apiv3_schema = open_apiv3_schema
+
+    @builtins.property
+    def open_apiv3_schema(self) -> typing.Optional["JsonSchemaProps"]:
+        '''openAPIV3Schema is the OpenAPI v3 schema to use for validation and pruning.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.CustomResourceValidation#openAPIV3Schema
+        '''
+        result = self._value_open_apiv3_schema
+        return typing.cast(typing.Optional["JsonSchemaProps"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_open_apiv3_schema is not None:
+            values["open_apiv3_schema"] = self._value_open_apiv3_schema
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "CustomResourceValidation(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__043bf7c99906ebf978f378e80401b671bd7d527825d3a4d5d96e0c729fdbf9a8(
+    *,
+    open_apiv3_schema: typing.Optional[typing.Union[JsonSchemaProps, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
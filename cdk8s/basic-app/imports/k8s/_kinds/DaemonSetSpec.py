@@ -0,0 +1,175 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .DaemonSetUpdateStrategy import DaemonSetUpdateStrategy
+from .LabelSelector import LabelSelector
+from .PodTemplateSpec import PodTemplateSpec
+
+
+@jsii.data_type(
+    jsii_type="k8s.DaemonSetSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "selector": "selector",
+        "template": "template",
+        "min_ready_seconds": "minReadySeconds",
+        "revision_history_limit": "revisionHistoryLimit",
+        "update_strategy": "updateStrategy",
+    },
+)
+class DaemonSetSpec(_base.Struct):
+    __slots__ = (
+        "_value_selector",
+        "_value_template",
+        "_value_min_ready_seconds",
+        "_value_revision_history_limit",
+        "_value_update_strategy",
+    )
+
+    def __init__(
+        self,
+        *,
+        selector: typing.Union["LabelSelector", typing.Dict[builtins.str, typing.Any]],
+        template: typing.Union["PodTemplateSpec", typing.Dict[builtins.str, typing.Any]],
+        min_ready_seconds: typing.Optional[jsii.Number] = None,
+        revision_history_limit: typing.Optional[jsii.Number] = None,
+        update_strategy: typing.Optional[typing.Union["DaemonSetUpdateStrategy", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''DaemonSetSpec is the specification of a daemon set.
+
+        :param selector: A label query over pods that are managed by the daemon set. Must match in order to be controlled. It must match the pod template's labels. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+        :param template: An object that describes the pod that will be created. The DaemonSet will create exactly one copy of this pod on every node that matches the template's node selector (or on every node if no node selector is specified). More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#pod-template
+        :param min_ready_seconds: The minimum number of seconds for which a newly created DaemonSet pod should be ready without any of its container crashing, for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready). Default: 0 (pod will be considered available as soon as it is ready).
+        :param revision_history_limit: The number of old history to retain to allow rollback. This is a pointer to distinguish between explicit zero and not specified. Defaults to 10. Default: 10.
+        :param update_strategy: An update strategy to replace existing DaemonSet pods with new pods.
+
+        :schema: io.k8s.api.apps.v1.DaemonSetSpec
+        '''
+        if isinstance(selector, dict):
+            selector = LabelSelector(**selector)
+        if isinstance(template, dict):
+            template = PodTemplateSpec(**template)
+        if isinstance(update_strategy, dict):
+            update_strategy = DaemonSetUpdateStrategy(**update_strategy)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__14204ab2e113520a3c936870c510953423acc16ac3f52118402d23dec634f9a1)
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+            check_type(argname="argument template", value=template, expected_type=type_hints["template"])
+            check_type(argname="argument min_ready_seconds", value=min_ready_seconds, expected_type=type_hints["min_ready_seconds"])
+            check_type(argname="argument revision_history_limit", value=revision_history_limit, expected_type=type_hints["revision_history_limit"])
+            check_type(argname="argument update_strategy", value=update_strategy, expected_type=type_hints["update_strategy"])
+        self._value_selector = selector
+        self._value_template = template
+        self._value_min_ready_seconds = min_ready_seconds
+        self._value_revision_history_limit = revision_history_limit
+        self._value_update_strategy = update_strategy
+
+    @builtins.property
+    def selector(self) -> "LabelSelector":
+        '''A label query over pods that are managed by the daemon set.
+
+        Must match in order to be controlled. It must match the pod template's labels. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+
+        :schema: io.k8s.api.apps.v1.DaemonSetSpec#selector
+        '''
+        result = self._value_selector
+        assert result is not None, "Required property 'selector' is missing"
+        return typing.cast("LabelSelector", result)
+
+    @builtins.property
+    def template(self) -> "PodTemplateSpec":
+        '''An object that describes the pod that will be created.
+
+        The DaemonSet will create exactly one copy of this pod on every node that matches the template's node selector (or on every node if no node selector is specified). More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#pod-template
+
+        :schema: io.k8s.api.apps.v1.DaemonSetSpec#template
+        '''
+        result = self._value_template
+        assert result is not None, "Required property 'template' is missing"
+        return typing.cast("PodTemplateSpec", result)
+
+    @builtins.property
+    def min_ready_seconds(self) -> typing.Optional[jsii.Number]:
+        '''The minimum number of seconds for which a newly created DaemonSet pod should be ready without any of its container crashing, for it to be considered available.
+
+        Defaults to 0 (pod will be considered available as soon as it is ready).
+
+        :default: 0 (pod will be considered available as soon as it is ready).
+
+        :schema: io.k8s.api.apps.v1.DaemonSetSpec#minReadySeconds
+        '''
+        result = self._value_min_ready_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def revision_history_limit(self) -> typing.Optional[jsii.Number]:
+        '''The number of old history to retain to allow rollback.
+
+        This is a pointer to distinguish between explicit zero and not specified. Defaults to 10.
+
+        :default: 10.
+
+        :schema: io.k8s.api.apps.v1.DaemonSetSpec#revisionHistoryLimit
+        '''
+        result = self._value_revision_history_limit
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def update_strategy(self) -> typing.Optional["DaemonSetUpdateStrategy"]:
+        '''An update strategy to replace existing DaemonSet pods with new pods.
+
+        :schema: io.k8s.api.apps.v1.DaemonSetSpec#updateStrategy
+        '''
+        result = self._value_update_strategy
+        return typing.cast(typing.Optional["DaemonSetUpdateStrategy"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "selector": self._value_selector,
+            "template": self._value_template,
+        }
+        if self._value_min_ready_seconds is not None:
+            values["min_ready_seconds"] = self._value_min_ready_seconds
+        if self._value_revision_history_limit is not None:
+            values["revision_history_limit"] = self._value_revision_history_limit
+        if self._value_update_strategy is not None:
+            values["update_strategy"] = self._value_update_strategy
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "DaemonSetSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__14204ab2e113520a3c936870c510953423acc16ac3f52118402d23dec634f9a1(
+    *,
+    selector: typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]],
+    template: typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]],
+    min_ready_seconds: typing.Optional[jsii.Number] = None,
+    revision_history_limit: typing.Optional[jsii.Number] = None,
+    update_strategy: typing.Optional[typing.Union[DaemonSetUpdateStrategy, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
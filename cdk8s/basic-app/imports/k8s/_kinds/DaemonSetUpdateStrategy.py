@@ -0,0 +1,105 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .RollingUpdateDaemonSet import RollingUpdateDaemonSet
+
+
+@jsii.data_type(
+    jsii_type="k8s.DaemonSetUpdateStrategy",
+    jsii_struct_bases=[],
+    name_mapping={"rolling_update": "rollingUpdate", "type": "type"},
+)
+class DaemonSetUpdateStrategy(_base.Struct):
+    __slots__ = (
+        "_value_rolling_update",
+        "_value_type",
+    )
+
+    def __init__(
+        self,
+        *,
+        rolling_update: typing.Optional[typing.Union["RollingUpdateDaemonSet", typing.Dict[builtins.str, typing.Any]]] = None,
+        type: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''DaemonSetUpdateStrategy is a struct used to control the update strategy for a DaemonSet.
+
+        :param rolling_update: Rolling update config params. Present only if type = "RollingUpdate".
+        :param type: Type of daemon set update. Can be "RollingUpdate" or "OnDelete". Default is RollingUpdate. Default: RollingUpdate.
+
+        :schema: io.k8s.api.apps.v1.DaemonSetUpdateStrategy
+        '''
+        if isinstance(rolling_update, dict):
+            rolling_update = RollingUpdateDaemonSet(**rolling_update)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__8b11783b3c58aecec2330e072809ea832cb9b06930ebac2636be1238b0ff753f)
+            check_type(argname="argument rolling_update", value=rolling_update, expected_type=type_hints["rolling_update"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+        self._value_rolling_update = rolling_update
+        self._value_type = type
+
+    @builtins.property
+    def rolling_update(self) -> typing.Optional["RollingUpdateDaemonSet"]:
+        '''Rolling update config params.
+
+        Present only if type = "RollingUpdate".
+
+        :schema: io.k8s.api.apps.v1.DaemonSetUpdateStrategy#rollingUpdate
+        '''
+        result = self._value_rolling_update
+        return typing.cast(typing.Optional["RollingUpdateDaemonSet"], result)
+
+    @builtins.property
+    def type(self) -> typing.Optional[builtins.str]:
+        '''Type of daemon set update.
+
+        Can be "RollingUpdate" or "OnDelete". Default is RollingUpdate.
+
+        :default: RollingUpdate.
+
+        :schema: io.k8s.api.apps.v1.DaemonSetUpdateStrategy#type
+        '''
+        result = self._value_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_rolling_update is not None:
+            values["rolling_update"] = self._value_rolling_update
+        if self._value_type is not None:
+            values["type"] = self._value_type
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "DaemonSetUpdateStrategy(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__8b11783b3c58aecec2330e072809ea832cb9b06930ebac2636be1238b0ff753f(
+    *,
+    rolling_update: typing.Optional[typing.Union[RollingUpdateDaemonSet, typing.Dict[builtins.str, typing.Any]]] = None,
+    type: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
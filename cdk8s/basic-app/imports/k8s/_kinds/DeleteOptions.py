@@ -0,0 +1,209 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind import IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind
+from .Preconditions import Preconditions
+
+
+@jsii.data_type(
+    jsii_type="k8s.DeleteOptions",
+    jsii_struct_bases=[],
+    name_mapping={
+        "api_version": "apiVersion",
+        "dry_run": "dryRun",
+        "grace_period_seconds": "gracePeriodSeconds",
+        "kind": "kind",
+        "orphan_dependents": "orphanDependents",
+        "preconditions": "preconditions",
+        "propagation_policy": "propagationPolicy",
+    },
+)
+class DeleteOptions(_base.Struct):
+    __slots__ = (
+        "_value_api_version",
+        "_value_dry_run",
+        "_value_grace_period_seconds",
+        "_value_kind",
+        "_value_orphan_dependents",
+        "_value_preconditions",
+        "_value_propagation_policy",
+    )
+
+    def __init__(
+        self,
+        *,
+        api_version: typing.Optional[builtins.str] = None,
+        dry_run: typing.Optional[typing.Sequence[builtins.str]] = None,
+        grace_period_seconds: typing.Optional[jsii.Number] = None,
+        kind: typing.Optional["IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind"] = None,
+        orphan_dependents: typing.Optional[builtins.bool] = None,
+        preconditions: typing.Optional[typing.Union["Preconditions", typing.Dict[builtins.str, typing.Any]]] = None,
+        propagation_policy: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''DeleteOptions may be provided when deleting an API object.
+
+        :param api_version: APIVersion defines the versioned schema of this representation of an object. Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
+        :param dry_run: When present, indicates that modifications should not be persisted. An invalid or unrecognized dryRun directive will result in an error response and no further processing of the request. Valid values are: - All: all dry run stages will be processed
+        :param grace_period_seconds: The duration in seconds before the object should be deleted. Value must be non-negative integer. The value zero indicates delete immediately. If this value is nil, the default grace period for the specified type will be used. Defaults to a per object value if not specified. zero means delete immediately. Default: a per object value if not specified. zero means delete immediately.
+        :param kind: Kind is a string value representing the REST resource this object represents. Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+        :param orphan_dependents: Deprecated: please use the PropagationPolicy, this field will be deprecated in 1.7. Should the dependent objects be orphaned. If true/false, the "orphan" finalizer will be added to/removed from the object's finalizers list. Either this field or PropagationPolicy may be set, but not both.
+        :param preconditions: Must be fulfilled before a deletion is carried out. If not possible, a 409 Conflict status will be returned.
+        :param propagation_policy: Whether and how garbage collection will be performed. Either this field or OrphanDependents may be set, but not both. The default policy is decided by the existing finalizer set in the metadata.finalizers and the resource-specific default policy. Acceptable values are: 'Orphan' - orphan the dependents; 'Background' - allow the garbage collector to delete the dependents in the background; 'Foreground' - a cascading policy that deletes all dependents in the foreground.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions
+        '''
+        if isinstance(preconditions, dict):
+            preconditions = Preconditions(**preconditions)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__51651210b2f45ea52509def59df38f1a165f6231405843108f8fb43c79e7fd13)
+            check_type(argname="argument api_version", value=api_version, expected_type=type_hints["api_version"])
+            check_type(argname="argument dry_run", value=dry_run, expected_type=type_hints["dry_run"])
+            check_type(argname="argument grace_period_seconds", value=grace_period_seconds, expected_type=type_hints["grace_period_seconds"])
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument orphan_dependents", value=orphan_dependents, expected_type=type_hints["orphan_dependents"])
+            check_type(argname="argument preconditions", value=preconditions, expected_type=type_hints["preconditions"])
+            check_type(argname="argument propagation_policy", value=propagation_policy, expected_type=type_hints["propagation_policy"])
+        self._value_api_version = api_version
+        self._value_dry_run = dry_run
+        self._value_grace_period_seconds = grace_period_seconds
+        self._value_kind = kind
+        self._value_orphan_dependents = orphan_dependents
+        self._value_preconditions = preconditions
+        self._value_propagation_policy = propagation_policy
+
+    @builtins.property
+    def api_version(self) -> typing.Optional[builtins.str]:
+        '''APIVersion defines the versioned schema of this representation of an object.
+
+        Servers should convert recognized schemas to the latest internal value, and may reject unrecognized values. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#resources
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions#apiVersion
+        '''
+        result = self._value_api_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def dry_run(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''When present, indicates that modifications should not be persisted.
+
+        An invalid or unrecognized dryRun directive will result in an error response and no further processing of the request. Valid values are: - All: all dry run stages will be processed
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions#dryRun
+        '''
+        result = self._value_dry_run
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def grace_period_seconds(self) -> typing.Optional[jsii.Number]:
+        '''The duration in seconds before the object should be deleted.
+
+        Value must be non-negative integer. The value zero indicates delete immediately. If this value is nil, the default grace period for the specified type will be used. Defaults to a per object value if not specified. zero means delete immediately.
+
+        :default: a per object value if not specified. zero means delete immediately.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions#gracePeriodSeconds
+        '''
+        result = self._value_grace_period_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def kind(
+        self,
+    ) -> typing.Optional["IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind"]:
+        '''Kind is a string value representing the REST resource this object represents.
+
+        Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions#kind
+        '''
+        result = self._value_kind
+        return typing.cast(typing.Optional["IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind"], result)
+
+    @builtins.property
+    def orphan_dependents(self) -> typing.Optional[builtins.bool]:
+        '''Deprecated: please use the PropagationPolicy, this field will be deprecated in 1.7. Should the dependent objects be orphaned. If true/false, the "orphan" finalizer will be added to/removed from the object's finalizers list. Either this field or PropagationPolicy may be set, but not both.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions#orphanDependents
+        '''
+        result = self._value_orphan_dependents
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def preconditions(self) -> typing.Optional["Preconditions"]:
+        '''Must be fulfilled before a deletion is carried out.
+
+        If not possible, a 409 Conflict status will be returned.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions#preconditions
+        '''
+        result = self._value_preconditions
+        return typing.cast(typing.Optional["Preconditions"], result)
+
+    @builtins.property
+    def propagation_policy(self) -> typing.Optional[builtins.str]:
+        '''Whether and how garbage collection will be performed.
+
+        Either this field or OrphanDependents may be set, but not both. The default policy is decided by the existing finalizer set in the metadata.finalizers and the resource-specific default policy. Acceptable values are: 'Orphan' - orphan the dependents; 'Background' - allow the garbage collector to delete the dependents in the background; 'Foreground' - a cascading policy that deletes all dependents in the foreground.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions#propagationPolicy
+        '''
+        result = self._value_propagation_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_api_version is not None:
+            values["api_version"] = self._value_api_version
+        if self._value_dry_run is not None:
+            values["dry_run"] = self._value_dry_run
+        if self._value_grace_period_seconds is not None:
+            values["grace_period_seconds"] = self._value_grace_period_seconds
+        if self._value_kind is not None:
+            values["kind"] = self._value_kind
+        if self._value_orphan_dependents is not None:
+            values["orphan_dependents"] = self._value_orphan_dependents
+        if self._value_preconditions is not None:
+            values["preconditions"] = self._value_preconditions
+        if self._value_propagation_policy is not None:
+            values["propagation_policy"] = self._value_propagation_policy
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "DeleteOptions(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__51651210b2f45ea52509def59df38f1a165f6231405843108f8fb43c79e7fd13(
+    *,
+    api_version: typing.Optional[builtins.str] = None,
+    dry_run: typing.Optional[typing.Sequence[builtins.str]] = None,
+    grace_period_seconds: typing.Optional[jsii.Number] = None,
+    kind: typing.Optional[IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind] = None,
+    orphan_dependents: typing.Optional[builtins.bool] = None,
+    preconditions: typing.Optional[typing.Union[Preconditions, typing.Dict[builtins.str, typing.Any]]] = None,
+    propagation_policy: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
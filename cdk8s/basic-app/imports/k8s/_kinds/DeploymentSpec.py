@@ -0,0 +1,235 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .DeploymentStrategy import DeploymentStrategy
+from .LabelSelector import LabelSelector
+from .PodTemplateSpec import PodTemplateSpec
+
+
+@jsii.data_type(
+    jsii_type="k8s.DeploymentSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "selector": "selector",
+        "template": "template",
+        "min_ready_seconds": "minReadySeconds",
+        "paused": "paused",
+        "progress_deadline_seconds": "progressDeadlineSeconds",
+        "replicas": "replicas",
+        "revision_history_limit": "revisionHistoryLimit",
+        "strategy": "strategy",
+    },
+)
+class DeploymentSpec(_base.Struct):
+    __slots__ = (
+        "_value_selector",
+        "_value_template",
+        "_value_min_ready_seconds",
+        "_value_paused",
+        "_value_progress_deadline_seconds",
+        "_value_replicas",
+        "_value_revision_history_limit",
+        "_value_strategy",
+    )
+
+    def __init__(
+        self,
+        *,
+        selector: typing.Union["LabelSelector", typing.Dict[builtins.str, typing.Any]],
+        template: typing.Union["PodTemplateSpec", typing.Dict[builtins.str, typing.Any]],
+        min_ready_seconds: typing.Optional[jsii.Number] = None,
+        paused: typing.Optional[builtins.bool] = None,
+        progress_deadline_seconds: typing.Optional[jsii.Number] = None,
+        replicas: typing.Optional[jsii.Number] = None,
+        revision_history_limit: typing.Optional[jsii.Number] = None,
+        strategy: typing.Optional[typing.Union["DeploymentStrategy", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''DeploymentSpec is the specification of the desired behavior of the Deployment.
+
+        :param selector: Label selector for pods. Existing ReplicaSets whose pods are selected by this will be the ones affected by this deployment. It must match the pod template's labels.
+        :param template: Template describes the pods that will be created.
+        :param min_ready_seconds: Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready) Default: 0 (pod will be considered available as soon as it is ready)
+        :param paused: Indicates that the deployment is paused.
+        :param progress_deadline_seconds: The maximum time in seconds for a deployment to make progress before it is considered to be failed. The deployment controller will continue to process failed deployments and a condition with a ProgressDeadlineExceeded reason will be surfaced in the deployment status. Note that progress will not be estimated during the time a deployment is paused. Defaults to 600s. Default: 600s.
+        :param replicas: Number of desired pods. This is a pointer to distinguish between explicit zero and not specified. Defaults to 1. Default: 1.
+        :param revision_history_limit: The number of old ReplicaSets to retain to allow rollback. This is a pointer to distinguish between explicit zero and not specified. Defaults to 10. Default: 10.
+        :param strategy: The deployment strategy to use to replace existing pods with new ones.
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec
+        '''
+        if isinstance(selector, dict):
+            selector = LabelSelector(**selector)
+        if isinstance(template, dict):
+            template = PodTemplateSpec(**template)
+        if isinstance(strategy, dict):
+            strategy = DeploymentStrategy(**strategy)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__88d492f2893c840ec003d2ddba4caf15921d31465e62b8a4667d961a583e3504)
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+            check_type(argname="argument template", value=template, expected_type=type_hints["template"])
+            check_type(argname="argument min_ready_seconds", value=min_ready_seconds, expected_type=type_hints["min_ready_seconds"])
+            check_type(argname="argument paused", value=paused, expected_type=type_hints["paused"])
+            check_type(argname="argument progress_deadline_seconds", value=progress_deadline_seconds, expected_type=type_hints["progress_deadline_seconds"])
+            check_type(argname="argument replicas", value=replicas, expected_type=type_hints["replicas"])
+            check_type(argname="argument revision_history_limit", value=revision_history_limit, expected_type=type_hints["revision_history_limit"])
+            check_type(argname="argument strategy", value=strategy, expected_type=type_hints["strategy"])
+        self._value_selector = selector
+        self._value_template = template
+        self._value_min_ready_seconds = min_ready_seconds
+        self._value_paused = paused
+        self._value_progress_deadline_seconds = progress_deadline_seconds
+        self._value_replicas = replicas
+        self._value_revision_history_limit = revision_history_limit
+        self._value_strategy = strategy
+
+    @builtins.property
+    def selector(self) -> "LabelSelector":
+        '''Label selector for pods.
+
+        Existing ReplicaSets whose pods are selected by this will be the ones affected by this deployment. It must match the pod template's labels.
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec#selector
+        '''
+        result = self._value_selector
+        assert result is not None, "Required property 'selector' is missing"
+        return typing.cast("LabelSelector", result)
+
+    @builtins.property
+    def template(self) -> "PodTemplateSpec":
+        '''Template describes the pods that will be created.
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec#template
+        '''
+        result = self._value_template
+        assert result is not None, "Required property 'template' is missing"
+        return typing.cast("PodTemplateSpec", result)
+
+    @builtins.property
+    def min_ready_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available.
+
+        Defaults to 0 (pod will be considered available as soon as it is ready)
+
+        :default: 0 (pod will be considered available as soon as it is ready)
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec#minReadySeconds
+        '''
+        result = self._value_min_ready_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def paused(self) -> typing.Optional[builtins.bool]:
+        '''Indicates that the deployment is paused.
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec#paused
+        '''
+        result = self._value_paused
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def progress_deadline_seconds(self) -> typing.Optional[jsii.Number]:
+        '''The maximum time in seconds for a deployment to make progress before it is considered to be failed.
+
+        The deployment controller will continue to process failed deployments and a condition with a ProgressDeadlineExceeded reason will be surfaced in the deployment status. Note that progress will not be estimated during the time a deployment is paused. Defaults to 600s.
+
+        :default: 600s.
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec#progressDeadlineSeconds
+        '''
+        result = self._value_progress_deadline_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def replicas(self) -> typing.Optional[jsii.Number]:
+        '''Number of desired pods.
+
+        This is a pointer to distinguish between explicit zero and not specified. Defaults to 1.
+
+        :default: 1.
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec#replicas
+        '''
+        result = self._value_replicas
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def revision_history_limit(self) -> typing.Optional[jsii.Number]:
+        '''The number of old ReplicaSets to retain to allow rollback.
+
+        This is a pointer to distinguish between explicit zero and not specified. Defaults to 10.
+
+        :default: 10.
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec#revisionHistoryLimit
+        '''
+        result = self._value_revision_history_limit
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def strategy(self) -> typing.Optional["DeploymentStrategy"]:
+        '''The deployment strategy to use to replace existing pods with new ones.
+
+        :schema: io.k8s.api.apps.v1.DeploymentSpec#strategy
+        '''
+        result = self._value_strategy
+        return typing.cast(typing.Optional["DeploymentStrategy"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "selector": self._value_selector,
+            "template": self._value_template,
+        }
+        if self._value_min_ready_seconds is not None:
+            values["min_ready_seconds"] = self._value_min_ready_seconds
+        if self._value_paused is not None:
+            values["paused"] = self._value_paused
+        if self._value_progress_deadline_seconds is not None:
+            values["progress_deadline_seconds"] = self._value_progress_deadline_seconds
+        if self._value_replicas is not None:
+            values["replicas"] = self._value_replicas
+        if self._value_revision_history_limit is not None:
+            values["revision_history_limit"] = self._value_revision_history_limit
+        if self._value_strategy is not None:
+            values["strategy"] = self._value_strategy
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "DeploymentSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__88d492f2893c840ec003d2ddba4caf15921d31465e62b8a4667d961a583e3504(
+    *,
+    selector: typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]],
+    template: typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]],
+    min_ready_seconds: typing.Optional[jsii.Number] = None,
+    paused: typing.Optional[builtins.bool] = None,
+    progress_deadline_seconds: typing.Optional[jsii.Number] = None,
+    replicas: typing.Optional[jsii.Number] = None,
+    revision_history_limit: typing.Optional[jsii.Number] = None,
+    strategy: typing.Optional[typing.Union[DeploymentStrategy, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
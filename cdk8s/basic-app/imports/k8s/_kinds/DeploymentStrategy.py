@@ -0,0 +1,105 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .RollingUpdateDeployment import RollingUpdateDeployment
+
+
+@jsii.data_type(
+    jsii_type="k8s.DeploymentStrategy",
+    jsii_struct_bases=[],
+    name_mapping={"rolling_update": "rollingUpdate", "type": "type"},
+)
+class DeploymentStrategy(_base.Struct):
+    __slots__ = (
+        "_value_rolling_update",
+        "_value_type",
+    )
+
+    def __init__(
+        self,
+        *,
+        rolling_update: typing.Optional[typing.Union["RollingUpdateDeployment", typing.Dict[builtins.str, typing.Any]]] = None,
+        type: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''DeploymentStrategy describes how to replace existing pods with new ones.
+
+        :param rolling_update: Rolling update config params. Present only if DeploymentStrategyType = RollingUpdate.
+        :param type: Type of deployment. Can be "Recreate" or "RollingUpdate". Default is RollingUpdate. Default: RollingUpdate.
+
+        :schema: io.k8s.api.apps.v1.DeploymentStrategy
+        '''
+        if isinstance(rolling_update, dict):
+            rolling_update = RollingUpdateDeployment(**rolling_update)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__47c8ed86524662fa654ab55acc09523cd7f42475f5339eab3418ffa208e11b45)
+            check_type(argname="argument rolling_update", value=rolling_update, expected_type=type_hints["rolling_update"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+        self._value_rolling_update = rolling_update
+        self._value_type = type
+
+    @builtins.property
+    def rolling_update(self) -> typing.Optional["RollingUpdateDeployment"]:
+        '''Rolling update config params.
+
+        Present only if DeploymentStrategyType = RollingUpdate.
+
+        :schema: io.k8s.api.apps.v1.DeploymentStrategy#rollingUpdate
+        '''
+        result = self._value_rolling_update
+        return typing.cast(typing.Optional["RollingUpdateDeployment"], result)
+
+    @builtins.property
+    def type(self) -> typing.Optional[builtins.str]:
+        '''Type of deployment.
+
+        Can be "Recreate" or "RollingUpdate". Default is RollingUpdate.
+
+        :default: RollingUpdate.
+
+        :schema: io.k8s.api.apps.v1.DeploymentStrategy#type
+        '''
+        result = self._value_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_rolling_update is not None:
+            values["rolling_update"] = self._value_rolling_update
+        if self._value_type is not None:
+            values["type"] = self._value_type
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "DeploymentStrategy(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__47c8ed86524662fa654ab55acc09523cd7f42475f5339eab3418ffa208e11b45(
+    *,
+    rolling_update: typing.Optional[typing.Union[RollingUpdateDeployment, typing.Dict[builtins.str, typing.Any]]] = None,
+    type: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,82 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .DownwardApiVolumeFile import DownwardApiVolumeFile
+
+
+@jsii.data_type(
+    jsii_type="k8s.DownwardApiProjection",
+    jsii_struct_bases=[],
+    name_mapping={"items": "items"},
+)
+class DownwardApiProjection(_base.Struct):
+    __slots__ = (
+        "_value_items",
+    )
+
+    def __init__(
+        self,
+        *,
+        items: typing.Optional[typing.Sequence[typing.Union["DownwardApiVolumeFile", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''Represents downward API info for projecting into a projected volume.
+
+        Note that this is identical to a downwardAPI volume source without the default mode.
+
+        :param items: Items is a list of DownwardAPIVolume file.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIProjection
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__869e1c36b23a22ea11fcce61bba7f500c0b12d2d573aa9739a152c0099840760)
+            check_type(argname="argument items", value=items, expected_type=type_hints["items"])
+        self._value_items = items
+
+    @builtins.property
+    def items(self) -> typing.Optional[typing.List["DownwardApiVolumeFile"]]:
+        '''Items is a list of DownwardAPIVolume file.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIProjection#items
+        '''
+        result = self._value_items
+        return typing.cast(typing.Optional[typing.List["DownwardApiVolumeFile"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_items is not None:
+            values["items"] = self._value_items
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "DownwardApiProjection(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__869e1c36b23a22ea11fcce61bba7f500c0b12d2d573aa9739a152c0099840760(
+    *,
+    items: typing.Optional[typing.Sequence[typing.Union[DownwardApiVolumeFile, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
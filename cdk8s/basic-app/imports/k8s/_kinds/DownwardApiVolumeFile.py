@@ -0,0 +1,146 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectFieldSelector import ObjectFieldSelector
+from .ResourceFieldSelector import ResourceFieldSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.DownwardApiVolumeFile",
+    jsii_struct_bases=[],
+    name_mapping={
+        "path": "path",
+        "field_ref": "fieldRef",
+        "mode": "mode",
+        "resource_field_ref": "resourceFieldRef",
+    },
+)
+class DownwardApiVolumeFile(_base.Struct):
+    __slots__ = (
+        "_value_path",
+        "_value_field_ref",
+        "_value_mode",
+        "_value_resource_field_ref",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: builtins.str,
+        field_ref: typing.Optional[typing.Union["ObjectFieldSelector", typing.Dict[builtins.str, typing.Any]]] = None,
+        mode: typing.Optional[jsii.Number] = None,
+        resource_field_ref: typing.Optional[typing.Union["ResourceFieldSelector", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''DownwardAPIVolumeFile represents information to create the file containing the pod field.
+
+        :param path: Required: Path is the relative path name of the file to be created. Must not be absolute or contain the '..' path. Must be utf-8 encoded. The first item of the relative path must not start with '..'
+        :param field_ref: Required: Selects a field of the pod: only annotations, labels, name and namespace are supported.
+        :param mode: Optional: mode bits used to set permissions on this file, must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. If not specified, the volume defaultMode will be used. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+        :param resource_field_ref: Selects a resource of the container: only resources limits and requests (limits.cpu, limits.memory, requests.cpu and requests.memory) are currently supported.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIVolumeFile
+        '''
+        if isinstance(field_ref, dict):
+            field_ref = ObjectFieldSelector(**field_ref)
+        if isinstance(resource_field_ref, dict):
+            resource_field_ref = ResourceFieldSelector(**resource_field_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__101db0695abfdddd40bd62385a630a47df841ee1a6f24407608f8fe8b6ff069d)
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument field_ref", value=field_ref, expected_type=type_hints["field_ref"])
+            check_type(argname="argument mode", value=mode, expected_type=type_hints["mode"])
+            check_type(argname="argument resource_field_ref", value=resource_field_ref, expected_type=type_hints["resource_field_ref"])
+        self._value_path = path
+        self._value_field_ref = field_ref
+        self._value_mode = mode
+        self._value_resource_field_ref = resource_field_ref
+
+    @builtins.property
+    def path(self) -> builtins.str:
+        '''Required: Path is  the relative path name of the file to be created.
+
+        Must not be absolute or contain the '..' path. Must be utf-8 encoded. The first item of the relative path must not start with '..'
+
+        :schema: io.k8s.api.core.v1.DownwardAPIVolumeFile#path
+        '''
+        result = self._value_path
+        assert result is not None, "Required property 'path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def field_ref(self) -> typing.Optional["ObjectFieldSelector"]:
+        '''Required: Selects a field of the pod: only annotations, labels, name and namespace are supported.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIVolumeFile#fieldRef
+        '''
+        result = self._value_field_ref
+        return typing.cast(typing.Optional["ObjectFieldSelector"], result)
+
+    @builtins.property
+    def mode(self) -> typing.Optional[jsii.Number]:
+        '''Optional: mode bits used to set permissions on this file, must be an octal value between 0000 and 0777 or a decimal value between 0 and 511.
+
+        YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. If not specified, the volume defaultMode will be used. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIVolumeFile#mode
+        '''
+        result = self._value_mode
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def resource_field_ref(self) -> typing.Optional["ResourceFieldSelector"]:
+        '''Selects a resource of the container: only resources limits and requests (limits.cpu, limits.memory, requests.cpu and requests.memory) are currently supported.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIVolumeFile#resourceFieldRef
+        '''
+        result = self._value_resource_field_ref
+        return typing.cast(typing.Optional["ResourceFieldSelector"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "path": self._value_path,
+        }
+        if self._value_field_ref is not None:
+            values["field_ref"] = self._value_field_ref
+        if self._value_mode is not None:
+            values["mode"] = self._value_mode
+        if self._value_resource_field_ref is not None:
+            values["resource_field_ref"] = self._value_resource_field_ref
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "DownwardApiVolumeFile(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__101db0695abfdddd40bd62385a630a47df841ee1a6f24407608f8fe8b6ff069d(
+    *,
+    path: builtins.str,
+    field_ref: typing.Optional[typing.Union[ObjectFieldSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    mode: typing.Optional[jsii.Number] = None,
+    resource_field_ref: typing.Optional[typing.Union[ResourceFieldSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .DownwardApiVolumeFile import DownwardApiVolumeFile
+
+
+@jsii.data_type(
+    jsii_type="k8s.DownwardApiVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"default_mode": "defaultMode", "items": "items"},
+)
+class DownwardApiVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_default_mode",
+        "_value_items",
+    )
+
+    def __init__(
+        self,
+        *,
+        default_mode: typing.Optional[jsii.Number] = None,
+        items: typing.Optional[typing.Sequence[typing.Union[DownwardApiVolumeFile, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''DownwardAPIVolumeSource represents a volume containing downward API info.
+
+        Downward API volumes support ownership management and SELinux relabeling.
+
+        :param default_mode: Optional: mode bits to use on created files by default. Must be a Optional: mode bits used to set permissions on created files by default. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Defaults to 0644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set. Default: 644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+        :param items: Items is a list of downward API volume file.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__d43c40d536e8ef2ac9d664987c3d40ea8d2b2a7183453e3267caf21a4f0e109a)
+            check_type(argname="argument default_mode", value=default_mode, expected_type=type_hints["default_mode"])
+            check_type(argname="argument items", value=items, expected_type=type_hints["items"])
+        self._value_default_mode = default_mode
+        self._value_items = items
+
+    @builtins.property
+    def default_mode(self) -> typing.Optional[jsii.Number]:
+        '''Optional: mode bits to use on created files by default.
+
+        Must be a Optional: mode bits used to set permissions on created files by default. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Defaults to 0644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+
+        :default: 644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIVolumeSource#defaultMode
+        '''
+        result = self._value_default_mode
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def items(self) -> typing.Optional[typing.List[DownwardApiVolumeFile]]:
+        '''Items is a list of downward API volume file.
+
+        :schema: io.k8s.api.core.v1.DownwardAPIVolumeSource#items
+        '''
+        result = self._value_items
+        return typing.cast(typing.Optional[typing.List[DownwardApiVolumeFile]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_default_mode is not None:
+            values["default_mode"] = self._value_default_mode
+        if self._value_items is not None:
+            values["items"] = self._value_items
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "DownwardApiVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__d43c40d536e8ef2ac9d664987c3d40ea8d2b2a7183453e3267caf21a4f0e109a(
+    *,
+    default_mode: typing.Optional[jsii.Number] = None,
+    items: typing.Optional[typing.Sequence[typing.Union[DownwardApiVolumeFile, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Quantity import Quantity
+
+
+@jsii.data_type(
+    jsii_type="k8s.EmptyDirVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"medium": "medium", "size_limit": "sizeLimit"},
+)
+class EmptyDirVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_medium",
+        "_value_size_limit",
+    )
+
+    def __init__(
+        self,
+        *,
+        medium: typing.Optional[builtins.str] = None,
+        size_limit: typing.Optional["Quantity"] = None,
+    ) -> None:
+        '''Represents an empty directory for a pod.
+
+        Empty directory volumes support ownership management and SELinux relabeling.
+
+        :param medium: medium represents what type of storage medium should back this directory. The default is "" which means to use the node's default medium. Must be an empty string (default) or Memory. More info: https://kubernetes.io/docs/concepts/storage/volumes#emptydir
+        :param size_limit: sizeLimit is the total amount of local storage required for this EmptyDir volume. The size limit is also applicable for memory medium. The maximum usage on memory medium EmptyDir would be the minimum value between the SizeLimit specified here and the sum of memory limits of all containers in a pod. The default is nil which means that the limit is undefined. More info: http://kubernetes.io/docs/user-guide/volumes#emptydir
+
+        :schema: io.k8s.api.core.v1.EmptyDirVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__51336821e156a17acb25064d05a943dee51ed6d9fede28f0496b90a126cbde50)
+            check_type(argname="argument medium", value=medium, expected_type=type_hints["medium"])
+            check_type(argname="argument size_limit", value=size_limit, expected_type=type_hints["size_limit"])
+        self._value_medium = medium
+        self._value_size_limit = size_limit
+
+    @builtins.property
+    def medium(self) -> typing.Optional[builtins.str]:
+        '''medium represents what type of storage medium should back this directory.
+
+        The default is "" which means to use the node's default medium. Must be an empty string (default) or Memory. More info: https://kubernetes.io/docs/concepts/storage/volumes#emptydir
+
+        :schema: io.k8s.api.core.v1.EmptyDirVolumeSource#medium
+        '''
+        result = self._value_medium
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def size_limit(self) -> typing.Optional["Quantity"]:
+        '''sizeLimit is the total amount of local storage required for this EmptyDir volume.
+
+        The size limit is also applicable for memory medium. The maximum usage on memory medium EmptyDir would be the minimum value between the SizeLimit specified here and the sum of memory limits of all containers in a pod. The default is nil which means that the limit is undefined. More info: http://kubernetes.io/docs/user-guide/volumes#emptydir
+
+        :schema: io.k8s.api.core.v1.EmptyDirVolumeSource#sizeLimit
+        '''
+        result = self._value_size_limit
+        return typing.cast(typing.Optional["Quantity"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_medium is not None:
+            values["medium"] = self._value_medium
+        if self._value_size_limit is not None:
+            values["size_limit"] = self._value_size_limit
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EmptyDirVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__51336821e156a17acb25064d05a943dee51ed6d9fede28f0496b90a126cbde50(
+    *,
+    medium: typing.Optional[builtins.str] = None,
+    size_limit: typing.Optional[Quantity] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
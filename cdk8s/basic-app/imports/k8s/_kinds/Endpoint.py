@@ -0,0 +1,227 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .EndpointConditions import EndpointConditions
+from .EndpointHints import EndpointHints
+from .ObjectReference import ObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.Endpoint",
+    jsii_struct_bases=[],
+    name_mapping={
+        "addresses": "addresses",
+        "conditions": "conditions",
+        "deprecated_topology": "deprecatedTopology",
+        "hints": "hints",
+        "hostname": "hostname",
+        "node_name": "nodeName",
+        "target_ref": "targetRef",
+        "zone": "zone",
+    },
+)
+class Endpoint(_base.Struct):
+    __slots__ = (
+        "_value_addresses",
+        "_value_conditions",
+        "_value_deprecated_topology",
+        "_value_hints",
+        "_value_hostname",
+        "_value_node_name",
+        "_value_target_ref",
+        "_value_zone",
+    )
+
+    def __init__(
+        self,
+        *,
+        addresses: typing.Sequence[builtins.str],
+        conditions: typing.Optional[typing.Union["EndpointConditions", typing.Dict[builtins.str, typing.Any]]] = None,
+        deprecated_topology: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        hints: typing.Optional[typing.Union["EndpointHints", typing.Dict[builtins.str, typing.Any]]] = None,
+        hostname: typing.Optional[builtins.str] = None,
+        node_name: typing.Optional[builtins.str] = None,
+        target_ref: typing.Optional[typing.Union["ObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        zone: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Endpoint represents a single logical "backend" implementing a service.
+
+        :param addresses: addresses of this endpoint. The contents of this field are interpreted according to the corresponding EndpointSlice addressType field. Consumers must handle different types of addresses in the context of their own capabilities. This must contain at least one address but no more than 100. These are all assumed to be fungible and clients may choose to only use the first element. Refer to: https://issue.k8s.io/106267
+        :param conditions: conditions contains information about the current status of the endpoint.
+        :param deprecated_topology: deprecatedTopology contains topology information part of the v1beta1 API. This field is deprecated, and will be removed when the v1beta1 API is removed (no sooner than kubernetes v1.24). While this field can hold values, it is not writable through the v1 API, and any attempts to write to it will be silently ignored. Topology information can be found in the zone and nodeName fields instead.
+        :param hints: hints contains information associated with how an endpoint should be consumed.
+        :param hostname: hostname of this endpoint. This field may be used by consumers of endpoints to distinguish endpoints from each other (e.g. in DNS names). Multiple endpoints which use the same hostname should be considered fungible (e.g. multiple A values in DNS). Must be lowercase and pass DNS Label (RFC 1123) validation.
+        :param node_name: nodeName represents the name of the Node hosting this endpoint. This can be used to determine endpoints local to a Node.
+        :param target_ref: targetRef is a reference to a Kubernetes object that represents this endpoint.
+        :param zone: zone is the name of the Zone this endpoint exists in.
+
+        :schema: io.k8s.api.discovery.v1.Endpoint
+        '''
+        if isinstance(conditions, dict):
+            conditions = EndpointConditions(**conditions)
+        if isinstance(hints, dict):
+            hints = EndpointHints(**hints)
+        if isinstance(target_ref, dict):
+            target_ref = ObjectReference(**target_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__aecf0f91e9c72760558c73c60babfa2b9ec1400a6ace4c1cad4cdb2ce4cf4276)
+            check_type(argname="argument addresses", value=addresses, expected_type=type_hints["addresses"])
+            check_type(argname="argument conditions", value=conditions, expected_type=type_hints["conditions"])
+            check_type(argname="argument deprecated_topology", value=deprecated_topology, expected_type=type_hints["deprecated_topology"])
+            check_type(argname="argument hints", value=hints, expected_type=type_hints["hints"])
+            check_type(argname="argument hostname", value=hostname, expected_type=type_hints["hostname"])
+            check_type(argname="argument node_name", value=node_name, expected_type=type_hints["node_name"])
+            check_type(argname="argument target_ref", value=target_ref, expected_type=type_hints["target_ref"])
+            check_type(argname="argument zone", value=zone, expected_type=type_hints["zone"])
+        self._value_addresses = addresses
+        self._value_conditions = conditions
+        self._value_deprecated_topology = deprecated_topology
+        self._value_hints = hints
+        self._value_hostname = hostname
+        self._value_node_name = node_name
+        self._value_target_ref = target_ref
+        self._value_zone = zone
+
+    @builtins.property
+    def addresses(self) -> typing.List[builtins.str]:
+        '''addresses of this endpoint.
+
+        The contents of this field are interpreted according to the corresponding EndpointSlice addressType field. Consumers must handle different types of addresses in the context of their own capabilities. This must contain at least one address but no more than 100. These are all assumed to be fungible and clients may choose to only use the first element. Refer to: https://issue.k8s.io/106267
+
+        :schema: io.k8s.api.discovery.v1.Endpoint#addresses
+        '''
+        result = self._value_addresses
+        assert result is not None, "Required property 'addresses' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def conditions(self) -> typing.Optional["EndpointConditions"]:
+        '''conditions contains information about the current status of the endpoint.
+
+        :schema: io.k8s.api.discovery.v1.Endpoint#conditions
+        '''
+        result = self._value_conditions
+        return typing.cast(typing.Optional["EndpointConditions"], result)
+
+    @builtins.property
+    def deprecated_topology(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''deprecatedTopology contains topology information part of the v1beta1 API.
+
+        This field is deprecated, and will be removed when the v1beta1 API is removed (no sooner than kubernetes v1.24).  While this field can hold values, it is not writable through the v1 API, and any attempts to write to it will be silently ignored. Topology information can be found in the zone and nodeName fields instead.
+
+        :schema: io.k8s.api.discovery.v1.Endpoint#deprecatedTopology
+        '''
+        result = self._value_deprecated_topology
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def hints(self) -> typing.Optional["EndpointHints"]:
+        '''hints contains information associated with how an endpoint should be consumed.
+
+        :schema: io.k8s.api.discovery.v1.Endpoint#hints
+        '''
+        result = self._value_hints
+        return typing.cast(typing.Optional["EndpointHints"], result)
+
+    @builtins.property
+    def hostname(self) -> typing.Optional[builtins.str]:
+        '''hostname of this endpoint.
+
+        This field may be used by consumers of endpoints to distinguish endpoints from each other (e.g. in DNS names). Multiple endpoints which use the same hostname should be considered fungible (e.g. multiple A values in DNS). Must be lowercase and pass DNS Label (RFC 1123) validation.
+
+        :schema: io.k8s.api.discovery.v1.Endpoint#hostname
+        '''
+        result = self._value_hostname
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def node_name(self) -> typing.Optional[builtins.str]:
+        '''nodeName represents the name of the Node hosting this endpoint.
+
+        This can be used to determine endpoints local to a Node.
+
+        :schema: io.k8s.api.discovery.v1.Endpoint#nodeName
+        '''
+        result = self._value_node_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def target_ref(self) -> typing.Optional["ObjectReference"]:
+        '''targetRef is a reference to a Kubernetes object that represents this endpoint.
+
+        :schema: io.k8s.api.discovery.v1.Endpoint#targetRef
+        '''
+        result = self._value_target_ref
+        return typing.cast(typing.Optional["ObjectReference"], result)
+
+    @builtins.property
+    def zone(self) -> typing.Optional[builtins.str]:
+        '''zone is the name of the Zone this endpoint exists in.
+
+        :schema: io.k8s.api.discovery.v1.Endpoint#zone
+        '''
+        result = self._value_zone
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "addresses": self._value_addresses,
+        }
+        if self._value_conditions is not None:
+            values["conditions"] = self._value_conditions
+        if self._value_deprecated_topology is not None:
+            values["deprecated_topology"] = self._value_deprecated_topology
+        if self._value_hints is not None:
+            values["hints"] = self._value_hints
+        if self._value_hostname is not None:
+            values["hostname"] = self._value_hostname
+        if self._value_node_name is not None:
+            values["node_name"] = self._value_node_name
+        if self._value_target_ref is not None:
+            values["target_ref"] = self._value_target_ref
+        if self._value_zone is not None:
+            values["zone"] = self._value_zone
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Endpoint(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__aecf0f91e9c72760558c73c60babfa2b9ec1400a6ace4c1cad4cdb2ce4cf4276(
+    *,
+    addresses: typing.Sequence[builtins.str],
+    conditions: typing.Optional[typing.Union[EndpointConditions, typing.Dict[builtins.str, typing.Any]]] = None,
+    deprecated_topology: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    hints: typing.Optional[typing.Union[EndpointHints, typing.Dict[builtins.str, typing.Any]]] = None,
+    hostname: typing.Optional[builtins.str] = None,
+    node_name: typing.Optional[builtins.str] = None,
+    target_ref: typing.Optional[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    zone: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
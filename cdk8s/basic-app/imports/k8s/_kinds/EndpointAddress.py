@@ -0,0 +1,143 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectReference import ObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.EndpointAddress",
+    jsii_struct_bases=[],
+    name_mapping={
+        "ip": "ip",
+        "hostname": "hostname",
+        "node_name": "nodeName",
+        "target_ref": "targetRef",
+    },
+)
+class EndpointAddress(_base.Struct):
+    __slots__ = (
+        "_value_ip",
+        "_value_hostname",
+        "_value_node_name",
+        "_value_target_ref",
+    )
+
+    def __init__(
+        self,
+        *,
+        ip: builtins.str,
+        hostname: typing.Optional[builtins.str] = None,
+        node_name: typing.Optional[builtins.str] = None,
+        target_ref: typing.Optional[typing.Union["ObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''EndpointAddress is a tuple that describes single IP address.
+
+        :param ip: The IP of this endpoint. May not be loopback (127.0.0.0/8), link-local (169.254.0.0/16), or link-local multicast ((224.0.0.0/24). IPv6 is also accepted but not fully supported on all platforms. Also, certain kubernetes components, like kube-proxy, are not IPv6 ready.
+        :param hostname: The Hostname of this endpoint.
+        :param node_name: Optional: Node hosting this endpoint. This can be used to determine endpoints local to a node.
+        :param target_ref: Reference to object providing the endpoint.
+
+        :schema: io.k8s.api.core.v1.EndpointAddress
+        '''
+        if isinstance(target_ref, dict):
+            target_ref = ObjectReference(**target_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__970f09567748e206afbb46c0fa29177fb5967712f3943c875ccea8dfd5d1b3ce)
+            check_type(argname="argument ip", value=ip, expected_type=type_hints["ip"])
+            check_type(argname="argument hostname", value=hostname, expected_type=type_hints["hostname"])
+            check_type(argname="argument node_name", value=node_name, expected_type=type_hints["node_name"])
+            check_type(argname="argument target_ref", value=target_ref, expected_type=type_hints["target_ref"])
+        self._value_ip = ip
+        self._value_hostname = hostname
+        self._value_node_name = node_name
+        self._value_target_ref = target_ref
+
+    @builtins.property
+    def ip(self) -> builtins.str:
+        '''The IP of this endpoint.
+
+        May not be loopback (127.0.0.0/8), link-local (169.254.0.0/16), or link-local multicast ((224.0.0.0/24). IPv6 is also accepted but not fully supported on all platforms. Also, certain kubernetes components, like kube-proxy, are not IPv6 ready.
+
+        :schema: io.k8s.api.core.v1.EndpointAddress#ip
+        '''
+        result = self._value_ip
+        assert result is not None, "Required property 'ip' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def hostname(self) -> typing.Optional[builtins.str]:
+        '''The Hostname of this endpoint.
+
+        :schema: io.k8s.api.core.v1.EndpointAddress#hostname
+        '''
+        result = self._value_hostname
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def node_name(self) -> typing.Optional[builtins.str]:
+        '''Optional: Node hosting this endpoint.
+
+        This can be used to determine endpoints local to a node.
+
+        :schema: io.k8s.api.core.v1.EndpointAddress#nodeName
+        '''
+        result = self._value_node_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def target_ref(self) -> typing.Optional["ObjectReference"]:
+        '''Reference to object providing the endpoint.
+
+        :schema: io.k8s.api.core.v1.EndpointAddress#targetRef
+        '''
+        result = self._value_target_ref
+        return typing.cast(typing.Optional["ObjectReference"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "ip": self._value_ip,
+        }
+        if self._value_hostname is not None:
+            values["hostname"] = self._value_hostname
+        if self._value_node_name is not None:
+            values["node_name"] = self._value_node_name
+        if self._value_target_ref is not None:
+            values["target_ref"] = self._value_target_ref
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EndpointAddress(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__970f09567748e206afbb46c0fa29177fb5967712f3943c875ccea8dfd5d1b3ce(
+    *,
+    ip: builtins.str,
+    hostname: typing.Optional[builtins.str] = None,
+    node_name: typing.Optional[builtins.str] = None,
+    target_ref: typing.Optional[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
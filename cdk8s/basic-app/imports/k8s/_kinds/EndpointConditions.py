@@ -0,0 +1,123 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.EndpointConditions",
+    jsii_struct_bases=[],
+    name_mapping={
+        "ready": "ready",
+        "serving": "serving",
+        "terminating": "terminating",
+    },
+)
+class EndpointConditions(_base.Struct):
+    __slots__ = (
+        "_value_ready",
+        "_value_serving",
+        "_value_terminating",
+    )
+
+    def __init__(
+        self,
+        *,
+        ready: typing.Optional[builtins.bool] = None,
+        serving: typing.Optional[builtins.bool] = None,
+        terminating: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''EndpointConditions represents the current condition of an endpoint.
+
+        :param ready: ready indicates that this endpoint is prepared to receive traffic, according to whatever system is managing the endpoint. A nil value indicates an unknown state. In most cases consumers should interpret this unknown state as ready. For compatibility reasons, ready should never be "true" for terminating endpoints.
+        :param serving: serving is identical to ready except that it is set regardless of the terminating state of endpoints. This condition should be set to true for a ready endpoint that is terminating. If nil, consumers should defer to the ready condition. This field can be enabled with the EndpointSliceTerminatingCondition feature gate.
+        :param terminating: terminating indicates that this endpoint is terminating. A nil value indicates an unknown state. Consumers should interpret this unknown state to mean that the endpoint is not terminating. This field can be enabled with the EndpointSliceTerminatingCondition feature gate.
+
+        :schema: io.k8s.api.discovery.v1.EndpointConditions
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b2b5238272f9d14831397973a28343d30df4184341889339940e2808d1357461)
+            check_type(argname="argument ready", value=ready, expected_type=type_hints["ready"])
+            check_type(argname="argument serving", value=serving, expected_type=type_hints["serving"])
+            check_type(argname="argument terminating", value=terminating, expected_type=type_hints["terminating"])
+        self._value_ready = ready
+        self._value_serving = serving
+        self._value_terminating = terminating
+
+    @builtins.property
+    def ready(self) -> typing.Optional[builtins.bool]:
+        '''ready indicates that this endpoint is prepared to receive traffic, according to whatever system is managing the endpoint.
+
+        A nil value indicates an unknown state. In most cases consumers should interpret this unknown state as ready. For compatibility reasons, ready should never be "true" for terminating endpoints.
+
+        :schema: io.k8s.api.discovery.v1.EndpointConditions#ready
+        '''
+        result = self._value_ready
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def serving(self) -> typing.Optional[builtins.bool]:
+        '''serving is identical to ready except that it is set regardless of the terminating state of endpoints.
+
+        This condition should be set to true for a ready endpoint that is terminating. If nil, consumers should defer to the ready condition. This field can be enabled with the EndpointSliceTerminatingCondition feature gate.
+
+        :schema: io.k8s.api.discovery.v1.EndpointConditions#serving
+        '''
+        result = self._value_serving
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def terminating(self) -> typing.Optional[builtins.bool]:
+        '''terminating indicates that this endpoint is terminating.
+
+        A nil value indicates an unknown state. Consumers should interpret this unknown state to mean that the endpoint is not terminating. This field can be enabled with the EndpointSliceTerminatingCondition feature gate.
+
+        :schema: io.k8s.api.discovery.v1.EndpointConditions#terminating
+        '''
+        result = self._value_terminating
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_ready is not None:
+            values["ready"] = self._value_ready
+        if self._value_serving is not None:
+            values["serving"] = self._value_serving
+        if self._value_terminating is not None:
+            values["terminating"] = self._value_terminating
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EndpointConditions(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b2b5238272f9d14831397973a28343d30df4184341889339940e2808d1357461(
+    *,
+    ready: typing.Optional[builtins.bool] = None,
+    serving: typing.Optional[builtins.bool] = None,
+    terminating: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,80 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ForZone import ForZone
+
+
+@jsii.data_type(
+    jsii_type="k8s.EndpointHints",
+    jsii_struct_bases=[],
+    name_mapping={"for_zones": "forZones"},
+)
+class EndpointHints(_base.Struct):
+    __slots__ = (
+        "_value_for_zones",
+    )
+
+    def __init__(
+        self,
+        *,
+        for_zones: typing.Optional[typing.Sequence[typing.Union["ForZone", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''EndpointHints provides hints describing how an endpoint should be consumed.
+
+        :param for_zones: forZones indicates the zone(s) this endpoint should be consumed by to enable topology aware routing.
+
+        :schema: io.k8s.api.discovery.v1.EndpointHints
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__72b3d0ad7203c24d6795afe4a3e837823411fa92c071099c508160c704770992)
+            check_type(argname="argument for_zones", value=for_zones, expected_type=type_hints["for_zones"])
+        self._value_for_zones = for_zones
+
+    @builtins.property
+    def for_zones(self) -> typing.Optional[typing.List["ForZone"]]:
+        '''forZones indicates the zone(s) this endpoint should be consumed by to enable topology aware routing.
+
+        :schema: io.k8s.api.discovery.v1.EndpointHints#forZones
+        '''
+        result = self._value_for_zones
+        return typing.cast(typing.Optional[typing.List["ForZone"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_for_zones is not None:
+            values["for_zones"] = self._value_for_zones
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EndpointHints(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__72b3d0ad7203c24d6795afe4a3e837823411fa92c071099c508160c704770992(
+    *,
+    for_zones: typing.Optional[typing.Sequence[typing.Union[ForZone, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,144 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.EndpointPort",
+    jsii_struct_bases=[],
+    name_mapping={
+        "port": "port",
+        "app_protocol": "appProtocol",
+        "name": "name",
+        "protocol": "protocol",
+    },
+)
+class EndpointPort(_base.Struct):
+    __slots__ = (
+        "_value_port",
+        "_value_app_protocol",
+        "_value_name",
+        "_value_protocol",
+    )
+
+    def __init__(
+        self,
+        *,
+        port: jsii.Number,
+        app_protocol: typing.Optional[builtins.str] = None,
+        name: typing.Optional[builtins.str] = None,
+        protocol: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''EndpointPort is a tuple that describes a single port.
+
+        :param port: The port number of the endpoint.
+        :param app_protocol: The application protocol for this port. This field follows standard Kubernetes label syntax. Un-prefixed names are reserved for IANA standard service names (as per RFC-6335 and https://www.iana.org/assignments/service-names). Non-standard protocols should use prefixed names such as mycompany.com/my-custom-protocol.
+        :param name: The name of this port. This must match the 'name' field in the corresponding ServicePort. Must be a DNS_LABEL. Optional only if one port is defined.
+        :param protocol: The IP protocol for this port. Must be UDP, TCP, or SCTP. Default is TCP. Default: TCP.
+
+        :schema: io.k8s.api.core.v1.EndpointPort
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__198ff7c8fddac2085d2564d42a0d2f8327272caf700986100e27c5038c106c79)
+            check_type(argname="argument port", value=port, expected_type=type_hints["port"])
+            check_type(argname="argument app_protocol", value=app_protocol, expected_type=type_hints["app_protocol"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument protocol", value=protocol, expected_type=type_hints["protocol"])
+        self._value_port = port
+        self._value_app_protocol = app_protocol
+        self._value_name = name
+        self._value_protocol = protocol
+
+    @builtins.property
+    def port(self) -> jsii.Number:
+        '''The port number of the endpoint.
+
+        :schema: io.k8s.api.core.v1.EndpointPort#port
+        '''
+        result = self._value_port
+        assert result is not None, "Required property 'port' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def app_protocol(self) -> typing.Optional[builtins.str]:
+        '''The application protocol for this port.
+
+        This field follows standard Kubernetes label syntax. Un-prefixed names are reserved for IANA standard service names (as per RFC-6335 and https://www.iana.org/assignments/service-names). Non-standard protocols should use prefixed names such as mycompany.com/my-custom-protocol.
+
+        :schema: io.k8s.api.core.v1.EndpointPort#appProtocol
+        '''
+        result = self._value_app_protocol
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''The name of this port.
+
+        This must match the 'name' field in the corresponding ServicePort. Must be a DNS_LABEL. Optional only if one port is defined.
+
+        :schema: io.k8s.api.core.v1.EndpointPort#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def protocol(self) -> typing.Optional[builtins.str]:
+        '''The IP protocol for this port.
+
+        Must be UDP, TCP, or SCTP. Default is TCP.
+
+        :default: TCP.
+
+        :schema: io.k8s.api.core.v1.EndpointPort#protocol
+        '''
+        result = self._value_protocol
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "port": self._value_port,
+        }
+        if self._value_app_protocol is not None:
+            values["app_protocol"] = self._value_app_protocol
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_protocol is not None:
+            values["protocol"] = self._value_protocol
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EndpointPort(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__198ff7c8fddac2085d2564d42a0d2f8327272caf700986100e27c5038c106c79(
+    *,
+    port: jsii.Number,
+    app_protocol: typing.Optional[builtins.str] = None,
+    name: typing.Optional[builtins.str] = None,
+    protocol: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
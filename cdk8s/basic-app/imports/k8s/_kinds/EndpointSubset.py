@@ -0,0 +1,133 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .EndpointAddress import EndpointAddress
+from .EndpointPort import EndpointPort
+
+
+@jsii.data_type(
+    jsii_type="k8s.EndpointSubset",
+    jsii_struct_bases=[],
+    name_mapping={
+        "addresses": "addresses",
+        "not_ready_addresses": "notReadyAddresses",
+        "ports": "ports",
+    },
+)
+class EndpointSubset(_base.Struct):
+    __slots__ = (
+        "_value_addresses",
+        "_value_not_ready_addresses",
+        "_value_ports",
+    )
+
+    def __init__(
+        self,
+        *,
+        addresses: typing.Optional[typing.Sequence[typing.Union[EndpointAddress, typing.Dict[builtins.str, typing.Any]]]] = None,
+        not_ready_addresses: typing.Optional[typing.Sequence[typing.Union[EndpointAddress, typing.Dict[builtins.str, typing.Any]]]] = None,
+        ports: typing.Optional[typing.Sequence[typing.Union[EndpointPort, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''EndpointSubset is a group of addresses with a common set of ports.
+
+        The expanded set of endpoints is the Cartesian product of Addresses x Ports. For example, given:
+
+        {
+        Addresses: [{"ip": "10.10.1.1"}, {"ip": "10.10.2.2"}],
+        Ports:     [{"name": "a", "port": 8675}, {"name": "b", "port": 309}]
+        }
+
+        The resulting set of endpoints can be viewed as:
+
+        a: [ 10.10.1.1:8675, 10.10.2.2:8675 ],
+        b: [ 10.10.1.1:309, 10.10.2.2:309 ]
+
+        :param addresses: IP addresses which offer the related ports that are marked as ready. These endpoints should be considered safe for load balancers and clients to utilize.
+        :param not_ready_addresses: IP addresses which offer the related ports but are not currently marked as ready because they have not yet finished starting, have recently failed a readiness check, or have recently failed a liveness check.
+        :param ports: Port numbers available on the related IP addresses.
+
+        :schema: io.k8s.api.core.v1.EndpointSubset
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__f3121032b6cb224e5e34b7639c8027fadb2a705523967f72dda8e1bb2dc1c8ab)
+            check_type(argname="argument addresses", value=addresses, expected_type=type_hints["addresses"])
+            check_type(argname="argument not_ready_addresses", value=not_ready_addresses, expected_type=type_hints["not_ready_addresses"])
+            check_type(argname="argument ports", value=ports, expected_type=type_hints["ports"])
+        self._value_addresses = addresses
+        self._value_not_ready_addresses = not_ready_addresses
+        self._value_ports = ports
+
+    @builtins.property
+    def addresses(self) -> typing.Optional[typing.List[EndpointAddress]]:
+        '''IP addresses which offer the related ports that are marked as ready.
+
+        These endpoints should be considered safe for load balancers and clients to utilize.
+
+        :schema: io.k8s.api.core.v1.EndpointSubset#addresses
+        '''
+        result = self._value_addresses
+        return typing.cast(typing.Optional[typing.List[EndpointAddress]], result)
+
+    @builtins.property
+    def not_ready_addresses(self) -> typing.Optional[typing.List[EndpointAddress]]:
+        '''IP addresses which offer the related ports but are not currently marked as ready because they have not yet finished starting, have recently failed a readiness check, or have recently failed a liveness check.
+
+        :schema: io.k8s.api.core.v1.EndpointSubset#notReadyAddresses
+        '''
+        result = self._value_not_ready_addresses
+        return typing.cast(typing.Optional[typing.List[EndpointAddress]], result)
+
+    @builtins.property
+    def ports(self) -> typing.Optional[typing.List[EndpointPort]]:
+        '''Port numbers available on the related IP addresses.
+
+        :schema: io.k8s.api.core.v1.EndpointSubset#ports
+        '''
+        result = self._value_ports
+        return typing.cast(typing.Optional[typing.List[EndpointPort]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_addresses is not None:
+            values["addresses"] = self._value_addresses
+        if self._value_not_ready_addresses is not None:
+            values["not_ready_addresses"] = self._value_not_ready_addresses
+        if self._value_ports is not None:
+            values["ports"] = self._value_ports
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EndpointSubset(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__f3121032b6cb224e5e34b7639c8027fadb2a705523967f72dda8e1bb2dc1c8ab(
+    *,
+    addresses: typing.Optional[typing.Sequence[typing.Union[EndpointAddress, typing.Dict[builtins.str, typing.Any]]]] = None,
+    not_ready_addresses: typing.Optional[typing.Sequence[typing.Union[EndpointAddress, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ports: typing.Optional[typing.Sequence[typing.Union[EndpointPort, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,125 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ConfigMapEnvSource import ConfigMapEnvSource
+from .SecretEnvSource import SecretEnvSource
+
+
+@jsii.data_type(
+    jsii_type="k8s.EnvFromSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "config_map_ref": "configMapRef",
+        "prefix": "prefix",
+        "secret_ref": "secretRef",
+    },
+)
+class EnvFromSource(_base.Struct):
+    __slots__ = (
+        "_value_config_map_ref",
+        "_value_prefix",
+        "_value_secret_ref",
+    )
+
+    def __init__(
+        self,
+        *,
+        config_map_ref: typing.Optional[typing.Union[ConfigMapEnvSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        prefix: typing.Optional[builtins.str] = None,
+        secret_ref: typing.Optional[typing.Union["SecretEnvSource", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''EnvFromSource represents the source of a set of ConfigMaps.
+
+        :param config_map_ref: The ConfigMap to select from.
+        :param prefix: An optional identifier to prepend to each key in the ConfigMap. Must be a C_IDENTIFIER.
+        :param secret_ref: The Secret to select from.
+
+        :schema: io.k8s.api.core.v1.EnvFromSource
+        '''
+        if isinstance(config_map_ref, dict):
+            config_map_ref = ConfigMapEnvSource(**config_map_ref)
+        if isinstance(secret_ref, dict):
+            secret_ref = SecretEnvSource(**secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__1e745a3a12e83796a4c7e9f2246565d74fe3f6a1041987cbb7dd3435aaba3180)
+            check_type(argname="argument config_map_ref", value=config_map_ref, expected_type=type_hints["config_map_ref"])
+            check_type(argname="argument prefix", value=prefix, expected_type=type_hints["prefix"])
+            check_type(argname="argument secret_ref", value=secret_ref, expected_type=type_hints["secret_ref"])
+        self._value_config_map_ref = config_map_ref
+        self._value_prefix = prefix
+        self._value_secret_ref = secret_ref
+
+    @builtins.property
+    def config_map_ref(self) -> typing.Optional[ConfigMapEnvSource]:
+        '''The ConfigMap to select from.
+
+        :schema: io.k8s.api.core.v1.EnvFromSource#configMapRef
+        '''
+        result = self._value_config_map_ref
+        return typing.cast(typing.Optional[ConfigMapEnvSource], result)
+
+    @builtins.property
+    def prefix(self) -> typing.Optional[builtins.str]:
+        '''An optional identifier to prepend to each key in the ConfigMap.
+
+        Must be a C_IDENTIFIER.
+
+        :schema: io.k8s.api.core.v1.EnvFromSource#prefix
+        '''
+        result = self._value_prefix
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def secret_ref(self) -> typing.Optional["SecretEnvSource"]:
+        '''The Secret to select from.
+
+        :schema: io.k8s.api.core.v1.EnvFromSource#secretRef
+        '''
+        result = self._value_secret_ref
+        return typing.cast(typing.Optional["SecretEnvSource"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_config_map_ref is not None:
+            values["config_map_ref"] = self._value_config_map_ref
+        if self._value_prefix is not None:
+            values["prefix"] = self._value_prefix
+        if self._value_secret_ref is not None:
+            values["secret_ref"] = self._value_secret_ref
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EnvFromSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__1e745a3a12e83796a4c7e9f2246565d74fe3f6a1041987cbb7dd3435aaba3180(
+    *,
+    config_map_ref: typing.Optional[typing.Union[ConfigMapEnvSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    prefix: typing.Optional[builtins.str] = None,
+    secret_ref: typing.Optional[typing.Union[SecretEnvSource, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,125 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .EnvVarSource import EnvVarSource
+
+
+@jsii.data_type(
+    jsii_type="k8s.EnvVar",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name", "value": "value", "value_from": "valueFrom"},
+)
+class EnvVar(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_value",
+        "_value_value_from",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: builtins.str,
+        value: typing.Optional[builtins.str] = None,
+        value_from: typing.Optional[typing.Union["EnvVarSource", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''EnvVar represents an environment variable present in a Container.
+
+        :param name: Name of the environment variable. Must be a C_IDENTIFIER.
+        :param value: Variable references $(VAR_NAME) are expanded using the previously defined environment variables in the container and any service environment variables. If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Defaults to "". Default: .
+        :param value_from: Source for the environment variable's value. Cannot be used if value is not empty.
+
+        :schema: io.k8s.api.core.v1.EnvVar
+        '''
+        if isinstance(value_from, dict):
+            value_from = EnvVarSource(**value_from)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7ff167fe39eff04347196f0b38e85c859cfdf9180d26b47b3ccc003411311c3a)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument value", value=value, expected_type=type_hints["value"])
+            check_type(argname="argument value_from", value=value_from, expected_type=type_hints["value_from"])
+        self._value_name = name
+        self._value_value = value
+        self._value_value_from = value_from
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''Name of the environment variable.
+
+        Must be a C_IDENTIFIER.
+
+        :schema: io.k8s.api.core.v1.EnvVar#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def value(self) -> typing.Optional[builtins.str]:
+        '''Variable references $(VAR_NAME) are expanded using the previously defined environment variables in the container and any service environment variables.
+
+        If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Defaults to "".
+
+        :default: .
+
+        :schema: io.k8s.api.core.v1.EnvVar#value
+        '''
+        result = self._value_value
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def value_from(self) -> typing.Optional["EnvVarSource"]:
+        '''Source for the environment variable's value.
+
+        Cannot be used if value is not empty.
+
+        :schema: io.k8s.api.core.v1.EnvVar#valueFrom
+        '''
+        result = self._value_value_from
+        return typing.cast(typing.Optional["EnvVarSource"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+        }
+        if self._value_value is not None:
+            values["value"] = self._value_value
+        if self._value_value_from is not None:
+            values["value_from"] = self._value_value_from
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EnvVar(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7ff167fe39eff04347196f0b38e85c859cfdf9180d26b47b3ccc003411311c3a(
+    *,
+    name: builtins.str,
+    value: typing.Optional[builtins.str] = None,
+    value_from: typing.Optional[typing.Union[EnvVarSource, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
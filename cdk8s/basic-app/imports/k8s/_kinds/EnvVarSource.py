@@ -0,0 +1,147 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ConfigMapKeySelector import ConfigMapKeySelector
+from .ObjectFieldSelector import ObjectFieldSelector
+from .ResourceFieldSelector import ResourceFieldSelector
+from .SecretKeySelector import SecretKeySelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.EnvVarSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "config_map_key_ref": "configMapKeyRef",
+        "field_ref": "fieldRef",
+        "resource_field_ref": "resourceFieldRef",
+        "secret_key_ref": "secretKeyRef",
+    },
+)
+class EnvVarSource(_base.Struct):
+    __slots__ = (
+        "_value_config_map_key_ref",
+        "_value_field_ref",
+        "_value_resource_field_ref",
+        "_value_secret_key_ref",
+    )
+
+    def __init__(
+        self,
+        *,
+        config_map_key_ref: typing.Optional[typing.Union[ConfigMapKeySelector, typing.Dict[builtins.str, typing.Any]]] = None,
+        field_ref: typing.Optional[typing.Union["ObjectFieldSelector", typing.Dict[builtins.str, typing.Any]]] = None,
+        resource_field_ref: typing.Optional[typing.Union["ResourceFieldSelector", typing.Dict[builtins.str, typing.Any]]] = None,
+        secret_key_ref: typing.Optional[typing.Union["SecretKeySelector", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''EnvVarSource represents a source for the value of an EnvVar.
+
+        :param config_map_key_ref: Selects a key of a ConfigMap.
+        :param field_ref: Selects a field of the pod: supports metadata.name, metadata.namespace, ``metadata.labels['<KEY>']``, ``metadata.annotations['<KEY>']``, spec.nodeName, spec.serviceAccountName, status.hostIP, status.podIP, status.podIPs.
+        :param resource_field_ref: Selects a resource of the container: only resources limits and requests (limits.cpu, limits.memory, limits.ephemeral-storage, requests.cpu, requests.memory and requests.ephemeral-storage) are currently supported.
+        :param secret_key_ref: Selects a key of a secret in the pod's namespace.
+
+        :schema: io.k8s.api.core.v1.EnvVarSource
+        '''
+        if isinstance(config_map_key_ref, dict):
+            config_map_key_ref = ConfigMapKeySelector(**config_map_key_ref)
+        if isinstance(field_ref, dict):
+            field_ref = ObjectFieldSelector(**field_ref)
+        if isinstance(resource_field_ref, dict):
+            resource_field_ref = ResourceFieldSelector(**resource_field_ref)
+        if isinstance(secret_key_ref, dict):
+            secret_key_ref = SecretKeySelector(**secret_key_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__8200f0b06b85522180fa691bfce5b26210b45cbf9374d77ea5dd65cbbf09b32a)
+            check_type(argname="argument config_map_key_ref", value=config_map_key_ref, expected_type=type_hints["config_map_key_ref"])
+            check_type(argname="argument field_ref", value=field_ref, expected_type=type_hints["field_ref"])
+            check_type(argname="argument resource_field_ref", value=resource_field_ref, expected_type=type_hints["resource_field_ref"])
+            check_type(argname="argument secret_key_ref", value=secret_key_ref, expected_type=type_hints["secret_key_ref"])
+        self._value_config_map_key_ref = config_map_key_ref
+        self._value_field_ref = field_ref
+        self._value_resource_field_ref = resource_field_ref
+        self._value_secret_key_ref = secret_key_ref
+
+    @builtins.property
+    def config_map_key_ref(self) -> typing.Optional[ConfigMapKeySelector]:
+        '''Selects a key of a ConfigMap.
+
+        :schema: io.k8s.api.core.v1.EnvVarSource#configMapKeyRef
+        '''
+        result = self._value_config_map_key_ref
+        return typing.cast(typing.Optional[ConfigMapKeySelector], result)
+
+    @builtins.property
+    def field_ref(self) -> typing.Optional["ObjectFieldSelector"]:
+        '''Selects a field of the pod: supports metadata.name, metadata.namespace, ``metadata.labels['<KEY>']``, ``metadata.annotations['<KEY>']``, spec.nodeName, spec.serviceAccountName, status.hostIP, status.podIP, status.podIPs.
+
+        :schema: io.k8s.api.core.v1.EnvVarSource#fieldRef
+        '''
+        result = self._value_field_ref
+        return typing.cast(typing.Optional["ObjectFieldSelector"], result)
+
+    @builtins.property
+    def resource_field_ref(self) -> typing.Optional["ResourceFieldSelector"]:
+        '''Selects a resource of the container: only resources limits and requests (limits.cpu, limits.memory, limits.ephemeral-storage, requests.cpu, requests.memory and requests.ephemeral-storage) are currently supported.
+
+        :schema: io.k8s.api.core.v1.EnvVarSource#resourceFieldRef
+        '''
+        result = self._value_resource_field_ref
+        return typing.cast(typing.Optional["ResourceFieldSelector"], result)
+
+    @builtins.property
+    def secret_key_ref(self) -> typing.Optional["SecretKeySelector"]:
+        '''Selects a key of a secret in the pod's namespace.
+
+        :schema: io.k8s.api.core.v1.EnvVarSource#secretKeyRef
+        '''
+        result = self._value_secret_key_ref
+        return typing.cast(typing.Optional["SecretKeySelector"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_config_map_key_ref is not None:
+            values["config_map_key_ref"] = self._value_config_map_key_ref
+        if self._value_field_ref is not None:
+            values["field_ref"] = self._value_field_ref
+        if self._value_resource_field_ref is not None:
+            values["resource_field_ref"] = self._value_resource_field_ref
+        if self._value_secret_key_ref is not None:
+            values["secret_key_ref"] = self._value_secret_key_ref
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EnvVarSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__8200f0b06b85522180fa691bfce5b26210b45cbf9374d77ea5dd65cbbf09b32a(
+    *,
+    config_map_key_ref: typing.Optional[typing.Union[ConfigMapKeySelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    field_ref: typing.Optional[typing.Union[ObjectFieldSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    resource_field_ref: typing.Optional[typing.Union[ResourceFieldSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    secret_key_ref: typing.Optional[typing.Union[SecretKeySelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,551 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ContainerPort import ContainerPort
+from .EnvFromSource import EnvFromSource
+from .EnvVar import EnvVar
+from .Lifecycle import Lifecycle
+from .Probe import Probe
+from .ResourceRequirements import ResourceRequirements
+from .SecurityContext import SecurityContext
+from .VolumeDevice import VolumeDevice
+from .VolumeMount import VolumeMount
+
+
+@jsii.data_type(
+    jsii_type="k8s.EphemeralContainer",
+    jsii_struct_bases=[],
+    name_mapping={
+        "name": "name",
+        "args": "args",
+        "command": "command",
+        "env": "env",
+        "env_from": "envFrom",
+        "image": "image",
+        "image_pull_policy": "imagePullPolicy",
+        "lifecycle": "lifecycle",
+        "liveness_probe": "livenessProbe",
+        "ports": "ports",
+        "readiness_probe": "readinessProbe",
+        "resources": "resources",
+        "security_context": "securityContext",
+        "startup_probe": "startupProbe",
+        "stdin": "stdin",
+        "stdin_once": "stdinOnce",
+        "target_container_name": "targetContainerName",
+        "termination_message_path": "terminationMessagePath",
+        "termination_message_policy": "terminationMessagePolicy",
+        "tty": "tty",
+        "volume_devices": "volumeDevices",
+        "volume_mounts": "volumeMounts",
+        "working_dir": "workingDir",
+    },
+)
+class EphemeralContainer(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_args",
+        "_value_command",
+        "_value_env",
+        "_value_env_from",
+        "_value_image",
+        "_value_image_pull_policy",
+        "_value_lifecycle",
+        "_value_liveness_probe",
+        "_value_ports",
+        "_value_readiness_probe",
+        "_value_resources",
+        "_value_security_context",
+        "_value_startup_probe",
+        "_value_stdin",
+        "_value_stdin_once",
+        "_value_target_container_name",
+        "_value_termination_message_path",
+        "_value_termination_message_policy",
+        "_value_tty",
+        "_value_volume_devices",
+        "_value_volume_mounts",
+        "_value_working_dir",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: builtins.str,
+        args: typing.Optional[typing.Sequence[builtins.str]] = None,
+        command: typing.Optional[typing.Sequence[builtins.str]] = None,
+        env: typing.Optional[typing.Sequence[typing.Union[EnvVar, typing.Dict[builtins.str, typing.Any]]]] = None,
+        env_from: typing.Optional[typing.Sequence[typing.Union[EnvFromSource, typing.Dict[builtins.str, typing.Any]]]] = None,
+        image: typing.Optional[builtins.str] = None,
+        image_pull_policy: typing.Optional[builtins.str] = None,
+        lifecycle: typing.Optional[typing.Union["Lifecycle", typing.Dict[builtins.str, typing.Any]]] = None,
+        liveness_probe: typing.Optional[typing.Union["Probe", typing.Dict[builtins.str, typing.Any]]] = None,
+        ports: typing.Optional[typing.Sequence[typing.Union[ContainerPort, typing.Dict[builtins.str, typing.Any]]]] = None,
+        readiness_probe: typing.Optional[typing.Union["Probe", typing.Dict[builtins.str, typing.Any]]] = None,
+        resources: typing.Optional[typing.Union["ResourceRequirements", typing.Dict[builtins.str, typing.Any]]] = None,
+        security_context: typing.Optional[typing.Union["SecurityContext", typing.Dict[builtins.str, typing.Any]]] = None,
+        startup_probe: typing.Optional[typing.Union["Probe", typing.Dict[builtins.str, typing.Any]]] = None,
+        stdin: typing.Optional[builtins.bool] = None,
+        stdin_once: typing.Optional[builtins.bool] = None,
+        target_container_name: typing.Optional[builtins.str] = None,
+        termination_message_path: typing.Optional[builtins.str] = None,
+        termination_message_policy: typing.Optional[builtins.str] = None,
+        tty: typing.Optional[builtins.bool] = None,
+        volume_devices: typing.Optional[typing.Sequence[typing.Union["VolumeDevice", typing.Dict[builtins.str, typing.Any]]]] = None,
+        volume_mounts: typing.Optional[typing.Sequence[typing.Union["VolumeMount", typing.Dict[builtins.str, typing.Any]]]] = None,
+        working_dir: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''An EphemeralContainer is a temporary container that you may add to an existing Pod for user-initiated activities such as debugging.
+
+        Ephemeral containers have no resource or scheduling guarantees, and they will not be restarted when they exit or when a Pod is removed or restarted. The kubelet may evict a Pod if an ephemeral container causes the Pod to exceed its resource allocation.
+
+        To add an ephemeral container, use the ephemeralcontainers subresource of an existing Pod. Ephemeral containers may not be removed or restarted.
+
+        :param name: Name of the ephemeral container specified as a DNS_LABEL. This name must be unique among all containers, init containers and ephemeral containers.
+        :param args: Arguments to the entrypoint. The image's CMD is used if this is not provided. Variable references $(VAR_NAME) are expanded using the container's environment. If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Cannot be updated. More info: https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell
+        :param command: Entrypoint array. Not executed within a shell. The image's ENTRYPOINT is used if this is not provided. Variable references $(VAR_NAME) are expanded using the container's environment. If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Cannot be updated. More info: https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell
+        :param env: List of environment variables to set in the container. Cannot be updated.
+        :param env_from: List of sources to populate environment variables in the container. The keys defined within a source must be a C_IDENTIFIER. All invalid keys will be reported as an event when the container is starting. When a key exists in multiple sources, the value associated with the last source will take precedence. Values defined by an Env with a duplicate key will take precedence. Cannot be updated.
+        :param image: Container image name. More info: https://kubernetes.io/docs/concepts/containers/images
+        :param image_pull_policy: Image pull policy. One of Always, Never, IfNotPresent. Defaults to Always if :latest tag is specified, or IfNotPresent otherwise. Cannot be updated. More info: https://kubernetes.io/docs/concepts/containers/images#updating-images Default: Always if :latest tag is specified, or IfNotPresent otherwise. Cannot be updated. More info: https://kubernetes.io/docs/concepts/containers/images#updating-images
+        :param lifecycle: Lifecycle is not allowed for ephemeral containers.
+        :param liveness_probe: Probes are not allowed for ephemeral containers.
+        :param ports: Ports are not allowed for ephemeral containers.
+        :param readiness_probe: Probes are not allowed for ephemeral containers.
+        :param resources: Resources are not allowed for ephemeral containers. Ephemeral containers use spare resources already allocated to the pod.
+        :param security_context: Optional: SecurityContext defines the security options the ephemeral container should be run with. If set, the fields of SecurityContext override the equivalent fields of PodSecurityContext.
+        :param startup_probe: Probes are not allowed for ephemeral containers.
+        :param stdin: Whether this container should allocate a buffer for stdin in the container runtime. If this is not set, reads from stdin in the container will always result in EOF. Default is false. Default: false.
+        :param stdin_once: Whether the container runtime should close the stdin channel after it has been opened by a single attach. When stdin is true the stdin stream will remain open across multiple attach sessions. If stdinOnce is set to true, stdin is opened on container start, is empty until the first client attaches to stdin, and then remains open and accepts data until the client disconnects, at which time stdin is closed and remains closed until the container is restarted. If this flag is false, a container processes that reads from stdin will never receive an EOF. Default is false Default: false
+        :param target_container_name: If set, the name of the container from PodSpec that this ephemeral container targets. The ephemeral container will be run in the namespaces (IPC, PID, etc) of this container. If not set then the ephemeral container uses the namespaces configured in the Pod spec. The container runtime must implement support for this feature. If the runtime does not support namespace targeting then the result of setting this field is undefined.
+        :param termination_message_path: Optional: Path at which the file to which the container's termination message will be written is mounted into the container's filesystem. Message written is intended to be brief final status, such as an assertion failure message. Will be truncated by the node if greater than 4096 bytes. The total message length across all containers will be limited to 12kb. Defaults to /dev/termination-log. Cannot be updated. Default: dev/termination-log. Cannot be updated.
+        :param termination_message_policy: Indicate how the termination message should be populated. File will use the contents of terminationMessagePath to populate the container status message on both success and failure. FallbackToLogsOnError will use the last chunk of container log output if the termination message file is empty and the container exited with an error. The log output is limited to 2048 bytes or 80 lines, whichever is smaller. Defaults to File. Cannot be updated. Default: File. Cannot be updated.
+        :param tty: Whether this container should allocate a TTY for itself, also requires 'stdin' to be true. Default is false. Default: false.
+        :param volume_devices: volumeDevices is the list of block devices to be used by the container.
+        :param volume_mounts: Pod volumes to mount into the container's filesystem. Subpath mounts are not allowed for ephemeral containers. Cannot be updated.
+        :param working_dir: Container's working directory. If not specified, the container runtime's default will be used, which might be configured in the container image. Cannot be updated.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer
+        '''
+        if isinstance(lifecycle, dict):
+            lifecycle = Lifecycle(**lifecycle)
+        if isinstance(liveness_probe, dict):
+            liveness_probe = Probe(**liveness_probe)
+        if isinstance(readiness_probe, dict):
+            readiness_probe = Probe(**readiness_probe)
+        if isinstance(resources, dict):
+            resources = ResourceRequirements(**resources)
+        if isinstance(security_context, dict):
+            security_context = SecurityContext(**security_context)
+        if isinstance(startup_probe, dict):
+            startup_probe = Probe(**startup_probe)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__3e01c0b51ea0b6a8c67c37763e480129a2534ef49ece7c443d6c8063f7415d29)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument args", value=args, expected_type=type_hints["args"])
+            check_type(argname="argument command", value=command, expected_type=type_hints["command"])
+            check_type(argname="argument env", value=env, expected_type=type_hints["env"])
+            check_type(argname="argument env_from", value=env_from, expected_type=type_hints["env_from"])
+            check_type(argname="argument image", value=image, expected_type=type_hints["image"])
+            check_type(argname="argument image_pull_policy", value=image_pull_policy, expected_type=type_hints["image_pull_policy"])
+            check_type(argname="argument lifecycle", value=lifecycle, expected_type=type_hints["lifecycle"])
+            check_type(argname="argument liveness_probe", value=liveness_probe, expected_type=type_hints["liveness_probe"])
+            check_type(argname="argument ports", value=ports, expected_type=type_hints["ports"])
+            check_type(argname="argument readiness_probe", value=readiness_probe, expected_type=type_hints["readiness_probe"])
+            check_type(argname="argument resources", value=resources, expected_type=type_hints["resources"])
+            check_type(argname="argument security_context", value=security_context, expected_type=type_hints["security_context"])
+            check_type(argname="argument startup_probe", value=startup_probe, expected_type=type_hints["startup_probe"])
+            check_type(argname="argument stdin", value=stdin, expected_type=type_hints["stdin"])
+            check_type(argname="argument stdin_once", value=stdin_once, expected_type=type_hints["stdin_once"])
+            check_type(argname="argument target_container_name", value=target_container_name, expected_type=type_hints["target_container_name"])
+            check_type(argname="argument termination_message_path", value=termination_message_path, expected_type=type_hints["termination_message_path"])
+            check_type(argname="argument termination_message_policy", value=termination_message_policy, expected_type=type_hints["termination_message_policy"])
+            check_type(argname="argument tty", value=tty, expected_type=type_hints["tty"])
+            check_type(argname="argument volume_devices", value=volume_devices, expected_type=type_hints["volume_devices"])
+            check_type(argname="argument volume_mounts", value=volume_mounts, expected_type=type_hints["volume_mounts"])
+            check_type(argname="argument working_dir", value=working_dir, expected_type=type_hints["working_dir"])
+        self._value_name = name
+        self._value_args = args
+        self._value_command = command
+        self._value_env = env
+        self._value_env_from = env_from
+        self._value_image = image
+        self._value_image_pull_policy = image_pull_policy
+        self._value_lifecycle = lifecycle
+        self._value_liveness_probe = liveness_probe
+        self._value_ports = ports
+        self._value_readiness_probe = readiness_probe
+        self._value_resources = resources
+        self._value_security_context = security_context
+        self._value_startup_probe = startup_probe
+        self._value_stdin = stdin
+        self._value_stdin_once = stdin_once
+        self._value_target_container_name = target_container_name
+        self._value_termination_message_path = termination_message_path
+        self._value_termination_message_policy = termination_message_policy
+        self._value_tty = tty
+        self._value_volume_devices = volume_devices
+        self._value_volume_mounts = volume_mounts
+        self._value_working_dir = working_dir
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''Name of the ephemeral container specified as a DNS_LABEL.
+
+        This name must be unique among all containers, init containers and ephemeral containers.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def args(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Arguments to the entrypoint.
+
+        The image's CMD is used if this is not provided. Variable references $(VAR_NAME) are expanded using the container's environment. If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Cannot be updated. More info: https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#args
+        '''
+        result = self._value_args
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def command(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Entrypoint array.
+
+        Not executed within a shell. The image's ENTRYPOINT is used if this is not provided. Variable references $(VAR_NAME) are expanded using the container's environment. If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Cannot be updated. More info: https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#command
+        '''
+        result = self._value_command
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def env(self) -> typing.Optional[typing.List[EnvVar]]:
+        '''List of environment variables to set in the container.
+
+        Cannot be updated.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#env
+        '''
+        result = self._value_env
+        return typing.cast(typing.Optional[typing.List[EnvVar]], result)
+
+    @builtins.property
+    def env_from(self) -> typing.Optional[typing.List[EnvFromSource]]:
+        '''List of sources to populate environment variables in the container.
+
+        The keys defined within a source must be a C_IDENTIFIER. All invalid keys will be reported as an event when the container is starting. When a key exists in multiple sources, the value associated with the last source will take precedence. Values defined by an Env with a duplicate key will take precedence. Cannot be updated.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#envFrom
+        '''
+        result = self._value_env_from
+        return typing.cast(typing.Optional[typing.List[EnvFromSource]], result)
+
+    @builtins.property
+    def image(self) -> typing.Optional[builtins.str]:
+        '''Container image name.
+
+        More info: https://kubernetes.io/docs/concepts/containers/images
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#image
+        '''
+        result = self._value_image
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def image_pull_policy(self) -> typing.Optional[builtins.str]:
+        '''Image pull policy.
+
+        One of Always, Never, IfNotPresent. Defaults to Always if :latest tag is specified, or IfNotPresent otherwise. Cannot be updated. More info: https://kubernetes.io/docs/concepts/containers/images#updating-images
+
+        :default: Always if :latest tag is specified, or IfNotPresent otherwise. Cannot be updated. More info: https://kubernetes.io/docs/concepts/containers/images#updating-images
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#imagePullPolicy
+        '''
+        result = self._value_image_pull_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def lifecycle(self) -> typing.Optional["Lifecycle"]:
+        '''Lifecycle is not allowed for ephemeral containers.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#lifecycle
+        '''
+        result = self._value_lifecycle
+        return typing.cast(typing.Optional["Lifecycle"], result)
+
+    @builtins.property
+    def liveness_probe(self) -> typing.Optional["Probe"]:
+        '''Probes are not allowed for ephemeral containers.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#livenessProbe
+        '''
+        result = self._value_liveness_probe
+        return typing.cast(typing.Optional["Probe"], result)
+
+    @builtins.property
+    def ports(self) -> typing.Optional[typing.List[ContainerPort]]:
+        '''Ports are not allowed for ephemeral containers.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#ports
+        '''
+        result = self._value_ports
+        return typing.cast(typing.Optional[typing.List[ContainerPort]], result)
+
+    @builtins.property
+    def readiness_probe(self) -> typing.Optional["Probe"]:
+        '''Probes are not allowed for ephemeral containers.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#readinessProbe
+        '''
+        result = self._value_readiness_probe
+        return typing.cast(typing.Optional["Probe"], result)
+
+    @builtins.property
+    def resources(self) -> typing.Optional["ResourceRequirements"]:
+        '''Resources are not allowed for ephemeral containers.
+
+        Ephemeral containers use spare resources already allocated to the pod.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#resources
+        '''
+        result = self._value_resources
+        return typing.cast(typing.Optional["ResourceRequirements"], result)
+
+    @builtins.property
+    def security_context(self) -> typing.Optional["SecurityContext"]:
+        '''Optional: SecurityContext defines the security options the ephemeral container should be run with.
+
+        If set, the fields of SecurityContext override the equivalent fields of PodSecurityContext.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#securityContext
+        '''
+        result = self._value_security_context
+        return typing.cast(typing.Optional["SecurityContext"], result)
+
+    @builtins.property
+    def startup_probe(self) -> typing.Optional["Probe"]:
+        '''Probes are not allowed for ephemeral containers.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#startupProbe
+        '''
+        result = self._value_startup_probe
+        return typing.cast(typing.Optional["Probe"], result)
+
+    @builtins.property
+    def stdin(self) -> typing.Optional[builtins.bool]:
+        '''Whether this container should allocate a buffer for stdin in the container runtime.
+
+        If this is not set, reads from stdin in the container will always result in EOF. Default is false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#stdin
+        '''
+        result = self._value_stdin
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def stdin_once(self) -> typing.Optional[builtins.bool]:
+        '''Whether the container runtime should close the stdin channel after it has been opened by a single attach.
+
+        When stdin is true the stdin stream will remain open across multiple attach sessions. If stdinOnce is set to true, stdin is opened on container start, is empty until the first client attaches to stdin, and then remains open and accepts data until the client disconnects, at which time stdin is closed and remains closed until the container is restarted. If this flag is false, a container processes that reads from stdin will never receive an EOF. Default is false
+
+        :default: false
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#stdinOnce
+        '''
+        result = self._value_stdin_once
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def target_container_name(self) -> typing.Optional[builtins.str]:
+        '''If set, the name of the container from PodSpec that this ephemeral container targets.
+
+        The ephemeral container will be run in the namespaces (IPC, PID, etc) of this container. If not set then the ephemeral container uses the namespaces configured in the Pod spec.
+
+        The container runtime must implement support for this feature. If the runtime does not support namespace targeting then the result of setting this field is undefined.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#targetContainerName
+        '''
+        result = self._value_target_container_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def termination_message_path(self) -> typing.Optional[builtins.str]:
+        '''Optional: Path at which the file to which the container's termination message will be written is mounted into the container's filesystem.
+
+        Message written is intended to be brief final status, such as an assertion failure message. Will be truncated by the node if greater than 4096 bytes. The total message length across all containers will be limited to 12kb. Defaults to /dev/termination-log. Cannot be updated.
+
+        :default: dev/termination-log. Cannot be updated.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#terminationMessagePath
+        '''
+        result = self._value_termination_message_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def termination_message_policy(self) -> typing.Optional[builtins.str]:
+        '''Indicate how the termination message should be populated.
+
+        File will use the contents of terminationMessagePath to populate the container status message on both success and failure. FallbackToLogsOnError will use the last chunk of container log output if the termination message file is empty and the container exited with an error. The log output is limited to 2048 bytes or 80 lines, whichever is smaller. Defaults to File. Cannot be updated.
+
+        :default: File. Cannot be updated.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#terminationMessagePolicy
+        '''
+        result = self._value_termination_message_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def tty(self) -> typing.Optional[builtins.bool]:
+        '''Whether this container should allocate a TTY for itself, also requires 'stdin' to be true.
+
+        Default is false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#tty
+        '''
+        result = self._value_tty
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def volume_devices(self) -> typing.Optional[typing.List["VolumeDevice"]]:
+        '''volumeDevices is the list of block devices to be used by the container.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#volumeDevices
+        '''
+        result = self._value_volume_devices
+        return typing.cast(typing.Optional[typing.List["VolumeDevice"]], result)
+
+    @builtins.property
+    def volume_mounts(self) -> typing.Optional[typing.List["VolumeMount"]]:
+        '''Pod volumes to mount into the container's filesystem.
+
+        Subpath mounts are not allowed for ephemeral containers. Cannot be updated.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#volumeMounts
+        '''
+        result = self._value_volume_mounts
+        return typing.cast(typing.Optional[typing.List["VolumeMount"]], result)
+
+    @builtins.property
+    def working_dir(self) -> typing.Optional[builtins.str]:
+        '''Container's working directory.
+
+        If not specified, the container runtime's default will be used, which might be configured in the container image. Cannot be updated.
+
+        :schema: io.k8s.api.core.v1.EphemeralContainer#workingDir
+        '''
+        result = self._value_working_dir
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+        }
+        if self._value_args is not None:
+            values["args"] = self._value_args
+        if self._value_command is not None:
+            values["command"] = self._value_command
+        if self._value_env is not None:
+            values["env"] = self._value_env
+        if self._value_env_from is not None:
+            values["env_from"] = self._value_env_from
+        if self._value_image is not None:
+            values["image"] = self._value_image
+        if self._value_image_pull_policy is not None:
+            values["image_pull_policy"] = self._value_image_pull_policy
+        if self._value_lifecycle is not None:
+            values["lifecycle"] = self._value_lifecycle
+        if self._value_liveness_probe is not None:
+            values["liveness_probe"] = self._value_liveness_probe
+        if self._value_ports is not None:
+            values["ports"] = self._value_ports
+        if self._value_readiness_probe is not None:
+            values["readiness_probe"] = self._value_readiness_probe
+        if self._value_resources is not None:
+            values["resources"] = self._value_resources
+        if self._value_security_context is not None:
+            values["security_context"] = self._value_security_context
+        if self._value_startup_probe is not None:
+            values["startup_probe"] = self._value_startup_probe
+        if self._value_stdin is not None:
+            values["stdin"] = self._value_stdin
+        if self._value_stdin_once is not None:
+            values["stdin_once"] = self._value_stdin_once
+        if self._value_target_container_name is not None:
+            values["target_container_name"] = self._value_target_container_name
+        if self._value_termination_message_path is not None:
+            values["termination_message_path"] = self._value_termination_message_path
+        if self._value_termination_message_policy is not None:
+            values["termination_message_policy"] = self._value_termination_message_policy
+        if self._value_tty is not None:
+            values["tty"] = self._value_tty
+        if self._value_volume_devices is not None:
+            values["volume_devices"] = self._value_volume_devices
+        if self._value_volume_mounts is not None:
+            values["volume_mounts"] = self._value_volume_mounts
+        if self._value_working_dir is not None:
+            values["working_dir"] = self._value_working_dir
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EphemeralContainer(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__3e01c0b51ea0b6a8c67c37763e480129a2534ef49ece7c443d6c8063f7415d29(
+    *,
+    name: builtins.str,
+    args: typing.Optional[typing.Sequence[builtins.str]] = None,
+    command: typing.Optional[typing.Sequence[builtins.str]] = None,
+    env: typing.Optional[typing.Sequence[typing.Union[EnvVar, typing.Dict[builtins.str, typing.Any]]]] = None,
+    env_from: typing.Optional[typing.Sequence[typing.Union[EnvFromSource, typing.Dict[builtins.str, typing.Any]]]] = None,
+    image: typing.Optional[builtins.str] = None,
+    image_pull_policy: typing.Optional[builtins.str] = None,
+    lifecycle: typing.Optional[typing.Union[Lifecycle, typing.Dict[builtins.str, typing.Any]]] = None,
+    liveness_probe: typing.Optional[typing.Union[Probe, typing.Dict[builtins.str, typing.Any]]] = None,
+    ports: typing.Optional[typing.Sequence[typing.Union[ContainerPort, typing.Dict[builtins.str, typing.Any]]]] = None,
+    readiness_probe: typing.Optional[typing.Union[Probe, typing.Dict[builtins.str, typing.Any]]] = None,
+    resources: typing.Optional[typing.Union[ResourceRequirements, typing.Dict[builtins.str, typing.Any]]] = None,
+    security_context: typing.Optional[typing.Union[SecurityContext, typing.Dict[builtins.str, typing.Any]]] = None,
+    startup_probe: typing.Optional[typing.Union[Probe, typing.Dict[builtins.str, typing.Any]]] = None,
+    stdin: typing.Optional[builtins.bool] = None,
+    stdin_once: typing.Optional[builtins.bool] = None,
+    target_container_name: typing.Optional[builtins.str] = None,
+    termination_message_path: typing.Optional[builtins.str] = None,
+    termination_message_policy: typing.Optional[builtins.str] = None,
+    tty: typing.Optional[builtins.bool] = None,
+    volume_devices: typing.Optional[typing.Sequence[typing.Union[VolumeDevice, typing.Dict[builtins.str, typing.Any]]]] = None,
+    volume_mounts: typing.Optional[typing.Sequence[typing.Union[VolumeMount, typing.Dict[builtins.str, typing.Any]]]] = None,
+    working_dir: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,90 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .PersistentVolumeClaimTemplate import PersistentVolumeClaimTemplate
+
+
+@jsii.data_type(
+    jsii_type="k8s.EphemeralVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"volume_claim_template": "volumeClaimTemplate"},
+)
+class EphemeralVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_volume_claim_template",
+    )
+
+    def __init__(
+        self,
+        *,
+        volume_claim_template: typing.Optional[typing.Union["PersistentVolumeClaimTemplate", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Represents an ephemeral volume that is handled by a normal storage driver.
+
+        :param volume_claim_template: Will be used to create a stand-alone PVC to provision the volume. The pod in which this EphemeralVolumeSource is embedded will be the owner of the PVC, i.e. the PVC will be deleted together with the pod. The name of the PVC will be ``<pod name>-<volume name>`` where ``<volume name>`` is the name from the ``PodSpec.Volumes`` array entry. Pod validation will reject the pod if the concatenated name is not valid for a PVC (for example, too long). An existing PVC with that name that is not owned by the pod will *not* be used for the pod to avoid using an unrelated volume by mistake. Starting the pod is then blocked until the unrelated PVC is removed. If such a pre-created PVC is meant to be used by the pod, the PVC has to updated with an owner reference to the pod once the pod exists. Normally this should not be necessary, but it may be useful when manually reconstructing a broken cluster. This field is read-only and no changes will be made by Kubernetes to the PVC after it has been created. Required, must not be nil.
+
+        :schema: io.k8s.api.core.v1.EphemeralVolumeSource
+        '''
+        if isinstance(volume_claim_template, dict):
+            volume_claim_template = PersistentVolumeClaimTemplate(**volume_claim_template)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b18bb939a5ee93260e717b4a8b31bc6e5ff1329bc0dfc81f9c7fa24800f6854b)
+            check_type(argname="argument volume_claim_template", value=volume_claim_template, expected_type=type_hints["volume_claim_template"])
+        self._value_volume_claim_template = volume_claim_template
+
+    @builtins.property
+    def volume_claim_template(self) -> typing.Optional["PersistentVolumeClaimTemplate"]:
+        '''Will be used to create a stand-alone PVC to provision the volume.
+
+        The pod in which this EphemeralVolumeSource is embedded will be the owner of the PVC, i.e. the PVC will be deleted together with the pod.  The name of the PVC will be ``<pod name>-<volume name>`` where ``<volume name>`` is the name from the ``PodSpec.Volumes`` array entry. Pod validation will reject the pod if the concatenated name is not valid for a PVC (for example, too long).
+
+        An existing PVC with that name that is not owned by the pod will *not* be used for the pod to avoid using an unrelated volume by mistake. Starting the pod is then blocked until the unrelated PVC is removed. If such a pre-created PVC is meant to be used by the pod, the PVC has to updated with an owner reference to the pod once the pod exists. Normally this should not be necessary, but it may be useful when manually reconstructing a broken cluster.
+
+        This field is read-only and no changes will be made by Kubernetes to the PVC after it has been created.
+
+        Required, must not be nil.
+
+        :schema: io.k8s.api.core.v1.EphemeralVolumeSource#volumeClaimTemplate
+        '''
+        result = self._value_volume_claim_template
+        return typing.cast(typing.Optional["PersistentVolumeClaimTemplate"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_volume_claim_template is not None:
+            values["volume_claim_template"] = self._value_volume_claim_template
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EphemeralVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b18bb939a5ee93260e717b4a8b31bc6e5ff1329bc0dfc81f9c7fa24800f6854b(
+    *,
+    volume_claim_template: typing.Optional[typing.Union[PersistentVolumeClaimTemplate, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,97 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.EventSeries",
+    jsii_struct_bases=[],
+    name_mapping={"count": "count", "last_observed_time": "lastObservedTime"},
+)
+class EventSeries(_base.Struct):
+    __slots__ = (
+        "_value_count",
+        "_value_last_observed_time",
+    )
+
+    def __init__(
+        self,
+        *,
+        count: jsii.Number,
+        last_observed_time: datetime.datetime,
+    ) -> None:
+        '''EventSeries contain information on series of events, i.e. thing that was/is happening continuously for some time. How often to update the EventSeries is up to the event reporters. The default event reporter in "k8s.io/client-go/tools/events/event_broadcaster.go" shows how this struct is updated on heartbeats and can guide customized reporter implementations.
+
+        :param count: count is the number of occurrences in this series up to the last heartbeat time.
+        :param last_observed_time: lastObservedTime is the time when last Event from the series was seen before last heartbeat.
+
+        :schema: io.k8s.api.events.v1.EventSeries
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__004487d3474ef54e77d3c4fc15800f434258914047b941481974745bac50347a)
+            check_type(argname="argument count", value=count, expected_type=type_hints["count"])
+            check_type(argname="argument last_observed_time", value=last_observed_time, expected_type=type_hints["last_observed_time"])
+        self._value_count = count
+        self._value_last_observed_time = last_observed_time
+
+    @builtins.property
+    def count(self) -> jsii.Number:
+        '''count is the number of occurrences in this series up to the last heartbeat time.
+
+        :schema: io.k8s.api.events.v1.EventSeries#count
+        '''
+        result = self._value_count
+        assert result is not None, "Required property 'count' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def last_observed_time(self) -> datetime.datetime:
+        '''lastObservedTime is the time when last Event from the series was seen before last heartbeat.
+
+        :schema: io.k8s.api.events.v1.EventSeries#lastObservedTime
+        '''
+        result = self._value_last_observed_time
+        assert result is not None, "Required property 'last_observed_time' is missing"
+        return typing.cast(datetime.datetime, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "count": self._value_count,
+            "last_observed_time": self._value_last_observed_time,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EventSeries(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__004487d3474ef54e77d3c4fc15800f434258914047b941481974745bac50347a(
+    *,
+    count: jsii.Number,
+    last_observed_time: datetime.datetime,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,96 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.EventSource",
+    jsii_struct_bases=[],
+    name_mapping={"component": "component", "host": "host"},
+)
+class EventSource(_base.Struct):
+    __slots__ = (
+        "_value_component",
+        "_value_host",
+    )
+
+    def __init__(
+        self,
+        *,
+        component: typing.Optional[builtins.str] = None,
+        host: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''EventSource contains information for an event.
+
+        :param component: Component from which the event is generated.
+        :param host: Node name on which the event is generated.
+
+        :schema: io.k8s.api.core.v1.EventSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__4a9e80d349ff66b0083f1d53dad15acd2eb7b7353b7849460bd62f8e25e7974e)
+            check_type(argname="argument component", value=component, expected_type=type_hints["component"])
+            check_type(argname="argument host", value=host, expected_type=type_hints["host"])
+        self._value_component = component
+        self._value_host = host
+
+    @builtins.property
+    def component(self) -> typing.Optional[builtins.str]:
+        '''Component from which the event is generated.
+
+        :schema: io.k8s.api.core.v1.EventSource#component
+        '''
+        result = self._value_component
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def host(self) -> typing.Optional[builtins.str]:
+        '''Node name on which the event is generated.
+
+        :schema: io.k8s.api.core.v1.EventSource#host
+        '''
+        result = self._value_host
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_component is not None:
+            values["component"] = self._value_component
+        if self._value_host is not None:
+            values["host"] = self._value_host
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "EventSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__4a9e80d349ff66b0083f1d53dad15acd2eb7b7353b7849460bd62f8e25e7974e(
+    *,
+    component: typing.Optional[builtins.str] = None,
+    host: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
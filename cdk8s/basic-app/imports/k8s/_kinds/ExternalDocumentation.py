@@ -0,0 +1,94 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ExternalDocumentation",
+    jsii_struct_bases=[],
+    name_mapping={"description": "description", "url": "url"},
+)
+class ExternalDocumentation(_base.Struct):
+    __slots__ = (
+        "_value_description",
+        "_value_url",
+    )
+
+    def __init__(
+        self,
+        *,
+        description: typing.Optional[builtins.str] = None,
+        url: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ExternalDocumentation allows referencing an external resource for extended documentation.
+
+        :param description: 
+        :param url: 
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.ExternalDocumentation
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ed55df628bde684d5aa951f6b4c6672c57289721dbb3a11facc37969e46246f1)
+            check_type(argname="argument description", value=description, expected_type=type_hints["description"])
+            check_type(argname="argument url", value=url, expected_type=type_hints["url"])
+        self._value_description = description
+        self._value_url = url
+
+    @builtins.property
+    def description(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.ExternalDocumentation#description
+        '''
+        result = self._value_description
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def url(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.ExternalDocumentation#url
+        '''
+        result = self._value_url
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_description is not None:
+            values["description"] = self._value_description
+        if self._value_url is not None:
+            values["url"] = self._value_url
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ExternalDocumentation(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ed55df628bde684d5aa951f6b4c6672c57289721dbb3a11facc37969e46246f1(
+    *,
+    description: typing.Optional[builtins.str] = None,
+    url: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
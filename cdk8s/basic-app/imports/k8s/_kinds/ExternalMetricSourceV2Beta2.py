@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .MetricIdentifierV2Beta2 import MetricIdentifierV2Beta2
+from .MetricTargetV2Beta2 import MetricTargetV2Beta2
+
+
+@jsii.data_type(
+    jsii_type="k8s.ExternalMetricSourceV2Beta2",
+    jsii_struct_bases=[],
+    name_mapping={"metric": "metric", "target": "target"},
+)
+class ExternalMetricSourceV2Beta2(_base.Struct):
+    __slots__ = (
+        "_value_metric",
+        "_value_target",
+    )
+
+    def __init__(
+        self,
+        *,
+        metric: typing.Union["MetricIdentifierV2Beta2", typing.Dict[builtins.str, typing.Any]],
+        target: typing.Union["MetricTargetV2Beta2", typing.Dict[builtins.str, typing.Any]],
+    ) -> None:
+        '''ExternalMetricSource indicates how to scale on a metric not associated with any Kubernetes object (for example length of queue in cloud messaging service, or QPS from loadbalancer running outside of cluster).
+
+        :param metric: metric identifies the target metric by name and selector.
+        :param target: target specifies the target value for the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.ExternalMetricSource
+        '''
+        if isinstance(metric, dict):
+            metric = MetricIdentifierV2Beta2(**metric)
+        if isinstance(target, dict):
+            target = MetricTargetV2Beta2(**target)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__36b252acbc556d35519402150f6787f9c6501c5c096b81ad8387447ce2884dd5)
+            check_type(argname="argument metric", value=metric, expected_type=type_hints["metric"])
+            check_type(argname="argument target", value=target, expected_type=type_hints["target"])
+        self._value_metric = metric
+        self._value_target = target
+
+    @builtins.property
+    def metric(self) -> "MetricIdentifierV2Beta2":
+        '''metric identifies the target metric by name and selector.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.ExternalMetricSource#metric
+        '''
+        result = self._value_metric
+        assert result is not None, "Required property 'metric' is missing"
+        return typing.cast("MetricIdentifierV2Beta2", result)
+
+    @builtins.property
+    def target(self) -> "MetricTargetV2Beta2":
+        '''target specifies the target value for the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.ExternalMetricSource#target
+        '''
+        result = self._value_target
+        assert result is not None, "Required property 'target' is missing"
+        return typing.cast("MetricTargetV2Beta2", result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "metric": self._value_metric,
+            "target": self._value_target,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ExternalMetricSourceV2Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__36b252acbc556d35519402150f6787f9c6501c5c096b81ad8387447ce2884dd5(
+    *,
+    metric: typing.Union[MetricIdentifierV2Beta2, typing.Dict[builtins.str, typing.Any]],
+    target: typing.Union[MetricTargetV2Beta2, typing.Dict[builtins.str, typing.Any]],
+) -> None:
+    """Type checking stubs"""
+    pass
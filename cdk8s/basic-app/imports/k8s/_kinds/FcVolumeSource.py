@@ -0,0 +1,161 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.FcVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "fs_type": "fsType",
+        "lun": "lun",
+        "read_only": "readOnly",
+        "target_ww_ns": "targetWwNs",
+        "wwids": "wwids",
+    },
+)
+class FcVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_fs_type",
+        "_value_lun",
+        "_value_read_only",
+        "_value_target_ww_ns",
+        "_value_wwids",
+    )
+
+    def __init__(
+        self,
+        *,
+        fs_type: typing.Optional[builtins.str] = None,
+        lun: typing.Optional[jsii.Number] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        target_ww_ns: typing.Optional[typing.Sequence[builtins.str]] = None,
+        wwids: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''Represents a Fibre Channel volume.
+
+        Fibre Channel volumes can only be mounted as read/write once. Fibre Channel volumes support ownership management and SELinux relabeling.
+
+        :param fs_type: fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+        :param lun: lun is Optional: FC target lun number.
+        :param read_only: readOnly is Optional: Defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. Default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+        :param target_ww_ns: targetWWNs is Optional: FC target worldwide names (WWNs).
+        :param wwids: wwids Optional: FC volume world wide identifiers (wwids) Either wwids or combination of targetWWNs and lun must be set, but not both simultaneously.
+
+        :schema: io.k8s.api.core.v1.FCVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__2745107e20cb778ffd413fedde9112e0e0e1ad8530ac6be3aa44daf745945cd1)
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument lun", value=lun, expected_type=type_hints["lun"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument target_ww_ns", value=target_ww_ns, expected_type=type_hints["target_ww_ns"])
+            check_type(argname="argument wwids", value=wwids, expected_type=type_hints["wwids"])
+        self._value_fs_type = fs_type
+        self._value_lun = lun
+        self._value_read_only = read_only
+        self._value_target_ww_ns = target_ww_ns
+        self._value_wwids = wwids
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the filesystem type to mount.
+
+        Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+
+        :schema: io.k8s.api.core.v1.FCVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def lun(self) -> typing.Optional[jsii.Number]:
+        '''lun is Optional: FC target lun number.
+
+        :schema: io.k8s.api.core.v1.FCVolumeSource#lun
+        '''
+        result = self._value_lun
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly is Optional: Defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.FCVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def target_ww_ns(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''targetWWNs is Optional: FC target worldwide names (WWNs).
+
+        :schema: io.k8s.api.core.v1.FCVolumeSource#targetWWNs
+        '''
+        result = self._value_target_ww_ns
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def wwids(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''wwids Optional: FC volume world wide identifiers (wwids) Either wwids or combination of targetWWNs and lun must be set, but not both simultaneously.
+
+        :schema: io.k8s.api.core.v1.FCVolumeSource#wwids
+        '''
+        result = self._value_wwids
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_lun is not None:
+            values["lun"] = self._value_lun
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_target_ww_ns is not None:
+            values["target_ww_ns"] = self._value_target_ww_ns
+        if self._value_wwids is not None:
+            values["wwids"] = self._value_wwids
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "FcVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__2745107e20cb778ffd413fedde9112e0e0e1ad8530ac6be3aa44daf745945cd1(
+    *,
+    fs_type: typing.Optional[builtins.str] = None,
+    lun: typing.Optional[jsii.Number] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    target_ww_ns: typing.Optional[typing.Sequence[builtins.str]] = None,
+    wwids: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,163 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .SecretReference import SecretReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.FlexPersistentVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "driver": "driver",
+        "fs_type": "fsType",
+        "options": "options",
+        "read_only": "readOnly",
+        "secret_ref": "secretRef",
+    },
+)
+class FlexPersistentVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_driver",
+        "_value_fs_type",
+        "_value_options",
+        "_value_read_only",
+        "_value_secret_ref",
+    )
+
+    def __init__(
+        self,
+        *,
+        driver: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+        options: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        secret_ref: typing.Optional[typing.Union["SecretReference", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''FlexPersistentVolumeSource represents a generic persistent volume resource that is provisioned/attached using an exec based plugin.
+
+        :param driver: driver is the name of the driver to use for this volume.
+        :param fs_type: fsType is the Filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". The default filesystem depends on FlexVolume script.
+        :param options: options is Optional: this field holds extra command options if any.
+        :param read_only: readOnly is Optional: defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+        :param secret_ref: secretRef is Optional: SecretRef is reference to the secret object containing sensitive information to pass to the plugin scripts. This may be empty if no secret object is specified. If the secret object contains more than one secret, all secrets are passed to the plugin scripts.
+
+        :schema: io.k8s.api.core.v1.FlexPersistentVolumeSource
+        '''
+        if isinstance(secret_ref, dict):
+            secret_ref = SecretReference(**secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__361bb86c0f3e6ad95260e69e5449b56f8ed56cc62d38e36d89c325ca5045168e)
+            check_type(argname="argument driver", value=driver, expected_type=type_hints["driver"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument options", value=options, expected_type=type_hints["options"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument secret_ref", value=secret_ref, expected_type=type_hints["secret_ref"])
+        self._value_driver = driver
+        self._value_fs_type = fs_type
+        self._value_options = options
+        self._value_read_only = read_only
+        self._value_secret_ref = secret_ref
+
+    @builtins.property
+    def driver(self) -> builtins.str:
+        '''driver is the name of the driver to use for this volume.
+
+        :schema: io.k8s.api.core.v1.FlexPersistentVolumeSource#driver
+        '''
+        result = self._value_driver
+        assert result is not None, "Required property 'driver' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the Filesystem type to mount.
+
+        Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". The default filesystem depends on FlexVolume script.
+
+        :schema: io.k8s.api.core.v1.FlexPersistentVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def options(self) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''options is Optional: this field holds extra command options if any.
+
+        :schema: io.k8s.api.core.v1.FlexPersistentVolumeSource#options
+        '''
+        result = self._value_options
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly is Optional: defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.FlexPersistentVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def secret_ref(self) -> typing.Optional["SecretReference"]:
+        '''secretRef is Optional: SecretRef is reference to the secret object containing sensitive information to pass to the plugin scripts.
+
+        This may be empty if no secret object is specified. If the secret object contains more than one secret, all secrets are passed to the plugin scripts.
+
+        :schema: io.k8s.api.core.v1.FlexPersistentVolumeSource#secretRef
+        '''
+        result = self._value_secret_ref
+        return typing.cast(typing.Optional["SecretReference"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "driver": self._value_driver,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_options is not None:
+            values["options"] = self._value_options
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_secret_ref is not None:
+            values["secret_ref"] = self._value_secret_ref
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "FlexPersistentVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__361bb86c0f3e6ad95260e69e5449b56f8ed56cc62d38e36d89c325ca5045168e(
+    *,
+    driver: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+    options: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    secret_ref: typing.Optional[typing.Union[SecretReference, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,100 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.FlockerVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"dataset_name": "datasetName", "dataset_uuid": "datasetUuid"},
+)
+class FlockerVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_dataset_name",
+        "_value_dataset_uuid",
+    )
+
+    def __init__(
+        self,
+        *,
+        dataset_name: typing.Optional[builtins.str] = None,
+        dataset_uuid: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a Flocker volume mounted by the Flocker agent.
+
+        One and only one of datasetName and datasetUUID should be set. Flocker volumes do not support ownership management or SELinux relabeling.
+
+        :param dataset_name: datasetName is Name of the dataset stored as metadata -> name on the dataset for Flocker should be considered as deprecated.
+        :param dataset_uuid: datasetUUID is the UUID of the dataset. This is unique identifier of a Flocker dataset
+
+        :schema: io.k8s.api.core.v1.FlockerVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c8da19b7f0ffd9cf70dddb6e7c6984f3d78d5aa2c70fad98b528bc4aded8a549)
+            check_type(argname="argument dataset_name", value=dataset_name, expected_type=type_hints["dataset_name"])
+            check_type(argname="argument dataset_uuid", value=dataset_uuid, expected_type=type_hints["dataset_uuid"])
+        self._value_dataset_name = dataset_name
+        self._value_dataset_uuid = dataset_uuid
+
+    @builtins.property
+    def dataset_name(self) -> typing.Optional[builtins.str]:
+        '''datasetName is Name of the dataset stored as metadata -> name on the dataset for Flocker should be considered as deprecated.
+
+        :schema: io.k8s.api.core.v1.FlockerVolumeSource#datasetName
+        '''
+        result = self._value_dataset_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def dataset_uuid(self) -> typing.Optional[builtins.str]:
+        '''datasetUUID is the UUID of the dataset.
+
+        This is unique identifier of a Flocker dataset
+
+        :schema: io.k8s.api.core.v1.FlockerVolumeSource#datasetUUID
+        '''
+        result = self._value_dataset_uuid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_dataset_name is not None:
+            values["dataset_name"] = self._value_dataset_name
+        if self._value_dataset_uuid is not None:
+            values["dataset_uuid"] = self._value_dataset_uuid
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "FlockerVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c8da19b7f0ffd9cf70dddb6e7c6984f3d78d5aa2c70fad98b528bc4aded8a549(
+    *,
+    dataset_name: typing.Optional[builtins.str] = None,
+    dataset_uuid: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,78 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.FlowDistinguisherMethodV1Beta2",
+    jsii_struct_bases=[],
+    name_mapping={"type": "type"},
+)
+class FlowDistinguisherMethodV1Beta2(_base.Struct):
+    __slots__ = (
+        "_value_type",
+    )
+
+    def __init__(self, *, type: builtins.str) -> None:
+        '''FlowDistinguisherMethod specifies the method of a flow distinguisher.
+
+        :param type: ``type`` is the type of flow distinguisher method The supported types are "ByUser" and "ByNamespace". Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.FlowDistinguisherMethod
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__f097bb4fbe672878a09ccbc6c996fba34cd3cbbd412e738d7df0e2c5790f6b10)
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+        self._value_type = type
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''``type`` is the type of flow distinguisher method The supported types are "ByUser" and "ByNamespace".
+
+        Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.FlowDistinguisherMethod#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "type": self._value_type,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "FlowDistinguisherMethodV1Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__f097bb4fbe672878a09ccbc6c996fba34cd3cbbd412e738d7df0e2c5790f6b10(
+    *,
+    type: builtins.str,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,153 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .FlowDistinguisherMethodV1Beta2 import FlowDistinguisherMethodV1Beta2
+from .PolicyRulesWithSubjectsV1Beta2 import PolicyRulesWithSubjectsV1Beta2
+from .PriorityLevelConfigurationReferenceV1Beta2 import PriorityLevelConfigurationReferenceV1Beta2
+
+
+@jsii.data_type(
+    jsii_type="k8s.FlowSchemaSpecV1Beta2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "priority_level_configuration": "priorityLevelConfiguration",
+        "distinguisher_method": "distinguisherMethod",
+        "matching_precedence": "matchingPrecedence",
+        "rules": "rules",
+    },
+)
+class FlowSchemaSpecV1Beta2(_base.Struct):
+    __slots__ = (
+        "_value_priority_level_configuration",
+        "_value_distinguisher_method",
+        "_value_matching_precedence",
+        "_value_rules",
+    )
+
+    def __init__(
+        self,
+        *,
+        priority_level_configuration: typing.Union["PriorityLevelConfigurationReferenceV1Beta2", typing.Dict[builtins.str, typing.Any]],
+        distinguisher_method: typing.Optional[typing.Union[FlowDistinguisherMethodV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+        matching_precedence: typing.Optional[jsii.Number] = None,
+        rules: typing.Optional[typing.Sequence[typing.Union["PolicyRulesWithSubjectsV1Beta2", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''FlowSchemaSpec describes how the FlowSchema's specification looks like.
+
+        :param priority_level_configuration: ``priorityLevelConfiguration`` should reference a PriorityLevelConfiguration in the cluster. If the reference cannot be resolved, the FlowSchema will be ignored and marked as invalid in its status. Required.
+        :param distinguisher_method: ``distinguisherMethod`` defines how to compute the flow distinguisher for requests that match this schema. ``nil`` specifies that the distinguisher is disabled and thus will always be the empty string.
+        :param matching_precedence: ``matchingPrecedence`` is used to choose among the FlowSchemas that match a given request. The chosen FlowSchema is among those with the numerically lowest (which we take to be logically highest) MatchingPrecedence. Each MatchingPrecedence value must be ranged in [1,10000]. Note that if the precedence is not specified, it will be set to 1000 as default.
+        :param rules: ``rules`` describes which requests will match this flow schema. This FlowSchema matches a request if and only if at least one member of rules matches the request. if it is an empty slice, there will be no requests matching the FlowSchema.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.FlowSchemaSpec
+        '''
+        if isinstance(priority_level_configuration, dict):
+            priority_level_configuration = PriorityLevelConfigurationReferenceV1Beta2(**priority_level_configuration)
+        if isinstance(distinguisher_method, dict):
+            distinguisher_method = FlowDistinguisherMethodV1Beta2(**distinguisher_method)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__95a7a4e1d128cef7bb866d233e06c9bb0da818b45bcd627a65d99a570d28c5b7)
+            check_type(argname="argument priority_level_configuration", value=priority_level_configuration, expected_type=type_hints["priority_level_configuration"])
+            check_type(argname="argument distinguisher_method", value=distinguisher_method, expected_type=type_hints["distinguisher_method"])
+            check_type(argname="argument matching_precedence", value=matching_precedence, expected_type=type_hints["matching_precedence"])
+            check_type(argname="argument rules", value=rules, expected_type=type_hints["rules"])
+        self._value_priority_level_configuration = priority_level_configuration
+        self._value_distinguisher_method = distinguisher_method
+        self._value_matching_precedence = matching_precedence
+        self._value_rules = rules
+
+    @builtins.property
+    def priority_level_configuration(
+        self,
+    ) -> "PriorityLevelConfigurationReferenceV1Beta2":
+        '''``priorityLevelConfiguration`` should reference a PriorityLevelConfiguration in the cluster.
+
+        If the reference cannot be resolved, the FlowSchema will be ignored and marked as invalid in its status. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.FlowSchemaSpec#priorityLevelConfiguration
+        '''
+        result = self._value_priority_level_configuration
+        assert result is not None, "Required property 'priority_level_configuration' is missing"
+        return typing.cast("PriorityLevelConfigurationReferenceV1Beta2", result)
+
+    @builtins.property
+    def distinguisher_method(self) -> typing.Optional[FlowDistinguisherMethodV1Beta2]:
+        '''``distinguisherMethod`` defines how to compute the flow distinguisher for requests that match this schema.
+
+        ``nil`` specifies that the distinguisher is disabled and thus will always be the empty string.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.FlowSchemaSpec#distinguisherMethod
+        '''
+        result = self._value_distinguisher_method
+        return typing.cast(typing.Optional[FlowDistinguisherMethodV1Beta2], result)
+
+    @builtins.property
+    def matching_precedence(self) -> typing.Optional[jsii.Number]:
+        '''``matchingPrecedence`` is used to choose among the FlowSchemas that match a given request.
+
+        The chosen FlowSchema is among those with the numerically lowest (which we take to be logically highest) MatchingPrecedence.  Each MatchingPrecedence value must be ranged in [1,10000]. Note that if the precedence is not specified, it will be set to 1000 as default.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.FlowSchemaSpec#matchingPrecedence
+        '''
+        result = self._value_matching_precedence
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def rules(self) -> typing.Optional[typing.List["PolicyRulesWithSubjectsV1Beta2"]]:
+        '''``rules`` describes which requests will match this flow schema.
+
+        This FlowSchema matches a request if and only if at least one member of rules matches the request. if it is an empty slice, there will be no requests matching the FlowSchema.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.FlowSchemaSpec#rules
+        '''
+        result = self._value_rules
+        return typing.cast(typing.Optional[typing.List["PolicyRulesWithSubjectsV1Beta2"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "priority_level_configuration": self._value_priority_level_configuration,
+        }
+        if self._value_distinguisher_method is not None:
+            values["distinguisher_method"] = self._value_distinguisher_method
+        if self._value_matching_precedence is not None:
+            values["matching_precedence"] = self._value_matching_precedence
+        if self._value_rules is not None:
+            values["rules"] = self._value_rules
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "FlowSchemaSpecV1Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__95a7a4e1d128cef7bb866d233e06c9bb0da818b45bcd627a65d99a570d28c5b7(
+    *,
+    priority_level_configuration: typing.Union[PriorityLevelConfigurationReferenceV1Beta2, typing.Dict[builtins.str, typing.Any]],
+    distinguisher_method: typing.Optional[typing.Union[FlowDistinguisherMethodV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+    matching_precedence: typing.Optional[jsii.Number] = None,
+    rules: typing.Optional[typing.Sequence[typing.Union[PolicyRulesWithSubjectsV1Beta2, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
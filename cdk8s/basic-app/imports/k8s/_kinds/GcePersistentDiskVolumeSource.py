@@ -0,0 +1,148 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.GcePersistentDiskVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "pd_name": "pdName",
+        "fs_type": "fsType",
+        "partition": "partition",
+        "read_only": "readOnly",
+    },
+)
+class GcePersistentDiskVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_pd_name",
+        "_value_fs_type",
+        "_value_partition",
+        "_value_read_only",
+    )
+
+    def __init__(
+        self,
+        *,
+        pd_name: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+        partition: typing.Optional[jsii.Number] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''Represents a Persistent Disk resource in Google Compute Engine.
+
+        A GCE PD must exist before mounting to a container. The disk must also be in the same GCE project and zone as the kubelet. A GCE PD can only be mounted as read/write once or read-only many times. GCE PDs support ownership management and SELinux relabeling.
+
+        :param pd_name: pdName is unique name of the PD resource in GCE. Used to identify the disk in GCE. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+        :param fs_type: fsType is filesystem type of the volume that you want to mount. Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+        :param partition: partition is the partition in the volume that you want to mount. If omitted, the default is to mount by volume name. Examples: For volume /dev/sda1, you specify the partition as "1". Similarly, the volume partition for /dev/sda is "0" (or you can leave the property empty). More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+        :param read_only: readOnly here will force the ReadOnly setting in VolumeMounts. Defaults to false. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk Default: false. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+
+        :schema: io.k8s.api.core.v1.GCEPersistentDiskVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__67fa0238ae227faa5913c9a406cb8c1df336aa99b59c22be5e9022157eef8101)
+            check_type(argname="argument pd_name", value=pd_name, expected_type=type_hints["pd_name"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument partition", value=partition, expected_type=type_hints["partition"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+        self._value_pd_name = pd_name
+        self._value_fs_type = fs_type
+        self._value_partition = partition
+        self._value_read_only = read_only
+
+    @builtins.property
+    def pd_name(self) -> builtins.str:
+        '''pdName is unique name of the PD resource in GCE.
+
+        Used to identify the disk in GCE. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+
+        :schema: io.k8s.api.core.v1.GCEPersistentDiskVolumeSource#pdName
+        '''
+        result = self._value_pd_name
+        assert result is not None, "Required property 'pd_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is filesystem type of the volume that you want to mount.
+
+        Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+
+        :schema: io.k8s.api.core.v1.GCEPersistentDiskVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def partition(self) -> typing.Optional[jsii.Number]:
+        '''partition is the partition in the volume that you want to mount.
+
+        If omitted, the default is to mount by volume name. Examples: For volume /dev/sda1, you specify the partition as "1". Similarly, the volume partition for /dev/sda is "0" (or you can leave the property empty). More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+
+        :schema: io.k8s.api.core.v1.GCEPersistentDiskVolumeSource#partition
+        '''
+        result = self._value_partition
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly here will force the ReadOnly setting in VolumeMounts.
+
+        Defaults to false. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+
+        :default: false. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+
+        :schema: io.k8s.api.core.v1.GCEPersistentDiskVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "pd_name": self._value_pd_name,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_partition is not None:
+            values["partition"] = self._value_partition
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "GcePersistentDiskVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__67fa0238ae227faa5913c9a406cb8c1df336aa99b59c22be5e9022157eef8101(
+    *,
+    pd_name: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+    partition: typing.Optional[jsii.Number] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
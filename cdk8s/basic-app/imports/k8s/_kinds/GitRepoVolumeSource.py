@@ -0,0 +1,124 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.GitRepoVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "repository": "repository",
+        "directory": "directory",
+        "revision": "revision",
+    },
+)
+class GitRepoVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_repository",
+        "_value_directory",
+        "_value_revision",
+    )
+
+    def __init__(
+        self,
+        *,
+        repository: builtins.str,
+        directory: typing.Optional[builtins.str] = None,
+        revision: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a volume that is populated with the contents of a git repository.
+
+        Git repo volumes do not support ownership management. Git repo volumes support SELinux relabeling.
+
+        DEPRECATED: GitRepo is deprecated. To provision a container with a git repo, mount an EmptyDir into an InitContainer that clones the repo using git, then mount the EmptyDir into the Pod's container.
+
+        :param repository: repository is the URL.
+        :param directory: directory is the target directory name. Must not contain or start with '..'. If '.' is supplied, the volume directory will be the git repository. Otherwise, if specified, the volume will contain the git repository in the subdirectory with the given name.
+        :param revision: revision is the commit hash for the specified revision.
+
+        :schema: io.k8s.api.core.v1.GitRepoVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__d3929ab9177d349a3cbc08144a071eb034b82c6d036e2f32c383d99193bfa2fc)
+            check_type(argname="argument repository", value=repository, expected_type=type_hints["repository"])
+            check_type(argname="argument directory", value=directory, expected_type=type_hints["directory"])
+            check_type(argname="argument revision", value=revision, expected_type=type_hints["revision"])
+        self._value_repository = repository
+        self._value_directory = directory
+        self._value_revision = revision
+
+    @builtins.property
+    def repository(self) -> builtins.str:
+        '''repository is the URL.
+
+        :schema: io.k8s.api.core.v1.GitRepoVolumeSource#repository
+        '''
+        result = self._value_repository
+        assert result is not None, "Required property 'repository' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def directory(self) -> typing.Optional[builtins.str]:
+        '''directory is the target directory name.
+
+        Must not contain or start with '..'.  If '.' is supplied, the volume directory will be the git repository.  Otherwise, if specified, the volume will contain the git repository in the subdirectory with the given name.
+
+        :schema: io.k8s.api.core.v1.GitRepoVolumeSource#directory
+        '''
+        result = self._value_directory
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def revision(self) -> typing.Optional[builtins.str]:
+        '''revision is the commit hash for the specified revision.
+
+        :schema: io.k8s.api.core.v1.GitRepoVolumeSource#revision
+        '''
+        result = self._value_revision
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "repository": self._value_repository,
+        }
+        if self._value_directory is not None:
+            values["directory"] = self._value_directory
+        if self._value_revision is not None:
+            values["revision"] = self._value_revision
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "GitRepoVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__d3929ab9177d349a3cbc08144a071eb034b82c6d036e2f32c383d99193bfa2fc(
+    *,
+    repository: builtins.str,
+    directory: typing.Optional[builtins.str] = None,
+    revision: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
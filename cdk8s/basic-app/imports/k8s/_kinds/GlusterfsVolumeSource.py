@@ -0,0 +1,124 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.GlusterfsVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"endpoints": "endpoints", "path": "path", "read_only": "readOnly"},
+)
+class GlusterfsVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_endpoints",
+        "_value_path",
+        "_value_read_only",
+    )
+
+    def __init__(
+        self,
+        *,
+        endpoints: builtins.str,
+        path: builtins.str,
+        read_only: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''Represents a Glusterfs mount that lasts the lifetime of a pod.
+
+        Glusterfs volumes do not support ownership management or SELinux relabeling.
+
+        :param endpoints: endpoints is the endpoint name that details Glusterfs topology. More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod
+        :param path: path is the Glusterfs volume path. More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod
+        :param read_only: readOnly here will force the Glusterfs volume to be mounted with read-only permissions. Defaults to false. More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod Default: false. More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod
+
+        :schema: io.k8s.api.core.v1.GlusterfsVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ee9a1041172608f39bf295d6750ada62e4ab7bf9812fabbb918c35d5ff339178)
+            check_type(argname="argument endpoints", value=endpoints, expected_type=type_hints["endpoints"])
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+        self._value_endpoints = endpoints
+        self._value_path = path
+        self._value_read_only = read_only
+
+    @builtins.property
+    def endpoints(self) -> builtins.str:
+        '''endpoints is the endpoint name that details Glusterfs topology.
+
+        More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod
+
+        :schema: io.k8s.api.core.v1.GlusterfsVolumeSource#endpoints
+        '''
+        result = self._value_endpoints
+        assert result is not None, "Required property 'endpoints' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def path(self) -> builtins.str:
+        '''path is the Glusterfs volume path.
+
+        More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod
+
+        :schema: io.k8s.api.core.v1.GlusterfsVolumeSource#path
+        '''
+        result = self._value_path
+        assert result is not None, "Required property 'path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly here will force the Glusterfs volume to be mounted with read-only permissions.
+
+        Defaults to false. More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod
+
+        :default: false. More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod
+
+        :schema: io.k8s.api.core.v1.GlusterfsVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "endpoints": self._value_endpoints,
+            "path": self._value_path,
+        }
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "GlusterfsVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ee9a1041172608f39bf295d6750ada62e4ab7bf9812fabbb918c35d5ff339178(
+    *,
+    endpoints: builtins.str,
+    path: builtins.str,
+    read_only: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
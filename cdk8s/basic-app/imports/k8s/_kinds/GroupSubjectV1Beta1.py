@@ -0,0 +1,78 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.GroupSubjectV1Beta1",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name"},
+)
+class GroupSubjectV1Beta1(_base.Struct):
+    __slots__ = (
+        "_value_name",
+    )
+
+    def __init__(self, *, name: builtins.str) -> None:
+        '''GroupSubject holds detailed information for group-kind subject.
+
+        :param name: name is the user group that matches, or "*" to match all user groups. See https://github.com/kubernetes/apiserver/blob/master/pkg/authentication/user/user.go for some well-known group names. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.GroupSubject
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__e92765ab399fe3122755f1d74d66158908c107381fd38f1d72e54731d41699fd)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+        self._value_name = name
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''name is the user group that matches, or "*" to match all user groups.
+
+        See https://github.com/kubernetes/apiserver/blob/master/pkg/authentication/user/user.go for some well-known group names. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.GroupSubject#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "GroupSubjectV1Beta1(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__e92765ab399fe3122755f1d74d66158908c107381fd38f1d72e54731d41699fd(
+    *,
+    name: builtins.str,
+) -> None:
+    """Type checking stubs"""
+    pass
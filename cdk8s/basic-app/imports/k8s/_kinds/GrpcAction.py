@@ -0,0 +1,100 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.GrpcAction",
+    jsii_struct_bases=[],
+    name_mapping={"port": "port", "service": "service"},
+)
+class GrpcAction(_base.Struct):
+    __slots__ = (
+        "_value_port",
+        "_value_service",
+    )
+
+    def __init__(
+        self,
+        *,
+        port: jsii.Number,
+        service: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''
+        :param port: Port number of the gRPC service. Number must be in the range 1 to 65535.
+        :param service: Service is the name of the service to place in the gRPC HealthCheckRequest (see https://github.com/grpc/grpc/blob/master/doc/health-checking.md). If this is not specified, the default behavior is defined by gRPC.
+
+        :schema: io.k8s.api.core.v1.GRPCAction
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__a4c720717a12c121388433640f65c648a1215ba44d394b015fa52bde58de178d)
+            check_type(argname="argument port", value=port, expected_type=type_hints["port"])
+            check_type(argname="argument service", value=service, expected_type=type_hints["service"])
+        self._value_port = port
+        self._value_service = service
+
+    @builtins.property
+    def port(self) -> jsii.Number:
+        '''Port number of the gRPC service.
+
+        Number must be in the range 1 to 65535.
+
+        :schema: io.k8s.api.core.v1.GRPCAction#port
+        '''
+        result = self._value_port
+        assert result is not None, "Required property 'port' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def service(self) -> typing.Optional[builtins.str]:
+        '''Service is the name of the service to place in the gRPC HealthCheckRequest (see https://github.com/grpc/grpc/blob/master/doc/health-checking.md).
+
+        If this is not specified, the default behavior is defined by gRPC.
+
+        :schema: io.k8s.api.core.v1.GRPCAction#service
+        '''
+        result = self._value_service
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "port": self._value_port,
+        }
+        if self._value_service is not None:
+            values["service"] = self._value_service
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "GrpcAction(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__a4c720717a12c121388433640f65c648a1215ba44d394b015fa52bde58de178d(
+    *,
+    port: jsii.Number,
+    service: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
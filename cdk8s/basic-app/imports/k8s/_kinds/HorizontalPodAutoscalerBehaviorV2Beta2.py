@@ -0,0 +1,109 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .HpaScalingRulesV2Beta2 import HpaScalingRulesV2Beta2
+
+
+@jsii.data_type(
+    jsii_type="k8s.HorizontalPodAutoscalerBehaviorV2Beta2",
+    jsii_struct_bases=[],
+    name_mapping={"scale_down": "scaleDown", "scale_up": "scaleUp"},
+)
+class HorizontalPodAutoscalerBehaviorV2Beta2(_base.Struct):
+    __slots__ = (
+        "_value_scale_down",
+        "_value_scale_up",
+    )
+
+    def __init__(
+        self,
+        *,
+        scale_down: typing.Optional[typing.Union["HpaScalingRulesV2Beta2", typing.Dict[builtins.str, typing.Any]]] = None,
+        scale_up: typing.Optional[typing.Union["HpaScalingRulesV2Beta2", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''HorizontalPodAutoscalerBehavior configures the scaling behavior of the target in both Up and Down directions (scaleUp and scaleDown fields respectively).
+
+        :param scale_down: scaleDown is scaling policy for scaling Down. If not set, the default value is to allow to scale down to minReplicas pods, with a 300 second stabilization window (i.e., the highest recommendation for the last 300sec is used).
+        :param scale_up: scaleUp is scaling policy for scaling Up. If not set, the default value is the higher of: - increase no more than 4 pods per 60 seconds - double the number of pods per 60 seconds No stabilization is used.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.HorizontalPodAutoscalerBehavior
+        '''
+        if isinstance(scale_down, dict):
+            scale_down = HpaScalingRulesV2Beta2(**scale_down)
+        if isinstance(scale_up, dict):
+            scale_up = HpaScalingRulesV2Beta2(**scale_up)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__bf4f9cb7b66a8c55f24e47bf9de8c9cbb33ce5e7db80786dbd9eb59d1cba90f3)
+            check_type(argname="argument scale_down", value=scale_down, expected_type=type_hints["scale_down"])
+            check_type(argname="argument scale_up", value=scale_up, expected_type=type_hints["scale_up"])
+        self._value_scale_down = scale_down
+        self._value_scale_up = scale_up
+
+    @builtins.property
+    def scale_down(self) -> typing.Optional["HpaScalingRulesV2Beta2"]:
+        '''scaleDown is scaling policy for scaling Down.
+
+        If not set, the default value is to allow to scale down to minReplicas pods, with a 300 second stabilization window (i.e., the highest recommendation for the last 300sec is used).
+
+        :schema: io.k8s.api.autoscaling.v2beta2.HorizontalPodAutoscalerBehavior#scaleDown
+        '''
+        result = self._value_scale_down
+        return typing.cast(typing.Optional["HpaScalingRulesV2Beta2"], result)
+
+    @builtins.property
+    def scale_up(self) -> typing.Optional["HpaScalingRulesV2Beta2"]:
+        '''scaleUp is scaling policy for scaling Up.
+
+        If not set, the default value is the higher of:
+
+        - increase no more than 4 pods per 60 seconds
+        - double the number of pods per 60 seconds
+          No stabilization is used.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.HorizontalPodAutoscalerBehavior#scaleUp
+        '''
+        result = self._value_scale_up
+        return typing.cast(typing.Optional["HpaScalingRulesV2Beta2"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_scale_down is not None:
+            values["scale_down"] = self._value_scale_down
+        if self._value_scale_up is not None:
+            values["scale_up"] = self._value_scale_up
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HorizontalPodAutoscalerBehaviorV2Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__bf4f9cb7b66a8c55f24e47bf9de8c9cbb33ce5e7db80786dbd9eb59d1cba90f3(
+    *,
+    scale_down: typing.Optional[typing.Union[HpaScalingRulesV2Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+    scale_up: typing.Optional[typing.Union[HpaScalingRulesV2Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,147 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .CrossVersionObjectReference import CrossVersionObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.HorizontalPodAutoscalerSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "max_replicas": "maxReplicas",
+        "scale_target_ref": "scaleTargetRef",
+        "min_replicas": "minReplicas",
+        "target_cpu_utilization_percentage": "targetCpuUtilizationPercentage",
+    },
+)
+class HorizontalPodAutoscalerSpec(_base.Struct):
+    __slots__ = (
+        "_value_max_replicas",
+        "_value_scale_target_ref",
+        "_value_min_replicas",
+        "_value_target_cpu_utilization_percentage",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_replicas: jsii.Number,
+        scale_target_ref: typing.Union[CrossVersionObjectReference, typing.Dict[builtins.str, typing.Any]],
+        min_replicas: typing.Optional[jsii.Number] = None,
+        target_cpu_utilization_percentage: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''specification of a horizontal pod autoscaler.
+
+        :param max_replicas: upper limit for the number of pods that can be set by the autoscaler; cannot be smaller than MinReplicas.
+        :param scale_target_ref: reference to scaled resource; horizontal pod autoscaler will learn the current resource consumption and will set the desired number of pods by using its Scale subresource.
+        :param min_replicas: minReplicas is the lower limit for the number of replicas to which the autoscaler can scale down. It defaults to 1 pod. minReplicas is allowed to be 0 if the alpha feature gate HPAScaleToZero is enabled and at least one Object or External metric is configured. Scaling is active as long as at least one metric value is available.
+        :param target_cpu_utilization_percentage: target average CPU utilization (represented as a percentage of requested CPU) over all the pods; if not specified the default autoscaling policy will be used.
+
+        :schema: io.k8s.api.autoscaling.v1.HorizontalPodAutoscalerSpec
+        '''
+        if isinstance(scale_target_ref, dict):
+            scale_target_ref = CrossVersionObjectReference(**scale_target_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__67e90701cb6e8283c6dcdce1a9bcefa03010668cc5c0dc412f36e77d3b94c2c6)
+            check_type(argname="argument max_replicas", value=max_replicas, expected_type=type_hints["max_replicas"])
+            check_type(argname="argument scale_target_ref", value=scale_target_ref, expected_type=type_hints["scale_target_ref"])
+            check_type(argname="argument min_replicas", value=min_replicas, expected_type=type_hints["min_replicas"])
+            check_type(argname="argument target_cpu_utilization_percentage", value=target_cpu_utilization_percentage, expected_type=type_hints["target_cpu_utilization_percentage"])
+        self._value_max_replicas = max_replicas
+        self._value_scale_target_ref = scale_target_ref
+        self._value_min_replicas = min_replicas
+        self._value_target_cpu_utilization_percentage = target_cpu_utilization_percentage
+
+    @builtins.property
+    def max_replicas(self) -> jsii.Number:
+        '''upper limit for the number of pods that can be set by the autoscaler;
+
+        cannot be smaller than MinReplicas.
+
+        :schema: io.k8s.api.autoscaling.v1.HorizontalPodAutoscalerSpec#maxReplicas
+        '''
+        result = self._value_max_replicas
+        assert result is not None, "Required property 'max_replicas' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def scale_target_ref(self) -> CrossVersionObjectReference:
+        '''reference to scaled resource;
+
+        horizontal pod autoscaler will learn the current resource consumption and will set the desired number of pods by using its Scale subresource.
+
+        :schema: io.k8s.api.autoscaling.v1.HorizontalPodAutoscalerSpec#scaleTargetRef
+        '''
+        result = self._value_scale_target_ref
+        assert result is not None, "Required property 'scale_target_ref' is missing"
+        return typing.cast(CrossVersionObjectReference, result)
+
+    @builtins.property
+    def min_replicas(self) -> typing.Optional[jsii.Number]:
+        '''minReplicas is the lower limit for the number of replicas to which the autoscaler can scale down.
+
+        It defaults to 1 pod.  minReplicas is allowed to be 0 if the alpha feature gate HPAScaleToZero is enabled and at least one Object or External metric is configured.  Scaling is active as long as at least one metric value is available.
+
+        :schema: io.k8s.api.autoscaling.v1.HorizontalPodAutoscalerSpec#minReplicas
+        '''
+        result = self._value_min_replicas
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def target_cpu_utilization_percentage(self) -> typing.Optional[jsii.Number]:
+        '''target average CPU utilization (represented as a percentage of requested CPU) over all the pods;
+
+        if not specified the default autoscaling policy will be used.
+
+        :schema: io.k8s.api.autoscaling.v1.HorizontalPodAutoscalerSpec#targetCPUUtilizationPercentage
+        '''
+        result = self._value_target_cpu_utilization_percentage
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "max_replicas": self._value_max_replicas,
+            "scale_target_ref": self._value_scale_target_ref,
+        }
+        if self._value_min_replicas is not None:
+            values["min_replicas"] = self._value_min_replicas
+        if self._value_target_cpu_utilization_percentage is not None:
+            values["target_cpu_utilization_percentage"] = self._value_target_cpu_utilization_percentage
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HorizontalPodAutoscalerSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__67e90701cb6e8283c6dcdce1a9bcefa03010668cc5c0dc412f36e77d3b94c2c6(
+    *,
+    max_replicas: jsii.Number,
+    scale_target_ref: typing.Union[CrossVersionObjectReference, typing.Dict[builtins.str, typing.Any]],
+    min_replicas: typing.Optional[jsii.Number] = None,
+    target_cpu_utilization_percentage: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
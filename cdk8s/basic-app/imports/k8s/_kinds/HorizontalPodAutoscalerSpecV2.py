@@ -0,0 +1,169 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .CrossVersionObjectReferenceV2 import CrossVersionObjectReferenceV2
+from .HorizontalPodAutoscalerBehaviorV2 import HorizontalPodAutoscalerBehaviorV2
+from .MetricSpecV2 import MetricSpecV2
+
+
+@jsii.data_type(
+    jsii_type="k8s.HorizontalPodAutoscalerSpecV2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "max_replicas": "maxReplicas",
+        "scale_target_ref": "scaleTargetRef",
+        "behavior": "behavior",
+        "metrics": "metrics",
+        "min_replicas": "minReplicas",
+    },
+)
+class HorizontalPodAutoscalerSpecV2(_base.Struct):
+    __slots__ = (
+        "_value_max_replicas",
+        "_value_scale_target_ref",
+        "_value_behavior",
+        "_value_metrics",
+        "_value_min_replicas",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_replicas: jsii.Number,
+        scale_target_ref: typing.Union[CrossVersionObjectReferenceV2, typing.Dict[builtins.str, typing.Any]],
+        behavior: typing.Optional[typing.Union[HorizontalPodAutoscalerBehaviorV2, typing.Dict[builtins.str, typing.Any]]] = None,
+        metrics: typing.Optional[typing.Sequence[typing.Union["MetricSpecV2", typing.Dict[builtins.str, typing.Any]]]] = None,
+        min_replicas: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''HorizontalPodAutoscalerSpec describes the desired functionality of the HorizontalPodAutoscaler.
+
+        :param max_replicas: maxReplicas is the upper limit for the number of replicas to which the autoscaler can scale up. It cannot be less that minReplicas.
+        :param scale_target_ref: scaleTargetRef points to the target resource to scale, and is used to the pods for which metrics should be collected, as well as to actually change the replica count.
+        :param behavior: behavior configures the scaling behavior of the target in both Up and Down directions (scaleUp and scaleDown fields respectively). If not set, the default HPAScalingRules for scale up and scale down are used.
+        :param metrics: metrics contains the specifications for which to use to calculate the desired replica count (the maximum replica count across all metrics will be used). The desired replica count is calculated multiplying the ratio between the target value and the current value by the current number of pods. Ergo, metrics used must decrease as the pod count is increased, and vice-versa. See the individual metric source types for more information about how each type of metric must respond. If not set, the default metric will be set to 80% average CPU utilization.
+        :param min_replicas: minReplicas is the lower limit for the number of replicas to which the autoscaler can scale down. It defaults to 1 pod. minReplicas is allowed to be 0 if the alpha feature gate HPAScaleToZero is enabled and at least one Object or External metric is configured. Scaling is active as long as at least one metric value is available.
+
+        :schema: io.k8s.api.autoscaling.v2.HorizontalPodAutoscalerSpec
+        '''
+        if isinstance(scale_target_ref, dict):
+            scale_target_ref = CrossVersionObjectReferenceV2(**scale_target_ref)
+        if isinstance(behavior, dict):
+            behavior = HorizontalPodAutoscalerBehaviorV2(**behavior)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__a1323a69e978b64e93ef7f04e8455a1c9a9c3bb874ab3f67e7522bf7d2a07c64)
+            check_type(argname="argument max_replicas", value=max_replicas, expected_type=type_hints["max_replicas"])
+            check_type(argname="argument scale_target_ref", value=scale_target_ref, expected_type=type_hints["scale_target_ref"])
+            check_type(argname="argument behavior", value=behavior, expected_type=type_hints["behavior"])
+            check_type(argname="argument metrics", value=metrics, expected_type=type_hints["metrics"])
+            check_type(argname="argument min_replicas", value=min_replicas, expected_type=type_hints["min_replicas"])
+        self._value_max_replicas = max_replicas
+        self._value_scale_target_ref = scale_target_ref
+        self._value_behavior = behavior
+        self._value_metrics = metrics
+        self._value_min_replicas = min_replicas
+
+    @builtins.property
+    def max_replicas(self) -> jsii.Number:
+        '''maxReplicas is the upper limit for the number of replicas to which the autoscaler can scale up.
+
+        It cannot be less that minReplicas.
+
+        :schema: io.k8s.api.autoscaling.v2.HorizontalPodAutoscalerSpec#maxReplicas
+        '''
+        result = self._value_max_replicas
+        assert result is not None, "Required property 'max_replicas' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def scale_target_ref(self) -> CrossVersionObjectReferenceV2:
+        '''scaleTargetRef points to the target resource to scale, and is used to the pods for which metrics should be collected, as well as to actually change the replica count.
+
+        :schema: io.k8s.api.autoscaling.v2.HorizontalPodAutoscalerSpec#scaleTargetRef
+        '''
+        result = self._value_scale_target_ref
+        assert result is not None, "Required property 'scale_target_ref' is missing"
+        return typing.cast(CrossVersionObjectReferenceV2, result)
+
+    @builtins.property
+    def behavior(self) -> typing.Optional[HorizontalPodAutoscalerBehaviorV2]:
+        '''behavior configures the scaling behavior of the target in both Up and Down directions (scaleUp and scaleDown fields respectively).
+
+        If not set, the default HPAScalingRules for scale up and scale down are used.
+
+        :schema: io.k8s.api.autoscaling.v2.HorizontalPodAutoscalerSpec#behavior
+        '''
+        result = self._value_behavior
+        return typing.cast(typing.Optional[HorizontalPodAutoscalerBehaviorV2], result)
+
+    @builtins.property
+    def metrics(self) -> typing.Optional[typing.List["MetricSpecV2"]]:
+        '''metrics contains the specifications for which to use to calculate the desired replica count (the maximum replica count across all metrics will be used).
+
+        The desired replica count is calculated multiplying the ratio between the target value and the current value by the current number of pods.  Ergo, metrics used must decrease as the pod count is increased, and vice-versa.  See the individual metric source types for more information about how each type of metric must respond. If not set, the default metric will be set to 80% average CPU utilization.
+
+        :schema: io.k8s.api.autoscaling.v2.HorizontalPodAutoscalerSpec#metrics
+        '''
+        result = self._value_metrics
+        return typing.cast(typing.Optional[typing.List["MetricSpecV2"]], result)
+
+    @builtins.property
+    def min_replicas(self) -> typing.Optional[jsii.Number]:
+        '''minReplicas is the lower limit for the number of replicas to which the autoscaler can scale down.
+
+        It defaults to 1 pod.  minReplicas is allowed to be 0 if the alpha feature gate HPAScaleToZero is enabled and at least one Object or External metric is configured.  Scaling is active as long as at least one metric value is available.
+
+        :schema: io.k8s.api.autoscaling.v2.HorizontalPodAutoscalerSpec#minReplicas
+        '''
+        result = self._value_min_replicas
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "max_replicas": self._value_max_replicas,
+            "scale_target_ref": self._value_scale_target_ref,
+        }
+        if self._value_behavior is not None:
+            values["behavior"] = self._value_behavior
+        if self._value_metrics is not None:
+            values["metrics"] = self._value_metrics
+        if self._value_min_replicas is not None:
+            values["min_replicas"] = self._value_min_replicas
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HorizontalPodAutoscalerSpecV2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__a1323a69e978b64e93ef7f04e8455a1c9a9c3bb874ab3f67e7522bf7d2a07c64(
+    *,
+    max_replicas: jsii.Number,
+    scale_target_ref: typing.Union[CrossVersionObjectReferenceV2, typing.Dict[builtins.str, typing.Any]],
+    behavior: typing.Optional[typing.Union[HorizontalPodAutoscalerBehaviorV2, typing.Dict[builtins.str, typing.Any]]] = None,
+    metrics: typing.Optional[typing.Sequence[typing.Union[MetricSpecV2, typing.Dict[builtins.str, typing.Any]]]] = None,
+    min_replicas: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,96 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.HostAlias",
+    jsii_struct_bases=[],
+    name_mapping={"hostnames": "hostnames", "ip": "ip"},
+)
+class HostAlias(_base.Struct):
+    __slots__ = (
+        "_value_hostnames",
+        "_value_ip",
+    )
+
+    def __init__(
+        self,
+        *,
+        hostnames: typing.Optional[typing.Sequence[builtins.str]] = None,
+        ip: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''HostAlias holds the mapping between IP and hostnames that will be injected as an entry in the pod's hosts file.
+
+        :param hostnames: Hostnames for the above IP address.
+        :param ip: IP address of the host file entry.
+
+        :schema: io.k8s.api.core.v1.HostAlias
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__baf1f258035adb05fce6a499ac90c7c683c23515cb2387103291d65c150db057)
+            check_type(argname="argument hostnames", value=hostnames, expected_type=type_hints["hostnames"])
+            check_type(argname="argument ip", value=ip, expected_type=type_hints["ip"])
+        self._value_hostnames = hostnames
+        self._value_ip = ip
+
+    @builtins.property
+    def hostnames(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Hostnames for the above IP address.
+
+        :schema: io.k8s.api.core.v1.HostAlias#hostnames
+        '''
+        result = self._value_hostnames
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def ip(self) -> typing.Optional[builtins.str]:
+        '''IP address of the host file entry.
+
+        :schema: io.k8s.api.core.v1.HostAlias#ip
+        '''
+        result = self._value_ip
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_hostnames is not None:
+            values["hostnames"] = self._value_hostnames
+        if self._value_ip is not None:
+            values["ip"] = self._value_ip
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HostAlias(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__baf1f258035adb05fce6a499ac90c7c683c23515cb2387103291d65c150db057(
+    *,
+    hostnames: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ip: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.HostPathVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"path": "path", "type": "type"},
+)
+class HostPathVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_path",
+        "_value_type",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: builtins.str,
+        type: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a host path mapped into a pod.
+
+        Host path volumes do not support ownership management or SELinux relabeling.
+
+        :param path: path of the directory on the host. If the path is a symlink, it will follow the link to the real path. More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath
+        :param type: type for HostPath Volume Defaults to "" More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath. Default: More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath
+
+        :schema: io.k8s.api.core.v1.HostPathVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__6e89b87d54e04bd3a5ed5104bd9aeeebc90ed613bc0805a39560bc2bbf615e55)
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+        self._value_path = path
+        self._value_type = type
+
+    @builtins.property
+    def path(self) -> builtins.str:
+        '''path of the directory on the host.
+
+        If the path is a symlink, it will follow the link to the real path. More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath
+
+        :schema: io.k8s.api.core.v1.HostPathVolumeSource#path
+        '''
+        result = self._value_path
+        assert result is not None, "Required property 'path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def type(self) -> typing.Optional[builtins.str]:
+        '''type for HostPath Volume Defaults to "" More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath.
+
+        :default: More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath
+
+        :schema: io.k8s.api.core.v1.HostPathVolumeSource#type
+        '''
+        result = self._value_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "path": self._value_path,
+        }
+        if self._value_type is not None:
+            values["type"] = self._value_type
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HostPathVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__6e89b87d54e04bd3a5ed5104bd9aeeebc90ed613bc0805a39560bc2bbf615e55(
+    *,
+    path: builtins.str,
+    type: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,118 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.HpaScalingPolicyV2",
+    jsii_struct_bases=[],
+    name_mapping={"period_seconds": "periodSeconds", "type": "type", "value": "value"},
+)
+class HpaScalingPolicyV2(_base.Struct):
+    __slots__ = (
+        "_value_period_seconds",
+        "_value_type",
+        "_value_value",
+    )
+
+    def __init__(
+        self,
+        *,
+        period_seconds: jsii.Number,
+        type: builtins.str,
+        value: jsii.Number,
+    ) -> None:
+        '''HPAScalingPolicy is a single policy which must hold true for a specified past interval.
+
+        :param period_seconds: PeriodSeconds specifies the window of time for which the policy should hold true. PeriodSeconds must be greater than zero and less than or equal to 1800 (30 min).
+        :param type: Type is used to specify the scaling policy.
+        :param value: Value contains the amount of change which is permitted by the policy. It must be greater than zero
+
+        :schema: io.k8s.api.autoscaling.v2.HPAScalingPolicy
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__aeb589a0fa4d0cc40251749153c9f79afe4dfc58697049ab09f63ee4925eb96d)
+            check_type(argname="argument period_seconds", value=period_seconds, expected_type=type_hints["period_seconds"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument value", value=value, expected_type=type_hints["value"])
+        self._value_period_seconds = period_seconds
+        self._value_type = type
+        self._value_value = value
+
+    @builtins.property
+    def period_seconds(self) -> jsii.Number:
+        '''PeriodSeconds specifies the window of time for which the policy should hold true.
+
+        PeriodSeconds must be greater than zero and less than or equal to 1800 (30 min).
+
+        :schema: io.k8s.api.autoscaling.v2.HPAScalingPolicy#periodSeconds
+        '''
+        result = self._value_period_seconds
+        assert result is not None, "Required property 'period_seconds' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''Type is used to specify the scaling policy.
+
+        :schema: io.k8s.api.autoscaling.v2.HPAScalingPolicy#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def value(self) -> jsii.Number:
+        '''Value contains the amount of change which is permitted by the policy.
+
+        It must be greater than zero
+
+        :schema: io.k8s.api.autoscaling.v2.HPAScalingPolicy#value
+        '''
+        result = self._value_value
+        assert result is not None, "Required property 'value' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "period_seconds": self._value_period_seconds,
+            "type": self._value_type,
+            "value": self._value_value,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HpaScalingPolicyV2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__aeb589a0fa4d0cc40251749153c9f79afe4dfc58697049ab09f63ee4925eb96d(
+    *,
+    period_seconds: jsii.Number,
+    type: builtins.str,
+    value: jsii.Number,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,126 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .HpaScalingPolicyV2Beta2 import HpaScalingPolicyV2Beta2
+
+
+@jsii.data_type(
+    jsii_type="k8s.HpaScalingRulesV2Beta2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "policies": "policies",
+        "select_policy": "selectPolicy",
+        "stabilization_window_seconds": "stabilizationWindowSeconds",
+    },
+)
+class HpaScalingRulesV2Beta2(_base.Struct):
+    __slots__ = (
+        "_value_policies",
+        "_value_select_policy",
+        "_value_stabilization_window_seconds",
+    )
+
+    def __init__(
+        self,
+        *,
+        policies: typing.Optional[typing.Sequence[typing.Union[HpaScalingPolicyV2Beta2, typing.Dict[builtins.str, typing.Any]]]] = None,
+        select_policy: typing.Optional[builtins.str] = None,
+        stabilization_window_seconds: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''HPAScalingRules configures the scaling behavior for one direction.
+
+        These Rules are applied after calculating DesiredReplicas from metrics for the HPA. They can limit the scaling velocity by specifying scaling policies. They can prevent flapping by specifying the stabilization window, so that the number of replicas is not set instantly, instead, the safest value from the stabilization window is chosen.
+
+        :param policies: policies is a list of potential scaling polices which can be used during scaling. At least one policy must be specified, otherwise the HPAScalingRules will be discarded as invalid
+        :param select_policy: selectPolicy is used to specify which policy should be used. If not set, the default value MaxPolicySelect is used.
+        :param stabilization_window_seconds: StabilizationWindowSeconds is the number of seconds for which past recommendations should be considered while scaling up or scaling down. StabilizationWindowSeconds must be greater than or equal to zero and less than or equal to 3600 (one hour). If not set, use the default values: - For scale up: 0 (i.e. no stabilization is done). - For scale down: 300 (i.e. the stabilization window is 300 seconds long).
+
+        :schema: io.k8s.api.autoscaling.v2beta2.HPAScalingRules
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__19cec94ecc00bf7bf6cfc17c6f5b098af65a2cd7a1a04a7a1f983629b3244999)
+            check_type(argname="argument policies", value=policies, expected_type=type_hints["policies"])
+            check_type(argname="argument select_policy", value=select_policy, expected_type=type_hints["select_policy"])
+            check_type(argname="argument stabilization_window_seconds", value=stabilization_window_seconds, expected_type=type_hints["stabilization_window_seconds"])
+        self._value_policies = policies
+        self._value_select_policy = select_policy
+        self._value_stabilization_window_seconds = stabilization_window_seconds
+
+    @builtins.property
+    def policies(self) -> typing.Optional[typing.List[HpaScalingPolicyV2Beta2]]:
+        '''policies is a list of potential scaling polices which can be used during scaling.
+
+        At least one policy must be specified, otherwise the HPAScalingRules will be discarded as invalid
+
+        :schema: io.k8s.api.autoscaling.v2beta2.HPAScalingRules#policies
+        '''
+        result = self._value_policies
+        return typing.cast(typing.Optional[typing.List[HpaScalingPolicyV2Beta2]], result)
+
+    @builtins.property
+    def select_policy(self) -> typing.Optional[builtins.str]:
+        '''selectPolicy is used to specify which policy should be used.
+
+        If not set, the default value MaxPolicySelect is used.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.HPAScalingRules#selectPolicy
+        '''
+        result = self._value_select_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def stabilization_window_seconds(self) -> typing.Optional[jsii.Number]:
+        '''StabilizationWindowSeconds is the number of seconds for which past recommendations should be considered while scaling up or scaling down.
+
+        StabilizationWindowSeconds must be greater than or equal to zero and less than or equal to 3600 (one hour). If not set, use the default values: - For scale up: 0 (i.e. no stabilization is done). - For scale down: 300 (i.e. the stabilization window is 300 seconds long).
+
+        :schema: io.k8s.api.autoscaling.v2beta2.HPAScalingRules#stabilizationWindowSeconds
+        '''
+        result = self._value_stabilization_window_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_policies is not None:
+            values["policies"] = self._value_policies
+        if self._value_select_policy is not None:
+            values["select_policy"] = self._value_select_policy
+        if self._value_stabilization_window_seconds is not None:
+            values["stabilization_window_seconds"] = self._value_stabilization_window_seconds
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HpaScalingRulesV2Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__19cec94ecc00bf7bf6cfc17c6f5b098af65a2cd7a1a04a7a1f983629b3244999(
+    *,
+    policies: typing.Optional[typing.Sequence[typing.Union[HpaScalingPolicyV2Beta2, typing.Dict[builtins.str, typing.Any]]]] = None,
+    select_policy: typing.Optional[builtins.str] = None,
+    stabilization_window_seconds: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,166 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .HttpHeader import HttpHeader
+from .IntOrString import IntOrString
+
+
+@jsii.data_type(
+    jsii_type="k8s.HttpGetAction",
+    jsii_struct_bases=[],
+    name_mapping={
+        "port": "port",
+        "host": "host",
+        "http_headers": "httpHeaders",
+        "path": "path",
+        "scheme": "scheme",
+    },
+)
+class HttpGetAction(_base.Struct):
+    __slots__ = (
+        "_value_port",
+        "_value_host",
+        "_value_http_headers",
+        "_value_path",
+        "_value_scheme",
+    )
+
+    def __init__(
+        self,
+        *,
+        port: "IntOrString",
+        host: typing.Optional[builtins.str] = None,
+        http_headers: typing.Optional[typing.Sequence[typing.Union["HttpHeader", typing.Dict[builtins.str, typing.Any]]]] = None,
+        path: typing.Optional[builtins.str] = None,
+        scheme: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''HTTPGetAction describes an action based on HTTP Get requests.
+
+        :param port: Name or number of the port to access on the container. Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
+        :param host: Host name to connect to, defaults to the pod IP. You probably want to set "Host" in httpHeaders instead.
+        :param http_headers: Custom headers to set in the request. HTTP allows repeated headers.
+        :param path: Path to access on the HTTP server.
+        :param scheme: Scheme to use for connecting to the host. Defaults to HTTP. Default: HTTP.
+
+        :schema: io.k8s.api.core.v1.HTTPGetAction
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__62efc5742934988596159a1c4328467a5bf15711d92d0298db109be22da42dbc)
+            check_type(argname="argument port", value=port, expected_type=type_hints["port"])
+            check_type(argname="argument host", value=host, expected_type=type_hints["host"])
+            check_type(argname="argument http_headers", value=http_headers, expected_type=type_hints["http_headers"])
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument scheme", value=scheme, expected_type=type_hints["scheme"])
+        self._value_port = port
+        self._value_host = host
+        self._value_http_headers = http_headers
+        self._value_path = path
+        self._value_scheme = scheme
+
+    @builtins.property
+    def port(self) -> "IntOrString":
+        '''Name or number of the port to access on the container.
+
+        Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
+
+        :schema: io.k8s.api.core.v1.HTTPGetAction#port
+        '''
+        result = self._value_port
+        assert result is not None, "Required property 'port' is missing"
+        return typing.cast("IntOrString", result)
+
+    @builtins.property
+    def host(self) -> typing.Optional[builtins.str]:
+        '''Host name to connect to, defaults to the pod IP.
+
+        You probably want to set "Host" in httpHeaders instead.
+
+        :schema: io.k8s.api.core.v1.HTTPGetAction#host
+        '''
+        result = self._value_host
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def http_headers(self) -> typing.Optional[typing.List["HttpHeader"]]:
+        '''Custom headers to set in the request.
+
+        HTTP allows repeated headers.
+
+        :schema: io.k8s.api.core.v1.HTTPGetAction#httpHeaders
+        '''
+        result = self._value_http_headers
+        return typing.cast(typing.Optional[typing.List["HttpHeader"]], result)
+
+    @builtins.property
+    def path(self) -> typing.Optional[builtins.str]:
+        '''Path to access on the HTTP server.
+
+        :schema: io.k8s.api.core.v1.HTTPGetAction#path
+        '''
+        result = self._value_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def scheme(self) -> typing.Optional[builtins.str]:
+        '''Scheme to use for connecting to the host.
+
+        Defaults to HTTP.
+
+        :default: HTTP.
+
+        :schema: io.k8s.api.core.v1.HTTPGetAction#scheme
+        '''
+        result = self._value_scheme
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "port": self._value_port,
+        }
+        if self._value_host is not None:
+            values["host"] = self._value_host
+        if self._value_http_headers is not None:
+            values["http_headers"] = self._value_http_headers
+        if self._value_path is not None:
+            values["path"] = self._value_path
+        if self._value_scheme is not None:
+            values["scheme"] = self._value_scheme
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HttpGetAction(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__62efc5742934988596159a1c4328467a5bf15711d92d0298db109be22da42dbc(
+    *,
+    port: IntOrString,
+    host: typing.Optional[builtins.str] = None,
+    http_headers: typing.Optional[typing.Sequence[typing.Union[HttpHeader, typing.Dict[builtins.str, typing.Any]]]] = None,
+    path: typing.Optional[builtins.str] = None,
+    scheme: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
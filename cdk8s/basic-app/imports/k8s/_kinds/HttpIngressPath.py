@@ -0,0 +1,134 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IngressBackend import IngressBackend
+
+
+@jsii.data_type(
+    jsii_type="k8s.HttpIngressPath",
+    jsii_struct_bases=[],
+    name_mapping={"backend": "backend", "path_type": "pathType", "path": "path"},
+)
+class HttpIngressPath(_base.Struct):
+    __slots__ = (
+        "_value_backend",
+        "_value_path_type",
+        "_value_path",
+    )
+
+    def __init__(
+        self,
+        *,
+        backend: typing.Union["IngressBackend", typing.Dict[builtins.str, typing.Any]],
+        path_type: builtins.str,
+        path: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''HTTPIngressPath associates a path with a backend.
+
+        Incoming urls matching the path are forwarded to the backend.
+
+        :param backend: Backend defines the referenced service endpoint to which the traffic will be forwarded to.
+        :param path_type: PathType determines the interpretation of the Path matching. PathType can be one of the following values: * Exact: Matches the URL path exactly. * Prefix: Matches based on a URL path prefix split by '/'. Matching is done on a path element by element basis. A path element refers is the list of labels in the path split by the '/' separator. A request is a match for path p if every p is an element-wise prefix of p of the request path. Note that if the last element of the path is a substring of the last element in request path, it is not a match (e.g. /foo/bar matches /foo/bar/baz, but does not match /foo/barbaz). - ImplementationSpecific: Interpretation of the Path matching is up to the IngressClass. Implementations can treat this as a separate PathType or treat it identically to Prefix or Exact path types. Implementations are required to support all path types.
+        :param path: Path is matched against the path of an incoming request. Currently it can contain characters disallowed from the conventional "path" part of a URL as defined by RFC 3986. Paths must begin with a '/' and must be present when using PathType with value "Exact" or "Prefix".
+
+        :schema: io.k8s.api.networking.v1.HTTPIngressPath
+        '''
+        if isinstance(backend, dict):
+            backend = IngressBackend(**backend)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__1cca829c509cb330ab5cf95c6fc26b20f21813dc375800b70fcbfdfeec2654c5)
+            check_type(argname="argument backend", value=backend, expected_type=type_hints["backend"])
+            check_type(argname="argument path_type", value=path_type, expected_type=type_hints["path_type"])
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+        self._value_backend = backend
+        self._value_path_type = path_type
+        self._value_path = path
+
+    @builtins.property
+    def backend(self) -> "IngressBackend":
+        '''Backend defines the referenced service endpoint to which the traffic will be forwarded to.
+
+        :schema: io.k8s.api.networking.v1.HTTPIngressPath#backend
+        '''
+        result = self._value_backend
+        assert result is not None, "Required property 'backend' is missing"
+        return typing.cast("IngressBackend", result)
+
+    @builtins.property
+    def path_type(self) -> builtins.str:
+        '''PathType determines the interpretation of the Path matching.
+
+        PathType can be one of the following values: * Exact: Matches the URL path exactly. * Prefix: Matches based on a URL path prefix split by '/'. Matching is
+        done on a path element by element basis. A path element refers is the
+        list of labels in the path split by the '/' separator. A request is a
+        match for path p if every p is an element-wise prefix of p of the
+        request path. Note that if the last element of the path is a substring
+        of the last element in request path, it is not a match (e.g. /foo/bar
+        matches /foo/bar/baz, but does not match /foo/barbaz).
+
+        - ImplementationSpecific: Interpretation of the Path matching is up to
+          the IngressClass. Implementations can treat this as a separate PathType
+          or treat it identically to Prefix or Exact path types.
+          Implementations are required to support all path types.
+
+        :schema: io.k8s.api.networking.v1.HTTPIngressPath#pathType
+        '''
+        result = self._value_path_type
+        assert result is not None, "Required property 'path_type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def path(self) -> typing.Optional[builtins.str]:
+        '''Path is matched against the path of an incoming request.
+
+        Currently it can contain characters disallowed from the conventional "path" part of a URL as defined by RFC 3986. Paths must begin with a '/' and must be present when using PathType with value "Exact" or "Prefix".
+
+        :schema: io.k8s.api.networking.v1.HTTPIngressPath#path
+        '''
+        result = self._value_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "backend": self._value_backend,
+            "path_type": self._value_path_type,
+        }
+        if self._value_path is not None:
+            values["path"] = self._value_path
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HttpIngressPath(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__1cca829c509cb330ab5cf95c6fc26b20f21813dc375800b70fcbfdfeec2654c5(
+    *,
+    backend: typing.Union[IngressBackend, typing.Dict[builtins.str, typing.Any]],
+    path_type: builtins.str,
+    path: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,83 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .HttpIngressPath import HttpIngressPath
+
+
+@jsii.data_type(
+    jsii_type="k8s.HttpIngressRuleValue",
+    jsii_struct_bases=[],
+    name_mapping={"paths": "paths"},
+)
+class HttpIngressRuleValue(_base.Struct):
+    __slots__ = (
+        "_value_paths",
+    )
+
+    def __init__(
+        self,
+        *,
+        paths: typing.Sequence[typing.Union[HttpIngressPath, typing.Dict[builtins.str, typing.Any]]],
+    ) -> None:
+        '''HTTPIngressRuleValue is a list of http selectors pointing to backends.
+
+        In the example: http:///? -> backend where where parts of the url correspond to RFC 3986, this resource will be used to match against everything after the last '/' and before the first '?' or '#'.
+
+        :param paths: A collection of paths that map requests to backends.
+
+        :schema: io.k8s.api.networking.v1.HTTPIngressRuleValue
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__05cd1df4bce67e8fa976f9efada12c170538e64a48328c5f255efdebc8f61d9a)
+            check_type(argname="argument paths", value=paths, expected_type=type_hints["paths"])
+        self._value_paths = paths
+
+    @builtins.property
+    def paths(self) -> typing.List[HttpIngressPath]:
+        '''A collection of paths that map requests to backends.
+
+        :schema: io.k8s.api.networking.v1.HTTPIngressRuleValue#paths
+        '''
+        result = self._value_paths
+        assert result is not None, "Required property 'paths' is missing"
+        return typing.cast(typing.List[HttpIngressPath], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "paths": self._value_paths,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "HttpIngressRuleValue(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__05cd1df4bce67e8fa976f9efada12c170538e64a48328c5f255efdebc8f61d9a(
+    *,
+    paths: typing.Sequence[typing.Union[HttpIngressPath, typing.Dict[builtins.str, typing.Any]]],
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,106 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IngressServiceBackend import IngressServiceBackend
+from .TypedLocalObjectReference import TypedLocalObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.IngressBackend",
+    jsii_struct_bases=[],
+    name_mapping={"resource": "resource", "service": "service"},
+)
+class IngressBackend(_base.Struct):
+    __slots__ = (
+        "_value_resource",
+        "_value_service",
+    )
+
+    def __init__(
+        self,
+        *,
+        resource: typing.Optional[typing.Union["TypedLocalObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        service: typing.Optional[typing.Union["IngressServiceBackend", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''IngressBackend describes all endpoints for a given service and port.
+
+        :param resource: Resource is an ObjectRef to another Kubernetes resource in the namespace of the Ingress object. If resource is specified, a service.Name and service.Port must not be specified. This is a mutually exclusive setting with "Service".
+        :param service: Service references a Service as a Backend. This is a mutually exclusive setting with "Resource".
+
+        :schema: io.k8s.api.networking.v1.IngressBackend
+        '''
+        if isinstance(resource, dict):
+            resource = TypedLocalObjectReference(**resource)
+        if isinstance(service, dict):
+            service = IngressServiceBackend(**service)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__df26b528fe90e75693923674dff2a906cecf821611adf7cf1d7a6745fd0cd715)
+            check_type(argname="argument resource", value=resource, expected_type=type_hints["resource"])
+            check_type(argname="argument service", value=service, expected_type=type_hints["service"])
+        self._value_resource = resource
+        self._value_service = service
+
+    @builtins.property
+    def resource(self) -> typing.Optional["TypedLocalObjectReference"]:
+        '''Resource is an ObjectRef to another Kubernetes resource in the namespace of the Ingress object.
+
+        If resource is specified, a service.Name and service.Port must not be specified. This is a mutually exclusive setting with "Service".
+
+        :schema: io.k8s.api.networking.v1.IngressBackend#resource
+        '''
+        result = self._value_resource
+        return typing.cast(typing.Optional["TypedLocalObjectReference"], result)
+
+    @builtins.property
+    def service(self) -> typing.Optional["IngressServiceBackend"]:
+        '''Service references a Service as a Backend.
+
+        This is a mutually exclusive setting with "Resource".
+
+        :schema: io.k8s.api.networking.v1.IngressBackend#service
+        '''
+        result = self._value_service
+        return typing.cast(typing.Optional["IngressServiceBackend"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_resource is not None:
+            values["resource"] = self._value_resource
+        if self._value_service is not None:
+            values["service"] = self._value_service
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IngressBackend(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__df26b528fe90e75693923674dff2a906cecf821611adf7cf1d7a6745fd0cd715(
+    *,
+    resource: typing.Optional[typing.Union[TypedLocalObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    service: typing.Optional[typing.Union[IngressServiceBackend, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,162 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.IngressClassParametersReference",
+    jsii_struct_bases=[],
+    name_mapping={
+        "kind": "kind",
+        "name": "name",
+        "api_group": "apiGroup",
+        "namespace": "namespace",
+        "scope": "scope",
+    },
+)
+class IngressClassParametersReference(_base.Struct):
+    __slots__ = (
+        "_value_kind",
+        "_value_name",
+        "_value_api_group",
+        "_value_namespace",
+        "_value_scope",
+    )
+
+    def __init__(
+        self,
+        *,
+        kind: builtins.str,
+        name: builtins.str,
+        api_group: typing.Optional[builtins.str] = None,
+        namespace: typing.Optional[builtins.str] = None,
+        scope: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''IngressClassParametersReference identifies an API object.
+
+        This can be used to specify a cluster or namespace-scoped resource.
+
+        :param kind: Kind is the type of resource being referenced.
+        :param name: Name is the name of resource being referenced.
+        :param api_group: APIGroup is the group for the resource being referenced. If APIGroup is not specified, the specified Kind must be in the core API group. For any other third-party types, APIGroup is required.
+        :param namespace: Namespace is the namespace of the resource being referenced. This field is required when scope is set to "Namespace" and must be unset when scope is set to "Cluster".
+        :param scope: Scope represents if this refers to a cluster or namespace scoped resource. This may be set to "Cluster" (default) or "Namespace".
+
+        :schema: io.k8s.api.networking.v1.IngressClassParametersReference
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b55c86b8fa568f61df7bfe266dca0075b336f1056df734d8a5f9f6b5116eadc6)
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument api_group", value=api_group, expected_type=type_hints["api_group"])
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+            check_type(argname="argument scope", value=scope, expected_type=type_hints["scope"])
+        self._value_kind = kind
+        self._value_name = name
+        self._value_api_group = api_group
+        self._value_namespace = namespace
+        self._value_scope = scope
+
+    @builtins.property
+    def kind(self) -> builtins.str:
+        '''Kind is the type of resource being referenced.
+
+        :schema: io.k8s.api.networking.v1.IngressClassParametersReference#kind
+        '''
+        result = self._value_kind
+        assert result is not None, "Required property 'kind' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''Name is the name of resource being referenced.
+
+        :schema: io.k8s.api.networking.v1.IngressClassParametersReference#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def api_group(self) -> typing.Optional[builtins.str]:
+        '''APIGroup is the group for the resource being referenced.
+
+        If APIGroup is not specified, the specified Kind must be in the core API group. For any other third-party types, APIGroup is required.
+
+        :schema: io.k8s.api.networking.v1.IngressClassParametersReference#apiGroup
+        '''
+        result = self._value_api_group
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def namespace(self) -> typing.Optional[builtins.str]:
+        '''Namespace is the namespace of the resource being referenced.
+
+        This field is required when scope is set to "Namespace" and must be unset when scope is set to "Cluster".
+
+        :schema: io.k8s.api.networking.v1.IngressClassParametersReference#namespace
+        '''
+        result = self._value_namespace
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def scope(self) -> typing.Optional[builtins.str]:
+        '''Scope represents if this refers to a cluster or namespace scoped resource.
+
+        This may be set to "Cluster" (default) or "Namespace".
+
+        :schema: io.k8s.api.networking.v1.IngressClassParametersReference#scope
+        '''
+        result = self._value_scope
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "kind": self._value_kind,
+            "name": self._value_name,
+        }
+        if self._value_api_group is not None:
+            values["api_group"] = self._value_api_group
+        if self._value_namespace is not None:
+            values["namespace"] = self._value_namespace
+        if self._value_scope is not None:
+            values["scope"] = self._value_scope
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IngressClassParametersReference(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b55c86b8fa568f61df7bfe266dca0075b336f1056df734d8a5f9f6b5116eadc6(
+    *,
+    kind: builtins.str,
+    name: builtins.str,
+    api_group: typing.Optional[builtins.str] = None,
+    namespace: typing.Optional[builtins.str] = None,
+    scope: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
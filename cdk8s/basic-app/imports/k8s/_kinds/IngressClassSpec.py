@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IngressClassParametersReference import IngressClassParametersReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.IngressClassSpec",
+    jsii_struct_bases=[],
+    name_mapping={"controller": "controller", "parameters": "parameters"},
+)
+class IngressClassSpec(_base.Struct):
+    __slots__ = (
+        "_value_controller",
+        "_value_parameters",
+    )
+
+    def __init__(
+        self,
+        *,
+        controller: typing.Optional[builtins.str] = None,
+        parameters: typing.Optional[typing.Union[IngressClassParametersReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''IngressClassSpec provides information about the class of an Ingress.
+
+        :param controller: Controller refers to the name of the controller that should handle this class. This allows for different "flavors" that are controlled by the same controller. For example, you may have different Parameters for the same implementing controller. This should be specified as a domain-prefixed path no more than 250 characters in length, e.g. "acme.io/ingress-controller". This field is immutable.
+        :param parameters: Parameters is a link to a custom resource containing additional configuration for the controller. This is optional if the controller does not require extra parameters.
+
+        :schema: io.k8s.api.networking.v1.IngressClassSpec
+        '''
+        if isinstance(parameters, dict):
+            parameters = IngressClassParametersReference(**parameters)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__9135d7f530914c8efd0036d3c9b7f8302e7bf5f1a915332fbf5ddccf196262d1)
+            check_type(argname="argument controller", value=controller, expected_type=type_hints["controller"])
+            check_type(argname="argument parameters", value=parameters, expected_type=type_hints["parameters"])
+        self._value_controller = controller
+        self._value_parameters = parameters
+
+    @builtins.property
+    def controller(self) -> typing.Optional[builtins.str]:
+        '''Controller refers to the name of the controller that should handle this class.
+
+        This allows for different "flavors" that are controlled by the same controller. For example, you may have different Parameters for the same implementing controller. This should be specified as a domain-prefixed path no more than 250 characters in length, e.g. "acme.io/ingress-controller". This field is immutable.
+
+        :schema: io.k8s.api.networking.v1.IngressClassSpec#controller
+        '''
+        result = self._value_controller
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def parameters(self) -> typing.Optional[IngressClassParametersReference]:
+        '''Parameters is a link to a custom resource containing additional configuration for the controller.
+
+        This is optional if the controller does not require extra parameters.
+
+        :schema: io.k8s.api.networking.v1.IngressClassSpec#parameters
+        '''
+        result = self._value_parameters
+        return typing.cast(typing.Optional[IngressClassParametersReference], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_controller is not None:
+            values["controller"] = self._value_controller
+        if self._value_parameters is not None:
+            values["parameters"] = self._value_parameters
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IngressClassSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__9135d7f530914c8efd0036d3c9b7f8302e7bf5f1a915332fbf5ddccf196262d1(
+    *,
+    controller: typing.Optional[builtins.str] = None,
+    parameters: typing.Optional[typing.Union[IngressClassParametersReference, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,109 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .HttpIngressRuleValue import HttpIngressRuleValue
+
+
+@jsii.data_type(
+    jsii_type="k8s.IngressRule",
+    jsii_struct_bases=[],
+    name_mapping={"host": "host", "http": "http"},
+)
+class IngressRule(_base.Struct):
+    __slots__ = (
+        "_value_host",
+        "_value_http",
+    )
+
+    def __init__(
+        self,
+        *,
+        host: typing.Optional[builtins.str] = None,
+        http: typing.Optional[typing.Union[HttpIngressRuleValue, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''IngressRule represents the rules mapping the paths under a specified host to the related backend services.
+
+        Incoming requests are first evaluated for a host match, then routed to the backend associated with the matching IngressRuleValue.
+
+        :param host: Host is the fully qualified domain name of a network host, as defined by RFC 3986. Note the following deviations from the "host" part of the URI as defined in RFC 3986: 1. IPs are not allowed. Currently an IngressRuleValue can only apply to the IP in the Spec of the parent Ingress. 2. The ``:`` delimiter is not respected because ports are not allowed. Currently the port of an Ingress is implicitly :80 for http and :443 for https. Both these may change in the future. Incoming requests are matched against the host before the IngressRuleValue. If the host is unspecified, the Ingress routes all traffic based on the specified IngressRuleValue. Host can be "precise" which is a domain name without the terminating dot of a network host (e.g. "foo.bar.com") or "wildcard", which is a domain name prefixed with a single wildcard label (e.g. "*.foo.com"). The wildcard character '*' must appear by itself as the first DNS label and matches only a single label. You cannot have a wildcard label by itself (e.g. Host == "*"). Requests will be matched against the Host field in the following way: 1. If Host is precise, the request matches this rule if the http host header is equal to Host. 2. If Host is a wildcard, then the request matches this rule if the http host header is to equal to the suffix (removing the first label) of the wildcard rule.
+        :param http: 
+
+        :schema: io.k8s.api.networking.v1.IngressRule
+        '''
+        if isinstance(http, dict):
+            http = HttpIngressRuleValue(**http)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__f579f76985685fddfa2343f3fdb2f56b0ad569a16de003c2209b63ace70d1fee)
+            check_type(argname="argument host", value=host, expected_type=type_hints["host"])
+            check_type(argname="argument http", value=http, expected_type=type_hints["http"])
+        self._value_host = host
+        self._value_http = http
+
+    @builtins.property
+    def host(self) -> typing.Optional[builtins.str]:
+        '''Host is the fully qualified domain name of a network host, as defined by RFC 3986.
+
+        Note the following deviations from the "host" part of the URI as defined in RFC 3986: 1. IPs are not allowed. Currently an IngressRuleValue can only apply to
+        the IP in the Spec of the parent Ingress.
+        2. The ``:`` delimiter is not respected because ports are not allowed.
+        Currently the port of an Ingress is implicitly :80 for http and
+        :443 for https.
+        Both these may change in the future. Incoming requests are matched against the host before the IngressRuleValue. If the host is unspecified, the Ingress routes all traffic based on the specified IngressRuleValue.
+
+        Host can be "precise" which is a domain name without the terminating dot of a network host (e.g. "foo.bar.com") or "wildcard", which is a domain name prefixed with a single wildcard label (e.g. "*.foo.com"). The wildcard character '*' must appear by itself as the first DNS label and matches only a single label. You cannot have a wildcard label by itself (e.g. Host == "*"). Requests will be matched against the Host field in the following way: 1. If Host is precise, the request matches this rule if the http host header is equal to Host. 2. If Host is a wildcard, then the request matches this rule if the http host header is to equal to the suffix (removing the first label) of the wildcard rule.
+
+        :schema: io.k8s.api.networking.v1.IngressRule#host
+        '''
+        result = self._value_host
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def http(self) -> typing.Optional[HttpIngressRuleValue]:
+        '''
+        :schema: io.k8s.api.networking.v1.IngressRule#http
+        '''
+        result = self._value_http
+        return typing.cast(typing.Optional[HttpIngressRuleValue], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_host is not None:
+            values["host"] = self._value_host
+        if self._value_http is not None:
+            values["http"] = self._value_http
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IngressRule(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__f579f76985685fddfa2343f3fdb2f56b0ad569a16de003c2209b63ace70d1fee(
+    *,
+    host: typing.Optional[builtins.str] = None,
+    http: typing.Optional[typing.Union[HttpIngressRuleValue, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
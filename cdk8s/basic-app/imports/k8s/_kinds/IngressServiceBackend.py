@@ -0,0 +1,104 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ServiceBackendPort import ServiceBackendPort
+
+
+@jsii.data_type(
+    jsii_type="k8s.IngressServiceBackend",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name", "port": "port"},
+)
+class IngressServiceBackend(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_port",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: builtins.str,
+        port: typing.Optional[typing.Union["ServiceBackendPort", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''IngressServiceBackend references a Kubernetes Service as a Backend.
+
+        :param name: Name is the referenced service. The service must exist in the same namespace as the Ingress object.
+        :param port: Port of the referenced service. A port name or port number is required for a IngressServiceBackend.
+
+        :schema: io.k8s.api.networking.v1.IngressServiceBackend
+        '''
+        if isinstance(port, dict):
+            port = ServiceBackendPort(**port)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__e3e97fffe88d91fb9b536c53695ba745cdabbeb12e55b6dea45d253fdc89f5cd)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument port", value=port, expected_type=type_hints["port"])
+        self._value_name = name
+        self._value_port = port
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''Name is the referenced service.
+
+        The service must exist in the same namespace as the Ingress object.
+
+        :schema: io.k8s.api.networking.v1.IngressServiceBackend#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def port(self) -> typing.Optional["ServiceBackendPort"]:
+        '''Port of the referenced service.
+
+        A port name or port number is required for a IngressServiceBackend.
+
+        :schema: io.k8s.api.networking.v1.IngressServiceBackend#port
+        '''
+        result = self._value_port
+        return typing.cast(typing.Optional["ServiceBackendPort"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+        }
+        if self._value_port is not None:
+            values["port"] = self._value_port
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IngressServiceBackend(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__e3e97fffe88d91fb9b536c53695ba745cdabbeb12e55b6dea45d253fdc89f5cd(
+    *,
+    name: builtins.str,
+    port: typing.Optional[typing.Union[ServiceBackendPort, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
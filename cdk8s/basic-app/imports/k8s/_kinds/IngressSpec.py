@@ -0,0 +1,148 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IngressBackend import IngressBackend
+from .IngressRule import IngressRule
+from .IngressTls import IngressTls
+
+
+@jsii.data_type(
+    jsii_type="k8s.IngressSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "default_backend": "defaultBackend",
+        "ingress_class_name": "ingressClassName",
+        "rules": "rules",
+        "tls": "tls",
+    },
+)
+class IngressSpec(_base.Struct):
+    __slots__ = (
+        "_value_default_backend",
+        "_value_ingress_class_name",
+        "_value_rules",
+        "_value_tls",
+    )
+
+    def __init__(
+        self,
+        *,
+        default_backend: typing.Optional[typing.Union[IngressBackend, typing.Dict[builtins.str, typing.Any]]] = None,
+        ingress_class_name: typing.Optional[builtins.str] = None,
+        rules: typing.Optional[typing.Sequence[typing.Union[IngressRule, typing.Dict[builtins.str, typing.Any]]]] = None,
+        tls: typing.Optional[typing.Sequence[typing.Union["IngressTls", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''IngressSpec describes the Ingress the user wishes to exist.
+
+        :param default_backend: DefaultBackend is the backend that should handle requests that don't match any rule. If Rules are not specified, DefaultBackend must be specified. If DefaultBackend is not set, the handling of requests that do not match any of the rules will be up to the Ingress controller.
+        :param ingress_class_name: IngressClassName is the name of an IngressClass cluster resource. Ingress controller implementations use this field to know whether they should be serving this Ingress resource, by a transitive connection (controller -> IngressClass -> Ingress resource). Although the ``kubernetes.io/ingress.class`` annotation (simple constant name) was never formally defined, it was widely supported by Ingress controllers to create a direct binding between Ingress controller and Ingress resources. Newly created Ingress resources should prefer using the field. However, even though the annotation is officially deprecated, for backwards compatibility reasons, ingress controllers should still honor that annotation if present.
+        :param rules: A list of host rules used to configure the Ingress. If unspecified, or no rule matches, all traffic is sent to the default backend.
+        :param tls: TLS configuration. Currently the Ingress only supports a single TLS port, 443. If multiple members of this list specify different hosts, they will be multiplexed on the same port according to the hostname specified through the SNI TLS extension, if the ingress controller fulfilling the ingress supports SNI.
+
+        :schema: io.k8s.api.networking.v1.IngressSpec
+        '''
+        if isinstance(default_backend, dict):
+            default_backend = IngressBackend(**default_backend)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__97b273849944944f09361df5533bf081b4f556d667e5a81bba5956e651d6411b)
+            check_type(argname="argument default_backend", value=default_backend, expected_type=type_hints["default_backend"])
+            check_type(argname="argument ingress_class_name", value=ingress_class_name, expected_type=type_hints["ingress_class_name"])
+            check_type(argname="argument rules", value=rules, expected_type=type_hints["rules"])
+            check_type(argname="argument tls", value=tls, expected_type=type_hints["tls"])
+        self._value_default_backend = default_backend
+        self._value_ingress_class_name = ingress_class_name
+        self._value_rules = rules
+        self._value_tls = tls
+
+    @builtins.property
+    def default_backend(self) -> typing.Optional[IngressBackend]:
+        '''DefaultBackend is the backend that should handle requests that don't match any rule.
+
+        If Rules are not specified, DefaultBackend must be specified. If DefaultBackend is not set, the handling of requests that do not match any of the rules will be up to the Ingress controller.
+
+        :schema: io.k8s.api.networking.v1.IngressSpec#defaultBackend
+        '''
+        result = self._value_default_backend
+        return typing.cast(typing.Optional[IngressBackend], result)
+
+    @builtins.property
+    def ingress_class_name(self) -> typing.Optional[builtins.str]:
+        '''IngressClassName is the name of an IngressClass cluster resource.
+
+        Ingress controller implementations use this field to know whether they should be serving this Ingress resource, by a transitive connection (controller -> IngressClass -> Ingress resource). Although the ``kubernetes.io/ingress.class`` annotation (simple constant name) was never formally defined, it was widely supported by Ingress controllers to create a direct binding between Ingress controller and Ingress resources. Newly created Ingress resources should prefer using the field. However, even though the annotation is officially deprecated, for backwards compatibility reasons, ingress controllers should still honor that annotation if present.
+
+        :schema: io.k8s.api.networking.v1.IngressSpec#ingressClassName
+        '''
+        result = self._value_ingress_class_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def rules(self) -> typing.Optional[typing.List[IngressRule]]:
+        '''A list of host rules used to configure the Ingress.
+
+        If unspecified, or no rule matches, all traffic is sent to the default backend.
+
+        :schema: io.k8s.api.networking.v1.IngressSpec#rules
+        '''
+        result = self._value_rules
+        return typing.cast(typing.Optional[typing.List[IngressRule]], result)
+
+    @builtins.property
+    def tls(self) -> typing.Optional[typing.List["IngressTls"]]:
+        '''TLS configuration.
+
+        Currently the Ingress only supports a single TLS port, 443. If multiple members of this list specify different hosts, they will be multiplexed on the same port according to the hostname specified through the SNI TLS extension, if the ingress controller fulfilling the ingress supports SNI.
+
+        :schema: io.k8s.api.networking.v1.IngressSpec#tls
+        '''
+        result = self._value_tls
+        return typing.cast(typing.Optional[typing.List["IngressTls"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_default_backend is not None:
+            values["default_backend"] = self._value_default_backend
+        if self._value_ingress_class_name is not None:
+            values["ingress_class_name"] = self._value_ingress_class_name
+        if self._value_rules is not None:
+            values["rules"] = self._value_rules
+        if self._value_tls is not None:
+            values["tls"] = self._value_tls
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IngressSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__97b273849944944f09361df5533bf081b4f556d667e5a81bba5956e651d6411b(
+    *,
+    default_backend: typing.Optional[typing.Union[IngressBackend, typing.Dict[builtins.str, typing.Any]]] = None,
+    ingress_class_name: typing.Optional[builtins.str] = None,
+    rules: typing.Optional[typing.Sequence[typing.Union[IngressRule, typing.Dict[builtins.str, typing.Any]]]] = None,
+    tls: typing.Optional[typing.Sequence[typing.Union[IngressTls, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,102 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.IngressTls",
+    jsii_struct_bases=[],
+    name_mapping={"hosts": "hosts", "secret_name": "secretName"},
+)
+class IngressTls(_base.Struct):
+    __slots__ = (
+        "_value_hosts",
+        "_value_secret_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        hosts: typing.Optional[typing.Sequence[builtins.str]] = None,
+        secret_name: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''IngressTLS describes the transport layer security associated with an Ingress.
+
+        :param hosts: Hosts are a list of hosts included in the TLS certificate. The values in this list must match the name/s used in the tlsSecret. Defaults to the wildcard host setting for the loadbalancer controller fulfilling this Ingress, if left unspecified. Default: the wildcard host setting for the loadbalancer controller fulfilling this Ingress, if left unspecified.
+        :param secret_name: SecretName is the name of the secret used to terminate TLS traffic on port 443. Field is left optional to allow TLS routing based on SNI hostname alone. If the SNI host in a listener conflicts with the "Host" header field used by an IngressRule, the SNI host is used for termination and value of the Host header is used for routing.
+
+        :schema: io.k8s.api.networking.v1.IngressTLS
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__8025d7972fe3e671efe9fc76590f08e6af4537e71b575480407655a7b7b7b9ef)
+            check_type(argname="argument hosts", value=hosts, expected_type=type_hints["hosts"])
+            check_type(argname="argument secret_name", value=secret_name, expected_type=type_hints["secret_name"])
+        self._value_hosts = hosts
+        self._value_secret_name = secret_name
+
+    @builtins.property
+    def hosts(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Hosts are a list of hosts included in the TLS certificate.
+
+        The values in this list must match the name/s used in the tlsSecret. Defaults to the wildcard host setting for the loadbalancer controller fulfilling this Ingress, if left unspecified.
+
+        :default: the wildcard host setting for the loadbalancer controller fulfilling this Ingress, if left unspecified.
+
+        :schema: io.k8s.api.networking.v1.IngressTLS#hosts
+        '''
+        result = self._value_hosts
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def secret_name(self) -> typing.Optional[builtins.str]:
+        '''SecretName is the name of the secret used to terminate TLS traffic on port 443.
+
+        Field is left optional to allow TLS routing based on SNI hostname alone. If the SNI host in a listener conflicts with the "Host" header field used by an IngressRule, the SNI host is used for termination and value of the Host header is used for routing.
+
+        :schema: io.k8s.api.networking.v1.IngressTLS#secretName
+        '''
+        result = self._value_secret_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_hosts is not None:
+            values["hosts"] = self._value_hosts
+        if self._value_secret_name is not None:
+            values["secret_name"] = self._value_secret_name
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IngressTls(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__8025d7972fe3e671efe9fc76590f08e6af4537e71b575480407655a7b7b7b9ef(
+    *,
+    hosts: typing.Optional[typing.Sequence[builtins.str]] = None,
+    secret_name: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,31 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.enum(jsii_type="k8s.IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind")
+class IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind(enum.Enum):
+    '''Kind is a string value representing the REST resource this object represents.
+
+    Servers may infer this from the endpoint the client submits requests to. Cannot be updated. In CamelCase. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+
+    :schema: IoK8SApimachineryPkgApisMetaV1DeleteOptionsKind
+    '''
+
+    DELETE_OPTIONS = "DELETE_OPTIONS"
+    '''DeleteOptions.'''
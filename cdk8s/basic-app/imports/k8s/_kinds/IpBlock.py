@@ -0,0 +1,99 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.IpBlock",
+    jsii_struct_bases=[],
+    name_mapping={"cidr": "cidr", "except_": "except"},
+)
+class IpBlock(_base.Struct):
+    __slots__ = (
+        "_value_cidr",
+        "_value_except_",
+    )
+
+    def __init__(
+        self,
+        *,
+        cidr: builtins.str,
+        except_: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''IPBlock describes a particular CIDR (Ex.
+
+        "192.168.1.1/24","2001:db9::/64") that is allowed to the pods matched by a NetworkPolicySpec's podSelector. The except entry describes CIDRs that should not be included within this rule.
+
+        :param cidr: CIDR is a string representing the IP Block Valid examples are "192.168.1.1/24" or "2001:db9::/64".
+        :param except_: Except is a slice of CIDRs that should not be included within an IP Block Valid examples are "192.168.1.1/24" or "2001:db9::/64" Except values will be rejected if they are outside the CIDR range.
+
+        :schema: io.k8s.api.networking.v1.IPBlock
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__06c394466495c1b06784a9836bf93d9ce9aec1a818eac2478c2db2ccb377d374)
+            check_type(argname="argument cidr", value=cidr, expected_type=type_hints["cidr"])
+            check_type(argname="argument except_", value=except_, expected_type=type_hints["except_"])
+        self._value_cidr = cidr
+        self._value_except_ = except_
+
+    @builtins.property
+    def cidr(self) -> builtins.str:
+        '''CIDR is a string representing the IP Block Valid examples are "192.168.1.1/24" or "2001:db9::/64".
+
+        :schema: io.k8s.api.networking.v1.IPBlock#cidr
+        '''
+        result = self._value_cidr
+        assert result is not None, "Required property 'cidr' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def except_(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Except is a slice of CIDRs that should not be included within an IP Block Valid examples are "192.168.1.1/24" or "2001:db9::/64" Except values will be rejected if they are outside the CIDR range.
+
+        :schema: io.k8s.api.networking.v1.IPBlock#except
+        '''
+        result = self._value_except_
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "cidr": self._value_cidr,
+        }
+        if self._value_except_ is not None:
+            values["except_"] = self._value_except_
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IpBlock(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__06c394466495c1b06784a9836bf93d9ce9aec1a818eac2478c2db2ccb377d374(
+    *,
+    cidr: builtins.str,
+    except_: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
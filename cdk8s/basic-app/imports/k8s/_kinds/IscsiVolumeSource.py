@@ -0,0 +1,283 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LocalObjectReference import LocalObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.IscsiVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "iqn": "iqn",
+        "lun": "lun",
+        "target_portal": "targetPortal",
+        "chap_auth_discovery": "chapAuthDiscovery",
+        "chap_auth_session": "chapAuthSession",
+        "fs_type": "fsType",
+        "initiator_name": "initiatorName",
+        "iscsi_interface": "iscsiInterface",
+        "portals": "portals",
+        "read_only": "readOnly",
+        "secret_ref": "secretRef",
+    },
+)
+class IscsiVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_iqn",
+        "_value_lun",
+        "_value_target_portal",
+        "_value_chap_auth_discovery",
+        "_value_chap_auth_session",
+        "_value_fs_type",
+        "_value_initiator_name",
+        "_value_iscsi_interface",
+        "_value_portals",
+        "_value_read_only",
+        "_value_secret_ref",
+    )
+
+    def __init__(
+        self,
+        *,
+        iqn: builtins.str,
+        lun: jsii.Number,
+        target_portal: builtins.str,
+        chap_auth_discovery: typing.Optional[builtins.bool] = None,
+        chap_auth_session: typing.Optional[builtins.bool] = None,
+        fs_type: typing.Optional[builtins.str] = None,
+        initiator_name: typing.Optional[builtins.str] = None,
+        iscsi_interface: typing.Optional[builtins.str] = None,
+        portals: typing.Optional[typing.Sequence[builtins.str]] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        secret_ref: typing.Optional[typing.Union["LocalObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Represents an ISCSI disk.
+
+        ISCSI volumes can only be mounted as read/write once. ISCSI volumes support ownership management and SELinux relabeling.
+
+        :param iqn: iqn is the target iSCSI Qualified Name.
+        :param lun: lun represents iSCSI Target Lun number.
+        :param target_portal: targetPortal is iSCSI Target Portal. The Portal is either an IP or ip_addr:port if the port is other than default (typically TCP ports 860 and 3260).
+        :param chap_auth_discovery: chapAuthDiscovery defines whether support iSCSI Discovery CHAP authentication.
+        :param chap_auth_session: chapAuthSession defines whether support iSCSI Session CHAP authentication.
+        :param fs_type: fsType is the filesystem type of the volume that you want to mount. Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#iscsi
+        :param initiator_name: initiatorName is the custom iSCSI Initiator Name. If initiatorName is specified with iscsiInterface simultaneously, new iSCSI interface : will be created for the connection.
+        :param iscsi_interface: iscsiInterface is the interface Name that uses an iSCSI transport. Defaults to 'default' (tcp). Default: default' (tcp).
+        :param portals: portals is the iSCSI Target Portal List. The portal is either an IP or ip_addr:port if the port is other than default (typically TCP ports 860 and 3260).
+        :param read_only: readOnly here will force the ReadOnly setting in VolumeMounts. Defaults to false. Default: false.
+        :param secret_ref: secretRef is the CHAP Secret for iSCSI target and initiator authentication.
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource
+        '''
+        if isinstance(secret_ref, dict):
+            secret_ref = LocalObjectReference(**secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__3f8a3f5224af62afa8f0a6e18b9dbecb3365354c791cdf02387e47f4f53ef0b6)
+            check_type(argname="argument iqn", value=iqn, expected_type=type_hints["iqn"])
+            check_type(argname="argument lun", value=lun, expected_type=type_hints["lun"])
+            check_type(argname="argument target_portal", value=target_portal, expected_type=type_hints["target_portal"])
+            check_type(argname="argument chap_auth_discovery", value=chap_auth_discovery, expected_type=type_hints["chap_auth_discovery"])
+            check_type(argname="argument chap_auth_session", value=chap_auth_session, expected_type=type_hints["chap_auth_session"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument initiator_name", value=initiator_name, expected_type=type_hints["initiator_name"])
+            check_type(argname="argument iscsi_interface", value=iscsi_interface, expected_type=type_hints["iscsi_interface"])
+            check_type(argname="argument portals", value=portals, expected_type=type_hints["portals"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument secret_ref", value=secret_ref, expected_type=type_hints["secret_ref"])
+        self._value_iqn = iqn
+        self._value_lun = lun
+        self._value_target_portal = target_portal
+        self._value_chap_auth_discovery = chap_auth_discovery
+        self._value_chap_auth_session = chap_auth_session
+        self._value_fs_type = fs_type
+        self._value_initiator_name = initiator_name
+        self._value_iscsi_interface = iscsi_interface
+        self._value_portals = portals
+        self._value_read_only = read_only
+        self._value_secret_ref = secret_ref
+
+    @builtins.property
+    def iqn(self) -> builtins.str:
+        '''iqn is the target iSCSI Qualified Name.
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#iqn
+        '''
+        result = self._value_iqn
+        assert result is not None, "Required property 'iqn' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def lun(self) -> jsii.Number:
+        '''lun represents iSCSI Target Lun number.
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#lun
+        '''
+        result = self._value_lun
+        assert result is not None, "Required property 'lun' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def target_portal(self) -> builtins.str:
+        '''targetPortal is iSCSI Target Portal.
+
+        The Portal is either an IP or ip_addr:port if the port is other than default (typically TCP ports 860 and 3260).
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#targetPortal
+        '''
+        result = self._value_target_portal
+        assert result is not None, "Required property 'target_portal' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def chap_auth_discovery(self) -> typing.Optional[builtins.bool]:
+        '''chapAuthDiscovery defines whether support iSCSI Discovery CHAP authentication.
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#chapAuthDiscovery
+        '''
+        result = self._value_chap_auth_discovery
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def chap_auth_session(self) -> typing.Optional[builtins.bool]:
+        '''chapAuthSession defines whether support iSCSI Session CHAP authentication.
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#chapAuthSession
+        '''
+        result = self._value_chap_auth_session
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the filesystem type of the volume that you want to mount.
+
+        Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#iscsi
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def initiator_name(self) -> typing.Optional[builtins.str]:
+        '''initiatorName is the custom iSCSI Initiator Name.
+
+        If initiatorName is specified with iscsiInterface simultaneously, new iSCSI interface : will be created for the connection.
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#initiatorName
+        '''
+        result = self._value_initiator_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def iscsi_interface(self) -> typing.Optional[builtins.str]:
+        '''iscsiInterface is the interface Name that uses an iSCSI transport.
+
+        Defaults to 'default' (tcp).
+
+        :default: default' (tcp).
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#iscsiInterface
+        '''
+        result = self._value_iscsi_interface
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def portals(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''portals is the iSCSI Target Portal List.
+
+        The portal is either an IP or ip_addr:port if the port is other than default (typically TCP ports 860 and 3260).
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#portals
+        '''
+        result = self._value_portals
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly here will force the ReadOnly setting in VolumeMounts.
+
+        Defaults to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def secret_ref(self) -> typing.Optional["LocalObjectReference"]:
+        '''secretRef is the CHAP Secret for iSCSI target and initiator authentication.
+
+        :schema: io.k8s.api.core.v1.ISCSIVolumeSource#secretRef
+        '''
+        result = self._value_secret_ref
+        return typing.cast(typing.Optional["LocalObjectReference"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "iqn": self._value_iqn,
+            "lun": self._value_lun,
+            "target_portal": self._value_target_portal,
+        }
+        if self._value_chap_auth_discovery is not None:
+            values["chap_auth_discovery"] = self._value_chap_auth_discovery
+        if self._value_chap_auth_session is not None:
+            values["chap_auth_session"] = self._value_chap_auth_session
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_initiator_name is not None:
+            values["initiator_name"] = self._value_initiator_name
+        if self._value_iscsi_interface is not None:
+            values["iscsi_interface"] = self._value_iscsi_interface
+        if self._value_portals is not None:
+            values["portals"] = self._value_portals
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_secret_ref is not None:
+            values["secret_ref"] = self._value_secret_ref
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "IscsiVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__3f8a3f5224af62afa8f0a6e18b9dbecb3365354c791cdf02387e47f4f53ef0b6(
+    *,
+    iqn: builtins.str,
+    lun: jsii.Number,
+    target_portal: builtins.str,
+    chap_auth_discovery: typing.Optional[builtins.bool] = None,
+    chap_auth_session: typing.Optional[builtins.bool] = None,
+    fs_type: typing.Optional[builtins.str] = None,
+    initiator_name: typing.Optional[builtins.str] = None,
+    iscsi_interface: typing.Optional[builtins.str] = None,
+    portals: typing.Optional[typing.Sequence[builtins.str]] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    secret_ref: typing.Optional[typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,303 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+from .PodFailurePolicy import PodFailurePolicy
+from .PodTemplateSpec import PodTemplateSpec
+
+
+@jsii.data_type(
+    jsii_type="k8s.JobSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "template": "template",
+        "active_deadline_seconds": "activeDeadlineSeconds",
+        "backoff_limit": "backoffLimit",
+        "completion_mode": "completionMode",
+        "completions": "completions",
+        "manual_selector": "manualSelector",
+        "parallelism": "parallelism",
+        "pod_failure_policy": "podFailurePolicy",
+        "selector": "selector",
+        "suspend": "suspend",
+        "ttl_seconds_after_finished": "ttlSecondsAfterFinished",
+    },
+)
+class JobSpec(_base.Struct):
+    __slots__ = (
+        "_value_template",
+        "_value_active_deadline_seconds",
+        "_value_backoff_limit",
+        "_value_completion_mode",
+        "_value_completions",
+        "_value_manual_selector",
+        "_value_parallelism",
+        "_value_pod_failure_policy",
+        "_value_selector",
+        "_value_suspend",
+        "_value_ttl_seconds_after_finished",
+    )
+
+    def __init__(
+        self,
+        *,
+        template: typing.Union["PodTemplateSpec", typing.Dict[builtins.str, typing.Any]],
+        active_deadline_seconds: typing.Optional[jsii.Number] = None,
+        backoff_limit: typing.Optional[jsii.Number] = None,
+        completion_mode: typing.Optional[builtins.str] = None,
+        completions: typing.Optional[jsii.Number] = None,
+        manual_selector: typing.Optional[builtins.bool] = None,
+        parallelism: typing.Optional[jsii.Number] = None,
+        pod_failure_policy: typing.Optional[typing.Union["PodFailurePolicy", typing.Dict[builtins.str, typing.Any]]] = None,
+        selector: typing.Optional[typing.Union["LabelSelector", typing.Dict[builtins.str, typing.Any]]] = None,
+        suspend: typing.Optional[builtins.bool] = None,
+        ttl_seconds_after_finished: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''JobSpec describes how the job execution will look like.
+
+        :param template: Describes the pod that will be created when executing a job. More info: https://kubernetes.io/docs/concepts/workloads/controllers/jobs-run-to-completion/
+        :param active_deadline_seconds: Specifies the duration in seconds relative to the startTime that the job may be continuously active before the system tries to terminate it; value must be positive integer. If a Job is suspended (at creation or through an update), this timer will effectively be stopped and reset when the Job is resumed again.
+        :param backoff_limit: Specifies the number of retries before marking this job failed. Defaults to 6 Default: 6
+        :param completion_mode: CompletionMode specifies how Pod completions are tracked. It can be ``NonIndexed`` (default) or ``Indexed``. ``NonIndexed`` means that the Job is considered complete when there have been .spec.completions successfully completed Pods. Each Pod completion is homologous to each other. ``Indexed`` means that the Pods of a Job get an associated completion index from 0 to (.spec.completions - 1), available in the annotation batch.kubernetes.io/job-completion-index. The Job is considered complete when there is one successfully completed Pod for each index. When value is ``Indexed``, .spec.completions must be specified and ``.spec.parallelism`` must be less than or equal to 10^5. In addition, The Pod name takes the form ``$(job-name)-$(index)-$(random-string)``, the Pod hostname takes the form ``$(job-name)-$(index)``. More completion modes can be added in the future. If the Job controller observes a mode that it doesn't recognize, which is possible during upgrades due to version skew, the controller skips updates for the Job.
+        :param completions: Specifies the desired number of successfully finished pods the job should be run with. Setting to nil means that the success of any pod signals the success of all pods, and allows parallelism to have any positive value. Setting to 1 means that parallelism is limited to 1 and the success of that pod signals the success of the job. More info: https://kubernetes.io/docs/concepts/workloads/controllers/jobs-run-to-completion/
+        :param manual_selector: manualSelector controls generation of pod labels and pod selectors. Leave ``manualSelector`` unset unless you are certain what you are doing. When false or unset, the system pick labels unique to this job and appends those labels to the pod template. When true, the user is responsible for picking unique labels and specifying the selector. Failure to pick a unique label may cause this and other jobs to not function correctly. However, You may see ``manualSelector=true`` in jobs that were created with the old ``extensions/v1beta1`` API. More info: https://kubernetes.io/docs/concepts/workloads/controllers/jobs-run-to-completion/#specifying-your-own-pod-selector
+        :param parallelism: Specifies the maximum desired number of pods the job should run at any given time. The actual number of pods running in steady state will be less than this number when ((.spec.completions - .status.successful) < .spec.parallelism), i.e. when the work left to do is less than max parallelism. More info: https://kubernetes.io/docs/concepts/workloads/controllers/jobs-run-to-completion/
+        :param pod_failure_policy: Specifies the policy of handling failed pods. In particular, it allows to specify the set of actions and conditions which need to be satisfied to take the associated action. If empty, the default behaviour applies - the counter of failed pods, represented by the jobs's .status.failed field, is incremented and it is checked against the backoffLimit. This field cannot be used in combination with restartPolicy=OnFailure. This field is alpha-level. To use this field, you must enable the ``JobPodFailurePolicy`` feature gate (disabled by default).
+        :param selector: A label query over pods that should match the pod count. Normally, the system sets this field for you. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+        :param suspend: Suspend specifies whether the Job controller should create Pods or not. If a Job is created with suspend set to true, no Pods are created by the Job controller. If a Job is suspended after creation (i.e. the flag goes from false to true), the Job controller will delete all active Pods associated with this Job. Users must design their workload to gracefully handle this. Suspending a Job will reset the StartTime field of the Job, effectively resetting the ActiveDeadlineSeconds timer too. Defaults to false. Default: false.
+        :param ttl_seconds_after_finished: ttlSecondsAfterFinished limits the lifetime of a Job that has finished execution (either Complete or Failed). If this field is set, ttlSecondsAfterFinished after the Job finishes, it is eligible to be automatically deleted. When the Job is being deleted, its lifecycle guarantees (e.g. finalizers) will be honored. If this field is unset, the Job won't be automatically deleted. If this field is set to zero, the Job becomes eligible to be deleted immediately after it finishes.
+
+        :schema: io.k8s.api.batch.v1.JobSpec
+        '''
+        if isinstance(template, dict):
+            template = PodTemplateSpec(**template)
+        if isinstance(pod_failure_policy, dict):
+            pod_failure_policy = PodFailurePolicy(**pod_failure_policy)
+        if isinstance(selector, dict):
+            selector = LabelSelector(**selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__292598de0c2d5d5c366c954213d0653c155500e82fa84af63083a2187622ca4d)
+            check_type(argname="argument template", value=template, expected_type=type_hints["template"])
+            check_type(argname="argument active_deadline_seconds", value=active_deadline_seconds, expected_type=type_hints["active_deadline_seconds"])
+            check_type(argname="argument backoff_limit", value=backoff_limit, expected_type=type_hints["backoff_limit"])
+            check_type(argname="argument completion_mode", value=completion_mode, expected_type=type_hints["completion_mode"])
+            check_type(argname="argument completions", value=completions, expected_type=type_hints["completions"])
+            check_type(argname="argument manual_selector", value=manual_selector, expected_type=type_hints["manual_selector"])
+            check_type(argname="argument parallelism", value=parallelism, expected_type=type_hints["parallelism"])
+            check_type(argname="argument pod_failure_policy", value=pod_failure_policy, expected_type=type_hints["pod_failure_policy"])
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+            check_type(argname="argument suspend", value=suspend, expected_type=type_hints["suspend"])
+            check_type(argname="argument ttl_seconds_after_finished", value=ttl_seconds_after_finished, expected_type=type_hints["ttl_seconds_after_finished"])
+        self._value_template = template
+        self._value_active_deadline_seconds = active_deadline_seconds
+        self._value_backoff_limit = backoff_limit
+        self._value_completion_mode = completion_mode
+        self._value_completions = completions
+        self._value_manual_selector = manual_selector
+        self._value_parallelism = parallelism
+        self._value_pod_failure_policy = pod_failure_policy
+        self._value_selector = selector
+        self._value_suspend = suspend
+        self._value_ttl_seconds_after_finished = ttl_seconds_after_finished
+
+    @builtins.property
+    def template(self) -> "PodTemplateSpec":
+        '''Describes the pod that will be created when executing a job.
+
+        More info: https://kubernetes.io/docs/concepts/workloads/controllers/jobs-run-to-completion/
+
+        :schema: io.k8s.api.batch.v1.JobSpec#template
+        '''
+        result = self._value_template
+        assert result is not None, "Required property 'template' is missing"
+        return typing.cast("PodTemplateSpec", result)
+
+    @builtins.property
+    def active_deadline_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Specifies the duration in seconds relative to the startTime that the job may be continuously active before the system tries to terminate it;
+
+        value must be positive integer. If a Job is suspended (at creation or through an update), this timer will effectively be stopped and reset when the Job is resumed again.
+
+        :schema: io.k8s.api.batch.v1.JobSpec#activeDeadlineSeconds
+        '''
+        result = self._value_active_deadline_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def backoff_limit(self) -> typing.Optional[jsii.Number]:
+        '''Specifies the number of retries before marking this job failed.
+
+        Defaults to 6
+
+        :default: 6
+
+        :schema: io.k8s.api.batch.v1.JobSpec#backoffLimit
+        '''
+        result = self._value_backoff_limit
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def completion_mode(self) -> typing.Optional[builtins.str]:
+        '''CompletionMode specifies how Pod completions are tracked. It can be ``NonIndexed`` (default) or ``Indexed``.
+
+        ``NonIndexed`` means that the Job is considered complete when there have been .spec.completions successfully completed Pods. Each Pod completion is homologous to each other.
+
+        ``Indexed`` means that the Pods of a Job get an associated completion index from 0 to (.spec.completions - 1), available in the annotation batch.kubernetes.io/job-completion-index. The Job is considered complete when there is one successfully completed Pod for each index. When value is ``Indexed``, .spec.completions must be specified and ``.spec.parallelism`` must be less than or equal to 10^5. In addition, The Pod name takes the form ``$(job-name)-$(index)-$(random-string)``, the Pod hostname takes the form ``$(job-name)-$(index)``.
+
+        More completion modes can be added in the future. If the Job controller observes a mode that it doesn't recognize, which is possible during upgrades due to version skew, the controller skips updates for the Job.
+
+        :schema: io.k8s.api.batch.v1.JobSpec#completionMode
+        '''
+        result = self._value_completion_mode
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def completions(self) -> typing.Optional[jsii.Number]:
+        '''Specifies the desired number of successfully finished pods the job should be run with.
+
+        Setting to nil means that the success of any pod signals the success of all pods, and allows parallelism to have any positive value.  Setting to 1 means that parallelism is limited to 1 and the success of that pod signals the success of the job. More info: https://kubernetes.io/docs/concepts/workloads/controllers/jobs-run-to-completion/
+
+        :schema: io.k8s.api.batch.v1.JobSpec#completions
+        '''
+        result = self._value_completions
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def manual_selector(self) -> typing.Optional[builtins.bool]:
+        '''manualSelector controls generation of pod labels and pod selectors.
+
+        Leave ``manualSelector`` unset unless you are certain what you are doing. When false or unset, the system pick labels unique to this job and appends those labels to the pod template.  When true, the user is responsible for picking unique labels and specifying the selector.  Failure to pick a unique label may cause this and other jobs to not function correctly.  However, You may see ``manualSelector=true`` in jobs that were created with the old ``extensions/v1beta1`` API. More info: https://kubernetes.io/docs/concepts/workloads/controllers/jobs-run-to-completion/#specifying-your-own-pod-selector
+
+        :schema: io.k8s.api.batch.v1.JobSpec#manualSelector
+        '''
+        result = self._value_manual_selector
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def parallelism(self) -> typing.Optional[jsii.Number]:
+        '''Specifies the maximum desired number of pods the job should run at any given time.
+
+        The actual number of pods running in steady state will be less than this number when ((.spec.completions - .status.successful) < .spec.parallelism), i.e. when the work left to do is less than max parallelism. More info: https://kubernetes.io/docs/concepts/workloads/controllers/jobs-run-to-completion/
+
+        :schema: io.k8s.api.batch.v1.JobSpec#parallelism
+        '''
+        result = self._value_parallelism
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def pod_failure_policy(self) -> typing.Optional["PodFailurePolicy"]:
+        '''Specifies the policy of handling failed pods.
+
+        In particular, it allows to specify the set of actions and conditions which need to be satisfied to take the associated action. If empty, the default behaviour applies - the counter of failed pods, represented by the jobs's .status.failed field, is incremented and it is checked against the backoffLimit. This field cannot be used in combination with restartPolicy=OnFailure.
+
+        This field is alpha-level. To use this field, you must enable the ``JobPodFailurePolicy`` feature gate (disabled by default).
+
+        :schema: io.k8s.api.batch.v1.JobSpec#podFailurePolicy
+        '''
+        result = self._value_pod_failure_policy
+        return typing.cast(typing.Optional["PodFailurePolicy"], result)
+
+    @builtins.property
+    def selector(self) -> typing.Optional["LabelSelector"]:
+        '''A label query over pods that should match the pod count.
+
+        Normally, the system sets this field for you. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+
+        :schema: io.k8s.api.batch.v1.JobSpec#selector
+        '''
+        result = self._value_selector
+        return typing.cast(typing.Optional["LabelSelector"], result)
+
+    @builtins.property
+    def suspend(self) -> typing.Optional[builtins.bool]:
+        '''Suspend specifies whether the Job controller should create Pods or not.
+
+        If a Job is created with suspend set to true, no Pods are created by the Job controller. If a Job is suspended after creation (i.e. the flag goes from false to true), the Job controller will delete all active Pods associated with this Job. Users must design their workload to gracefully handle this. Suspending a Job will reset the StartTime field of the Job, effectively resetting the ActiveDeadlineSeconds timer too. Defaults to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.batch.v1.JobSpec#suspend
+        '''
+        result = self._value_suspend
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def ttl_seconds_after_finished(self) -> typing.Optional[jsii.Number]:
+        '''ttlSecondsAfterFinished limits the lifetime of a Job that has finished execution (either Complete or Failed).
+
+        If this field is set, ttlSecondsAfterFinished after the Job finishes, it is eligible to be automatically deleted. When the Job is being deleted, its lifecycle guarantees (e.g. finalizers) will be honored. If this field is unset, the Job won't be automatically deleted. If this field is set to zero, the Job becomes eligible to be deleted immediately after it finishes.
+
+        :schema: io.k8s.api.batch.v1.JobSpec#ttlSecondsAfterFinished
+        '''
+        result = self._value_ttl_seconds_after_finished
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "template": self._value_template,
+        }
+        if self._value_active_deadline_seconds is not None:
+            values["active_deadline_seconds"] = self._value_active_deadline_seconds
+        if self._value_backoff_limit is not None:
+            values["backoff_limit"] = self._value_backoff_limit
+        if self._value_completion_mode is not None:
+            values["completion_mode"] = self._value_completion_mode
+        if self._value_completions is not None:
+            values["completions"] = self._value_completions
+        if self._value_manual_selector is not None:
+            values["manual_selector"] = self._value_manual_selector
+        if self._value_parallelism is not None:
+            values["parallelism"] = self._value_parallelism
+        if self._value_pod_failure_policy is not None:
+            values["pod_failure_policy"] = self._value_pod_failure_policy
+        if self._value_selector is not None:
+            values["selector"] = self._value_selector
+        if self._value_suspend is not None:
+            values["suspend"] = self._value_suspend
+        if self._value_ttl_seconds_after_finished is not None:
+            values["ttl_seconds_after_finished"] = self._value_ttl_seconds_after_finished
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "JobSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__292598de0c2d5d5c366c954213d0653c155500e82fa84af63083a2187622ca4d(
+    *,
+    template: typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]],
+    active_deadline_seconds: typing.Optional[jsii.Number] = None,
+    backoff_limit: typing.Optional[jsii.Number] = None,
+    completion_mode: typing.Optional[builtins.str] = None,
+    completions: typing.Optional[jsii.Number] = None,
+    manual_selector: typing.Optional[builtins.bool] = None,
+    parallelism: typing.Optional[jsii.Number] = None,
+    pod_failure_policy: typing.Optional[typing.Union[PodFailurePolicy, typing.Dict[builtins.str, typing.Any]]] = None,
+    selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    suspend: typing.Optional[builtins.bool] = None,
+    ttl_seconds_after_finished: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
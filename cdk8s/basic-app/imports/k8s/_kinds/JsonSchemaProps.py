@@ -0,0 +1,886 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ExternalDocumentation import ExternalDocumentation
+from .ValidationRule import ValidationRule
+
+
+@jsii.data_type(
+    jsii_type="k8s.JsonSchemaProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "additional_items": "additionalItems",
+        "additional_properties": "additionalProperties",
+        "all_of": "allOf",
+        "any_of": "anyOf",
+        "default": "default",
+        "definitions": "definitions",
+        "dependencies": "dependencies",
+        "description": "description",
+        "enum": "enum",
+        "example": "example",
+        "exclusive_maximum": "exclusiveMaximum",
+        "exclusive_minimum": "exclusiveMinimum",
+        "external_docs": "externalDocs",
+        "format": "format",
+        "id": "id",
+        "items": "items",
+        "maximum": "maximum",
+        "max_items": "maxItems",
+        "max_length": "maxLength",
+        "max_properties": "maxProperties",
+        "minimum": "minimum",
+        "min_items": "minItems",
+        "min_length": "minLength",
+        "min_properties": "minProperties",
+        "multiple_of": "multipleOf",
+        "not_": "not",
+        "nullable": "nullable",
+        "one_of": "oneOf",
+        "pattern": "pattern",
+        "pattern_properties": "patternProperties",
+        "properties": "properties",
+        "ref": "ref",
+        "required": "required",
+        "schema": "schema",
+        "title": "title",
+        "type": "type",
+        "unique_items": "uniqueItems",
+        "x_kubernetes_embedded_resource": "xKubernetesEmbeddedResource",
+        "x_kubernetes_int_or_string": "xKubernetesIntOrString",
+        "x_kubernetes_list_map_keys": "xKubernetesListMapKeys",
+        "x_kubernetes_list_type": "xKubernetesListType",
+        "x_kubernetes_map_type": "xKubernetesMapType",
+        "x_kubernetes_preserve_unknown_fields": "xKubernetesPreserveUnknownFields",
+        "x_kubernetes_validations": "xKubernetesValidations",
+    },
+)
+class JsonSchemaProps(_base.Struct):
+    __slots__ = (
+        "_value_additional_items",
+        "_value_additional_properties",
+        "_value_all_of",
+        "_value_any_of",
+        "_value_default",
+        "_value_definitions",
+        "_value_dependencies",
+        "_value_description",
+        "_value_enum",
+        "_value_example",
+        "_value_exclusive_maximum",
+        "_value_exclusive_minimum",
+        "_value_external_docs",
+        "_value_format",
+        "_value_id",
+        "_value_items",
+        "_value_maximum",
+        "_value_max_items",
+        "_value_max_length",
+        "_value_max_properties",
+        "_value_minimum",
+        "_value_min_items",
+        "_value_min_length",
+        "_value_min_properties",
+        "_value_multiple_of",
+        "_value_not_",
+        "_value_nullable",
+        "_value_one_of",
+        "_value_pattern",
+        "_value_pattern_properties",
+        "_value_properties",
+        "_value_ref",
+        "_value_required",
+        "_value_schema",
+        "_value_title",
+        "_value_type",
+        "_value_unique_items",
+        "_value_x_kubernetes_embedded_resource",
+        "_value_x_kubernetes_int_or_string",
+        "_value_x_kubernetes_list_map_keys",
+        "_value_x_kubernetes_list_type",
+        "_value_x_kubernetes_map_type",
+        "_value_x_kubernetes_preserve_unknown_fields",
+        "_value_x_kubernetes_validations",
+    )
+
+    def __init__(
+        self,
+        *,
+        additional_items: typing.Any = None,
+        additional_properties: typing.Any = None,
+        all_of: typing.Optional[typing.Sequence[typing.Union["JsonSchemaProps", typing.Dict[builtins.str, typing.Any]]]] = None,
+        any_of: typing.Optional[typing.Sequence[typing.Union["JsonSchemaProps", typing.Dict[builtins.str, typing.Any]]]] = None,
+        default: typing.Any = None,
+        definitions: typing.Optional[typing.Mapping[builtins.str, typing.Union["JsonSchemaProps", typing.Dict[builtins.str, typing.Any]]]] = None,
+        dependencies: typing.Optional[typing.Mapping[builtins.str, typing.Any]] = None,
+        description: typing.Optional[builtins.str] = None,
+        enum: typing.Optional[typing.Sequence[typing.Any]] = None,
+        example: typing.Any = None,
+        exclusive_maximum: typing.Optional[builtins.bool] = None,
+        exclusive_minimum: typing.Optional[builtins.bool] = None,
+        external_docs: typing.Optional[typing.Union[ExternalDocumentation, typing.Dict[builtins.str, typing.Any]]] = None,
+        format: typing.Optional[builtins.str] = None,
+        id: typing.Optional[builtins.str] = None,
+        items: typing.Any = None,
+        maximum: typing.Optional[jsii.Number] = None,
+        max_items: typing.Optional[jsii.Number] = None,
+        max_length: typing.Optional[jsii.Number] = None,
+        max_properties: typing.Optional[jsii.Number] = None,
+        minimum: typing.Optional[jsii.Number] = None,
+        min_items: typing.Optional[jsii.Number] = None,
+        min_length: typing.Optional[jsii.Number] = None,
+        min_properties: typing.Optional[jsii.Number] = None,
+        multiple_of: typing.Optional[jsii.Number] = None,
+        not_: typing.Optional[typing.Union["JsonSchemaProps", typing.Dict[builtins.str, typing.Any]]] = None,
+        nullable: typing.Optional[builtins.bool] = None,
+        one_of: typing.Optional[typing.Sequence[typing.Union["JsonSchemaProps", typing.Dict[builtins.str, typing.Any]]]] = None,
+        pattern: typing.Optional[builtins.str] = None,
+        pattern_properties: typing.Optional[typing.Mapping[builtins.str, typing.Union["JsonSchemaProps", typing.Dict[builtins.str, typing.Any]]]] = None,
+        properties: typing.Optional[typing.Mapping[builtins.str, typing.Union["JsonSchemaProps", typing.Dict[builtins.str, typing.Any]]]] = None,
+        ref: typing.Optional[builtins.str] = None,
+        required: typing.Optional[typing.Sequence[builtins.str]] = None,
+        schema: typing.Optional[builtins.str] = None,
+        title: typing.Optional[builtins.str] = None,
+        type: typing.Optional[builtins.str] = None,
+        unique_items: typing.Optional[builtins.bool] = None,
+        x_kubernetes_embedded_resource: typing.Optional[builtins.bool] = None,
+        x_kubernetes_int_or_string: typing.Optional[builtins.bool] = None,
+        x_kubernetes_list_map_keys: typing.Optional[typing.Sequence[builtins.str]] = None,
+        x_kubernetes_list_type: typing.Optional[builtins.str] = None,
+        x_kubernetes_map_type: typing.Optional[builtins.str] = None,
+        x_kubernetes_preserve_unknown_fields: typing.Optional[builtins.bool] = None,
+        x_kubernetes_validations: typing.Optional[typing.Sequence[typing.Union["ValidationRule", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''JSONSchemaProps is a JSON-Schema following Specification Draft 4 (http://json-schema.org/).
+
+        :param additional_items: 
+        :param additional_properties: 
+        :param all_of: 
+        :param any_of: 
+        :param default: default is a default value for undefined object fields. Defaulting is a beta feature under the CustomResourceDefaulting feature gate. Defaulting requires spec.preserveUnknownFields to be false.
+        :param definitions: 
+        :param dependencies: 
+        :param description: 
+        :param enum: 
+        :param example: 
+        :param exclusive_maximum: 
+        :param exclusive_minimum: 
+        :param external_docs: 
+        :param format: format is an OpenAPI v3 format string. Unknown formats are ignored. The following formats are validated:. - bsonobjectid: a bson object ID, i.e. a 24 characters hex string - uri: an URI as parsed by Golang net/url.ParseRequestURI - email: an email address as parsed by Golang net/mail.ParseAddress - hostname: a valid representation for an Internet host name, as defined by RFC 1034, section 3.1 [RFC1034]. - ipv4: an IPv4 IP as parsed by Golang net.ParseIP - ipv6: an IPv6 IP as parsed by Golang net.ParseIP - cidr: a CIDR as parsed by Golang net.ParseCIDR - mac: a MAC address as parsed by Golang net.ParseMAC - uuid: an UUID that allows uppercase defined by the regex (?i)^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$ - uuid3: an UUID3 that allows uppercase defined by the regex (?i)^[0-9a-f]{8}-?[0-9a-f]{4}-?3[0-9a-f]{3}-?[0-9a-f]{4}-?[0-9a-f]{12}$ - uuid4: an UUID4 that allows uppercase defined by the regex (?i)^[0-9a-f]{8}-?[0-9a-f]{4}-?4[0-9a-f]{3}-?[89ab][0-9a-f]{3}-?[0-9a-f]{12}$ - uuid5: an UUID5 that allows uppercase defined by the regex (?i)^[0-9a-f]{8}-?[0-9a-f]{4}-?5[0-9a-f]{3}-?[89ab][0-9a-f]{3}-?[0-9a-f]{12}$ - isbn: an ISBN10 or ISBN13 number string like "0321751043" or "978-0321751041" - isbn10: an ISBN10 number string like "0321751043" - isbn13: an ISBN13 number string like "978-0321751041" - creditcard: a credit card number defined by the regex ^(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|6(?:011|5[0-9][0-9])[0-9]{12}|3[47][0-9]{13}|3(?:0[0-5]|[68][0-9])[0-9]{11}|(?:2131|1800|35\\d{3})\\d{11})$ with any non digit characters mixed in - ssn: a U.S. social security number following the regex ^\\d{3}[- ]?\\d{2}[- ]?\\d{4}$ - hexcolor: an hexadecimal color code like "#FFFFFF: following the regex ^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$ - rgbcolor: an RGB color code like rgb like "rgb(255,255,2559" - byte: base64 encoded binary data - password: any kind of string - date: a date string like "2006-01-02" as defined by full-date in RFC3339 - duration: a duration string like "22 ns" as parsed by Golang time.ParseDuration or compatible with Scala duration format - datetime: a date time string like "2014-12-15T19:30:20.000Z" as defined by date-time in RFC3339.
+        :param id: 
+        :param items: 
+        :param maximum: 
+        :param max_items: 
+        :param max_length: 
+        :param max_properties: 
+        :param minimum: 
+        :param min_items: 
+        :param min_length: 
+        :param min_properties: 
+        :param multiple_of: 
+        :param not_: 
+        :param nullable: 
+        :param one_of: 
+        :param pattern: 
+        :param pattern_properties: 
+        :param properties: 
+        :param ref: 
+        :param required: 
+        :param schema: 
+        :param title: 
+        :param type: 
+        :param unique_items: 
+        :param x_kubernetes_embedded_resource: x-kubernetes-embedded-resource defines that the value is an embedded Kubernetes runtime.Object, with TypeMeta and ObjectMeta. The type must be object. It is allowed to further restrict the embedded object. kind, apiVersion and metadata are validated automatically. x-kubernetes-preserve-unknown-fields is allowed to be true, but does not have to be if the object is fully specified (up to kind, apiVersion, metadata).
+        :param x_kubernetes_int_or_string: x-kubernetes-int-or-string specifies that this value is either an integer or a string. If this is true, an empty type is allowed and type as child of anyOf is permitted if following one of the following patterns: 1. anyOf: - type: integer - type: string 2. allOf: - anyOf: - type: integer - type: string - ... zero or more
+        :param x_kubernetes_list_map_keys: x-kubernetes-list-map-keys annotates an array with the x-kubernetes-list-type ``map`` by specifying the keys used as the index of the map. This tag MUST only be used on lists that have the "x-kubernetes-list-type" extension set to "map". Also, the values specified for this attribute must be a scalar typed field of the child structure (no nesting is supported). The properties specified must either be required or have a default value, to ensure those properties are present for all list items.
+        :param x_kubernetes_list_type: x-kubernetes-list-type annotates an array to further describe its topology. This extension must only be used on lists and may have 3 possible values: 1. ``atomic``: the list is treated as a single entity, like a scalar. Atomic lists will be entirely replaced when updated. This extension may be used on any type of list (struct, scalar, ...). 2. ``set``: Sets are lists that must not have multiple items with the same value. Each value must be a scalar, an object with x-kubernetes-map-type ``atomic`` or an array with x-kubernetes-list-type ``atomic``. 3. ``map``: These lists are like maps in that their elements have a non-index key used to identify them. Order is preserved upon merge. The map tag must only be used on a list with elements of type object. Defaults to atomic for arrays. Default: atomic for arrays.
+        :param x_kubernetes_map_type: x-kubernetes-map-type annotates an object to further describe its topology. This extension must only be used when type is object and may have 2 possible values: 1. ``granular``: These maps are actual maps (key-value pairs) and each fields are independent from each other (they can each be manipulated by separate actors). This is the default behaviour for all maps. 2. ``atomic``: the list is treated as a single entity, like a scalar. Atomic maps will be entirely replaced when updated.
+        :param x_kubernetes_preserve_unknown_fields: x-kubernetes-preserve-unknown-fields stops the API server decoding step from pruning fields which are not specified in the validation schema. This affects fields recursively, but switches back to normal pruning behaviour if nested properties or additionalProperties are specified in the schema. This can either be true or undefined. False is forbidden.
+        :param x_kubernetes_validations: x-kubernetes-validations describes a list of validation rules written in the CEL expression language. This field is an alpha-level. Using this field requires the feature gate ``CustomResourceValidationExpressions`` to be enabled.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps
+        '''
+        if isinstance(external_docs, dict):
+            external_docs = ExternalDocumentation(**external_docs)
+        if isinstance(not_, dict):
+            not_ = JsonSchemaProps(**not_)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__daf776f0153100d207addeedc621b9aaef5a61bb490f24eaa0139862d3db2a89)
+            check_type(argname="argument additional_items", value=additional_items, expected_type=type_hints["additional_items"])
+            check_type(argname="argument additional_properties", value=additional_properties, expected_type=type_hints["additional_properties"])
+            check_type(argname="argument all_of", value=all_of, expected_type=type_hints["all_of"])
+            check_type(argname="argument any_of", value=any_of, expected_type=type_hints["any_of"])
+            check_type(argname="argument default", value=default, expected_type=type_hints["default"])
+            check_type(argname="argument definitions", value=definitions, expected_type=type_hints["definitions"])
+            check_type(argname="argument dependencies", value=dependencies, expected_type=type_hints["dependencies"])
+            check_type(argname="argument description", value=description, expected_type=type_hints["description"])
+            check_type(argname="argument enum", value=enum, expected_type=type_hints["enum"])
+            check_type(argname="argument example", value=example, expected_type=type_hints["example"])
+            check_type(argname="argument exclusive_maximum", value=exclusive_maximum, expected_type=type_hints["exclusive_maximum"])
+            check_type(argname="argument exclusive_minimum", value=exclusive_minimum, expected_type=type_hints["exclusive_minimum"])
+            check_type(argname="argument external_docs", value=external_docs, expected_type=type_hints["external_docs"])
+            check_type(argname="argument format", value=format, expected_type=type_hints["format"])
+            check_type(argname="argument id", value=id, expected_type=type_hints["id"])
+            check_type(argname="argument items", value=items, expected_type=type_hints["items"])
+            check_type(argname="argument maximum", value=maximum, expected_type=type_hints["maximum"])
+            check_type(argname="argument max_items", value=max_items, expected_type=type_hints["max_items"])
+            check_type(argname="argument max_length", value=max_length, expected_type=type_hints["max_length"])
+            check_type(argname="argument max_properties", value=max_properties, expected_type=type_hints["max_properties"])
+            check_type(argname="argument minimum", value=minimum, expected_type=type_hints["minimum"])
+            check_type(argname="argument min_items", value=min_items, expected_type=type_hints["min_items"])
+            check_type(argname="argument min_length", value=min_length, expected_type=type_hints["min_length"])
+            check_type(argname="argument min_properties", value=min_properties, expected_type=type_hints["min_properties"])
+            check_type(argname="argument multiple_of", value=multiple_of, expected_type=type_hints["multiple_of"])
+            check_type(argname="argument not_", value=not_, expected_type=type_hints["not_"])
+            check_type(argname="argument nullable", value=nullable, expected_type=type_hints["nullable"])
+            check_type(argname="argument one_of", value=one_of, expected_type=type_hints["one_of"])
+            check_type(argname="argument pattern", value=pattern, expected_type=type_hints["pattern"])
+            check_type(argname="argument pattern_properties", value=pattern_properties, expected_type=type_hints["pattern_properties"])
+            check_type(argname="argument properties", value=properties, expected_type=type_hints["properties"])
+            check_type(argname="argument ref", value=ref, expected_type=type_hints["ref"])
+            check_type(argname="argument required", value=required, expected_type=type_hints["required"])
+            check_type(argname="argument schema", value=schema, expected_type=type_hints["schema"])
+            check_type(argname="argument title", value=title, expected_type=type_hints["title"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument unique_items", value=unique_items, expected_type=type_hints["unique_items"])
+            check_type(argname="argument x_kubernetes_embedded_resource", value=x_kubernetes_embedded_resource, expected_type=type_hints["x_kubernetes_embedded_resource"])
+            check_type(argname="argument x_kubernetes_int_or_string", value=x_kubernetes_int_or_string, expected_type=type_hints["x_kubernetes_int_or_string"])
+            check_type(argname="argument x_kubernetes_list_map_keys", value=x_kubernetes_list_map_keys, expected_type=type_hints["x_kubernetes_list_map_keys"])
+            check_type(argname="argument x_kubernetes_list_type", value=x_kubernetes_list_type, expected_type=type_hints["x_kubernetes_list_type"])
+            check_type(argname="argument x_kubernetes_map_type", value=x_kubernetes_map_type, expected_type=type_hints["x_kubernetes_map_type"])
+            check_type(argname="argument x_kubernetes_preserve_unknown_fields", value=x_kubernetes_preserve_unknown_fields, expected_type=type_hints["x_kubernetes_preserve_unknown_fields"])
+            check_type(argname="argument x_kubernetes_validations", value=x_kubernetes_validations, expected_type=type_hints["x_kubernetes_validations"])
+        self._value_additional_items = additional_items
+        self._value_additional_properties = additional_properties
+        self._value_all_of = all_of
+        self._value_any_of = any_of
+        self._value_default = default
+        self._value_definitions = definitions
+        self._value_dependencies = dependencies
+        self._value_description = description
+        self._value_enum = enum
+        self._value_example = example
+        self._value_exclusive_maximum = exclusive_maximum
+        self._value_exclusive_minimum = exclusive_minimum
+        self._value_external_docs = external_docs
+        self._value_format = format
+        self._value_id = id
+        self._value_items = items
+        self._value_maximum = maximum
+        self._value_max_items = max_items
+        self._value_max_length = max_length
+        self._value_max_properties = max_properties
+        self._value_minimum = minimum
+        self._value_min_items = min_items
+        self._value_min_length = min_length
+        self._value_min_properties = min_properties
+        self._value_multiple_of = multiple_of
+        self._value_not_ = not_
+        self._value_nullable = nullable
+        self._value_one_of = one_of
+        self._value_pattern = pattern
+        self._value_pattern_properties = pattern_properties
+        self._value_properties = properties
+        self._value_ref = ref
+        self._value_required = required
+        self._value_schema = schema
+        self._value_title = title
+        self._value_type = type
+        self._value_unique_items = unique_items
+        self._value_x_kubernetes_embedded_resource = x_kubernetes_embedded_resource
+        self._value_x_kubernetes_int_or_string = x_kubernetes_int_or_string
+        self._value_x_kubernetes_list_map_keys = x_kubernetes_list_map_keys
+        self._value_x_kubernetes_list_type = x_kubernetes_list_type
+        self._value_x_kubernetes_map_type = x_kubernetes_map_type
+        self._value_x_kubernetes_preserve_unknown_fields = x_kubernetes_preserve_unknown_fields
+        self._value_x_kubernetes_validations = x_kubernetes_validations
+
+    @builtins.property
+    def additional_items(self) -> typing.Any:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#additionalItems
+        '''
+        result = self._value_additional_items
+        return typing.cast(typing.Any, result)
+
+    @builtins.property
+    def additional_properties(self) -> typing.Any:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#additionalProperties
+        '''
+        result = self._value_additional_properties
+        return typing.cast(typing.Any, result)
+
+    @builtins.property
+    def all_of(self) -> typing.Optional[typing.List["JsonSchemaProps"]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#allOf
+        '''
+        result = self._value_all_of
+        return typing.cast(typing.Optional[typing.List["JsonSchemaProps"]], result)
+
+    @builtins.property
+    def any_of(self) -> typing.Optional[typing.List["JsonSchemaProps"]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#anyOf
+        '''
+        result = self._value_any_of
+        return typing.cast(typing.Optional[typing.List["JsonSchemaProps"]], result)
+
+    @builtins.property
+    def default(self) -> typing.Any:
+        '''default is a default value for undefined object fields.
+
+        Defaulting is a beta feature under the CustomResourceDefaulting feature gate. Defaulting requires spec.preserveUnknownFields to be false.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#default
+        '''
+        result = self._value_default
+        return typing.cast(typing.Any, result)
+
+    @builtins.property
+    def definitions(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, "JsonSchemaProps"]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#definitions
+        '''
+        result = self._value_definitions
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "JsonSchemaProps"]], result)
+
+    @builtins.property
+    def dependencies(self) -> typing.Optional[typing.Mapping[builtins.str, typing.Any]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#dependencies
+        '''
+        result = self._value_dependencies
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, typing.Any]], result)
+
+    @builtins.property
+    def description(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#description
+        '''
+        result = self._value_description
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def enum(self) -> typing.Optional[typing.List[typing.Any]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#enum
+        '''
+        result = self._value_enum
+        return typing.cast(typing.Optional[typing.List[typing.Any]], result)
+
+    @builtins.property
+    def example(self) -> typing.Any:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#example
+        '''
+        result = self._value_example
+        return typing.cast(typing.Any, result)
+
+    @builtins.property
+    def exclusive_maximum(self) -> typing.Optional[builtins.bool]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#exclusiveMaximum
+        '''
+        result = self._value_exclusive_maximum
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def exclusive_minimum(self) -> typing.Optional[builtins.bool]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#exclusiveMinimum
+        '''
+        result = self._value_exclusive_minimum
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def external_docs(self) -> typing.Optional[ExternalDocumentation]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#externalDocs
+        '''
+        result = self._value_external_docs
+        return typing.cast(typing.Optional[ExternalDocumentation], result)
+
+    @builtins.property
+    def format(self) -> typing.Optional[builtins.str]:
+        '''format is an OpenAPI v3 format string. Unknown formats are ignored. The following formats are validated:.
+
+        - bsonobjectid: a bson object ID, i.e. a 24 characters hex string - uri: an URI as parsed by Golang net/url.ParseRequestURI - email: an email address as parsed by Golang net/mail.ParseAddress - hostname: a valid representation for an Internet host name, as defined by RFC 1034, section 3.1 [RFC1034]. - ipv4: an IPv4 IP as parsed by Golang net.ParseIP - ipv6: an IPv6 IP as parsed by Golang net.ParseIP - cidr: a CIDR as parsed by Golang net.ParseCIDR - mac: a MAC address as parsed by Golang net.ParseMAC - uuid: an UUID that allows uppercase defined by the regex (?i)^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$ - uuid3: an UUID3 that allows uppercase defined by the regex (?i)^[0-9a-f]{8}-?[0-9a-f]{4}-?3[0-9a-f]{3}-?[0-9a-f]{4}-?[0-9a-f]{12}$ - uuid4: an UUID4 that allows uppercase defined by the regex (?i)^[0-9a-f]{8}-?[0-9a-f]{4}-?4[0-9a-f]{3}-?[89ab][0-9a-f]{3}-?[0-9a-f]{12}$ - uuid5: an UUID5 that allows uppercase defined by the regex (?i)^[0-9a-f]{8}-?[0-9a-f]{4}-?5[0-9a-f]{3}-?[89ab][0-9a-f]{3}-?[0-9a-f]{12}$ - isbn: an ISBN10 or ISBN13 number string like "0321751043" or "978-0321751041" - isbn10: an ISBN10 number string like "0321751043" - isbn13: an ISBN13 number string like "978-0321751041" - creditcard: a credit card number defined by the regex ^(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|6(?:011|5[0-9][0-9])[0-9]{12}|3[47][0-9]{13}|3(?:0[0-5]|[68][0-9])[0-9]{11}|(?:2131|1800|35\\d{3})\\d{11})$ with any non digit characters mixed in - ssn: a U.S. social security number following the regex ^\\d{3}[- ]?\\d{2}[- ]?\\d{4}$ - hexcolor: an hexadecimal color code like "#FFFFFF: following the regex ^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$ - rgbcolor: an RGB color code like rgb like "rgb(255,255,2559" - byte: base64 encoded binary data - password: any kind of string - date: a date string like "2006-01-02" as defined by full-date in RFC3339 - duration: a duration string like "22 ns" as parsed by Golang time.ParseDuration or compatible with Scala duration format - datetime: a date time string like "2014-12-15T19:30:20.000Z" as defined by date-time in RFC3339.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#format
+        '''
+        result = self._value_format
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def id(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#id
+        '''
+        result = self._value_id
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def items(self) -> typing.Any:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#items
+        '''
+        result = self._value_items
+        return typing.cast(typing.Any, result)
+
+    @builtins.property
+    def maximum(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#maximum
+        '''
+        result = self._value_maximum
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def max_items(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#maxItems
+        '''
+        result = self._value_max_items
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def max_length(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#maxLength
+        '''
+        result = self._value_max_length
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def max_properties(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#maxProperties
+        '''
+        result = self._value_max_properties
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def minimum(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#minimum
+        '''
+        result = self._value_minimum
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def min_items(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#minItems
+        '''
+        result = self._value_min_items
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def min_length(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#minLength
+        '''
+        result = self._value_min_length
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def min_properties(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#minProperties
+        '''
+        result = self._value_min_properties
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def multiple_of(self) -> typing.Optional[jsii.Number]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#multipleOf
+        '''
+        result = self._value_multiple_of
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def not_(self) -> typing.Optional["JsonSchemaProps"]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#not
+        '''
+        result = self._value_not_
+        return typing.cast(typing.Optional["JsonSchemaProps"], result)
+
+    @builtins.property
+    def nullable(self) -> typing.Optional[builtins.bool]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#nullable
+        '''
+        result = self._value_nullable
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def one_of(self) -> typing.Optional[typing.List["JsonSchemaProps"]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#oneOf
+        '''
+        result = self._value_one_of
+        return typing.cast(typing.Optional[typing.List["JsonSchemaProps"]], result)
+
+    @builtins.property
+    def pattern(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#pattern
+        '''
+        result = self._value_pattern
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def pattern_properties(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, "JsonSchemaProps"]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#patternProperties
+        '''
+        result = self._value_pattern_properties
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "JsonSchemaProps"]], result)
+
+    @builtins.property
+    def properties(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, "JsonSchemaProps"]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#properties
+        '''
+        result = self._value_properties
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "JsonSchemaProps"]], result)
+
+    @builtins.property
+    def ref(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#$ref
+        '''
+        result = self._value_ref
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def required(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#required
+        '''
+        result = self._value_required
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def schema(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#$schema
+        '''
+        result = self._value_schema
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def title(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#title
+        '''
+        result = self._value_title
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def type(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#type
+        '''
+        result = self._value_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def unique_items(self) -> typing.Optional[builtins.bool]:
+        '''
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#uniqueItems
+        '''
+        result = self._value_unique_items
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def x_kubernetes_embedded_resource(self) -> typing.Optional[builtins.bool]:
+        '''x-kubernetes-embedded-resource defines that the value is an embedded Kubernetes runtime.Object, with TypeMeta and ObjectMeta. The type must be object. It is allowed to further restrict the embedded object. kind, apiVersion and metadata are validated automatically. x-kubernetes-preserve-unknown-fields is allowed to be true, but does not have to be if the object is fully specified (up to kind, apiVersion, metadata).
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#x-kubernetes-embedded-resource
+        '''
+        result = self._value_x_kubernetes_embedded_resource
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def x_kubernetes_int_or_string(self) -> typing.Optional[builtins.bool]:
+        '''x-kubernetes-int-or-string specifies that this value is either an integer or a string.
+
+        If this is true, an empty type is allowed and type as child of anyOf is permitted if following one of the following patterns:
+
+        1. anyOf:
+
+        - type: integer
+        - type: string
+
+        1. allOf:
+
+        - anyOf:
+        - type: integer
+        - type: string
+        - ... zero or more
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#x-kubernetes-int-or-string
+        '''
+        result = self._value_x_kubernetes_int_or_string
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def x_kubernetes_list_map_keys(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''x-kubernetes-list-map-keys annotates an array with the x-kubernetes-list-type ``map`` by specifying the keys used as the index of the map.
+
+        This tag MUST only be used on lists that have the "x-kubernetes-list-type" extension set to "map". Also, the values specified for this attribute must be a scalar typed field of the child structure (no nesting is supported).
+
+        The properties specified must either be required or have a default value, to ensure those properties are present for all list items.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#x-kubernetes-list-map-keys
+        '''
+        result = self._value_x_kubernetes_list_map_keys
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def x_kubernetes_list_type(self) -> typing.Optional[builtins.str]:
+        '''x-kubernetes-list-type annotates an array to further describe its topology.
+
+        This extension must only be used on lists and may have 3 possible values:
+
+        1. ``atomic``: the list is treated as a single entity, like a scalar.
+           Atomic lists will be entirely replaced when updated. This extension
+           may be used on any type of list (struct, scalar, ...).
+        2. ``set``:
+           Sets are lists that must not have multiple items with the same value. Each
+           value must be a scalar, an object with x-kubernetes-map-type ``atomic`` or an
+           array with x-kubernetes-list-type ``atomic``.
+        3. ``map``:
+           These lists are like maps in that their elements have a non-index key
+           used to identify them. Order is preserved upon merge. The map tag
+           must only be used on a list with elements of type object.
+           Defaults to atomic for arrays.
+
+        :default: atomic for arrays.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#x-kubernetes-list-type
+        '''
+        result = self._value_x_kubernetes_list_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def x_kubernetes_map_type(self) -> typing.Optional[builtins.str]:
+        '''x-kubernetes-map-type annotates an object to further describe its topology.
+
+        This extension must only be used when type is object and may have 2 possible values:
+
+        1. ``granular``:
+           These maps are actual maps (key-value pairs) and each fields are independent
+           from each other (they can each be manipulated by separate actors). This is
+           the default behaviour for all maps.
+        2. ``atomic``: the list is treated as a single entity, like a scalar.
+           Atomic maps will be entirely replaced when updated.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#x-kubernetes-map-type
+        '''
+        result = self._value_x_kubernetes_map_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def x_kubernetes_preserve_unknown_fields(self) -> typing.Optional[builtins.bool]:
+        '''x-kubernetes-preserve-unknown-fields stops the API server decoding step from pruning fields which are not specified in the validation schema.
+
+        This affects fields recursively, but switches back to normal pruning behaviour if nested properties or additionalProperties are specified in the schema. This can either be true or undefined. False is forbidden.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#x-kubernetes-preserve-unknown-fields
+        '''
+        result = self._value_x_kubernetes_preserve_unknown_fields
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def x_kubernetes_validations(
+        self,
+    ) -> typing.Optional[typing.List["ValidationRule"]]:
+        '''x-kubernetes-validations describes a list of validation rules written in the CEL expression language.
+
+        This field is an alpha-level. Using this field requires the feature gate ``CustomResourceValidationExpressions`` to be enabled.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.JSONSchemaProps#x-kubernetes-validations
+        '''
+        result = self._value_x_kubernetes_validations
+        return typing.cast(typing.Optional[typing.List["ValidationRule"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_additional_items is not None:
+            values["additional_items"] = self._value_additional_items
+        if self._value_additional_properties is not None:
+            values["additional_properties"] = self._value_additional_properties
+        if self._value_all_of is not None:
+            values["all_of"] = self._value_all_of
+        if self._value_any_of is not None:
+            values["any_of"] = self._value_any_of
+        if self._value_default is not None:
+            values["default"] = self._value_default
+        if self._value_definitions is not None:
+            values["definitions"] = self._value_definitions
+        if self._value_dependencies is not None:
+            values["dependencies"] = self._value_dependencies
+        if self._value_description is not None:
+            values["description"] = self._value_description
+        if self._value_enum is not None:
+            values["enum"] = self._value_enum
+        if self._value_example is not None:
+            values["example"] = self._value_example
+        if self._value_exclusive_maximum is not None:
+            values["exclusive_maximum"] = self._value_exclusive_maximum
+        if self._value_exclusive_minimum is not None:
+            values["exclusive_minimum"] = self._value_exclusive_minimum
+        if self._value_external_docs is not None:
+            values["external_docs"] = self._value_external_docs
+        if self._value_format is not None:
+            values["format"] = self._value_format
+        if self._value_id is not None:
+            values["id"] = self._value_id
+        if self._value_items is not None:
+            values["items"] = self._value_items
+        if self._value_maximum is not None:
+            values["maximum"] = self._value_maximum
+        if self._value_max_items is not None:
+            values["max_items"] = self._value_max_items
+        if self._value_max_length is not None:
+            values["max_length"] = self._value_max_length
+        if self._value_max_properties is not None:
+            values["max_properties"] = self._value_max_properties
+        if self._value_minimum is not None:
+            values["minimum"] = self._value_minimum
+        if self._value_min_items is not None:
+            values["min_items"] = self._value_min_items
+        if self._value_min_length is not None:
+            values["min_length"] = self._value_min_length
+        if self._value_min_properties is not None:
+            values["min_properties"] = self._value_min_properties
+        if self._value_multiple_of is not None:
+            values["multiple_of"] = self._value_multiple_of
+        if self._value_not_ is not None:
+            values["not_"] = self._value_not_
+        if self._value_nullable is not None:
+            values["nullable"] = self._value_nullable
+        if self._value_one_of is not None:
+            values["one_of"] = self._value_one_of
+        if self._value_pattern is not None:
+            values["pattern"] = self._value_pattern
+        if self._value_pattern_properties is not None:
+            values["pattern_properties"] = self._value_pattern_properties
+        if self._value_properties is not None:
+            values["properties"] = self._value_properties
+        if self._value_ref is not None:
+            values["ref"] = self._value_ref
+        if self._value_required is not None:
+            values["required"] = self._value_required
+        if self._value_schema is not None:
+            values["schema"] = self._value_schema
+        if self._value_title is not None:
+            values["title"] = self._value_title
+        if self._value_type is not None:
+            values["type"] = self._value_type
+        if self._value_unique_items is not None:
+            values["unique_items"] = self._value_unique_items
+        if self._value_x_kubernetes_embedded_resource is not None:
+            values["x_kubernetes_embedded_resource"] = self._value_x_kubernetes_embedded_resource
+        if self._value_x_kubernetes_int_or_string is not None:
+            values["x_kubernetes_int_or_string"] = self._value_x_kubernetes_int_or_string
+        if self._value_x_kubernetes_list_map_keys is not None:
+            values["x_kubernetes_list_map_keys"] = self._value_x_kubernetes_list_map_keys
+        if self._value_x_kubernetes_list_type is not None:
+            values["x_kubernetes_list_type"] = self._value_x_kubernetes_list_type
+        if self._value_x_kubernetes_map_type is not None:
+            values["x_kubernetes_map_type"] = self._value_x_kubernetes_map_type
+        if self._value_x_kubernetes_preserve_unknown_fields is not None:
+            values["x_kubernetes_preserve_unknown_fields"] = self._value_x_kubernetes_preserve_unknown_fields
+        if self._value_x_kubernetes_validations is not None:
+            values["x_kubernetes_validations"] = self._value_x_kubernetes_validations
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "JsonSchemaProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__daf776f0153100d207addeedc621b9aaef5a61bb490f24eaa0139862d3db2a89(
+    *,
+    additional_items: typing.Any = None,
+    additional_properties: typing.Any = None,
+    all_of: typing.Optional[typing.Sequence[typing.Union[JsonSchemaProps, typing.Dict[builtins.str, typing.Any]]]] = None,
+    any_of: typing.Optional[typing.Sequence[typing.Union[JsonSchemaProps, typing.Dict[builtins.str, typing.Any]]]] = None,
+    default: typing.Any = None,
+    definitions: typing.Optional[typing.Mapping[builtins.str, typing.Union[JsonSchemaProps, typing.Dict[builtins.str, typing.Any]]]] = None,
+    dependencies: typing.Optional[typing.Mapping[builtins.str, typing.Any]] = None,
+    description: typing.Optional[builtins.str] = None,
+    enum: typing.Optional[typing.Sequence[typing.Any]] = None,
+    example: typing.Any = None,
+    exclusive_maximum: typing.Optional[builtins.bool] = None,
+    exclusive_minimum: typing.Optional[builtins.bool] = None,
+    external_docs: typing.Optional[typing.Union[ExternalDocumentation, typing.Dict[builtins.str, typing.Any]]] = None,
+    format: typing.Optional[builtins.str] = None,
+    id: typing.Optional[builtins.str] = None,
+    items: typing.Any = None,
+    maximum: typing.Optional[jsii.Number] = None,
+    max_items: typing.Optional[jsii.Number] = None,
+    max_length: typing.Optional[jsii.Number] = None,
+    max_properties: typing.Optional[jsii.Number] = None,
+    minimum: typing.Optional[jsii.Number] = None,
+    min_items: typing.Optional[jsii.Number] = None,
+    min_length: typing.Optional[jsii.Number] = None,
+    min_properties: typing.Optional[jsii.Number] = None,
+    multiple_of: typing.Optional[jsii.Number] = None,
+    not_: typing.Optional[typing.Union[JsonSchemaProps, typing.Dict[builtins.str, typing.Any]]] = None,
+    nullable: typing.Optional[builtins.bool] = None,
+    one_of: typing.Optional[typing.Sequence[typing.Union[JsonSchemaProps, typing.Dict[builtins.str, typing.Any]]]] = None,
+    pattern: typing.Optional[builtins.str] = None,
+    pattern_properties: typing.Optional[typing.Mapping[builtins.str, typing.Union[JsonSchemaProps, typing.Dict[builtins.str, typing.Any]]]] = None,
+    properties: typing.Optional[typing.Mapping[builtins.str, typing.Union[JsonSchemaProps, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ref: typing.Optional[builtins.str] = None,
+    required: typing.Optional[typing.Sequence[builtins.str]] = None,
+    schema: typing.Optional[builtins.str] = None,
+    title: typing.Optional[builtins.str] = None,
+    type: typing.Optional[builtins.str] = None,
+    unique_items: typing.Optional[builtins.bool] = None,
+    x_kubernetes_embedded_resource: typing.Optional[builtins.bool] = None,
+    x_kubernetes_int_or_string: typing.Optional[builtins.bool] = None,
+    x_kubernetes_list_map_keys: typing.Optional[typing.Sequence[builtins.str]] = None,
+    x_kubernetes_list_type: typing.Optional[builtins.str] = None,
+    x_kubernetes_map_type: typing.Optional[builtins.str] = None,
+    x_kubernetes_preserve_unknown_fields: typing.Optional[builtins.bool] = None,
+    x_kubernetes_validations: typing.Optional[typing.Sequence[typing.Union[ValidationRule, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
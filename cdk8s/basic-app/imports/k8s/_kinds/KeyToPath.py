@@ -0,0 +1,118 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.KeyToPath",
+    jsii_struct_bases=[],
+    name_mapping={"key": "key", "path": "path", "mode": "mode"},
+)
+class KeyToPath(_base.Struct):
+    __slots__ = (
+        "_value_key",
+        "_value_path",
+        "_value_mode",
+    )
+
+    def __init__(
+        self,
+        *,
+        key: builtins.str,
+        path: builtins.str,
+        mode: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''Maps a string key to a path within a volume.
+
+        :param key: key is the key to project.
+        :param path: path is the relative path of the file to map the key to. May not be an absolute path. May not contain the path element '..'. May not start with the string '..'.
+        :param mode: mode is Optional: mode bits used to set permissions on this file. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. If not specified, the volume defaultMode will be used. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+
+        :schema: io.k8s.api.core.v1.KeyToPath
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__1f579c4b13a88f3186bcbc183fc5b54bf1b162f87adf1d2ad83a9a8b5e0bb447)
+            check_type(argname="argument key", value=key, expected_type=type_hints["key"])
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument mode", value=mode, expected_type=type_hints["mode"])
+        self._value_key = key
+        self._value_path = path
+        self._value_mode = mode
+
+    @builtins.property
+    def key(self) -> builtins.str:
+        '''key is the key to project.
+
+        :schema: io.k8s.api.core.v1.KeyToPath#key
+        '''
+        result = self._value_key
+        assert result is not None, "Required property 'key' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def path(self) -> builtins.str:
+        '''path is the relative path of the file to map the key to.
+
+        May not be an absolute path. May not contain the path element '..'. May not start with the string '..'.
+
+        :schema: io.k8s.api.core.v1.KeyToPath#path
+        '''
+        result = self._value_path
+        assert result is not None, "Required property 'path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def mode(self) -> typing.Optional[jsii.Number]:
+        '''mode is Optional: mode bits used to set permissions on this file.
+
+        Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. If not specified, the volume defaultMode will be used. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+
+        :schema: io.k8s.api.core.v1.KeyToPath#mode
+        '''
+        result = self._value_mode
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "key": self._value_key,
+            "path": self._value_path,
+        }
+        if self._value_mode is not None:
+            values["mode"] = self._value_mode
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KeyToPath(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__1f579c4b13a88f3186bcbc183fc5b54bf1b162f87adf1d2ad83a9a8b5e0bb447(
+    *,
+    key: builtins.str,
+    path: builtins.str,
+    mode: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
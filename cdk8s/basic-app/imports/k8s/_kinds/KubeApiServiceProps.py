@@ -0,0 +1,106 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ApiServiceSpec import ApiServiceSpec
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeApiServiceProps",
+    jsii_struct_bases=[],
+    name_mapping={"metadata": "metadata", "spec": "spec"},
+)
+class KubeApiServiceProps(_base.Struct):
+    __slots__ = (
+        "_value_metadata",
+        "_value_spec",
+    )
+
+    def __init__(
+        self,
+        *,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        spec: typing.Optional[typing.Union[ApiServiceSpec, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''APIService represents a server for a particular GroupVersion.
+
+        Name must be "version.group".
+
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param spec: Spec contains information for locating and communicating with a server.
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIService
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if isinstance(spec, dict):
+            spec = ApiServiceSpec(**spec)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__fa388b54653e1794b03d081efbf5ba6ac4082c87f562e32c6beeaedcb2062b0f)
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument spec", value=spec, expected_type=type_hints["spec"])
+        self._value_metadata = metadata
+        self._value_spec = spec
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIService#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def spec(self) -> typing.Optional[ApiServiceSpec]:
+        '''Spec contains information for locating and communicating with a server.
+
+        :schema: io.k8s.kube-aggregator.pkg.apis.apiregistration.v1.APIService#spec
+        '''
+        result = self._value_spec
+        return typing.cast(typing.Optional[ApiServiceSpec], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_spec is not None:
+            values["spec"] = self._value_spec
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeApiServiceProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__fa388b54653e1794b03d081efbf5ba6ac4082c87f562e32c6beeaedcb2062b0f(
+    *,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    spec: typing.Optional[typing.Union[ApiServiceSpec, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
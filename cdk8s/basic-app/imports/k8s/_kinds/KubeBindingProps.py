@@ -0,0 +1,107 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+from .ObjectReference import ObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeBindingProps",
+    jsii_struct_bases=[],
+    name_mapping={"target": "target", "metadata": "metadata"},
+)
+class KubeBindingProps(_base.Struct):
+    __slots__ = (
+        "_value_target",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        target: typing.Union["ObjectReference", typing.Dict[builtins.str, typing.Any]],
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Binding ties one object to another;
+
+        for example, a pod is bound to a node by a scheduler. Deprecated in 1.7, please use the bindings subresource of pods instead.
+
+        :param target: The target object that you want to bind to the standard object.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.core.v1.Binding
+        '''
+        if isinstance(target, dict):
+            target = ObjectReference(**target)
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__17f73704962797e0f37ad68c644b7528547425a2b7852b93aad34d9faee41a89)
+            check_type(argname="argument target", value=target, expected_type=type_hints["target"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_target = target
+        self._value_metadata = metadata
+
+    @builtins.property
+    def target(self) -> "ObjectReference":
+        '''The target object that you want to bind to the standard object.
+
+        :schema: io.k8s.api.core.v1.Binding#target
+        '''
+        result = self._value_target
+        assert result is not None, "Required property 'target' is missing"
+        return typing.cast("ObjectReference", result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.core.v1.Binding#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "target": self._value_target,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeBindingProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__17f73704962797e0f37ad68c644b7528547425a2b7852b93aad34d9faee41a89(
+    *,
+    target: typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]],
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,111 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .CertificateSigningRequestSpec import CertificateSigningRequestSpec
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeCertificateSigningRequestProps",
+    jsii_struct_bases=[],
+    name_mapping={"spec": "spec", "metadata": "metadata"},
+)
+class KubeCertificateSigningRequestProps(_base.Struct):
+    __slots__ = (
+        "_value_spec",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        spec: typing.Union[CertificateSigningRequestSpec, typing.Dict[builtins.str, typing.Any]],
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''CertificateSigningRequest objects provide a mechanism to obtain x509 certificates by submitting a certificate signing request, and having it asynchronously approved and issued.
+
+        Kubelets use this API to obtain:
+
+        1. client certificates to authenticate to kube-apiserver (with the "kubernetes.io/kube-apiserver-client-kubelet" signerName).
+        2. serving certificates for TLS endpoints kube-apiserver can connect to securely (with the "kubernetes.io/kubelet-serving" signerName).
+
+        This API can be used to request client certificates to authenticate to kube-apiserver (with the "kubernetes.io/kube-apiserver-client" signerName), or to obtain certificates from custom non-Kubernetes signers.
+
+        :param spec: spec contains the certificate request, and is immutable after creation. Only the request, signerName, expirationSeconds, and usages fields can be set on creation. Other fields are derived by Kubernetes and cannot be modified by users.
+        :param metadata: 
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequest
+        '''
+        if isinstance(spec, dict):
+            spec = CertificateSigningRequestSpec(**spec)
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ea26900e83d9c03052f5118bf686d1cf204888ec1fe99f0622dd1de5b45ebc2a)
+            check_type(argname="argument spec", value=spec, expected_type=type_hints["spec"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_spec = spec
+        self._value_metadata = metadata
+
+    @builtins.property
+    def spec(self) -> CertificateSigningRequestSpec:
+        '''spec contains the certificate request, and is immutable after creation.
+
+        Only the request, signerName, expirationSeconds, and usages fields can be set on creation. Other fields are derived by Kubernetes and cannot be modified by users.
+
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequest#spec
+        '''
+        result = self._value_spec
+        assert result is not None, "Required property 'spec' is missing"
+        return typing.cast(CertificateSigningRequestSpec, result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''
+        :schema: io.k8s.api.certificates.v1.CertificateSigningRequest#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "spec": self._value_spec,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeCertificateSigningRequestProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ea26900e83d9c03052f5118bf686d1cf204888ec1fe99f0622dd1de5b45ebc2a(
+    *,
+    spec: typing.Union[CertificateSigningRequestSpec, typing.Dict[builtins.str, typing.Any]],
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
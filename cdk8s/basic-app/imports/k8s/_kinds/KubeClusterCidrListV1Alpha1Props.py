@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .KubeClusterCidrv1Alpha1Props import KubeClusterCidrv1Alpha1Props
+from .ListMeta import ListMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeClusterCidrListV1Alpha1Props",
+    jsii_struct_bases=[],
+    name_mapping={"items": "items", "metadata": "metadata"},
+)
+class KubeClusterCidrListV1Alpha1Props(_base.Struct):
+    __slots__ = (
+        "_value_items",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        items: typing.Sequence[typing.Union["KubeClusterCidrv1Alpha1Props", typing.Dict[builtins.str, typing.Any]]],
+        metadata: typing.Optional[typing.Union["ListMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ClusterCIDRList contains a list of ClusterCIDR.
+
+        :param items: Items is the list of ClusterCIDRs.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.networking.v1alpha1.ClusterCIDRList
+        '''
+        if isinstance(metadata, dict):
+            metadata = ListMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__2568516c61e397e6ffe9ac679a0c57c224fdd0d1ee2c188bf4282ba2ec5d1871)
+            check_type(argname="argument items", value=items, expected_type=type_hints["items"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_items = items
+        self._value_metadata = metadata
+
+    @builtins.property
+    def items(self) -> typing.List["KubeClusterCidrv1Alpha1Props"]:
+        '''Items is the list of ClusterCIDRs.
+
+        :schema: io.k8s.api.networking.v1alpha1.ClusterCIDRList#items
+        '''
+        result = self._value_items
+        assert result is not None, "Required property 'items' is missing"
+        return typing.cast(typing.List["KubeClusterCidrv1Alpha1Props"], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ListMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.networking.v1alpha1.ClusterCIDRList#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ListMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "items": self._value_items,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeClusterCidrListV1Alpha1Props(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__2568516c61e397e6ffe9ac679a0c57c224fdd0d1ee2c188bf4282ba2ec5d1871(
+    *,
+    items: typing.Sequence[typing.Union[KubeClusterCidrv1Alpha1Props, typing.Dict[builtins.str, typing.Any]]],
+    metadata: typing.Optional[typing.Union[ListMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .KubeClusterRoleBindingProps import KubeClusterRoleBindingProps
+from .ListMeta import ListMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeClusterRoleBindingListProps",
+    jsii_struct_bases=[],
+    name_mapping={"items": "items", "metadata": "metadata"},
+)
+class KubeClusterRoleBindingListProps(_base.Struct):
+    __slots__ = (
+        "_value_items",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        items: typing.Sequence[typing.Union["KubeClusterRoleBindingProps", typing.Dict[builtins.str, typing.Any]]],
+        metadata: typing.Optional[typing.Union["ListMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ClusterRoleBindingList is a collection of ClusterRoleBindings.
+
+        :param items: Items is a list of ClusterRoleBindings.
+        :param metadata: Standard object's metadata.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleBindingList
+        '''
+        if isinstance(metadata, dict):
+            metadata = ListMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__2c82a518d0376ee32a141ec070cbf273462cdd5ce947e4b47885cda5cfe73403)
+            check_type(argname="argument items", value=items, expected_type=type_hints["items"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_items = items
+        self._value_metadata = metadata
+
+    @builtins.property
+    def items(self) -> typing.List["KubeClusterRoleBindingProps"]:
+        '''Items is a list of ClusterRoleBindings.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleBindingList#items
+        '''
+        result = self._value_items
+        assert result is not None, "Required property 'items' is missing"
+        return typing.cast(typing.List["KubeClusterRoleBindingProps"], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ListMeta"]:
+        '''Standard object's metadata.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleBindingList#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ListMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "items": self._value_items,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeClusterRoleBindingListProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__2c82a518d0376ee32a141ec070cbf273462cdd5ce947e4b47885cda5cfe73403(
+    *,
+    items: typing.Sequence[typing.Union[KubeClusterRoleBindingProps, typing.Dict[builtins.str, typing.Any]]],
+    metadata: typing.Optional[typing.Union[ListMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,129 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+from .RoleRef import RoleRef
+from .Subject import Subject
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeClusterRoleBindingProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "role_ref": "roleRef",
+        "metadata": "metadata",
+        "subjects": "subjects",
+    },
+)
+class KubeClusterRoleBindingProps(_base.Struct):
+    __slots__ = (
+        "_value_role_ref",
+        "_value_metadata",
+        "_value_subjects",
+    )
+
+    def __init__(
+        self,
+        *,
+        role_ref: typing.Union["RoleRef", typing.Dict[builtins.str, typing.Any]],
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        subjects: typing.Optional[typing.Sequence[typing.Union["Subject", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''ClusterRoleBinding references a ClusterRole, but not contain it.
+
+        It can reference a ClusterRole in the global namespace, and adds who information via Subject.
+
+        :param role_ref: RoleRef can only reference a ClusterRole in the global namespace. If the RoleRef cannot be resolved, the Authorizer must return an error.
+        :param metadata: Standard object's metadata.
+        :param subjects: Subjects holds references to the objects the role applies to.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleBinding
+        '''
+        if isinstance(role_ref, dict):
+            role_ref = RoleRef(**role_ref)
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__257a9d454c53443a5bcf76ea68af6361260af7fedca4596fd5f3e37805c7a05f)
+            check_type(argname="argument role_ref", value=role_ref, expected_type=type_hints["role_ref"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument subjects", value=subjects, expected_type=type_hints["subjects"])
+        self._value_role_ref = role_ref
+        self._value_metadata = metadata
+        self._value_subjects = subjects
+
+    @builtins.property
+    def role_ref(self) -> "RoleRef":
+        '''RoleRef can only reference a ClusterRole in the global namespace.
+
+        If the RoleRef cannot be resolved, the Authorizer must return an error.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleBinding#roleRef
+        '''
+        result = self._value_role_ref
+        assert result is not None, "Required property 'role_ref' is missing"
+        return typing.cast("RoleRef", result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleBinding#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def subjects(self) -> typing.Optional[typing.List["Subject"]]:
+        '''Subjects holds references to the objects the role applies to.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleBinding#subjects
+        '''
+        result = self._value_subjects
+        return typing.cast(typing.Optional[typing.List["Subject"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "role_ref": self._value_role_ref,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_subjects is not None:
+            values["subjects"] = self._value_subjects
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeClusterRoleBindingProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__257a9d454c53443a5bcf76ea68af6361260af7fedca4596fd5f3e37805c7a05f(
+    *,
+    role_ref: typing.Union[RoleRef, typing.Dict[builtins.str, typing.Any]],
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    subjects: typing.Optional[typing.Sequence[typing.Union[Subject, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .KubeClusterRoleProps import KubeClusterRoleProps
+from .ListMeta import ListMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeClusterRoleListProps",
+    jsii_struct_bases=[],
+    name_mapping={"items": "items", "metadata": "metadata"},
+)
+class KubeClusterRoleListProps(_base.Struct):
+    __slots__ = (
+        "_value_items",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        items: typing.Sequence[typing.Union["KubeClusterRoleProps", typing.Dict[builtins.str, typing.Any]]],
+        metadata: typing.Optional[typing.Union["ListMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ClusterRoleList is a collection of ClusterRoles.
+
+        :param items: Items is a list of ClusterRoles.
+        :param metadata: Standard object's metadata.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleList
+        '''
+        if isinstance(metadata, dict):
+            metadata = ListMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__3567db5c4e5df260e3bfb132c868492937f16ab86f1fd556633c1bdf5c23ac38)
+            check_type(argname="argument items", value=items, expected_type=type_hints["items"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_items = items
+        self._value_metadata = metadata
+
+    @builtins.property
+    def items(self) -> typing.List["KubeClusterRoleProps"]:
+        '''Items is a list of ClusterRoles.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleList#items
+        '''
+        result = self._value_items
+        assert result is not None, "Required property 'items' is missing"
+        return typing.cast(typing.List["KubeClusterRoleProps"], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ListMeta"]:
+        '''Standard object's metadata.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRoleList#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ListMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "items": self._value_items,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeClusterRoleListProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__3567db5c4e5df260e3bfb132c868492937f16ab86f1fd556633c1bdf5c23ac38(
+    *,
+    items: typing.Sequence[typing.Union[KubeClusterRoleProps, typing.Dict[builtins.str, typing.Any]]],
+    metadata: typing.Optional[typing.Union[ListMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
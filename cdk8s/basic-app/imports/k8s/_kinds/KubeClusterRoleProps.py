@@ -0,0 +1,126 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .AggregationRule import AggregationRule
+from .ObjectMeta import ObjectMeta
+from .PolicyRule import PolicyRule
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeClusterRoleProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "aggregation_rule": "aggregationRule",
+        "metadata": "metadata",
+        "rules": "rules",
+    },
+)
+class KubeClusterRoleProps(_base.Struct):
+    __slots__ = (
+        "_value_aggregation_rule",
+        "_value_metadata",
+        "_value_rules",
+    )
+
+    def __init__(
+        self,
+        *,
+        aggregation_rule: typing.Optional[typing.Union[AggregationRule, typing.Dict[builtins.str, typing.Any]]] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        rules: typing.Optional[typing.Sequence[typing.Union["PolicyRule", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''ClusterRole is a cluster level, logical grouping of PolicyRules that can be referenced as a unit by a RoleBinding or ClusterRoleBinding.
+
+        :param aggregation_rule: AggregationRule is an optional field that describes how to build the Rules for this ClusterRole. If AggregationRule is set, then the Rules are controller managed and direct changes to Rules will be stomped by the controller.
+        :param metadata: Standard object's metadata.
+        :param rules: Rules holds all the PolicyRules for this ClusterRole.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRole
+        '''
+        if isinstance(aggregation_rule, dict):
+            aggregation_rule = AggregationRule(**aggregation_rule)
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__6faf558e694a82d5282c1ee1c2544179d7e40c708128f00e73fbc361becd9539)
+            check_type(argname="argument aggregation_rule", value=aggregation_rule, expected_type=type_hints["aggregation_rule"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument rules", value=rules, expected_type=type_hints["rules"])
+        self._value_aggregation_rule = aggregation_rule
+        self._value_metadata = metadata
+        self._value_rules = rules
+
+    @builtins.property
+    def aggregation_rule(self) -> typing.Optional[AggregationRule]:
+        '''AggregationRule is an optional field that describes how to build the Rules for this ClusterRole.
+
+        If AggregationRule is set, then the Rules are controller managed and direct changes to Rules will be stomped by the controller.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRole#aggregationRule
+        '''
+        result = self._value_aggregation_rule
+        return typing.cast(typing.Optional[AggregationRule], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRole#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def rules(self) -> typing.Optional[typing.List["PolicyRule"]]:
+        '''Rules holds all the PolicyRules for this ClusterRole.
+
+        :schema: io.k8s.api.rbac.v1.ClusterRole#rules
+        '''
+        result = self._value_rules
+        return typing.cast(typing.Optional[typing.List["PolicyRule"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_aggregation_rule is not None:
+            values["aggregation_rule"] = self._value_aggregation_rule
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_rules is not None:
+            values["rules"] = self._value_rules
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeClusterRoleProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__6faf558e694a82d5282c1ee1c2544179d7e40c708128f00e73fbc361becd9539(
+    *,
+    aggregation_rule: typing.Optional[typing.Union[AggregationRule, typing.Dict[builtins.str, typing.Any]]] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    rules: typing.Optional[typing.Sequence[typing.Union[PolicyRule, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,104 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ComponentCondition import ComponentCondition
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeComponentStatusProps",
+    jsii_struct_bases=[],
+    name_mapping={"conditions": "conditions", "metadata": "metadata"},
+)
+class KubeComponentStatusProps(_base.Struct):
+    __slots__ = (
+        "_value_conditions",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        conditions: typing.Optional[typing.Sequence[typing.Union[ComponentCondition, typing.Dict[builtins.str, typing.Any]]]] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ComponentStatus (and ComponentStatusList) holds the cluster validation info.
+
+        Deprecated: This API is deprecated in v1.19+
+
+        :param conditions: List of component conditions observed.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.core.v1.ComponentStatus
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__67f24fea501ac86ffd29cd8da4d47fae1b8eb42d42c249efb3614ebb5feb3863)
+            check_type(argname="argument conditions", value=conditions, expected_type=type_hints["conditions"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_conditions = conditions
+        self._value_metadata = metadata
+
+    @builtins.property
+    def conditions(self) -> typing.Optional[typing.List[ComponentCondition]]:
+        '''List of component conditions observed.
+
+        :schema: io.k8s.api.core.v1.ComponentStatus#conditions
+        '''
+        result = self._value_conditions
+        return typing.cast(typing.Optional[typing.List[ComponentCondition]], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.core.v1.ComponentStatus#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_conditions is not None:
+            values["conditions"] = self._value_conditions
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeComponentStatusProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__67f24fea501ac86ffd29cd8da4d47fae1b8eb42d42c249efb3614ebb5feb3863(
+    *,
+    conditions: typing.Optional[typing.Sequence[typing.Union[ComponentCondition, typing.Dict[builtins.str, typing.Any]]]] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,148 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeConfigMapProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "binary_data": "binaryData",
+        "data": "data",
+        "immutable": "immutable",
+        "metadata": "metadata",
+    },
+)
+class KubeConfigMapProps(_base.Struct):
+    __slots__ = (
+        "_value_binary_data",
+        "_value_data",
+        "_value_immutable",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        binary_data: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        data: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        immutable: typing.Optional[builtins.bool] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ConfigMap holds configuration data for pods to consume.
+
+        :param binary_data: BinaryData contains the binary data. Each key must consist of alphanumeric characters, '-', '_' or '.'. BinaryData can contain byte sequences that are not in the UTF-8 range. The keys stored in BinaryData must not overlap with the ones in the Data field, this is enforced during validation process. Using this field will require 1.10+ apiserver and kubelet.
+        :param data: Data contains the configuration data. Each key must consist of alphanumeric characters, '-', '_' or '.'. Values with non-UTF-8 byte sequences must use the BinaryData field. The keys stored in Data must not overlap with the keys in the BinaryData field, this is enforced during validation process.
+        :param immutable: Immutable, if set to true, ensures that data stored in the ConfigMap cannot be updated (only object metadata can be modified). If not set to true, the field can be modified at any time. Defaulted to nil.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.core.v1.ConfigMap
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__1a39b77b09572a5978b914a6a73c5b5de4761e48a8d3b3d72892406c734d515a)
+            check_type(argname="argument binary_data", value=binary_data, expected_type=type_hints["binary_data"])
+            check_type(argname="argument data", value=data, expected_type=type_hints["data"])
+            check_type(argname="argument immutable", value=immutable, expected_type=type_hints["immutable"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_binary_data = binary_data
+        self._value_data = data
+        self._value_immutable = immutable
+        self._value_metadata = metadata
+
+    @builtins.property
+    def binary_data(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''BinaryData contains the binary data.
+
+        Each key must consist of alphanumeric characters, '-', '_' or '.'. BinaryData can contain byte sequences that are not in the UTF-8 range. The keys stored in BinaryData must not overlap with the ones in the Data field, this is enforced during validation process. Using this field will require 1.10+ apiserver and kubelet.
+
+        :schema: io.k8s.api.core.v1.ConfigMap#binaryData
+        '''
+        result = self._value_binary_data
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def data(self) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''Data contains the configuration data.
+
+        Each key must consist of alphanumeric characters, '-', '_' or '.'. Values with non-UTF-8 byte sequences must use the BinaryData field. The keys stored in Data must not overlap with the keys in the BinaryData field, this is enforced during validation process.
+
+        :schema: io.k8s.api.core.v1.ConfigMap#data
+        '''
+        result = self._value_data
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def immutable(self) -> typing.Optional[builtins.bool]:
+        '''Immutable, if set to true, ensures that data stored in the ConfigMap cannot be updated (only object metadata can be modified).
+
+        If not set to true, the field can be modified at any time. Defaulted to nil.
+
+        :schema: io.k8s.api.core.v1.ConfigMap#immutable
+        '''
+        result = self._value_immutable
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.core.v1.ConfigMap#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_binary_data is not None:
+            values["binary_data"] = self._value_binary_data
+        if self._value_data is not None:
+            values["data"] = self._value_data
+        if self._value_immutable is not None:
+            values["immutable"] = self._value_immutable
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeConfigMapProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__1a39b77b09572a5978b914a6a73c5b5de4761e48a8d3b3d72892406c734d515a(
+    *,
+    binary_data: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    data: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    immutable: typing.Optional[builtins.bool] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,121 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeControllerRevisionProps",
+    jsii_struct_bases=[],
+    name_mapping={"revision": "revision", "data": "data", "metadata": "metadata"},
+)
+class KubeControllerRevisionProps(_base.Struct):
+    __slots__ = (
+        "_value_revision",
+        "_value_data",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        revision: jsii.Number,
+        data: typing.Any = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ControllerRevision implements an immutable snapshot of state data.
+
+        Clients are responsible for serializing and deserializing the objects that contain their internal state. Once a ControllerRevision has been successfully created, it can not be updated. The API Server will fail validation of all requests that attempt to mutate the Data field. ControllerRevisions may, however, be deleted. Note that, due to its use by both the DaemonSet and StatefulSet controllers for update and rollback, this object is beta. However, it may be subject to name and representation changes in future releases, and clients should not depend on its stability. It is primarily for internal use by controllers.
+
+        :param revision: Revision indicates the revision of the state represented by Data.
+        :param data: Data is the serialized representation of the state.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.apps.v1.ControllerRevision
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__2de468b613a3e33f95f5158a17d168ea0ab46ec3ccc31df40206c6abcc1e847c)
+            check_type(argname="argument revision", value=revision, expected_type=type_hints["revision"])
+            check_type(argname="argument data", value=data, expected_type=type_hints["data"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_revision = revision
+        self._value_data = data
+        self._value_metadata = metadata
+
+    @builtins.property
+    def revision(self) -> jsii.Number:
+        '''Revision indicates the revision of the state represented by Data.
+
+        :schema: io.k8s.api.apps.v1.ControllerRevision#revision
+        '''
+        result = self._value_revision
+        assert result is not None, "Required property 'revision' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def data(self) -> typing.Any:
+        '''Data is the serialized representation of the state.
+
+        :schema: io.k8s.api.apps.v1.ControllerRevision#data
+        '''
+        result = self._value_data
+        return typing.cast(typing.Any, result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.apps.v1.ControllerRevision#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "revision": self._value_revision,
+        }
+        if self._value_data is not None:
+            values["data"] = self._value_data
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeControllerRevisionProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__2de468b613a3e33f95f5158a17d168ea0ab46ec3ccc31df40206c6abcc1e847c(
+    *,
+    revision: jsii.Number,
+    data: typing.Any = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,185 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+from .ObjectMeta import ObjectMeta
+from .Quantity import Quantity
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeCsiStorageCapacityV1Beta1Props",
+    jsii_struct_bases=[],
+    name_mapping={
+        "storage_class_name": "storageClassName",
+        "capacity": "capacity",
+        "maximum_volume_size": "maximumVolumeSize",
+        "metadata": "metadata",
+        "node_topology": "nodeTopology",
+    },
+)
+class KubeCsiStorageCapacityV1Beta1Props(_base.Struct):
+    __slots__ = (
+        "_value_storage_class_name",
+        "_value_capacity",
+        "_value_maximum_volume_size",
+        "_value_metadata",
+        "_value_node_topology",
+    )
+
+    def __init__(
+        self,
+        *,
+        storage_class_name: builtins.str,
+        capacity: typing.Optional["Quantity"] = None,
+        maximum_volume_size: typing.Optional["Quantity"] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        node_topology: typing.Optional[typing.Union["LabelSelector", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''CSIStorageCapacity stores the result of one CSI GetCapacity call.
+
+        For a given StorageClass, this describes the available capacity in a particular topology segment.  This can be used when considering where to instantiate new PersistentVolumes.
+
+        For example this can express things like: - StorageClass "standard" has "1234 GiB" available in "topology.kubernetes.io/zone=us-east1" - StorageClass "localssd" has "10 GiB" available in "kubernetes.io/hostname=knode-abc123"
+
+        The following three cases all imply that no capacity is available for a certain combination: - no object exists with suitable topology and storage class name - such an object exists, but the capacity is unset - such an object exists, but the capacity is zero
+
+        The producer of these objects can decide which approach is more suitable.
+
+        They are consumed by the kube-scheduler when a CSI driver opts into capacity-aware scheduling with CSIDriverSpec.StorageCapacity. The scheduler compares the MaximumVolumeSize against the requested size of pending volumes to filter out unsuitable nodes. If MaximumVolumeSize is unset, it falls back to a comparison against the less precise Capacity. If that is also unset, the scheduler assumes that capacity is insufficient and tries some other node.
+
+        :param storage_class_name: The name of the StorageClass that the reported capacity applies to. It must meet the same requirements as the name of a StorageClass object (non-empty, DNS subdomain). If that object no longer exists, the CSIStorageCapacity object is obsolete and should be removed by its creator. This field is immutable.
+        :param capacity: Capacity is the value reported by the CSI driver in its GetCapacityResponse for a GetCapacityRequest with topology and parameters that match the previous fields. The semantic is currently (CSI spec 1.2) defined as: The available capacity, in bytes, of the storage that can be used to provision volumes. If not set, that information is currently unavailable.
+        :param maximum_volume_size: MaximumVolumeSize is the value reported by the CSI driver in its GetCapacityResponse for a GetCapacityRequest with topology and parameters that match the previous fields. This is defined since CSI spec 1.4.0 as the largest size that may be used in a CreateVolumeRequest.capacity_range.required_bytes field to create a volume with the same parameters as those in GetCapacityRequest. The corresponding value in the Kubernetes API is ResourceRequirements.Requests in a volume claim.
+        :param metadata: Standard object's metadata. The name has no particular meaning. It must be be a DNS subdomain (dots allowed, 253 characters). To ensure that there are no conflicts with other CSI drivers on the cluster, the recommendation is to use csisc-, a generated name, or a reverse-domain name which ends with the unique CSI driver name. Objects are namespaced. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param node_topology: NodeTopology defines which nodes have access to the storage for which capacity was reported. If not set, the storage is not accessible from any node in the cluster. If empty, the storage is accessible from all nodes. This field is immutable.
+
+        :schema: io.k8s.api.storage.v1beta1.CSIStorageCapacity
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if isinstance(node_topology, dict):
+            node_topology = LabelSelector(**node_topology)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__8418b166e025fb1853c1ac02bf35c29f522036d884cff7a2ce4f670249d87d99)
+            check_type(argname="argument storage_class_name", value=storage_class_name, expected_type=type_hints["storage_class_name"])
+            check_type(argname="argument capacity", value=capacity, expected_type=type_hints["capacity"])
+            check_type(argname="argument maximum_volume_size", value=maximum_volume_size, expected_type=type_hints["maximum_volume_size"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument node_topology", value=node_topology, expected_type=type_hints["node_topology"])
+        self._value_storage_class_name = storage_class_name
+        self._value_capacity = capacity
+        self._value_maximum_volume_size = maximum_volume_size
+        self._value_metadata = metadata
+        self._value_node_topology = node_topology
+
+    @builtins.property
+    def storage_class_name(self) -> builtins.str:
+        '''The name of the StorageClass that the reported capacity applies to.
+
+        It must meet the same requirements as the name of a StorageClass object (non-empty, DNS subdomain). If that object no longer exists, the CSIStorageCapacity object is obsolete and should be removed by its creator. This field is immutable.
+
+        :schema: io.k8s.api.storage.v1beta1.CSIStorageCapacity#storageClassName
+        '''
+        result = self._value_storage_class_name
+        assert result is not None, "Required property 'storage_class_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def capacity(self) -> typing.Optional["Quantity"]:
+        '''Capacity is the value reported by the CSI driver in its GetCapacityResponse for a GetCapacityRequest with topology and parameters that match the previous fields.
+
+        The semantic is currently (CSI spec 1.2) defined as: The available capacity, in bytes, of the storage that can be used to provision volumes. If not set, that information is currently unavailable.
+
+        :schema: io.k8s.api.storage.v1beta1.CSIStorageCapacity#capacity
+        '''
+        result = self._value_capacity
+        return typing.cast(typing.Optional["Quantity"], result)
+
+    @builtins.property
+    def maximum_volume_size(self) -> typing.Optional["Quantity"]:
+        '''MaximumVolumeSize is the value reported by the CSI driver in its GetCapacityResponse for a GetCapacityRequest with topology and parameters that match the previous fields.
+
+        This is defined since CSI spec 1.4.0 as the largest size that may be used in a CreateVolumeRequest.capacity_range.required_bytes field to create a volume with the same parameters as those in GetCapacityRequest. The corresponding value in the Kubernetes API is ResourceRequirements.Requests in a volume claim.
+
+        :schema: io.k8s.api.storage.v1beta1.CSIStorageCapacity#maximumVolumeSize
+        '''
+        result = self._value_maximum_volume_size
+        return typing.cast(typing.Optional["Quantity"], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        The name has no particular meaning. It must be be a DNS subdomain (dots allowed, 253 characters). To ensure that there are no conflicts with other CSI drivers on the cluster, the recommendation is to use csisc-, a generated name, or a reverse-domain name which ends with the unique CSI driver name.
+
+        Objects are namespaced.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.storage.v1beta1.CSIStorageCapacity#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def node_topology(self) -> typing.Optional["LabelSelector"]:
+        '''NodeTopology defines which nodes have access to the storage for which capacity was reported.
+
+        If not set, the storage is not accessible from any node in the cluster. If empty, the storage is accessible from all nodes. This field is immutable.
+
+        :schema: io.k8s.api.storage.v1beta1.CSIStorageCapacity#nodeTopology
+        '''
+        result = self._value_node_topology
+        return typing.cast(typing.Optional["LabelSelector"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "storage_class_name": self._value_storage_class_name,
+        }
+        if self._value_capacity is not None:
+            values["capacity"] = self._value_capacity
+        if self._value_maximum_volume_size is not None:
+            values["maximum_volume_size"] = self._value_maximum_volume_size
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_node_topology is not None:
+            values["node_topology"] = self._value_node_topology
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeCsiStorageCapacityV1Beta1Props(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__8418b166e025fb1853c1ac02bf35c29f522036d884cff7a2ce4f670249d87d99(
+    *,
+    storage_class_name: builtins.str,
+    capacity: typing.Optional[Quantity] = None,
+    maximum_volume_size: typing.Optional[Quantity] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    node_topology: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
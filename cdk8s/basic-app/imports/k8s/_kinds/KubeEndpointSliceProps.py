@@ -0,0 +1,149 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Endpoint import Endpoint
+from .EndpointPort import EndpointPort
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeEndpointSliceProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "address_type": "addressType",
+        "endpoints": "endpoints",
+        "metadata": "metadata",
+        "ports": "ports",
+    },
+)
+class KubeEndpointSliceProps(_base.Struct):
+    __slots__ = (
+        "_value_address_type",
+        "_value_endpoints",
+        "_value_metadata",
+        "_value_ports",
+    )
+
+    def __init__(
+        self,
+        *,
+        address_type: builtins.str,
+        endpoints: typing.Sequence[typing.Union[Endpoint, typing.Dict[builtins.str, typing.Any]]],
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        ports: typing.Optional[typing.Sequence[typing.Union[EndpointPort, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''EndpointSlice represents a subset of the endpoints that implement a service.
+
+        For a given service there may be multiple EndpointSlice objects, selected by labels, which must be joined to produce the full set of endpoints.
+
+        :param address_type: addressType specifies the type of address carried by this EndpointSlice. All addresses in this slice must be the same type. This field is immutable after creation. The following address types are currently supported: * IPv4: Represents an IPv4 Address. * IPv6: Represents an IPv6 Address. * FQDN: Represents a Fully Qualified Domain Name.
+        :param endpoints: endpoints is a list of unique endpoints in this slice. Each slice may include a maximum of 1000 endpoints.
+        :param metadata: Standard object's metadata.
+        :param ports: ports specifies the list of network ports exposed by each endpoint in this slice. Each port must have a unique name. When ports is empty, it indicates that there are no defined ports. When a port is defined with a nil port value, it indicates "all ports". Each slice may include a maximum of 100 ports.
+
+        :schema: io.k8s.api.discovery.v1.EndpointSlice
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__d5a0710afc3e844c1100b501405d8ce44983ec5b3c3f16765cabf7c83048029e)
+            check_type(argname="argument address_type", value=address_type, expected_type=type_hints["address_type"])
+            check_type(argname="argument endpoints", value=endpoints, expected_type=type_hints["endpoints"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument ports", value=ports, expected_type=type_hints["ports"])
+        self._value_address_type = address_type
+        self._value_endpoints = endpoints
+        self._value_metadata = metadata
+        self._value_ports = ports
+
+    @builtins.property
+    def address_type(self) -> builtins.str:
+        '''addressType specifies the type of address carried by this EndpointSlice.
+
+        All addresses in this slice must be the same type. This field is immutable after creation. The following address types are currently supported: * IPv4: Represents an IPv4 Address. * IPv6: Represents an IPv6 Address. * FQDN: Represents a Fully Qualified Domain Name.
+
+        :schema: io.k8s.api.discovery.v1.EndpointSlice#addressType
+        '''
+        result = self._value_address_type
+        assert result is not None, "Required property 'address_type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def endpoints(self) -> typing.List[Endpoint]:
+        '''endpoints is a list of unique endpoints in this slice.
+
+        Each slice may include a maximum of 1000 endpoints.
+
+        :schema: io.k8s.api.discovery.v1.EndpointSlice#endpoints
+        '''
+        result = self._value_endpoints
+        assert result is not None, "Required property 'endpoints' is missing"
+        return typing.cast(typing.List[Endpoint], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        :schema: io.k8s.api.discovery.v1.EndpointSlice#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def ports(self) -> typing.Optional[typing.List[EndpointPort]]:
+        '''ports specifies the list of network ports exposed by each endpoint in this slice.
+
+        Each port must have a unique name. When ports is empty, it indicates that there are no defined ports. When a port is defined with a nil port value, it indicates "all ports". Each slice may include a maximum of 100 ports.
+
+        :schema: io.k8s.api.discovery.v1.EndpointSlice#ports
+        '''
+        result = self._value_ports
+        return typing.cast(typing.Optional[typing.List[EndpointPort]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "address_type": self._value_address_type,
+            "endpoints": self._value_endpoints,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_ports is not None:
+            values["ports"] = self._value_ports
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeEndpointSliceProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__d5a0710afc3e844c1100b501405d8ce44983ec5b3c3f16765cabf7c83048029e(
+    *,
+    address_type: builtins.str,
+    endpoints: typing.Sequence[typing.Union[Endpoint, typing.Dict[builtins.str, typing.Any]]],
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    ports: typing.Optional[typing.Sequence[typing.Union[EndpointPort, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,366 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .EventSeries import EventSeries
+from .EventSource import EventSource
+from .ObjectMeta import ObjectMeta
+from .ObjectReference import ObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeEventProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "event_time": "eventTime",
+        "action": "action",
+        "deprecated_count": "deprecatedCount",
+        "deprecated_first_timestamp": "deprecatedFirstTimestamp",
+        "deprecated_last_timestamp": "deprecatedLastTimestamp",
+        "deprecated_source": "deprecatedSource",
+        "metadata": "metadata",
+        "note": "note",
+        "reason": "reason",
+        "regarding": "regarding",
+        "related": "related",
+        "reporting_controller": "reportingController",
+        "reporting_instance": "reportingInstance",
+        "series": "series",
+        "type": "type",
+    },
+)
+class KubeEventProps(_base.Struct):
+    __slots__ = (
+        "_value_event_time",
+        "_value_action",
+        "_value_deprecated_count",
+        "_value_deprecated_first_timestamp",
+        "_value_deprecated_last_timestamp",
+        "_value_deprecated_source",
+        "_value_metadata",
+        "_value_note",
+        "_value_reason",
+        "_value_regarding",
+        "_value_related",
+        "_value_reporting_controller",
+        "_value_reporting_instance",
+        "_value_series",
+        "_value_type",
+    )
+
+    def __init__(
+        self,
+        *,
+        event_time: datetime.datetime,
+        action: typing.Optional[builtins.str] = None,
+        deprecated_count: typing.Optional[jsii.Number] = None,
+        deprecated_first_timestamp: typing.Optional[datetime.datetime] = None,
+        deprecated_last_timestamp: typing.Optional[datetime.datetime] = None,
+        deprecated_source: typing.Optional[typing.Union[EventSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        note: typing.Optional[builtins.str] = None,
+        reason: typing.Optional[builtins.str] = None,
+        regarding: typing.Optional[typing.Union["ObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        related: typing.Optional[typing.Union["ObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        reporting_controller: typing.Optional[builtins.str] = None,
+        reporting_instance: typing.Optional[builtins.str] = None,
+        series: typing.Optional[typing.Union[EventSeries, typing.Dict[builtins.str, typing.Any]]] = None,
+        type: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Event is a report of an event somewhere in the cluster.
+
+        It generally denotes some state change in the system. Events have a limited retention time and triggers and messages may evolve with time.  Event consumers should not rely on the timing of an event with a given Reason reflecting a consistent underlying trigger, or the continued existence of events with that Reason.  Events should be treated as informative, best-effort, supplemental data.
+
+        :param event_time: eventTime is the time when this Event was first observed. It is required.
+        :param action: action is what action was taken/failed regarding to the regarding object. It is machine-readable. This field cannot be empty for new Events and it can have at most 128 characters.
+        :param deprecated_count: deprecatedCount is the deprecated field assuring backward compatibility with core.v1 Event type.
+        :param deprecated_first_timestamp: deprecatedFirstTimestamp is the deprecated field assuring backward compatibility with core.v1 Event type.
+        :param deprecated_last_timestamp: deprecatedLastTimestamp is the deprecated field assuring backward compatibility with core.v1 Event type.
+        :param deprecated_source: deprecatedSource is the deprecated field assuring backward compatibility with core.v1 Event type.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param note: note is a human-readable description of the status of this operation. Maximal length of the note is 1kB, but libraries should be prepared to handle values up to 64kB.
+        :param reason: reason is why the action was taken. It is human-readable. This field cannot be empty for new Events and it can have at most 128 characters.
+        :param regarding: regarding contains the object this Event is about. In most cases it's an Object reporting controller implements, e.g. ReplicaSetController implements ReplicaSets and this event is emitted because it acts on some changes in a ReplicaSet object.
+        :param related: related is the optional secondary object for more complex actions. E.g. when regarding object triggers a creation or deletion of related object.
+        :param reporting_controller: reportingController is the name of the controller that emitted this Event, e.g. ``kubernetes.io/kubelet``. This field cannot be empty for new Events.
+        :param reporting_instance: reportingInstance is the ID of the controller instance, e.g. ``kubelet-xyzf``. This field cannot be empty for new Events and it can have at most 128 characters.
+        :param series: series is data about the Event series this event represents or nil if it's a singleton Event.
+        :param type: type is the type of this event (Normal, Warning), new types could be added in the future. It is machine-readable. This field cannot be empty for new Events.
+
+        :schema: io.k8s.api.events.v1.Event
+        '''
+        if isinstance(deprecated_source, dict):
+            deprecated_source = EventSource(**deprecated_source)
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if isinstance(regarding, dict):
+            regarding = ObjectReference(**regarding)
+        if isinstance(related, dict):
+            related = ObjectReference(**related)
+        if isinstance(series, dict):
+            series = EventSeries(**series)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__48c2a6f443e17733c15e46b85814aa0990b46cd3a60cd4b9a9dbb71d3d3e844b)
+            check_type(argname="argument event_time", value=event_time, expected_type=type_hints["event_time"])
+            check_type(argname="argument action", value=action, expected_type=type_hints["action"])
+            check_type(argname="argument deprecated_count", value=deprecated_count, expected_type=type_hints["deprecated_count"])
+            check_type(argname="argument deprecated_first_timestamp", value=deprecated_first_timestamp, expected_type=type_hints["deprecated_first_timestamp"])
+            check_type(argname="argument deprecated_last_timestamp", value=deprecated_last_timestamp, expected_type=type_hints["deprecated_last_timestamp"])
+            check_type(argname="argument deprecated_source", value=deprecated_source, expected_type=type_hints["deprecated_source"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument note", value=note, expected_type=type_hints["note"])
+            check_type(argname="argument reason", value=reason, expected_type=type_hints["reason"])
+            check_type(argname="argument regarding", value=regarding, expected_type=type_hints["regarding"])
+            check_type(argname="argument related", value=related, expected_type=type_hints["related"])
+            check_type(argname="argument reporting_controller", value=reporting_controller, expected_type=type_hints["reporting_controller"])
+            check_type(argname="argument reporting_instance", value=reporting_instance, expected_type=type_hints["reporting_instance"])
+            check_type(argname="argument series", value=series, expected_type=type_hints["series"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+        self._value_event_time = event_time
+        self._value_action = action
+        self._value_deprecated_count = deprecated_count
+        self._value_deprecated_first_timestamp = deprecated_first_timestamp
+        self._value_deprecated_last_timestamp = deprecated_last_timestamp
+        self._value_deprecated_source = deprecated_source
+        self._value_metadata = metadata
+        self._value_note = note
+        self._value_reason = reason
+        self._value_regarding = regarding
+        self._value_related = related
+        self._value_reporting_controller = reporting_controller
+        self._value_reporting_instance = reporting_instance
+        self._value_series = series
+        self._value_type = type
+
+    @builtins.property
+    def event_time(self) -> datetime.datetime:
+        '''eventTime is the time when this Event was first observed.
+
+        It is required.
+
+        :schema: io.k8s.api.events.v1.Event#eventTime
+        '''
+        result = self._value_event_time
+        assert result is not None, "Required property 'event_time' is missing"
+        return typing.cast(datetime.datetime, result)
+
+    @builtins.property
+    def action(self) -> typing.Optional[builtins.str]:
+        '''action is what action was taken/failed regarding to the regarding object.
+
+        It is machine-readable. This field cannot be empty for new Events and it can have at most 128 characters.
+
+        :schema: io.k8s.api.events.v1.Event#action
+        '''
+        result = self._value_action
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def deprecated_count(self) -> typing.Optional[jsii.Number]:
+        '''deprecatedCount is the deprecated field assuring backward compatibility with core.v1 Event type.
+
+        :schema: io.k8s.api.events.v1.Event#deprecatedCount
+        '''
+        result = self._value_deprecated_count
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def deprecated_first_timestamp(self) -> typing.Optional[datetime.datetime]:
+        '''deprecatedFirstTimestamp is the deprecated field assuring backward compatibility with core.v1 Event type.
+
+        :schema: io.k8s.api.events.v1.Event#deprecatedFirstTimestamp
+        '''
+        result = self._value_deprecated_first_timestamp
+        return typing.cast(typing.Optional[datetime.datetime], result)
+
+    @builtins.property
+    def deprecated_last_timestamp(self) -> typing.Optional[datetime.datetime]:
+        '''deprecatedLastTimestamp is the deprecated field assuring backward compatibility with core.v1 Event type.
+
+        :schema: io.k8s.api.events.v1.Event#deprecatedLastTimestamp
+        '''
+        result = self._value_deprecated_last_timestamp
+        return typing.cast(typing.Optional[datetime.datetime], result)
+
+    @builtins.property
+    def deprecated_source(self) -> typing.Optional[EventSource]:
+        '''deprecatedSource is the deprecated field assuring backward compatibility with core.v1 Event type.
+
+        :schema: io.k8s.api.events.v1.Event#deprecatedSource
+        '''
+        result = self._value_deprecated_source
+        return typing.cast(typing.Optional[EventSource], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.events.v1.Event#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def note(self) -> typing.Optional[builtins.str]:
+        '''note is a human-readable description of the status of this operation.
+
+        Maximal length of the note is 1kB, but libraries should be prepared to handle values up to 64kB.
+
+        :schema: io.k8s.api.events.v1.Event#note
+        '''
+        result = self._value_note
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def reason(self) -> typing.Optional[builtins.str]:
+        '''reason is why the action was taken.
+
+        It is human-readable. This field cannot be empty for new Events and it can have at most 128 characters.
+
+        :schema: io.k8s.api.events.v1.Event#reason
+        '''
+        result = self._value_reason
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def regarding(self) -> typing.Optional["ObjectReference"]:
+        '''regarding contains the object this Event is about.
+
+        In most cases it's an Object reporting controller implements, e.g. ReplicaSetController implements ReplicaSets and this event is emitted because it acts on some changes in a ReplicaSet object.
+
+        :schema: io.k8s.api.events.v1.Event#regarding
+        '''
+        result = self._value_regarding
+        return typing.cast(typing.Optional["ObjectReference"], result)
+
+    @builtins.property
+    def related(self) -> typing.Optional["ObjectReference"]:
+        '''related is the optional secondary object for more complex actions.
+
+        E.g. when regarding object triggers a creation or deletion of related object.
+
+        :schema: io.k8s.api.events.v1.Event#related
+        '''
+        result = self._value_related
+        return typing.cast(typing.Optional["ObjectReference"], result)
+
+    @builtins.property
+    def reporting_controller(self) -> typing.Optional[builtins.str]:
+        '''reportingController is the name of the controller that emitted this Event, e.g. ``kubernetes.io/kubelet``. This field cannot be empty for new Events.
+
+        :schema: io.k8s.api.events.v1.Event#reportingController
+        '''
+        result = self._value_reporting_controller
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def reporting_instance(self) -> typing.Optional[builtins.str]:
+        '''reportingInstance is the ID of the controller instance, e.g. ``kubelet-xyzf``. This field cannot be empty for new Events and it can have at most 128 characters.
+
+        :schema: io.k8s.api.events.v1.Event#reportingInstance
+        '''
+        result = self._value_reporting_instance
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def series(self) -> typing.Optional[EventSeries]:
+        '''series is data about the Event series this event represents or nil if it's a singleton Event.
+
+        :schema: io.k8s.api.events.v1.Event#series
+        '''
+        result = self._value_series
+        return typing.cast(typing.Optional[EventSeries], result)
+
+    @builtins.property
+    def type(self) -> typing.Optional[builtins.str]:
+        '''type is the type of this event (Normal, Warning), new types could be added in the future.
+
+        It is machine-readable. This field cannot be empty for new Events.
+
+        :schema: io.k8s.api.events.v1.Event#type
+        '''
+        result = self._value_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "event_time": self._value_event_time,
+        }
+        if self._value_action is not None:
+            values["action"] = self._value_action
+        if self._value_deprecated_count is not None:
+            values["deprecated_count"] = self._value_deprecated_count
+        if self._value_deprecated_first_timestamp is not None:
+            values["deprecated_first_timestamp"] = self._value_deprecated_first_timestamp
+        if self._value_deprecated_last_timestamp is not None:
+            values["deprecated_last_timestamp"] = self._value_deprecated_last_timestamp
+        if self._value_deprecated_source is not None:
+            values["deprecated_source"] = self._value_deprecated_source
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_note is not None:
+            values["note"] = self._value_note
+        if self._value_reason is not None:
+            values["reason"] = self._value_reason
+        if self._value_regarding is not None:
+            values["regarding"] = self._value_regarding
+        if self._value_related is not None:
+            values["related"] = self._value_related
+        if self._value_reporting_controller is not None:
+            values["reporting_controller"] = self._value_reporting_controller
+        if self._value_reporting_instance is not None:
+            values["reporting_instance"] = self._value_reporting_instance
+        if self._value_series is not None:
+            values["series"] = self._value_series
+        if self._value_type is not None:
+            values["type"] = self._value_type
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeEventProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__48c2a6f443e17733c15e46b85814aa0990b46cd3a60cd4b9a9dbb71d3d3e844b(
+    *,
+    event_time: datetime.datetime,
+    action: typing.Optional[builtins.str] = None,
+    deprecated_count: typing.Optional[jsii.Number] = None,
+    deprecated_first_timestamp: typing.Optional[datetime.datetime] = None,
+    deprecated_last_timestamp: typing.Optional[datetime.datetime] = None,
+    deprecated_source: typing.Optional[typing.Union[EventSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    note: typing.Optional[builtins.str] = None,
+    reason: typing.Optional[builtins.str] = None,
+    regarding: typing.Optional[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    related: typing.Optional[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    reporting_controller: typing.Optional[builtins.str] = None,
+    reporting_instance: typing.Optional[builtins.str] = None,
+    series: typing.Optional[typing.Union[EventSeries, typing.Dict[builtins.str, typing.Any]]] = None,
+    type: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
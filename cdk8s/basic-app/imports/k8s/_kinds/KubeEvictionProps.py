@@ -0,0 +1,104 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .DeleteOptions import DeleteOptions
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeEvictionProps",
+    jsii_struct_bases=[],
+    name_mapping={"delete_options": "deleteOptions", "metadata": "metadata"},
+)
+class KubeEvictionProps(_base.Struct):
+    __slots__ = (
+        "_value_delete_options",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        delete_options: typing.Optional[typing.Union[DeleteOptions, typing.Dict[builtins.str, typing.Any]]] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Eviction evicts a pod from its node subject to certain policies and safety constraints.
+
+        This is a subresource of Pod.  A request to cause such an eviction is created by POSTing to .../pods//evictions.
+
+        :param delete_options: DeleteOptions may be provided.
+        :param metadata: ObjectMeta describes the pod that is being evicted.
+
+        :schema: io.k8s.api.policy.v1.Eviction
+        '''
+        if isinstance(delete_options, dict):
+            delete_options = DeleteOptions(**delete_options)
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__87cf0d2be9c3f9f8ef8e2278ad8544565ff3211d2445691804c2609bf06a14a3)
+            check_type(argname="argument delete_options", value=delete_options, expected_type=type_hints["delete_options"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_delete_options = delete_options
+        self._value_metadata = metadata
+
+    @builtins.property
+    def delete_options(self) -> typing.Optional[DeleteOptions]:
+        '''DeleteOptions may be provided.
+
+        :schema: io.k8s.api.policy.v1.Eviction#deleteOptions
+        '''
+        result = self._value_delete_options
+        return typing.cast(typing.Optional[DeleteOptions], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''ObjectMeta describes the pod that is being evicted.
+
+        :schema: io.k8s.api.policy.v1.Eviction#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_delete_options is not None:
+            values["delete_options"] = self._value_delete_options
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeEvictionProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__87cf0d2be9c3f9f8ef8e2278ad8544565ff3211d2445691804c2609bf06a14a3(
+    *,
+    delete_options: typing.Optional[typing.Union[DeleteOptions, typing.Dict[builtins.str, typing.Any]]] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
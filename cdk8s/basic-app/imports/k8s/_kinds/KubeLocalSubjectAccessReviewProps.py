@@ -0,0 +1,109 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+from .SubjectAccessReviewSpec import SubjectAccessReviewSpec
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeLocalSubjectAccessReviewProps",
+    jsii_struct_bases=[],
+    name_mapping={"spec": "spec", "metadata": "metadata"},
+)
+class KubeLocalSubjectAccessReviewProps(_base.Struct):
+    __slots__ = (
+        "_value_spec",
+        "_value_metadata",
+    )
+
+    def __init__(
+        self,
+        *,
+        spec: typing.Union["SubjectAccessReviewSpec", typing.Dict[builtins.str, typing.Any]],
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''LocalSubjectAccessReview checks whether or not a user or group can perform an action in a given namespace.
+
+        Having a namespace scoped resource makes it much easier to grant namespace scoped policy that includes permissions checking.
+
+        :param spec: Spec holds information about the request being evaluated. spec.namespace must be equal to the namespace you made the request against. If empty, it is defaulted.
+        :param metadata: Standard list metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.authorization.v1.LocalSubjectAccessReview
+        '''
+        if isinstance(spec, dict):
+            spec = SubjectAccessReviewSpec(**spec)
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__70906afc8c383c855cbd20f07b10abc432f25794647078ae07044f7af0aecd01)
+            check_type(argname="argument spec", value=spec, expected_type=type_hints["spec"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+        self._value_spec = spec
+        self._value_metadata = metadata
+
+    @builtins.property
+    def spec(self) -> "SubjectAccessReviewSpec":
+        '''Spec holds information about the request being evaluated.
+
+        spec.namespace must be equal to the namespace you made the request against.  If empty, it is defaulted.
+
+        :schema: io.k8s.api.authorization.v1.LocalSubjectAccessReview#spec
+        '''
+        result = self._value_spec
+        assert result is not None, "Required property 'spec' is missing"
+        return typing.cast("SubjectAccessReviewSpec", result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard list metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.authorization.v1.LocalSubjectAccessReview#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "spec": self._value_spec,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeLocalSubjectAccessReviewProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__70906afc8c383c855cbd20f07b10abc432f25794647078ae07044f7af0aecd01(
+    *,
+    spec: typing.Union[SubjectAccessReviewSpec, typing.Dict[builtins.str, typing.Any]],
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
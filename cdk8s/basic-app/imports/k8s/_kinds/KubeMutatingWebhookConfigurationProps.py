@@ -0,0 +1,102 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .MutatingWebhook import MutatingWebhook
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeMutatingWebhookConfigurationProps",
+    jsii_struct_bases=[],
+    name_mapping={"metadata": "metadata", "webhooks": "webhooks"},
+)
+class KubeMutatingWebhookConfigurationProps(_base.Struct):
+    __slots__ = (
+        "_value_metadata",
+        "_value_webhooks",
+    )
+
+    def __init__(
+        self,
+        *,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        webhooks: typing.Optional[typing.Sequence[typing.Union["MutatingWebhook", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''MutatingWebhookConfiguration describes the configuration of and admission webhook that accept or reject and may change the object.
+
+        :param metadata: Standard object metadata; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata.
+        :param webhooks: Webhooks is a list of webhooks and the affected resources and operations.
+
+        :schema: io.k8s.api.admissionregistration.v1.MutatingWebhookConfiguration
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__dcc8f1c51a09b8fe278a8bee5d20fb75c30d888189811d6a2f4a60c0182384cf)
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument webhooks", value=webhooks, expected_type=type_hints["webhooks"])
+        self._value_metadata = metadata
+        self._value_webhooks = webhooks
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object metadata;
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata.
+
+        :schema: io.k8s.api.admissionregistration.v1.MutatingWebhookConfiguration#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def webhooks(self) -> typing.Optional[typing.List["MutatingWebhook"]]:
+        '''Webhooks is a list of webhooks and the affected resources and operations.
+
+        :schema: io.k8s.api.admissionregistration.v1.MutatingWebhookConfiguration#webhooks
+        '''
+        result = self._value_webhooks
+        return typing.cast(typing.Optional[typing.List["MutatingWebhook"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_webhooks is not None:
+            values["webhooks"] = self._value_webhooks
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeMutatingWebhookConfigurationProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__dcc8f1c51a09b8fe278a8bee5d20fb75c30d888189811d6a2f4a60c0182384cf(
+    *,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    webhooks: typing.Optional[typing.Sequence[typing.Union[MutatingWebhook, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
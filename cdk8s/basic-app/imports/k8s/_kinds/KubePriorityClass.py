@@ -0,0 +1,123 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .KubePriorityClassProps import KubePriorityClassProps
+from .ObjectMeta import ObjectMeta
+
+
+class KubePriorityClass(
+    _cdk8s_d3d9af27.ApiObject,
+    metaclass=jsii.JSIIMeta,
+    jsii_type="k8s.KubePriorityClass",
+):
+    '''PriorityClass defines mapping from a priority class name to the priority integer value.
+
+    The value can be any valid integer.
+
+    :schema: io.k8s.api.scheduling.v1.PriorityClass
+    '''
+
+    def __init__(
+        self,
+        scope: _constructs_77d1e7e8.Construct,
+        id: builtins.str,
+        *,
+        value: jsii.Number,
+        description: typing.Optional[builtins.str] = None,
+        global_default: typing.Optional[builtins.bool] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        preemption_policy: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Defines a "io.k8s.api.scheduling.v1.PriorityClass" API object.
+
+        :param scope: the scope in which to define this object.
+        :param id: a scope-local name for the object.
+        :param value: The value of this priority class. This is the actual priority that pods receive when they have the name of this class in their pod spec.
+        :param description: description is an arbitrary string that usually provides guidelines on when this priority class should be used.
+        :param global_default: globalDefault specifies whether this PriorityClass should be considered as the default priority for pods that do not have any priority class. Only one PriorityClass can be marked as ``globalDefault``. However, if more than one PriorityClasses exists with their ``globalDefault`` field set to true, the smallest value of such global default PriorityClasses will be used as the default priority.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param preemption_policy: PreemptionPolicy is the Policy for preempting pods with lower priority. One of Never, PreemptLowerPriority. Defaults to PreemptLowerPriority if unset. Default: PreemptLowerPriority if unset.
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7849121f7cc4169719bf7c0334ed5b358df3185c443cdcca26f3ba64a177342f)
+            check_type(argname="argument scope", value=scope, expected_type=type_hints["scope"])
+            check_type(argname="argument id", value=id, expected_type=type_hints["id"])
+        props = KubePriorityClassProps(
+            value=value,
+            description=description,
+            global_default=global_default,
+            metadata=metadata,
+            preemption_policy=preemption_policy,
+        )
+
+        jsii.create(self.__class__, self, [scope, id, props])
+
+    @jsii.member(jsii_name="manifest")
+    @builtins.classmethod
+    def manifest(
+        cls,
+        *,
+        value: jsii.Number,
+        description: typing.Optional[builtins.str] = None,
+        global_default: typing.Optional[builtins.bool] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        preemption_policy: typing.Optional[builtins.str] = None,
+    ) -> typing.Any:
+        '''Renders a Kubernetes manifest for "io.k8s.api.scheduling.v1.PriorityClass".
+
+        This can be used to inline resource manifests inside other objects (e.g. as templates).
+
+        :param value: The value of this priority class. This is the actual priority that pods receive when they have the name of this class in their pod spec.
+        :param description: description is an arbitrary string that usually provides guidelines on when this priority class should be used.
+        :param global_default: globalDefault specifies whether this PriorityClass should be considered as the default priority for pods that do not have any priority class. Only one PriorityClass can be marked as ``globalDefault``. However, if more than one PriorityClasses exists with their ``globalDefault`` field set to true, the smallest value of such global default PriorityClasses will be used as the default priority.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param preemption_policy: PreemptionPolicy is the Policy for preempting pods with lower priority. One of Never, PreemptLowerPriority. Defaults to PreemptLowerPriority if unset. Default: PreemptLowerPriority if unset.
+        '''
+        props = KubePriorityClassProps(
+            value=value,
+            description=description,
+            global_default=global_default,
+            metadata=metadata,
+            preemption_policy=preemption_policy,
+        )
+
+        return typing.cast(typing.Any, jsii.sinvoke(cls, "manifest", [props]))
+
+    @jsii.member(jsii_name="toJson")
+    def to_json(self) -> typing.Any:
+        '''Renders the object to Kubernetes JSON.'''
+        return typing.cast(typing.Any, jsii.invoke(self, "toJson", []))
+
+    @jsii.python.classproperty
+    @jsii.member(jsii_name="GVK")
+    def GVK(cls) -> _cdk8s_d3d9af27.GroupVersionKind:
+        '''Returns the apiVersion and kind for "io.k8s.api.scheduling.v1.PriorityClass".'''
+        return typing.cast(_cdk8s_d3d9af27.GroupVersionKind, jsii.sget(cls, "GVK"))
+
+def _typecheckingstub__7849121f7cc4169719bf7c0334ed5b358df3185c443cdcca26f3ba64a177342f(
+    scope: _constructs_77d1e7e8.Construct,
+    id: builtins.str,
+    *,
+    value: jsii.Number,
+    description: typing.Optional[builtins.str] = None,
+    global_default: typing.Optional[builtins.bool] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    preemption_policy: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
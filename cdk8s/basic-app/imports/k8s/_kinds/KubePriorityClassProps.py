@@ -0,0 +1,169 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubePriorityClassProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "value": "value",
+        "description": "description",
+        "global_default": "globalDefault",
+        "metadata": "metadata",
+        "preemption_policy": "preemptionPolicy",
+    },
+)
+class KubePriorityClassProps(_base.Struct):
+    __slots__ = (
+        "_value_value",
+        "_value_description",
+        "_value_global_default",
+        "_value_metadata",
+        "_value_preemption_policy",
+    )
+
+    def __init__(
+        self,
+        *,
+        value: jsii.Number,
+        description: typing.Optional[builtins.str] = None,
+        global_default: typing.Optional[builtins.bool] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        preemption_policy: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''PriorityClass defines mapping from a priority class name to the priority integer value.
+
+        The value can be any valid integer.
+
+        :param value: The value of this priority class. This is the actual priority that pods receive when they have the name of this class in their pod spec.
+        :param description: description is an arbitrary string that usually provides guidelines on when this priority class should be used.
+        :param global_default: globalDefault specifies whether this PriorityClass should be considered as the default priority for pods that do not have any priority class. Only one PriorityClass can be marked as ``globalDefault``. However, if more than one PriorityClasses exists with their ``globalDefault`` field set to true, the smallest value of such global default PriorityClasses will be used as the default priority.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param preemption_policy: PreemptionPolicy is the Policy for preempting pods with lower priority. One of Never, PreemptLowerPriority. Defaults to PreemptLowerPriority if unset. Default: PreemptLowerPriority if unset.
+
+        :schema: io.k8s.api.scheduling.v1.PriorityClass
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__d2a7a0f6e62dd93fbc211f3259e5bdec03162b72d41924ec9b0431446407d338)
+            check_type(argname="argument value", value=value, expected_type=type_hints["value"])
+            check_type(argname="argument description", value=description, expected_type=type_hints["description"])
+            check_type(argname="argument global_default", value=global_default, expected_type=type_hints["global_default"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument preemption_policy", value=preemption_policy, expected_type=type_hints["preemption_policy"])
+        self._value_value = value
+        self._value_description = description
+        self._value_global_default = global_default
+        self._value_metadata = metadata
+        self._value_preemption_policy = preemption_policy
+
+    @builtins.property
+    def value(self) -> jsii.Number:
+        '''The value of this priority class.
+
+        This is the actual priority that pods receive when they have the name of this class in their pod spec.
+
+        :schema: io.k8s.api.scheduling.v1.PriorityClass#value
+        '''
+        result = self._value_value
+        assert result is not None, "Required property 'value' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def description(self) -> typing.Optional[builtins.str]:
+        '''description is an arbitrary string that usually provides guidelines on when this priority class should be used.
+
+        :schema: io.k8s.api.scheduling.v1.PriorityClass#description
+        '''
+        result = self._value_description
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def global_default(self) -> typing.Optional[builtins.bool]:
+        '''globalDefault specifies whether this PriorityClass should be considered as the default priority for pods that do not have any priority class.
+
+        Only one PriorityClass can be marked as ``globalDefault``. However, if more than one PriorityClasses exists with their ``globalDefault`` field set to true, the smallest value of such global default PriorityClasses will be used as the default priority.
+
+        :schema: io.k8s.api.scheduling.v1.PriorityClass#globalDefault
+        '''
+        result = self._value_global_default
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.scheduling.v1.PriorityClass#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def preemption_policy(self) -> typing.Optional[builtins.str]:
+        '''PreemptionPolicy is the Policy for preempting pods with lower priority.
+
+        One of Never, PreemptLowerPriority. Defaults to PreemptLowerPriority if unset.
+
+        :default: PreemptLowerPriority if unset.
+
+        :schema: io.k8s.api.scheduling.v1.PriorityClass#preemptionPolicy
+        '''
+        result = self._value_preemption_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "value": self._value_value,
+        }
+        if self._value_description is not None:
+            values["description"] = self._value_description
+        if self._value_global_default is not None:
+            values["global_default"] = self._value_global_default
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_preemption_policy is not None:
+            values["preemption_policy"] = self._value_preemption_policy
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubePriorityClassProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__d2a7a0f6e62dd93fbc211f3259e5bdec03162b72d41924ec9b0431446407d338(
+    *,
+    value: jsii.Number,
+    description: typing.Optional[builtins.str] = None,
+    global_default: typing.Optional[builtins.bool] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    preemption_policy: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,129 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+from .RoleRef import RoleRef
+from .Subject import Subject
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeRoleBindingProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "role_ref": "roleRef",
+        "metadata": "metadata",
+        "subjects": "subjects",
+    },
+)
+class KubeRoleBindingProps(_base.Struct):
+    __slots__ = (
+        "_value_role_ref",
+        "_value_metadata",
+        "_value_subjects",
+    )
+
+    def __init__(
+        self,
+        *,
+        role_ref: typing.Union["RoleRef", typing.Dict[builtins.str, typing.Any]],
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        subjects: typing.Optional[typing.Sequence[typing.Union["Subject", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''RoleBinding references a role, but does not contain it.
+
+        It can reference a Role in the same namespace or a ClusterRole in the global namespace. It adds who information via Subjects and namespace information by which namespace it exists in.  RoleBindings in a given namespace only have effect in that namespace.
+
+        :param role_ref: RoleRef can reference a Role in the current namespace or a ClusterRole in the global namespace. If the RoleRef cannot be resolved, the Authorizer must return an error.
+        :param metadata: Standard object's metadata.
+        :param subjects: Subjects holds references to the objects the role applies to.
+
+        :schema: io.k8s.api.rbac.v1.RoleBinding
+        '''
+        if isinstance(role_ref, dict):
+            role_ref = RoleRef(**role_ref)
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__8a2b8de1d0bd2d542efd8d7543a30c1daee70a3e4a630cb0ef968ba5f26deb1d)
+            check_type(argname="argument role_ref", value=role_ref, expected_type=type_hints["role_ref"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument subjects", value=subjects, expected_type=type_hints["subjects"])
+        self._value_role_ref = role_ref
+        self._value_metadata = metadata
+        self._value_subjects = subjects
+
+    @builtins.property
+    def role_ref(self) -> "RoleRef":
+        '''RoleRef can reference a Role in the current namespace or a ClusterRole in the global namespace.
+
+        If the RoleRef cannot be resolved, the Authorizer must return an error.
+
+        :schema: io.k8s.api.rbac.v1.RoleBinding#roleRef
+        '''
+        result = self._value_role_ref
+        assert result is not None, "Required property 'role_ref' is missing"
+        return typing.cast("RoleRef", result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        :schema: io.k8s.api.rbac.v1.RoleBinding#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def subjects(self) -> typing.Optional[typing.List["Subject"]]:
+        '''Subjects holds references to the objects the role applies to.
+
+        :schema: io.k8s.api.rbac.v1.RoleBinding#subjects
+        '''
+        result = self._value_subjects
+        return typing.cast(typing.Optional[typing.List["Subject"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "role_ref": self._value_role_ref,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_subjects is not None:
+            values["subjects"] = self._value_subjects
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeRoleBindingProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__8a2b8de1d0bd2d542efd8d7543a30c1daee70a3e4a630cb0ef968ba5f26deb1d(
+    *,
+    role_ref: typing.Union[RoleRef, typing.Dict[builtins.str, typing.Any]],
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    subjects: typing.Optional[typing.Sequence[typing.Union[Subject, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
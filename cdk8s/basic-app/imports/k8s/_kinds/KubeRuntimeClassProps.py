@@ -0,0 +1,154 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+from .Overhead import Overhead
+from .Scheduling import Scheduling
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeRuntimeClassProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "handler": "handler",
+        "metadata": "metadata",
+        "overhead": "overhead",
+        "scheduling": "scheduling",
+    },
+)
+class KubeRuntimeClassProps(_base.Struct):
+    __slots__ = (
+        "_value_handler",
+        "_value_metadata",
+        "_value_overhead",
+        "_value_scheduling",
+    )
+
+    def __init__(
+        self,
+        *,
+        handler: builtins.str,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        overhead: typing.Optional[typing.Union["Overhead", typing.Dict[builtins.str, typing.Any]]] = None,
+        scheduling: typing.Optional[typing.Union["Scheduling", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''RuntimeClass defines a class of container runtime supported in the cluster.
+
+        The RuntimeClass is used to determine which container runtime is used to run all containers in a pod. RuntimeClasses are manually defined by a user or cluster provisioner, and referenced in the PodSpec. The Kubelet is responsible for resolving the RuntimeClassName reference before running the pod.  For more details, see https://kubernetes.io/docs/concepts/containers/runtime-class/
+
+        :param handler: Handler specifies the underlying runtime and configuration that the CRI implementation will use to handle pods of this class. The possible values are specific to the node & CRI configuration. It is assumed that all handlers are available on every node, and handlers of the same name are equivalent on every node. For example, a handler called "runc" might specify that the runc OCI runtime (using native Linux containers) will be used to run the containers in a pod. The Handler must be lowercase, conform to the DNS Label (RFC 1123) requirements, and is immutable.
+        :param metadata: More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata.
+        :param overhead: Overhead represents the resource overhead associated with running a pod for a given RuntimeClass. For more details, see https://kubernetes.io/docs/concepts/scheduling-eviction/pod-overhead/
+        :param scheduling: Scheduling holds the scheduling constraints to ensure that pods running with this RuntimeClass are scheduled to nodes that support it. If scheduling is nil, this RuntimeClass is assumed to be supported by all nodes.
+
+        :schema: io.k8s.api.node.v1.RuntimeClass
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if isinstance(overhead, dict):
+            overhead = Overhead(**overhead)
+        if isinstance(scheduling, dict):
+            scheduling = Scheduling(**scheduling)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__66d9897bab16ca27a49026227ad29d408015abcd5910370e14974dcb1b0a858e)
+            check_type(argname="argument handler", value=handler, expected_type=type_hints["handler"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument overhead", value=overhead, expected_type=type_hints["overhead"])
+            check_type(argname="argument scheduling", value=scheduling, expected_type=type_hints["scheduling"])
+        self._value_handler = handler
+        self._value_metadata = metadata
+        self._value_overhead = overhead
+        self._value_scheduling = scheduling
+
+    @builtins.property
+    def handler(self) -> builtins.str:
+        '''Handler specifies the underlying runtime and configuration that the CRI implementation will use to handle pods of this class.
+
+        The possible values are specific to the node & CRI configuration.  It is assumed that all handlers are available on every node, and handlers of the same name are equivalent on every node. For example, a handler called "runc" might specify that the runc OCI runtime (using native Linux containers) will be used to run the containers in a pod. The Handler must be lowercase, conform to the DNS Label (RFC 1123) requirements, and is immutable.
+
+        :schema: io.k8s.api.node.v1.RuntimeClass#handler
+        '''
+        result = self._value_handler
+        assert result is not None, "Required property 'handler' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata.
+
+        :schema: io.k8s.api.node.v1.RuntimeClass#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def overhead(self) -> typing.Optional["Overhead"]:
+        '''Overhead represents the resource overhead associated with running a pod for a given RuntimeClass.
+
+        For more details, see
+        https://kubernetes.io/docs/concepts/scheduling-eviction/pod-overhead/
+
+        :schema: io.k8s.api.node.v1.RuntimeClass#overhead
+        '''
+        result = self._value_overhead
+        return typing.cast(typing.Optional["Overhead"], result)
+
+    @builtins.property
+    def scheduling(self) -> typing.Optional["Scheduling"]:
+        '''Scheduling holds the scheduling constraints to ensure that pods running with this RuntimeClass are scheduled to nodes that support it.
+
+        If scheduling is nil, this RuntimeClass is assumed to be supported by all nodes.
+
+        :schema: io.k8s.api.node.v1.RuntimeClass#scheduling
+        '''
+        result = self._value_scheduling
+        return typing.cast(typing.Optional["Scheduling"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "handler": self._value_handler,
+        }
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_overhead is not None:
+            values["overhead"] = self._value_overhead
+        if self._value_scheduling is not None:
+            values["scheduling"] = self._value_scheduling
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeRuntimeClassProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__66d9897bab16ca27a49026227ad29d408015abcd5910370e14974dcb1b0a858e(
+    *,
+    handler: builtins.str,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    overhead: typing.Optional[typing.Union[Overhead, typing.Dict[builtins.str, typing.Any]]] = None,
+    scheduling: typing.Optional[typing.Union[Scheduling, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,170 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeSecretProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "data": "data",
+        "immutable": "immutable",
+        "metadata": "metadata",
+        "string_data": "stringData",
+        "type": "type",
+    },
+)
+class KubeSecretProps(_base.Struct):
+    __slots__ = (
+        "_value_data",
+        "_value_immutable",
+        "_value_metadata",
+        "_value_string_data",
+        "_value_type",
+    )
+
+    def __init__(
+        self,
+        *,
+        data: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        immutable: typing.Optional[builtins.bool] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        string_data: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        type: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Secret holds secret data of a certain type.
+
+        The total bytes of the values in the Data field must be less than MaxSecretSize bytes.
+
+        :param data: Data contains the secret data. Each key must consist of alphanumeric characters, '-', '_' or '.'. The serialized form of the secret data is a base64 encoded string, representing the arbitrary (possibly non-string) data value here. Described in https://tools.ietf.org/html/rfc4648#section-4
+        :param immutable: Immutable, if set to true, ensures that data stored in the Secret cannot be updated (only object metadata can be modified). If not set to true, the field can be modified at any time. Defaulted to nil.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param string_data: stringData allows specifying non-binary secret data in string form. It is provided as a write-only input field for convenience. All keys and values are merged into the data field on write, overwriting any existing values. The stringData field is never output when reading from the API.
+        :param type: Used to facilitate programmatic handling of secret data. More info: https://kubernetes.io/docs/concepts/configuration/secret/#secret-types
+
+        :schema: io.k8s.api.core.v1.Secret
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__63ee35f74b966b919ab03aa2ea463b9251eb7bc667ff598909abc78e4bdeaea6)
+            check_type(argname="argument data", value=data, expected_type=type_hints["data"])
+            check_type(argname="argument immutable", value=immutable, expected_type=type_hints["immutable"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument string_data", value=string_data, expected_type=type_hints["string_data"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+        self._value_data = data
+        self._value_immutable = immutable
+        self._value_metadata = metadata
+        self._value_string_data = string_data
+        self._value_type = type
+
+    @builtins.property
+    def data(self) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''Data contains the secret data.
+
+        Each key must consist of alphanumeric characters, '-', '_' or '.'. The serialized form of the secret data is a base64 encoded string, representing the arbitrary (possibly non-string) data value here. Described in https://tools.ietf.org/html/rfc4648#section-4
+
+        :schema: io.k8s.api.core.v1.Secret#data
+        '''
+        result = self._value_data
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def immutable(self) -> typing.Optional[builtins.bool]:
+        '''Immutable, if set to true, ensures that data stored in the Secret cannot be updated (only object metadata can be modified).
+
+        If not set to true, the field can be modified at any time. Defaulted to nil.
+
+        :schema: io.k8s.api.core.v1.Secret#immutable
+        '''
+        result = self._value_immutable
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.core.v1.Secret#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def string_data(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''stringData allows specifying non-binary secret data in string form.
+
+        It is provided as a write-only input field for convenience. All keys and values are merged into the data field on write, overwriting any existing values. The stringData field is never output when reading from the API.
+
+        :schema: io.k8s.api.core.v1.Secret#stringData
+        '''
+        result = self._value_string_data
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def type(self) -> typing.Optional[builtins.str]:
+        '''Used to facilitate programmatic handling of secret data.
+
+        More info: https://kubernetes.io/docs/concepts/configuration/secret/#secret-types
+
+        :schema: io.k8s.api.core.v1.Secret#type
+        '''
+        result = self._value_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_data is not None:
+            values["data"] = self._value_data
+        if self._value_immutable is not None:
+            values["immutable"] = self._value_immutable
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_string_data is not None:
+            values["string_data"] = self._value_string_data
+        if self._value_type is not None:
+            values["type"] = self._value_type
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeSecretProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__63ee35f74b966b919ab03aa2ea463b9251eb7bc667ff598909abc78e4bdeaea6(
+    *,
+    data: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    immutable: typing.Optional[builtins.bool] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    string_data: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    type: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,150 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LocalObjectReference import LocalObjectReference
+from .ObjectMeta import ObjectMeta
+from .ObjectReference import ObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeServiceAccountProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "automount_service_account_token": "automountServiceAccountToken",
+        "image_pull_secrets": "imagePullSecrets",
+        "metadata": "metadata",
+        "secrets": "secrets",
+    },
+)
+class KubeServiceAccountProps(_base.Struct):
+    __slots__ = (
+        "_value_automount_service_account_token",
+        "_value_image_pull_secrets",
+        "_value_metadata",
+        "_value_secrets",
+    )
+
+    def __init__(
+        self,
+        *,
+        automount_service_account_token: typing.Optional[builtins.bool] = None,
+        image_pull_secrets: typing.Optional[typing.Sequence[typing.Union["LocalObjectReference", typing.Dict[builtins.str, typing.Any]]]] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        secrets: typing.Optional[typing.Sequence[typing.Union["ObjectReference", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''ServiceAccount binds together: * a name, understood by users, and perhaps by peripheral systems, for an identity * a principal that can be authenticated and authorized * a set of secrets.
+
+        :param automount_service_account_token: AutomountServiceAccountToken indicates whether pods running as this service account should have an API token automatically mounted. Can be overridden at the pod level.
+        :param image_pull_secrets: ImagePullSecrets is a list of references to secrets in the same namespace to use for pulling any images in pods that reference this ServiceAccount. ImagePullSecrets are distinct from Secrets because Secrets can be mounted in the pod, but ImagePullSecrets are only accessed by the kubelet. More info: https://kubernetes.io/docs/concepts/containers/images/#specifying-imagepullsecrets-on-a-pod
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param secrets: Secrets is a list of the secrets in the same namespace that pods running using this ServiceAccount are allowed to use. Pods are only limited to this list if this service account has a "kubernetes.io/enforce-mountable-secrets" annotation set to "true". This field should not be used to find auto-generated service account token secrets for use outside of pods. Instead, tokens can be requested directly using the TokenRequest API, or service account token secrets can be manually created. More info: https://kubernetes.io/docs/concepts/configuration/secret
+
+        :schema: io.k8s.api.core.v1.ServiceAccount
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ec9a6be9029d2ceb1c08d223e9b02d893a24441944fdbe9ad2eaa60dc6e92fb8)
+            check_type(argname="argument automount_service_account_token", value=automount_service_account_token, expected_type=type_hints["automount_service_account_token"])
+            check_type(argname="argument image_pull_secrets", value=image_pull_secrets, expected_type=type_hints["image_pull_secrets"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument secrets", value=secrets, expected_type=type_hints["secrets"])
+        self._value_automount_service_account_token = automount_service_account_token
+        self._value_image_pull_secrets = image_pull_secrets
+        self._value_metadata = metadata
+        self._value_secrets = secrets
+
+    @builtins.property
+    def automount_service_account_token(self) -> typing.Optional[builtins.bool]:
+        '''AutomountServiceAccountToken indicates whether pods running as this service account should have an API token automatically mounted.
+
+        Can be overridden at the pod level.
+
+        :schema: io.k8s.api.core.v1.ServiceAccount#automountServiceAccountToken
+        '''
+        result = self._value_automount_service_account_token
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def image_pull_secrets(
+        self,
+    ) -> typing.Optional[typing.List["LocalObjectReference"]]:
+        '''ImagePullSecrets is a list of references to secrets in the same namespace to use for pulling any images in pods that reference this ServiceAccount.
+
+        ImagePullSecrets are distinct from Secrets because Secrets can be mounted in the pod, but ImagePullSecrets are only accessed by the kubelet. More info: https://kubernetes.io/docs/concepts/containers/images/#specifying-imagepullsecrets-on-a-pod
+
+        :schema: io.k8s.api.core.v1.ServiceAccount#imagePullSecrets
+        '''
+        result = self._value_image_pull_secrets
+        return typing.cast(typing.Optional[typing.List["LocalObjectReference"]], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.core.v1.ServiceAccount#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def secrets(self) -> typing.Optional[typing.List["ObjectReference"]]:
+        '''Secrets is a list of the secrets in the same namespace that pods running using this ServiceAccount are allowed to use.
+
+        Pods are only limited to this list if this service account has a "kubernetes.io/enforce-mountable-secrets" annotation set to "true". This field should not be used to find auto-generated service account token secrets for use outside of pods. Instead, tokens can be requested directly using the TokenRequest API, or service account token secrets can be manually created. More info: https://kubernetes.io/docs/concepts/configuration/secret
+
+        :schema: io.k8s.api.core.v1.ServiceAccount#secrets
+        '''
+        result = self._value_secrets
+        return typing.cast(typing.Optional[typing.List["ObjectReference"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_automount_service_account_token is not None:
+            values["automount_service_account_token"] = self._value_automount_service_account_token
+        if self._value_image_pull_secrets is not None:
+            values["image_pull_secrets"] = self._value_image_pull_secrets
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_secrets is not None:
+            values["secrets"] = self._value_secrets
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeServiceAccountProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ec9a6be9029d2ceb1c08d223e9b02d893a24441944fdbe9ad2eaa60dc6e92fb8(
+    *,
+    automount_service_account_token: typing.Optional[builtins.bool] = None,
+    image_pull_secrets: typing.Optional[typing.Sequence[typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]]]] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    secrets: typing.Optional[typing.Sequence[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
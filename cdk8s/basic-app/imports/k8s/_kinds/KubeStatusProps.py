@@ -0,0 +1,165 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ListMeta import ListMeta
+from .StatusDetails import StatusDetails
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeStatusProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "code": "code",
+        "details": "details",
+        "message": "message",
+        "metadata": "metadata",
+        "reason": "reason",
+    },
+)
+class KubeStatusProps(_base.Struct):
+    __slots__ = (
+        "_value_code",
+        "_value_details",
+        "_value_message",
+        "_value_metadata",
+        "_value_reason",
+    )
+
+    def __init__(
+        self,
+        *,
+        code: typing.Optional[jsii.Number] = None,
+        details: typing.Optional[typing.Union["StatusDetails", typing.Dict[builtins.str, typing.Any]]] = None,
+        message: typing.Optional[builtins.str] = None,
+        metadata: typing.Optional[typing.Union["ListMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        reason: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Status is a return value for calls that don't return other objects.
+
+        :param code: Suggested HTTP return code for this status, 0 if not set.
+        :param details: Extended data associated with the reason. Each reason may define its own extended details. This field is optional and the data returned is not guaranteed to conform to any schema except that defined by the reason type.
+        :param message: A human-readable description of the status of this operation.
+        :param metadata: Standard list metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+        :param reason: A machine-readable description of why this operation is in the "Failure" status. If this value is empty there is no information available. A Reason clarifies an HTTP status code but does not override it.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Status
+        '''
+        if isinstance(details, dict):
+            details = StatusDetails(**details)
+        if isinstance(metadata, dict):
+            metadata = ListMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__4143b0ac58cd2ed3e56cba31c073cbc2ecd0f798e3c8eba8c4aa27bf03019254)
+            check_type(argname="argument code", value=code, expected_type=type_hints["code"])
+            check_type(argname="argument details", value=details, expected_type=type_hints["details"])
+            check_type(argname="argument message", value=message, expected_type=type_hints["message"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument reason", value=reason, expected_type=type_hints["reason"])
+        self._value_code = code
+        self._value_details = details
+        self._value_message = message
+        self._value_metadata = metadata
+        self._value_reason = reason
+
+    @builtins.property
+    def code(self) -> typing.Optional[jsii.Number]:
+        '''Suggested HTTP return code for this status, 0 if not set.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Status#code
+        '''
+        result = self._value_code
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def details(self) -> typing.Optional["StatusDetails"]:
+        '''Extended data associated with the reason.
+
+        Each reason may define its own extended details. This field is optional and the data returned is not guaranteed to conform to any schema except that defined by the reason type.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Status#details
+        '''
+        result = self._value_details
+        return typing.cast(typing.Optional["StatusDetails"], result)
+
+    @builtins.property
+    def message(self) -> typing.Optional[builtins.str]:
+        '''A human-readable description of the status of this operation.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Status#message
+        '''
+        result = self._value_message
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ListMeta"]:
+        '''Standard list metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Status#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ListMeta"], result)
+
+    @builtins.property
+    def reason(self) -> typing.Optional[builtins.str]:
+        '''A machine-readable description of why this operation is in the "Failure" status.
+
+        If this value is empty there is no information available. A Reason clarifies an HTTP status code but does not override it.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Status#reason
+        '''
+        result = self._value_reason
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_code is not None:
+            values["code"] = self._value_code
+        if self._value_details is not None:
+            values["details"] = self._value_details
+        if self._value_message is not None:
+            values["message"] = self._value_message
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_reason is not None:
+            values["reason"] = self._value_reason
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeStatusProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__4143b0ac58cd2ed3e56cba31c073cbc2ecd0f798e3c8eba8c4aa27bf03019254(
+    *,
+    code: typing.Optional[jsii.Number] = None,
+    details: typing.Optional[typing.Union[StatusDetails, typing.Dict[builtins.str, typing.Any]]] = None,
+    message: typing.Optional[builtins.str] = None,
+    metadata: typing.Optional[typing.Union[ListMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    reason: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,226 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectMeta import ObjectMeta
+from .TopologySelectorTerm import TopologySelectorTerm
+
+
+@jsii.data_type(
+    jsii_type="k8s.KubeStorageClassProps",
+    jsii_struct_bases=[],
+    name_mapping={
+        "provisioner": "provisioner",
+        "allowed_topologies": "allowedTopologies",
+        "allow_volume_expansion": "allowVolumeExpansion",
+        "metadata": "metadata",
+        "mount_options": "mountOptions",
+        "parameters": "parameters",
+        "reclaim_policy": "reclaimPolicy",
+        "volume_binding_mode": "volumeBindingMode",
+    },
+)
+class KubeStorageClassProps(_base.Struct):
+    __slots__ = (
+        "_value_provisioner",
+        "_value_allowed_topologies",
+        "_value_allow_volume_expansion",
+        "_value_metadata",
+        "_value_mount_options",
+        "_value_parameters",
+        "_value_reclaim_policy",
+        "_value_volume_binding_mode",
+    )
+
+    def __init__(
+        self,
+        *,
+        provisioner: builtins.str,
+        allowed_topologies: typing.Optional[typing.Sequence[typing.Union["TopologySelectorTerm", typing.Dict[builtins.str, typing.Any]]]] = None,
+        allow_volume_expansion: typing.Optional[builtins.bool] = None,
+        metadata: typing.Optional[typing.Union["ObjectMeta", typing.Dict[builtins.str, typing.Any]]] = None,
+        mount_options: typing.Optional[typing.Sequence[builtins.str]] = None,
+        parameters: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        reclaim_policy: typing.Optional[builtins.str] = None,
+        volume_binding_mode: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''StorageClass describes the parameters for a class of storage for which PersistentVolumes can be dynamically provisioned.
+
+        StorageClasses are non-namespaced; the name of the storage class according to etcd is in ObjectMeta.Name.
+
+        :param provisioner: Provisioner indicates the type of the provisioner.
+        :param allowed_topologies: Restrict the node topologies where volumes can be dynamically provisioned. Each volume plugin defines its own supported topology specifications. An empty TopologySelectorTerm list means there is no topology restriction. This field is only honored by servers that enable the VolumeScheduling feature.
+        :param allow_volume_expansion: AllowVolumeExpansion shows whether the storage class allow volume expand.
+        :param metadata: Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param mount_options: Dynamically provisioned PersistentVolumes of this storage class are created with these mountOptions, e.g. ["ro", "soft"]. Not validated - mount of the PVs will simply fail if one is invalid.
+        :param parameters: Parameters holds the parameters for the provisioner that should create volumes of this storage class.
+        :param reclaim_policy: Dynamically provisioned PersistentVolumes of this storage class are created with this reclaimPolicy. Defaults to Delete. Default: Delete.
+        :param volume_binding_mode: VolumeBindingMode indicates how PersistentVolumeClaims should be provisioned and bound. When unset, VolumeBindingImmediate is used. This field is only honored by servers that enable the VolumeScheduling feature.
+
+        :schema: io.k8s.api.storage.v1.StorageClass
+        '''
+        if isinstance(metadata, dict):
+            metadata = ObjectMeta(**metadata)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__3697ffdc356ed18bd130e122d368bb18f095fa7f9f60844c7c50e565931d0f37)
+            check_type(argname="argument provisioner", value=provisioner, expected_type=type_hints["provisioner"])
+            check_type(argname="argument allowed_topologies", value=allowed_topologies, expected_type=type_hints["allowed_topologies"])
+            check_type(argname="argument allow_volume_expansion", value=allow_volume_expansion, expected_type=type_hints["allow_volume_expansion"])
+            check_type(argname="argument metadata", value=metadata, expected_type=type_hints["metadata"])
+            check_type(argname="argument mount_options", value=mount_options, expected_type=type_hints["mount_options"])
+            check_type(argname="argument parameters", value=parameters, expected_type=type_hints["parameters"])
+            check_type(argname="argument reclaim_policy", value=reclaim_policy, expected_type=type_hints["reclaim_policy"])
+            check_type(argname="argument volume_binding_mode", value=volume_binding_mode, expected_type=type_hints["volume_binding_mode"])
+        self._value_provisioner = provisioner
+        self._value_allowed_topologies = allowed_topologies
+        self._value_allow_volume_expansion = allow_volume_expansion
+        self._value_metadata = metadata
+        self._value_mount_options = mount_options
+        self._value_parameters = parameters
+        self._value_reclaim_policy = reclaim_policy
+        self._value_volume_binding_mode = volume_binding_mode
+
+    @builtins.property
+    def provisioner(self) -> builtins.str:
+        '''Provisioner indicates the type of the provisioner.
+
+        :schema: io.k8s.api.storage.v1.StorageClass#provisioner
+        '''
+        result = self._value_provisioner
+        assert result is not None, "Required property 'provisioner' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def allowed_topologies(
+        self,
+    ) -> typing.Optional[typing.List["TopologySelectorTerm"]]:
+        '''Restrict the node topologies where volumes can be dynamically provisioned.
+
+        Each volume plugin defines its own supported topology specifications. An empty TopologySelectorTerm list means there is no topology restriction. This field is only honored by servers that enable the VolumeScheduling feature.
+
+        :schema: io.k8s.api.storage.v1.StorageClass#allowedTopologies
+        '''
+        result = self._value_allowed_topologies
+        return typing.cast(typing.Optional[typing.List["TopologySelectorTerm"]], result)
+
+    @builtins.property
+    def allow_volume_expansion(self) -> typing.Optional[builtins.bool]:
+        '''AllowVolumeExpansion shows whether the storage class allow volume expand.
+
+        :schema: io.k8s.api.storage.v1.StorageClass#allowVolumeExpansion
+        '''
+        result = self._value_allow_volume_expansion
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def metadata(self) -> typing.Optional["ObjectMeta"]:
+        '''Standard object's metadata.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.api.storage.v1.StorageClass#metadata
+        '''
+        result = self._value_metadata
+        return typing.cast(typing.Optional["ObjectMeta"], result)
+
+    @builtins.property
+    def mount_options(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Dynamically provisioned PersistentVolumes of this storage class are created with these mountOptions, e.g. ["ro", "soft"]. Not validated - mount of the PVs will simply fail if one is invalid.
+
+        :schema: io.k8s.api.storage.v1.StorageClass#mountOptions
+        '''
+        result = self._value_mount_options
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def parameters(self) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''Parameters holds the parameters for the provisioner that should create volumes of this storage class.
+
+        :schema: io.k8s.api.storage.v1.StorageClass#parameters
+        '''
+        result = self._value_parameters
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def reclaim_policy(self) -> typing.Optional[builtins.str]:
+        '''Dynamically provisioned PersistentVolumes of this storage class are created with this reclaimPolicy.
+
+        Defaults to Delete.
+
+        :default: Delete.
+
+        :schema: io.k8s.api.storage.v1.StorageClass#reclaimPolicy
+        '''
+        result = self._value_reclaim_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def volume_binding_mode(self) -> typing.Optional[builtins.str]:
+        '''VolumeBindingMode indicates how PersistentVolumeClaims should be provisioned and bound.
+
+        When unset, VolumeBindingImmediate is used. This field is only honored by servers that enable the VolumeScheduling feature.
+
+        :schema: io.k8s.api.storage.v1.StorageClass#volumeBindingMode
+        '''
+        result = self._value_volume_binding_mode
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "provisioner": self._value_provisioner,
+        }
+        if self._value_allowed_topologies is not None:
+            values["allowed_topologies"] = self._value_allowed_topologies
+        if self._value_allow_volume_expansion is not None:
+            values["allow_volume_expansion"] = self._value_allow_volume_expansion
+        if self._value_metadata is not None:
+            values["metadata"] = self._value_metadata
+        if self._value_mount_options is not None:
+            values["mount_options"] = self._value_mount_options
+        if self._value_parameters is not None:
+            values["parameters"] = self._value_parameters
+        if self._value_reclaim_policy is not None:
+            values["reclaim_policy"] = self._value_reclaim_policy
+        if self._value_volume_binding_mode is not None:
+            values["volume_binding_mode"] = self._value_volume_binding_mode
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "KubeStorageClassProps(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__3697ffdc356ed18bd130e122d368bb18f095fa7f9f60844c7c50e565931d0f37(
+    *,
+    provisioner: builtins.str,
+    allowed_topologies: typing.Optional[typing.Sequence[typing.Union[TopologySelectorTerm, typing.Dict[builtins.str, typing.Any]]]] = None,
+    allow_volume_expansion: typing.Optional[builtins.bool] = None,
+    metadata: typing.Optional[typing.Union[ObjectMeta, typing.Dict[builtins.str, typing.Any]]] = None,
+    mount_options: typing.Optional[typing.Sequence[builtins.str]] = None,
+    parameters: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    reclaim_policy: typing.Optional[builtins.str] = None,
+    volume_binding_mode: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,155 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.LeaseSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "acquire_time": "acquireTime",
+        "holder_identity": "holderIdentity",
+        "lease_duration_seconds": "leaseDurationSeconds",
+        "lease_transitions": "leaseTransitions",
+        "renew_time": "renewTime",
+    },
+)
+class LeaseSpec(_base.Struct):
+    __slots__ = (
+        "_value_acquire_time",
+        "_value_holder_identity",
+        "_value_lease_duration_seconds",
+        "_value_lease_transitions",
+        "_value_renew_time",
+    )
+
+    def __init__(
+        self,
+        *,
+        acquire_time: typing.Optional[datetime.datetime] = None,
+        holder_identity: typing.Optional[builtins.str] = None,
+        lease_duration_seconds: typing.Optional[jsii.Number] = None,
+        lease_transitions: typing.Optional[jsii.Number] = None,
+        renew_time: typing.Optional[datetime.datetime] = None,
+    ) -> None:
+        '''LeaseSpec is a specification of a Lease.
+
+        :param acquire_time: acquireTime is a time when the current lease was acquired.
+        :param holder_identity: holderIdentity contains the identity of the holder of a current lease.
+        :param lease_duration_seconds: leaseDurationSeconds is a duration that candidates for a lease need to wait to force acquire it. This is measure against time of last observed RenewTime.
+        :param lease_transitions: leaseTransitions is the number of transitions of a lease between holders.
+        :param renew_time: renewTime is a time when the current holder of a lease has last updated the lease.
+
+        :schema: io.k8s.api.coordination.v1.LeaseSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__401c15ef806c5b756921eeaf607340ba52477c9d6dab3b4ed3171aa7accf13c0)
+            check_type(argname="argument acquire_time", value=acquire_time, expected_type=type_hints["acquire_time"])
+            check_type(argname="argument holder_identity", value=holder_identity, expected_type=type_hints["holder_identity"])
+            check_type(argname="argument lease_duration_seconds", value=lease_duration_seconds, expected_type=type_hints["lease_duration_seconds"])
+            check_type(argname="argument lease_transitions", value=lease_transitions, expected_type=type_hints["lease_transitions"])
+            check_type(argname="argument renew_time", value=renew_time, expected_type=type_hints["renew_time"])
+        self._value_acquire_time = acquire_time
+        self._value_holder_identity = holder_identity
+        self._value_lease_duration_seconds = lease_duration_seconds
+        self._value_lease_transitions = lease_transitions
+        self._value_renew_time = renew_time
+
+    @builtins.property
+    def acquire_time(self) -> typing.Optional[datetime.datetime]:
+        '''acquireTime is a time when the current lease was acquired.
+
+        :schema: io.k8s.api.coordination.v1.LeaseSpec#acquireTime
+        '''
+        result = self._value_acquire_time
+        return typing.cast(typing.Optional[datetime.datetime], result)
+
+    @builtins.property
+    def holder_identity(self) -> typing.Optional[builtins.str]:
+        '''holderIdentity contains the identity of the holder of a current lease.
+
+        :schema: io.k8s.api.coordination.v1.LeaseSpec#holderIdentity
+        '''
+        result = self._value_holder_identity
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def lease_duration_seconds(self) -> typing.Optional[jsii.Number]:
+        '''leaseDurationSeconds is a duration that candidates for a lease need to wait to force acquire it.
+
+        This is measure against time of last observed RenewTime.
+
+        :schema: io.k8s.api.coordination.v1.LeaseSpec#leaseDurationSeconds
+        '''
+        result = self._value_lease_duration_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def lease_transitions(self) -> typing.Optional[jsii.Number]:
+        '''leaseTransitions is the number of transitions of a lease between holders.
+
+        :schema: io.k8s.api.coordination.v1.LeaseSpec#leaseTransitions
+        '''
+        result = self._value_lease_transitions
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def renew_time(self) -> typing.Optional[datetime.datetime]:
+        '''renewTime is a time when the current holder of a lease has last updated the lease.
+
+        :schema: io.k8s.api.coordination.v1.LeaseSpec#renewTime
+        '''
+        result = self._value_renew_time
+        return typing.cast(typing.Optional[datetime.datetime], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_acquire_time is not None:
+            values["acquire_time"] = self._value_acquire_time
+        if self._value_holder_identity is not None:
+            values["holder_identity"] = self._value_holder_identity
+        if self._value_lease_duration_seconds is not None:
+            values["lease_duration_seconds"] = self._value_lease_duration_seconds
+        if self._value_lease_transitions is not None:
+            values["lease_transitions"] = self._value_lease_transitions
+        if self._value_renew_time is not None:
+            values["renew_time"] = self._value_renew_time
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "LeaseSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__401c15ef806c5b756921eeaf607340ba52477c9d6dab3b4ed3171aa7accf13c0(
+    *,
+    acquire_time: typing.Optional[datetime.datetime] = None,
+    holder_identity: typing.Optional[builtins.str] = None,
+    lease_duration_seconds: typing.Optional[jsii.Number] = None,
+    lease_transitions: typing.Optional[jsii.Number] = None,
+    renew_time: typing.Optional[datetime.datetime] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
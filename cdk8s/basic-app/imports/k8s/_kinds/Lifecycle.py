@@ -0,0 +1,107 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LifecycleHandler import LifecycleHandler
+
+
+@jsii.data_type(
+    jsii_type="k8s.Lifecycle",
+    jsii_struct_bases=[],
+    name_mapping={"post_start": "postStart", "pre_stop": "preStop"},
+)
+class Lifecycle(_base.Struct):
+    __slots__ = (
+        "_value_post_start",
+        "_value_pre_stop",
+    )
+
+    def __init__(
+        self,
+        *,
+        post_start: typing.Optional[typing.Union["LifecycleHandler", typing.Dict[builtins.str, typing.Any]]] = None,
+        pre_stop: typing.Optional[typing.Union["LifecycleHandler", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Lifecycle describes actions that the management system should take in response to container lifecycle events.
+
+        For the PostStart and PreStop lifecycle handlers, management of the container blocks until the action is complete, unless the container process fails, in which case the handler is aborted.
+
+        :param post_start: PostStart is called immediately after a container is created. If the handler fails, the container is terminated and restarted according to its restart policy. Other management of the container blocks until the hook completes. More info: https://kubernetes.io/docs/concepts/containers/container-lifecycle-hooks/#container-hooks
+        :param pre_stop: PreStop is called immediately before a container is terminated due to an API request or management event such as liveness/startup probe failure, preemption, resource contention, etc. The handler is not called if the container crashes or exits. The Pod's termination grace period countdown begins before the PreStop hook is executed. Regardless of the outcome of the handler, the container will eventually terminate within the Pod's termination grace period (unless delayed by finalizers). Other management of the container blocks until the hook completes or until the termination grace period is reached. More info: https://kubernetes.io/docs/concepts/containers/container-lifecycle-hooks/#container-hooks
+
+        :schema: io.k8s.api.core.v1.Lifecycle
+        '''
+        if isinstance(post_start, dict):
+            post_start = LifecycleHandler(**post_start)
+        if isinstance(pre_stop, dict):
+            pre_stop = LifecycleHandler(**pre_stop)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7bd1d9e48df3fb31eaad590d942020be7329bc9ca7a62db73e43e7362b1cc50d)
+            check_type(argname="argument post_start", value=post_start, expected_type=type_hints["post_start"])
+            check_type(argname="argument pre_stop", value=pre_stop, expected_type=type_hints["pre_stop"])
+        self._value_post_start = post_start
+        self._value_pre_stop = pre_stop
+
+    @builtins.property
+    def post_start(self) -> typing.Optional["LifecycleHandler"]:
+        '''PostStart is called immediately after a container is created.
+
+        If the handler fails, the container is terminated and restarted according to its restart policy. Other management of the container blocks until the hook completes. More info: https://kubernetes.io/docs/concepts/containers/container-lifecycle-hooks/#container-hooks
+
+        :schema: io.k8s.api.core.v1.Lifecycle#postStart
+        '''
+        result = self._value_post_start
+        return typing.cast(typing.Optional["LifecycleHandler"], result)
+
+    @builtins.property
+    def pre_stop(self) -> typing.Optional["LifecycleHandler"]:
+        '''PreStop is called immediately before a container is terminated due to an API request or management event such as liveness/startup probe failure, preemption, resource contention, etc.
+
+        The handler is not called if the container crashes or exits. The Pod's termination grace period countdown begins before the PreStop hook is executed. Regardless of the outcome of the handler, the container will eventually terminate within the Pod's termination grace period (unless delayed by finalizers). Other management of the container blocks until the hook completes or until the termination grace period is reached. More info: https://kubernetes.io/docs/concepts/containers/container-lifecycle-hooks/#container-hooks
+
+        :schema: io.k8s.api.core.v1.Lifecycle#preStop
+        '''
+        result = self._value_pre_stop
+        return typing.cast(typing.Optional["LifecycleHandler"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_post_start is not None:
+            values["post_start"] = self._value_post_start
+        if self._value_pre_stop is not None:
+            values["pre_stop"] = self._value_pre_stop
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Lifecycle(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7bd1d9e48df3fb31eaad590d942020be7329bc9ca7a62db73e43e7362b1cc50d(
+    *,
+    post_start: typing.Optional[typing.Union[LifecycleHandler, typing.Dict[builtins.str, typing.Any]]] = None,
+    pre_stop: typing.Optional[typing.Union[LifecycleHandler, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,126 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ExecAction import ExecAction
+from .HttpGetAction import HttpGetAction
+from .TcpSocketAction import TcpSocketAction
+
+
+@jsii.data_type(
+    jsii_type="k8s.LifecycleHandler",
+    jsii_struct_bases=[],
+    name_mapping={"exec": "exec", "http_get": "httpGet", "tcp_socket": "tcpSocket"},
+)
+class LifecycleHandler(_base.Struct):
+    __slots__ = (
+        "_value_exec",
+        "_value_http_get",
+        "_value_tcp_socket",
+    )
+
+    def __init__(
+        self,
+        *,
+        exec: typing.Optional[typing.Union[ExecAction, typing.Dict[builtins.str, typing.Any]]] = None,
+        http_get: typing.Optional[typing.Union[HttpGetAction, typing.Dict[builtins.str, typing.Any]]] = None,
+        tcp_socket: typing.Optional[typing.Union["TcpSocketAction", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''LifecycleHandler defines a specific action that should be taken in a lifecycle hook.
+
+        One and only one of the fields, except TCPSocket must be specified.
+
+        :param exec: Exec specifies the action to take.
+        :param http_get: HTTPGet specifies the http request to perform.
+        :param tcp_socket: Deprecated. TCPSocket is NOT supported as a LifecycleHandler and kept for the backward compatibility. There are no validation of this field and lifecycle hooks will fail in runtime when tcp handler is specified.
+
+        :schema: io.k8s.api.core.v1.LifecycleHandler
+        '''
+        if isinstance(exec, dict):
+            exec = ExecAction(**exec)
+        if isinstance(http_get, dict):
+            http_get = HttpGetAction(**http_get)
+        if isinstance(tcp_socket, dict):
+            tcp_socket = TcpSocketAction(**tcp_socket)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__26ab4379df425e6abfcd38434919756033f8e7da90416a68d159b10d8103d3a0)
+            check_type(argname="argument exec", value=exec, expected_type=type_hints["exec"])
+            check_type(argname="argument http_get", value=http_get, expected_type=type_hints["http_get"])
+            check_type(argname="argument tcp_socket", value=tcp_socket, expected_type=type_hints["tcp_socket"])
+        self._value_exec = exec
+        self._value_http_get = http_get
+        self._value_tcp_socket = tcp_socket
+
+    @builtins.property
+    def exec(self) -> typing.Optional[ExecAction]:
+        '''Exec specifies the action to take.
+
+        :schema: io.k8s.api.core.v1.LifecycleHandler#exec
+        '''
+        result = self._value_exec
+        return typing.cast(typing.Optional[ExecAction], result)
+
+    @builtins.property
+    def http_get(self) -> typing.Optional[HttpGetAction]:
+        '''HTTPGet specifies the http request to perform.
+
+        :schema: io.k8s.api.core.v1.LifecycleHandler#httpGet
+        '''
+        result = self._value_http_get
+        return typing.cast(typing.Optional[HttpGetAction], result)
+
+    @builtins.property
+    def tcp_socket(self) -> typing.Optional["TcpSocketAction"]:
+        '''Deprecated.
+
+        TCPSocket is NOT supported as a LifecycleHandler and kept for the backward compatibility. There are no validation of this field and lifecycle hooks will fail in runtime when tcp handler is specified.
+
+        :schema: io.k8s.api.core.v1.LifecycleHandler#tcpSocket
+        '''
+        result = self._value_tcp_socket
+        return typing.cast(typing.Optional["TcpSocketAction"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_exec is not None:
+            values["exec"] = self._value_exec
+        if self._value_http_get is not None:
+            values["http_get"] = self._value_http_get
+        if self._value_tcp_socket is not None:
+            values["tcp_socket"] = self._value_tcp_socket
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "LifecycleHandler(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__26ab4379df425e6abfcd38434919756033f8e7da90416a68d159b10d8103d3a0(
+    *,
+    exec: typing.Optional[typing.Union[ExecAction, typing.Dict[builtins.str, typing.Any]]] = None,
+    http_get: typing.Optional[typing.Union[HttpGetAction, typing.Dict[builtins.str, typing.Any]]] = None,
+    tcp_socket: typing.Optional[typing.Union[TcpSocketAction, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,179 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Quantity import Quantity
+
+
+@jsii.data_type(
+    jsii_type="k8s.LimitRangeItem",
+    jsii_struct_bases=[],
+    name_mapping={
+        "type": "type",
+        "default": "default",
+        "default_request": "defaultRequest",
+        "max": "max",
+        "max_limit_request_ratio": "maxLimitRequestRatio",
+        "min": "min",
+    },
+)
+class LimitRangeItem(_base.Struct):
+    __slots__ = (
+        "_value_type",
+        "_value_default",
+        "_value_default_request",
+        "_value_max",
+        "_value_max_limit_request_ratio",
+        "_value_min",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: builtins.str,
+        default: typing.Optional[typing.Mapping[builtins.str, "Quantity"]] = None,
+        default_request: typing.Optional[typing.Mapping[builtins.str, "Quantity"]] = None,
+        max: typing.Optional[typing.Mapping[builtins.str, "Quantity"]] = None,
+        max_limit_request_ratio: typing.Optional[typing.Mapping[builtins.str, "Quantity"]] = None,
+        min: typing.Optional[typing.Mapping[builtins.str, "Quantity"]] = None,
+    ) -> None:
+        '''LimitRangeItem defines a min/max usage limit for any resource that matches on kind.
+
+        :param type: Type of resource that this limit applies to.
+        :param default: Default resource requirement limit value by resource name if resource limit is omitted.
+        :param default_request: DefaultRequest is the default resource requirement request value by resource name if resource request is omitted.
+        :param max: Max usage constraints on this kind by resource name.
+        :param max_limit_request_ratio: MaxLimitRequestRatio if specified, the named resource must have a request and limit that are both non-zero where limit divided by request is less than or equal to the enumerated value; this represents the max burst for the named resource.
+        :param min: Min usage constraints on this kind by resource name.
+
+        :schema: io.k8s.api.core.v1.LimitRangeItem
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__f178641e82038afdb476dfb5344285c2cd173e3d277341d2bdd9147b73026eee)
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument default", value=default, expected_type=type_hints["default"])
+            check_type(argname="argument default_request", value=default_request, expected_type=type_hints["default_request"])
+            check_type(argname="argument max", value=max, expected_type=type_hints["max"])
+            check_type(argname="argument max_limit_request_ratio", value=max_limit_request_ratio, expected_type=type_hints["max_limit_request_ratio"])
+            check_type(argname="argument min", value=min, expected_type=type_hints["min"])
+        self._value_type = type
+        self._value_default = default
+        self._value_default_request = default_request
+        self._value_max = max
+        self._value_max_limit_request_ratio = max_limit_request_ratio
+        self._value_min = min
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''Type of resource that this limit applies to.
+
+        :schema: io.k8s.api.core.v1.LimitRangeItem#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def default(self) -> typing.Optional[typing.Mapping[builtins.str, "Quantity"]]:
+        '''Default resource requirement limit value by resource name if resource limit is omitted.
+
+        :schema: io.k8s.api.core.v1.LimitRangeItem#default
+        '''
+        result = self._value_default
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "Quantity"]], result)
+
+    @builtins.property
+    def default_request(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, "Quantity"]]:
+        '''DefaultRequest is the default resource requirement request value by resource name if resource request is omitted.
+
+        :schema: io.k8s.api.core.v1.LimitRangeItem#defaultRequest
+        '''
+        result = self._value_default_request
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "Quantity"]], result)
+
+    @builtins.property
+    def max(self) -> typing.Optional[typing.Mapping[builtins.str, "Quantity"]]:
+        '''Max usage constraints on this kind by resource name.
+
+        :schema: io.k8s.api.core.v1.LimitRangeItem#max
+        '''
+        result = self._value_max
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "Quantity"]], result)
+
+    @builtins.property
+    def max_limit_request_ratio(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, "Quantity"]]:
+        '''MaxLimitRequestRatio if specified, the named resource must have a request and limit that are both non-zero where limit divided by request is less than or equal to the enumerated value;
+
+        this represents the max burst for the named resource.
+
+        :schema: io.k8s.api.core.v1.LimitRangeItem#maxLimitRequestRatio
+        '''
+        result = self._value_max_limit_request_ratio
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "Quantity"]], result)
+
+    @builtins.property
+    def min(self) -> typing.Optional[typing.Mapping[builtins.str, "Quantity"]]:
+        '''Min usage constraints on this kind by resource name.
+
+        :schema: io.k8s.api.core.v1.LimitRangeItem#min
+        '''
+        result = self._value_min
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "Quantity"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "type": self._value_type,
+        }
+        if self._value_default is not None:
+            values["default"] = self._value_default
+        if self._value_default_request is not None:
+            values["default_request"] = self._value_default_request
+        if self._value_max is not None:
+            values["max"] = self._value_max
+        if self._value_max_limit_request_ratio is not None:
+            values["max_limit_request_ratio"] = self._value_max_limit_request_ratio
+        if self._value_min is not None:
+            values["min"] = self._value_min
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "LimitRangeItem(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__f178641e82038afdb476dfb5344285c2cd173e3d277341d2bdd9147b73026eee(
+    *,
+    type: builtins.str,
+    default: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    default_request: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    max: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    max_limit_request_ratio: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    min: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,81 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LimitRangeItem import LimitRangeItem
+
+
+@jsii.data_type(
+    jsii_type="k8s.LimitRangeSpec",
+    jsii_struct_bases=[],
+    name_mapping={"limits": "limits"},
+)
+class LimitRangeSpec(_base.Struct):
+    __slots__ = (
+        "_value_limits",
+    )
+
+    def __init__(
+        self,
+        *,
+        limits: typing.Sequence[typing.Union[LimitRangeItem, typing.Dict[builtins.str, typing.Any]]],
+    ) -> None:
+        '''LimitRangeSpec defines a min/max usage limit for resources that match on kind.
+
+        :param limits: Limits is the list of LimitRangeItem objects that are enforced.
+
+        :schema: io.k8s.api.core.v1.LimitRangeSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__027b4c522c19844f185c6e4f67a4d23daf36b62d09bea8f49867796254123ae9)
+            check_type(argname="argument limits", value=limits, expected_type=type_hints["limits"])
+        self._value_limits = limits
+
+    @builtins.property
+    def limits(self) -> typing.List[LimitRangeItem]:
+        '''Limits is the list of LimitRangeItem objects that are enforced.
+
+        :schema: io.k8s.api.core.v1.LimitRangeSpec#limits
+        '''
+        result = self._value_limits
+        assert result is not None, "Required property 'limits' is missing"
+        return typing.cast(typing.List[LimitRangeItem], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "limits": self._value_limits,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "LimitRangeSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__027b4c522c19844f185c6e4f67a4d23daf36b62d09bea8f49867796254123ae9(
+    *,
+    limits: typing.Sequence[typing.Union[LimitRangeItem, typing.Dict[builtins.str, typing.Any]]],
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,104 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .QueuingConfigurationV1Beta1 import QueuingConfigurationV1Beta1
+
+
+@jsii.data_type(
+    jsii_type="k8s.LimitResponseV1Beta1",
+    jsii_struct_bases=[],
+    name_mapping={"type": "type", "queuing": "queuing"},
+)
+class LimitResponseV1Beta1(_base.Struct):
+    __slots__ = (
+        "_value_type",
+        "_value_queuing",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: builtins.str,
+        queuing: typing.Optional[typing.Union["QueuingConfigurationV1Beta1", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''LimitResponse defines how to handle requests that can not be executed right now.
+
+        :param type: ``type`` is "Queue" or "Reject". "Queue" means that requests that can not be executed upon arrival are held in a queue until they can be executed or a queuing limit is reached. "Reject" means that requests that can not be executed upon arrival are rejected. Required.
+        :param queuing: ``queuing`` holds the configuration parameters for queuing. This field may be non-empty only if ``type`` is ``"Queue"``.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.LimitResponse
+        '''
+        if isinstance(queuing, dict):
+            queuing = QueuingConfigurationV1Beta1(**queuing)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c6a31d26dd1825fed6969f220d5de82c7753778878cd3ff82c2f5f0d49f8e043)
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument queuing", value=queuing, expected_type=type_hints["queuing"])
+        self._value_type = type
+        self._value_queuing = queuing
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''``type`` is "Queue" or "Reject".
+
+        "Queue" means that requests that can not be executed upon arrival are held in a queue until they can be executed or a queuing limit is reached. "Reject" means that requests that can not be executed upon arrival are rejected. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.LimitResponse#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def queuing(self) -> typing.Optional["QueuingConfigurationV1Beta1"]:
+        '''``queuing`` holds the configuration parameters for queuing.
+
+        This field may be non-empty only if ``type`` is ``"Queue"``.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.LimitResponse#queuing
+        '''
+        result = self._value_queuing
+        return typing.cast(typing.Optional["QueuingConfigurationV1Beta1"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "type": self._value_type,
+        }
+        if self._value_queuing is not None:
+            values["queuing"] = self._value_queuing
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "LimitResponseV1Beta1(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c6a31d26dd1825fed6969f220d5de82c7753778878cd3ff82c2f5f0d49f8e043(
+    *,
+    type: builtins.str,
+    queuing: typing.Optional[typing.Union[QueuingConfigurationV1Beta1, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,113 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LimitResponseV1Beta1 import LimitResponseV1Beta1
+
+
+@jsii.data_type(
+    jsii_type="k8s.LimitedPriorityLevelConfigurationV1Beta1",
+    jsii_struct_bases=[],
+    name_mapping={
+        "assured_concurrency_shares": "assuredConcurrencyShares",
+        "limit_response": "limitResponse",
+    },
+)
+class LimitedPriorityLevelConfigurationV1Beta1(_base.Struct):
+    __slots__ = (
+        "_value_assured_concurrency_shares",
+        "_value_limit_response",
+    )
+
+    def __init__(
+        self,
+        *,
+        assured_concurrency_shares: typing.Optional[jsii.Number] = None,
+        limit_response: typing.Optional[typing.Union[LimitResponseV1Beta1, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''LimitedPriorityLevelConfiguration specifies how to handle requests that are subject to limits.
+
+        It addresses two issues:
+
+        - How are requests for this priority level limited?
+        - What should be done with requests that exceed the limit?
+
+        :param assured_concurrency_shares: ``assuredConcurrencyShares`` (ACS) configures the execution limit, which is a limit on the number of requests of this priority level that may be exeucting at a given time. ACS must be a positive number. The server's concurrency limit (SCL) is divided among the concurrency-controlled priority levels in proportion to their assured concurrency shares. This produces the assured concurrency value (ACV) --- the number of requests that may be executing at a time --- for each such priority level: ACV(l) = ceil( SCL * ACS(l) / ( sum[priority levels k] ACS(k) ) ) bigger numbers of ACS mean more reserved concurrent requests (at the expense of every other PL). This field has a default value of 30.
+        :param limit_response: ``limitResponse`` indicates what to do with requests that can not be executed right now.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.LimitedPriorityLevelConfiguration
+        '''
+        if isinstance(limit_response, dict):
+            limit_response = LimitResponseV1Beta1(**limit_response)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__41d971b8a7a21ba91caea15cee41c4815f31c85df21694fcda26ff7bcf37200f)
+            check_type(argname="argument assured_concurrency_shares", value=assured_concurrency_shares, expected_type=type_hints["assured_concurrency_shares"])
+            check_type(argname="argument limit_response", value=limit_response, expected_type=type_hints["limit_response"])
+        self._value_assured_concurrency_shares = assured_concurrency_shares
+        self._value_limit_response = limit_response
+
+    @builtins.property
+    def assured_concurrency_shares(self) -> typing.Optional[jsii.Number]:
+        '''``assuredConcurrencyShares`` (ACS) configures the execution limit, which is a limit on the number of requests of this priority level that may be exeucting at a given time.
+
+        ACS must be a positive number. The server's concurrency limit (SCL) is divided among the concurrency-controlled priority levels in proportion to their assured concurrency shares. This produces the assured concurrency value (ACV) --- the number of requests that may be executing at a time --- for each such priority level:
+
+        ACV(l) = ceil( SCL * ACS(l) / ( sum[priority levels k] ACS(k) ) )
+
+        bigger numbers of ACS mean more reserved concurrent requests (at the expense of every other PL). This field has a default value of 30.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.LimitedPriorityLevelConfiguration#assuredConcurrencyShares
+        '''
+        result = self._value_assured_concurrency_shares
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def limit_response(self) -> typing.Optional[LimitResponseV1Beta1]:
+        '''``limitResponse`` indicates what to do with requests that can not be executed right now.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.LimitedPriorityLevelConfiguration#limitResponse
+        '''
+        result = self._value_limit_response
+        return typing.cast(typing.Optional[LimitResponseV1Beta1], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_assured_concurrency_shares is not None:
+            values["assured_concurrency_shares"] = self._value_assured_concurrency_shares
+        if self._value_limit_response is not None:
+            values["limit_response"] = self._value_limit_response
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "LimitedPriorityLevelConfigurationV1Beta1(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__41d971b8a7a21ba91caea15cee41c4815f31c85df21694fcda26ff7bcf37200f(
+    *,
+    assured_concurrency_shares: typing.Optional[jsii.Number] = None,
+    limit_response: typing.Optional[typing.Union[LimitResponseV1Beta1, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,143 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ListMeta",
+    jsii_struct_bases=[],
+    name_mapping={
+        "continue_": "continue",
+        "remaining_item_count": "remainingItemCount",
+        "resource_version": "resourceVersion",
+        "self_link": "selfLink",
+    },
+)
+class ListMeta(_base.Struct):
+    __slots__ = (
+        "_value_continue_",
+        "_value_remaining_item_count",
+        "_value_resource_version",
+        "_value_self_link",
+    )
+
+    def __init__(
+        self,
+        *,
+        continue_: typing.Optional[builtins.str] = None,
+        remaining_item_count: typing.Optional[jsii.Number] = None,
+        resource_version: typing.Optional[builtins.str] = None,
+        self_link: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ListMeta describes metadata that synthetic resources must have, including lists and various status objects.
+
+        A resource may have only one of {ObjectMeta, ListMeta}.
+
+        :param continue_: continue may be set if the user set a limit on the number of items returned, and indicates that the server has more data available. The value is opaque and may be used to issue another request to the endpoint that served this list to retrieve the next set of available objects. Continuing a consistent list may not be possible if the server configuration has changed or more than a few minutes have passed. The resourceVersion field returned when using this continue value will be identical to the value in the first response, unless you have received this token from an error message.
+        :param remaining_item_count: remainingItemCount is the number of subsequent items in the list which are not included in this list response. If the list request contained label or field selectors, then the number of remaining items is unknown and the field will be left unset and omitted during serialization. If the list is complete (either because it is not chunking or because this is the last chunk), then there are no more remaining items and this field will be left unset and omitted during serialization. Servers older than v1.15 do not set this field. The intended use of the remainingItemCount is *estimating* the size of a collection. Clients should not rely on the remainingItemCount to be set or to be exact.
+        :param resource_version: String that identifies the server's internal version of this object that can be used by clients to determine when objects have changed. Value must be treated as opaque by clients and passed unmodified back to the server. Populated by the system. Read-only. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#concurrency-control-and-consistency
+        :param self_link: Deprecated: selfLink is a legacy read-only field that is no longer populated by the system.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ListMeta
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c89d5e06a349da5660f2e0e4d4f09e7a3e9ddf286741898802308a9398682fb7)
+            check_type(argname="argument continue_", value=continue_, expected_type=type_hints["continue_"])
+            check_type(argname="argument remaining_item_count", value=remaining_item_count, expected_type=type_hints["remaining_item_count"])
+            check_type(argname="argument resource_version", value=resource_version, expected_type=type_hints["resource_version"])
+            check_type(argname="argument self_link", value=self_link, expected_type=type_hints["self_link"])
+        self._value_continue_ = continue_
+        self._value_remaining_item_count = remaining_item_count
+        self._value_resource_version = resource_version
+        self._value_self_link = self_link
+
+    @builtins.property
+    def continue_(self) -> typing.Optional[builtins.str]:
+        '''continue may be set if the user set a limit on the number of items returned, and indicates that the server has more data available.
+
+        The value is opaque and may be used to issue another request to the endpoint that served this list to retrieve the next set of available objects. Continuing a consistent list may not be possible if the server configuration has changed or more than a few minutes have passed. The resourceVersion field returned when using this continue value will be identical to the value in the first response, unless you have received this token from an error message.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ListMeta#continue
+        '''
+        result = self._value_continue_
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def remaining_item_count(self) -> typing.Optional[jsii.Number]:
+        '''remainingItemCount is the number of subsequent items in the list which are not included in this list response.
+
+        If the list request contained label or field selectors, then the number of remaining items is unknown and the field will be left unset and omitted during serialization. If the list is complete (either because it is not chunking or because this is the last chunk), then there are no more remaining items and this field will be left unset and omitted during serialization. Servers older than v1.15 do not set this field. The intended use of the remainingItemCount is *estimating* the size of a collection. Clients should not rely on the remainingItemCount to be set or to be exact.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ListMeta#remainingItemCount
+        '''
+        result = self._value_remaining_item_count
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def resource_version(self) -> typing.Optional[builtins.str]:
+        '''String that identifies the server's internal version of this object that can be used by clients to determine when objects have changed.
+
+        Value must be treated as opaque by clients and passed unmodified back to the server. Populated by the system. Read-only. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#concurrency-control-and-consistency
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ListMeta#resourceVersion
+        '''
+        result = self._value_resource_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def self_link(self) -> typing.Optional[builtins.str]:
+        '''Deprecated: selfLink is a legacy read-only field that is no longer populated by the system.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ListMeta#selfLink
+        '''
+        result = self._value_self_link
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_continue_ is not None:
+            values["continue_"] = self._value_continue_
+        if self._value_remaining_item_count is not None:
+            values["remaining_item_count"] = self._value_remaining_item_count
+        if self._value_resource_version is not None:
+            values["resource_version"] = self._value_resource_version
+        if self._value_self_link is not None:
+            values["self_link"] = self._value_self_link
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ListMeta(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c89d5e06a349da5660f2e0e4d4f09e7a3e9ddf286741898802308a9398682fb7(
+    *,
+    continue_: typing.Optional[builtins.str] = None,
+    remaining_item_count: typing.Optional[jsii.Number] = None,
+    resource_version: typing.Optional[builtins.str] = None,
+    self_link: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.LocalVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"path": "path", "fs_type": "fsType"},
+)
+class LocalVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_path",
+        "_value_fs_type",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Local represents directly-attached storage with node affinity (Beta feature).
+
+        :param path: path of the full path to the volume on the node. It can be either a directory or block device (disk, partition, ...).
+        :param fs_type: fsType is the filesystem type to mount. It applies only when the Path is a block device. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". The default value is to auto-select a filesystem if unspecified.
+
+        :schema: io.k8s.api.core.v1.LocalVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b968cf718668502f36d95fef3ccb40aea55d0b34c90e37b5b542eeec51d43091)
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+        self._value_path = path
+        self._value_fs_type = fs_type
+
+    @builtins.property
+    def path(self) -> builtins.str:
+        '''path of the full path to the volume on the node.
+
+        It can be either a directory or block device (disk, partition, ...).
+
+        :schema: io.k8s.api.core.v1.LocalVolumeSource#path
+        '''
+        result = self._value_path
+        assert result is not None, "Required property 'path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the filesystem type to mount.
+
+        It applies only when the Path is a block device. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". The default value is to auto-select a filesystem if unspecified.
+
+        :schema: io.k8s.api.core.v1.LocalVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "path": self._value_path,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "LocalVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b968cf718668502f36d95fef3ccb40aea55d0b34c90e37b5b542eeec51d43091(
+    *,
+    path: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
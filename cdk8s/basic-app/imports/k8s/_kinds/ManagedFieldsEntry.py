@@ -0,0 +1,199 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ManagedFieldsEntry",
+    jsii_struct_bases=[],
+    name_mapping={
+        "api_version": "apiVersion",
+        "fields_type": "fieldsType",
+        "fields_v1": "fieldsV1",
+        "manager": "manager",
+        "operation": "operation",
+        "subresource": "subresource",
+        "time": "time",
+    },
+)
+class ManagedFieldsEntry(_base.Struct):
+    __slots__ = (
+        "_value_api_version",
+        "_value_fields_type",
+        "_value_fields_v1",
+        "_value_manager",
+        "_value_operation",
+        "_value_subresource",
+        "_value_time",
+    )
+
+    def __init__(
+        self,
+        *,
+        api_version: typing.Optional[builtins.str] = None,
+        fields_type: typing.Optional[builtins.str] = None,
+        fields_v1: typing.Any = None,
+        manager: typing.Optional[builtins.str] = None,
+        operation: typing.Optional[builtins.str] = None,
+        subresource: typing.Optional[builtins.str] = None,
+        time: typing.Optional[datetime.datetime] = None,
+    ) -> None:
+        '''ManagedFieldsEntry is a workflow-id, a FieldSet and the group version of the resource that the fieldset applies to.
+
+        :param api_version: APIVersion defines the version of this resource that this field set applies to. The format is "group/version" just like the top-level APIVersion field. It is necessary to track the version of a field set because it cannot be automatically converted.
+        :param fields_type: FieldsType is the discriminator for the different fields format and version. There is currently only one possible value: "FieldsV1"
+        :param fields_v1: FieldsV1 holds the first JSON version format as described in the "FieldsV1" type.
+        :param manager: Manager is an identifier of the workflow managing these fields.
+        :param operation: Operation is the type of operation which lead to this ManagedFieldsEntry being created. The only valid values for this field are 'Apply' and 'Update'.
+        :param subresource: Subresource is the name of the subresource used to update that object, or empty string if the object was updated through the main resource. The value of this field is used to distinguish between managers, even if they share the same name. For example, a status update will be distinct from a regular update using the same manager name. Note that the APIVersion field is not related to the Subresource field and it always corresponds to the version of the main resource.
+        :param time: Time is the timestamp of when the ManagedFields entry was added. The timestamp will also be updated if a field is added, the manager changes any of the owned fields value or removes a field. The timestamp does not update when a field is removed from the entry because another manager took it over.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7d4739bc7dc7000dc6e5fca030c204929e2fd79081deaecd9bb2d31a8ff798f8)
+            check_type(argname="argument api_version", value=api_version, expected_type=type_hints["api_version"])
+            check_type(argname="argument fields_type", value=fields_type, expected_type=type_hints["fields_type"])
+            check_type(argname="argument fields_v1", value=fields_v1, expected_type=type_hints["fields_v1"])
+            check_type(argname="argument manager", value=manager, expected_type=type_hints["manager"])
+            check_type(argname="argument operation", value=operation, expected_type=type_hints["operation"])
+            check_type(argname="argument subresource", value=subresource, expected_type=type_hints["subresource"])
+            check_type(argname="argument time", value=time, expected_type=type_hints["time"])
+        self._value_api_version = api_version
+        self._value_fields_type = fields_type
+        self._value_fields_v1 = fields_v1
+        self._value_manager = manager
+        self._value_operation = operation
+        self._value_subresource = subresource
+        self._value_time = time
+
+    @builtins.property
+    def api_version(self) -> typing.Optional[builtins.str]:
+        '''APIVersion defines the version of this resource that this field set applies to.
+
+        The format is "group/version" just like the top-level APIVersion field. It is necessary to track the version of a field set because it cannot be automatically converted.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry#apiVersion
+        '''
+        result = self._value_api_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def fields_type(self) -> typing.Optional[builtins.str]:
+        '''FieldsType is the discriminator for the different fields format and version.
+
+        There is currently only one possible value: "FieldsV1"
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry#fieldsType
+        '''
+        result = self._value_fields_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def fields_v1(self) -> typing.Any:
+        '''FieldsV1 holds the first JSON version format as described in the "FieldsV1" type.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry#fieldsV1
+        '''
+        result = self._value_fields_v1
+        return typing.cast(typing.Any, result)
+
+    @builtins.property
+    def manager(self) -> typing.Optional[builtins.str]:
+        '''Manager is an identifier of the workflow managing these fields.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry#manager
+        '''
+        result = self._value_manager
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def operation(self) -> typing.Optional[builtins.str]:
+        '''Operation is the type of operation which lead to this ManagedFieldsEntry being created.
+
+        The only valid values for this field are 'Apply' and 'Update'.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry#operation
+        '''
+        result = self._value_operation
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def subresource(self) -> typing.Optional[builtins.str]:
+        '''Subresource is the name of the subresource used to update that object, or empty string if the object was updated through the main resource.
+
+        The value of this field is used to distinguish between managers, even if they share the same name. For example, a status update will be distinct from a regular update using the same manager name. Note that the APIVersion field is not related to the Subresource field and it always corresponds to the version of the main resource.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry#subresource
+        '''
+        result = self._value_subresource
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def time(self) -> typing.Optional[datetime.datetime]:
+        '''Time is the timestamp of when the ManagedFields entry was added.
+
+        The timestamp will also be updated if a field is added, the manager changes any of the owned fields value or removes a field. The timestamp does not update when a field is removed from the entry because another manager took it over.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ManagedFieldsEntry#time
+        '''
+        result = self._value_time
+        return typing.cast(typing.Optional[datetime.datetime], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_api_version is not None:
+            values["api_version"] = self._value_api_version
+        if self._value_fields_type is not None:
+            values["fields_type"] = self._value_fields_type
+        if self._value_fields_v1 is not None:
+            values["fields_v1"] = self._value_fields_v1
+        if self._value_manager is not None:
+            values["manager"] = self._value_manager
+        if self._value_operation is not None:
+            values["operation"] = self._value_operation
+        if self._value_subresource is not None:
+            values["subresource"] = self._value_subresource
+        if self._value_time is not None:
+            values["time"] = self._value_time
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ManagedFieldsEntry(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7d4739bc7dc7000dc6e5fca030c204929e2fd79081deaecd9bb2d31a8ff798f8(
+    *,
+    api_version: typing.Optional[builtins.str] = None,
+    fields_type: typing.Optional[builtins.str] = None,
+    fields_v1: typing.Any = None,
+    manager: typing.Optional[builtins.str] = None,
+    operation: typing.Optional[builtins.str] = None,
+    subresource: typing.Optional[builtins.str] = None,
+    time: typing.Optional[datetime.datetime] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
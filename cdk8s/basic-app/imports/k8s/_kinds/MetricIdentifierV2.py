@@ -0,0 +1,102 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.MetricIdentifierV2",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name", "selector": "selector"},
+)
+class MetricIdentifierV2(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_selector",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: builtins.str,
+        selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''MetricIdentifier defines the name and optionally selector for a metric.
+
+        :param name: name is the name of the given metric.
+        :param selector: selector is the string-encoded form of a standard kubernetes label selector for the given metric When set, it is passed as an additional parameter to the metrics server for more specific metrics scoping. When unset, just the metricName will be used to gather metrics.
+
+        :schema: io.k8s.api.autoscaling.v2.MetricIdentifier
+        '''
+        if isinstance(selector, dict):
+            selector = LabelSelector(**selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__05f3c3477ee039ee62c1437881247ebc79634cd90deb0f404da58859b54f239b)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+        self._value_name = name
+        self._value_selector = selector
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''name is the name of the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2.MetricIdentifier#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def selector(self) -> typing.Optional[LabelSelector]:
+        '''selector is the string-encoded form of a standard kubernetes label selector for the given metric When set, it is passed as an additional parameter to the metrics server for more specific metrics scoping.
+
+        When unset, just the metricName will be used to gather metrics.
+
+        :schema: io.k8s.api.autoscaling.v2.MetricIdentifier#selector
+        '''
+        result = self._value_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+        }
+        if self._value_selector is not None:
+            values["selector"] = self._value_selector
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "MetricIdentifierV2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__05f3c3477ee039ee62c1437881247ebc79634cd90deb0f404da58859b54f239b(
+    *,
+    name: builtins.str,
+    selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
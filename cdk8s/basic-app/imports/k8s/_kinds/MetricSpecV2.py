@@ -0,0 +1,193 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ContainerResourceMetricSourceV2 import ContainerResourceMetricSourceV2
+from .ExternalMetricSourceV2 import ExternalMetricSourceV2
+from .ObjectMetricSourceV2 import ObjectMetricSourceV2
+from .PodsMetricSourceV2 import PodsMetricSourceV2
+from .ResourceMetricSourceV2 import ResourceMetricSourceV2
+
+
+@jsii.data_type(
+    jsii_type="k8s.MetricSpecV2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "type": "type",
+        "container_resource": "containerResource",
+        "external": "external",
+        "object": "object",
+        "pods": "pods",
+        "resource": "resource",
+    },
+)
+class MetricSpecV2(_base.Struct):
+    __slots__ = (
+        "_value_type",
+        "_value_container_resource",
+        "_value_external",
+        "_value_object",
+        "_value_pods",
+        "_value_resource",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: builtins.str,
+        container_resource: typing.Optional[typing.Union[ContainerResourceMetricSourceV2, typing.Dict[builtins.str, typing.Any]]] = None,
+        external: typing.Optional[typing.Union[ExternalMetricSourceV2, typing.Dict[builtins.str, typing.Any]]] = None,
+        object: typing.Optional[typing.Union["ObjectMetricSourceV2", typing.Dict[builtins.str, typing.Any]]] = None,
+        pods: typing.Optional[typing.Union["PodsMetricSourceV2", typing.Dict[builtins.str, typing.Any]]] = None,
+        resource: typing.Optional[typing.Union["ResourceMetricSourceV2", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''MetricSpec specifies how to scale based on a single metric (only ``type`` and one other matching field should be set at once).
+
+        :param type: type is the type of metric source. It should be one of "ContainerResource", "External", "Object", "Pods" or "Resource", each mapping to a matching field in the object. Note: "ContainerResource" type is available on when the feature-gate HPAContainerMetrics is enabled
+        :param container_resource: containerResource refers to a resource metric (such as those specified in requests and limits) known to Kubernetes describing a single container in each pod of the current scale target (e.g. CPU or memory). Such metrics are built in to Kubernetes, and have special scaling options on top of those available to normal per-pod metrics using the "pods" source. This is an alpha feature and can be enabled by the HPAContainerMetrics feature flag.
+        :param external: external refers to a global metric that is not associated with any Kubernetes object. It allows autoscaling based on information coming from components running outside of cluster (for example length of queue in cloud messaging service, or QPS from loadbalancer running outside of cluster).
+        :param object: object refers to a metric describing a single kubernetes object (for example, hits-per-second on an Ingress object).
+        :param pods: pods refers to a metric describing each pod in the current scale target (for example, transactions-processed-per-second). The values will be averaged together before being compared to the target value.
+        :param resource: resource refers to a resource metric (such as those specified in requests and limits) known to Kubernetes describing each pod in the current scale target (e.g. CPU or memory). Such metrics are built in to Kubernetes, and have special scaling options on top of those available to normal per-pod metrics using the "pods" source.
+
+        :schema: io.k8s.api.autoscaling.v2.MetricSpec
+        '''
+        if isinstance(container_resource, dict):
+            container_resource = ContainerResourceMetricSourceV2(**container_resource)
+        if isinstance(external, dict):
+            external = ExternalMetricSourceV2(**external)
+        if isinstance(object, dict):
+            object = ObjectMetricSourceV2(**object)
+        if isinstance(pods, dict):
+            pods = PodsMetricSourceV2(**pods)
+        if isinstance(resource, dict):
+            resource = ResourceMetricSourceV2(**resource)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__776c3a518a700d093a83bf2abc7751e45a06a623a34cd032f17c5caa38d5a529)
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument container_resource", value=container_resource, expected_type=type_hints["container_resource"])
+            check_type(argname="argument external", value=external, expected_type=type_hints["external"])
+            check_type(argname="argument object", value=object, expected_type=type_hints["object"])
+            check_type(argname="argument pods", value=pods, expected_type=type_hints["pods"])
+            check_type(argname="argument resource", value=resource, expected_type=type_hints["resource"])
+        self._value_type = type
+        self._value_container_resource = container_resource
+        self._value_external = external
+        self._value_object = object
+        self._value_pods = pods
+        self._value_resource = resource
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''type is the type of metric source.
+
+        It should be one of "ContainerResource", "External", "Object", "Pods" or "Resource", each mapping to a matching field in the object. Note: "ContainerResource" type is available on when the feature-gate HPAContainerMetrics is enabled
+
+        :schema: io.k8s.api.autoscaling.v2.MetricSpec#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def container_resource(self) -> typing.Optional[ContainerResourceMetricSourceV2]:
+        '''containerResource refers to a resource metric (such as those specified in requests and limits) known to Kubernetes describing a single container in each pod of the current scale target (e.g. CPU or memory). Such metrics are built in to Kubernetes, and have special scaling options on top of those available to normal per-pod metrics using the "pods" source. This is an alpha feature and can be enabled by the HPAContainerMetrics feature flag.
+
+        :schema: io.k8s.api.autoscaling.v2.MetricSpec#containerResource
+        '''
+        result = self._value_container_resource
+        return typing.cast(typing.Optional[ContainerResourceMetricSourceV2], result)
+
+    @builtins.property
+    def external(self) -> typing.Optional[ExternalMetricSourceV2]:
+        '''external refers to a global metric that is not associated with any Kubernetes object.
+
+        It allows autoscaling based on information coming from components running outside of cluster (for example length of queue in cloud messaging service, or QPS from loadbalancer running outside of cluster).
+
+        :schema: io.k8s.api.autoscaling.v2.MetricSpec#external
+        '''
+        result = self._value_external
+        return typing.cast(typing.Optional[ExternalMetricSourceV2], result)
+
+    @builtins.property
+    def object(self) -> typing.Optional["ObjectMetricSourceV2"]:
+        '''object refers to a metric describing a single kubernetes object (for example, hits-per-second on an Ingress object).
+
+        :schema: io.k8s.api.autoscaling.v2.MetricSpec#object
+        '''
+        result = self._value_object
+        return typing.cast(typing.Optional["ObjectMetricSourceV2"], result)
+
+    @builtins.property
+    def pods(self) -> typing.Optional["PodsMetricSourceV2"]:
+        '''pods refers to a metric describing each pod in the current scale target (for example, transactions-processed-per-second).
+
+        The values will be averaged together before being compared to the target value.
+
+        :schema: io.k8s.api.autoscaling.v2.MetricSpec#pods
+        '''
+        result = self._value_pods
+        return typing.cast(typing.Optional["PodsMetricSourceV2"], result)
+
+    @builtins.property
+    def resource(self) -> typing.Optional["ResourceMetricSourceV2"]:
+        '''resource refers to a resource metric (such as those specified in requests and limits) known to Kubernetes describing each pod in the current scale target (e.g. CPU or memory). Such metrics are built in to Kubernetes, and have special scaling options on top of those available to normal per-pod metrics using the "pods" source.
+
+        :schema: io.k8s.api.autoscaling.v2.MetricSpec#resource
+        '''
+        result = self._value_resource
+        return typing.cast(typing.Optional["ResourceMetricSourceV2"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "type": self._value_type,
+        }
+        if self._value_container_resource is not None:
+            values["container_resource"] = self._value_container_resource
+        if self._value_external is not None:
+            values["external"] = self._value_external
+        if self._value_object is not None:
+            values["object"] = self._value_object
+        if self._value_pods is not None:
+            values["pods"] = self._value_pods
+        if self._value_resource is not None:
+            values["resource"] = self._value_resource
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "MetricSpecV2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__776c3a518a700d093a83bf2abc7751e45a06a623a34cd032f17c5caa38d5a529(
+    *,
+    type: builtins.str,
+    container_resource: typing.Optional[typing.Union[ContainerResourceMetricSourceV2, typing.Dict[builtins.str, typing.Any]]] = None,
+    external: typing.Optional[typing.Union[ExternalMetricSourceV2, typing.Dict[builtins.str, typing.Any]]] = None,
+    object: typing.Optional[typing.Union[ObjectMetricSourceV2, typing.Dict[builtins.str, typing.Any]]] = None,
+    pods: typing.Optional[typing.Union[PodsMetricSourceV2, typing.Dict[builtins.str, typing.Any]]] = None,
+    resource: typing.Optional[typing.Union[ResourceMetricSourceV2, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,139 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Quantity import Quantity
+
+
+@jsii.data_type(
+    jsii_type="k8s.MetricTargetV2Beta2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "type": "type",
+        "average_utilization": "averageUtilization",
+        "average_value": "averageValue",
+        "value": "value",
+    },
+)
+class MetricTargetV2Beta2(_base.Struct):
+    __slots__ = (
+        "_value_type",
+        "_value_average_utilization",
+        "_value_average_value",
+        "_value_value",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: builtins.str,
+        average_utilization: typing.Optional[jsii.Number] = None,
+        average_value: typing.Optional["Quantity"] = None,
+        value: typing.Optional["Quantity"] = None,
+    ) -> None:
+        '''MetricTarget defines the target value, average value, or average utilization of a specific metric.
+
+        :param type: type represents whether the metric type is Utilization, Value, or AverageValue.
+        :param average_utilization: averageUtilization is the target value of the average of the resource metric across all relevant pods, represented as a percentage of the requested value of the resource for the pods. Currently only valid for Resource metric source type
+        :param average_value: averageValue is the target value of the average of the metric across all relevant pods (as a quantity).
+        :param value: value is the target value of the metric (as a quantity).
+
+        :schema: io.k8s.api.autoscaling.v2beta2.MetricTarget
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__a875785cdfda077be38d004ca502a87fd98eac78e57c53a334e7f63f63b2debd)
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument average_utilization", value=average_utilization, expected_type=type_hints["average_utilization"])
+            check_type(argname="argument average_value", value=average_value, expected_type=type_hints["average_value"])
+            check_type(argname="argument value", value=value, expected_type=type_hints["value"])
+        self._value_type = type
+        self._value_average_utilization = average_utilization
+        self._value_average_value = average_value
+        self._value_value = value
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''type represents whether the metric type is Utilization, Value, or AverageValue.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.MetricTarget#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def average_utilization(self) -> typing.Optional[jsii.Number]:
+        '''averageUtilization is the target value of the average of the resource metric across all relevant pods, represented as a percentage of the requested value of the resource for the pods.
+
+        Currently only valid for Resource metric source type
+
+        :schema: io.k8s.api.autoscaling.v2beta2.MetricTarget#averageUtilization
+        '''
+        result = self._value_average_utilization
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def average_value(self) -> typing.Optional["Quantity"]:
+        '''averageValue is the target value of the average of the metric across all relevant pods (as a quantity).
+
+        :schema: io.k8s.api.autoscaling.v2beta2.MetricTarget#averageValue
+        '''
+        result = self._value_average_value
+        return typing.cast(typing.Optional["Quantity"], result)
+
+    @builtins.property
+    def value(self) -> typing.Optional["Quantity"]:
+        '''value is the target value of the metric (as a quantity).
+
+        :schema: io.k8s.api.autoscaling.v2beta2.MetricTarget#value
+        '''
+        result = self._value_value
+        return typing.cast(typing.Optional["Quantity"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "type": self._value_type,
+        }
+        if self._value_average_utilization is not None:
+            values["average_utilization"] = self._value_average_utilization
+        if self._value_average_value is not None:
+            values["average_value"] = self._value_average_value
+        if self._value_value is not None:
+            values["value"] = self._value_value
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "MetricTargetV2Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__a875785cdfda077be38d004ca502a87fd98eac78e57c53a334e7f63f63b2debd(
+    *,
+    type: builtins.str,
+    average_utilization: typing.Optional[jsii.Number] = None,
+    average_value: typing.Optional[Quantity] = None,
+    value: typing.Optional[Quantity] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
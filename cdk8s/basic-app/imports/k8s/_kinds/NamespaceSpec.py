@@ -0,0 +1,81 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.NamespaceSpec",
+    jsii_struct_bases=[],
+    name_mapping={"finalizers": "finalizers"},
+)
+class NamespaceSpec(_base.Struct):
+    __slots__ = (
+        "_value_finalizers",
+    )
+
+    def __init__(
+        self,
+        *,
+        finalizers: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''NamespaceSpec describes the attributes on a Namespace.
+
+        :param finalizers: Finalizers is an opaque list of values that must be empty to permanently remove object from storage. More info: https://kubernetes.io/docs/tasks/administer-cluster/namespaces/
+
+        :schema: io.k8s.api.core.v1.NamespaceSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__0ea645c91cd000f5a4da28ff25155be76d43d13a8e9e70b0d5c0f6eb2529d3c8)
+            check_type(argname="argument finalizers", value=finalizers, expected_type=type_hints["finalizers"])
+        self._value_finalizers = finalizers
+
+    @builtins.property
+    def finalizers(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Finalizers is an opaque list of values that must be empty to permanently remove object from storage.
+
+        More info: https://kubernetes.io/docs/tasks/administer-cluster/namespaces/
+
+        :schema: io.k8s.api.core.v1.NamespaceSpec#finalizers
+        '''
+        result = self._value_finalizers
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_finalizers is not None:
+            values["finalizers"] = self._value_finalizers
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NamespaceSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__0ea645c91cd000f5a4da28ff25155be76d43d13a8e9e70b0d5c0f6eb2529d3c8(
+    *,
+    finalizers: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
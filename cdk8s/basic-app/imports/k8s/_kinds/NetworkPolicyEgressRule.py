@@ -0,0 +1,104 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NetworkPolicyPeer import NetworkPolicyPeer
+from .NetworkPolicyPort import NetworkPolicyPort
+
+
+@jsii.data_type(
+    jsii_type="k8s.NetworkPolicyEgressRule",
+    jsii_struct_bases=[],
+    name_mapping={"ports": "ports", "to": "to"},
+)
+class NetworkPolicyEgressRule(_base.Struct):
+    __slots__ = (
+        "_value_ports",
+        "_value_to",
+    )
+
+    def __init__(
+        self,
+        *,
+        ports: typing.Optional[typing.Sequence[typing.Union["NetworkPolicyPort", typing.Dict[builtins.str, typing.Any]]]] = None,
+        to: typing.Optional[typing.Sequence[typing.Union["NetworkPolicyPeer", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''NetworkPolicyEgressRule describes a particular set of traffic that is allowed out of pods matched by a NetworkPolicySpec's podSelector.
+
+        The traffic must match both ports and to. This type is beta-level in 1.8
+
+        :param ports: List of destination ports for outgoing traffic. Each item in this list is combined using a logical OR. If this field is empty or missing, this rule matches all ports (traffic not restricted by port). If this field is present and contains at least one item, then this rule allows traffic only if the traffic matches at least one port in the list.
+        :param to: List of destinations for outgoing traffic of pods selected for this rule. Items in this list are combined using a logical OR operation. If this field is empty or missing, this rule matches all destinations (traffic not restricted by destination). If this field is present and contains at least one item, this rule allows traffic only if the traffic matches at least one item in the to list.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyEgressRule
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__2310900f85c6226ede2a61dd42a7652ea8cc83e009f119df2fbd2f16997b26de)
+            check_type(argname="argument ports", value=ports, expected_type=type_hints["ports"])
+            check_type(argname="argument to", value=to, expected_type=type_hints["to"])
+        self._value_ports = ports
+        self._value_to = to
+
+    @builtins.property
+    def ports(self) -> typing.Optional[typing.List["NetworkPolicyPort"]]:
+        '''List of destination ports for outgoing traffic.
+
+        Each item in this list is combined using a logical OR. If this field is empty or missing, this rule matches all ports (traffic not restricted by port). If this field is present and contains at least one item, then this rule allows traffic only if the traffic matches at least one port in the list.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyEgressRule#ports
+        '''
+        result = self._value_ports
+        return typing.cast(typing.Optional[typing.List["NetworkPolicyPort"]], result)
+
+    @builtins.property
+    def to(self) -> typing.Optional[typing.List["NetworkPolicyPeer"]]:
+        '''List of destinations for outgoing traffic of pods selected for this rule.
+
+        Items in this list are combined using a logical OR operation. If this field is empty or missing, this rule matches all destinations (traffic not restricted by destination). If this field is present and contains at least one item, this rule allows traffic only if the traffic matches at least one item in the to list.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyEgressRule#to
+        '''
+        result = self._value_to
+        return typing.cast(typing.Optional[typing.List["NetworkPolicyPeer"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_ports is not None:
+            values["ports"] = self._value_ports
+        if self._value_to is not None:
+            values["to"] = self._value_to
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NetworkPolicyEgressRule(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__2310900f85c6226ede2a61dd42a7652ea8cc83e009f119df2fbd2f16997b26de(
+    *,
+    ports: typing.Optional[typing.Sequence[typing.Union[NetworkPolicyPort, typing.Dict[builtins.str, typing.Any]]]] = None,
+    to: typing.Optional[typing.Sequence[typing.Union[NetworkPolicyPeer, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,104 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NetworkPolicyPeer import NetworkPolicyPeer
+from .NetworkPolicyPort import NetworkPolicyPort
+
+
+@jsii.data_type(
+    jsii_type="k8s.NetworkPolicyIngressRule",
+    jsii_struct_bases=[],
+    name_mapping={"from_": "from", "ports": "ports"},
+)
+class NetworkPolicyIngressRule(_base.Struct):
+    __slots__ = (
+        "_value_from_",
+        "_value_ports",
+    )
+
+    def __init__(
+        self,
+        *,
+        from_: typing.Optional[typing.Sequence[typing.Union["NetworkPolicyPeer", typing.Dict[builtins.str, typing.Any]]]] = None,
+        ports: typing.Optional[typing.Sequence[typing.Union["NetworkPolicyPort", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''NetworkPolicyIngressRule describes a particular set of traffic that is allowed to the pods matched by a NetworkPolicySpec's podSelector.
+
+        The traffic must match both ports and from.
+
+        :param from_: List of sources which should be able to access the pods selected for this rule. Items in this list are combined using a logical OR operation. If this field is empty or missing, this rule matches all sources (traffic not restricted by source). If this field is present and contains at least one item, this rule allows traffic only if the traffic matches at least one item in the from list.
+        :param ports: List of ports which should be made accessible on the pods selected for this rule. Each item in this list is combined using a logical OR. If this field is empty or missing, this rule matches all ports (traffic not restricted by port). If this field is present and contains at least one item, then this rule allows traffic only if the traffic matches at least one port in the list.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyIngressRule
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__539e72cf73f95f606fca75f4cbd682e72299b5c8617bc9a6aafa6f3c15b73e64)
+            check_type(argname="argument from_", value=from_, expected_type=type_hints["from_"])
+            check_type(argname="argument ports", value=ports, expected_type=type_hints["ports"])
+        self._value_from_ = from_
+        self._value_ports = ports
+
+    @builtins.property
+    def from_(self) -> typing.Optional[typing.List["NetworkPolicyPeer"]]:
+        '''List of sources which should be able to access the pods selected for this rule.
+
+        Items in this list are combined using a logical OR operation. If this field is empty or missing, this rule matches all sources (traffic not restricted by source). If this field is present and contains at least one item, this rule allows traffic only if the traffic matches at least one item in the from list.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyIngressRule#from
+        '''
+        result = self._value_from_
+        return typing.cast(typing.Optional[typing.List["NetworkPolicyPeer"]], result)
+
+    @builtins.property
+    def ports(self) -> typing.Optional[typing.List["NetworkPolicyPort"]]:
+        '''List of ports which should be made accessible on the pods selected for this rule.
+
+        Each item in this list is combined using a logical OR. If this field is empty or missing, this rule matches all ports (traffic not restricted by port). If this field is present and contains at least one item, then this rule allows traffic only if the traffic matches at least one port in the list.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyIngressRule#ports
+        '''
+        result = self._value_ports
+        return typing.cast(typing.Optional[typing.List["NetworkPolicyPort"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_from_ is not None:
+            values["from_"] = self._value_from_
+        if self._value_ports is not None:
+            values["ports"] = self._value_ports
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NetworkPolicyIngressRule(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__539e72cf73f95f606fca75f4cbd682e72299b5c8617bc9a6aafa6f3c15b73e64(
+    *,
+    from_: typing.Optional[typing.Sequence[typing.Union[NetworkPolicyPeer, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ports: typing.Optional[typing.Sequence[typing.Union[NetworkPolicyPort, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,137 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IpBlock import IpBlock
+from .LabelSelector import LabelSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.NetworkPolicyPeer",
+    jsii_struct_bases=[],
+    name_mapping={
+        "ip_block": "ipBlock",
+        "namespace_selector": "namespaceSelector",
+        "pod_selector": "podSelector",
+    },
+)
+class NetworkPolicyPeer(_base.Struct):
+    __slots__ = (
+        "_value_ip_block",
+        "_value_namespace_selector",
+        "_value_pod_selector",
+    )
+
+    def __init__(
+        self,
+        *,
+        ip_block: typing.Optional[typing.Union[IpBlock, typing.Dict[builtins.str, typing.Any]]] = None,
+        namespace_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+        pod_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''NetworkPolicyPeer describes a peer to allow traffic to/from.
+
+        Only certain combinations of fields are allowed
+
+        :param ip_block: IPBlock defines policy on a particular IPBlock. If this field is set then neither of the other fields can be.
+        :param namespace_selector: Selects Namespaces using cluster-scoped labels. This field follows standard label selector semantics; if present but empty, it selects all namespaces. If PodSelector is also set, then the NetworkPolicyPeer as a whole selects the Pods matching PodSelector in the Namespaces selected by NamespaceSelector. Otherwise it selects all Pods in the Namespaces selected by NamespaceSelector.
+        :param pod_selector: This is a label selector which selects Pods. This field follows standard label selector semantics; if present but empty, it selects all pods. If NamespaceSelector is also set, then the NetworkPolicyPeer as a whole selects the Pods matching PodSelector in the Namespaces selected by NamespaceSelector. Otherwise it selects the Pods matching PodSelector in the policy's own Namespace.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyPeer
+        '''
+        if isinstance(ip_block, dict):
+            ip_block = IpBlock(**ip_block)
+        if isinstance(namespace_selector, dict):
+            namespace_selector = LabelSelector(**namespace_selector)
+        if isinstance(pod_selector, dict):
+            pod_selector = LabelSelector(**pod_selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__79d11d83de8d6e2520a2426cb19cd2d699bfd94c627f4b84d0a50530c388c1bf)
+            check_type(argname="argument ip_block", value=ip_block, expected_type=type_hints["ip_block"])
+            check_type(argname="argument namespace_selector", value=namespace_selector, expected_type=type_hints["namespace_selector"])
+            check_type(argname="argument pod_selector", value=pod_selector, expected_type=type_hints["pod_selector"])
+        self._value_ip_block = ip_block
+        self._value_namespace_selector = namespace_selector
+        self._value_pod_selector = pod_selector
+
+    @builtins.property
+    def ip_block(self) -> typing.Optional[IpBlock]:
+        '''IPBlock defines policy on a particular IPBlock.
+
+        If this field is set then neither of the other fields can be.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyPeer#ipBlock
+        '''
+        result = self._value_ip_block
+        return typing.cast(typing.Optional[IpBlock], result)
+
+    @builtins.property
+    def namespace_selector(self) -> typing.Optional[LabelSelector]:
+        '''Selects Namespaces using cluster-scoped labels.
+
+        This field follows standard label selector semantics; if present but empty, it selects all namespaces.
+
+        If PodSelector is also set, then the NetworkPolicyPeer as a whole selects the Pods matching PodSelector in the Namespaces selected by NamespaceSelector. Otherwise it selects all Pods in the Namespaces selected by NamespaceSelector.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyPeer#namespaceSelector
+        '''
+        result = self._value_namespace_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def pod_selector(self) -> typing.Optional[LabelSelector]:
+        '''This is a label selector which selects Pods.
+
+        This field follows standard label selector semantics; if present but empty, it selects all pods.
+
+        If NamespaceSelector is also set, then the NetworkPolicyPeer as a whole selects the Pods matching PodSelector in the Namespaces selected by NamespaceSelector. Otherwise it selects the Pods matching PodSelector in the policy's own Namespace.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyPeer#podSelector
+        '''
+        result = self._value_pod_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_ip_block is not None:
+            values["ip_block"] = self._value_ip_block
+        if self._value_namespace_selector is not None:
+            values["namespace_selector"] = self._value_namespace_selector
+        if self._value_pod_selector is not None:
+            values["pod_selector"] = self._value_pod_selector
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NetworkPolicyPeer(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__79d11d83de8d6e2520a2426cb19cd2d699bfd94c627f4b84d0a50530c388c1bf(
+    *,
+    ip_block: typing.Optional[typing.Union[IpBlock, typing.Dict[builtins.str, typing.Any]]] = None,
+    namespace_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    pod_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,120 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IntOrString import IntOrString
+
+
+@jsii.data_type(
+    jsii_type="k8s.NetworkPolicyPort",
+    jsii_struct_bases=[],
+    name_mapping={"end_port": "endPort", "port": "port", "protocol": "protocol"},
+)
+class NetworkPolicyPort(_base.Struct):
+    __slots__ = (
+        "_value_end_port",
+        "_value_port",
+        "_value_protocol",
+    )
+
+    def __init__(
+        self,
+        *,
+        end_port: typing.Optional[jsii.Number] = None,
+        port: typing.Optional[IntOrString] = None,
+        protocol: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''NetworkPolicyPort describes a port to allow traffic on.
+
+        :param end_port: If set, indicates that the range of ports from port to endPort, inclusive, should be allowed by the policy. This field cannot be defined if the port field is not defined or if the port field is defined as a named (string) port. The endPort must be equal or greater than port.
+        :param port: The port on the given protocol. This can either be a numerical or named port on a pod. If this field is not provided, this matches all port names and numbers. If present, only traffic on the specified protocol AND port will be matched.
+        :param protocol: The protocol (TCP, UDP, or SCTP) which traffic must match. If not specified, this field defaults to TCP.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyPort
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__49079df49fbd7a79ac55d3eb11dc0d2260b7ec0d23bd59e732339eebb03b1866)
+            check_type(argname="argument end_port", value=end_port, expected_type=type_hints["end_port"])
+            check_type(argname="argument port", value=port, expected_type=type_hints["port"])
+            check_type(argname="argument protocol", value=protocol, expected_type=type_hints["protocol"])
+        self._value_end_port = end_port
+        self._value_port = port
+        self._value_protocol = protocol
+
+    @builtins.property
+    def end_port(self) -> typing.Optional[jsii.Number]:
+        '''If set, indicates that the range of ports from port to endPort, inclusive, should be allowed by the policy.
+
+        This field cannot be defined if the port field is not defined or if the port field is defined as a named (string) port. The endPort must be equal or greater than port.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyPort#endPort
+        '''
+        result = self._value_end_port
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def port(self) -> typing.Optional[IntOrString]:
+        '''The port on the given protocol.
+
+        This can either be a numerical or named port on a pod. If this field is not provided, this matches all port names and numbers. If present, only traffic on the specified protocol AND port will be matched.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyPort#port
+        '''
+        result = self._value_port
+        return typing.cast(typing.Optional[IntOrString], result)
+
+    @builtins.property
+    def protocol(self) -> typing.Optional[builtins.str]:
+        '''The protocol (TCP, UDP, or SCTP) which traffic must match.
+
+        If not specified, this field defaults to TCP.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicyPort#protocol
+        '''
+        result = self._value_protocol
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_end_port is not None:
+            values["end_port"] = self._value_end_port
+        if self._value_port is not None:
+            values["port"] = self._value_port
+        if self._value_protocol is not None:
+            values["protocol"] = self._value_protocol
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NetworkPolicyPort(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__49079df49fbd7a79ac55d3eb11dc0d2260b7ec0d23bd59e732339eebb03b1866(
+    *,
+    end_port: typing.Optional[jsii.Number] = None,
+    port: typing.Optional[IntOrString] = None,
+    protocol: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,149 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+from .NetworkPolicyEgressRule import NetworkPolicyEgressRule
+from .NetworkPolicyIngressRule import NetworkPolicyIngressRule
+
+
+@jsii.data_type(
+    jsii_type="k8s.NetworkPolicySpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "pod_selector": "podSelector",
+        "egress": "egress",
+        "ingress": "ingress",
+        "policy_types": "policyTypes",
+    },
+)
+class NetworkPolicySpec(_base.Struct):
+    __slots__ = (
+        "_value_pod_selector",
+        "_value_egress",
+        "_value_ingress",
+        "_value_policy_types",
+    )
+
+    def __init__(
+        self,
+        *,
+        pod_selector: typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]],
+        egress: typing.Optional[typing.Sequence[typing.Union[NetworkPolicyEgressRule, typing.Dict[builtins.str, typing.Any]]]] = None,
+        ingress: typing.Optional[typing.Sequence[typing.Union[NetworkPolicyIngressRule, typing.Dict[builtins.str, typing.Any]]]] = None,
+        policy_types: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''NetworkPolicySpec provides the specification of a NetworkPolicy.
+
+        :param pod_selector: Selects the pods to which this NetworkPolicy object applies. The array of ingress rules is applied to any pods selected by this field. Multiple network policies can select the same set of pods. In this case, the ingress rules for each are combined additively. This field is NOT optional and follows standard label selector semantics. An empty podSelector matches all pods in this namespace.
+        :param egress: List of egress rules to be applied to the selected pods. Outgoing traffic is allowed if there are no NetworkPolicies selecting the pod (and cluster policy otherwise allows the traffic), OR if the traffic matches at least one egress rule across all of the NetworkPolicy objects whose podSelector matches the pod. If this field is empty then this NetworkPolicy limits all outgoing traffic (and serves solely to ensure that the pods it selects are isolated by default). This field is beta-level in 1.8
+        :param ingress: List of ingress rules to be applied to the selected pods. Traffic is allowed to a pod if there are no NetworkPolicies selecting the pod (and cluster policy otherwise allows the traffic), OR if the traffic source is the pod's local node, OR if the traffic matches at least one ingress rule across all of the NetworkPolicy objects whose podSelector matches the pod. If this field is empty then this NetworkPolicy does not allow any traffic (and serves solely to ensure that the pods it selects are isolated by default)
+        :param policy_types: List of rule types that the NetworkPolicy relates to. Valid options are ["Ingress"], ["Egress"], or ["Ingress", "Egress"]. If this field is not specified, it will default based on the existence of Ingress or Egress rules; policies that contain an Egress section are assumed to affect Egress, and all policies (whether or not they contain an Ingress section) are assumed to affect Ingress. If you want to write an egress-only policy, you must explicitly specify policyTypes [ "Egress" ]. Likewise, if you want to write a policy that specifies that no egress is allowed, you must specify a policyTypes value that include "Egress" (since such a policy would not include an Egress section and would otherwise default to just [ "Ingress" ]). This field is beta-level in 1.8
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicySpec
+        '''
+        if isinstance(pod_selector, dict):
+            pod_selector = LabelSelector(**pod_selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__d9c84fc90459d1cd97b3329e793a8d157a79bc350c911daca3c8b5b185a16977)
+            check_type(argname="argument pod_selector", value=pod_selector, expected_type=type_hints["pod_selector"])
+            check_type(argname="argument egress", value=egress, expected_type=type_hints["egress"])
+            check_type(argname="argument ingress", value=ingress, expected_type=type_hints["ingress"])
+            check_type(argname="argument policy_types", value=policy_types, expected_type=type_hints["policy_types"])
+        self._value_pod_selector = pod_selector
+        self._value_egress = egress
+        self._value_ingress = ingress
+        self._value_policy_types = policy_types
+
+    @builtins.property
+    def pod_selector(self) -> LabelSelector:
+        '''Selects the pods to which this NetworkPolicy object applies.
+
+        The array of ingress rules is applied to any pods selected by this field. Multiple network policies can select the same set of pods. In this case, the ingress rules for each are combined additively. This field is NOT optional and follows standard label selector semantics. An empty podSelector matches all pods in this namespace.
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicySpec#podSelector
+        '''
+        result = self._value_pod_selector
+        assert result is not None, "Required property 'pod_selector' is missing"
+        return typing.cast(LabelSelector, result)
+
+    @builtins.property
+    def egress(self) -> typing.Optional[typing.List[NetworkPolicyEgressRule]]:
+        '''List of egress rules to be applied to the selected pods.
+
+        Outgoing traffic is allowed if there are no NetworkPolicies selecting the pod (and cluster policy otherwise allows the traffic), OR if the traffic matches at least one egress rule across all of the NetworkPolicy objects whose podSelector matches the pod. If this field is empty then this NetworkPolicy limits all outgoing traffic (and serves solely to ensure that the pods it selects are isolated by default). This field is beta-level in 1.8
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicySpec#egress
+        '''
+        result = self._value_egress
+        return typing.cast(typing.Optional[typing.List[NetworkPolicyEgressRule]], result)
+
+    @builtins.property
+    def ingress(self) -> typing.Optional[typing.List[NetworkPolicyIngressRule]]:
+        '''List of ingress rules to be applied to the selected pods.
+
+        Traffic is allowed to a pod if there are no NetworkPolicies selecting the pod (and cluster policy otherwise allows the traffic), OR if the traffic source is the pod's local node, OR if the traffic matches at least one ingress rule across all of the NetworkPolicy objects whose podSelector matches the pod. If this field is empty then this NetworkPolicy does not allow any traffic (and serves solely to ensure that the pods it selects are isolated by default)
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicySpec#ingress
+        '''
+        result = self._value_ingress
+        return typing.cast(typing.Optional[typing.List[NetworkPolicyIngressRule]], result)
+
+    @builtins.property
+    def policy_types(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''List of rule types that the NetworkPolicy relates to.
+
+        Valid options are ["Ingress"], ["Egress"], or ["Ingress", "Egress"]. If this field is not specified, it will default based on the existence of Ingress or Egress rules; policies that contain an Egress section are assumed to affect Egress, and all policies (whether or not they contain an Ingress section) are assumed to affect Ingress. If you want to write an egress-only policy, you must explicitly specify policyTypes [ "Egress" ]. Likewise, if you want to write a policy that specifies that no egress is allowed, you must specify a policyTypes value that include "Egress" (since such a policy would not include an Egress section and would otherwise default to just [ "Ingress" ]). This field is beta-level in 1.8
+
+        :schema: io.k8s.api.networking.v1.NetworkPolicySpec#policyTypes
+        '''
+        result = self._value_policy_types
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "pod_selector": self._value_pod_selector,
+        }
+        if self._value_egress is not None:
+            values["egress"] = self._value_egress
+        if self._value_ingress is not None:
+            values["ingress"] = self._value_ingress
+        if self._value_policy_types is not None:
+            values["policy_types"] = self._value_policy_types
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NetworkPolicySpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__d9c84fc90459d1cd97b3329e793a8d157a79bc350c911daca3c8b5b185a16977(
+    *,
+    pod_selector: typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]],
+    egress: typing.Optional[typing.Sequence[typing.Union[NetworkPolicyEgressRule, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ingress: typing.Optional[typing.Sequence[typing.Union[NetworkPolicyIngressRule, typing.Dict[builtins.str, typing.Any]]]] = None,
+    policy_types: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,124 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.NfsVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"path": "path", "server": "server", "read_only": "readOnly"},
+)
+class NfsVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_path",
+        "_value_server",
+        "_value_read_only",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: builtins.str,
+        server: builtins.str,
+        read_only: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''Represents an NFS mount that lasts the lifetime of a pod.
+
+        NFS volumes do not support ownership management or SELinux relabeling.
+
+        :param path: path that is exported by the NFS server. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+        :param server: server is the hostname or IP address of the NFS server. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+        :param read_only: readOnly here will force the NFS export to be mounted with read-only permissions. Defaults to false. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs Default: false. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+
+        :schema: io.k8s.api.core.v1.NFSVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__64ef53a74120cbc99eb5a721f1a72955a4b1a591eaaf717f4ad02b252033b821)
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument server", value=server, expected_type=type_hints["server"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+        self._value_path = path
+        self._value_server = server
+        self._value_read_only = read_only
+
+    @builtins.property
+    def path(self) -> builtins.str:
+        '''path that is exported by the NFS server.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+
+        :schema: io.k8s.api.core.v1.NFSVolumeSource#path
+        '''
+        result = self._value_path
+        assert result is not None, "Required property 'path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def server(self) -> builtins.str:
+        '''server is the hostname or IP address of the NFS server.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+
+        :schema: io.k8s.api.core.v1.NFSVolumeSource#server
+        '''
+        result = self._value_server
+        assert result is not None, "Required property 'server' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly here will force the NFS export to be mounted with read-only permissions.
+
+        Defaults to false. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+
+        :default: false. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+
+        :schema: io.k8s.api.core.v1.NFSVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "path": self._value_path,
+            "server": self._value_server,
+        }
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NfsVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__64ef53a74120cbc99eb5a721f1a72955a4b1a591eaaf717f4ad02b252033b821(
+    *,
+    path: builtins.str,
+    server: builtins.str,
+    read_only: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
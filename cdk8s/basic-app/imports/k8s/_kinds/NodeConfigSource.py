@@ -0,0 +1,84 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ConfigMapNodeConfigSource import ConfigMapNodeConfigSource
+
+
+@jsii.data_type(
+    jsii_type="k8s.NodeConfigSource",
+    jsii_struct_bases=[],
+    name_mapping={"config_map": "configMap"},
+)
+class NodeConfigSource(_base.Struct):
+    __slots__ = (
+        "_value_config_map",
+    )
+
+    def __init__(
+        self,
+        *,
+        config_map: typing.Optional[typing.Union[ConfigMapNodeConfigSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''NodeConfigSource specifies a source of node configuration.
+
+        Exactly one subfield (excluding metadata) must be non-nil. This API is deprecated since 1.22
+
+        :param config_map: ConfigMap is a reference to a Node's ConfigMap.
+
+        :schema: io.k8s.api.core.v1.NodeConfigSource
+        '''
+        if isinstance(config_map, dict):
+            config_map = ConfigMapNodeConfigSource(**config_map)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__cf7f83b52a971565e60c01b2feacf24dc56b2f356b8bd133298411fd8ca953fc)
+            check_type(argname="argument config_map", value=config_map, expected_type=type_hints["config_map"])
+        self._value_config_map = config_map
+
+    @builtins.property
+    def config_map(self) -> typing.Optional[ConfigMapNodeConfigSource]:
+        '''ConfigMap is a reference to a Node's ConfigMap.
+
+        :schema: io.k8s.api.core.v1.NodeConfigSource#configMap
+        '''
+        result = self._value_config_map
+        return typing.cast(typing.Optional[ConfigMapNodeConfigSource], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_config_map is not None:
+            values["config_map"] = self._value_config_map
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NodeConfigSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__cf7f83b52a971565e60c01b2feacf24dc56b2f356b8bd133298411fd8ca953fc(
+    *,
+    config_map: typing.Optional[typing.Union[ConfigMapNodeConfigSource, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,85 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NodeSelectorTerm import NodeSelectorTerm
+
+
+@jsii.data_type(
+    jsii_type="k8s.NodeSelector",
+    jsii_struct_bases=[],
+    name_mapping={"node_selector_terms": "nodeSelectorTerms"},
+)
+class NodeSelector(_base.Struct):
+    __slots__ = (
+        "_value_node_selector_terms",
+    )
+
+    def __init__(
+        self,
+        *,
+        node_selector_terms: typing.Sequence[typing.Union["NodeSelectorTerm", typing.Dict[builtins.str, typing.Any]]],
+    ) -> None:
+        '''A node selector represents the union of the results of one or more label queries over a set of nodes;
+
+        that is, it represents the OR of the selectors represented by the node selector terms.
+
+        :param node_selector_terms: Required. A list of node selector terms. The terms are ORed.
+
+        :schema: io.k8s.api.core.v1.NodeSelector
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__860ee52caab59ff2ee19e780fd4b3b278089ce131229f4b4c67d9158710bfd41)
+            check_type(argname="argument node_selector_terms", value=node_selector_terms, expected_type=type_hints["node_selector_terms"])
+        self._value_node_selector_terms = node_selector_terms
+
+    @builtins.property
+    def node_selector_terms(self) -> typing.List["NodeSelectorTerm"]:
+        '''Required.
+
+        A list of node selector terms. The terms are ORed.
+
+        :schema: io.k8s.api.core.v1.NodeSelector#nodeSelectorTerms
+        '''
+        result = self._value_node_selector_terms
+        assert result is not None, "Required property 'node_selector_terms' is missing"
+        return typing.cast(typing.List["NodeSelectorTerm"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "node_selector_terms": self._value_node_selector_terms,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NodeSelector(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__860ee52caab59ff2ee19e780fd4b3b278089ce131229f4b4c67d9158710bfd41(
+    *,
+    node_selector_terms: typing.Sequence[typing.Union[NodeSelectorTerm, typing.Dict[builtins.str, typing.Any]]],
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,104 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NodeSelectorRequirement import NodeSelectorRequirement
+
+
+@jsii.data_type(
+    jsii_type="k8s.NodeSelectorTerm",
+    jsii_struct_bases=[],
+    name_mapping={
+        "match_expressions": "matchExpressions",
+        "match_fields": "matchFields",
+    },
+)
+class NodeSelectorTerm(_base.Struct):
+    __slots__ = (
+        "_value_match_expressions",
+        "_value_match_fields",
+    )
+
+    def __init__(
+        self,
+        *,
+        match_expressions: typing.Optional[typing.Sequence[typing.Union[NodeSelectorRequirement, typing.Dict[builtins.str, typing.Any]]]] = None,
+        match_fields: typing.Optional[typing.Sequence[typing.Union[NodeSelectorRequirement, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''A null or empty node selector term matches no objects.
+
+        The requirements of them are ANDed. The TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
+
+        :param match_expressions: A list of node selector requirements by node's labels.
+        :param match_fields: A list of node selector requirements by node's fields.
+
+        :schema: io.k8s.api.core.v1.NodeSelectorTerm
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__00ea4bc7ccd8ca5e61bdb8b0ba65854a04f15b4b8fbaf25f3edafd171975a953)
+            check_type(argname="argument match_expressions", value=match_expressions, expected_type=type_hints["match_expressions"])
+            check_type(argname="argument match_fields", value=match_fields, expected_type=type_hints["match_fields"])
+        self._value_match_expressions = match_expressions
+        self._value_match_fields = match_fields
+
+    @builtins.property
+    def match_expressions(
+        self,
+    ) -> typing.Optional[typing.List[NodeSelectorRequirement]]:
+        '''A list of node selector requirements by node's labels.
+
+        :schema: io.k8s.api.core.v1.NodeSelectorTerm#matchExpressions
+        '''
+        result = self._value_match_expressions
+        return typing.cast(typing.Optional[typing.List[NodeSelectorRequirement]], result)
+
+    @builtins.property
+    def match_fields(self) -> typing.Optional[typing.List[NodeSelectorRequirement]]:
+        '''A list of node selector requirements by node's fields.
+
+        :schema: io.k8s.api.core.v1.NodeSelectorTerm#matchFields
+        '''
+        result = self._value_match_fields
+        return typing.cast(typing.Optional[typing.List[NodeSelectorRequirement]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_match_expressions is not None:
+            values["match_expressions"] = self._value_match_expressions
+        if self._value_match_fields is not None:
+            values["match_fields"] = self._value_match_fields
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NodeSelectorTerm(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__00ea4bc7ccd8ca5e61bdb8b0ba65854a04f15b4b8fbaf25f3edafd171975a953(
+    *,
+    match_expressions: typing.Optional[typing.Sequence[typing.Union[NodeSelectorRequirement, typing.Dict[builtins.str, typing.Any]]]] = None,
+    match_fields: typing.Optional[typing.Sequence[typing.Union[NodeSelectorRequirement, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
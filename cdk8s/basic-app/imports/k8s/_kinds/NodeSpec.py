@@ -0,0 +1,201 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NodeConfigSource import NodeConfigSource
+from .Taint import Taint
+
+
+@jsii.data_type(
+    jsii_type="k8s.NodeSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "config_source": "configSource",
+        "external_id": "externalId",
+        "pod_cidr": "podCidr",
+        "pod_cid_rs": "podCidRs",
+        "provider_id": "providerId",
+        "taints": "taints",
+        "unschedulable": "unschedulable",
+    },
+)
+class NodeSpec(_base.Struct):
+    __slots__ = (
+        "_value_config_source",
+        "_value_external_id",
+        "_value_pod_cidr",
+        "_value_pod_cid_rs",
+        "_value_provider_id",
+        "_value_taints",
+        "_value_unschedulable",
+    )
+
+    def __init__(
+        self,
+        *,
+        config_source: typing.Optional[typing.Union[NodeConfigSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        external_id: typing.Optional[builtins.str] = None,
+        pod_cidr: typing.Optional[builtins.str] = None,
+        pod_cid_rs: typing.Optional[typing.Sequence[builtins.str]] = None,
+        provider_id: typing.Optional[builtins.str] = None,
+        taints: typing.Optional[typing.Sequence[typing.Union["Taint", typing.Dict[builtins.str, typing.Any]]]] = None,
+        unschedulable: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''NodeSpec describes the attributes that a node is created with.
+
+        :param config_source: Deprecated: Previously used to specify the source of the node's configuration for the DynamicKubeletConfig feature. This feature is removed from Kubelets as of 1.24 and will be fully removed in 1.26.
+        :param external_id: Deprecated. Not all kubelets will set this field. Remove field after 1.13. see: https://issues.k8s.io/61966
+        :param pod_cidr: PodCIDR represents the pod IP range assigned to the node.
+        :param pod_cid_rs: podCIDRs represents the IP ranges assigned to the node for usage by Pods on that node. If this field is specified, the 0th entry must match the podCIDR field. It may contain at most 1 value for each of IPv4 and IPv6.
+        :param provider_id: ID of the node assigned by the cloud provider in the format: ://.
+        :param taints: If specified, the node's taints.
+        :param unschedulable: Unschedulable controls node schedulability of new pods. By default, node is schedulable. More info: https://kubernetes.io/docs/concepts/nodes/node/#manual-node-administration
+
+        :schema: io.k8s.api.core.v1.NodeSpec
+        '''
+        if isinstance(config_source, dict):
+            config_source = NodeConfigSource(**config_source)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__6e50f14ca142b7e1ae3aa4c3b0de77e924013889955b6653359e1c2bc719eb0d)
+            check_type(argname="argument config_source", value=config_source, expected_type=type_hints["config_source"])
+            check_type(argname="argument external_id", value=external_id, expected_type=type_hints["external_id"])
+            check_type(argname="argument pod_cidr", value=pod_cidr, expected_type=type_hints["pod_cidr"])
+            check_type(argname="argument pod_cid_rs", value=pod_cid_rs, expected_type=type_hints["pod_cid_rs"])
+            check_type(argname="argument provider_id", value=provider_id, expected_type=type_hints["provider_id"])
+            check_type(argname="argument taints", value=taints, expected_type=type_hints["taints"])
+            check_type(argname="argument unschedulable", value=unschedulable, expected_type=type_hints["unschedulable"])
+        self._value_config_source = config_source
+        self._value_external_id = external_id
+        self._value_pod_cidr = pod_cidr
+        self._value_pod_cid_rs = pod_cid_rs
+        self._value_provider_id = provider_id
+        self._value_taints = taints
+        self._value_unschedulable = unschedulable
+
+    @builtins.property
+    def config_source(self) -> typing.Optional[NodeConfigSource]:
+        '''Deprecated: Previously used to specify the source of the node's configuration for the DynamicKubeletConfig feature.
+
+        This feature is removed from Kubelets as of 1.24 and will be fully removed in 1.26.
+
+        :schema: io.k8s.api.core.v1.NodeSpec#configSource
+        '''
+        result = self._value_config_source
+        return typing.cast(typing.Optional[NodeConfigSource], result)
+
+    @builtins.property
+    def external_id(self) -> typing.Optional[builtins.str]:
+        '''Deprecated.
+
+        Not all kubelets will set this field. Remove field after 1.13. see: https://issues.k8s.io/61966
+
+        :schema: io.k8s.api.core.v1.NodeSpec#externalID
+        '''
+        result = self._value_external_id
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def pod_cidr(self) -> typing.Optional[builtins.str]:
+        '''PodCIDR represents the pod IP range assigned to the node.
+
+        :schema: io.k8s.api.core.v1.NodeSpec#podCIDR
+        '''
+        result = self._value_pod_cidr
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def pod_cid_rs(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''podCIDRs represents the IP ranges assigned to the node for usage by Pods on that node.
+
+        If this field is specified, the 0th entry must match the podCIDR field. It may contain at most 1 value for each of IPv4 and IPv6.
+
+        :schema: io.k8s.api.core.v1.NodeSpec#podCIDRs
+        '''
+        result = self._value_pod_cid_rs
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def provider_id(self) -> typing.Optional[builtins.str]:
+        '''ID of the node assigned by the cloud provider in the format: ://.
+
+        :schema: io.k8s.api.core.v1.NodeSpec#providerID
+        '''
+        result = self._value_provider_id
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def taints(self) -> typing.Optional[typing.List["Taint"]]:
+        '''If specified, the node's taints.
+
+        :schema: io.k8s.api.core.v1.NodeSpec#taints
+        '''
+        result = self._value_taints
+        return typing.cast(typing.Optional[typing.List["Taint"]], result)
+
+    @builtins.property
+    def unschedulable(self) -> typing.Optional[builtins.bool]:
+        '''Unschedulable controls node schedulability of new pods.
+
+        By default, node is schedulable. More info: https://kubernetes.io/docs/concepts/nodes/node/#manual-node-administration
+
+        :schema: io.k8s.api.core.v1.NodeSpec#unschedulable
+        '''
+        result = self._value_unschedulable
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_config_source is not None:
+            values["config_source"] = self._value_config_source
+        if self._value_external_id is not None:
+            values["external_id"] = self._value_external_id
+        if self._value_pod_cidr is not None:
+            values["pod_cidr"] = self._value_pod_cidr
+        if self._value_pod_cid_rs is not None:
+            values["pod_cid_rs"] = self._value_pod_cid_rs
+        if self._value_provider_id is not None:
+            values["provider_id"] = self._value_provider_id
+        if self._value_taints is not None:
+            values["taints"] = self._value_taints
+        if self._value_unschedulable is not None:
+            values["unschedulable"] = self._value_unschedulable
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NodeSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__6e50f14ca142b7e1ae3aa4c3b0de77e924013889955b6653359e1c2bc719eb0d(
+    *,
+    config_source: typing.Optional[typing.Union[NodeConfigSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    external_id: typing.Optional[builtins.str] = None,
+    pod_cidr: typing.Optional[builtins.str] = None,
+    pod_cid_rs: typing.Optional[typing.Sequence[builtins.str]] = None,
+    provider_id: typing.Optional[builtins.str] = None,
+    taints: typing.Optional[typing.Sequence[typing.Union[Taint, typing.Dict[builtins.str, typing.Any]]]] = None,
+    unschedulable: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,96 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.NonResourceAttributes",
+    jsii_struct_bases=[],
+    name_mapping={"path": "path", "verb": "verb"},
+)
+class NonResourceAttributes(_base.Struct):
+    __slots__ = (
+        "_value_path",
+        "_value_verb",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: typing.Optional[builtins.str] = None,
+        verb: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''NonResourceAttributes includes the authorization attributes available for non-resource requests to the Authorizer interface.
+
+        :param path: Path is the URL path of the request.
+        :param verb: Verb is the standard HTTP verb.
+
+        :schema: io.k8s.api.authorization.v1.NonResourceAttributes
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__87614183732b5aa4dd1bacd6db0063d066b6c9f07ce5f58af69ea84b6410702b)
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument verb", value=verb, expected_type=type_hints["verb"])
+        self._value_path = path
+        self._value_verb = verb
+
+    @builtins.property
+    def path(self) -> typing.Optional[builtins.str]:
+        '''Path is the URL path of the request.
+
+        :schema: io.k8s.api.authorization.v1.NonResourceAttributes#path
+        '''
+        result = self._value_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def verb(self) -> typing.Optional[builtins.str]:
+        '''Verb is the standard HTTP verb.
+
+        :schema: io.k8s.api.authorization.v1.NonResourceAttributes#verb
+        '''
+        result = self._value_verb
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_path is not None:
+            values["path"] = self._value_path
+        if self._value_verb is not None:
+            values["verb"] = self._value_verb
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NonResourceAttributes(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__87614183732b5aa4dd1bacd6db0063d066b6c9f07ce5f58af69ea84b6410702b(
+    *,
+    path: typing.Optional[builtins.str] = None,
+    verb: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
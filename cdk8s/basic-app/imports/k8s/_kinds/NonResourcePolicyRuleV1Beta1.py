@@ -0,0 +1,110 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.NonResourcePolicyRuleV1Beta1",
+    jsii_struct_bases=[],
+    name_mapping={"non_resource_ur_ls": "nonResourceUrLs", "verbs": "verbs"},
+)
+class NonResourcePolicyRuleV1Beta1(_base.Struct):
+    __slots__ = (
+        "_value_non_resource_ur_ls",
+        "_value_verbs",
+    )
+
+    def __init__(
+        self,
+        *,
+        non_resource_ur_ls: typing.Sequence[builtins.str],
+        verbs: typing.Sequence[builtins.str],
+    ) -> None:
+        '''NonResourcePolicyRule is a predicate that matches non-resource requests according to their verb and the target non-resource URL.
+
+        A NonResourcePolicyRule matches a request if and only if both (a) at least one member of verbs matches the request and (b) at least one member of nonResourceURLs matches the request.
+
+        :param non_resource_ur_ls: ``nonResourceURLs`` is a set of url prefixes that a user should have access to and may not be empty. For example: - "/healthz" is legal - "/hea*" is illegal - "/hea" is legal but matches nothing - "/hea/*" also matches nothing - "/healthz/*" matches all per-component health checks. "*" matches all non-resource urls. if it is present, it must be the only entry. Required.
+        :param verbs: ``verbs`` is a list of matching verbs and may not be empty. "*" matches all verbs. If it is present, it must be the only entry. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.NonResourcePolicyRule
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__67cb72f3c9d1be981ed8680709b60cf9fe8a87527b6f9c70f8d2d56da286bb08)
+            check_type(argname="argument non_resource_ur_ls", value=non_resource_ur_ls, expected_type=type_hints["non_resource_ur_ls"])
+            check_type(argname="argument verbs", value=verbs, expected_type=type_hints["verbs"])
+        self._value_non_resource_ur_ls = non_resource_ur_ls
+        self._value_verbs = verbs
+
+    @builtins.property
+    def non_resource_ur_ls(self) -> typing.List[builtins.str]:
+        '''``nonResourceURLs`` is a set of url prefixes that a user should have access to and may not be empty.
+
+        For example:
+
+        - "/healthz" is legal
+        - "/hea*" is illegal
+        - "/hea" is legal but matches nothing
+        - "/hea/*" also matches nothing
+        - "/healthz/*" matches all per-component health checks.
+          "*" matches all non-resource urls. if it is present, it must be the only entry. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.NonResourcePolicyRule#nonResourceURLs
+        '''
+        result = self._value_non_resource_ur_ls
+        assert result is not None, "Required property 'non_resource_ur_ls' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def verbs(self) -> typing.List[builtins.str]:
+        '''``verbs`` is a list of matching verbs and may not be empty.
+
+        "*" matches all verbs. If it is present, it must be the only entry. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.NonResourcePolicyRule#verbs
+        '''
+        result = self._value_verbs
+        assert result is not None, "Required property 'verbs' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "non_resource_ur_ls": self._value_non_resource_ur_ls,
+            "verbs": self._value_verbs,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "NonResourcePolicyRuleV1Beta1(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__67cb72f3c9d1be981ed8680709b60cf9fe8a87527b6f9c70f8d2d56da286bb08(
+    *,
+    non_resource_ur_ls: typing.Sequence[builtins.str],
+    verbs: typing.Sequence[builtins.str],
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,97 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ObjectFieldSelector",
+    jsii_struct_bases=[],
+    name_mapping={"field_path": "fieldPath", "api_version": "apiVersion"},
+)
+class ObjectFieldSelector(_base.Struct):
+    __slots__ = (
+        "_value_field_path",
+        "_value_api_version",
+    )
+
+    def __init__(
+        self,
+        *,
+        field_path: builtins.str,
+        api_version: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ObjectFieldSelector selects an APIVersioned field of an object.
+
+        :param field_path: Path of the field to select in the specified API version.
+        :param api_version: Version of the schema the FieldPath is written in terms of, defaults to "v1".
+
+        :schema: io.k8s.api.core.v1.ObjectFieldSelector
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c814859696bb254244f25cd638a669639c7d94c59b5e4180978a9f2c8497378a)
+            check_type(argname="argument field_path", value=field_path, expected_type=type_hints["field_path"])
+            check_type(argname="argument api_version", value=api_version, expected_type=type_hints["api_version"])
+        self._value_field_path = field_path
+        self._value_api_version = api_version
+
+    @builtins.property
+    def field_path(self) -> builtins.str:
+        '''Path of the field to select in the specified API version.
+
+        :schema: io.k8s.api.core.v1.ObjectFieldSelector#fieldPath
+        '''
+        result = self._value_field_path
+        assert result is not None, "Required property 'field_path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def api_version(self) -> typing.Optional[builtins.str]:
+        '''Version of the schema the FieldPath is written in terms of, defaults to "v1".
+
+        :schema: io.k8s.api.core.v1.ObjectFieldSelector#apiVersion
+        '''
+        result = self._value_api_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "field_path": self._value_field_path,
+        }
+        if self._value_api_version is not None:
+            values["api_version"] = self._value_api_version
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ObjectFieldSelector(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c814859696bb254244f25cd638a669639c7d94c59b5e4180978a9f2c8497378a(
+    *,
+    field_path: builtins.str,
+    api_version: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
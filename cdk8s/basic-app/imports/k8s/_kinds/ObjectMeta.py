@@ -0,0 +1,379 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ManagedFieldsEntry import ManagedFieldsEntry
+from .OwnerReference import OwnerReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.ObjectMeta",
+    jsii_struct_bases=[],
+    name_mapping={
+        "annotations": "annotations",
+        "creation_timestamp": "creationTimestamp",
+        "deletion_grace_period_seconds": "deletionGracePeriodSeconds",
+        "deletion_timestamp": "deletionTimestamp",
+        "finalizers": "finalizers",
+        "generate_name": "generateName",
+        "generation": "generation",
+        "labels": "labels",
+        "managed_fields": "managedFields",
+        "name": "name",
+        "namespace": "namespace",
+        "owner_references": "ownerReferences",
+        "resource_version": "resourceVersion",
+        "self_link": "selfLink",
+        "uid": "uid",
+    },
+)
+class ObjectMeta(_base.Struct):
+    __slots__ = (
+        "_value_annotations",
+        "_value_creation_timestamp",
+        "_value_deletion_grace_period_seconds",
+        "_value_deletion_timestamp",
+        "_value_finalizers",
+        "_value_generate_name",
+        "_value_generation",
+        "_value_labels",
+        "_value_managed_fields",
+        "_value_name",
+        "_value_namespace",
+        "_value_owner_references",
+        "_value_resource_version",
+        "_value_self_link",
+        "_value_uid",
+    )
+
+    def __init__(
+        self,
+        *,
+        annotations: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        creation_timestamp: typing.Optional[datetime.datetime] = None,
+        deletion_grace_period_seconds: typing.Optional[jsii.Number] = None,
+        deletion_timestamp: typing.Optional[datetime.datetime] = None,
+        finalizers: typing.Optional[typing.Sequence[builtins.str]] = None,
+        generate_name: typing.Optional[builtins.str] = None,
+        generation: typing.Optional[jsii.Number] = None,
+        labels: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        managed_fields: typing.Optional[typing.Sequence[typing.Union[ManagedFieldsEntry, typing.Dict[builtins.str, typing.Any]]]] = None,
+        name: typing.Optional[builtins.str] = None,
+        namespace: typing.Optional[builtins.str] = None,
+        owner_references: typing.Optional[typing.Sequence[typing.Union["OwnerReference", typing.Dict[builtins.str, typing.Any]]]] = None,
+        resource_version: typing.Optional[builtins.str] = None,
+        self_link: typing.Optional[builtins.str] = None,
+        uid: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ObjectMeta is metadata that all persisted resources must have, which includes all objects users must create.
+
+        :param annotations: Annotations is an unstructured key value map stored with a resource that may be set by external tools to store and retrieve arbitrary metadata. They are not queryable and should be preserved when modifying objects. More info: http://kubernetes.io/docs/user-guide/annotations
+        :param creation_timestamp: CreationTimestamp is a timestamp representing the server time when this object was created. It is not guaranteed to be set in happens-before order across separate operations. Clients may not set this value. It is represented in RFC3339 form and is in UTC. Populated by the system. Read-only. Null for lists. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param deletion_grace_period_seconds: Number of seconds allowed for this object to gracefully terminate before it will be removed from the system. Only set when deletionTimestamp is also set. May only be shortened. Read-only.
+        :param deletion_timestamp: DeletionTimestamp is RFC 3339 date and time at which this resource will be deleted. This field is set by the server when a graceful deletion is requested by the user, and is not directly settable by a client. The resource is expected to be deleted (no longer visible from resource lists, and not reachable by name) after the time in this field, once the finalizers list is empty. As long as the finalizers list contains items, deletion is blocked. Once the deletionTimestamp is set, this value may not be unset or be set further into the future, although it may be shortened or the resource may be deleted prior to this time. For example, a user may request that a pod is deleted in 30 seconds. The Kubelet will react by sending a graceful termination signal to the containers in the pod. After that 30 seconds, the Kubelet will send a hard termination signal (SIGKILL) to the container and after cleanup, remove the pod from the API. In the presence of network partitions, this object may still exist after this timestamp, until an administrator or automated process can determine the resource is fully terminated. If not set, graceful deletion of the object has not been requested. Populated by the system when a graceful deletion is requested. Read-only. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        :param finalizers: Must be empty before the object is deleted from the registry. Each entry is an identifier for the responsible component that will remove the entry from the list. If the deletionTimestamp of the object is non-nil, entries in this list can only be removed. Finalizers may be processed and removed in any order. Order is NOT enforced because it introduces significant risk of stuck finalizers. finalizers is a shared field, any actor with permission can reorder it. If the finalizer list is processed in order, then this can lead to a situation in which the component responsible for the first finalizer in the list is waiting for a signal (field value, external system, or other) produced by a component responsible for a finalizer later in the list, resulting in a deadlock. Without enforced ordering finalizers are free to order amongst themselves and are not vulnerable to ordering changes in the list.
+        :param generate_name: GenerateName is an optional prefix, used by the server, to generate a unique name ONLY IF the Name field has not been provided. If this field is used, the name returned to the client will be different than the name passed. This value will also be combined with a unique suffix. The provided value has the same validation rules as the Name field, and may be truncated by the length of the suffix required to make the value unique on the server. If this field is specified and the generated name exists, the server will return a 409. Applied only if Name is not specified. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#idempotency
+        :param generation: A sequence number representing a specific generation of the desired state. Populated by the system. Read-only.
+        :param labels: Map of string keys and values that can be used to organize and categorize (scope and select) objects. May match selectors of replication controllers and services. More info: http://kubernetes.io/docs/user-guide/labels
+        :param managed_fields: ManagedFields maps workflow-id and version to the set of fields that are managed by that workflow. This is mostly for internal housekeeping, and users typically shouldn't need to set or understand this field. A workflow can be the user's name, a controller's name, or the name of a specific apply path like "ci-cd". The set of fields is always in the version that the workflow used when modifying the object.
+        :param name: Name must be unique within a namespace. Is required when creating resources, although some resources may allow a client to request the generation of an appropriate name automatically. Name is primarily intended for creation idempotence and configuration definition. Cannot be updated. More info: http://kubernetes.io/docs/user-guide/identifiers#names
+        :param namespace: Namespace defines the space within which each name must be unique. An empty namespace is equivalent to the "default" namespace, but "default" is the canonical representation. Not all objects are required to be scoped to a namespace - the value of this field for those objects will be empty. Must be a DNS_LABEL. Cannot be updated. More info: http://kubernetes.io/docs/user-guide/namespaces
+        :param owner_references: List of objects depended by this object. If ALL objects in the list have been deleted, this object will be garbage collected. If this object is managed by a controller, then an entry in this list will point to this controller, with the controller field set to true. There cannot be more than one managing controller.
+        :param resource_version: An opaque value that represents the internal version of this object that can be used by clients to determine when objects have changed. May be used for optimistic concurrency, change detection, and the watch operation on a resource or set of resources. Clients must treat these values as opaque and passed unmodified back to the server. They may only be valid for a particular resource or set of resources. Populated by the system. Read-only. Value must be treated as opaque by clients and . More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#concurrency-control-and-consistency
+        :param self_link: Deprecated: selfLink is a legacy read-only field that is no longer populated by the system.
+        :param uid: UID is the unique in time and space value for this object. It is typically generated by the server on successful creation of a resource and is not allowed to change on PUT operations. Populated by the system. Read-only. More info: http://kubernetes.io/docs/user-guide/identifiers#uids
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7ee1f9d34e34f50cf19155ec68863e4beccde0e8fb69f1e800f6e8b53b8a2af5)
+            check_type(argname="argument annotations", value=annotations, expected_type=type_hints["annotations"])
+            check_type(argname="argument creation_timestamp", value=creation_timestamp, expected_type=type_hints["creation_timestamp"])
+            check_type(argname="argument deletion_grace_period_seconds", value=deletion_grace_period_seconds, expected_type=type_hints["deletion_grace_period_seconds"])
+            check_type(argname="argument deletion_timestamp", value=deletion_timestamp, expected_type=type_hints["deletion_timestamp"])
+            check_type(argname="argument finalizers", value=finalizers, expected_type=type_hints["finalizers"])
+            check_type(argname="argument generate_name", value=generate_name, expected_type=type_hints["generate_name"])
+            check_type(argname="argument generation", value=generation, expected_type=type_hints["generation"])
+            check_type(argname="argument labels", value=labels, expected_type=type_hints["labels"])
+            check_type(argname="argument managed_fields", value=managed_fields, expected_type=type_hints["managed_fields"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+            check_type(argname="argument owner_references", value=owner_references, expected_type=type_hints["owner_references"])
+            check_type(argname="argument resource_version", value=resource_version, expected_type=type_hints["resource_version"])
+            check_type(argname="argument self_link", value=self_link, expected_type=type_hints["self_link"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+        self._value_annotations = annotations
+        self._value_creation_timestamp = creation_timestamp
+        self._value_deletion_grace_period_seconds = deletion_grace_period_seconds
+        self._value_deletion_timestamp = deletion_timestamp
+        self._value_finalizers = finalizers
+        self._value_generate_name = generate_name
+        self._value_generation = generation
+        self._value_labels = labels
+        self._value_managed_fields = managed_fields
+        self._value_name = name
+        self._value_namespace = namespace
+        self._value_owner_references = owner_references
+        self._value_resource_version = resource_version
+        self._value_self_link = self_link
+        self._value_uid = uid
+
+    @builtins.property
+    def annotations(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''Annotations is an unstructured key value map stored with a resource that may be set by external tools to store and retrieve arbitrary metadata.
+
+        They are not queryable and should be preserved when modifying objects. More info: http://kubernetes.io/docs/user-guide/annotations
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#annotations
+        '''
+        result = self._value_annotations
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def creation_timestamp(self) -> typing.Optional[datetime.datetime]:
+        '''CreationTimestamp is a timestamp representing the server time when this object was created.
+
+        It is not guaranteed to be set in happens-before order across separate operations. Clients may not set this value. It is represented in RFC3339 form and is in UTC.
+
+        Populated by the system. Read-only. Null for lists. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#creationTimestamp
+        '''
+        result = self._value_creation_timestamp
+        return typing.cast(typing.Optional[datetime.datetime], result)
+
+    @builtins.property
+    def deletion_grace_period_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Number of seconds allowed for this object to gracefully terminate before it will be removed from the system.
+
+        Only set when deletionTimestamp is also set. May only be shortened. Read-only.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#deletionGracePeriodSeconds
+        '''
+        result = self._value_deletion_grace_period_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def deletion_timestamp(self) -> typing.Optional[datetime.datetime]:
+        '''DeletionTimestamp is RFC 3339 date and time at which this resource will be deleted.
+
+        This field is set by the server when a graceful deletion is requested by the user, and is not directly settable by a client. The resource is expected to be deleted (no longer visible from resource lists, and not reachable by name) after the time in this field, once the finalizers list is empty. As long as the finalizers list contains items, deletion is blocked. Once the deletionTimestamp is set, this value may not be unset or be set further into the future, although it may be shortened or the resource may be deleted prior to this time. For example, a user may request that a pod is deleted in 30 seconds. The Kubelet will react by sending a graceful termination signal to the containers in the pod. After that 30 seconds, the Kubelet will send a hard termination signal (SIGKILL) to the container and after cleanup, remove the pod from the API. In the presence of network partitions, this object may still exist after this timestamp, until an administrator or automated process can determine the resource is fully terminated. If not set, graceful deletion of the object has not been requested.
+
+        Populated by the system when a graceful deletion is requested. Read-only. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#deletionTimestamp
+        '''
+        result = self._value_deletion_timestamp
+        return typing.cast(typing.Optional[datetime.datetime], result)
+
+    @builtins.property
+    def finalizers(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Must be empty before the object is deleted from the registry.
+
+        Each entry is an identifier for the responsible component that will remove the entry from the list. If the deletionTimestamp of the object is non-nil, entries in this list can only be removed. Finalizers may be processed and removed in any order.  Order is NOT enforced because it introduces significant risk of stuck finalizers. finalizers is a shared field, any actor with permission can reorder it. If the finalizer list is processed in order, then this can lead to a situation in which the component responsible for the first finalizer in the list is waiting for a signal (field value, external system, or other) produced by a component responsible for a finalizer later in the list, resulting in a deadlock. Without enforced ordering finalizers are free to order amongst themselves and are not vulnerable to ordering changes in the list.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#finalizers
+        '''
+        result = self._value_finalizers
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def generate_name(self) -> typing.Optional[builtins.str]:
+        '''GenerateName is an optional prefix, used by the server, to generate a unique name ONLY IF the Name field has not been provided.
+
+        If this field is used, the name returned to the client will be different than the name passed. This value will also be combined with a unique suffix. The provided value has the same validation rules as the Name field, and may be truncated by the length of the suffix required to make the value unique on the server.
+
+        If this field is specified and the generated name exists, the server will return a 409.
+
+        Applied only if Name is not specified. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#idempotency
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#generateName
+        '''
+        result = self._value_generate_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def generation(self) -> typing.Optional[jsii.Number]:
+        '''A sequence number representing a specific generation of the desired state.
+
+        Populated by the system. Read-only.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#generation
+        '''
+        result = self._value_generation
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def labels(self) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''Map of string keys and values that can be used to organize and categorize (scope and select) objects.
+
+        May match selectors of replication controllers and services. More info: http://kubernetes.io/docs/user-guide/labels
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#labels
+        '''
+        result = self._value_labels
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def managed_fields(self) -> typing.Optional[typing.List[ManagedFieldsEntry]]:
+        '''ManagedFields maps workflow-id and version to the set of fields that are managed by that workflow.
+
+        This is mostly for internal housekeeping, and users typically shouldn't need to set or understand this field. A workflow can be the user's name, a controller's name, or the name of a specific apply path like "ci-cd". The set of fields is always in the version that the workflow used when modifying the object.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#managedFields
+        '''
+        result = self._value_managed_fields
+        return typing.cast(typing.Optional[typing.List[ManagedFieldsEntry]], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Name must be unique within a namespace.
+
+        Is required when creating resources, although some resources may allow a client to request the generation of an appropriate name automatically. Name is primarily intended for creation idempotence and configuration definition. Cannot be updated. More info: http://kubernetes.io/docs/user-guide/identifiers#names
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def namespace(self) -> typing.Optional[builtins.str]:
+        '''Namespace defines the space within which each name must be unique.
+
+        An empty namespace is equivalent to the "default" namespace, but "default" is the canonical representation. Not all objects are required to be scoped to a namespace - the value of this field for those objects will be empty.
+
+        Must be a DNS_LABEL. Cannot be updated. More info: http://kubernetes.io/docs/user-guide/namespaces
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#namespace
+        '''
+        result = self._value_namespace
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def owner_references(self) -> typing.Optional[typing.List["OwnerReference"]]:
+        '''List of objects depended by this object.
+
+        If ALL objects in the list have been deleted, this object will be garbage collected. If this object is managed by a controller, then an entry in this list will point to this controller, with the controller field set to true. There cannot be more than one managing controller.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#ownerReferences
+        '''
+        result = self._value_owner_references
+        return typing.cast(typing.Optional[typing.List["OwnerReference"]], result)
+
+    @builtins.property
+    def resource_version(self) -> typing.Optional[builtins.str]:
+        '''An opaque value that represents the internal version of this object that can be used by clients to determine when objects have changed.
+
+        May be used for optimistic concurrency, change detection, and the watch operation on a resource or set of resources. Clients must treat these values as opaque and passed unmodified back to the server. They may only be valid for a particular resource or set of resources.
+
+        Populated by the system. Read-only. Value must be treated as opaque by clients and . More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#concurrency-control-and-consistency
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#resourceVersion
+        '''
+        result = self._value_resource_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def self_link(self) -> typing.Optional[builtins.str]:
+        '''Deprecated: selfLink is a legacy read-only field that is no longer populated by the system.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#selfLink
+        '''
+        result = self._value_self_link
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def uid(self) -> typing.Optional[builtins.str]:
+        '''UID is the unique in time and space value for this object.
+
+        It is typically generated by the server on successful creation of a resource and is not allowed to change on PUT operations.
+
+        Populated by the system. Read-only. More info: http://kubernetes.io/docs/user-guide/identifiers#uids
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta#uid
+        '''
+        result = self._value_uid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_annotations is not None:
+            values["annotations"] = self._value_annotations
+        if self._value_creation_timestamp is not None:
+            values["creation_timestamp"] = self._value_creation_timestamp
+        if self._value_deletion_grace_period_seconds is not None:
+            values["deletion_grace_period_seconds"] = self._value_deletion_grace_period_seconds
+        if self._value_deletion_timestamp is not None:
+            values["deletion_timestamp"] = self._value_deletion_timestamp
+        if self._value_finalizers is not None:
+            values["finalizers"] = self._value_finalizers
+        if self._value_generate_name is not None:
+            values["generate_name"] = self._value_generate_name
+        if self._value_generation is not None:
+            values["generation"] = self._value_generation
+        if self._value_labels is not None:
+            values["labels"] = self._value_labels
+        if self._value_managed_fields is not None:
+            values["managed_fields"] = self._value_managed_fields
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_namespace is not None:
+            values["namespace"] = self._value_namespace
+        if self._value_owner_references is not None:
+            values["owner_references"] = self._value_owner_references
+        if self._value_resource_version is not None:
+            values["resource_version"] = self._value_resource_version
+        if self._value_self_link is not None:
+            values["self_link"] = self._value_self_link
+        if self._value_uid is not None:
+            values["uid"] = self._value_uid
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ObjectMeta(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7ee1f9d34e34f50cf19155ec68863e4beccde0e8fb69f1e800f6e8b53b8a2af5(
+    *,
+    annotations: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    creation_timestamp: typing.Optional[datetime.datetime] = None,
+    deletion_grace_period_seconds: typing.Optional[jsii.Number] = None,
+    deletion_timestamp: typing.Optional[datetime.datetime] = None,
+    finalizers: typing.Optional[typing.Sequence[builtins.str]] = None,
+    generate_name: typing.Optional[builtins.str] = None,
+    generation: typing.Optional[jsii.Number] = None,
+    labels: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    managed_fields: typing.Optional[typing.Sequence[typing.Union[ManagedFieldsEntry, typing.Dict[builtins.str, typing.Any]]]] = None,
+    name: typing.Optional[builtins.str] = None,
+    namespace: typing.Optional[builtins.str] = None,
+    owner_references: typing.Optional[typing.Sequence[typing.Union[OwnerReference, typing.Dict[builtins.str, typing.Any]]]] = None,
+    resource_version: typing.Optional[builtins.str] = None,
+    self_link: typing.Optional[builtins.str] = None,
+    uid: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,126 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .CrossVersionObjectReferenceV2Beta2 import CrossVersionObjectReferenceV2Beta2
+from .MetricIdentifierV2Beta2 import MetricIdentifierV2Beta2
+from .MetricTargetV2Beta2 import MetricTargetV2Beta2
+
+
+@jsii.data_type(
+    jsii_type="k8s.ObjectMetricSourceV2Beta2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "described_object": "describedObject",
+        "metric": "metric",
+        "target": "target",
+    },
+)
+class ObjectMetricSourceV2Beta2(_base.Struct):
+    __slots__ = (
+        "_value_described_object",
+        "_value_metric",
+        "_value_target",
+    )
+
+    def __init__(
+        self,
+        *,
+        described_object: typing.Union[CrossVersionObjectReferenceV2Beta2, typing.Dict[builtins.str, typing.Any]],
+        metric: typing.Union[MetricIdentifierV2Beta2, typing.Dict[builtins.str, typing.Any]],
+        target: typing.Union[MetricTargetV2Beta2, typing.Dict[builtins.str, typing.Any]],
+    ) -> None:
+        '''ObjectMetricSource indicates how to scale on a metric describing a kubernetes object (for example, hits-per-second on an Ingress object).
+
+        :param described_object: 
+        :param metric: metric identifies the target metric by name and selector.
+        :param target: target specifies the target value for the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.ObjectMetricSource
+        '''
+        if isinstance(described_object, dict):
+            described_object = CrossVersionObjectReferenceV2Beta2(**described_object)
+        if isinstance(metric, dict):
+            metric = MetricIdentifierV2Beta2(**metric)
+        if isinstance(target, dict):
+            target = MetricTargetV2Beta2(**target)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ef8bdab30daace0db5f7f5e3f35434e3a17d875bdd22c51b11fe95f7bd90f752)
+            check_type(argname="argument described_object", value=described_object, expected_type=type_hints["described_object"])
+            check_type(argname="argument metric", value=metric, expected_type=type_hints["metric"])
+            check_type(argname="argument target", value=target, expected_type=type_hints["target"])
+        self._value_described_object = described_object
+        self._value_metric = metric
+        self._value_target = target
+
+    @builtins.property
+    def described_object(self) -> CrossVersionObjectReferenceV2Beta2:
+        '''
+        :schema: io.k8s.api.autoscaling.v2beta2.ObjectMetricSource#describedObject
+        '''
+        result = self._value_described_object
+        assert result is not None, "Required property 'described_object' is missing"
+        return typing.cast(CrossVersionObjectReferenceV2Beta2, result)
+
+    @builtins.property
+    def metric(self) -> MetricIdentifierV2Beta2:
+        '''metric identifies the target metric by name and selector.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.ObjectMetricSource#metric
+        '''
+        result = self._value_metric
+        assert result is not None, "Required property 'metric' is missing"
+        return typing.cast(MetricIdentifierV2Beta2, result)
+
+    @builtins.property
+    def target(self) -> MetricTargetV2Beta2:
+        '''target specifies the target value for the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2beta2.ObjectMetricSource#target
+        '''
+        result = self._value_target
+        assert result is not None, "Required property 'target' is missing"
+        return typing.cast(MetricTargetV2Beta2, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "described_object": self._value_described_object,
+            "metric": self._value_metric,
+            "target": self._value_target,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ObjectMetricSourceV2Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ef8bdab30daace0db5f7f5e3f35434e3a17d875bdd22c51b11fe95f7bd90f752(
+    *,
+    described_object: typing.Union[CrossVersionObjectReferenceV2Beta2, typing.Dict[builtins.str, typing.Any]],
+    metric: typing.Union[MetricIdentifierV2Beta2, typing.Dict[builtins.str, typing.Any]],
+    target: typing.Union[MetricTargetV2Beta2, typing.Dict[builtins.str, typing.Any]],
+) -> None:
+    """Type checking stubs"""
+    pass
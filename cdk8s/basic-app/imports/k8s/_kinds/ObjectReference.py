@@ -0,0 +1,199 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ObjectReference",
+    jsii_struct_bases=[],
+    name_mapping={
+        "api_version": "apiVersion",
+        "field_path": "fieldPath",
+        "kind": "kind",
+        "name": "name",
+        "namespace": "namespace",
+        "resource_version": "resourceVersion",
+        "uid": "uid",
+    },
+)
+class ObjectReference(_base.Struct):
+    __slots__ = (
+        "_value_api_version",
+        "_value_field_path",
+        "_value_kind",
+        "_value_name",
+        "_value_namespace",
+        "_value_resource_version",
+        "_value_uid",
+    )
+
+    def __init__(
+        self,
+        *,
+        api_version: typing.Optional[builtins.str] = None,
+        field_path: typing.Optional[builtins.str] = None,
+        kind: typing.Optional[builtins.str] = None,
+        name: typing.Optional[builtins.str] = None,
+        namespace: typing.Optional[builtins.str] = None,
+        resource_version: typing.Optional[builtins.str] = None,
+        uid: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ObjectReference contains enough information to let you inspect or modify the referred object.
+
+        :param api_version: API version of the referent.
+        :param field_path: If referring to a piece of an object instead of an entire object, this string should contain a valid JSON/Go field access statement, such as desiredState.manifest.containers[2]. For example, if the object reference is to a container within a pod, this would take on a value like: "spec.containers{name}" (where "name" refers to the name of the container that triggered the event) or if no container name is specified "spec.containers[2]" (container with index 2 in this pod). This syntax is chosen only to have some well-defined way of referencing a part of an object.
+        :param kind: Kind of the referent. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+        :param name: Name of the referent. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+        :param namespace: Namespace of the referent. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/namespaces/
+        :param resource_version: Specific resourceVersion to which this reference is made, if any. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#concurrency-control-and-consistency
+        :param uid: UID of the referent. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#uids
+
+        :schema: io.k8s.api.core.v1.ObjectReference
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c20094532bd9f73694f77438189bb3de9c66cbdd0365b5006af71270a4661cc5)
+            check_type(argname="argument api_version", value=api_version, expected_type=type_hints["api_version"])
+            check_type(argname="argument field_path", value=field_path, expected_type=type_hints["field_path"])
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+            check_type(argname="argument resource_version", value=resource_version, expected_type=type_hints["resource_version"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+        self._value_api_version = api_version
+        self._value_field_path = field_path
+        self._value_kind = kind
+        self._value_name = name
+        self._value_namespace = namespace
+        self._value_resource_version = resource_version
+        self._value_uid = uid
+
+    @builtins.property
+    def api_version(self) -> typing.Optional[builtins.str]:
+        '''API version of the referent.
+
+        :schema: io.k8s.api.core.v1.ObjectReference#apiVersion
+        '''
+        result = self._value_api_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def field_path(self) -> typing.Optional[builtins.str]:
+        '''If referring to a piece of an object instead of an entire object, this string should contain a valid JSON/Go field access statement, such as desiredState.manifest.containers[2]. For example, if the object reference is to a container within a pod, this would take on a value like: "spec.containers{name}" (where "name" refers to the name of the container that triggered the event) or if no container name is specified "spec.containers[2]" (container with index 2 in this pod). This syntax is chosen only to have some well-defined way of referencing a part of an object.
+
+        :schema: io.k8s.api.core.v1.ObjectReference#fieldPath
+        '''
+        result = self._value_field_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def kind(self) -> typing.Optional[builtins.str]:
+        '''Kind of the referent.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+
+        :schema: io.k8s.api.core.v1.ObjectReference#kind
+        '''
+        result = self._value_kind
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Name of the referent.
+
+        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+
+        :schema: io.k8s.api.core.v1.ObjectReference#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def namespace(self) -> typing.Optional[builtins.str]:
+        '''Namespace of the referent.
+
+        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/namespaces/
+
+        :schema: io.k8s.api.core.v1.ObjectReference#namespace
+        '''
+        result = self._value_namespace
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def resource_version(self) -> typing.Optional[builtins.str]:
+        '''Specific resourceVersion to which this reference is made, if any.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#concurrency-control-and-consistency
+
+        :schema: io.k8s.api.core.v1.ObjectReference#resourceVersion
+        '''
+        result = self._value_resource_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def uid(self) -> typing.Optional[builtins.str]:
+        '''UID of the referent.
+
+        More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#uids
+
+        :schema: io.k8s.api.core.v1.ObjectReference#uid
+        '''
+        result = self._value_uid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_api_version is not None:
+            values["api_version"] = self._value_api_version
+        if self._value_field_path is not None:
+            values["field_path"] = self._value_field_path
+        if self._value_kind is not None:
+            values["kind"] = self._value_kind
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_namespace is not None:
+            values["namespace"] = self._value_namespace
+        if self._value_resource_version is not None:
+            values["resource_version"] = self._value_resource_version
+        if self._value_uid is not None:
+            values["uid"] = self._value_uid
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ObjectReference(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c20094532bd9f73694f77438189bb3de9c66cbdd0365b5006af71270a4661cc5(
+    *,
+    api_version: typing.Optional[builtins.str] = None,
+    field_path: typing.Optional[builtins.str] = None,
+    kind: typing.Optional[builtins.str] = None,
+    name: typing.Optional[builtins.str] = None,
+    namespace: typing.Optional[builtins.str] = None,
+    resource_version: typing.Optional[builtins.str] = None,
+    uid: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
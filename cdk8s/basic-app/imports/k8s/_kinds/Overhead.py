@@ -0,0 +1,80 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Quantity import Quantity
+
+
+@jsii.data_type(
+    jsii_type="k8s.Overhead",
+    jsii_struct_bases=[],
+    name_mapping={"pod_fixed": "podFixed"},
+)
+class Overhead(_base.Struct):
+    __slots__ = (
+        "_value_pod_fixed",
+    )
+
+    def __init__(
+        self,
+        *,
+        pod_fixed: typing.Optional[typing.Mapping[builtins.str, "Quantity"]] = None,
+    ) -> None:
+        '''Overhead structure represents the resource overhead associated with running a pod.
+
+        :param pod_fixed: PodFixed represents the fixed resource overhead associated with running a pod.
+
+        :schema: io.k8s.api.node.v1.Overhead
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__57ac617e483fea78edd490dac696636c32772cbc5e9c8196a16758039d227d56)
+            check_type(argname="argument pod_fixed", value=pod_fixed, expected_type=type_hints["pod_fixed"])
+        self._value_pod_fixed = pod_fixed
+
+    @builtins.property
+    def pod_fixed(self) -> typing.Optional[typing.Mapping[builtins.str, "Quantity"]]:
+        '''PodFixed represents the fixed resource overhead associated with running a pod.
+
+        :schema: io.k8s.api.node.v1.Overhead#podFixed
+        '''
+        result = self._value_pod_fixed
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "Quantity"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_pod_fixed is not None:
+            values["pod_fixed"] = self._value_pod_fixed
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Overhead(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__57ac617e483fea78edd490dac696636c32772cbc5e9c8196a16758039d227d56(
+    *,
+    pod_fixed: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
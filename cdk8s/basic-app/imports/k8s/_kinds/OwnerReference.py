@@ -0,0 +1,184 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.OwnerReference",
+    jsii_struct_bases=[],
+    name_mapping={
+        "api_version": "apiVersion",
+        "kind": "kind",
+        "name": "name",
+        "uid": "uid",
+        "block_owner_deletion": "blockOwnerDeletion",
+        "controller": "controller",
+    },
+)
+class OwnerReference(_base.Struct):
+    __slots__ = (
+        "_value_api_version",
+        "_value_kind",
+        "_value_name",
+        "_value_uid",
+        "_value_block_owner_deletion",
+        "_value_controller",
+    )
+
+    def __init__(
+        self,
+        *,
+        api_version: builtins.str,
+        kind: builtins.str,
+        name: builtins.str,
+        uid: builtins.str,
+        block_owner_deletion: typing.Optional[builtins.bool] = None,
+        controller: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''OwnerReference contains enough information to let you identify an owning object.
+
+        An owning object must be in the same namespace as the dependent, or be cluster-scoped, so there is no namespace field.
+
+        :param api_version: API version of the referent.
+        :param kind: Kind of the referent. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+        :param name: Name of the referent. More info: http://kubernetes.io/docs/user-guide/identifiers#names
+        :param uid: UID of the referent. More info: http://kubernetes.io/docs/user-guide/identifiers#uids
+        :param block_owner_deletion: If true, AND if the owner has the "foregroundDeletion" finalizer, then the owner cannot be deleted from the key-value store until this reference is removed. See https://kubernetes.io/docs/concepts/architecture/garbage-collection/#foreground-deletion for how the garbage collector interacts with this field and enforces the foreground deletion. Defaults to false. To set this field, a user needs "delete" permission of the owner, otherwise 422 (Unprocessable Entity) will be returned. Default: false. To set this field, a user needs "delete" permission of the owner, otherwise 422 (Unprocessable Entity) will be returned.
+        :param controller: If true, this reference points to the managing controller.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__f492c2fd31467da33dd2714b04585d0827fb1e1b0cf0b750d6db405bd88f0eeb)
+            check_type(argname="argument api_version", value=api_version, expected_type=type_hints["api_version"])
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+            check_type(argname="argument block_owner_deletion", value=block_owner_deletion, expected_type=type_hints["block_owner_deletion"])
+            check_type(argname="argument controller", value=controller, expected_type=type_hints["controller"])
+        self._value_api_version = api_version
+        self._value_kind = kind
+        self._value_name = name
+        self._value_uid = uid
+        self._value_block_owner_deletion = block_owner_deletion
+        self._value_controller = controller
+
+    @builtins.property
+    def api_version(self) -> builtins.str:
+        '''API version of the referent.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference#apiVersion
+        '''
+        result = self._value_api_version
+        assert result is not None, "Required property 'api_version' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def kind(self) -> builtins.str:
+        '''Kind of the referent.
+
+        More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference#kind
+        '''
+        result = self._value_kind
+        assert result is not None, "Required property 'kind' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''Name of the referent.
+
+        More info: http://kubernetes.io/docs/user-guide/identifiers#names
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def uid(self) -> builtins.str:
+        '''UID of the referent.
+
+        More info: http://kubernetes.io/docs/user-guide/identifiers#uids
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference#uid
+        '''
+        result = self._value_uid
+        assert result is not None, "Required property 'uid' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def block_owner_deletion(self) -> typing.Optional[builtins.bool]:
+        '''If true, AND if the owner has the "foregroundDeletion" finalizer, then the owner cannot be deleted from the key-value store until this reference is removed.
+
+        See https://kubernetes.io/docs/concepts/architecture/garbage-collection/#foreground-deletion for how the garbage collector interacts with this field and enforces the foreground deletion. Defaults to false. To set this field, a user needs "delete" permission of the owner, otherwise 422 (Unprocessable Entity) will be returned.
+
+        :default: false. To set this field, a user needs "delete" permission of the owner, otherwise 422 (Unprocessable Entity) will be returned.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference#blockOwnerDeletion
+        '''
+        result = self._value_block_owner_deletion
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def controller(self) -> typing.Optional[builtins.bool]:
+        '''If true, this reference points to the managing controller.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.OwnerReference#controller
+        '''
+        result = self._value_controller
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "api_version": self._value_api_version,
+            "kind": self._value_kind,
+            "name": self._value_name,
+            "uid": self._value_uid,
+        }
+        if self._value_block_owner_deletion is not None:
+            values["block_owner_deletion"] = self._value_block_owner_deletion
+        if self._value_controller is not None:
+            values["controller"] = self._value_controller
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "OwnerReference(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__f492c2fd31467da33dd2714b04585d0827fb1e1b0cf0b750d6db405bd88f0eeb(
+    *,
+    api_version: builtins.str,
+    kind: builtins.str,
+    name: builtins.str,
+    uid: builtins.str,
+    block_owner_deletion: typing.Optional[builtins.bool] = None,
+    controller: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
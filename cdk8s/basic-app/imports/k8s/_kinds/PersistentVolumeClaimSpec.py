@@ -0,0 +1,234 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+from .ResourceRequirements import ResourceRequirements
+from .TypedLocalObjectReference import TypedLocalObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.PersistentVolumeClaimSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "access_modes": "accessModes",
+        "data_source": "dataSource",
+        "data_source_ref": "dataSourceRef",
+        "resources": "resources",
+        "selector": "selector",
+        "storage_class_name": "storageClassName",
+        "volume_mode": "volumeMode",
+        "volume_name": "volumeName",
+    },
+)
+class PersistentVolumeClaimSpec(_base.Struct):
+    __slots__ = (
+        "_value_access_modes",
+        "_value_data_source",
+        "_value_data_source_ref",
+        "_value_resources",
+        "_value_selector",
+        "_value_storage_class_name",
+        "_value_volume_mode",
+        "_value_volume_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        access_modes: typing.Optional[typing.Sequence[builtins.str]] = None,
+        data_source: typing.Optional[typing.Union["TypedLocalObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        data_source_ref: typing.Optional[typing.Union["TypedLocalObjectReference", typing.Dict[builtins.str, typing.Any]]] = None,
+        resources: typing.Optional[typing.Union["ResourceRequirements", typing.Dict[builtins.str, typing.Any]]] = None,
+        selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+        storage_class_name: typing.Optional[builtins.str] = None,
+        volume_mode: typing.Optional[builtins.str] = None,
+        volume_name: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''PersistentVolumeClaimSpec describes the common attributes of storage devices and allows a Source for provider-specific attributes.
+
+        :param access_modes: accessModes contains the desired access modes the volume should have. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes-1
+        :param data_source: dataSource field can be used to specify either: * An existing VolumeSnapshot object (snapshot.storage.k8s.io/VolumeSnapshot) * An existing PVC (PersistentVolumeClaim) If the provisioner or an external controller can support the specified data source, it will create a new volume based on the contents of the specified data source. If the AnyVolumeDataSource feature gate is enabled, this field will always have the same contents as the DataSourceRef field.
+        :param data_source_ref: dataSourceRef specifies the object from which to populate the volume with data, if a non-empty volume is desired. This may be any local object from a non-empty API group (non core object) or a PersistentVolumeClaim object. When this field is specified, volume binding will only succeed if the type of the specified object matches some installed volume populator or dynamic provisioner. This field will replace the functionality of the DataSource field and as such if both fields are non-empty, they must have the same value. For backwards compatibility, both fields (DataSource and DataSourceRef) will be set to the same value automatically if one of them is empty and the other is non-empty. There are two important differences between DataSource and DataSourceRef: * While DataSource only allows two specific types of objects, DataSourceRef allows any non-core object, as well as PersistentVolumeClaim objects. - While DataSource ignores disallowed values (dropping them), DataSourceRef preserves all values, and generates an error if a disallowed value is specified. (Beta) Using this field requires the AnyVolumeDataSource feature gate to be enabled.
+        :param resources: resources represents the minimum resources the volume should have. If RecoverVolumeExpansionFailure feature is enabled users are allowed to specify resource requirements that are lower than previous value but must still be higher than capacity recorded in the status field of the claim. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#resources
+        :param selector: selector is a label query over volumes to consider for binding.
+        :param storage_class_name: storageClassName is the name of the StorageClass required by the claim. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#class-1
+        :param volume_mode: volumeMode defines what type of volume is required by the claim. Value of Filesystem is implied when not included in claim spec.
+        :param volume_name: volumeName is the binding reference to the PersistentVolume backing this claim.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec
+        '''
+        if isinstance(data_source, dict):
+            data_source = TypedLocalObjectReference(**data_source)
+        if isinstance(data_source_ref, dict):
+            data_source_ref = TypedLocalObjectReference(**data_source_ref)
+        if isinstance(resources, dict):
+            resources = ResourceRequirements(**resources)
+        if isinstance(selector, dict):
+            selector = LabelSelector(**selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__be23e20b8fae04cc3c5f02f0df1e7da53e588f89c5d6bcc9ca2ad145ca3ea9ac)
+            check_type(argname="argument access_modes", value=access_modes, expected_type=type_hints["access_modes"])
+            check_type(argname="argument data_source", value=data_source, expected_type=type_hints["data_source"])
+            check_type(argname="argument data_source_ref", value=data_source_ref, expected_type=type_hints["data_source_ref"])
+            check_type(argname="argument resources", value=resources, expected_type=type_hints["resources"])
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+            check_type(argname="argument storage_class_name", value=storage_class_name, expected_type=type_hints["storage_class_name"])
+            check_type(argname="argument volume_mode", value=volume_mode, expected_type=type_hints["volume_mode"])
+            check_type(argname="argument volume_name", value=volume_name, expected_type=type_hints["volume_name"])
+        self._value_access_modes = access_modes
+        self._value_data_source = data_source
+        self._value_data_source_ref = data_source_ref
+        self._value_resources = resources
+        self._value_selector = selector
+        self._value_storage_class_name = storage_class_name
+        self._value_volume_mode = volume_mode
+        self._value_volume_name = volume_name
+
+    @builtins.property
+    def access_modes(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''accessModes contains the desired access modes the volume should have.
+
+        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes-1
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec#accessModes
+        '''
+        result = self._value_access_modes
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def data_source(self) -> typing.Optional["TypedLocalObjectReference"]:
+        '''dataSource field can be used to specify either: * An existing VolumeSnapshot object (snapshot.storage.k8s.io/VolumeSnapshot) * An existing PVC (PersistentVolumeClaim) If the provisioner or an external controller can support the specified data source, it will create a new volume based on the contents of the specified data source. If the AnyVolumeDataSource feature gate is enabled, this field will always have the same contents as the DataSourceRef field.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec#dataSource
+        '''
+        result = self._value_data_source
+        return typing.cast(typing.Optional["TypedLocalObjectReference"], result)
+
+    @builtins.property
+    def data_source_ref(self) -> typing.Optional["TypedLocalObjectReference"]:
+        '''dataSourceRef specifies the object from which to populate the volume with data, if a non-empty volume is desired.
+
+        This may be any local object from a non-empty API group (non core object) or a PersistentVolumeClaim object. When this field is specified, volume binding will only succeed if the type of the specified object matches some installed volume populator or dynamic provisioner. This field will replace the functionality of the DataSource field and as such if both fields are non-empty, they must have the same value. For backwards compatibility, both fields (DataSource and DataSourceRef) will be set to the same value automatically if one of them is empty and the other is non-empty. There are two important differences between DataSource and DataSourceRef: * While DataSource only allows two specific types of objects, DataSourceRef
+        allows any non-core object, as well as PersistentVolumeClaim objects.
+
+        - While DataSource ignores disallowed values (dropping them), DataSourceRef
+          preserves all values, and generates an error if a disallowed value is
+          specified.
+          (Beta) Using this field requires the AnyVolumeDataSource feature gate to be enabled.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec#dataSourceRef
+        '''
+        result = self._value_data_source_ref
+        return typing.cast(typing.Optional["TypedLocalObjectReference"], result)
+
+    @builtins.property
+    def resources(self) -> typing.Optional["ResourceRequirements"]:
+        '''resources represents the minimum resources the volume should have.
+
+        If RecoverVolumeExpansionFailure feature is enabled users are allowed to specify resource requirements that are lower than previous value but must still be higher than capacity recorded in the status field of the claim. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#resources
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec#resources
+        '''
+        result = self._value_resources
+        return typing.cast(typing.Optional["ResourceRequirements"], result)
+
+    @builtins.property
+    def selector(self) -> typing.Optional[LabelSelector]:
+        '''selector is a label query over volumes to consider for binding.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec#selector
+        '''
+        result = self._value_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def storage_class_name(self) -> typing.Optional[builtins.str]:
+        '''storageClassName is the name of the StorageClass required by the claim.
+
+        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#class-1
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec#storageClassName
+        '''
+        result = self._value_storage_class_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def volume_mode(self) -> typing.Optional[builtins.str]:
+        '''volumeMode defines what type of volume is required by the claim.
+
+        Value of Filesystem is implied when not included in claim spec.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec#volumeMode
+        '''
+        result = self._value_volume_mode
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def volume_name(self) -> typing.Optional[builtins.str]:
+        '''volumeName is the binding reference to the PersistentVolume backing this claim.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimSpec#volumeName
+        '''
+        result = self._value_volume_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_access_modes is not None:
+            values["access_modes"] = self._value_access_modes
+        if self._value_data_source is not None:
+            values["data_source"] = self._value_data_source
+        if self._value_data_source_ref is not None:
+            values["data_source_ref"] = self._value_data_source_ref
+        if self._value_resources is not None:
+            values["resources"] = self._value_resources
+        if self._value_selector is not None:
+            values["selector"] = self._value_selector
+        if self._value_storage_class_name is not None:
+            values["storage_class_name"] = self._value_storage_class_name
+        if self._value_volume_mode is not None:
+            values["volume_mode"] = self._value_volume_mode
+        if self._value_volume_name is not None:
+            values["volume_name"] = self._value_volume_name
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PersistentVolumeClaimSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__be23e20b8fae04cc3c5f02f0df1e7da53e588f89c5d6bcc9ca2ad145ca3ea9ac(
+    *,
+    access_modes: typing.Optional[typing.Sequence[builtins.str]] = None,
+    data_source: typing.Optional[typing.Union[TypedLocalObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    data_source_ref: typing.Optional[typing.Union[TypedLocalObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    resources: typing.Optional[typing.Union[ResourceRequirements, typing.Dict[builtins.str, typing.Any]]] = None,
+    selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    storage_class_name: typing.Optional[builtins.str] = None,
+    volume_mode: typing.Optional[builtins.str] = None,
+    volume_name: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
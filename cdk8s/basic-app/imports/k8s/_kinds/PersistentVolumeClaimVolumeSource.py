@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.PersistentVolumeClaimVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"claim_name": "claimName", "read_only": "readOnly"},
+)
+class PersistentVolumeClaimVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_claim_name",
+        "_value_read_only",
+    )
+
+    def __init__(
+        self,
+        *,
+        claim_name: builtins.str,
+        read_only: typing.Optional[builtins.bool] = None,
+    ) -> None:
+        '''PersistentVolumeClaimVolumeSource references the user's PVC in the same namespace.
+
+        This volume finds the bound PV and mounts that volume for the pod. A PersistentVolumeClaimVolumeSource is, essentially, a wrapper around another type of volume that is owned by someone else (the system).
+
+        :param claim_name: claimName is the name of a PersistentVolumeClaim in the same namespace as the pod using this volume. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims
+        :param read_only: readOnly Will force the ReadOnly setting in VolumeMounts. Default false.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__077a0f4dddf176bb8ddbe6260969da6b9456d4aae46a38dd256c0a2204c8ee7b)
+            check_type(argname="argument claim_name", value=claim_name, expected_type=type_hints["claim_name"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+        self._value_claim_name = claim_name
+        self._value_read_only = read_only
+
+    @builtins.property
+    def claim_name(self) -> builtins.str:
+        '''claimName is the name of a PersistentVolumeClaim in the same namespace as the pod using this volume.
+
+        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimVolumeSource#claimName
+        '''
+        result = self._value_claim_name
+        assert result is not None, "Required property 'claim_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly Will force the ReadOnly setting in VolumeMounts.
+
+        Default false.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeClaimVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "claim_name": self._value_claim_name,
+        }
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PersistentVolumeClaimVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__077a0f4dddf176bb8ddbe6260969da6b9456d4aae46a38dd256c0a2204c8ee7b(
+    *,
+    claim_name: builtins.str,
+    read_only: typing.Optional[builtins.bool] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,712 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .AwsElasticBlockStoreVolumeSource import AwsElasticBlockStoreVolumeSource
+from .AzureDiskVolumeSource import AzureDiskVolumeSource
+from .AzureFilePersistentVolumeSource import AzureFilePersistentVolumeSource
+from .CephFsPersistentVolumeSource import CephFsPersistentVolumeSource
+from .CinderPersistentVolumeSource import CinderPersistentVolumeSource
+from .CsiPersistentVolumeSource import CsiPersistentVolumeSource
+from .FcVolumeSource import FcVolumeSource
+from .FlexPersistentVolumeSource import FlexPersistentVolumeSource
+from .FlockerVolumeSource import FlockerVolumeSource
+from .GcePersistentDiskVolumeSource import GcePersistentDiskVolumeSource
+from .GlusterfsPersistentVolumeSource import GlusterfsPersistentVolumeSource
+from .HostPathVolumeSource import HostPathVolumeSource
+from .IscsiPersistentVolumeSource import IscsiPersistentVolumeSource
+from .LocalVolumeSource import LocalVolumeSource
+from .NfsVolumeSource import NfsVolumeSource
+from .ObjectReference import ObjectReference
+from .PhotonPersistentDiskVolumeSource import PhotonPersistentDiskVolumeSource
+from .PortworxVolumeSource import PortworxVolumeSource
+from .Quantity import Quantity
+from .QuobyteVolumeSource import QuobyteVolumeSource
+from .RbdPersistentVolumeSource import RbdPersistentVolumeSource
+from .ScaleIoPersistentVolumeSource import ScaleIoPersistentVolumeSource
+from .StorageOsPersistentVolumeSource import StorageOsPersistentVolumeSource
+from .VolumeNodeAffinity import VolumeNodeAffinity
+from .VsphereVirtualDiskVolumeSource import VsphereVirtualDiskVolumeSource
+
+
+@jsii.data_type(
+    jsii_type="k8s.PersistentVolumeSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "access_modes": "accessModes",
+        "aws_elastic_block_store": "awsElasticBlockStore",
+        "azure_disk": "azureDisk",
+        "azure_file": "azureFile",
+        "capacity": "capacity",
+        "cephfs": "cephfs",
+        "cinder": "cinder",
+        "claim_ref": "claimRef",
+        "csi": "csi",
+        "fc": "fc",
+        "flex_volume": "flexVolume",
+        "flocker": "flocker",
+        "gce_persistent_disk": "gcePersistentDisk",
+        "glusterfs": "glusterfs",
+        "host_path": "hostPath",
+        "iscsi": "iscsi",
+        "local": "local",
+        "mount_options": "mountOptions",
+        "nfs": "nfs",
+        "node_affinity": "nodeAffinity",
+        "persistent_volume_reclaim_policy": "persistentVolumeReclaimPolicy",
+        "photon_persistent_disk": "photonPersistentDisk",
+        "portworx_volume": "portworxVolume",
+        "quobyte": "quobyte",
+        "rbd": "rbd",
+        "scale_io": "scaleIo",
+        "storage_class_name": "storageClassName",
+        "storageos": "storageos",
+        "volume_mode": "volumeMode",
+        "vsphere_volume": "vsphereVolume",
+    },
+)
+class PersistentVolumeSpec(_base.Struct):
+    __slots__ = (
+        "_value_access_modes",
+        "_value_aws_elastic_block_store",
+        "_value_azure_disk",
+        "_value_azure_file",
+        "_value_capacity",
+        "_value_cephfs",
+        "_value_cinder",
+        "_value_claim_ref",
+        "_value_csi",
+        "_value_fc",
+        "_value_flex_volume",
+        "_value_flocker",
+        "_value_gce_persistent_disk",
+        "_value_glusterfs",
+        "_value_host_path",
+        "_value_iscsi",
+        "_value_local",
+        "_value_mount_options",
+        "_value_nfs",
+        "_value_node_affinity",
+        "_value_persistent_volume_reclaim_policy",
+        "_value_photon_persistent_disk",
+        "_value_portworx_volume",
+        "_value_quobyte",
+        "_value_rbd",
+        "_value_scale_io",
+        "_value_storage_class_name",
+        "_value_storageos",
+        "_value_volume_mode",
+        "_value_vsphere_volume",
+    )
+
+    def __init__(
+        self,
+        *,
+        access_modes: typing.Optional[typing.Sequence[builtins.str]] = None,
+        aws_elastic_block_store: typing.Optional[typing.Union[AwsElasticBlockStoreVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        azure_disk: typing.Optional[typing.Union[AzureDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        azure_file: typing.Optional[typing.Union[AzureFilePersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        capacity: typing.Optional[typing.Mapping[builtins.str, "Quantity"]] = None,
+        cephfs: typing.Optional[typing.Union[CephFsPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        cinder: typing.Optional[typing.Union[CinderPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        claim_ref: typing.Optional[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+        csi: typing.Optional[typing.Union[CsiPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        fc: typing.Optional[typing.Union[FcVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        flex_volume: typing.Optional[typing.Union[FlexPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        flocker: typing.Optional[typing.Union[FlockerVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        gce_persistent_disk: typing.Optional[typing.Union[GcePersistentDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        glusterfs: typing.Optional[typing.Union[GlusterfsPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        host_path: typing.Optional[typing.Union[HostPathVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        iscsi: typing.Optional[typing.Union[IscsiPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        local: typing.Optional[typing.Union[LocalVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        mount_options: typing.Optional[typing.Sequence[builtins.str]] = None,
+        nfs: typing.Optional[typing.Union[NfsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        node_affinity: typing.Optional[typing.Union["VolumeNodeAffinity", typing.Dict[builtins.str, typing.Any]]] = None,
+        persistent_volume_reclaim_policy: typing.Optional[builtins.str] = None,
+        photon_persistent_disk: typing.Optional[typing.Union["PhotonPersistentDiskVolumeSource", typing.Dict[builtins.str, typing.Any]]] = None,
+        portworx_volume: typing.Optional[typing.Union["PortworxVolumeSource", typing.Dict[builtins.str, typing.Any]]] = None,
+        quobyte: typing.Optional[typing.Union["QuobyteVolumeSource", typing.Dict[builtins.str, typing.Any]]] = None,
+        rbd: typing.Optional[typing.Union["RbdPersistentVolumeSource", typing.Dict[builtins.str, typing.Any]]] = None,
+        scale_io: typing.Optional[typing.Union["ScaleIoPersistentVolumeSource", typing.Dict[builtins.str, typing.Any]]] = None,
+        storage_class_name: typing.Optional[builtins.str] = None,
+        storageos: typing.Optional[typing.Union["StorageOsPersistentVolumeSource", typing.Dict[builtins.str, typing.Any]]] = None,
+        volume_mode: typing.Optional[builtins.str] = None,
+        vsphere_volume: typing.Optional[typing.Union["VsphereVirtualDiskVolumeSource", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''PersistentVolumeSpec is the specification of a persistent volume.
+
+        :param access_modes: accessModes contains all ways the volume can be mounted. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes
+        :param aws_elastic_block_store: awsElasticBlockStore represents an AWS Disk resource that is attached to a kubelet's host machine and then exposed to the pod. More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+        :param azure_disk: azureDisk represents an Azure Data Disk mount on the host and bind mount to the pod.
+        :param azure_file: azureFile represents an Azure File Service mount on the host and bind mount to the pod.
+        :param capacity: capacity is the description of the persistent volume's resources and capacity. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#capacity
+        :param cephfs: cephFS represents a Ceph FS mount on the host that shares a pod's lifetime.
+        :param cinder: cinder represents a cinder volume attached and mounted on kubelets host machine. More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+        :param claim_ref: claimRef is part of a bi-directional binding between PersistentVolume and PersistentVolumeClaim. Expected to be non-nil when bound. claim.VolumeName is the authoritative bind between PV and PVC. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#binding
+        :param csi: csi represents storage that is handled by an external CSI driver (Beta feature).
+        :param fc: fc represents a Fibre Channel resource that is attached to a kubelet's host machine and then exposed to the pod.
+        :param flex_volume: flexVolume represents a generic volume resource that is provisioned/attached using an exec based plugin.
+        :param flocker: flocker represents a Flocker volume attached to a kubelet's host machine and exposed to the pod for its usage. This depends on the Flocker control service being running
+        :param gce_persistent_disk: gcePersistentDisk represents a GCE Disk resource that is attached to a kubelet's host machine and then exposed to the pod. Provisioned by an admin. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+        :param glusterfs: glusterfs represents a Glusterfs volume that is attached to a host and exposed to the pod. Provisioned by an admin. More info: https://examples.k8s.io/volumes/glusterfs/README.md
+        :param host_path: hostPath represents a directory on the host. Provisioned by a developer or tester. This is useful for single-node development and testing only! On-host storage is not supported in any way and WILL NOT WORK in a multi-node cluster. More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath
+        :param iscsi: iscsi represents an ISCSI Disk resource that is attached to a kubelet's host machine and then exposed to the pod. Provisioned by an admin.
+        :param local: local represents directly-attached storage with node affinity.
+        :param mount_options: mountOptions is the list of mount options, e.g. ["ro", "soft"]. Not validated - mount will simply fail if one is invalid. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#mount-options.
+        :param nfs: nfs represents an NFS mount on the host. Provisioned by an admin. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+        :param node_affinity: nodeAffinity defines constraints that limit what nodes this volume can be accessed from. This field influences the scheduling of pods that use this volume.
+        :param persistent_volume_reclaim_policy: persistentVolumeReclaimPolicy defines what happens to a persistent volume when released from its claim. Valid options are Retain (default for manually created PersistentVolumes), Delete (default for dynamically provisioned PersistentVolumes), and Recycle (deprecated). Recycle must be supported by the volume plugin underlying this PersistentVolume. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#reclaiming
+        :param photon_persistent_disk: photonPersistentDisk represents a PhotonController persistent disk attached and mounted on kubelets host machine.
+        :param portworx_volume: portworxVolume represents a portworx volume attached and mounted on kubelets host machine.
+        :param quobyte: quobyte represents a Quobyte mount on the host that shares a pod's lifetime.
+        :param rbd: rbd represents a Rados Block Device mount on the host that shares a pod's lifetime. More info: https://examples.k8s.io/volumes/rbd/README.md
+        :param scale_io: scaleIO represents a ScaleIO persistent volume attached and mounted on Kubernetes nodes.
+        :param storage_class_name: storageClassName is the name of StorageClass to which this persistent volume belongs. Empty value means that this volume does not belong to any StorageClass.
+        :param storageos: storageOS represents a StorageOS volume that is attached to the kubelet's host machine and mounted into the pod More info: https://examples.k8s.io/volumes/storageos/README.md.
+        :param volume_mode: volumeMode defines if a volume is intended to be used with a formatted filesystem or to remain in raw block state. Value of Filesystem is implied when not included in spec.
+        :param vsphere_volume: vsphereVolume represents a vSphere volume attached and mounted on kubelets host machine.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec
+        '''
+        if isinstance(aws_elastic_block_store, dict):
+            aws_elastic_block_store = AwsElasticBlockStoreVolumeSource(**aws_elastic_block_store)
+        if isinstance(azure_disk, dict):
+            azure_disk = AzureDiskVolumeSource(**azure_disk)
+        if isinstance(azure_file, dict):
+            azure_file = AzureFilePersistentVolumeSource(**azure_file)
+        if isinstance(cephfs, dict):
+            cephfs = CephFsPersistentVolumeSource(**cephfs)
+        if isinstance(cinder, dict):
+            cinder = CinderPersistentVolumeSource(**cinder)
+        if isinstance(claim_ref, dict):
+            claim_ref = ObjectReference(**claim_ref)
+        if isinstance(csi, dict):
+            csi = CsiPersistentVolumeSource(**csi)
+        if isinstance(fc, dict):
+            fc = FcVolumeSource(**fc)
+        if isinstance(flex_volume, dict):
+            flex_volume = FlexPersistentVolumeSource(**flex_volume)
+        if isinstance(flocker, dict):
+            flocker = FlockerVolumeSource(**flocker)
+        if isinstance(gce_persistent_disk, dict):
+            gce_persistent_disk = GcePersistentDiskVolumeSource(**gce_persistent_disk)
+        if isinstance(glusterfs, dict):
+            glusterfs = GlusterfsPersistentVolumeSource(**glusterfs)
+        if isinstance(host_path, dict):
+            host_path = HostPathVolumeSource(**host_path)
+        if isinstance(iscsi, dict):
+            iscsi = IscsiPersistentVolumeSource(**iscsi)
+        if isinstance(local, dict):
+            local = LocalVolumeSource(**local)
+        if isinstance(nfs, dict):
+            nfs = NfsVolumeSource(**nfs)
+        if isinstance(node_affinity, dict):
+            node_affinity = VolumeNodeAffinity(**node_affinity)
+        if isinstance(photon_persistent_disk, dict):
+            photon_persistent_disk = PhotonPersistentDiskVolumeSource(**photon_persistent_disk)
+        if isinstance(portworx_volume, dict):
+            portworx_volume = PortworxVolumeSource(**portworx_volume)
+        if isinstance(quobyte, dict):
+            quobyte = QuobyteVolumeSource(**quobyte)
+        if isinstance(rbd, dict):
+            rbd = RbdPersistentVolumeSource(**rbd)
+        if isinstance(scale_io, dict):
+            scale_io = ScaleIoPersistentVolumeSource(**scale_io)
+        if isinstance(storageos, dict):
+            storageos = StorageOsPersistentVolumeSource(**storageos)
+        if isinstance(vsphere_volume, dict):
+            vsphere_volume = VsphereVirtualDiskVolumeSource(**vsphere_volume)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__35aff97a067cf96c268b843a969ca0b9162e0690f21670fdecba69ea27a470fb)
+            check_type(argname="argument access_modes", value=access_modes, expected_type=type_hints["access_modes"])
+            check_type(argname="argument aws_elastic_block_store", value=aws_elastic_block_store, expected_type=type_hints["aws_elastic_block_store"])
+            check_type(argname="argument azure_disk", value=azure_disk, expected_type=type_hints["azure_disk"])
+            check_type(argname="argument azure_file", value=azure_file, expected_type=type_hints["azure_file"])
+            check_type(argname="argument capacity", value=capacity, expected_type=type_hints["capacity"])
+            check_type(argname="argument cephfs", value=cephfs, expected_type=type_hints["cephfs"])
+            check_type(argname="argument cinder", value=cinder, expected_type=type_hints["cinder"])
+            check_type(argname="argument claim_ref", value=claim_ref, expected_type=type_hints["claim_ref"])
+            check_type(argname="argument csi", value=csi, expected_type=type_hints["csi"])
+            check_type(argname="argument fc", value=fc, expected_type=type_hints["fc"])
+            check_type(argname="argument flex_volume", value=flex_volume, expected_type=type_hints["flex_volume"])
+            check_type(argname="argument flocker", value=flocker, expected_type=type_hints["flocker"])
+            check_type(argname="argument gce_persistent_disk", value=gce_persistent_disk, expected_type=type_hints["gce_persistent_disk"])
+            check_type(argname="argument glusterfs", value=glusterfs, expected_type=type_hints["glusterfs"])
+            check_type(argname="argument host_path", value=host_path, expected_type=type_hints["host_path"])
+            check_type(argname="argument iscsi", value=iscsi, expected_type=type_hints["iscsi"])
+            check_type(argname="argument local", value=local, expected_type=type_hints["local"])
+            check_type(argname="argument mount_options", value=mount_options, expected_type=type_hints["mount_options"])
+            check_type(argname="argument nfs", value=nfs, expected_type=type_hints["nfs"])
+            check_type(argname="argument node_affinity", value=node_affinity, expected_type=type_hints["node_affinity"])
+            check_type(argname="argument persistent_volume_reclaim_policy", value=persistent_volume_reclaim_policy, expected_type=type_hints["persistent_volume_reclaim_policy"])
+            check_type(argname="argument photon_persistent_disk", value=photon_persistent_disk, expected_type=type_hints["photon_persistent_disk"])
+            check_type(argname="argument portworx_volume", value=portworx_volume, expected_type=type_hints["portworx_volume"])
+            check_type(argname="argument quobyte", value=quobyte, expected_type=type_hints["quobyte"])
+            check_type(argname="argument rbd", value=rbd, expected_type=type_hints["rbd"])
+            check_type(argname="argument scale_io", value=scale_io, expected_type=type_hints["scale_io"])
+            check_type(argname="argument storage_class_name", value=storage_class_name, expected_type=type_hints["storage_class_name"])
+            check_type(argname="argument storageos", value=storageos, expected_type=type_hints["storageos"])
+            check_type(argname="argument volume_mode", value=volume_mode, expected_type=type_hints["volume_mode"])
+            check_type(argname="argument vsphere_volume", value=vsphere_volume, expected_type=type_hints["vsphere_volume"])
+        self._value_access_modes = access_modes
+        self._value_aws_elastic_block_store = aws_elastic_block_store
+        self._value_azure_disk = azure_disk
+        self._value_azure_file = azure_file
+        self._value_capacity = capacity
+        self._value_cephfs = cephfs
+        self._value_cinder = cinder
+        self._value_claim_ref = claim_ref
+        self._value_csi = csi
+        self._value_fc = fc
+        self._value_flex_volume = flex_volume
+        self._value_flocker = flocker
+        self._value_gce_persistent_disk = gce_persistent_disk
+        self._value_glusterfs = glusterfs
+        self._value_host_path = host_path
+        self._value_iscsi = iscsi
+        self._value_local = local
+        self._value_mount_options = mount_options
+        self._value_nfs = nfs
+        self._value_node_affinity = node_affinity
+        self._value_persistent_volume_reclaim_policy = persistent_volume_reclaim_policy
+        self._value_photon_persistent_disk = photon_persistent_disk
+        self._value_portworx_volume = portworx_volume
+        self._value_quobyte = quobyte
+        self._value_rbd = rbd
+        self._value_scale_io = scale_io
+        self._value_storage_class_name = storage_class_name
+        self._value_storageos = storageos
+        self._value_volume_mode = volume_mode
+        self._value_vsphere_volume = vsphere_volume
+
+    @builtins.property
+    def access_modes(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''accessModes contains all ways the volume can be mounted.
+
+        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#accessModes
+        '''
+        result = self._value_access_modes
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def aws_elastic_block_store(
+        self,
+    ) -> typing.Optional[AwsElasticBlockStoreVolumeSource]:
+        '''awsElasticBlockStore represents an AWS Disk resource that is attached to a kubelet's host machine and then exposed to the pod.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#awsElasticBlockStore
+        '''
+        result = self._value_aws_elastic_block_store
+        return typing.cast(typing.Optional[AwsElasticBlockStoreVolumeSource], result)
+
+    @builtins.property
+    def azure_disk(self) -> typing.Optional[AzureDiskVolumeSource]:
+        '''azureDisk represents an Azure Data Disk mount on the host and bind mount to the pod.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#azureDisk
+        '''
+        result = self._value_azure_disk
+        return typing.cast(typing.Optional[AzureDiskVolumeSource], result)
+
+    @builtins.property
+    def azure_file(self) -> typing.Optional[AzureFilePersistentVolumeSource]:
+        '''azureFile represents an Azure File Service mount on the host and bind mount to the pod.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#azureFile
+        '''
+        result = self._value_azure_file
+        return typing.cast(typing.Optional[AzureFilePersistentVolumeSource], result)
+
+    @builtins.property
+    def capacity(self) -> typing.Optional[typing.Mapping[builtins.str, "Quantity"]]:
+        '''capacity is the description of the persistent volume's resources and capacity.
+
+        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#capacity
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#capacity
+        '''
+        result = self._value_capacity
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "Quantity"]], result)
+
+    @builtins.property
+    def cephfs(self) -> typing.Optional[CephFsPersistentVolumeSource]:
+        '''cephFS represents a Ceph FS mount on the host that shares a pod's lifetime.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#cephfs
+        '''
+        result = self._value_cephfs
+        return typing.cast(typing.Optional[CephFsPersistentVolumeSource], result)
+
+    @builtins.property
+    def cinder(self) -> typing.Optional[CinderPersistentVolumeSource]:
+        '''cinder represents a cinder volume attached and mounted on kubelets host machine.
+
+        More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#cinder
+        '''
+        result = self._value_cinder
+        return typing.cast(typing.Optional[CinderPersistentVolumeSource], result)
+
+    @builtins.property
+    def claim_ref(self) -> typing.Optional[ObjectReference]:
+        '''claimRef is part of a bi-directional binding between PersistentVolume and PersistentVolumeClaim.
+
+        Expected to be non-nil when bound. claim.VolumeName is the authoritative bind between PV and PVC. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#binding
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#claimRef
+        '''
+        result = self._value_claim_ref
+        return typing.cast(typing.Optional[ObjectReference], result)
+
+    @builtins.property
+    def csi(self) -> typing.Optional[CsiPersistentVolumeSource]:
+        '''csi represents storage that is handled by an external CSI driver (Beta feature).
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#csi
+        '''
+        result = self._value_csi
+        return typing.cast(typing.Optional[CsiPersistentVolumeSource], result)
+
+    @builtins.property
+    def fc(self) -> typing.Optional[FcVolumeSource]:
+        '''fc represents a Fibre Channel resource that is attached to a kubelet's host machine and then exposed to the pod.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#fc
+        '''
+        result = self._value_fc
+        return typing.cast(typing.Optional[FcVolumeSource], result)
+
+    @builtins.property
+    def flex_volume(self) -> typing.Optional[FlexPersistentVolumeSource]:
+        '''flexVolume represents a generic volume resource that is provisioned/attached using an exec based plugin.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#flexVolume
+        '''
+        result = self._value_flex_volume
+        return typing.cast(typing.Optional[FlexPersistentVolumeSource], result)
+
+    @builtins.property
+    def flocker(self) -> typing.Optional[FlockerVolumeSource]:
+        '''flocker represents a Flocker volume attached to a kubelet's host machine and exposed to the pod for its usage.
+
+        This depends on the Flocker control service being running
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#flocker
+        '''
+        result = self._value_flocker
+        return typing.cast(typing.Optional[FlockerVolumeSource], result)
+
+    @builtins.property
+    def gce_persistent_disk(self) -> typing.Optional[GcePersistentDiskVolumeSource]:
+        '''gcePersistentDisk represents a GCE Disk resource that is attached to a kubelet's host machine and then exposed to the pod.
+
+        Provisioned by an admin. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#gcePersistentDisk
+        '''
+        result = self._value_gce_persistent_disk
+        return typing.cast(typing.Optional[GcePersistentDiskVolumeSource], result)
+
+    @builtins.property
+    def glusterfs(self) -> typing.Optional[GlusterfsPersistentVolumeSource]:
+        '''glusterfs represents a Glusterfs volume that is attached to a host and exposed to the pod.
+
+        Provisioned by an admin. More info: https://examples.k8s.io/volumes/glusterfs/README.md
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#glusterfs
+        '''
+        result = self._value_glusterfs
+        return typing.cast(typing.Optional[GlusterfsPersistentVolumeSource], result)
+
+    @builtins.property
+    def host_path(self) -> typing.Optional[HostPathVolumeSource]:
+        '''hostPath represents a directory on the host.
+
+        Provisioned by a developer or tester. This is useful for single-node development and testing only! On-host storage is not supported in any way and WILL NOT WORK in a multi-node cluster. More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#hostPath
+        '''
+        result = self._value_host_path
+        return typing.cast(typing.Optional[HostPathVolumeSource], result)
+
+    @builtins.property
+    def iscsi(self) -> typing.Optional[IscsiPersistentVolumeSource]:
+        '''iscsi represents an ISCSI Disk resource that is attached to a kubelet's host machine and then exposed to the pod.
+
+        Provisioned by an admin.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#iscsi
+        '''
+        result = self._value_iscsi
+        return typing.cast(typing.Optional[IscsiPersistentVolumeSource], result)
+
+    @builtins.property
+    def local(self) -> typing.Optional[LocalVolumeSource]:
+        '''local represents directly-attached storage with node affinity.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#local
+        '''
+        result = self._value_local
+        return typing.cast(typing.Optional[LocalVolumeSource], result)
+
+    @builtins.property
+    def mount_options(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''mountOptions is the list of mount options, e.g. ["ro", "soft"]. Not validated - mount will simply fail if one is invalid. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes/#mount-options.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#mountOptions
+        '''
+        result = self._value_mount_options
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def nfs(self) -> typing.Optional[NfsVolumeSource]:
+        '''nfs represents an NFS mount on the host.
+
+        Provisioned by an admin. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#nfs
+        '''
+        result = self._value_nfs
+        return typing.cast(typing.Optional[NfsVolumeSource], result)
+
+    @builtins.property
+    def node_affinity(self) -> typing.Optional["VolumeNodeAffinity"]:
+        '''nodeAffinity defines constraints that limit what nodes this volume can be accessed from.
+
+        This field influences the scheduling of pods that use this volume.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#nodeAffinity
+        '''
+        result = self._value_node_affinity
+        return typing.cast(typing.Optional["VolumeNodeAffinity"], result)
+
+    @builtins.property
+    def persistent_volume_reclaim_policy(self) -> typing.Optional[builtins.str]:
+        '''persistentVolumeReclaimPolicy defines what happens to a persistent volume when released from its claim.
+
+        Valid options are Retain (default for manually created PersistentVolumes), Delete (default for dynamically provisioned PersistentVolumes), and Recycle (deprecated). Recycle must be supported by the volume plugin underlying this PersistentVolume. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#reclaiming
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#persistentVolumeReclaimPolicy
+        '''
+        result = self._value_persistent_volume_reclaim_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def photon_persistent_disk(
+        self,
+    ) -> typing.Optional["PhotonPersistentDiskVolumeSource"]:
+        '''photonPersistentDisk represents a PhotonController persistent disk attached and mounted on kubelets host machine.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#photonPersistentDisk
+        '''
+        result = self._value_photon_persistent_disk
+        return typing.cast(typing.Optional["PhotonPersistentDiskVolumeSource"], result)
+
+    @builtins.property
+    def portworx_volume(self) -> typing.Optional["PortworxVolumeSource"]:
+        '''portworxVolume represents a portworx volume attached and mounted on kubelets host machine.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#portworxVolume
+        '''
+        result = self._value_portworx_volume
+        return typing.cast(typing.Optional["PortworxVolumeSource"], result)
+
+    @builtins.property
+    def quobyte(self) -> typing.Optional["QuobyteVolumeSource"]:
+        '''quobyte represents a Quobyte mount on the host that shares a pod's lifetime.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#quobyte
+        '''
+        result = self._value_quobyte
+        return typing.cast(typing.Optional["QuobyteVolumeSource"], result)
+
+    @builtins.property
+    def rbd(self) -> typing.Optional["RbdPersistentVolumeSource"]:
+        '''rbd represents a Rados Block Device mount on the host that shares a pod's lifetime.
+
+        More info: https://examples.k8s.io/volumes/rbd/README.md
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#rbd
+        '''
+        result = self._value_rbd
+        return typing.cast(typing.Optional["RbdPersistentVolumeSource"], result)
+
+    @builtins.property
+    def scale_io(self) -> typing.Optional["ScaleIoPersistentVolumeSource"]:
+        '''scaleIO represents a ScaleIO persistent volume attached and mounted on Kubernetes nodes.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#scaleIO
+        '''
+        result = self._value_scale_io
+        return typing.cast(typing.Optional["ScaleIoPersistentVolumeSource"], result)
+
+    @builtins.property
+    def storage_class_name(self) -> typing.Optional[builtins.str]:
+        '''storageClassName is the name of StorageClass to which this persistent volume belongs.
+
+        Empty value means that this volume does not belong to any StorageClass.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#storageClassName
+        '''
+        result = self._value_storage_class_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def storageos(self) -> typing.Optional["StorageOsPersistentVolumeSource"]:
+        '''storageOS represents a StorageOS volume that is attached to the kubelet's host machine and mounted into the pod More info: https://examples.k8s.io/volumes/storageos/README.md.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#storageos
+        '''
+        result = self._value_storageos
+        return typing.cast(typing.Optional["StorageOsPersistentVolumeSource"], result)
+
+    @builtins.property
+    def volume_mode(self) -> typing.Optional[builtins.str]:
+        '''volumeMode defines if a volume is intended to be used with a formatted filesystem or to remain in raw block state.
+
+        Value of Filesystem is implied when not included in spec.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#volumeMode
+        '''
+        result = self._value_volume_mode
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def vsphere_volume(self) -> typing.Optional["VsphereVirtualDiskVolumeSource"]:
+        '''vsphereVolume represents a vSphere volume attached and mounted on kubelets host machine.
+
+        :schema: io.k8s.api.core.v1.PersistentVolumeSpec#vsphereVolume
+        '''
+        result = self._value_vsphere_volume
+        return typing.cast(typing.Optional["VsphereVirtualDiskVolumeSource"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_access_modes is not None:
+            values["access_modes"] = self._value_access_modes
+        if self._value_aws_elastic_block_store is not None:
+            values["aws_elastic_block_store"] = self._value_aws_elastic_block_store
+        if self._value_azure_disk is not None:
+            values["azure_disk"] = self._value_azure_disk
+        if self._value_azure_file is not None:
+            values["azure_file"] = self._value_azure_file
+        if self._value_capacity is not None:
+            values["capacity"] = self._value_capacity
+        if self._value_cephfs is not None:
+            values["cephfs"] = self._value_cephfs
+        if self._value_cinder is not None:
+            values["cinder"] = self._value_cinder
+        if self._value_claim_ref is not None:
+            values["claim_ref"] = self._value_claim_ref
+        if self._value_csi is not None:
+            values["csi"] = self._value_csi
+        if self._value_fc is not None:
+            values["fc"] = self._value_fc
+        if self._value_flex_volume is not None:
+            values["flex_volume"] = self._value_flex_volume
+        if self._value_flocker is not None:
+            values["flocker"] = self._value_flocker
+        if self._value_gce_persistent_disk is not None:
+            values["gce_persistent_disk"] = self._value_gce_persistent_disk
+        if self._value_glusterfs is not None:
+            values["glusterfs"] = self._value_glusterfs
+        if self._value_host_path is not None:
+            values["host_path"] = self._value_host_path
+        if self._value_iscsi is not None:
+            values["iscsi"] = self._value_iscsi
+        if self._value_local is not None:
+            values["local"] = self._value_local
+        if self._value_mount_options is not None:
+            values["mount_options"] = self._value_mount_options
+        if self._value_nfs is not None:
+            values["nfs"] = self._value_nfs
+        if self._value_node_affinity is not None:
+            values["node_affinity"] = self._value_node_affinity
+        if self._value_persistent_volume_reclaim_policy is not None:
+            values["persistent_volume_reclaim_policy"] = self._value_persistent_volume_reclaim_policy
+        if self._value_photon_persistent_disk is not None:
+            values["photon_persistent_disk"] = self._value_photon_persistent_disk
+        if self._value_portworx_volume is not None:
+            values["portworx_volume"] = self._value_portworx_volume
+        if self._value_quobyte is not None:
+            values["quobyte"] = self._value_quobyte
+        if self._value_rbd is not None:
+            values["rbd"] = self._value_rbd
+        if self._value_scale_io is not None:
+            values["scale_io"] = self._value_scale_io
+        if self._value_storage_class_name is not None:
+            values["storage_class_name"] = self._value_storage_class_name
+        if self._value_storageos is not None:
+            values["storageos"] = self._value_storageos
+        if self._value_volume_mode is not None:
+            values["volume_mode"] = self._value_volume_mode
+        if self._value_vsphere_volume is not None:
+            values["vsphere_volume"] = self._value_vsphere_volume
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PersistentVolumeSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__35aff97a067cf96c268b843a969ca0b9162e0690f21670fdecba69ea27a470fb(
+    *,
+    access_modes: typing.Optional[typing.Sequence[builtins.str]] = None,
+    aws_elastic_block_store: typing.Optional[typing.Union[AwsElasticBlockStoreVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    azure_disk: typing.Optional[typing.Union[AzureDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    azure_file: typing.Optional[typing.Union[AzureFilePersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    capacity: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    cephfs: typing.Optional[typing.Union[CephFsPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    cinder: typing.Optional[typing.Union[CinderPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    claim_ref: typing.Optional[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    csi: typing.Optional[typing.Union[CsiPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    fc: typing.Optional[typing.Union[FcVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    flex_volume: typing.Optional[typing.Union[FlexPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    flocker: typing.Optional[typing.Union[FlockerVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    gce_persistent_disk: typing.Optional[typing.Union[GcePersistentDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    glusterfs: typing.Optional[typing.Union[GlusterfsPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    host_path: typing.Optional[typing.Union[HostPathVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    iscsi: typing.Optional[typing.Union[IscsiPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    local: typing.Optional[typing.Union[LocalVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    mount_options: typing.Optional[typing.Sequence[builtins.str]] = None,
+    nfs: typing.Optional[typing.Union[NfsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    node_affinity: typing.Optional[typing.Union[VolumeNodeAffinity, typing.Dict[builtins.str, typing.Any]]] = None,
+    persistent_volume_reclaim_policy: typing.Optional[builtins.str] = None,
+    photon_persistent_disk: typing.Optional[typing.Union[PhotonPersistentDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    portworx_volume: typing.Optional[typing.Union[PortworxVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    quobyte: typing.Optional[typing.Union[QuobyteVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    rbd: typing.Optional[typing.Union[RbdPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    scale_io: typing.Optional[typing.Union[ScaleIoPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    storage_class_name: typing.Optional[builtins.str] = None,
+    storageos: typing.Optional[typing.Union[StorageOsPersistentVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    volume_mode: typing.Optional[builtins.str] = None,
+    vsphere_volume: typing.Optional[typing.Union[VsphereVirtualDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,99 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.PhotonPersistentDiskVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"pd_id": "pdId", "fs_type": "fsType"},
+)
+class PhotonPersistentDiskVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_pd_id",
+        "_value_fs_type",
+    )
+
+    def __init__(
+        self,
+        *,
+        pd_id: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a Photon Controller persistent disk resource.
+
+        :param pd_id: pdID is the ID that identifies Photon Controller persistent disk.
+        :param fs_type: fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+
+        :schema: io.k8s.api.core.v1.PhotonPersistentDiskVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7b0be95f372a9aa5db6fdac38282cc046204e7f43c46d9459c585522c86b2f39)
+            check_type(argname="argument pd_id", value=pd_id, expected_type=type_hints["pd_id"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+        self._value_pd_id = pd_id
+        self._value_fs_type = fs_type
+
+    @builtins.property
+    def pd_id(self) -> builtins.str:
+        '''pdID is the ID that identifies Photon Controller persistent disk.
+
+        :schema: io.k8s.api.core.v1.PhotonPersistentDiskVolumeSource#pdID
+        '''
+        result = self._value_pd_id
+        assert result is not None, "Required property 'pd_id' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the filesystem type to mount.
+
+        Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+
+        :schema: io.k8s.api.core.v1.PhotonPersistentDiskVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "pd_id": self._value_pd_id,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PhotonPersistentDiskVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7b0be95f372a9aa5db6fdac38282cc046204e7f43c46d9459c585522c86b2f39(
+    *,
+    pd_id: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
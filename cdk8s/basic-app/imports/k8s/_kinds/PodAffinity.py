@@ -0,0 +1,109 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .PodAffinityTerm import PodAffinityTerm
+from .WeightedPodAffinityTerm import WeightedPodAffinityTerm
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodAffinity",
+    jsii_struct_bases=[],
+    name_mapping={
+        "preferred_during_scheduling_ignored_during_execution": "preferredDuringSchedulingIgnoredDuringExecution",
+        "required_during_scheduling_ignored_during_execution": "requiredDuringSchedulingIgnoredDuringExecution",
+    },
+)
+class PodAffinity(_base.Struct):
+    __slots__ = (
+        "_value_preferred_during_scheduling_ignored_during_execution",
+        "_value_required_during_scheduling_ignored_during_execution",
+    )
+
+    def __init__(
+        self,
+        *,
+        preferred_during_scheduling_ignored_during_execution: typing.Optional[typing.Sequence[typing.Union["WeightedPodAffinityTerm", typing.Dict[builtins.str, typing.Any]]]] = None,
+        required_during_scheduling_ignored_during_execution: typing.Optional[typing.Sequence[typing.Union["PodAffinityTerm", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''Pod affinity is a group of inter pod affinity scheduling rules.
+
+        :param preferred_during_scheduling_ignored_during_execution: The scheduler will prefer to schedule pods to nodes that satisfy the affinity expressions specified by this field, but it may choose a node that violates one or more of the expressions. The node that is most preferred is the one with the greatest sum of weights, i.e. for each node that meets all of the scheduling requirements (resource request, requiredDuringScheduling affinity expressions, etc.), compute a sum by iterating through the elements of this field and adding "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the node(s) with the highest sum are the most preferred.
+        :param required_during_scheduling_ignored_during_execution: If the affinity requirements specified by this field are not met at scheduling time, the pod will not be scheduled onto the node. If the affinity requirements specified by this field cease to be met at some point during pod execution (e.g. due to a pod label update), the system may or may not try to eventually evict the pod from its node. When there are multiple elements, the lists of nodes corresponding to each podAffinityTerm are intersected, i.e. all terms must be satisfied.
+
+        :schema: io.k8s.api.core.v1.PodAffinity
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__0830de33ed62413d27b090c2218c86cadcbd37738b116d98ce30ae82e8676733)
+            check_type(argname="argument preferred_during_scheduling_ignored_during_execution", value=preferred_during_scheduling_ignored_during_execution, expected_type=type_hints["preferred_during_scheduling_ignored_during_execution"])
+            check_type(argname="argument required_during_scheduling_ignored_during_execution", value=required_during_scheduling_ignored_during_execution, expected_type=type_hints["required_during_scheduling_ignored_during_execution"])
+        self._value_preferred_during_scheduling_ignored_during_execution = preferred_during_scheduling_ignored_during_execution
+        self._value_required_during_scheduling_ignored_during_execution = required_during_scheduling_ignored_during_execution
+
+    @builtins.property
+    def preferred_during_scheduling_ignored_during_execution(
+        self,
+    ) -> typing.Optional[typing.List["WeightedPodAffinityTerm"]]:
+        '''The scheduler will prefer to schedule pods to nodes that satisfy the affinity expressions specified by this field, but it may choose a node that violates one or more of the expressions.
+
+        The node that is most preferred is the one with the greatest sum of weights, i.e. for each node that meets all of the scheduling requirements (resource request, requiredDuringScheduling affinity expressions, etc.), compute a sum by iterating through the elements of this field and adding "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the node(s) with the highest sum are the most preferred.
+
+        :schema: io.k8s.api.core.v1.PodAffinity#preferredDuringSchedulingIgnoredDuringExecution
+        '''
+        result = self._value_preferred_during_scheduling_ignored_during_execution
+        return typing.cast(typing.Optional[typing.List["WeightedPodAffinityTerm"]], result)
+
+    @builtins.property
+    def required_during_scheduling_ignored_during_execution(
+        self,
+    ) -> typing.Optional[typing.List["PodAffinityTerm"]]:
+        '''If the affinity requirements specified by this field are not met at scheduling time, the pod will not be scheduled onto the node.
+
+        If the affinity requirements specified by this field cease to be met at some point during pod execution (e.g. due to a pod label update), the system may or may not try to eventually evict the pod from its node. When there are multiple elements, the lists of nodes corresponding to each podAffinityTerm are intersected, i.e. all terms must be satisfied.
+
+        :schema: io.k8s.api.core.v1.PodAffinity#requiredDuringSchedulingIgnoredDuringExecution
+        '''
+        result = self._value_required_during_scheduling_ignored_during_execution
+        return typing.cast(typing.Optional[typing.List["PodAffinityTerm"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_preferred_during_scheduling_ignored_during_execution is not None:
+            values["preferred_during_scheduling_ignored_during_execution"] = self._value_preferred_during_scheduling_ignored_during_execution
+        if self._value_required_during_scheduling_ignored_during_execution is not None:
+            values["required_during_scheduling_ignored_during_execution"] = self._value_required_during_scheduling_ignored_during_execution
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodAffinity(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__0830de33ed62413d27b090c2218c86cadcbd37738b116d98ce30ae82e8676733(
+    *,
+    preferred_during_scheduling_ignored_during_execution: typing.Optional[typing.Sequence[typing.Union[WeightedPodAffinityTerm, typing.Dict[builtins.str, typing.Any]]]] = None,
+    required_during_scheduling_ignored_during_execution: typing.Optional[typing.Sequence[typing.Union[PodAffinityTerm, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,147 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodAffinityTerm",
+    jsii_struct_bases=[],
+    name_mapping={
+        "topology_key": "topologyKey",
+        "label_selector": "labelSelector",
+        "namespaces": "namespaces",
+        "namespace_selector": "namespaceSelector",
+    },
+)
+class PodAffinityTerm(_base.Struct):
+    __slots__ = (
+        "_value_topology_key",
+        "_value_label_selector",
+        "_value_namespaces",
+        "_value_namespace_selector",
+    )
+
+    def __init__(
+        self,
+        *,
+        topology_key: builtins.str,
+        label_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+        namespaces: typing.Optional[typing.Sequence[builtins.str]] = None,
+        namespace_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Defines a set of pods (namely those matching the labelSelector relative to the given namespace(s)) that this pod should be co-located (affinity) or not co-located (anti-affinity) with, where co-located is defined as running on a node whose value of the label with key  matches that of any node on which a pod of the set of pods is running.
+
+        :param topology_key: This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching the labelSelector in the specified namespaces, where co-located is defined as running on a node whose value of the label with key topologyKey matches that of any node on which any of the selected pods is running. Empty topologyKey is not allowed.
+        :param label_selector: A label query over a set of resources, in this case pods.
+        :param namespaces: namespaces specifies a static list of namespace names that the term applies to. The term is applied to the union of the namespaces listed in this field and the ones selected by namespaceSelector. null or empty namespaces list and null namespaceSelector means "this pod's namespace".
+        :param namespace_selector: A label query over the set of namespaces that the term applies to. The term is applied to the union of the namespaces selected by this field and the ones listed in the namespaces field. null selector and null or empty namespaces list means "this pod's namespace". An empty selector ({}) matches all namespaces.
+
+        :schema: io.k8s.api.core.v1.PodAffinityTerm
+        '''
+        if isinstance(label_selector, dict):
+            label_selector = LabelSelector(**label_selector)
+        if isinstance(namespace_selector, dict):
+            namespace_selector = LabelSelector(**namespace_selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__063b73cb46562ef4af361b17cfc211f3c56960b9052f045d67104026b7d98e93)
+            check_type(argname="argument topology_key", value=topology_key, expected_type=type_hints["topology_key"])
+            check_type(argname="argument label_selector", value=label_selector, expected_type=type_hints["label_selector"])
+            check_type(argname="argument namespaces", value=namespaces, expected_type=type_hints["namespaces"])
+            check_type(argname="argument namespace_selector", value=namespace_selector, expected_type=type_hints["namespace_selector"])
+        self._value_topology_key = topology_key
+        self._value_label_selector = label_selector
+        self._value_namespaces = namespaces
+        self._value_namespace_selector = namespace_selector
+
+    @builtins.property
+    def topology_key(self) -> builtins.str:
+        '''This pod should be co-located (affinity) or not co-located (anti-affinity) with the pods matching the labelSelector in the specified namespaces, where co-located is defined as running on a node whose value of the label with key topologyKey matches that of any node on which any of the selected pods is running.
+
+        Empty topologyKey is not allowed.
+
+        :schema: io.k8s.api.core.v1.PodAffinityTerm#topologyKey
+        '''
+        result = self._value_topology_key
+        assert result is not None, "Required property 'topology_key' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def label_selector(self) -> typing.Optional[LabelSelector]:
+        '''A label query over a set of resources, in this case pods.
+
+        :schema: io.k8s.api.core.v1.PodAffinityTerm#labelSelector
+        '''
+        result = self._value_label_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def namespaces(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''namespaces specifies a static list of namespace names that the term applies to.
+
+        The term is applied to the union of the namespaces listed in this field and the ones selected by namespaceSelector. null or empty namespaces list and null namespaceSelector means "this pod's namespace".
+
+        :schema: io.k8s.api.core.v1.PodAffinityTerm#namespaces
+        '''
+        result = self._value_namespaces
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def namespace_selector(self) -> typing.Optional[LabelSelector]:
+        '''A label query over the set of namespaces that the term applies to.
+
+        The term is applied to the union of the namespaces selected by this field and the ones listed in the namespaces field. null selector and null or empty namespaces list means "this pod's namespace". An empty selector ({}) matches all namespaces.
+
+        :schema: io.k8s.api.core.v1.PodAffinityTerm#namespaceSelector
+        '''
+        result = self._value_namespace_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "topology_key": self._value_topology_key,
+        }
+        if self._value_label_selector is not None:
+            values["label_selector"] = self._value_label_selector
+        if self._value_namespaces is not None:
+            values["namespaces"] = self._value_namespaces
+        if self._value_namespace_selector is not None:
+            values["namespace_selector"] = self._value_namespace_selector
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodAffinityTerm(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__063b73cb46562ef4af361b17cfc211f3c56960b9052f045d67104026b7d98e93(
+    *,
+    topology_key: builtins.str,
+    label_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    namespaces: typing.Optional[typing.Sequence[builtins.str]] = None,
+    namespace_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
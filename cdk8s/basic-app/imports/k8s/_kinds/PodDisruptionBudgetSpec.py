@@ -0,0 +1,123 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IntOrString import IntOrString
+from .LabelSelector import LabelSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodDisruptionBudgetSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "max_unavailable": "maxUnavailable",
+        "min_available": "minAvailable",
+        "selector": "selector",
+    },
+)
+class PodDisruptionBudgetSpec(_base.Struct):
+    __slots__ = (
+        "_value_max_unavailable",
+        "_value_min_available",
+        "_value_selector",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_unavailable: typing.Optional[IntOrString] = None,
+        min_available: typing.Optional[IntOrString] = None,
+        selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''PodDisruptionBudgetSpec is a description of a PodDisruptionBudget.
+
+        :param max_unavailable: An eviction is allowed if at most "maxUnavailable" pods selected by "selector" are unavailable after the eviction, i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions by specifying 0. This is a mutually exclusive setting with "minAvailable".
+        :param min_available: An eviction is allowed if at least "minAvailable" pods selected by "selector" will still be available after the eviction, i.e. even in the absence of the evicted pod. So for example you can prevent all voluntary evictions by specifying "100%".
+        :param selector: Label query over pods whose evictions are managed by the disruption budget. A null selector will match no pods, while an empty ({}) selector will select all pods within the namespace.
+
+        :schema: io.k8s.api.policy.v1.PodDisruptionBudgetSpec
+        '''
+        if isinstance(selector, dict):
+            selector = LabelSelector(**selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__fcf659f51d3ad1ddb70e76f4550c401ae77b9bed37d6671e9b1895983dbc2bc6)
+            check_type(argname="argument max_unavailable", value=max_unavailable, expected_type=type_hints["max_unavailable"])
+            check_type(argname="argument min_available", value=min_available, expected_type=type_hints["min_available"])
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+        self._value_max_unavailable = max_unavailable
+        self._value_min_available = min_available
+        self._value_selector = selector
+
+    @builtins.property
+    def max_unavailable(self) -> typing.Optional[IntOrString]:
+        '''An eviction is allowed if at most "maxUnavailable" pods selected by "selector" are unavailable after the eviction, i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions by specifying 0. This is a mutually exclusive setting with "minAvailable".
+
+        :schema: io.k8s.api.policy.v1.PodDisruptionBudgetSpec#maxUnavailable
+        '''
+        result = self._value_max_unavailable
+        return typing.cast(typing.Optional[IntOrString], result)
+
+    @builtins.property
+    def min_available(self) -> typing.Optional[IntOrString]:
+        '''An eviction is allowed if at least "minAvailable" pods selected by "selector" will still be available after the eviction, i.e. even in the absence of the evicted pod.  So for example you can prevent all voluntary evictions by specifying "100%".
+
+        :schema: io.k8s.api.policy.v1.PodDisruptionBudgetSpec#minAvailable
+        '''
+        result = self._value_min_available
+        return typing.cast(typing.Optional[IntOrString], result)
+
+    @builtins.property
+    def selector(self) -> typing.Optional[LabelSelector]:
+        '''Label query over pods whose evictions are managed by the disruption budget.
+
+        A null selector will match no pods, while an empty ({}) selector will select all pods within the namespace.
+
+        :schema: io.k8s.api.policy.v1.PodDisruptionBudgetSpec#selector
+        '''
+        result = self._value_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_max_unavailable is not None:
+            values["max_unavailable"] = self._value_max_unavailable
+        if self._value_min_available is not None:
+            values["min_available"] = self._value_min_available
+        if self._value_selector is not None:
+            values["selector"] = self._value_selector
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodDisruptionBudgetSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__fcf659f51d3ad1ddb70e76f4550c401ae77b9bed37d6671e9b1895983dbc2bc6(
+    *,
+    max_unavailable: typing.Optional[IntOrString] = None,
+    min_available: typing.Optional[IntOrString] = None,
+    selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,124 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .PodDnsConfigOption import PodDnsConfigOption
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodDnsConfig",
+    jsii_struct_bases=[],
+    name_mapping={
+        "nameservers": "nameservers",
+        "options": "options",
+        "searches": "searches",
+    },
+)
+class PodDnsConfig(_base.Struct):
+    __slots__ = (
+        "_value_nameservers",
+        "_value_options",
+        "_value_searches",
+    )
+
+    def __init__(
+        self,
+        *,
+        nameservers: typing.Optional[typing.Sequence[builtins.str]] = None,
+        options: typing.Optional[typing.Sequence[typing.Union["PodDnsConfigOption", typing.Dict[builtins.str, typing.Any]]]] = None,
+        searches: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''PodDNSConfig defines the DNS parameters of a pod in addition to those generated from DNSPolicy.
+
+        :param nameservers: A list of DNS name server IP addresses. This will be appended to the base nameservers generated from DNSPolicy. Duplicated nameservers will be removed.
+        :param options: A list of DNS resolver options. This will be merged with the base options generated from DNSPolicy. Duplicated entries will be removed. Resolution options given in Options will override those that appear in the base DNSPolicy.
+        :param searches: A list of DNS search domains for host-name lookup. This will be appended to the base search paths generated from DNSPolicy. Duplicated search paths will be removed.
+
+        :schema: io.k8s.api.core.v1.PodDNSConfig
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__8c30b93db014abaf8ed6b5187f791e1155288ba850e120d30272e029498d46a2)
+            check_type(argname="argument nameservers", value=nameservers, expected_type=type_hints["nameservers"])
+            check_type(argname="argument options", value=options, expected_type=type_hints["options"])
+            check_type(argname="argument searches", value=searches, expected_type=type_hints["searches"])
+        self._value_nameservers = nameservers
+        self._value_options = options
+        self._value_searches = searches
+
+    @builtins.property
+    def nameservers(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''A list of DNS name server IP addresses.
+
+        This will be appended to the base nameservers generated from DNSPolicy. Duplicated nameservers will be removed.
+
+        :schema: io.k8s.api.core.v1.PodDNSConfig#nameservers
+        '''
+        result = self._value_nameservers
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def options(self) -> typing.Optional[typing.List["PodDnsConfigOption"]]:
+        '''A list of DNS resolver options.
+
+        This will be merged with the base options generated from DNSPolicy. Duplicated entries will be removed. Resolution options given in Options will override those that appear in the base DNSPolicy.
+
+        :schema: io.k8s.api.core.v1.PodDNSConfig#options
+        '''
+        result = self._value_options
+        return typing.cast(typing.Optional[typing.List["PodDnsConfigOption"]], result)
+
+    @builtins.property
+    def searches(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''A list of DNS search domains for host-name lookup.
+
+        This will be appended to the base search paths generated from DNSPolicy. Duplicated search paths will be removed.
+
+        :schema: io.k8s.api.core.v1.PodDNSConfig#searches
+        '''
+        result = self._value_searches
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_nameservers is not None:
+            values["nameservers"] = self._value_nameservers
+        if self._value_options is not None:
+            values["options"] = self._value_options
+        if self._value_searches is not None:
+            values["searches"] = self._value_searches
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodDnsConfig(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__8c30b93db014abaf8ed6b5187f791e1155288ba850e120d30272e029498d46a2(
+    *,
+    nameservers: typing.Optional[typing.Sequence[builtins.str]] = None,
+    options: typing.Optional[typing.Sequence[typing.Union[PodDnsConfigOption, typing.Dict[builtins.str, typing.Any]]]] = None,
+    searches: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
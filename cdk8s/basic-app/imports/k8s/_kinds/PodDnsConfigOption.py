@@ -0,0 +1,95 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodDnsConfigOption",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name", "value": "value"},
+)
+class PodDnsConfigOption(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_value",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: typing.Optional[builtins.str] = None,
+        value: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''PodDNSConfigOption defines DNS resolver options of a pod.
+
+        :param name: Required.
+        :param value: 
+
+        :schema: io.k8s.api.core.v1.PodDNSConfigOption
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__815fe5aad5ae05289693b717c8d0482e9f0ca6d59c31bed07e76d275fb763759)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument value", value=value, expected_type=type_hints["value"])
+        self._value_name = name
+        self._value_value = value
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Required.
+
+        :schema: io.k8s.api.core.v1.PodDNSConfigOption#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def value(self) -> typing.Optional[builtins.str]:
+        '''
+        :schema: io.k8s.api.core.v1.PodDNSConfigOption#value
+        '''
+        result = self._value_value
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_value is not None:
+            values["value"] = self._value_value
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodDnsConfigOption(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__815fe5aad5ae05289693b717c8d0482e9f0ca6d59c31bed07e76d275fb763759(
+    *,
+    name: typing.Optional[builtins.str] = None,
+    value: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
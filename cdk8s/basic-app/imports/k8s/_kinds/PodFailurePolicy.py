@@ -0,0 +1,83 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .PodFailurePolicyRule import PodFailurePolicyRule
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodFailurePolicy",
+    jsii_struct_bases=[],
+    name_mapping={"rules": "rules"},
+)
+class PodFailurePolicy(_base.Struct):
+    __slots__ = (
+        "_value_rules",
+    )
+
+    def __init__(
+        self,
+        *,
+        rules: typing.Sequence[typing.Union["PodFailurePolicyRule", typing.Dict[builtins.str, typing.Any]]],
+    ) -> None:
+        '''PodFailurePolicy describes how failed pods influence the backoffLimit.
+
+        :param rules: A list of pod failure policy rules. The rules are evaluated in order. Once a rule matches a Pod failure, the remaining of the rules are ignored. When no rule matches the Pod failure, the default handling applies - the counter of pod failures is incremented and it is checked against the backoffLimit. At most 20 elements are allowed.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicy
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7d648d0923526488e7170f574c8a29f5a5121299dee93365c01d1ca343751c04)
+            check_type(argname="argument rules", value=rules, expected_type=type_hints["rules"])
+        self._value_rules = rules
+
+    @builtins.property
+    def rules(self) -> typing.List["PodFailurePolicyRule"]:
+        '''A list of pod failure policy rules.
+
+        The rules are evaluated in order. Once a rule matches a Pod failure, the remaining of the rules are ignored. When no rule matches the Pod failure, the default handling applies - the counter of pod failures is incremented and it is checked against the backoffLimit. At most 20 elements are allowed.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicy#rules
+        '''
+        result = self._value_rules
+        assert result is not None, "Required property 'rules' is missing"
+        return typing.cast(typing.List["PodFailurePolicyRule"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "rules": self._value_rules,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodFailurePolicy(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7d648d0923526488e7170f574c8a29f5a5121299dee93365c01d1ca343751c04(
+    *,
+    rules: typing.Sequence[typing.Union[PodFailurePolicyRule, typing.Dict[builtins.str, typing.Any]]],
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,133 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodFailurePolicyOnExitCodesRequirement",
+    jsii_struct_bases=[],
+    name_mapping={
+        "operator": "operator",
+        "values": "values",
+        "container_name": "containerName",
+    },
+)
+class PodFailurePolicyOnExitCodesRequirement(_base.Struct):
+    __slots__ = (
+        "_value_operator",
+        "_value_values",
+        "_value_container_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        operator: builtins.str,
+        values: typing.Sequence[jsii.Number],
+        container_name: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''PodFailurePolicyOnExitCodesRequirement describes the requirement for handling a failed pod based on its container exit codes.
+
+        In particular, it lookups the .state.terminated.exitCode for each app container and init container status, represented by the .status.containerStatuses and .status.initContainerStatuses fields in the Pod status, respectively. Containers completed with success (exit code 0) are excluded from the requirement check.
+
+        :param operator: Represents the relationship between the container exit code(s) and the specified values. Containers completed with success (exit code 0) are excluded from the requirement check. Possible values are: - In: the requirement is satisfied if at least one container exit code (might be multiple if there are multiple containers not restricted by the 'containerName' field) is in the set of specified values. - NotIn: the requirement is satisfied if at least one container exit code (might be multiple if there are multiple containers not restricted by the 'containerName' field) is not in the set of specified values. Additional values are considered to be added in the future. Clients should react to an unknown operator by assuming the requirement is not satisfied.
+        :param values: Specifies the set of values. Each returned container exit code (might be multiple in case of multiple containers) is checked against this set of values with respect to the operator. The list of values must be ordered and must not contain duplicates. Value '0' cannot be used for the In operator. At least one element is required. At most 255 elements are allowed.
+        :param container_name: Restricts the check for exit codes to the container with the specified name. When null, the rule applies to all containers. When specified, it should match one the container or initContainer names in the pod template.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyOnExitCodesRequirement
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__9156cdbac4d38b9bf3a2fd6d97fb9187f19aa4043a7010b5897b2c0ff19ddb5a)
+            check_type(argname="argument operator", value=operator, expected_type=type_hints["operator"])
+            check_type(argname="argument values", value=values, expected_type=type_hints["values"])
+            check_type(argname="argument container_name", value=container_name, expected_type=type_hints["container_name"])
+        self._value_operator = operator
+        self._value_values = values
+        self._value_container_name = container_name
+
+    @builtins.property
+    def operator(self) -> builtins.str:
+        '''Represents the relationship between the container exit code(s) and the specified values.
+
+        Containers completed with success (exit code 0) are excluded from the requirement check. Possible values are: - In: the requirement is satisfied if at least one container exit code
+        (might be multiple if there are multiple containers not restricted
+        by the 'containerName' field) is in the set of specified values.
+
+        - NotIn: the requirement is satisfied if at least one container exit code
+          (might be multiple if there are multiple containers not restricted
+          by the 'containerName' field) is not in the set of specified values.
+          Additional values are considered to be added in the future. Clients should react to an unknown operator by assuming the requirement is not satisfied.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyOnExitCodesRequirement#operator
+        '''
+        result = self._value_operator
+        assert result is not None, "Required property 'operator' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def values(self) -> typing.List[jsii.Number]:
+        '''Specifies the set of values.
+
+        Each returned container exit code (might be multiple in case of multiple containers) is checked against this set of values with respect to the operator. The list of values must be ordered and must not contain duplicates. Value '0' cannot be used for the In operator. At least one element is required. At most 255 elements are allowed.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyOnExitCodesRequirement#values
+        '''
+        result = self._value_values
+        assert result is not None, "Required property 'values' is missing"
+        return typing.cast(typing.List[jsii.Number], result)
+
+    @builtins.property
+    def container_name(self) -> typing.Optional[builtins.str]:
+        '''Restricts the check for exit codes to the container with the specified name.
+
+        When null, the rule applies to all containers. When specified, it should match one the container or initContainer names in the pod template.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyOnExitCodesRequirement#containerName
+        '''
+        result = self._value_container_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "operator": self._value_operator,
+            "values": self._value_values,
+        }
+        if self._value_container_name is not None:
+            values["container_name"] = self._value_container_name
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodFailurePolicyOnExitCodesRequirement(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__9156cdbac4d38b9bf3a2fd6d97fb9187f19aa4043a7010b5897b2c0ff19ddb5a(
+    *,
+    operator: builtins.str,
+    values: typing.Sequence[jsii.Number],
+    container_name: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
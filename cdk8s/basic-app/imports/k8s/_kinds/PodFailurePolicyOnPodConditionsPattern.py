@@ -0,0 +1,98 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodFailurePolicyOnPodConditionsPattern",
+    jsii_struct_bases=[],
+    name_mapping={"status": "status", "type": "type"},
+)
+class PodFailurePolicyOnPodConditionsPattern(_base.Struct):
+    __slots__ = (
+        "_value_status",
+        "_value_type",
+    )
+
+    def __init__(self, *, status: builtins.str, type: builtins.str) -> None:
+        '''PodFailurePolicyOnPodConditionsPattern describes a pattern for matching an actual pod condition type.
+
+        :param status: Specifies the required Pod condition status. To match a pod condition it is required that the specified status equals the pod condition status. Defaults to True. Default: True.
+        :param type: Specifies the required Pod condition type. To match a pod condition it is required that specified type equals the pod condition type.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyOnPodConditionsPattern
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__749d7e1a80b843779b9d09f3b38a68a3fd1c77026783179dbf25170231c5a720)
+            check_type(argname="argument status", value=status, expected_type=type_hints["status"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+        self._value_status = status
+        self._value_type = type
+
+    @builtins.property
+    def status(self) -> builtins.str:
+        '''Specifies the required Pod condition status.
+
+        To match a pod condition it is required that the specified status equals the pod condition status. Defaults to True.
+
+        :default: True.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyOnPodConditionsPattern#status
+        '''
+        result = self._value_status
+        assert result is not None, "Required property 'status' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''Specifies the required Pod condition type.
+
+        To match a pod condition it is required that specified type equals the pod condition type.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyOnPodConditionsPattern#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "status": self._value_status,
+            "type": self._value_type,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodFailurePolicyOnPodConditionsPattern(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__749d7e1a80b843779b9d09f3b38a68a3fd1c77026783179dbf25170231c5a720(
+    *,
+    status: builtins.str,
+    type: builtins.str,
+) -> None:
+    """Type checking stubs"""
+    pass
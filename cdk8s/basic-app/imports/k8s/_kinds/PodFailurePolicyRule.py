@@ -0,0 +1,135 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .PodFailurePolicyOnExitCodesRequirement import PodFailurePolicyOnExitCodesRequirement
+from .PodFailurePolicyOnPodConditionsPattern import PodFailurePolicyOnPodConditionsPattern
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodFailurePolicyRule",
+    jsii_struct_bases=[],
+    name_mapping={
+        "action": "action",
+        "on_pod_conditions": "onPodConditions",
+        "on_exit_codes": "onExitCodes",
+    },
+)
+class PodFailurePolicyRule(_base.Struct):
+    __slots__ = (
+        "_value_action",
+        "_value_on_pod_conditions",
+        "_value_on_exit_codes",
+    )
+
+    def __init__(
+        self,
+        *,
+        action: builtins.str,
+        on_pod_conditions: typing.Sequence[typing.Union[PodFailurePolicyOnPodConditionsPattern, typing.Dict[builtins.str, typing.Any]]],
+        on_exit_codes: typing.Optional[typing.Union[PodFailurePolicyOnExitCodesRequirement, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''PodFailurePolicyRule describes how a pod failure is handled when the requirements are met.
+
+        One of OnExitCodes and onPodConditions, but not both, can be used in each rule.
+
+        :param action: Specifies the action taken on a pod failure when the requirements are satisfied. Possible values are: - FailJob: indicates that the pod's job is marked as Failed and all running pods are terminated. - Ignore: indicates that the counter towards the .backoffLimit is not incremented and a replacement pod is created. - Count: indicates that the pod is handled in the default way - the counter towards the .backoffLimit is incremented. Additional values are considered to be added in the future. Clients should react to an unknown action by skipping the rule.
+        :param on_pod_conditions: Represents the requirement on the pod conditions. The requirement is represented as a list of pod condition patterns. The requirement is satisfied if at least one pattern matches an actual pod condition. At most 20 elements are allowed.
+        :param on_exit_codes: Represents the requirement on the container exit codes.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyRule
+        '''
+        if isinstance(on_exit_codes, dict):
+            on_exit_codes = PodFailurePolicyOnExitCodesRequirement(**on_exit_codes)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__9752d799ae40ee7e1d07cceb2daac5e29af9b379c43f336814f8928b638ebe0a)
+            check_type(argname="argument action", value=action, expected_type=type_hints["action"])
+            check_type(argname="argument on_pod_conditions", value=on_pod_conditions, expected_type=type_hints["on_pod_conditions"])
+            check_type(argname="argument on_exit_codes", value=on_exit_codes, expected_type=type_hints["on_exit_codes"])
+        self._value_action = action
+        self._value_on_pod_conditions = on_pod_conditions
+        self._value_on_exit_codes = on_exit_codes
+
+    @builtins.property
+    def action(self) -> builtins.str:
+        '''Specifies the action taken on a pod failure when the requirements are satisfied.
+
+        Possible values are: - FailJob: indicates that the pod's job is marked as Failed and all
+        running pods are terminated.
+
+        - Ignore: indicates that the counter towards the .backoffLimit is not
+          incremented and a replacement pod is created.
+        - Count: indicates that the pod is handled in the default way - the
+          counter towards the .backoffLimit is incremented.
+          Additional values are considered to be added in the future. Clients should react to an unknown action by skipping the rule.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyRule#action
+        '''
+        result = self._value_action
+        assert result is not None, "Required property 'action' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def on_pod_conditions(self) -> typing.List[PodFailurePolicyOnPodConditionsPattern]:
+        '''Represents the requirement on the pod conditions.
+
+        The requirement is represented as a list of pod condition patterns. The requirement is satisfied if at least one pattern matches an actual pod condition. At most 20 elements are allowed.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyRule#onPodConditions
+        '''
+        result = self._value_on_pod_conditions
+        assert result is not None, "Required property 'on_pod_conditions' is missing"
+        return typing.cast(typing.List[PodFailurePolicyOnPodConditionsPattern], result)
+
+    @builtins.property
+    def on_exit_codes(self) -> typing.Optional[PodFailurePolicyOnExitCodesRequirement]:
+        '''Represents the requirement on the container exit codes.
+
+        :schema: io.k8s.api.batch.v1.PodFailurePolicyRule#onExitCodes
+        '''
+        result = self._value_on_exit_codes
+        return typing.cast(typing.Optional[PodFailurePolicyOnExitCodesRequirement], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "action": self._value_action,
+            "on_pod_conditions": self._value_on_pod_conditions,
+        }
+        if self._value_on_exit_codes is not None:
+            values["on_exit_codes"] = self._value_on_exit_codes
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodFailurePolicyRule(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__9752d799ae40ee7e1d07cceb2daac5e29af9b379c43f336814f8928b638ebe0a(
+    *,
+    action: builtins.str,
+    on_pod_conditions: typing.Sequence[typing.Union[PodFailurePolicyOnPodConditionsPattern, typing.Dict[builtins.str, typing.Any]]],
+    on_exit_codes: typing.Optional[typing.Union[PodFailurePolicyOnExitCodesRequirement, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
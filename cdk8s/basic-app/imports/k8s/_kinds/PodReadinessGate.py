@@ -0,0 +1,76 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodReadinessGate",
+    jsii_struct_bases=[],
+    name_mapping={"condition_type": "conditionType"},
+)
+class PodReadinessGate(_base.Struct):
+    __slots__ = (
+        "_value_condition_type",
+    )
+
+    def __init__(self, *, condition_type: builtins.str) -> None:
+        '''PodReadinessGate contains the reference to a pod condition.
+
+        :param condition_type: ConditionType refers to a condition in the pod's condition list with matching type.
+
+        :schema: io.k8s.api.core.v1.PodReadinessGate
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__6efa6da68115e82d6b27bff9f91e3ed47585fedf0e8e6358afee97da2cccc1fc)
+            check_type(argname="argument condition_type", value=condition_type, expected_type=type_hints["condition_type"])
+        self._value_condition_type = condition_type
+
+    @builtins.property
+    def condition_type(self) -> builtins.str:
+        '''ConditionType refers to a condition in the pod's condition list with matching type.
+
+        :schema: io.k8s.api.core.v1.PodReadinessGate#conditionType
+        '''
+        result = self._value_condition_type
+        assert result is not None, "Required property 'condition_type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "condition_type": self._value_condition_type,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodReadinessGate(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__6efa6da68115e82d6b27bff9f91e3ed47585fedf0e8e6358afee97da2cccc1fc(
+    *,
+    condition_type: builtins.str,
+) -> None:
+    """Type checking stubs"""
+    pass
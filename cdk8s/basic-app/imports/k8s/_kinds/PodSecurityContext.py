@@ -0,0 +1,281 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .SeLinuxOptions import SeLinuxOptions
+from .SeccompProfile import SeccompProfile
+from .Sysctl import Sysctl
+from .WindowsSecurityContextOptions import WindowsSecurityContextOptions
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodSecurityContext",
+    jsii_struct_bases=[],
+    name_mapping={
+        "fs_group": "fsGroup",
+        "fs_group_change_policy": "fsGroupChangePolicy",
+        "run_as_group": "runAsGroup",
+        "run_as_non_root": "runAsNonRoot",
+        "run_as_user": "runAsUser",
+        "seccomp_profile": "seccompProfile",
+        "se_linux_options": "seLinuxOptions",
+        "supplemental_groups": "supplementalGroups",
+        "sysctls": "sysctls",
+        "windows_options": "windowsOptions",
+    },
+)
+class PodSecurityContext(_base.Struct):
+    __slots__ = (
+        "_value_fs_group",
+        "_value_fs_group_change_policy",
+        "_value_run_as_group",
+        "_value_run_as_non_root",
+        "_value_run_as_user",
+        "_value_seccomp_profile",
+        "_value_se_linux_options",
+        "_value_supplemental_groups",
+        "_value_sysctls",
+        "_value_windows_options",
+    )
+
+    def __init__(
+        self,
+        *,
+        fs_group: typing.Optional[jsii.Number] = None,
+        fs_group_change_policy: typing.Optional[builtins.str] = None,
+        run_as_group: typing.Optional[jsii.Number] = None,
+        run_as_non_root: typing.Optional[builtins.bool] = None,
+        run_as_user: typing.Optional[jsii.Number] = None,
+        seccomp_profile: typing.Optional[typing.Union["SeccompProfile", typing.Dict[builtins.str, typing.Any]]] = None,
+        se_linux_options: typing.Optional[typing.Union["SeLinuxOptions", typing.Dict[builtins.str, typing.Any]]] = None,
+        supplemental_groups: typing.Optional[typing.Sequence[jsii.Number]] = None,
+        sysctls: typing.Optional[typing.Sequence[typing.Union["Sysctl", typing.Dict[builtins.str, typing.Any]]]] = None,
+        windows_options: typing.Optional[typing.Union["WindowsSecurityContextOptions", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''PodSecurityContext holds pod-level security attributes and common container settings.
+
+        Some fields are also present in container.securityContext.  Field values of container.securityContext take precedence over field values of PodSecurityContext.
+
+        :param fs_group: A special supplemental group that applies to all containers in a pod. Some volume types allow the Kubelet to change the ownership of that volume to be owned by the pod: 1. The owning GID will be the FSGroup 2. The setgid bit is set (new files created in the volume will be owned by FSGroup) 3. The permission bits are OR'd with rw-rw---- If unset, the Kubelet will not modify the ownership and permissions of any volume. Note that this field cannot be set when spec.os.name is windows.
+        :param fs_group_change_policy: fsGroupChangePolicy defines behavior of changing ownership and permission of the volume before being exposed inside Pod. This field will only apply to volume types which support fsGroup based ownership(and permissions). It will have no effect on ephemeral volume types such as: secret, configmaps and emptydir. Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used. Note that this field cannot be set when spec.os.name is windows.
+        :param run_as_group: The GID to run the entrypoint of the container process. Uses runtime default if unset. May also be set in SecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence for that container. Note that this field cannot be set when spec.os.name is windows.
+        :param run_as_non_root: Indicates that the container must run as a non-root user. If true, the Kubelet will validate the image at runtime to ensure that it does not run as UID 0 (root) and fail to start the container if it does. If unset or false, no such validation will be performed. May also be set in SecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+        :param run_as_user: The UID to run the entrypoint of the container process. Defaults to user specified in image metadata if unspecified. May also be set in SecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence for that container. Note that this field cannot be set when spec.os.name is windows. Default: user specified in image metadata if unspecified. May also be set in SecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence for that container. Note that this field cannot be set when spec.os.name is windows.
+        :param seccomp_profile: The seccomp options to use by the containers in this pod. Note that this field cannot be set when spec.os.name is windows.
+        :param se_linux_options: The SELinux context to be applied to all containers. If unspecified, the container runtime will allocate a random SELinux context for each container. May also be set in SecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence for that container. Note that this field cannot be set when spec.os.name is windows.
+        :param supplemental_groups: A list of groups applied to the first process run in each container, in addition to the container's primary GID. If unspecified, no groups will be added to any container. Note that this field cannot be set when spec.os.name is windows.
+        :param sysctls: Sysctls hold a list of namespaced sysctls used for the pod. Pods with unsupported sysctls (by the container runtime) might fail to launch. Note that this field cannot be set when spec.os.name is windows.
+        :param windows_options: The Windows specific settings applied to all containers. If unspecified, the options within a container's SecurityContext will be used. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is linux.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext
+        '''
+        if isinstance(seccomp_profile, dict):
+            seccomp_profile = SeccompProfile(**seccomp_profile)
+        if isinstance(se_linux_options, dict):
+            se_linux_options = SeLinuxOptions(**se_linux_options)
+        if isinstance(windows_options, dict):
+            windows_options = WindowsSecurityContextOptions(**windows_options)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b23f586ca6b5b102b009640138cfcb7cb8db5fffa8d48ddb6c723e2d52bc60bc)
+            check_type(argname="argument fs_group", value=fs_group, expected_type=type_hints["fs_group"])
+            check_type(argname="argument fs_group_change_policy", value=fs_group_change_policy, expected_type=type_hints["fs_group_change_policy"])
+            check_type(argname="argument run_as_group", value=run_as_group, expected_type=type_hints["run_as_group"])
+            check_type(argname="argument run_as_non_root", value=run_as_non_root, expected_type=type_hints["run_as_non_root"])
+            check_type(argname="argument run_as_user", value=run_as_user, expected_type=type_hints["run_as_user"])
+            check_type(argname="argument seccomp_profile", value=seccomp_profile, expected_type=type_hints["seccomp_profile"])
+            check_type(argname="argument se_linux_options", value=se_linux_options, expected_type=type_hints["se_linux_options"])
+            check_type(argname="argument supplemental_groups", value=supplemental_groups, expected_type=type_hints["supplemental_groups"])
+            check_type(argname="argument sysctls", value=sysctls, expected_type=type_hints["sysctls"])
+            check_type(argname="argument windows_options", value=windows_options, expected_type=type_hints["windows_options"])
+        self._value_fs_group = fs_group
+        self._value_fs_group_change_policy = fs_group_change_policy
+        self._value_run_as_group = run_as_group
+        self._value_run_as_non_root = run_as_non_root
+        self._value_run_as_user = run_as_user
+        self._value_seccomp_profile = seccomp_profile
+        self._value_se_linux_options = se_linux_options
+        self._value_supplemental_groups = supplemental_groups
+        self._value_sysctls = sysctls
+        self._value_windows_options = windows_options
+
+    @builtins.property
+    def fs_group(self) -> typing.Optional[jsii.Number]:
+        '''A special supplemental group that applies to all containers in a pod.
+
+        Some volume types allow the Kubelet to change the ownership of that volume to be owned by the pod:
+
+        1. The owning GID will be the FSGroup 2. The setgid bit is set (new files created in the volume will be owned by FSGroup) 3. The permission bits are OR'd with rw-rw----
+
+        If unset, the Kubelet will not modify the ownership and permissions of any volume. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#fsGroup
+        '''
+        result = self._value_fs_group
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def fs_group_change_policy(self) -> typing.Optional[builtins.str]:
+        '''fsGroupChangePolicy defines behavior of changing ownership and permission of the volume before being exposed inside Pod.
+
+        This field will only apply to volume types which support fsGroup based ownership(and permissions). It will have no effect on ephemeral volume types such as: secret, configmaps and emptydir. Valid values are "OnRootMismatch" and "Always". If not specified, "Always" is used. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#fsGroupChangePolicy
+        '''
+        result = self._value_fs_group_change_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def run_as_group(self) -> typing.Optional[jsii.Number]:
+        '''The GID to run the entrypoint of the container process.
+
+        Uses runtime default if unset. May also be set in SecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence for that container. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#runAsGroup
+        '''
+        result = self._value_run_as_group
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def run_as_non_root(self) -> typing.Optional[builtins.bool]:
+        '''Indicates that the container must run as a non-root user.
+
+        If true, the Kubelet will validate the image at runtime to ensure that it does not run as UID 0 (root) and fail to start the container if it does. If unset or false, no such validation will be performed. May also be set in SecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#runAsNonRoot
+        '''
+        result = self._value_run_as_non_root
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def run_as_user(self) -> typing.Optional[jsii.Number]:
+        '''The UID to run the entrypoint of the container process.
+
+        Defaults to user specified in image metadata if unspecified. May also be set in SecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence for that container. Note that this field cannot be set when spec.os.name is windows.
+
+        :default: user specified in image metadata if unspecified. May also be set in SecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence for that container. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#runAsUser
+        '''
+        result = self._value_run_as_user
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def seccomp_profile(self) -> typing.Optional["SeccompProfile"]:
+        '''The seccomp options to use by the containers in this pod.
+
+        Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#seccompProfile
+        '''
+        result = self._value_seccomp_profile
+        return typing.cast(typing.Optional["SeccompProfile"], result)
+
+    @builtins.property
+    def se_linux_options(self) -> typing.Optional["SeLinuxOptions"]:
+        '''The SELinux context to be applied to all containers.
+
+        If unspecified, the container runtime will allocate a random SELinux context for each container.  May also be set in SecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence for that container. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#seLinuxOptions
+        '''
+        result = self._value_se_linux_options
+        return typing.cast(typing.Optional["SeLinuxOptions"], result)
+
+    @builtins.property
+    def supplemental_groups(self) -> typing.Optional[typing.List[jsii.Number]]:
+        '''A list of groups applied to the first process run in each container, in addition to the container's primary GID.
+
+        If unspecified, no groups will be added to any container. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#supplementalGroups
+        '''
+        result = self._value_supplemental_groups
+        return typing.cast(typing.Optional[typing.List[jsii.Number]], result)
+
+    @builtins.property
+    def sysctls(self) -> typing.Optional[typing.List["Sysctl"]]:
+        '''Sysctls hold a list of namespaced sysctls used for the pod.
+
+        Pods with unsupported sysctls (by the container runtime) might fail to launch. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#sysctls
+        '''
+        result = self._value_sysctls
+        return typing.cast(typing.Optional[typing.List["Sysctl"]], result)
+
+    @builtins.property
+    def windows_options(self) -> typing.Optional["WindowsSecurityContextOptions"]:
+        '''The Windows specific settings applied to all containers.
+
+        If unspecified, the options within a container's SecurityContext will be used. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is linux.
+
+        :schema: io.k8s.api.core.v1.PodSecurityContext#windowsOptions
+        '''
+        result = self._value_windows_options
+        return typing.cast(typing.Optional["WindowsSecurityContextOptions"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_fs_group is not None:
+            values["fs_group"] = self._value_fs_group
+        if self._value_fs_group_change_policy is not None:
+            values["fs_group_change_policy"] = self._value_fs_group_change_policy
+        if self._value_run_as_group is not None:
+            values["run_as_group"] = self._value_run_as_group
+        if self._value_run_as_non_root is not None:
+            values["run_as_non_root"] = self._value_run_as_non_root
+        if self._value_run_as_user is not None:
+            values["run_as_user"] = self._value_run_as_user
+        if self._value_seccomp_profile is not None:
+            values["seccomp_profile"] = self._value_seccomp_profile
+        if self._value_se_linux_options is not None:
+            values["se_linux_options"] = self._value_se_linux_options
+        if self._value_supplemental_groups is not None:
+            values["supplemental_groups"] = self._value_supplemental_groups
+        if self._value_sysctls is not None:
+            values["sysctls"] = self._value_sysctls
+        if self._value_windows_options is not None:
+            values["windows_options"] = self._value_windows_options
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodSecurityContext(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b23f586ca6b5b102b009640138cfcb7cb8db5fffa8d48ddb6c723e2d52bc60bc(
+    *,
+    fs_group: typing.Optional[jsii.Number] = None,
+    fs_group_change_policy: typing.Optional[builtins.str] = None,
+    run_as_group: typing.Optional[jsii.Number] = None,
+    run_as_non_root: typing.Optional[builtins.bool] = None,
+    run_as_user: typing.Optional[jsii.Number] = None,
+    seccomp_profile: typing.Optional[typing.Union[SeccompProfile, typing.Dict[builtins.str, typing.Any]]] = None,
+    se_linux_options: typing.Optional[typing.Union[SeLinuxOptions, typing.Dict[builtins.str, typing.Any]]] = None,
+    supplemental_groups: typing.Optional[typing.Sequence[jsii.Number]] = None,
+    sysctls: typing.Optional[typing.Sequence[typing.Union[Sysctl, typing.Dict[builtins.str, typing.Any]]]] = None,
+    windows_options: typing.Optional[typing.Union[WindowsSecurityContextOptions, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
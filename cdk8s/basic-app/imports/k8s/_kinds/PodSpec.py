@@ -0,0 +1,845 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Affinity import Affinity
+from .Container import Container
+from .EphemeralContainer import EphemeralContainer
+from .HostAlias import HostAlias
+from .LocalObjectReference import LocalObjectReference
+from .PodDnsConfig import PodDnsConfig
+from .PodOs import PodOs
+from .PodReadinessGate import PodReadinessGate
+from .PodSecurityContext import PodSecurityContext
+from .Quantity import Quantity
+from .Toleration import Toleration
+from .TopologySpreadConstraint import TopologySpreadConstraint
+from .Volume import Volume
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "containers": "containers",
+        "active_deadline_seconds": "activeDeadlineSeconds",
+        "affinity": "affinity",
+        "automount_service_account_token": "automountServiceAccountToken",
+        "dns_config": "dnsConfig",
+        "dns_policy": "dnsPolicy",
+        "enable_service_links": "enableServiceLinks",
+        "ephemeral_containers": "ephemeralContainers",
+        "host_aliases": "hostAliases",
+        "host_ipc": "hostIpc",
+        "hostname": "hostname",
+        "host_network": "hostNetwork",
+        "host_pid": "hostPid",
+        "host_users": "hostUsers",
+        "image_pull_secrets": "imagePullSecrets",
+        "init_containers": "initContainers",
+        "node_name": "nodeName",
+        "node_selector": "nodeSelector",
+        "os": "os",
+        "overhead": "overhead",
+        "preemption_policy": "preemptionPolicy",
+        "priority": "priority",
+        "priority_class_name": "priorityClassName",
+        "readiness_gates": "readinessGates",
+        "restart_policy": "restartPolicy",
+        "runtime_class_name": "runtimeClassName",
+        "scheduler_name": "schedulerName",
+        "security_context": "securityContext",
+        "service_account": "serviceAccount",
+        "service_account_name": "serviceAccountName",
+        "set_hostname_as_fqdn": "setHostnameAsFqdn",
+        "share_process_namespace": "shareProcessNamespace",
+        "subdomain": "subdomain",
+        "termination_grace_period_seconds": "terminationGracePeriodSeconds",
+        "tolerations": "tolerations",
+        "topology_spread_constraints": "topologySpreadConstraints",
+        "volumes": "volumes",
+    },
+)
+class PodSpec(_base.Struct):
+    __slots__ = (
+        "_value_containers",
+        "_value_active_deadline_seconds",
+        "_value_affinity",
+        "_value_automount_service_account_token",
+        "_value_dns_config",
+        "_value_dns_policy",
+        "_value_enable_service_links",
+        "_value_ephemeral_containers",
+        "_value_host_aliases",
+        "_value_host_ipc",
+        "_value_hostname",
+        "_value_host_network",
+        "_value_host_pid",
+        "_value_host_users",
+        "_value_image_pull_secrets",
+        "_value_init_containers",
+        "_value_node_name",
+        "_value_node_selector",
+        "_value_os",
+        "_value_overhead",
+        "_value_preemption_policy",
+        "_value_priority",
+        "_value_priority_class_name",
+        "_value_readiness_gates",
+        "_value_restart_policy",
+        "_value_runtime_class_name",
+        "_value_scheduler_name",
+        "_value_security_context",
+        "_value_service_account",
+        "_value_service_account_name",
+        "_value_set_hostname_as_fqdn",
+        "_value_share_process_namespace",
+        "_value_subdomain",
+        "_value_termination_grace_period_seconds",
+        "_value_tolerations",
+        "_value_topology_spread_constraints",
+        "_value_volumes",
+    )
+
+    def __init__(
+        self,
+        *,
+        containers: typing.Sequence[typing.Union[Container, typing.Dict[builtins.str, typing.Any]]],
+        active_deadline_seconds: typing.Optional[jsii.Number] = None,
+        affinity: typing.Optional[typing.Union[Affinity, typing.Dict[builtins.str, typing.Any]]] = None,
+        automount_service_account_token: typing.Optional[builtins.bool] = None,
+        dns_config: typing.Optional[typing.Union[PodDnsConfig, typing.Dict[builtins.str, typing.Any]]] = None,
+        dns_policy: typing.Optional[builtins.str] = None,
+        enable_service_links: typing.Optional[builtins.bool] = None,
+        ephemeral_containers: typing.Optional[typing.Sequence[typing.Union[EphemeralContainer, typing.Dict[builtins.str, typing.Any]]]] = None,
+        host_aliases: typing.Optional[typing.Sequence[typing.Union[HostAlias, typing.Dict[builtins.str, typing.Any]]]] = None,
+        host_ipc: typing.Optional[builtins.bool] = None,
+        hostname: typing.Optional[builtins.str] = None,
+        host_network: typing.Optional[builtins.bool] = None,
+        host_pid: typing.Optional[builtins.bool] = None,
+        host_users: typing.Optional[builtins.bool] = None,
+        image_pull_secrets: typing.Optional[typing.Sequence[typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]]]] = None,
+        init_containers: typing.Optional[typing.Sequence[typing.Union[Container, typing.Dict[builtins.str, typing.Any]]]] = None,
+        node_name: typing.Optional[builtins.str] = None,
+        node_selector: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        os: typing.Optional[typing.Union[PodOs, typing.Dict[builtins.str, typing.Any]]] = None,
+        overhead: typing.Optional[typing.Mapping[builtins.str, "Quantity"]] = None,
+        preemption_policy: typing.Optional[builtins.str] = None,
+        priority: typing.Optional[jsii.Number] = None,
+        priority_class_name: typing.Optional[builtins.str] = None,
+        readiness_gates: typing.Optional[typing.Sequence[typing.Union[PodReadinessGate, typing.Dict[builtins.str, typing.Any]]]] = None,
+        restart_policy: typing.Optional[builtins.str] = None,
+        runtime_class_name: typing.Optional[builtins.str] = None,
+        scheduler_name: typing.Optional[builtins.str] = None,
+        security_context: typing.Optional[typing.Union[PodSecurityContext, typing.Dict[builtins.str, typing.Any]]] = None,
+        service_account: typing.Optional[builtins.str] = None,
+        service_account_name: typing.Optional[builtins.str] = None,
+        set_hostname_as_fqdn: typing.Optional[builtins.bool] = None,
+        share_process_namespace: typing.Optional[builtins.bool] = None,
+        subdomain: typing.Optional[builtins.str] = None,
+        termination_grace_period_seconds: typing.Optional[jsii.Number] = None,
+        tolerations: typing.Optional[typing.Sequence[typing.Union["Toleration", typing.Dict[builtins.str, typing.Any]]]] = None,
+        topology_spread_constraints: typing.Optional[typing.Sequence[typing.Union["TopologySpreadConstraint", typing.Dict[builtins.str, typing.Any]]]] = None,
+        volumes: typing.Optional[typing.Sequence[typing.Union["Volume", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''PodSpec is a description of a pod.
+
+        :param containers: List of containers belonging to the pod. Containers cannot currently be added or removed. There must be at least one container in a Pod. Cannot be updated.
+        :param active_deadline_seconds: Optional duration in seconds the pod may be active on the node relative to StartTime before the system will actively try to mark it failed and kill associated containers. Value must be a positive integer.
+        :param affinity: If specified, the pod's scheduling constraints.
+        :param automount_service_account_token: AutomountServiceAccountToken indicates whether a service account token should be automatically mounted.
+        :param dns_config: Specifies the DNS parameters of a pod. Parameters specified here will be merged to the generated DNS configuration based on DNSPolicy.
+        :param dns_policy: Set DNS policy for the pod. Defaults to "ClusterFirst". Valid values are 'ClusterFirstWithHostNet', 'ClusterFirst', 'Default' or 'None'. DNS parameters given in DNSConfig will be merged with the policy selected with DNSPolicy. To have DNS options set along with hostNetwork, you have to specify DNS policy explicitly to 'ClusterFirstWithHostNet'. Default: ClusterFirst". Valid values are 'ClusterFirstWithHostNet', 'ClusterFirst', 'Default' or 'None'. DNS parameters given in DNSConfig will be merged with the policy selected with DNSPolicy. To have DNS options set along with hostNetwork, you have to specify DNS policy explicitly to 'ClusterFirstWithHostNet'.
+        :param enable_service_links: EnableServiceLinks indicates whether information about services should be injected into pod's environment variables, matching the syntax of Docker links. Optional: Defaults to true. Default: true.
+        :param ephemeral_containers: List of ephemeral containers run in this pod. Ephemeral containers may be run in an existing pod to perform user-initiated actions such as debugging. This list cannot be specified when creating a pod, and it cannot be modified by updating the pod spec. In order to add an ephemeral container to an existing pod, use the pod's ephemeralcontainers subresource.
+        :param host_aliases: HostAliases is an optional list of hosts and IPs that will be injected into the pod's hosts file if specified. This is only valid for non-hostNetwork pods.
+        :param host_ipc: Use the host's ipc namespace. Optional: Default to false. Default: false.
+        :param hostname: Specifies the hostname of the Pod If not specified, the pod's hostname will be set to a system-defined value.
+        :param host_network: Host networking requested for this pod. Use the host's network namespace. If this option is set, the ports that will be used must be specified. Default to false. Default: false.
+        :param host_pid: Use the host's pid namespace. Optional: Default to false. Default: false.
+        :param host_users: Use the host's user namespace. Optional: Default to true. If set to true or not present, the pod will be run in the host user namespace, useful for when the pod needs a feature only available to the host user namespace, such as loading a kernel module with CAP_SYS_MODULE. When set to false, a new userns is created for the pod. Setting false is useful for mitigating container breakout vulnerabilities even allowing users to run their containers as root without actually having root privileges on the host. This field is alpha-level and is only honored by servers that enable the UserNamespacesSupport feature. Default: true. If set to true or not present, the pod will be run in the host user namespace, useful for when the pod needs a feature only available to the host user namespace, such as loading a kernel module with CAP_SYS_MODULE. When set to false, a new userns is created for the pod. Setting false is useful for mitigating container breakout vulnerabilities even allowing users to run their containers as root without actually having root privileges on the host. This field is alpha-level and is only honored by servers that enable the UserNamespacesSupport feature.
+        :param image_pull_secrets: ImagePullSecrets is an optional list of references to secrets in the same namespace to use for pulling any of the images used by this PodSpec. If specified, these secrets will be passed to individual puller implementations for them to use. More info: https://kubernetes.io/docs/concepts/containers/images#specifying-imagepullsecrets-on-a-pod
+        :param init_containers: List of initialization containers belonging to the pod. Init containers are executed in order prior to containers being started. If any init container fails, the pod is considered to have failed and is handled according to its restartPolicy. The name for an init container or normal container must be unique among all containers. Init containers may not have Lifecycle actions, Readiness probes, Liveness probes, or Startup probes. The resourceRequirements of an init container are taken into account during scheduling by finding the highest request/limit for each resource type, and then using the max of of that value or the sum of the normal containers. Limits are applied to init containers in a similar fashion. Init containers cannot currently be added or removed. Cannot be updated. More info: https://kubernetes.io/docs/concepts/workloads/pods/init-containers/
+        :param node_name: NodeName is a request to schedule this pod onto a specific node. If it is non-empty, the scheduler simply schedules this pod onto that node, assuming that it fits resource requirements.
+        :param node_selector: NodeSelector is a selector which must be true for the pod to fit on a node. Selector which must match a node's labels for the pod to be scheduled on that node. More info: https://kubernetes.io/docs/concepts/configuration/assign-pod-node/
+        :param os: Specifies the OS of the containers in the pod. Some pod and container fields are restricted if this is set. If the OS field is set to linux, the following fields must be unset: -securityContext.windowsOptions If the OS field is set to windows, following fields must be unset: - spec.hostPID - spec.hostIPC - spec.hostUsers - spec.securityContext.seLinuxOptions - spec.securityContext.seccompProfile - spec.securityContext.fsGroup - spec.securityContext.fsGroupChangePolicy - spec.securityContext.sysctls - spec.shareProcessNamespace - spec.securityContext.runAsUser - spec.securityContext.runAsGroup - spec.securityContext.supplementalGroups - spec.containers[*].securityContext.seLinuxOptions - spec.containers[*].securityContext.seccompProfile - spec.containers[*].securityContext.capabilities - spec.containers[*].securityContext.readOnlyRootFilesystem - spec.containers[*].securityContext.privileged - spec.containers[*].securityContext.allowPrivilegeEscalation - spec.containers[*].securityContext.procMount - spec.containers[*].securityContext.runAsUser - spec.containers[*].securityContext.runAsGroup
+        :param overhead: Overhead represents the resource overhead associated with running a pod for a given RuntimeClass. This field will be autopopulated at admission time by the RuntimeClass admission controller. If the RuntimeClass admission controller is enabled, overhead must not be set in Pod create requests. The RuntimeClass admission controller will reject Pod create requests which have the overhead already set. If RuntimeClass is configured and selected in the PodSpec, Overhead will be set to the value defined in the corresponding RuntimeClass, otherwise it will remain unset and treated as zero. More info: https://git.k8s.io/enhancements/keps/sig-node/688-pod-overhead/README.md
+        :param preemption_policy: PreemptionPolicy is the Policy for preempting pods with lower priority. One of Never, PreemptLowerPriority. Defaults to PreemptLowerPriority if unset. Default: PreemptLowerPriority if unset.
+        :param priority: The priority value. Various system components use this field to find the priority of the pod. When Priority Admission Controller is enabled, it prevents users from setting this field. The admission controller populates this field from PriorityClassName. The higher the value, the higher the priority.
+        :param priority_class_name: If specified, indicates the pod's priority. "system-node-critical" and "system-cluster-critical" are two special keywords which indicate the highest priorities with the former being the highest priority. Any other name must be defined by creating a PriorityClass object with that name. If not specified, the pod priority will be default or zero if there is no default.
+        :param readiness_gates: If specified, all readiness gates will be evaluated for pod readiness. A pod is ready when all its containers are ready AND all conditions specified in the readiness gates have status equal to "True" More info: https://git.k8s.io/enhancements/keps/sig-network/580-pod-readiness-gates
+        :param restart_policy: Restart policy for all containers within the pod. One of Always, OnFailure, Never. Default to Always. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#restart-policy Default: Always. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#restart-policy
+        :param runtime_class_name: RuntimeClassName refers to a RuntimeClass object in the node.k8s.io group, which should be used to run this pod. If no RuntimeClass resource matches the named class, the pod will not be run. If unset or empty, the "legacy" RuntimeClass will be used, which is an implicit class with an empty definition that uses the default runtime handler. More info: https://git.k8s.io/enhancements/keps/sig-node/585-runtime-class.
+        :param scheduler_name: If specified, the pod will be dispatched by specified scheduler. If not specified, the pod will be dispatched by default scheduler.
+        :param security_context: SecurityContext holds pod-level security attributes and common container settings. Optional: Defaults to empty. See type description for default values of each field. Default: empty. See type description for default values of each field.
+        :param service_account: DeprecatedServiceAccount is a depreciated alias for ServiceAccountName. Deprecated: Use serviceAccountName instead.
+        :param service_account_name: ServiceAccountName is the name of the ServiceAccount to use to run this pod. More info: https://kubernetes.io/docs/tasks/configure-pod-container/configure-service-account/
+        :param set_hostname_as_fqdn: If true the pod's hostname will be configured as the pod's FQDN, rather than the leaf name (the default). In Linux containers, this means setting the FQDN in the hostname field of the kernel (the nodename field of struct utsname). In Windows containers, this means setting the registry value of hostname for the registry key HKEY_LOCAL_MACHINE\\SYSTEM\\CurrentControlSet\\Services\\Tcpip\\Parameters to FQDN. If a pod does not have FQDN, this has no effect. Default to false. Default: false.
+        :param share_process_namespace: Share a single process namespace between all of the containers in a pod. When this is set containers will be able to view and signal processes from other containers in the same pod, and the first process in each container will not be assigned PID 1. HostPID and ShareProcessNamespace cannot both be set. Optional: Default to false. Default: false.
+        :param subdomain: If specified, the fully qualified Pod hostname will be "...svc.". If not specified, the pod will not have a domainname at all.
+        :param termination_grace_period_seconds: Optional duration in seconds the pod needs to terminate gracefully. May be decreased in delete request. Value must be non-negative integer. The value zero indicates stop immediately via the kill signal (no opportunity to shut down). If this value is nil, the default grace period will be used instead. The grace period is the duration in seconds after the processes running in the pod are sent a termination signal and the time when the processes are forcibly halted with a kill signal. Set this value longer than the expected cleanup time for your process. Defaults to 30 seconds. Default: 30 seconds.
+        :param tolerations: If specified, the pod's tolerations.
+        :param topology_spread_constraints: TopologySpreadConstraints describes how a group of pods ought to spread across topology domains. Scheduler will schedule pods in a way which abides by the constraints. All topologySpreadConstraints are ANDed.
+        :param volumes: List of volumes that can be mounted by containers belonging to the pod. More info: https://kubernetes.io/docs/concepts/storage/volumes
+
+        :schema: io.k8s.api.core.v1.PodSpec
+        '''
+        if isinstance(affinity, dict):
+            affinity = Affinity(**affinity)
+        if isinstance(dns_config, dict):
+            dns_config = PodDnsConfig(**dns_config)
+        if isinstance(os, dict):
+            os = PodOs(**os)
+        if isinstance(security_context, dict):
+            security_context = PodSecurityContext(**security_context)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__9ddad62f26f59d5b393ec9c7814efae31dbad75f06f4456a0bef61a6ce7dd763)
+            check_type(argname="argument containers", value=containers, expected_type=type_hints["containers"])
+            check_type(argname="argument active_deadline_seconds", value=active_deadline_seconds, expected_type=type_hints["active_deadline_seconds"])
+            check_type(argname="argument affinity", value=affinity, expected_type=type_hints["affinity"])
+            check_type(argname="argument automount_service_account_token", value=automount_service_account_token, expected_type=type_hints["automount_service_account_token"])
+            check_type(argname="argument dns_config", value=dns_config, expected_type=type_hints["dns_config"])
+            check_type(argname="argument dns_policy", value=dns_policy, expected_type=type_hints["dns_policy"])
+            check_type(argname="argument enable_service_links", value=enable_service_links, expected_type=type_hints["enable_service_links"])
+            check_type(argname="argument ephemeral_containers", value=ephemeral_containers, expected_type=type_hints["ephemeral_containers"])
+            check_type(argname="argument host_aliases", value=host_aliases, expected_type=type_hints["host_aliases"])
+            check_type(argname="argument host_ipc", value=host_ipc, expected_type=type_hints["host_ipc"])
+            check_type(argname="argument hostname", value=hostname, expected_type=type_hints["hostname"])
+            check_type(argname="argument host_network", value=host_network, expected_type=type_hints["host_network"])
+            check_type(argname="argument host_pid", value=host_pid, expected_type=type_hints["host_pid"])
+            check_type(argname="argument host_users", value=host_users, expected_type=type_hints["host_users"])
+            check_type(argname="argument image_pull_secrets", value=image_pull_secrets, expected_type=type_hints["image_pull_secrets"])
+            check_type(argname="argument init_containers", value=init_containers, expected_type=type_hints["init_containers"])
+            check_type(argname="argument node_name", value=node_name, expected_type=type_hints["node_name"])
+            check_type(argname="argument node_selector", value=node_selector, expected_type=type_hints["node_selector"])
+            check_type(argname="argument os", value=os, expected_type=type_hints["os"])
+            check_type(argname="argument overhead", value=overhead, expected_type=type_hints["overhead"])
+            check_type(argname="argument preemption_policy", value=preemption_policy, expected_type=type_hints["preemption_policy"])
+            check_type(argname="argument priority", value=priority, expected_type=type_hints["priority"])
+            check_type(argname="argument priority_class_name", value=priority_class_name, expected_type=type_hints["priority_class_name"])
+            check_type(argname="argument readiness_gates", value=readiness_gates, expected_type=type_hints["readiness_gates"])
+            check_type(argname="argument restart_policy", value=restart_policy, expected_type=type_hints["restart_policy"])
+            check_type(argname="argument runtime_class_name", value=runtime_class_name, expected_type=type_hints["runtime_class_name"])
+            check_type(argname="argument scheduler_name", value=scheduler_name, expected_type=type_hints["scheduler_name"])
+            check_type(argname="argument security_context", value=security_context, expected_type=type_hints["security_context"])
+            check_type(argname="argument service_account", value=service_account, expected_type=type_hints["service_account"])
+            check_type(argname="argument service_account_name", value=service_account_name, expected_type=type_hints["service_account_name"])
+            check_type(argname="argument set_hostname_as_fqdn", value=set_hostname_as_fqdn, expected_type=type_hints["set_hostname_as_fqdn"])
+            check_type(argname="argument share_process_namespace", value=share_process_namespace, expected_type=type_hints["share_process_namespace"])
+            check_type(argname="argument subdomain", value=subdomain, expected_type=type_hints["subdomain"])
+            check_type(argname="argument termination_grace_period_seconds", value=termination_grace_period_seconds, expected_type=type_hints["termination_grace_period_seconds"])
+            check_type(argname="argument tolerations", value=tolerations, expected_type=type_hints["tolerations"])
+            check_type(argname="argument topology_spread_constraints", value=topology_spread_constraints, expected_type=type_hints["topology_spread_constraints"])
+            check_type(argname="argument volumes", value=volumes, expected_type=type_hints["volumes"])
+        self._value_containers = containers
+        self._value_active_deadline_seconds = active_deadline_seconds
+        self._value_affinity = affinity
+        self._value_automount_service_account_token = automount_service_account_token
+        self._value_dns_config = dns_config
+        self._value_dns_policy = dns_policy
+        self._value_enable_service_links = enable_service_links
+        self._value_ephemeral_containers = ephemeral_containers
+        self._value_host_aliases = host_aliases
+        self._value_host_ipc = host_ipc
+        self._value_hostname = hostname
+        self._value_host_network = host_network
+        self._value_host_pid = host_pid
+        self._value_host_users = host_users
+        self._value_image_pull_secrets = image_pull_secrets
+        self._value_init_containers = init_containers
+        self._value_node_name = node_name
+        self._value_node_selector = node_selector
+        self._value_os = os
+        self._value_overhead = overhead
+        self._value_preemption_policy = preemption_policy
+        self._value_priority = priority
+        self._value_priority_class_name = priority_class_name
+        self._value_readiness_gates = readiness_gates
+        self._value_restart_policy = restart_policy
+        self._value_runtime_class_name = runtime_class_name
+        self._value_scheduler_name = scheduler_name
+        self._value_security_context = security_context
+        self._value_service_account = service_account
+        self._value_service_account_name = service_account_name
+        self._value_set_hostname_as_fqdn = set_hostname_as_fqdn
+        self._value_share_process_namespace = share_process_namespace
+        self._value_subdomain = subdomain
+        self._value_termination_grace_period_seconds = termination_grace_period_seconds
+        self._value_tolerations = tolerations
+        self._value_topology_spread_constraints = topology_spread_constraints
+        self._value_volumes = volumes
+
+    @builtins.property
+    def containers(self) -> typing.List[Container]:
+        '''List of containers belonging to the pod.
+
+        Containers cannot currently be added or removed. There must be at least one container in a Pod. Cannot be updated.
+
+        :schema: io.k8s.api.core.v1.PodSpec#containers
+        '''
+        result = self._value_containers
+        assert result is not None, "Required property 'containers' is missing"
+        return typing.cast(typing.List[Container], result)
+
+    @builtins.property
+    def active_deadline_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Optional duration in seconds the pod may be active on the node relative to StartTime before the system will actively try to mark it failed and kill associated containers.
+
+        Value must be a positive integer.
+
+        :schema: io.k8s.api.core.v1.PodSpec#activeDeadlineSeconds
+        '''
+        result = self._value_active_deadline_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def affinity(self) -> typing.Optional[Affinity]:
+        '''If specified, the pod's scheduling constraints.
+
+        :schema: io.k8s.api.core.v1.PodSpec#affinity
+        '''
+        result = self._value_affinity
+        return typing.cast(typing.Optional[Affinity], result)
+
+    @builtins.property
+    def automount_service_account_token(self) -> typing.Optional[builtins.bool]:
+        '''AutomountServiceAccountToken indicates whether a service account token should be automatically mounted.
+
+        :schema: io.k8s.api.core.v1.PodSpec#automountServiceAccountToken
+        '''
+        result = self._value_automount_service_account_token
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def dns_config(self) -> typing.Optional[PodDnsConfig]:
+        '''Specifies the DNS parameters of a pod.
+
+        Parameters specified here will be merged to the generated DNS configuration based on DNSPolicy.
+
+        :schema: io.k8s.api.core.v1.PodSpec#dnsConfig
+        '''
+        result = self._value_dns_config
+        return typing.cast(typing.Optional[PodDnsConfig], result)
+
+    @builtins.property
+    def dns_policy(self) -> typing.Optional[builtins.str]:
+        '''Set DNS policy for the pod.
+
+        Defaults to "ClusterFirst". Valid values are 'ClusterFirstWithHostNet', 'ClusterFirst', 'Default' or 'None'. DNS parameters given in DNSConfig will be merged with the policy selected with DNSPolicy. To have DNS options set along with hostNetwork, you have to specify DNS policy explicitly to 'ClusterFirstWithHostNet'.
+
+        :default: ClusterFirst". Valid values are 'ClusterFirstWithHostNet', 'ClusterFirst', 'Default' or 'None'. DNS parameters given in DNSConfig will be merged with the policy selected with DNSPolicy. To have DNS options set along with hostNetwork, you have to specify DNS policy explicitly to 'ClusterFirstWithHostNet'.
+
+        :schema: io.k8s.api.core.v1.PodSpec#dnsPolicy
+        '''
+        result = self._value_dns_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def enable_service_links(self) -> typing.Optional[builtins.bool]:
+        '''EnableServiceLinks indicates whether information about services should be injected into pod's environment variables, matching the syntax of Docker links.
+
+        Optional: Defaults to true.
+
+        :default: true.
+
+        :schema: io.k8s.api.core.v1.PodSpec#enableServiceLinks
+        '''
+        result = self._value_enable_service_links
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def ephemeral_containers(self) -> typing.Optional[typing.List[EphemeralContainer]]:
+        '''List of ephemeral containers run in this pod.
+
+        Ephemeral containers may be run in an existing pod to perform user-initiated actions such as debugging. This list cannot be specified when creating a pod, and it cannot be modified by updating the pod spec. In order to add an ephemeral container to an existing pod, use the pod's ephemeralcontainers subresource.
+
+        :schema: io.k8s.api.core.v1.PodSpec#ephemeralContainers
+        '''
+        result = self._value_ephemeral_containers
+        return typing.cast(typing.Optional[typing.List[EphemeralContainer]], result)
+
+    @builtins.property
+    def host_aliases(self) -> typing.Optional[typing.List[HostAlias]]:
+        '''HostAliases is an optional list of hosts and IPs that will be injected into the pod's hosts file if specified.
+
+        This is only valid for non-hostNetwork pods.
+
+        :schema: io.k8s.api.core.v1.PodSpec#hostAliases
+        '''
+        result = self._value_host_aliases
+        return typing.cast(typing.Optional[typing.List[HostAlias]], result)
+
+    @builtins.property
+    def host_ipc(self) -> typing.Optional[builtins.bool]:
+        '''Use the host's ipc namespace.
+
+        Optional: Default to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.PodSpec#hostIPC
+        '''
+        result = self._value_host_ipc
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def hostname(self) -> typing.Optional[builtins.str]:
+        '''Specifies the hostname of the Pod If not specified, the pod's hostname will be set to a system-defined value.
+
+        :schema: io.k8s.api.core.v1.PodSpec#hostname
+        '''
+        result = self._value_hostname
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def host_network(self) -> typing.Optional[builtins.bool]:
+        '''Host networking requested for this pod.
+
+        Use the host's network namespace. If this option is set, the ports that will be used must be specified. Default to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.PodSpec#hostNetwork
+        '''
+        result = self._value_host_network
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def host_pid(self) -> typing.Optional[builtins.bool]:
+        '''Use the host's pid namespace.
+
+        Optional: Default to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.PodSpec#hostPID
+        '''
+        result = self._value_host_pid
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def host_users(self) -> typing.Optional[builtins.bool]:
+        '''Use the host's user namespace.
+
+        Optional: Default to true. If set to true or not present, the pod will be run in the host user namespace, useful for when the pod needs a feature only available to the host user namespace, such as loading a kernel module with CAP_SYS_MODULE. When set to false, a new userns is created for the pod. Setting false is useful for mitigating container breakout vulnerabilities even allowing users to run their containers as root without actually having root privileges on the host. This field is alpha-level and is only honored by servers that enable the UserNamespacesSupport feature.
+
+        :default: true. If set to true or not present, the pod will be run in the host user namespace, useful for when the pod needs a feature only available to the host user namespace, such as loading a kernel module with CAP_SYS_MODULE. When set to false, a new userns is created for the pod. Setting false is useful for mitigating container breakout vulnerabilities even allowing users to run their containers as root without actually having root privileges on the host. This field is alpha-level and is only honored by servers that enable the UserNamespacesSupport feature.
+
+        :schema: io.k8s.api.core.v1.PodSpec#hostUsers
+        '''
+        result = self._value_host_users
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def image_pull_secrets(self) -> typing.Optional[typing.List[LocalObjectReference]]:
+        '''ImagePullSecrets is an optional list of references to secrets in the same namespace to use for pulling any of the images used by this PodSpec.
+
+        If specified, these secrets will be passed to individual puller implementations for them to use. More info: https://kubernetes.io/docs/concepts/containers/images#specifying-imagepullsecrets-on-a-pod
+
+        :schema: io.k8s.api.core.v1.PodSpec#imagePullSecrets
+        '''
+        result = self._value_image_pull_secrets
+        return typing.cast(typing.Optional[typing.List[LocalObjectReference]], result)
+
+    @builtins.property
+    def init_containers(self) -> typing.Optional[typing.List[Container]]:
+        '''List of initialization containers belonging to the pod.
+
+        Init containers are executed in order prior to containers being started. If any init container fails, the pod is considered to have failed and is handled according to its restartPolicy. The name for an init container or normal container must be unique among all containers. Init containers may not have Lifecycle actions, Readiness probes, Liveness probes, or Startup probes. The resourceRequirements of an init container are taken into account during scheduling by finding the highest request/limit for each resource type, and then using the max of of that value or the sum of the normal containers. Limits are applied to init containers in a similar fashion. Init containers cannot currently be added or removed. Cannot be updated. More info: https://kubernetes.io/docs/concepts/workloads/pods/init-containers/
+
+        :schema: io.k8s.api.core.v1.PodSpec#initContainers
+        '''
+        result = self._value_init_containers
+        return typing.cast(typing.Optional[typing.List[Container]], result)
+
+    @builtins.property
+    def node_name(self) -> typing.Optional[builtins.str]:
+        '''NodeName is a request to schedule this pod onto a specific node.
+
+        If it is non-empty, the scheduler simply schedules this pod onto that node, assuming that it fits resource requirements.
+
+        :schema: io.k8s.api.core.v1.PodSpec#nodeName
+        '''
+        result = self._value_node_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def node_selector(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''NodeSelector is a selector which must be true for the pod to fit on a node.
+
+        Selector which must match a node's labels for the pod to be scheduled on that node. More info: https://kubernetes.io/docs/concepts/configuration/assign-pod-node/
+
+        :schema: io.k8s.api.core.v1.PodSpec#nodeSelector
+        '''
+        result = self._value_node_selector
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def os(self) -> typing.Optional[PodOs]:
+        '''Specifies the OS of the containers in the pod.
+
+        Some pod and container fields are restricted if this is set.
+
+        If the OS field is set to linux, the following fields must be unset: -securityContext.windowsOptions
+
+        If the OS field is set to windows, following fields must be unset: - spec.hostPID - spec.hostIPC - spec.hostUsers - spec.securityContext.seLinuxOptions - spec.securityContext.seccompProfile - spec.securityContext.fsGroup - spec.securityContext.fsGroupChangePolicy - spec.securityContext.sysctls - spec.shareProcessNamespace - spec.securityContext.runAsUser - spec.securityContext.runAsGroup - spec.securityContext.supplementalGroups - spec.containers[*].securityContext.seLinuxOptions - spec.containers[*].securityContext.seccompProfile - spec.containers[*].securityContext.capabilities - spec.containers[*].securityContext.readOnlyRootFilesystem - spec.containers[*].securityContext.privileged - spec.containers[*].securityContext.allowPrivilegeEscalation - spec.containers[*].securityContext.procMount - spec.containers[*].securityContext.runAsUser - spec.containers[*].securityContext.runAsGroup
+
+        :schema: io.k8s.api.core.v1.PodSpec#os
+        '''
+        result = self._value_os
+        return typing.cast(typing.Optional[PodOs], result)
+
+    @builtins.property
+    def overhead(self) -> typing.Optional[typing.Mapping[builtins.str, "Quantity"]]:
+        '''Overhead represents the resource overhead associated with running a pod for a given RuntimeClass.
+
+        This field will be autopopulated at admission time by the RuntimeClass admission controller. If the RuntimeClass admission controller is enabled, overhead must not be set in Pod create requests. The RuntimeClass admission controller will reject Pod create requests which have the overhead already set. If RuntimeClass is configured and selected in the PodSpec, Overhead will be set to the value defined in the corresponding RuntimeClass, otherwise it will remain unset and treated as zero. More info: https://git.k8s.io/enhancements/keps/sig-node/688-pod-overhead/README.md
+
+        :schema: io.k8s.api.core.v1.PodSpec#overhead
+        '''
+        result = self._value_overhead
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, "Quantity"]], result)
+
+    @builtins.property
+    def preemption_policy(self) -> typing.Optional[builtins.str]:
+        '''PreemptionPolicy is the Policy for preempting pods with lower priority.
+
+        One of Never, PreemptLowerPriority. Defaults to PreemptLowerPriority if unset.
+
+        :default: PreemptLowerPriority if unset.
+
+        :schema: io.k8s.api.core.v1.PodSpec#preemptionPolicy
+        '''
+        result = self._value_preemption_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def priority(self) -> typing.Optional[jsii.Number]:
+        '''The priority value.
+
+        Various system components use this field to find the priority of the pod. When Priority Admission Controller is enabled, it prevents users from setting this field. The admission controller populates this field from PriorityClassName. The higher the value, the higher the priority.
+
+        :schema: io.k8s.api.core.v1.PodSpec#priority
+        '''
+        result = self._value_priority
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def priority_class_name(self) -> typing.Optional[builtins.str]:
+        '''If specified, indicates the pod's priority.
+
+        "system-node-critical" and "system-cluster-critical" are two special keywords which indicate the highest priorities with the former being the highest priority. Any other name must be defined by creating a PriorityClass object with that name. If not specified, the pod priority will be default or zero if there is no default.
+
+        :schema: io.k8s.api.core.v1.PodSpec#priorityClassName
+        '''
+        result = self._value_priority_class_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def readiness_gates(self) -> typing.Optional[typing.List[PodReadinessGate]]:
+        '''If specified, all readiness gates will be evaluated for pod readiness.
+
+        A pod is ready when all its containers are ready AND all conditions specified in the readiness gates have status equal to "True" More info: https://git.k8s.io/enhancements/keps/sig-network/580-pod-readiness-gates
+
+        :schema: io.k8s.api.core.v1.PodSpec#readinessGates
+        '''
+        result = self._value_readiness_gates
+        return typing.cast(typing.Optional[typing.List[PodReadinessGate]], result)
+
+    @builtins.property
+    def restart_policy(self) -> typing.Optional[builtins.str]:
+        '''Restart policy for all containers within the pod.
+
+        One of Always, OnFailure, Never. Default to Always. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#restart-policy
+
+        :default: Always. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle/#restart-policy
+
+        :schema: io.k8s.api.core.v1.PodSpec#restartPolicy
+        '''
+        result = self._value_restart_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def runtime_class_name(self) -> typing.Optional[builtins.str]:
+        '''RuntimeClassName refers to a RuntimeClass object in the node.k8s.io group, which should be used to run this pod.  If no RuntimeClass resource matches the named class, the pod will not be run. If unset or empty, the "legacy" RuntimeClass will be used, which is an implicit class with an empty definition that uses the default runtime handler. More info: https://git.k8s.io/enhancements/keps/sig-node/585-runtime-class.
+
+        :schema: io.k8s.api.core.v1.PodSpec#runtimeClassName
+        '''
+        result = self._value_runtime_class_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def scheduler_name(self) -> typing.Optional[builtins.str]:
+        '''If specified, the pod will be dispatched by specified scheduler.
+
+        If not specified, the pod will be dispatched by default scheduler.
+
+        :schema: io.k8s.api.core.v1.PodSpec#schedulerName
+        '''
+        result = self._value_scheduler_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def security_context(self) -> typing.Optional[PodSecurityContext]:
+        '''SecurityContext holds pod-level security attributes and common container settings.
+
+        Optional: Defaults to empty.  See type description for default values of each field.
+
+        :default: empty.  See type description for default values of each field.
+
+        :schema: io.k8s.api.core.v1.PodSpec#securityContext
+        '''
+        result = self._value_security_context
+        return typing.cast(typing.Optional[PodSecurityContext], result)
+
+    @builtins.property
+    def service_account(self) -> typing.Optional[builtins.str]:
+        '''DeprecatedServiceAccount is a depreciated alias for ServiceAccountName.
+
+        Deprecated: Use serviceAccountName instead.
+
+        :schema: io.k8s.api.core.v1.PodSpec#serviceAccount
+        '''
+        result = self._value_service_account
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def service_account_name(self) -> typing.Optional[builtins.str]:
+        '''ServiceAccountName is the name of the ServiceAccount to use to run this pod.
+
+        More info: https://kubernetes.io/docs/tasks/configure-pod-container/configure-service-account/
+
+        :schema: io.k8s.api.core.v1.PodSpec#serviceAccountName
+        '''
+        result = self._value_service_account_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def set_hostname_as_fqdn(self) -> typing.Optional[builtins.bool]:
+        '''If true the pod's hostname will be configured as the pod's FQDN, rather than the leaf name (the default).
+
+        In Linux containers, this means setting the FQDN in the hostname field of the kernel (the nodename field of struct utsname). In Windows containers, this means setting the registry value of hostname for the registry key HKEY_LOCAL_MACHINE\\SYSTEM\\CurrentControlSet\\Services\\Tcpip\\Parameters to FQDN. If a pod does not have FQDN, this has no effect. Default to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.PodSpec#setHostnameAsFQDN
+        '''
+        result = self._value_set_hostname_as_fqdn
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def share_process_namespace(self) -> typing.Optional[builtins.bool]:
+        '''Share a single process namespace between all of the containers in a pod.
+
+        When this is set containers will be able to view and signal processes from other containers in the same pod, and the first process in each container will not be assigned PID 1. HostPID and ShareProcessNamespace cannot both be set. Optional: Default to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.PodSpec#shareProcessNamespace
+        '''
+        result = self._value_share_process_namespace
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def subdomain(self) -> typing.Optional[builtins.str]:
+        '''If specified, the fully qualified Pod hostname will be "...svc.". If not specified, the pod will not have a domainname at all.
+
+        :schema: io.k8s.api.core.v1.PodSpec#subdomain
+        '''
+        result = self._value_subdomain
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def termination_grace_period_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Optional duration in seconds the pod needs to terminate gracefully.
+
+        May be decreased in delete request. Value must be non-negative integer. The value zero indicates stop immediately via the kill signal (no opportunity to shut down). If this value is nil, the default grace period will be used instead. The grace period is the duration in seconds after the processes running in the pod are sent a termination signal and the time when the processes are forcibly halted with a kill signal. Set this value longer than the expected cleanup time for your process. Defaults to 30 seconds.
+
+        :default: 30 seconds.
+
+        :schema: io.k8s.api.core.v1.PodSpec#terminationGracePeriodSeconds
+        '''
+        result = self._value_termination_grace_period_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def tolerations(self) -> typing.Optional[typing.List["Toleration"]]:
+        '''If specified, the pod's tolerations.
+
+        :schema: io.k8s.api.core.v1.PodSpec#tolerations
+        '''
+        result = self._value_tolerations
+        return typing.cast(typing.Optional[typing.List["Toleration"]], result)
+
+    @builtins.property
+    def topology_spread_constraints(
+        self,
+    ) -> typing.Optional[typing.List["TopologySpreadConstraint"]]:
+        '''TopologySpreadConstraints describes how a group of pods ought to spread across topology domains.
+
+        Scheduler will schedule pods in a way which abides by the constraints. All topologySpreadConstraints are ANDed.
+
+        :schema: io.k8s.api.core.v1.PodSpec#topologySpreadConstraints
+        '''
+        result = self._value_topology_spread_constraints
+        return typing.cast(typing.Optional[typing.List["TopologySpreadConstraint"]], result)
+
+    @builtins.property
+    def volumes(self) -> typing.Optional[typing.List["Volume"]]:
+        '''List of volumes that can be mounted by containers belonging to the pod.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes
+
+        :schema: io.k8s.api.core.v1.PodSpec#volumes
+        '''
+        result = self._value_volumes
+        return typing.cast(typing.Optional[typing.List["Volume"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "containers": self._value_containers,
+        }
+        if self._value_active_deadline_seconds is not None:
+            values["active_deadline_seconds"] = self._value_active_deadline_seconds
+        if self._value_affinity is not None:
+            values["affinity"] = self._value_affinity
+        if self._value_automount_service_account_token is not None:
+            values["automount_service_account_token"] = self._value_automount_service_account_token
+        if self._value_dns_config is not None:
+            values["dns_config"] = self._value_dns_config
+        if self._value_dns_policy is not None:
+            values["dns_policy"] = self._value_dns_policy
+        if self._value_enable_service_links is not None:
+            values["enable_service_links"] = self._value_enable_service_links
+        if self._value_ephemeral_containers is not None:
+            values["ephemeral_containers"] = self._value_ephemeral_containers
+        if self._value_host_aliases is not None:
+            values["host_aliases"] = self._value_host_aliases
+        if self._value_host_ipc is not None:
+            values["host_ipc"] = self._value_host_ipc
+        if self._value_hostname is not None:
+            values["hostname"] = self._value_hostname
+        if self._value_host_network is not None:
+            values["host_network"] = self._value_host_network
+        if self._value_host_pid is not None:
+            values["host_pid"] = self._value_host_pid
+        if self._value_host_users is not None:
+            values["host_users"] = self._value_host_users
+        if self._value_image_pull_secrets is not None:
+            values["image_pull_secrets"] = self._value_image_pull_secrets
+        if self._value_init_containers is not None:
+            values["init_containers"] = self._value_init_containers
+        if self._value_node_name is not None:
+            values["node_name"] = self._value_node_name
+        if self._value_node_selector is not None:
+            values["node_selector"] = self._value_node_selector
+        if self._value_os is not None:
+            values["os"] = self._value_os
+        if self._value_overhead is not None:
+            values["overhead"] = self._value_overhead
+        if self._value_preemption_policy is not None:
+            values["preemption_policy"] = self._value_preemption_policy
+        if self._value_priority is not None:
+            values["priority"] = self._value_priority
+        if self._value_priority_class_name is not None:
+            values["priority_class_name"] = self._value_priority_class_name
+        if self._value_readiness_gates is not None:
+            values["readiness_gates"] = self._value_readiness_gates
+        if self._value_restart_policy is not None:
+            values["restart_policy"] = self._value_restart_policy
+        if self._value_runtime_class_name is not None:
+            values["runtime_class_name"] = self._value_runtime_class_name
+        if self._value_scheduler_name is not None:
+            values["scheduler_name"] = self._value_scheduler_name
+        if self._value_security_context is not None:
+            values["security_context"] = self._value_security_context
+        if self._value_service_account is not None:
+            values["service_account"] = self._value_service_account
+        if self._value_service_account_name is not None:
+            values["service_account_name"] = self._value_service_account_name
+        if self._value_set_hostname_as_fqdn is not None:
+            values["set_hostname_as_fqdn"] = self._value_set_hostname_as_fqdn
+        if self._value_share_process_namespace is not None:
+            values["share_process_namespace"] = self._value_share_process_namespace
+        if self._value_subdomain is not None:
+            values["subdomain"] = self._value_subdomain
+        if self._value_termination_grace_period_seconds is not None:
+            values["termination_grace_period_seconds"] = self._value_termination_grace_period_seconds
+        if self._value_tolerations is not None:
+            values["tolerations"] = self._value_tolerations
+        if self._value_topology_spread_constraints is not None:
+            values["topology_spread_constraints"] = self._value_topology_spread_constraints
+        if self._value_volumes is not None:
+            values["volumes"] = self._value_volumes
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__9ddad62f26f59d5b393ec9c7814efae31dbad75f06f4456a0bef61a6ce7dd763(
+    *,
+    containers: typing.Sequence[typing.Union[Container, typing.Dict[builtins.str, typing.Any]]],
+    active_deadline_seconds: typing.Optional[jsii.Number] = None,
+    affinity: typing.Optional[typing.Union[Affinity, typing.Dict[builtins.str, typing.Any]]] = None,
+    automount_service_account_token: typing.Optional[builtins.bool] = None,
+    dns_config: typing.Optional[typing.Union[PodDnsConfig, typing.Dict[builtins.str, typing.Any]]] = None,
+    dns_policy: typing.Optional[builtins.str] = None,
+    enable_service_links: typing.Optional[builtins.bool] = None,
+    ephemeral_containers: typing.Optional[typing.Sequence[typing.Union[EphemeralContainer, typing.Dict[builtins.str, typing.Any]]]] = None,
+    host_aliases: typing.Optional[typing.Sequence[typing.Union[HostAlias, typing.Dict[builtins.str, typing.Any]]]] = None,
+    host_ipc: typing.Optional[builtins.bool] = None,
+    hostname: typing.Optional[builtins.str] = None,
+    host_network: typing.Optional[builtins.bool] = None,
+    host_pid: typing.Optional[builtins.bool] = None,
+    host_users: typing.Optional[builtins.bool] = None,
+    image_pull_secrets: typing.Optional[typing.Sequence[typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]]]] = None,
+    init_containers: typing.Optional[typing.Sequence[typing.Union[Container, typing.Dict[builtins.str, typing.Any]]]] = None,
+    node_name: typing.Optional[builtins.str] = None,
+    node_selector: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    os: typing.Optional[typing.Union[PodOs, typing.Dict[builtins.str, typing.Any]]] = None,
+    overhead: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    preemption_policy: typing.Optional[builtins.str] = None,
+    priority: typing.Optional[jsii.Number] = None,
+    priority_class_name: typing.Optional[builtins.str] = None,
+    readiness_gates: typing.Optional[typing.Sequence[typing.Union[PodReadinessGate, typing.Dict[builtins.str, typing.Any]]]] = None,
+    restart_policy: typing.Optional[builtins.str] = None,
+    runtime_class_name: typing.Optional[builtins.str] = None,
+    scheduler_name: typing.Optional[builtins.str] = None,
+    security_context: typing.Optional[typing.Union[PodSecurityContext, typing.Dict[builtins.str, typing.Any]]] = None,
+    service_account: typing.Optional[builtins.str] = None,
+    service_account_name: typing.Optional[builtins.str] = None,
+    set_hostname_as_fqdn: typing.Optional[builtins.bool] = None,
+    share_process_namespace: typing.Optional[builtins.bool] = None,
+    subdomain: typing.Optional[builtins.str] = None,
+    termination_grace_period_seconds: typing.Optional[jsii.Number] = None,
+    tolerations: typing.Optional[typing.Sequence[typing.Union[Toleration, typing.Dict[builtins.str, typing.Any]]]] = None,
+    topology_spread_constraints: typing.Optional[typing.Sequence[typing.Union[TopologySpreadConstraint, typing.Dict[builtins.str, typing.Any]]]] = None,
+    volumes: typing.Optional[typing.Sequence[typing.Union[Volume, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
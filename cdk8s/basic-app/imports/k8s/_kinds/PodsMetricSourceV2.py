@@ -0,0 +1,105 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .MetricIdentifierV2 import MetricIdentifierV2
+from .MetricTargetV2 import MetricTargetV2
+
+
+@jsii.data_type(
+    jsii_type="k8s.PodsMetricSourceV2",
+    jsii_struct_bases=[],
+    name_mapping={"metric": "metric", "target": "target"},
+)
+class PodsMetricSourceV2(_base.Struct):
+    __slots__ = (
+        "_value_metric",
+        "_value_target",
+    )
+
+    def __init__(
+        self,
+        *,
+        metric: typing.Union[MetricIdentifierV2, typing.Dict[builtins.str, typing.Any]],
+        target: typing.Union[MetricTargetV2, typing.Dict[builtins.str, typing.Any]],
+    ) -> None:
+        '''PodsMetricSource indicates how to scale on a metric describing each pod in the current scale target (for example, transactions-processed-per-second).
+
+        The values will be averaged together before being compared to the target value.
+
+        :param metric: metric identifies the target metric by name and selector.
+        :param target: target specifies the target value for the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2.PodsMetricSource
+        '''
+        if isinstance(metric, dict):
+            metric = MetricIdentifierV2(**metric)
+        if isinstance(target, dict):
+            target = MetricTargetV2(**target)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__4e1daa232feea2f9ba7daaf3807ee414905ce98c0d3805ab6cd957f8405729b3)
+            check_type(argname="argument metric", value=metric, expected_type=type_hints["metric"])
+            check_type(argname="argument target", value=target, expected_type=type_hints["target"])
+        self._value_metric = metric
+        self._value_target = target
+
+    @builtins.property
+    def metric(self) -> MetricIdentifierV2:
+        '''metric identifies the target metric by name and selector.
+
+        :schema: io.k8s.api.autoscaling.v2.PodsMetricSource#metric
+        '''
+        result = self._value_metric
+        assert result is not None, "Required property 'metric' is missing"
+        return typing.cast(MetricIdentifierV2, result)
+
+    @builtins.property
+    def target(self) -> MetricTargetV2:
+        '''target specifies the target value for the given metric.
+
+        :schema: io.k8s.api.autoscaling.v2.PodsMetricSource#target
+        '''
+        result = self._value_target
+        assert result is not None, "Required property 'target' is missing"
+        return typing.cast(MetricTargetV2, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "metric": self._value_metric,
+            "target": self._value_target,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PodsMetricSourceV2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__4e1daa232feea2f9ba7daaf3807ee414905ce98c0d3805ab6cd957f8405729b3(
+    *,
+    metric: typing.Union[MetricIdentifierV2, typing.Dict[builtins.str, typing.Any]],
+    target: typing.Union[MetricTargetV2, typing.Dict[builtins.str, typing.Any]],
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,164 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.PolicyRule",
+    jsii_struct_bases=[],
+    name_mapping={
+        "verbs": "verbs",
+        "api_groups": "apiGroups",
+        "non_resource_ur_ls": "nonResourceUrLs",
+        "resource_names": "resourceNames",
+        "resources": "resources",
+    },
+)
+class PolicyRule(_base.Struct):
+    __slots__ = (
+        "_value_verbs",
+        "_value_api_groups",
+        "_value_non_resource_ur_ls",
+        "_value_resource_names",
+        "_value_resources",
+    )
+
+    def __init__(
+        self,
+        *,
+        verbs: typing.Sequence[builtins.str],
+        api_groups: typing.Optional[typing.Sequence[builtins.str]] = None,
+        non_resource_ur_ls: typing.Optional[typing.Sequence[builtins.str]] = None,
+        resource_names: typing.Optional[typing.Sequence[builtins.str]] = None,
+        resources: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''PolicyRule holds information that describes a policy rule, but does not contain information about who the rule applies to or which namespace the rule applies to.
+
+        :param verbs: Verbs is a list of Verbs that apply to ALL the ResourceKinds contained in this rule. '*' represents all verbs.
+        :param api_groups: APIGroups is the name of the APIGroup that contains the resources. If multiple API groups are specified, any action requested against one of the enumerated resources in any API group will be allowed. "" represents the core API group and "*" represents all API groups.
+        :param non_resource_ur_ls: NonResourceURLs is a set of partial urls that a user should have access to. *s are allowed, but only as the full, final step in the path Since non-resource URLs are not namespaced, this field is only applicable for ClusterRoles referenced from a ClusterRoleBinding. Rules can either apply to API resources (such as "pods" or "secrets") or non-resource URL paths (such as "/api"), but not both.
+        :param resource_names: ResourceNames is an optional white list of names that the rule applies to. An empty set means that everything is allowed.
+        :param resources: Resources is a list of resources this rule applies to. '*' represents all resources.
+
+        :schema: io.k8s.api.rbac.v1.PolicyRule
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__faa1080f7a02c3d2eac7f18aad0cdbef93f8f9cff0f9825224a9dd8a829faf0a)
+            check_type(argname="argument verbs", value=verbs, expected_type=type_hints["verbs"])
+            check_type(argname="argument api_groups", value=api_groups, expected_type=type_hints["api_groups"])
+            check_type(argname="argument non_resource_ur_ls", value=non_resource_ur_ls, expected_type=type_hints["non_resource_ur_ls"])
+            check_type(argname="argument resource_names", value=resource_names, expected_type=type_hints["resource_names"])
+            check_type(argname="argument resources", value=resources, expected_type=type_hints["resources"])
+        self._value_verbs = verbs
+        self._value_api_groups = api_groups
+        self._value_non_resource_ur_ls = non_resource_ur_ls
+        self._value_resource_names = resource_names
+        self._value_resources = resources
+
+    @builtins.property
+    def verbs(self) -> typing.List[builtins.str]:
+        '''Verbs is a list of Verbs that apply to ALL the ResourceKinds contained in this rule.
+
+        '*' represents all verbs.
+
+        :schema: io.k8s.api.rbac.v1.PolicyRule#verbs
+        '''
+        result = self._value_verbs
+        assert result is not None, "Required property 'verbs' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def api_groups(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''APIGroups is the name of the APIGroup that contains the resources.
+
+        If multiple API groups are specified, any action requested against one of the enumerated resources in any API group will be allowed. "" represents the core API group and "*" represents all API groups.
+
+        :schema: io.k8s.api.rbac.v1.PolicyRule#apiGroups
+        '''
+        result = self._value_api_groups
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def non_resource_ur_ls(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''NonResourceURLs is a set of partial urls that a user should have access to.
+
+        *s are allowed, but only as the full, final step in the path Since non-resource URLs are not namespaced, this field is only applicable for ClusterRoles referenced from a ClusterRoleBinding. Rules can either apply to API resources (such as "pods" or "secrets") or non-resource URL paths (such as "/api"),  but not both.
+
+        :schema: io.k8s.api.rbac.v1.PolicyRule#nonResourceURLs
+        '''
+        result = self._value_non_resource_ur_ls
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def resource_names(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''ResourceNames is an optional white list of names that the rule applies to.
+
+        An empty set means that everything is allowed.
+
+        :schema: io.k8s.api.rbac.v1.PolicyRule#resourceNames
+        '''
+        result = self._value_resource_names
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def resources(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Resources is a list of resources this rule applies to.
+
+        '*' represents all resources.
+
+        :schema: io.k8s.api.rbac.v1.PolicyRule#resources
+        '''
+        result = self._value_resources
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "verbs": self._value_verbs,
+        }
+        if self._value_api_groups is not None:
+            values["api_groups"] = self._value_api_groups
+        if self._value_non_resource_ur_ls is not None:
+            values["non_resource_ur_ls"] = self._value_non_resource_ur_ls
+        if self._value_resource_names is not None:
+            values["resource_names"] = self._value_resource_names
+        if self._value_resources is not None:
+            values["resources"] = self._value_resources
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PolicyRule(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__faa1080f7a02c3d2eac7f18aad0cdbef93f8f9cff0f9825224a9dd8a829faf0a(
+    *,
+    verbs: typing.Sequence[builtins.str],
+    api_groups: typing.Optional[typing.Sequence[builtins.str]] = None,
+    non_resource_ur_ls: typing.Optional[typing.Sequence[builtins.str]] = None,
+    resource_names: typing.Optional[typing.Sequence[builtins.str]] = None,
+    resources: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,131 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NonResourcePolicyRuleV1Beta1 import NonResourcePolicyRuleV1Beta1
+from .ResourcePolicyRuleV1Beta1 import ResourcePolicyRuleV1Beta1
+from .SubjectV1Beta1 import SubjectV1Beta1
+
+
+@jsii.data_type(
+    jsii_type="k8s.PolicyRulesWithSubjectsV1Beta1",
+    jsii_struct_bases=[],
+    name_mapping={
+        "subjects": "subjects",
+        "non_resource_rules": "nonResourceRules",
+        "resource_rules": "resourceRules",
+    },
+)
+class PolicyRulesWithSubjectsV1Beta1(_base.Struct):
+    __slots__ = (
+        "_value_subjects",
+        "_value_non_resource_rules",
+        "_value_resource_rules",
+    )
+
+    def __init__(
+        self,
+        *,
+        subjects: typing.Sequence[typing.Union["SubjectV1Beta1", typing.Dict[builtins.str, typing.Any]]],
+        non_resource_rules: typing.Optional[typing.Sequence[typing.Union[NonResourcePolicyRuleV1Beta1, typing.Dict[builtins.str, typing.Any]]]] = None,
+        resource_rules: typing.Optional[typing.Sequence[typing.Union["ResourcePolicyRuleV1Beta1", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''PolicyRulesWithSubjects prescribes a test that applies to a request to an apiserver.
+
+        The test considers the subject making the request, the verb being requested, and the resource to be acted upon. This PolicyRulesWithSubjects matches a request if and only if both (a) at least one member of subjects matches the request and (b) at least one member of resourceRules or nonResourceRules matches the request.
+
+        :param subjects: subjects is the list of normal user, serviceaccount, or group that this rule cares about. There must be at least one member in this slice. A slice that includes both the system:authenticated and system:unauthenticated user groups matches every request. Required.
+        :param non_resource_rules: ``nonResourceRules`` is a list of NonResourcePolicyRules that identify matching requests according to their verb and the target non-resource URL.
+        :param resource_rules: ``resourceRules`` is a slice of ResourcePolicyRules that identify matching requests according to their verb and the target resource. At least one of ``resourceRules`` and ``nonResourceRules`` has to be non-empty.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.PolicyRulesWithSubjects
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__406eb14bf98c8f3f6931d191e32e945ebfe5d267e0bb9e0517475a1bf2c6833b)
+            check_type(argname="argument subjects", value=subjects, expected_type=type_hints["subjects"])
+            check_type(argname="argument non_resource_rules", value=non_resource_rules, expected_type=type_hints["non_resource_rules"])
+            check_type(argname="argument resource_rules", value=resource_rules, expected_type=type_hints["resource_rules"])
+        self._value_subjects = subjects
+        self._value_non_resource_rules = non_resource_rules
+        self._value_resource_rules = resource_rules
+
+    @builtins.property
+    def subjects(self) -> typing.List["SubjectV1Beta1"]:
+        '''subjects is the list of normal user, serviceaccount, or group that this rule cares about.
+
+        There must be at least one member in this slice. A slice that includes both the system:authenticated and system:unauthenticated user groups matches every request. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.PolicyRulesWithSubjects#subjects
+        '''
+        result = self._value_subjects
+        assert result is not None, "Required property 'subjects' is missing"
+        return typing.cast(typing.List["SubjectV1Beta1"], result)
+
+    @builtins.property
+    def non_resource_rules(
+        self,
+    ) -> typing.Optional[typing.List[NonResourcePolicyRuleV1Beta1]]:
+        '''``nonResourceRules`` is a list of NonResourcePolicyRules that identify matching requests according to their verb and the target non-resource URL.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.PolicyRulesWithSubjects#nonResourceRules
+        '''
+        result = self._value_non_resource_rules
+        return typing.cast(typing.Optional[typing.List[NonResourcePolicyRuleV1Beta1]], result)
+
+    @builtins.property
+    def resource_rules(
+        self,
+    ) -> typing.Optional[typing.List["ResourcePolicyRuleV1Beta1"]]:
+        '''``resourceRules`` is a slice of ResourcePolicyRules that identify matching requests according to their verb and the target resource.
+
+        At least one of ``resourceRules`` and ``nonResourceRules`` has to be non-empty.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.PolicyRulesWithSubjects#resourceRules
+        '''
+        result = self._value_resource_rules
+        return typing.cast(typing.Optional[typing.List["ResourcePolicyRuleV1Beta1"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "subjects": self._value_subjects,
+        }
+        if self._value_non_resource_rules is not None:
+            values["non_resource_rules"] = self._value_non_resource_rules
+        if self._value_resource_rules is not None:
+            values["resource_rules"] = self._value_resource_rules
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PolicyRulesWithSubjectsV1Beta1(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__406eb14bf98c8f3f6931d191e32e945ebfe5d267e0bb9e0517475a1bf2c6833b(
+    *,
+    subjects: typing.Sequence[typing.Union[SubjectV1Beta1, typing.Dict[builtins.str, typing.Any]]],
+    non_resource_rules: typing.Optional[typing.Sequence[typing.Union[NonResourcePolicyRuleV1Beta1, typing.Dict[builtins.str, typing.Any]]]] = None,
+    resource_rules: typing.Optional[typing.Sequence[typing.Union[ResourcePolicyRuleV1Beta1, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,96 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.Preconditions",
+    jsii_struct_bases=[],
+    name_mapping={"resource_version": "resourceVersion", "uid": "uid"},
+)
+class Preconditions(_base.Struct):
+    __slots__ = (
+        "_value_resource_version",
+        "_value_uid",
+    )
+
+    def __init__(
+        self,
+        *,
+        resource_version: typing.Optional[builtins.str] = None,
+        uid: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Preconditions must be fulfilled before an operation (update, delete, etc.) is carried out.
+
+        :param resource_version: Specifies the target ResourceVersion.
+        :param uid: Specifies the target UID.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Preconditions
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__5d83cea33916e66ca6553e6bdfe2c022d25c2d9b0d13a46f323bef2db497363e)
+            check_type(argname="argument resource_version", value=resource_version, expected_type=type_hints["resource_version"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+        self._value_resource_version = resource_version
+        self._value_uid = uid
+
+    @builtins.property
+    def resource_version(self) -> typing.Optional[builtins.str]:
+        '''Specifies the target ResourceVersion.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Preconditions#resourceVersion
+        '''
+        result = self._value_resource_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def uid(self) -> typing.Optional[builtins.str]:
+        '''Specifies the target UID.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.Preconditions#uid
+        '''
+        result = self._value_uid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_resource_version is not None:
+            values["resource_version"] = self._value_resource_version
+        if self._value_uid is not None:
+            values["uid"] = self._value_uid
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Preconditions(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__5d83cea33916e66ca6553e6bdfe2c022d25c2d9b0d13a46f323bef2db497363e(
+    *,
+    resource_version: typing.Optional[builtins.str] = None,
+    uid: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,100 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NodeSelectorTerm import NodeSelectorTerm
+
+
+@jsii.data_type(
+    jsii_type="k8s.PreferredSchedulingTerm",
+    jsii_struct_bases=[],
+    name_mapping={"preference": "preference", "weight": "weight"},
+)
+class PreferredSchedulingTerm(_base.Struct):
+    __slots__ = (
+        "_value_preference",
+        "_value_weight",
+    )
+
+    def __init__(
+        self,
+        *,
+        preference: typing.Union[NodeSelectorTerm, typing.Dict[builtins.str, typing.Any]],
+        weight: jsii.Number,
+    ) -> None:
+        '''An empty preferred scheduling term matches all objects with implicit weight 0 (i.e. it's a no-op). A null preferred scheduling term matches no objects (i.e. is also a no-op).
+
+        :param preference: A node selector term, associated with the corresponding weight.
+        :param weight: Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
+
+        :schema: io.k8s.api.core.v1.PreferredSchedulingTerm
+        '''
+        if isinstance(preference, dict):
+            preference = NodeSelectorTerm(**preference)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__4778017af685ac589aca31cd5f8aed67ddd4b8d050f99423b40b402a8758f9df)
+            check_type(argname="argument preference", value=preference, expected_type=type_hints["preference"])
+            check_type(argname="argument weight", value=weight, expected_type=type_hints["weight"])
+        self._value_preference = preference
+        self._value_weight = weight
+
+    @builtins.property
+    def preference(self) -> NodeSelectorTerm:
+        '''A node selector term, associated with the corresponding weight.
+
+        :schema: io.k8s.api.core.v1.PreferredSchedulingTerm#preference
+        '''
+        result = self._value_preference
+        assert result is not None, "Required property 'preference' is missing"
+        return typing.cast(NodeSelectorTerm, result)
+
+    @builtins.property
+    def weight(self) -> jsii.Number:
+        '''Weight associated with matching the corresponding nodeSelectorTerm, in the range 1-100.
+
+        :schema: io.k8s.api.core.v1.PreferredSchedulingTerm#weight
+        '''
+        result = self._value_weight
+        assert result is not None, "Required property 'weight' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "preference": self._value_preference,
+            "weight": self._value_weight,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PreferredSchedulingTerm(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__4778017af685ac589aca31cd5f8aed67ddd4b8d050f99423b40b402a8758f9df(
+    *,
+    preference: typing.Union[NodeSelectorTerm, typing.Dict[builtins.str, typing.Any]],
+    weight: jsii.Number,
+) -> None:
+    """Type checking stubs"""
+    pass
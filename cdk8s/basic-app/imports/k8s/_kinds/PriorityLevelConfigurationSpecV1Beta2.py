@@ -0,0 +1,104 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LimitedPriorityLevelConfigurationV1Beta2 import LimitedPriorityLevelConfigurationV1Beta2
+
+
+@jsii.data_type(
+    jsii_type="k8s.PriorityLevelConfigurationSpecV1Beta2",
+    jsii_struct_bases=[],
+    name_mapping={"type": "type", "limited": "limited"},
+)
+class PriorityLevelConfigurationSpecV1Beta2(_base.Struct):
+    __slots__ = (
+        "_value_type",
+        "_value_limited",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: builtins.str,
+        limited: typing.Optional[typing.Union[LimitedPriorityLevelConfigurationV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''PriorityLevelConfigurationSpec specifies the configuration of a priority level.
+
+        :param type: ``type`` indicates whether this priority level is subject to limitation on request execution. A value of ``"Exempt"`` means that requests of this priority level are not subject to a limit (and thus are never queued) and do not detract from the capacity made available to other priority levels. A value of ``"Limited"`` means that (a) requests of this priority level *are* subject to limits and (b) some of the server's limited capacity is made available exclusively to this priority level. Required.
+        :param limited: ``limited`` specifies how requests are handled for a Limited priority level. This field must be non-empty if and only if ``type`` is ``"Limited"``.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.PriorityLevelConfigurationSpec
+        '''
+        if isinstance(limited, dict):
+            limited = LimitedPriorityLevelConfigurationV1Beta2(**limited)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__94bca280ba8f7fad3c10c340b8cf6039d7a0f6cbd700ea283a8eeb4f1a9bdaad)
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument limited", value=limited, expected_type=type_hints["limited"])
+        self._value_type = type
+        self._value_limited = limited
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''``type`` indicates whether this priority level is subject to limitation on request execution.
+
+        A value of ``"Exempt"`` means that requests of this priority level are not subject to a limit (and thus are never queued) and do not detract from the capacity made available to other priority levels.  A value of ``"Limited"`` means that (a) requests of this priority level *are* subject to limits and (b) some of the server's limited capacity is made available exclusively to this priority level. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.PriorityLevelConfigurationSpec#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def limited(self) -> typing.Optional[LimitedPriorityLevelConfigurationV1Beta2]:
+        '''``limited`` specifies how requests are handled for a Limited priority level.
+
+        This field must be non-empty if and only if ``type`` is ``"Limited"``.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.PriorityLevelConfigurationSpec#limited
+        '''
+        result = self._value_limited
+        return typing.cast(typing.Optional[LimitedPriorityLevelConfigurationV1Beta2], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "type": self._value_type,
+        }
+        if self._value_limited is not None:
+            values["limited"] = self._value_limited
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "PriorityLevelConfigurationSpecV1Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__94bca280ba8f7fad3c10c340b8cf6039d7a0f6cbd700ea283a8eeb4f1a9bdaad(
+    *,
+    type: builtins.str,
+    limited: typing.Optional[typing.Union[LimitedPriorityLevelConfigurationV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
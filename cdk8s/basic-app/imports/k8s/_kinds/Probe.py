@@ -0,0 +1,277 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ExecAction import ExecAction
+from .GrpcAction import GrpcAction
+from .HttpGetAction import HttpGetAction
+from .TcpSocketAction import TcpSocketAction
+
+
+@jsii.data_type(
+    jsii_type="k8s.Probe",
+    jsii_struct_bases=[],
+    name_mapping={
+        "exec": "exec",
+        "failure_threshold": "failureThreshold",
+        "grpc": "grpc",
+        "http_get": "httpGet",
+        "initial_delay_seconds": "initialDelaySeconds",
+        "period_seconds": "periodSeconds",
+        "success_threshold": "successThreshold",
+        "tcp_socket": "tcpSocket",
+        "termination_grace_period_seconds": "terminationGracePeriodSeconds",
+        "timeout_seconds": "timeoutSeconds",
+    },
+)
+class Probe(_base.Struct):
+    __slots__ = (
+        "_value_exec",
+        "_value_failure_threshold",
+        "_value_grpc",
+        "_value_http_get",
+        "_value_initial_delay_seconds",
+        "_value_period_seconds",
+        "_value_success_threshold",
+        "_value_tcp_socket",
+        "_value_termination_grace_period_seconds",
+        "_value_timeout_seconds",
+    )
+
+    def __init__(
+        self,
+        *,
+        exec: typing.Optional[typing.Union[ExecAction, typing.Dict[builtins.str, typing.Any]]] = None,
+        failure_threshold: typing.Optional[jsii.Number] = None,
+        grpc: typing.Optional[typing.Union[GrpcAction, typing.Dict[builtins.str, typing.Any]]] = None,
+        http_get: typing.Optional[typing.Union[HttpGetAction, typing.Dict[builtins.str, typing.Any]]] = None,
+        initial_delay_seconds: typing.Optional[jsii.Number] = None,
+        period_seconds: typing.Optional[jsii.Number] = None,
+        success_threshold: typing.Optional[jsii.Number] = None,
+        tcp_socket: typing.Optional[typing.Union["TcpSocketAction", typing.Dict[builtins.str, typing.Any]]] = None,
+        termination_grace_period_seconds: typing.Optional[jsii.Number] = None,
+        timeout_seconds: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''Probe describes a health check to be performed against a container to determine whether it is alive or ready to receive traffic.
+
+        :param exec: Exec specifies the action to take.
+        :param failure_threshold: Minimum consecutive failures for the probe to be considered failed after having succeeded. Defaults to 3. Minimum value is 1. Default: 3. Minimum value is 1.
+        :param grpc: GRPC specifies an action involving a GRPC port. This is a beta field and requires enabling GRPCContainerProbe feature gate.
+        :param http_get: HTTPGet specifies the http request to perform.
+        :param initial_delay_seconds: Number of seconds after the container has started before liveness probes are initiated. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes
+        :param period_seconds: How often (in seconds) to perform the probe. Default to 10 seconds. Minimum value is 1. Default: 10 seconds. Minimum value is 1.
+        :param success_threshold: Minimum consecutive successes for the probe to be considered successful after having failed. Defaults to 1. Must be 1 for liveness and startup. Minimum value is 1. Default: 1. Must be 1 for liveness and startup. Minimum value is 1.
+        :param tcp_socket: TCPSocket specifies an action involving a TCP port.
+        :param termination_grace_period_seconds: Optional duration in seconds the pod needs to terminate gracefully upon probe failure. The grace period is the duration in seconds after the processes running in the pod are sent a termination signal and the time when the processes are forcibly halted with a kill signal. Set this value longer than the expected cleanup time for your process. If this value is nil, the pod's terminationGracePeriodSeconds will be used. Otherwise, this value overrides the value provided by the pod spec. Value must be non-negative integer. The value zero indicates stop immediately via the kill signal (no opportunity to shut down). This is a beta field and requires enabling ProbeTerminationGracePeriod feature gate. Minimum value is 1. spec.terminationGracePeriodSeconds is used if unset.
+        :param timeout_seconds: Number of seconds after which the probe times out. Defaults to 1 second. Minimum value is 1. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes Default: 1 second. Minimum value is 1. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes
+
+        :schema: io.k8s.api.core.v1.Probe
+        '''
+        if isinstance(exec, dict):
+            exec = ExecAction(**exec)
+        if isinstance(grpc, dict):
+            grpc = GrpcAction(**grpc)
+        if isinstance(http_get, dict):
+            http_get = HttpGetAction(**http_get)
+        if isinstance(tcp_socket, dict):
+            tcp_socket = TcpSocketAction(**tcp_socket)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__db09437a4be3e51aba0181b1494c0c550aa4867813268b893ac716f115fa48c1)
+            check_type(argname="argument exec", value=exec, expected_type=type_hints["exec"])
+            check_type(argname="argument failure_threshold", value=failure_threshold, expected_type=type_hints["failure_threshold"])
+            check_type(argname="argument grpc", value=grpc, expected_type=type_hints["grpc"])
+            check_type(argname="argument http_get", value=http_get, expected_type=type_hints["http_get"])
+            check_type(argname="argument initial_delay_seconds", value=initial_delay_seconds, expected_type=type_hints["initial_delay_seconds"])
+            check_type(argname="argument period_seconds", value=period_seconds, expected_type=type_hints["period_seconds"])
+            check_type(argname="argument success_threshold", value=success_threshold, expected_type=type_hints["success_threshold"])
+            check_type(argname="argument tcp_socket", value=tcp_socket, expected_type=type_hints["tcp_socket"])
+            check_type(argname="argument termination_grace_period_seconds", value=termination_grace_period_seconds, expected_type=type_hints["termination_grace_period_seconds"])
+            check_type(argname="argument timeout_seconds", value=timeout_seconds, expected_type=type_hints["timeout_seconds"])
+        self._value_exec = exec
+        self._value_failure_threshold = failure_threshold
+        self._value_grpc = grpc
+        self._value_http_get = http_get
+        self._value_initial_delay_seconds = initial_delay_seconds
+        self._value_period_seconds = period_seconds
+        self._value_success_threshold = success_threshold
+        self._value_tcp_socket = tcp_socket
+        self._value_termination_grace_period_seconds = termination_grace_period_seconds
+        self._value_timeout_seconds = timeout_seconds
+
+    @builtins.property
+    def exec(self) -> typing.Optional[ExecAction]:
+        '''Exec specifies the action to take.
+
+        :schema: io.k8s.api.core.v1.Probe#exec
+        '''
+        result = self._value_exec
+        return typing.cast(typing.Optional[ExecAction], result)
+
+    @builtins.property
+    def failure_threshold(self) -> typing.Optional[jsii.Number]:
+        '''Minimum consecutive failures for the probe to be considered failed after having succeeded.
+
+        Defaults to 3. Minimum value is 1.
+
+        :default: 3. Minimum value is 1.
+
+        :schema: io.k8s.api.core.v1.Probe#failureThreshold
+        '''
+        result = self._value_failure_threshold
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def grpc(self) -> typing.Optional[GrpcAction]:
+        '''GRPC specifies an action involving a GRPC port.
+
+        This is a beta field and requires enabling GRPCContainerProbe feature gate.
+
+        :schema: io.k8s.api.core.v1.Probe#grpc
+        '''
+        result = self._value_grpc
+        return typing.cast(typing.Optional[GrpcAction], result)
+
+    @builtins.property
+    def http_get(self) -> typing.Optional[HttpGetAction]:
+        '''HTTPGet specifies the http request to perform.
+
+        :schema: io.k8s.api.core.v1.Probe#httpGet
+        '''
+        result = self._value_http_get
+        return typing.cast(typing.Optional[HttpGetAction], result)
+
+    @builtins.property
+    def initial_delay_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Number of seconds after the container has started before liveness probes are initiated.
+
+        More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes
+
+        :schema: io.k8s.api.core.v1.Probe#initialDelaySeconds
+        '''
+        result = self._value_initial_delay_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def period_seconds(self) -> typing.Optional[jsii.Number]:
+        '''How often (in seconds) to perform the probe.
+
+        Default to 10 seconds. Minimum value is 1.
+
+        :default: 10 seconds. Minimum value is 1.
+
+        :schema: io.k8s.api.core.v1.Probe#periodSeconds
+        '''
+        result = self._value_period_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def success_threshold(self) -> typing.Optional[jsii.Number]:
+        '''Minimum consecutive successes for the probe to be considered successful after having failed.
+
+        Defaults to 1. Must be 1 for liveness and startup. Minimum value is 1.
+
+        :default: 1. Must be 1 for liveness and startup. Minimum value is 1.
+
+        :schema: io.k8s.api.core.v1.Probe#successThreshold
+        '''
+        result = self._value_success_threshold
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def tcp_socket(self) -> typing.Optional["TcpSocketAction"]:
+        '''TCPSocket specifies an action involving a TCP port.
+
+        :schema: io.k8s.api.core.v1.Probe#tcpSocket
+        '''
+        result = self._value_tcp_socket
+        return typing.cast(typing.Optional["TcpSocketAction"], result)
+
+    @builtins.property
+    def termination_grace_period_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Optional duration in seconds the pod needs to terminate gracefully upon probe failure.
+
+        The grace period is the duration in seconds after the processes running in the pod are sent a termination signal and the time when the processes are forcibly halted with a kill signal. Set this value longer than the expected cleanup time for your process. If this value is nil, the pod's terminationGracePeriodSeconds will be used. Otherwise, this value overrides the value provided by the pod spec. Value must be non-negative integer. The value zero indicates stop immediately via the kill signal (no opportunity to shut down). This is a beta field and requires enabling ProbeTerminationGracePeriod feature gate. Minimum value is 1. spec.terminationGracePeriodSeconds is used if unset.
+
+        :schema: io.k8s.api.core.v1.Probe#terminationGracePeriodSeconds
+        '''
+        result = self._value_termination_grace_period_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def timeout_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Number of seconds after which the probe times out.
+
+        Defaults to 1 second. Minimum value is 1. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes
+
+        :default: 1 second. Minimum value is 1. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#container-probes
+
+        :schema: io.k8s.api.core.v1.Probe#timeoutSeconds
+        '''
+        result = self._value_timeout_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_exec is not None:
+            values["exec"] = self._value_exec
+        if self._value_failure_threshold is not None:
+            values["failure_threshold"] = self._value_failure_threshold
+        if self._value_grpc is not None:
+            values["grpc"] = self._value_grpc
+        if self._value_http_get is not None:
+            values["http_get"] = self._value_http_get
+        if self._value_initial_delay_seconds is not None:
+            values["initial_delay_seconds"] = self._value_initial_delay_seconds
+        if self._value_period_seconds is not None:
+            values["period_seconds"] = self._value_period_seconds
+        if self._value_success_threshold is not None:
+            values["success_threshold"] = self._value_success_threshold
+        if self._value_tcp_socket is not None:
+            values["tcp_socket"] = self._value_tcp_socket
+        if self._value_termination_grace_period_seconds is not None:
+            values["termination_grace_period_seconds"] = self._value_termination_grace_period_seconds
+        if self._value_timeout_seconds is not None:
+            values["timeout_seconds"] = self._value_timeout_seconds
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Probe(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__db09437a4be3e51aba0181b1494c0c550aa4867813268b893ac716f115fa48c1(
+    *,
+    exec: typing.Optional[typing.Union[ExecAction, typing.Dict[builtins.str, typing.Any]]] = None,
+    failure_threshold: typing.Optional[jsii.Number] = None,
+    grpc: typing.Optional[typing.Union[GrpcAction, typing.Dict[builtins.str, typing.Any]]] = None,
+    http_get: typing.Optional[typing.Union[HttpGetAction, typing.Dict[builtins.str, typing.Any]]] = None,
+    initial_delay_seconds: typing.Optional[jsii.Number] = None,
+    period_seconds: typing.Optional[jsii.Number] = None,
+    success_threshold: typing.Optional[jsii.Number] = None,
+    tcp_socket: typing.Optional[typing.Union[TcpSocketAction, typing.Dict[builtins.str, typing.Any]]] = None,
+    termination_grace_period_seconds: typing.Optional[jsii.Number] = None,
+    timeout_seconds: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,99 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .VolumeProjection import VolumeProjection
+
+
+@jsii.data_type(
+    jsii_type="k8s.ProjectedVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={"default_mode": "defaultMode", "sources": "sources"},
+)
+class ProjectedVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_default_mode",
+        "_value_sources",
+    )
+
+    def __init__(
+        self,
+        *,
+        default_mode: typing.Optional[jsii.Number] = None,
+        sources: typing.Optional[typing.Sequence[typing.Union["VolumeProjection", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''Represents a projected volume source.
+
+        :param default_mode: defaultMode are the mode bits used to set permissions on created files by default. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+        :param sources: sources is the list of volume projections.
+
+        :schema: io.k8s.api.core.v1.ProjectedVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7074d18926a011b639c0d0e74c2a29fc486086a8992a0ccda6c888fe8065ce84)
+            check_type(argname="argument default_mode", value=default_mode, expected_type=type_hints["default_mode"])
+            check_type(argname="argument sources", value=sources, expected_type=type_hints["sources"])
+        self._value_default_mode = default_mode
+        self._value_sources = sources
+
+    @builtins.property
+    def default_mode(self) -> typing.Optional[jsii.Number]:
+        '''defaultMode are the mode bits used to set permissions on created files by default.
+
+        Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set.
+
+        :schema: io.k8s.api.core.v1.ProjectedVolumeSource#defaultMode
+        '''
+        result = self._value_default_mode
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def sources(self) -> typing.Optional[typing.List["VolumeProjection"]]:
+        '''sources is the list of volume projections.
+
+        :schema: io.k8s.api.core.v1.ProjectedVolumeSource#sources
+        '''
+        result = self._value_sources
+        return typing.cast(typing.Optional[typing.List["VolumeProjection"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_default_mode is not None:
+            values["default_mode"] = self._value_default_mode
+        if self._value_sources is not None:
+            values["sources"] = self._value_sources
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ProjectedVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7074d18926a011b639c0d0e74c2a29fc486086a8992a0ccda6c888fe8065ce84(
+    *,
+    default_mode: typing.Optional[jsii.Number] = None,
+    sources: typing.Optional[typing.Sequence[typing.Union[VolumeProjection, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,123 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.QueuingConfigurationV1Beta2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "hand_size": "handSize",
+        "queue_length_limit": "queueLengthLimit",
+        "queues": "queues",
+    },
+)
+class QueuingConfigurationV1Beta2(_base.Struct):
+    __slots__ = (
+        "_value_hand_size",
+        "_value_queue_length_limit",
+        "_value_queues",
+    )
+
+    def __init__(
+        self,
+        *,
+        hand_size: typing.Optional[jsii.Number] = None,
+        queue_length_limit: typing.Optional[jsii.Number] = None,
+        queues: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''QueuingConfiguration holds the configuration parameters for queuing.
+
+        :param hand_size: ``handSize`` is a small positive number that configures the shuffle sharding of requests into queues. When enqueuing a request at this priority level the request's flow identifier (a string pair) is hashed and the hash value is used to shuffle the list of queues and deal a hand of the size specified here. The request is put into one of the shortest queues in that hand. ``handSize`` must be no larger than ``queues``, and should be significantly smaller (so that a few heavy flows do not saturate most of the queues). See the user-facing documentation for more extensive guidance on setting this field. This field has a default value of 8.
+        :param queue_length_limit: ``queueLengthLimit`` is the maximum number of requests allowed to be waiting in a given queue of this priority level at a time; excess requests are rejected. This value must be positive. If not specified, it will be defaulted to 50.
+        :param queues: ``queues`` is the number of queues for this priority level. The queues exist independently at each apiserver. The value must be positive. Setting it to 1 effectively precludes shufflesharding and thus makes the distinguisher method of associated flow schemas irrelevant. This field has a default value of 64.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.QueuingConfiguration
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__8d5a34c8cf9c81ed2f5b31625c4cec39f9cc1c5c9d4fb1cd5b7c4ea13cbfecda)
+            check_type(argname="argument hand_size", value=hand_size, expected_type=type_hints["hand_size"])
+            check_type(argname="argument queue_length_limit", value=queue_length_limit, expected_type=type_hints["queue_length_limit"])
+            check_type(argname="argument queues", value=queues, expected_type=type_hints["queues"])
+        self._value_hand_size = hand_size
+        self._value_queue_length_limit = queue_length_limit
+        self._value_queues = queues
+
+    @builtins.property
+    def hand_size(self) -> typing.Optional[jsii.Number]:
+        '''``handSize`` is a small positive number that configures the shuffle sharding of requests into queues.
+
+        When enqueuing a request at this priority level the request's flow identifier (a string pair) is hashed and the hash value is used to shuffle the list of queues and deal a hand of the size specified here.  The request is put into one of the shortest queues in that hand. ``handSize`` must be no larger than ``queues``, and should be significantly smaller (so that a few heavy flows do not saturate most of the queues).  See the user-facing documentation for more extensive guidance on setting this field.  This field has a default value of 8.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.QueuingConfiguration#handSize
+        '''
+        result = self._value_hand_size
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def queue_length_limit(self) -> typing.Optional[jsii.Number]:
+        '''``queueLengthLimit`` is the maximum number of requests allowed to be waiting in a given queue of this priority level at a time;
+
+        excess requests are rejected.  This value must be positive.  If not specified, it will be defaulted to 50.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.QueuingConfiguration#queueLengthLimit
+        '''
+        result = self._value_queue_length_limit
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def queues(self) -> typing.Optional[jsii.Number]:
+        '''``queues`` is the number of queues for this priority level.
+
+        The queues exist independently at each apiserver. The value must be positive.  Setting it to 1 effectively precludes shufflesharding and thus makes the distinguisher method of associated flow schemas irrelevant.  This field has a default value of 64.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.QueuingConfiguration#queues
+        '''
+        result = self._value_queues
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_hand_size is not None:
+            values["hand_size"] = self._value_hand_size
+        if self._value_queue_length_limit is not None:
+            values["queue_length_limit"] = self._value_queue_length_limit
+        if self._value_queues is not None:
+            values["queues"] = self._value_queues
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "QueuingConfigurationV1Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__8d5a34c8cf9c81ed2f5b31625c4cec39f9cc1c5c9d4fb1cd5b7c4ea13cbfecda(
+    *,
+    hand_size: typing.Optional[jsii.Number] = None,
+    queue_length_limit: typing.Optional[jsii.Number] = None,
+    queues: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
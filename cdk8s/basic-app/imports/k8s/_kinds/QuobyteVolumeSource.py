@@ -0,0 +1,182 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.QuobyteVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "registry": "registry",
+        "volume": "volume",
+        "group": "group",
+        "read_only": "readOnly",
+        "tenant": "tenant",
+        "user": "user",
+    },
+)
+class QuobyteVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_registry",
+        "_value_volume",
+        "_value_group",
+        "_value_read_only",
+        "_value_tenant",
+        "_value_user",
+    )
+
+    def __init__(
+        self,
+        *,
+        registry: builtins.str,
+        volume: builtins.str,
+        group: typing.Optional[builtins.str] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        tenant: typing.Optional[builtins.str] = None,
+        user: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a Quobyte mount that lasts the lifetime of a pod.
+
+        Quobyte volumes do not support ownership management or SELinux relabeling.
+
+        :param registry: registry represents a single or multiple Quobyte Registry services specified as a string as host:port pair (multiple entries are separated with commas) which acts as the central registry for volumes.
+        :param volume: volume is a string that references an already created Quobyte volume by name.
+        :param group: group to map volume access to Default is no group. Default: no group
+        :param read_only: readOnly here will force the Quobyte volume to be mounted with read-only permissions. Defaults to false. Default: false.
+        :param tenant: tenant owning the given Quobyte volume in the Backend Used with dynamically provisioned Quobyte volumes, value is set by the plugin.
+        :param user: user to map volume access to Defaults to serivceaccount user. Default: serivceaccount user
+
+        :schema: io.k8s.api.core.v1.QuobyteVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__06c16a4eef69abcb24206e80e63cd1b95acadcfeb11e968c6e6938adf8d6afba)
+            check_type(argname="argument registry", value=registry, expected_type=type_hints["registry"])
+            check_type(argname="argument volume", value=volume, expected_type=type_hints["volume"])
+            check_type(argname="argument group", value=group, expected_type=type_hints["group"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument tenant", value=tenant, expected_type=type_hints["tenant"])
+            check_type(argname="argument user", value=user, expected_type=type_hints["user"])
+        self._value_registry = registry
+        self._value_volume = volume
+        self._value_group = group
+        self._value_read_only = read_only
+        self._value_tenant = tenant
+        self._value_user = user
+
+    @builtins.property
+    def registry(self) -> builtins.str:
+        '''registry represents a single or multiple Quobyte Registry services specified as a string as host:port pair (multiple entries are separated with commas) which acts as the central registry for volumes.
+
+        :schema: io.k8s.api.core.v1.QuobyteVolumeSource#registry
+        '''
+        result = self._value_registry
+        assert result is not None, "Required property 'registry' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def volume(self) -> builtins.str:
+        '''volume is a string that references an already created Quobyte volume by name.
+
+        :schema: io.k8s.api.core.v1.QuobyteVolumeSource#volume
+        '''
+        result = self._value_volume
+        assert result is not None, "Required property 'volume' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def group(self) -> typing.Optional[builtins.str]:
+        '''group to map volume access to Default is no group.
+
+        :default: no group
+
+        :schema: io.k8s.api.core.v1.QuobyteVolumeSource#group
+        '''
+        result = self._value_group
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly here will force the Quobyte volume to be mounted with read-only permissions.
+
+        Defaults to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.QuobyteVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def tenant(self) -> typing.Optional[builtins.str]:
+        '''tenant owning the given Quobyte volume in the Backend Used with dynamically provisioned Quobyte volumes, value is set by the plugin.
+
+        :schema: io.k8s.api.core.v1.QuobyteVolumeSource#tenant
+        '''
+        result = self._value_tenant
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def user(self) -> typing.Optional[builtins.str]:
+        '''user to map volume access to Defaults to serivceaccount user.
+
+        :default: serivceaccount user
+
+        :schema: io.k8s.api.core.v1.QuobyteVolumeSource#user
+        '''
+        result = self._value_user
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "registry": self._value_registry,
+            "volume": self._value_volume,
+        }
+        if self._value_group is not None:
+            values["group"] = self._value_group
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_tenant is not None:
+            values["tenant"] = self._value_tenant
+        if self._value_user is not None:
+            values["user"] = self._value_user
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "QuobyteVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__06c16a4eef69abcb24206e80e63cd1b95acadcfeb11e968c6e6938adf8d6afba(
+    *,
+    registry: builtins.str,
+    volume: builtins.str,
+    group: typing.Optional[builtins.str] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    tenant: typing.Optional[builtins.str] = None,
+    user: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
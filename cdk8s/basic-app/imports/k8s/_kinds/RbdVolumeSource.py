@@ -0,0 +1,239 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LocalObjectReference import LocalObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.RbdVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "image": "image",
+        "monitors": "monitors",
+        "fs_type": "fsType",
+        "keyring": "keyring",
+        "pool": "pool",
+        "read_only": "readOnly",
+        "secret_ref": "secretRef",
+        "user": "user",
+    },
+)
+class RbdVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_image",
+        "_value_monitors",
+        "_value_fs_type",
+        "_value_keyring",
+        "_value_pool",
+        "_value_read_only",
+        "_value_secret_ref",
+        "_value_user",
+    )
+
+    def __init__(
+        self,
+        *,
+        image: builtins.str,
+        monitors: typing.Sequence[builtins.str],
+        fs_type: typing.Optional[builtins.str] = None,
+        keyring: typing.Optional[builtins.str] = None,
+        pool: typing.Optional[builtins.str] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        secret_ref: typing.Optional[typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+        user: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a Rados Block Device mount that lasts the lifetime of a pod.
+
+        RBD volumes support ownership management and SELinux relabeling.
+
+        :param image: image is the rados image name. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+        :param monitors: monitors is a collection of Ceph monitors. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+        :param fs_type: fsType is the filesystem type of the volume that you want to mount. Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#rbd
+        :param keyring: keyring is the path to key ring for RBDUser. Default is /etc/ceph/keyring. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it Default: etc/ceph/keyring. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+        :param pool: pool is the rados pool name. Default is rbd. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it Default: rbd. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+        :param read_only: readOnly here will force the ReadOnly setting in VolumeMounts. Defaults to false. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it Default: false. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+        :param secret_ref: secretRef is name of the authentication secret for RBDUser. If provided overrides keyring. Default is nil. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it Default: nil. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+        :param user: user is the rados user name. Default is admin. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it Default: admin. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource
+        '''
+        if isinstance(secret_ref, dict):
+            secret_ref = LocalObjectReference(**secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b775d6c9c36f825c00349ce924014aaf1d073ef444b854540aaaa1b195f1f2e1)
+            check_type(argname="argument image", value=image, expected_type=type_hints["image"])
+            check_type(argname="argument monitors", value=monitors, expected_type=type_hints["monitors"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument keyring", value=keyring, expected_type=type_hints["keyring"])
+            check_type(argname="argument pool", value=pool, expected_type=type_hints["pool"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument secret_ref", value=secret_ref, expected_type=type_hints["secret_ref"])
+            check_type(argname="argument user", value=user, expected_type=type_hints["user"])
+        self._value_image = image
+        self._value_monitors = monitors
+        self._value_fs_type = fs_type
+        self._value_keyring = keyring
+        self._value_pool = pool
+        self._value_read_only = read_only
+        self._value_secret_ref = secret_ref
+        self._value_user = user
+
+    @builtins.property
+    def image(self) -> builtins.str:
+        '''image is the rados image name.
+
+        More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource#image
+        '''
+        result = self._value_image
+        assert result is not None, "Required property 'image' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def monitors(self) -> typing.List[builtins.str]:
+        '''monitors is a collection of Ceph monitors.
+
+        More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource#monitors
+        '''
+        result = self._value_monitors
+        assert result is not None, "Required property 'monitors' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the filesystem type of the volume that you want to mount.
+
+        Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#rbd
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def keyring(self) -> typing.Optional[builtins.str]:
+        '''keyring is the path to key ring for RBDUser.
+
+        Default is /etc/ceph/keyring. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :default: etc/ceph/keyring. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource#keyring
+        '''
+        result = self._value_keyring
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def pool(self) -> typing.Optional[builtins.str]:
+        '''pool is the rados pool name.
+
+        Default is rbd. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :default: rbd. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource#pool
+        '''
+        result = self._value_pool
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly here will force the ReadOnly setting in VolumeMounts.
+
+        Defaults to false. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :default: false. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def secret_ref(self) -> typing.Optional[LocalObjectReference]:
+        '''secretRef is name of the authentication secret for RBDUser.
+
+        If provided overrides keyring. Default is nil. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :default: nil. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource#secretRef
+        '''
+        result = self._value_secret_ref
+        return typing.cast(typing.Optional[LocalObjectReference], result)
+
+    @builtins.property
+    def user(self) -> typing.Optional[builtins.str]:
+        '''user is the rados user name.
+
+        Default is admin. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :default: admin. More info: https://examples.k8s.io/volumes/rbd/README.md#how-to-use-it
+
+        :schema: io.k8s.api.core.v1.RBDVolumeSource#user
+        '''
+        result = self._value_user
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "image": self._value_image,
+            "monitors": self._value_monitors,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_keyring is not None:
+            values["keyring"] = self._value_keyring
+        if self._value_pool is not None:
+            values["pool"] = self._value_pool
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_secret_ref is not None:
+            values["secret_ref"] = self._value_secret_ref
+        if self._value_user is not None:
+            values["user"] = self._value_user
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "RbdVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b775d6c9c36f825c00349ce924014aaf1d073ef444b854540aaaa1b195f1f2e1(
+    *,
+    image: builtins.str,
+    monitors: typing.Sequence[builtins.str],
+    fs_type: typing.Optional[builtins.str] = None,
+    keyring: typing.Optional[builtins.str] = None,
+    pool: typing.Optional[builtins.str] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    secret_ref: typing.Optional[typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    user: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
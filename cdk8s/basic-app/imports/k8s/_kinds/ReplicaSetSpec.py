@@ -0,0 +1,154 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+from .PodTemplateSpec import PodTemplateSpec
+
+
+@jsii.data_type(
+    jsii_type="k8s.ReplicaSetSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "selector": "selector",
+        "min_ready_seconds": "minReadySeconds",
+        "replicas": "replicas",
+        "template": "template",
+    },
+)
+class ReplicaSetSpec(_base.Struct):
+    __slots__ = (
+        "_value_selector",
+        "_value_min_ready_seconds",
+        "_value_replicas",
+        "_value_template",
+    )
+
+    def __init__(
+        self,
+        *,
+        selector: typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]],
+        min_ready_seconds: typing.Optional[jsii.Number] = None,
+        replicas: typing.Optional[jsii.Number] = None,
+        template: typing.Optional[typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ReplicaSetSpec is the specification of a ReplicaSet.
+
+        :param selector: Selector is a label query over pods that should match the replica count. Label keys and values that must match in order to be controlled by this replica set. It must match the pod template's labels. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+        :param min_ready_seconds: Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready) Default: 0 (pod will be considered available as soon as it is ready)
+        :param replicas: Replicas is the number of desired replicas. This is a pointer to distinguish between explicit zero and unspecified. Defaults to 1. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller/#what-is-a-replicationcontroller Default: 1. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller/#what-is-a-replicationcontroller
+        :param template: Template is the object that describes the pod that will be created if insufficient replicas are detected. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#pod-template
+
+        :schema: io.k8s.api.apps.v1.ReplicaSetSpec
+        '''
+        if isinstance(selector, dict):
+            selector = LabelSelector(**selector)
+        if isinstance(template, dict):
+            template = PodTemplateSpec(**template)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__4a649a1eff04d9feb07747ac0b41f1e738bb62df7f0a6d730148217e8a0b1f7b)
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+            check_type(argname="argument min_ready_seconds", value=min_ready_seconds, expected_type=type_hints["min_ready_seconds"])
+            check_type(argname="argument replicas", value=replicas, expected_type=type_hints["replicas"])
+            check_type(argname="argument template", value=template, expected_type=type_hints["template"])
+        self._value_selector = selector
+        self._value_min_ready_seconds = min_ready_seconds
+        self._value_replicas = replicas
+        self._value_template = template
+
+    @builtins.property
+    def selector(self) -> LabelSelector:
+        '''Selector is a label query over pods that should match the replica count.
+
+        Label keys and values that must match in order to be controlled by this replica set. It must match the pod template's labels. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+
+        :schema: io.k8s.api.apps.v1.ReplicaSetSpec#selector
+        '''
+        result = self._value_selector
+        assert result is not None, "Required property 'selector' is missing"
+        return typing.cast(LabelSelector, result)
+
+    @builtins.property
+    def min_ready_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available.
+
+        Defaults to 0 (pod will be considered available as soon as it is ready)
+
+        :default: 0 (pod will be considered available as soon as it is ready)
+
+        :schema: io.k8s.api.apps.v1.ReplicaSetSpec#minReadySeconds
+        '''
+        result = self._value_min_ready_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def replicas(self) -> typing.Optional[jsii.Number]:
+        '''Replicas is the number of desired replicas.
+
+        This is a pointer to distinguish between explicit zero and unspecified. Defaults to 1. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller/#what-is-a-replicationcontroller
+
+        :default: 1. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller/#what-is-a-replicationcontroller
+
+        :schema: io.k8s.api.apps.v1.ReplicaSetSpec#replicas
+        '''
+        result = self._value_replicas
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def template(self) -> typing.Optional[PodTemplateSpec]:
+        '''Template is the object that describes the pod that will be created if insufficient replicas are detected.
+
+        More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#pod-template
+
+        :schema: io.k8s.api.apps.v1.ReplicaSetSpec#template
+        '''
+        result = self._value_template
+        return typing.cast(typing.Optional[PodTemplateSpec], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "selector": self._value_selector,
+        }
+        if self._value_min_ready_seconds is not None:
+            values["min_ready_seconds"] = self._value_min_ready_seconds
+        if self._value_replicas is not None:
+            values["replicas"] = self._value_replicas
+        if self._value_template is not None:
+            values["template"] = self._value_template
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ReplicaSetSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__4a649a1eff04d9feb07747ac0b41f1e738bb62df7f0a6d730148217e8a0b1f7b(
+    *,
+    selector: typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]],
+    min_ready_seconds: typing.Optional[jsii.Number] = None,
+    replicas: typing.Optional[jsii.Number] = None,
+    template: typing.Optional[typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,150 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .PodTemplateSpec import PodTemplateSpec
+
+
+@jsii.data_type(
+    jsii_type="k8s.ReplicationControllerSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "min_ready_seconds": "minReadySeconds",
+        "replicas": "replicas",
+        "selector": "selector",
+        "template": "template",
+    },
+)
+class ReplicationControllerSpec(_base.Struct):
+    __slots__ = (
+        "_value_min_ready_seconds",
+        "_value_replicas",
+        "_value_selector",
+        "_value_template",
+    )
+
+    def __init__(
+        self,
+        *,
+        min_ready_seconds: typing.Optional[jsii.Number] = None,
+        replicas: typing.Optional[jsii.Number] = None,
+        selector: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        template: typing.Optional[typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ReplicationControllerSpec is the specification of a replication controller.
+
+        :param min_ready_seconds: Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready) Default: 0 (pod will be considered available as soon as it is ready)
+        :param replicas: Replicas is the number of desired replicas. This is a pointer to distinguish between explicit zero and unspecified. Defaults to 1. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#what-is-a-replicationcontroller Default: 1. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#what-is-a-replicationcontroller
+        :param selector: Selector is a label query over pods that should match the Replicas count. If Selector is empty, it is defaulted to the labels present on the Pod template. Label keys and values that must match in order to be controlled by this replication controller, if empty defaulted to labels on Pod template. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+        :param template: Template is the object that describes the pod that will be created if insufficient replicas are detected. This takes precedence over a TemplateRef. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#pod-template
+
+        :schema: io.k8s.api.core.v1.ReplicationControllerSpec
+        '''
+        if isinstance(template, dict):
+            template = PodTemplateSpec(**template)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__cb1a637f64dd89041b0c36855e6e4b2ebb97a853ce2ab8bf74baa53399293aa9)
+            check_type(argname="argument min_ready_seconds", value=min_ready_seconds, expected_type=type_hints["min_ready_seconds"])
+            check_type(argname="argument replicas", value=replicas, expected_type=type_hints["replicas"])
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+            check_type(argname="argument template", value=template, expected_type=type_hints["template"])
+        self._value_min_ready_seconds = min_ready_seconds
+        self._value_replicas = replicas
+        self._value_selector = selector
+        self._value_template = template
+
+    @builtins.property
+    def min_ready_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available.
+
+        Defaults to 0 (pod will be considered available as soon as it is ready)
+
+        :default: 0 (pod will be considered available as soon as it is ready)
+
+        :schema: io.k8s.api.core.v1.ReplicationControllerSpec#minReadySeconds
+        '''
+        result = self._value_min_ready_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def replicas(self) -> typing.Optional[jsii.Number]:
+        '''Replicas is the number of desired replicas.
+
+        This is a pointer to distinguish between explicit zero and unspecified. Defaults to 1. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#what-is-a-replicationcontroller
+
+        :default: 1. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#what-is-a-replicationcontroller
+
+        :schema: io.k8s.api.core.v1.ReplicationControllerSpec#replicas
+        '''
+        result = self._value_replicas
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def selector(self) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''Selector is a label query over pods that should match the Replicas count.
+
+        If Selector is empty, it is defaulted to the labels present on the Pod template. Label keys and values that must match in order to be controlled by this replication controller, if empty defaulted to labels on Pod template. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+
+        :schema: io.k8s.api.core.v1.ReplicationControllerSpec#selector
+        '''
+        result = self._value_selector
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def template(self) -> typing.Optional[PodTemplateSpec]:
+        '''Template is the object that describes the pod that will be created if insufficient replicas are detected.
+
+        This takes precedence over a TemplateRef. More info: https://kubernetes.io/docs/concepts/workloads/controllers/replicationcontroller#pod-template
+
+        :schema: io.k8s.api.core.v1.ReplicationControllerSpec#template
+        '''
+        result = self._value_template
+        return typing.cast(typing.Optional[PodTemplateSpec], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_min_ready_seconds is not None:
+            values["min_ready_seconds"] = self._value_min_ready_seconds
+        if self._value_replicas is not None:
+            values["replicas"] = self._value_replicas
+        if self._value_selector is not None:
+            values["selector"] = self._value_selector
+        if self._value_template is not None:
+            values["template"] = self._value_template
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ReplicationControllerSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__cb1a637f64dd89041b0c36855e6e4b2ebb97a853ce2ab8bf74baa53399293aa9(
+    *,
+    min_ready_seconds: typing.Optional[jsii.Number] = None,
+    replicas: typing.Optional[jsii.Number] = None,
+    selector: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    template: typing.Optional[typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
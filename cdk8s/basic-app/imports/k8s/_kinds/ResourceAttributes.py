@@ -0,0 +1,203 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ResourceAttributes",
+    jsii_struct_bases=[],
+    name_mapping={
+        "group": "group",
+        "name": "name",
+        "namespace": "namespace",
+        "resource": "resource",
+        "subresource": "subresource",
+        "verb": "verb",
+        "version": "version",
+    },
+)
+class ResourceAttributes(_base.Struct):
+    __slots__ = (
+        "_value_group",
+        "_value_name",
+        "_value_namespace",
+        "_value_resource",
+        "_value_subresource",
+        "_value_verb",
+        "_value_version",
+    )
+
+    def __init__(
+        self,
+        *,
+        group: typing.Optional[builtins.str] = None,
+        name: typing.Optional[builtins.str] = None,
+        namespace: typing.Optional[builtins.str] = None,
+        resource: typing.Optional[builtins.str] = None,
+        subresource: typing.Optional[builtins.str] = None,
+        verb: typing.Optional[builtins.str] = None,
+        version: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ResourceAttributes includes the authorization attributes available for resource requests to the Authorizer interface.
+
+        :param group: Group is the API Group of the Resource. "*" means all.
+        :param name: Name is the name of the resource being requested for a "get" or deleted for a "delete". "" (empty) means all.
+        :param namespace: Namespace is the namespace of the action being requested. Currently, there is no distinction between no namespace and all namespaces "" (empty) is defaulted for LocalSubjectAccessReviews "" (empty) is empty for cluster-scoped resources "" (empty) means "all" for namespace scoped resources from a SubjectAccessReview or SelfSubjectAccessReview
+        :param resource: Resource is one of the existing resource types. "*" means all.
+        :param subresource: Subresource is one of the existing resource types. "" means none.
+        :param verb: Verb is a kubernetes resource API verb, like: get, list, watch, create, update, delete, proxy. "*" means all.
+        :param version: Version is the API Version of the Resource. "*" means all.
+
+        :schema: io.k8s.api.authorization.v1.ResourceAttributes
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__1389ee6ee42f772dc34e626fc6cda72a7449fbddee89e52988179f65c725d996)
+            check_type(argname="argument group", value=group, expected_type=type_hints["group"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+            check_type(argname="argument resource", value=resource, expected_type=type_hints["resource"])
+            check_type(argname="argument subresource", value=subresource, expected_type=type_hints["subresource"])
+            check_type(argname="argument verb", value=verb, expected_type=type_hints["verb"])
+            check_type(argname="argument version", value=version, expected_type=type_hints["version"])
+        self._value_group = group
+        self._value_name = name
+        self._value_namespace = namespace
+        self._value_resource = resource
+        self._value_subresource = subresource
+        self._value_verb = verb
+        self._value_version = version
+
+    @builtins.property
+    def group(self) -> typing.Optional[builtins.str]:
+        '''Group is the API Group of the Resource.
+
+        "*" means all.
+
+        :schema: io.k8s.api.authorization.v1.ResourceAttributes#group
+        '''
+        result = self._value_group
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Name is the name of the resource being requested for a "get" or deleted for a "delete".
+
+        "" (empty) means all.
+
+        :schema: io.k8s.api.authorization.v1.ResourceAttributes#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def namespace(self) -> typing.Optional[builtins.str]:
+        '''Namespace is the namespace of the action being requested.
+
+        Currently, there is no distinction between no namespace and all namespaces "" (empty) is defaulted for LocalSubjectAccessReviews "" (empty) is empty for cluster-scoped resources "" (empty) means "all" for namespace scoped resources from a SubjectAccessReview or SelfSubjectAccessReview
+
+        :schema: io.k8s.api.authorization.v1.ResourceAttributes#namespace
+        '''
+        result = self._value_namespace
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def resource(self) -> typing.Optional[builtins.str]:
+        '''Resource is one of the existing resource types.
+
+        "*" means all.
+
+        :schema: io.k8s.api.authorization.v1.ResourceAttributes#resource
+        '''
+        result = self._value_resource
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def subresource(self) -> typing.Optional[builtins.str]:
+        '''Subresource is one of the existing resource types.
+
+        "" means none.
+
+        :schema: io.k8s.api.authorization.v1.ResourceAttributes#subresource
+        '''
+        result = self._value_subresource
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def verb(self) -> typing.Optional[builtins.str]:
+        '''Verb is a kubernetes resource API verb, like: get, list, watch, create, update, delete, proxy.
+
+        "*" means all.
+
+        :schema: io.k8s.api.authorization.v1.ResourceAttributes#verb
+        '''
+        result = self._value_verb
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def version(self) -> typing.Optional[builtins.str]:
+        '''Version is the API Version of the Resource.
+
+        "*" means all.
+
+        :schema: io.k8s.api.authorization.v1.ResourceAttributes#version
+        '''
+        result = self._value_version
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_group is not None:
+            values["group"] = self._value_group
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_namespace is not None:
+            values["namespace"] = self._value_namespace
+        if self._value_resource is not None:
+            values["resource"] = self._value_resource
+        if self._value_subresource is not None:
+            values["subresource"] = self._value_subresource
+        if self._value_verb is not None:
+            values["verb"] = self._value_verb
+        if self._value_version is not None:
+            values["version"] = self._value_version
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ResourceAttributes(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__1389ee6ee42f772dc34e626fc6cda72a7449fbddee89e52988179f65c725d996(
+    *,
+    group: typing.Optional[builtins.str] = None,
+    name: typing.Optional[builtins.str] = None,
+    namespace: typing.Optional[builtins.str] = None,
+    resource: typing.Optional[builtins.str] = None,
+    subresource: typing.Optional[builtins.str] = None,
+    verb: typing.Optional[builtins.str] = None,
+    version: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,119 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Quantity import Quantity
+
+
+@jsii.data_type(
+    jsii_type="k8s.ResourceFieldSelector",
+    jsii_struct_bases=[],
+    name_mapping={
+        "resource": "resource",
+        "container_name": "containerName",
+        "divisor": "divisor",
+    },
+)
+class ResourceFieldSelector(_base.Struct):
+    __slots__ = (
+        "_value_resource",
+        "_value_container_name",
+        "_value_divisor",
+    )
+
+    def __init__(
+        self,
+        *,
+        resource: builtins.str,
+        container_name: typing.Optional[builtins.str] = None,
+        divisor: typing.Optional[Quantity] = None,
+    ) -> None:
+        '''ResourceFieldSelector represents container resources (cpu, memory) and their output format.
+
+        :param resource: Required: resource to select.
+        :param container_name: Container name: required for volumes, optional for env vars.
+        :param divisor: Specifies the output format of the exposed resources, defaults to "1".
+
+        :schema: io.k8s.api.core.v1.ResourceFieldSelector
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7117ce5ef6d2382048cc325329ebe4abba77c2be754492f7322ea7cc6b3c8c8c)
+            check_type(argname="argument resource", value=resource, expected_type=type_hints["resource"])
+            check_type(argname="argument container_name", value=container_name, expected_type=type_hints["container_name"])
+            check_type(argname="argument divisor", value=divisor, expected_type=type_hints["divisor"])
+        self._value_resource = resource
+        self._value_container_name = container_name
+        self._value_divisor = divisor
+
+    @builtins.property
+    def resource(self) -> builtins.str:
+        '''Required: resource to select.
+
+        :schema: io.k8s.api.core.v1.ResourceFieldSelector#resource
+        '''
+        result = self._value_resource
+        assert result is not None, "Required property 'resource' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def container_name(self) -> typing.Optional[builtins.str]:
+        '''Container name: required for volumes, optional for env vars.
+
+        :schema: io.k8s.api.core.v1.ResourceFieldSelector#containerName
+        '''
+        result = self._value_container_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def divisor(self) -> typing.Optional[Quantity]:
+        '''Specifies the output format of the exposed resources, defaults to "1".
+
+        :schema: io.k8s.api.core.v1.ResourceFieldSelector#divisor
+        '''
+        result = self._value_divisor
+        return typing.cast(typing.Optional[Quantity], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "resource": self._value_resource,
+        }
+        if self._value_container_name is not None:
+            values["container_name"] = self._value_container_name
+        if self._value_divisor is not None:
+            values["divisor"] = self._value_divisor
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ResourceFieldSelector(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7117ce5ef6d2382048cc325329ebe4abba77c2be754492f7322ea7cc6b3c8c8c(
+    *,
+    resource: builtins.str,
+    container_name: typing.Optional[builtins.str] = None,
+    divisor: typing.Optional[Quantity] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,164 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ResourcePolicyRuleV1Beta2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "api_groups": "apiGroups",
+        "resources": "resources",
+        "verbs": "verbs",
+        "cluster_scope": "clusterScope",
+        "namespaces": "namespaces",
+    },
+)
+class ResourcePolicyRuleV1Beta2(_base.Struct):
+    __slots__ = (
+        "_value_api_groups",
+        "_value_resources",
+        "_value_verbs",
+        "_value_cluster_scope",
+        "_value_namespaces",
+    )
+
+    def __init__(
+        self,
+        *,
+        api_groups: typing.Sequence[builtins.str],
+        resources: typing.Sequence[builtins.str],
+        verbs: typing.Sequence[builtins.str],
+        cluster_scope: typing.Optional[builtins.bool] = None,
+        namespaces: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''ResourcePolicyRule is a predicate that matches some resource requests, testing the request's verb and the target resource.
+
+        A ResourcePolicyRule matches a resource request if and only if: (a) at least one member of verbs matches the request, (b) at least one member of apiGroups matches the request, (c) at least one member of resources matches the request, and (d) either (d1) the request does not specify a namespace (i.e., ``Namespace==""``) and clusterScope is true or (d2) the request specifies a namespace and least one member of namespaces matches the request's namespace.
+
+        :param api_groups: ``apiGroups`` is a list of matching API groups and may not be empty. "*" matches all API groups and, if present, must be the only entry. Required.
+        :param resources: ``resources`` is a list of matching resources (i.e., lowercase and plural) with, if desired, subresource. For example, [ "services", "nodes/status" ]. This list may not be empty. "*" matches all resources and, if present, must be the only entry. Required.
+        :param verbs: ``verbs`` is a list of matching verbs and may not be empty. "*" matches all verbs and, if present, must be the only entry. Required.
+        :param cluster_scope: ``clusterScope`` indicates whether to match requests that do not specify a namespace (which happens either because the resource is not namespaced or the request targets all namespaces). If this field is omitted or false then the ``namespaces`` field must contain a non-empty list.
+        :param namespaces: ``namespaces`` is a list of target namespaces that restricts matches. A request that specifies a target namespace matches only if either (a) this list contains that target namespace or (b) this list contains "*". Note that "*" matches any specified namespace but does not match a request that *does not specify* a namespace (see the ``clusterScope`` field for that). This list may be empty, but only if ``clusterScope`` is true.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.ResourcePolicyRule
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__36c3728ec619997c16f03e7e503f9b6faa92c7d0be82c87e3f0a2c89c144f2bb)
+            check_type(argname="argument api_groups", value=api_groups, expected_type=type_hints["api_groups"])
+            check_type(argname="argument resources", value=resources, expected_type=type_hints["resources"])
+            check_type(argname="argument verbs", value=verbs, expected_type=type_hints["verbs"])
+            check_type(argname="argument cluster_scope", value=cluster_scope, expected_type=type_hints["cluster_scope"])
+            check_type(argname="argument namespaces", value=namespaces, expected_type=type_hints["namespaces"])
+        self._value_api_groups = api_groups
+        self._value_resources = resources
+        self._value_verbs = verbs
+        self._value_cluster_scope = cluster_scope
+        self._value_namespaces = namespaces
+
+    @builtins.property
+    def api_groups(self) -> typing.List[builtins.str]:
+        '''``apiGroups`` is a list of matching API groups and may not be empty.
+
+        "*" matches all API groups and, if present, must be the only entry. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.ResourcePolicyRule#apiGroups
+        '''
+        result = self._value_api_groups
+        assert result is not None, "Required property 'api_groups' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def resources(self) -> typing.List[builtins.str]:
+        '''``resources`` is a list of matching resources (i.e., lowercase and plural) with, if desired, subresource.  For example, [ "services", "nodes/status" ].  This list may not be empty. "*" matches all resources and, if present, must be the only entry. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.ResourcePolicyRule#resources
+        '''
+        result = self._value_resources
+        assert result is not None, "Required property 'resources' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def verbs(self) -> typing.List[builtins.str]:
+        '''``verbs`` is a list of matching verbs and may not be empty.
+
+        "*" matches all verbs and, if present, must be the only entry. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.ResourcePolicyRule#verbs
+        '''
+        result = self._value_verbs
+        assert result is not None, "Required property 'verbs' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def cluster_scope(self) -> typing.Optional[builtins.bool]:
+        '''``clusterScope`` indicates whether to match requests that do not specify a namespace (which happens either because the resource is not namespaced or the request targets all namespaces).
+
+        If this field is omitted or false then the ``namespaces`` field must contain a non-empty list.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.ResourcePolicyRule#clusterScope
+        '''
+        result = self._value_cluster_scope
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def namespaces(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''``namespaces`` is a list of target namespaces that restricts matches.
+
+        A request that specifies a target namespace matches only if either (a) this list contains that target namespace or (b) this list contains "*".  Note that "*" matches any specified namespace but does not match a request that *does not specify* a namespace (see the ``clusterScope`` field for that). This list may be empty, but only if ``clusterScope`` is true.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.ResourcePolicyRule#namespaces
+        '''
+        result = self._value_namespaces
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "api_groups": self._value_api_groups,
+            "resources": self._value_resources,
+            "verbs": self._value_verbs,
+        }
+        if self._value_cluster_scope is not None:
+            values["cluster_scope"] = self._value_cluster_scope
+        if self._value_namespaces is not None:
+            values["namespaces"] = self._value_namespaces
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ResourcePolicyRuleV1Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__36c3728ec619997c16f03e7e503f9b6faa92c7d0be82c87e3f0a2c89c144f2bb(
+    *,
+    api_groups: typing.Sequence[builtins.str],
+    resources: typing.Sequence[builtins.str],
+    verbs: typing.Sequence[builtins.str],
+    cluster_scope: typing.Optional[builtins.bool] = None,
+    namespaces: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
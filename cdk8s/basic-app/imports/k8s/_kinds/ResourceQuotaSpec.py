@@ -0,0 +1,127 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Quantity import Quantity
+from .ScopeSelector import ScopeSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.ResourceQuotaSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "hard": "hard",
+        "scopes": "scopes",
+        "scope_selector": "scopeSelector",
+    },
+)
+class ResourceQuotaSpec(_base.Struct):
+    __slots__ = (
+        "_value_hard",
+        "_value_scopes",
+        "_value_scope_selector",
+    )
+
+    def __init__(
+        self,
+        *,
+        hard: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+        scopes: typing.Optional[typing.Sequence[builtins.str]] = None,
+        scope_selector: typing.Optional[typing.Union["ScopeSelector", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''ResourceQuotaSpec defines the desired hard limits to enforce for Quota.
+
+        :param hard: hard is the set of desired hard limits for each named resource. More info: https://kubernetes.io/docs/concepts/policy/resource-quotas/
+        :param scopes: A collection of filters that must match each object tracked by a quota. If not specified, the quota matches all objects.
+        :param scope_selector: scopeSelector is also a collection of filters like scopes that must match each object tracked by a quota but expressed using ScopeSelectorOperator in combination with possible values. For a resource to match, both scopes AND scopeSelector (if specified in spec), must be matched.
+
+        :schema: io.k8s.api.core.v1.ResourceQuotaSpec
+        '''
+        if isinstance(scope_selector, dict):
+            scope_selector = ScopeSelector(**scope_selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__1f38b292c93787ac346fc7bdbff50edd3c17b9ea8d3ae69b3ef92ad11538687e)
+            check_type(argname="argument hard", value=hard, expected_type=type_hints["hard"])
+            check_type(argname="argument scopes", value=scopes, expected_type=type_hints["scopes"])
+            check_type(argname="argument scope_selector", value=scope_selector, expected_type=type_hints["scope_selector"])
+        self._value_hard = hard
+        self._value_scopes = scopes
+        self._value_scope_selector = scope_selector
+
+    @builtins.property
+    def hard(self) -> typing.Optional[typing.Mapping[builtins.str, Quantity]]:
+        '''hard is the set of desired hard limits for each named resource.
+
+        More info: https://kubernetes.io/docs/concepts/policy/resource-quotas/
+
+        :schema: io.k8s.api.core.v1.ResourceQuotaSpec#hard
+        '''
+        result = self._value_hard
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, Quantity]], result)
+
+    @builtins.property
+    def scopes(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''A collection of filters that must match each object tracked by a quota.
+
+        If not specified, the quota matches all objects.
+
+        :schema: io.k8s.api.core.v1.ResourceQuotaSpec#scopes
+        '''
+        result = self._value_scopes
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def scope_selector(self) -> typing.Optional["ScopeSelector"]:
+        '''scopeSelector is also a collection of filters like scopes that must match each object tracked by a quota but expressed using ScopeSelectorOperator in combination with possible values.
+
+        For a resource to match, both scopes AND scopeSelector (if specified in spec), must be matched.
+
+        :schema: io.k8s.api.core.v1.ResourceQuotaSpec#scopeSelector
+        '''
+        result = self._value_scope_selector
+        return typing.cast(typing.Optional["ScopeSelector"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_hard is not None:
+            values["hard"] = self._value_hard
+        if self._value_scopes is not None:
+            values["scopes"] = self._value_scopes
+        if self._value_scope_selector is not None:
+            values["scope_selector"] = self._value_scope_selector
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ResourceQuotaSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__1f38b292c93787ac346fc7bdbff50edd3c17b9ea8d3ae69b3ef92ad11538687e(
+    *,
+    hard: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    scopes: typing.Optional[typing.Sequence[builtins.str]] = None,
+    scope_selector: typing.Optional[typing.Union[ScopeSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
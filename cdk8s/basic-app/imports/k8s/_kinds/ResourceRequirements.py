@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Quantity import Quantity
+
+
+@jsii.data_type(
+    jsii_type="k8s.ResourceRequirements",
+    jsii_struct_bases=[],
+    name_mapping={"limits": "limits", "requests": "requests"},
+)
+class ResourceRequirements(_base.Struct):
+    __slots__ = (
+        "_value_limits",
+        "_value_requests",
+    )
+
+    def __init__(
+        self,
+        *,
+        limits: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+        requests: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    ) -> None:
+        '''ResourceRequirements describes the compute resource requirements.
+
+        :param limits: Limits describes the maximum amount of compute resources allowed. More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+        :param requests: Requests describes the minimum amount of compute resources required. If Requests is omitted for a container, it defaults to Limits if that is explicitly specified, otherwise to an implementation-defined value. More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+
+        :schema: io.k8s.api.core.v1.ResourceRequirements
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__6f28381f115e86cc4a857dc64662f80338d1b27b3fbd53665d90231711e3a3cd)
+            check_type(argname="argument limits", value=limits, expected_type=type_hints["limits"])
+            check_type(argname="argument requests", value=requests, expected_type=type_hints["requests"])
+        self._value_limits = limits
+        self._value_requests = requests
+
+    @builtins.property
+    def limits(self) -> typing.Optional[typing.Mapping[builtins.str, Quantity]]:
+        '''Limits describes the maximum amount of compute resources allowed.
+
+        More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+
+        :schema: io.k8s.api.core.v1.ResourceRequirements#limits
+        '''
+        result = self._value_limits
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, Quantity]], result)
+
+    @builtins.property
+    def requests(self) -> typing.Optional[typing.Mapping[builtins.str, Quantity]]:
+        '''Requests describes the minimum amount of compute resources required.
+
+        If Requests is omitted for a container, it defaults to Limits if that is explicitly specified, otherwise to an implementation-defined value. More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/
+
+        :schema: io.k8s.api.core.v1.ResourceRequirements#requests
+        '''
+        result = self._value_requests
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, Quantity]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_limits is not None:
+            values["limits"] = self._value_limits
+        if self._value_requests is not None:
+            values["requests"] = self._value_requests
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ResourceRequirements(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__6f28381f115e86cc4a857dc64662f80338d1b27b3fbd53665d90231711e3a3cd(
+    *,
+    limits: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+    requests: typing.Optional[typing.Mapping[builtins.str, Quantity]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
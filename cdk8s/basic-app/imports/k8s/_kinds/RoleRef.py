@@ -0,0 +1,114 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.RoleRef",
+    jsii_struct_bases=[],
+    name_mapping={"api_group": "apiGroup", "kind": "kind", "name": "name"},
+)
+class RoleRef(_base.Struct):
+    __slots__ = (
+        "_value_api_group",
+        "_value_kind",
+        "_value_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        api_group: builtins.str,
+        kind: builtins.str,
+        name: builtins.str,
+    ) -> None:
+        '''RoleRef contains information that points to the role being used.
+
+        :param api_group: APIGroup is the group for the resource being referenced.
+        :param kind: Kind is the type of resource being referenced.
+        :param name: Name is the name of resource being referenced.
+
+        :schema: io.k8s.api.rbac.v1.RoleRef
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__34728caa2c65a1bce45499a1f4530a2e2966d14ff7e6d57ddbf874c837a09229)
+            check_type(argname="argument api_group", value=api_group, expected_type=type_hints["api_group"])
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+        self._value_api_group = api_group
+        self._value_kind = kind
+        self._value_name = name
+
+    @builtins.property
+    def api_group(self) -> builtins.str:
+        '''APIGroup is the group for the resource being referenced.
+
+        :schema: io.k8s.api.rbac.v1.RoleRef#apiGroup
+        '''
+        result = self._value_api_group
+        assert result is not None, "Required property 'api_group' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def kind(self) -> builtins.str:
+        '''Kind is the type of resource being referenced.
+
+        :schema: io.k8s.api.rbac.v1.RoleRef#kind
+        '''
+        result = self._value_kind
+        assert result is not None, "Required property 'kind' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''Name is the name of resource being referenced.
+
+        :schema: io.k8s.api.rbac.v1.RoleRef#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "api_group": self._value_api_group,
+            "kind": self._value_kind,
+            "name": self._value_name,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "RoleRef(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__34728caa2c65a1bce45499a1f4530a2e2966d14ff7e6d57ddbf874c837a09229(
+    *,
+    api_group: builtins.str,
+    kind: builtins.str,
+    name: builtins.str,
+) -> None:
+    """Type checking stubs"""
+    pass
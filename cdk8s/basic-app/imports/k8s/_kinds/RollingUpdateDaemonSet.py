@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IntOrString import IntOrString
+
+
+@jsii.data_type(
+    jsii_type="k8s.RollingUpdateDaemonSet",
+    jsii_struct_bases=[],
+    name_mapping={"max_surge": "maxSurge", "max_unavailable": "maxUnavailable"},
+)
+class RollingUpdateDaemonSet(_base.Struct):
+    __slots__ = (
+        "_value_max_surge",
+        "_value_max_unavailable",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_surge: typing.Optional[IntOrString] = None,
+        max_unavailable: typing.Optional[IntOrString] = None,
+    ) -> None:
+        '''Spec to control the desired behavior of daemon set rolling update.
+
+        :param max_surge: The maximum number of nodes with an existing available DaemonSet pod that can have an updated DaemonSet pod during during an update. Value can be an absolute number (ex: 5) or a percentage of desired pods (ex: 10%). This can not be 0 if MaxUnavailable is 0. Absolute number is calculated from percentage by rounding up to a minimum of 1. Default value is 0. Example: when this is set to 30%, at most 30% of the total number of nodes that should be running the daemon pod (i.e. status.desiredNumberScheduled) can have their a new pod created before the old pod is marked as deleted. The update starts by launching new pods on 30% of nodes. Once an updated pod is available (Ready for at least minReadySeconds) the old DaemonSet pod on that node is marked deleted. If the old pod becomes unavailable for any reason (Ready transitions to false, is evicted, or is drained) an updated pod is immediatedly created on that node without considering surge limits. Allowing surge implies the possibility that the resources consumed by the daemonset on any given node can double if the readiness check fails, and so resource intensive daemonsets should take into account that they may cause evictions during disruption.
+        :param max_unavailable: The maximum number of DaemonSet pods that can be unavailable during the update. Value can be an absolute number (ex: 5) or a percentage of total number of DaemonSet pods at the start of the update (ex: 10%). Absolute number is calculated from percentage by rounding up. This cannot be 0 if MaxSurge is 0 Default value is 1. Example: when this is set to 30%, at most 30% of the total number of nodes that should be running the daemon pod (i.e. status.desiredNumberScheduled) can have their pods stopped for an update at any given time. The update starts by stopping at most 30% of those DaemonSet pods and then brings up new DaemonSet pods in their place. Once the new pods are available, it then proceeds onto other DaemonSet pods, thus ensuring that at least 70% of original number of DaemonSet pods are available at all times during the update.
+
+        :schema: io.k8s.api.apps.v1.RollingUpdateDaemonSet
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__36e1da895206a5ed9179f6d5649f08d688e482419e0ac3c555bca88a46e32a8d)
+            check_type(argname="argument max_surge", value=max_surge, expected_type=type_hints["max_surge"])
+            check_type(argname="argument max_unavailable", value=max_unavailable, expected_type=type_hints["max_unavailable"])
+        self._value_max_surge = max_surge
+        self._value_max_unavailable = max_unavailable
+
+    @builtins.property
+    def max_surge(self) -> typing.Optional[IntOrString]:
+        '''The maximum number of nodes with an existing available DaemonSet pod that can have an updated DaemonSet pod during during an update.
+
+        Value can be an absolute number (ex: 5) or a percentage of desired pods (ex: 10%). This can not be 0 if MaxUnavailable is 0. Absolute number is calculated from percentage by rounding up to a minimum of 1. Default value is 0. Example: when this is set to 30%, at most 30% of the total number of nodes that should be running the daemon pod (i.e. status.desiredNumberScheduled) can have their a new pod created before the old pod is marked as deleted. The update starts by launching new pods on 30% of nodes. Once an updated pod is available (Ready for at least minReadySeconds) the old DaemonSet pod on that node is marked deleted. If the old pod becomes unavailable for any reason (Ready transitions to false, is evicted, or is drained) an updated pod is immediatedly created on that node without considering surge limits. Allowing surge implies the possibility that the resources consumed by the daemonset on any given node can double if the readiness check fails, and so resource intensive daemonsets should take into account that they may cause evictions during disruption.
+
+        :schema: io.k8s.api.apps.v1.RollingUpdateDaemonSet#maxSurge
+        '''
+        result = self._value_max_surge
+        return typing.cast(typing.Optional[IntOrString], result)
+
+    @builtins.property
+    def max_unavailable(self) -> typing.Optional[IntOrString]:
+        '''The maximum number of DaemonSet pods that can be unavailable during the update.
+
+        Value can be an absolute number (ex: 5) or a percentage of total number of DaemonSet pods at the start of the update (ex: 10%). Absolute number is calculated from percentage by rounding up. This cannot be 0 if MaxSurge is 0 Default value is 1. Example: when this is set to 30%, at most 30% of the total number of nodes that should be running the daemon pod (i.e. status.desiredNumberScheduled) can have their pods stopped for an update at any given time. The update starts by stopping at most 30% of those DaemonSet pods and then brings up new DaemonSet pods in their place. Once the new pods are available, it then proceeds onto other DaemonSet pods, thus ensuring that at least 70% of original number of DaemonSet pods are available at all times during the update.
+
+        :schema: io.k8s.api.apps.v1.RollingUpdateDaemonSet#maxUnavailable
+        '''
+        result = self._value_max_unavailable
+        return typing.cast(typing.Optional[IntOrString], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_max_surge is not None:
+            values["max_surge"] = self._value_max_surge
+        if self._value_max_unavailable is not None:
+            values["max_unavailable"] = self._value_max_unavailable
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "RollingUpdateDaemonSet(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__36e1da895206a5ed9179f6d5649f08d688e482419e0ac3c555bca88a46e32a8d(
+    *,
+    max_surge: typing.Optional[IntOrString] = None,
+    max_unavailable: typing.Optional[IntOrString] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
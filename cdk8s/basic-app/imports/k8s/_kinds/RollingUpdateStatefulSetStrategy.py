@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IntOrString import IntOrString
+
+
+@jsii.data_type(
+    jsii_type="k8s.RollingUpdateStatefulSetStrategy",
+    jsii_struct_bases=[],
+    name_mapping={"max_unavailable": "maxUnavailable", "partition": "partition"},
+)
+class RollingUpdateStatefulSetStrategy(_base.Struct):
+    __slots__ = (
+        "_value_max_unavailable",
+        "_value_partition",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_unavailable: typing.Optional[IntOrString] = None,
+        partition: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''RollingUpdateStatefulSetStrategy is used to communicate parameter for RollingUpdateStatefulSetStrategyType.
+
+        :param max_unavailable: The maximum number of pods that can be unavailable during the update. Value can be an absolute number (ex: 5) or a percentage of desired pods (ex: 10%). Absolute number is calculated from percentage by rounding up. This can not be 0. Defaults to 1. This field is alpha-level and is only honored by servers that enable the MaxUnavailableStatefulSet feature. The field applies to all pods in the range 0 to Replicas-1. That means if there is any unavailable pod in the range 0 to Replicas-1, it will be counted towards MaxUnavailable. Default: 1. This field is alpha-level and is only honored by servers that enable the MaxUnavailableStatefulSet feature. The field applies to all pods in the range 0 to Replicas-1. That means if there is any unavailable pod in the range 0 to Replicas-1, it will be counted towards MaxUnavailable.
+        :param partition: Partition indicates the ordinal at which the StatefulSet should be partitioned for updates. During a rolling update, all pods from ordinal Replicas-1 to Partition are updated. All pods from ordinal Partition-1 to 0 remain untouched. This is helpful in being able to do a canary based deployment. The default value is 0.
+
+        :schema: io.k8s.api.apps.v1.RollingUpdateStatefulSetStrategy
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__5244c3370eebd6a466d9aa0a3a0f3ab6e3fec32436cc8b602ba25a37b7f9e5ec)
+            check_type(argname="argument max_unavailable", value=max_unavailable, expected_type=type_hints["max_unavailable"])
+            check_type(argname="argument partition", value=partition, expected_type=type_hints["partition"])
+        self._value_max_unavailable = max_unavailable
+        self._value_partition = partition
+
+    @builtins.property
+    def max_unavailable(self) -> typing.Optional[IntOrString]:
+        '''The maximum number of pods that can be unavailable during the update.
+
+        Value can be an absolute number (ex: 5) or a percentage of desired pods (ex: 10%). Absolute number is calculated from percentage by rounding up. This can not be 0. Defaults to 1. This field is alpha-level and is only honored by servers that enable the MaxUnavailableStatefulSet feature. The field applies to all pods in the range 0 to Replicas-1. That means if there is any unavailable pod in the range 0 to Replicas-1, it will be counted towards MaxUnavailable.
+
+        :default: 1. This field is alpha-level and is only honored by servers that enable the MaxUnavailableStatefulSet feature. The field applies to all pods in the range 0 to Replicas-1. That means if there is any unavailable pod in the range 0 to Replicas-1, it will be counted towards MaxUnavailable.
+
+        :schema: io.k8s.api.apps.v1.RollingUpdateStatefulSetStrategy#maxUnavailable
+        '''
+        result = self._value_max_unavailable
+        return typing.cast(typing.Optional[IntOrString], result)
+
+    @builtins.property
+    def partition(self) -> typing.Optional[jsii.Number]:
+        '''Partition indicates the ordinal at which the StatefulSet should be partitioned for updates.
+
+        During a rolling update, all pods from ordinal Replicas-1 to Partition are updated. All pods from ordinal Partition-1 to 0 remain untouched. This is helpful in being able to do a canary based deployment. The default value is 0.
+
+        :schema: io.k8s.api.apps.v1.RollingUpdateStatefulSetStrategy#partition
+        '''
+        result = self._value_partition
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_max_unavailable is not None:
+            values["max_unavailable"] = self._value_max_unavailable
+        if self._value_partition is not None:
+            values["partition"] = self._value_partition
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "RollingUpdateStatefulSetStrategy(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__5244c3370eebd6a466d9aa0a3a0f3ab6e3fec32436cc8b602ba25a37b7f9e5ec(
+    *,
+    max_unavailable: typing.Optional[IntOrString] = None,
+    partition: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,171 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.RuleWithOperations",
+    jsii_struct_bases=[],
+    name_mapping={
+        "api_groups": "apiGroups",
+        "api_versions": "apiVersions",
+        "operations": "operations",
+        "resources": "resources",
+        "scope": "scope",
+    },
+)
+class RuleWithOperations(_base.Struct):
+    __slots__ = (
+        "_value_api_groups",
+        "_value_api_versions",
+        "_value_operations",
+        "_value_resources",
+        "_value_scope",
+    )
+
+    def __init__(
+        self,
+        *,
+        api_groups: typing.Optional[typing.Sequence[builtins.str]] = None,
+        api_versions: typing.Optional[typing.Sequence[builtins.str]] = None,
+        operations: typing.Optional[typing.Sequence[builtins.str]] = None,
+        resources: typing.Optional[typing.Sequence[builtins.str]] = None,
+        scope: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''RuleWithOperations is a tuple of Operations and Resources.
+
+        It is recommended to make sure that all the tuple expansions are valid.
+
+        :param api_groups: APIGroups is the API groups the resources belong to. '*' is all groups. If '*' is present, the length of the slice must be one. Required.
+        :param api_versions: APIVersions is the API versions the resources belong to. '*' is all versions. If '*' is present, the length of the slice must be one. Required.
+        :param operations: Operations is the operations the admission hook cares about - CREATE, UPDATE, DELETE, CONNECT or * for all of those operations and any future admission operations that are added. If '*' is present, the length of the slice must be one. Required.
+        :param resources: Resources is a list of resources this rule applies to. For example: 'pods' means pods. 'pods/log' means the log subresource of pods. '*' means all resources, but not subresources. 'pods/*' means all subresources of pods. '*/scale' means all scale subresources. '*/*' means all resources and their subresources. If wildcard is present, the validation rule will ensure resources do not overlap with each other. Depending on the enclosing object, subresources might not be allowed. Required.
+        :param scope: scope specifies the scope of this rule. Valid values are "Cluster", "Namespaced", and "*" "Cluster" means that only cluster-scoped resources will match this rule. Namespace API objects are cluster-scoped. "Namespaced" means that only namespaced resources will match this rule. "*" means that there are no scope restrictions. Subresources match the scope of their parent resource. Default is "*". Default: .
+
+        :schema: io.k8s.api.admissionregistration.v1.RuleWithOperations
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__a86077ec1a02004936f4e7b29b4891e15e965506276980ac5cde5434c9cb21a0)
+            check_type(argname="argument api_groups", value=api_groups, expected_type=type_hints["api_groups"])
+            check_type(argname="argument api_versions", value=api_versions, expected_type=type_hints["api_versions"])
+            check_type(argname="argument operations", value=operations, expected_type=type_hints["operations"])
+            check_type(argname="argument resources", value=resources, expected_type=type_hints["resources"])
+            check_type(argname="argument scope", value=scope, expected_type=type_hints["scope"])
+        self._value_api_groups = api_groups
+        self._value_api_versions = api_versions
+        self._value_operations = operations
+        self._value_resources = resources
+        self._value_scope = scope
+
+    @builtins.property
+    def api_groups(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''APIGroups is the API groups the resources belong to.
+
+        '*' is all groups. If '*' is present, the length of the slice must be one. Required.
+
+        :schema: io.k8s.api.admissionregistration.v1.RuleWithOperations#apiGroups
+        '''
+        result = self._value_api_groups
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def api_versions(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''APIVersions is the API versions the resources belong to.
+
+        '*' is all versions. If '*' is present, the length of the slice must be one. Required.
+
+        :schema: io.k8s.api.admissionregistration.v1.RuleWithOperations#apiVersions
+        '''
+        result = self._value_api_versions
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def operations(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Operations is the operations the admission hook cares about - CREATE, UPDATE, DELETE, CONNECT or * for all of those operations and any future admission operations that are added.
+
+        If '*' is present, the length of the slice must be one. Required.
+
+        :schema: io.k8s.api.admissionregistration.v1.RuleWithOperations#operations
+        '''
+        result = self._value_operations
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def resources(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Resources is a list of resources this rule applies to.
+
+        For example: 'pods' means pods. 'pods/log' means the log subresource of pods. '*' means all resources, but not subresources. 'pods/*' means all subresources of pods. '*/scale' means all scale subresources. '*/*' means all resources and their subresources.
+
+        If wildcard is present, the validation rule will ensure resources do not overlap with each other.
+
+        Depending on the enclosing object, subresources might not be allowed. Required.
+
+        :schema: io.k8s.api.admissionregistration.v1.RuleWithOperations#resources
+        '''
+        result = self._value_resources
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def scope(self) -> typing.Optional[builtins.str]:
+        '''scope specifies the scope of this rule.
+
+        Valid values are "Cluster", "Namespaced", and "*" "Cluster" means that only cluster-scoped resources will match this rule. Namespace API objects are cluster-scoped. "Namespaced" means that only namespaced resources will match this rule. "*" means that there are no scope restrictions. Subresources match the scope of their parent resource. Default is "*".
+
+        :default: .
+
+        :schema: io.k8s.api.admissionregistration.v1.RuleWithOperations#scope
+        '''
+        result = self._value_scope
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_api_groups is not None:
+            values["api_groups"] = self._value_api_groups
+        if self._value_api_versions is not None:
+            values["api_versions"] = self._value_api_versions
+        if self._value_operations is not None:
+            values["operations"] = self._value_operations
+        if self._value_resources is not None:
+            values["resources"] = self._value_resources
+        if self._value_scope is not None:
+            values["scope"] = self._value_scope
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "RuleWithOperations(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__a86077ec1a02004936f4e7b29b4891e15e965506276980ac5cde5434c9cb21a0(
+    *,
+    api_groups: typing.Optional[typing.Sequence[builtins.str]] = None,
+    api_versions: typing.Optional[typing.Sequence[builtins.str]] = None,
+    operations: typing.Optional[typing.Sequence[builtins.str]] = None,
+    resources: typing.Optional[typing.Sequence[builtins.str]] = None,
+    scope: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
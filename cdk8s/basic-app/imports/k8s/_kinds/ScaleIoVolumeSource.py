@@ -0,0 +1,261 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LocalObjectReference import LocalObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.ScaleIoVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "gateway": "gateway",
+        "secret_ref": "secretRef",
+        "system": "system",
+        "fs_type": "fsType",
+        "protection_domain": "protectionDomain",
+        "read_only": "readOnly",
+        "ssl_enabled": "sslEnabled",
+        "storage_mode": "storageMode",
+        "storage_pool": "storagePool",
+        "volume_name": "volumeName",
+    },
+)
+class ScaleIoVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_gateway",
+        "_value_secret_ref",
+        "_value_system",
+        "_value_fs_type",
+        "_value_protection_domain",
+        "_value_read_only",
+        "_value_ssl_enabled",
+        "_value_storage_mode",
+        "_value_storage_pool",
+        "_value_volume_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        gateway: builtins.str,
+        secret_ref: typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]],
+        system: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+        protection_domain: typing.Optional[builtins.str] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        ssl_enabled: typing.Optional[builtins.bool] = None,
+        storage_mode: typing.Optional[builtins.str] = None,
+        storage_pool: typing.Optional[builtins.str] = None,
+        volume_name: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ScaleIOVolumeSource represents a persistent ScaleIO volume.
+
+        :param gateway: gateway is the host address of the ScaleIO API Gateway.
+        :param secret_ref: secretRef references to the secret for ScaleIO user and other sensitive information. If this is not provided, Login operation will fail.
+        :param system: system is the name of the storage system as configured in ScaleIO.
+        :param fs_type: fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Default is "xfs". Default: xfs".
+        :param protection_domain: protectionDomain is the name of the ScaleIO Protection Domain for the configured storage.
+        :param read_only: readOnly Defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. Default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+        :param ssl_enabled: sslEnabled Flag enable/disable SSL communication with Gateway, default false.
+        :param storage_mode: storageMode indicates whether the storage for a volume should be ThickProvisioned or ThinProvisioned. Default is ThinProvisioned. Default: ThinProvisioned.
+        :param storage_pool: storagePool is the ScaleIO Storage Pool associated with the protection domain.
+        :param volume_name: volumeName is the name of a volume already created in the ScaleIO system that is associated with this volume source.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource
+        '''
+        if isinstance(secret_ref, dict):
+            secret_ref = LocalObjectReference(**secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__a01207e2538a5a1358fca3cbc8251d3c0eac11c259c7d6e013872e8e0c4e0aff)
+            check_type(argname="argument gateway", value=gateway, expected_type=type_hints["gateway"])
+            check_type(argname="argument secret_ref", value=secret_ref, expected_type=type_hints["secret_ref"])
+            check_type(argname="argument system", value=system, expected_type=type_hints["system"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument protection_domain", value=protection_domain, expected_type=type_hints["protection_domain"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument ssl_enabled", value=ssl_enabled, expected_type=type_hints["ssl_enabled"])
+            check_type(argname="argument storage_mode", value=storage_mode, expected_type=type_hints["storage_mode"])
+            check_type(argname="argument storage_pool", value=storage_pool, expected_type=type_hints["storage_pool"])
+            check_type(argname="argument volume_name", value=volume_name, expected_type=type_hints["volume_name"])
+        self._value_gateway = gateway
+        self._value_secret_ref = secret_ref
+        self._value_system = system
+        self._value_fs_type = fs_type
+        self._value_protection_domain = protection_domain
+        self._value_read_only = read_only
+        self._value_ssl_enabled = ssl_enabled
+        self._value_storage_mode = storage_mode
+        self._value_storage_pool = storage_pool
+        self._value_volume_name = volume_name
+
+    @builtins.property
+    def gateway(self) -> builtins.str:
+        '''gateway is the host address of the ScaleIO API Gateway.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#gateway
+        '''
+        result = self._value_gateway
+        assert result is not None, "Required property 'gateway' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def secret_ref(self) -> LocalObjectReference:
+        '''secretRef references to the secret for ScaleIO user and other sensitive information.
+
+        If this is not provided, Login operation will fail.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#secretRef
+        '''
+        result = self._value_secret_ref
+        assert result is not None, "Required property 'secret_ref' is missing"
+        return typing.cast(LocalObjectReference, result)
+
+    @builtins.property
+    def system(self) -> builtins.str:
+        '''system is the name of the storage system as configured in ScaleIO.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#system
+        '''
+        result = self._value_system
+        assert result is not None, "Required property 'system' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the filesystem type to mount.
+
+        Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Default is "xfs".
+
+        :default: xfs".
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def protection_domain(self) -> typing.Optional[builtins.str]:
+        '''protectionDomain is the name of the ScaleIO Protection Domain for the configured storage.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#protectionDomain
+        '''
+        result = self._value_protection_domain
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly Defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :default: false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def ssl_enabled(self) -> typing.Optional[builtins.bool]:
+        '''sslEnabled Flag enable/disable SSL communication with Gateway, default false.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#sslEnabled
+        '''
+        result = self._value_ssl_enabled
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def storage_mode(self) -> typing.Optional[builtins.str]:
+        '''storageMode indicates whether the storage for a volume should be ThickProvisioned or ThinProvisioned.
+
+        Default is ThinProvisioned.
+
+        :default: ThinProvisioned.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#storageMode
+        '''
+        result = self._value_storage_mode
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def storage_pool(self) -> typing.Optional[builtins.str]:
+        '''storagePool is the ScaleIO Storage Pool associated with the protection domain.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#storagePool
+        '''
+        result = self._value_storage_pool
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def volume_name(self) -> typing.Optional[builtins.str]:
+        '''volumeName is the name of a volume already created in the ScaleIO system that is associated with this volume source.
+
+        :schema: io.k8s.api.core.v1.ScaleIOVolumeSource#volumeName
+        '''
+        result = self._value_volume_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "gateway": self._value_gateway,
+            "secret_ref": self._value_secret_ref,
+            "system": self._value_system,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_protection_domain is not None:
+            values["protection_domain"] = self._value_protection_domain
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_ssl_enabled is not None:
+            values["ssl_enabled"] = self._value_ssl_enabled
+        if self._value_storage_mode is not None:
+            values["storage_mode"] = self._value_storage_mode
+        if self._value_storage_pool is not None:
+            values["storage_pool"] = self._value_storage_pool
+        if self._value_volume_name is not None:
+            values["volume_name"] = self._value_volume_name
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ScaleIoVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__a01207e2538a5a1358fca3cbc8251d3c0eac11c259c7d6e013872e8e0c4e0aff(
+    *,
+    gateway: builtins.str,
+    secret_ref: typing.Union[LocalObjectReference, typing.Dict[builtins.str, typing.Any]],
+    system: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+    protection_domain: typing.Optional[builtins.str] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    ssl_enabled: typing.Optional[builtins.bool] = None,
+    storage_mode: typing.Optional[builtins.str] = None,
+    storage_pool: typing.Optional[builtins.str] = None,
+    volume_name: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
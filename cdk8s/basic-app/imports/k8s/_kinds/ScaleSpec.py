@@ -0,0 +1,75 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ScaleSpec",
+    jsii_struct_bases=[],
+    name_mapping={"replicas": "replicas"},
+)
+class ScaleSpec(_base.Struct):
+    __slots__ = (
+        "_value_replicas",
+    )
+
+    def __init__(self, *, replicas: typing.Optional[jsii.Number] = None) -> None:
+        '''ScaleSpec describes the attributes of a scale subresource.
+
+        :param replicas: desired number of instances for the scaled object.
+
+        :schema: io.k8s.api.autoscaling.v1.ScaleSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__933ce43198d2e61bf18cbdc69b1a85d78c4b5059b04255c8eaae6fd004cd796f)
+            check_type(argname="argument replicas", value=replicas, expected_type=type_hints["replicas"])
+        self._value_replicas = replicas
+
+    @builtins.property
+    def replicas(self) -> typing.Optional[jsii.Number]:
+        '''desired number of instances for the scaled object.
+
+        :schema: io.k8s.api.autoscaling.v1.ScaleSpec#replicas
+        '''
+        result = self._value_replicas
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_replicas is not None:
+            values["replicas"] = self._value_replicas
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ScaleSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__933ce43198d2e61bf18cbdc69b1a85d78c4b5059b04255c8eaae6fd004cd796f(
+    *,
+    replicas: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
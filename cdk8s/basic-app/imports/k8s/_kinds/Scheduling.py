@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Toleration import Toleration
+
+
+@jsii.data_type(
+    jsii_type="k8s.Scheduling",
+    jsii_struct_bases=[],
+    name_mapping={"node_selector": "nodeSelector", "tolerations": "tolerations"},
+)
+class Scheduling(_base.Struct):
+    __slots__ = (
+        "_value_node_selector",
+        "_value_tolerations",
+    )
+
+    def __init__(
+        self,
+        *,
+        node_selector: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        tolerations: typing.Optional[typing.Sequence[typing.Union["Toleration", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''Scheduling specifies the scheduling constraints for nodes supporting a RuntimeClass.
+
+        :param node_selector: nodeSelector lists labels that must be present on nodes that support this RuntimeClass. Pods using this RuntimeClass can only be scheduled to a node matched by this selector. The RuntimeClass nodeSelector is merged with a pod's existing nodeSelector. Any conflicts will cause the pod to be rejected in admission.
+        :param tolerations: tolerations are appended (excluding duplicates) to pods running with this RuntimeClass during admission, effectively unioning the set of nodes tolerated by the pod and the RuntimeClass.
+
+        :schema: io.k8s.api.node.v1.Scheduling
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ec3f34534a8ab02cd430086d5367d2f94c6c0e7343339e7bfc16ee13ddc99d7a)
+            check_type(argname="argument node_selector", value=node_selector, expected_type=type_hints["node_selector"])
+            check_type(argname="argument tolerations", value=tolerations, expected_type=type_hints["tolerations"])
+        self._value_node_selector = node_selector
+        self._value_tolerations = tolerations
+
+    @builtins.property
+    def node_selector(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''nodeSelector lists labels that must be present on nodes that support this RuntimeClass.
+
+        Pods using this RuntimeClass can only be scheduled to a node matched by this selector. The RuntimeClass nodeSelector is merged with a pod's existing nodeSelector. Any conflicts will cause the pod to be rejected in admission.
+
+        :schema: io.k8s.api.node.v1.Scheduling#nodeSelector
+        '''
+        result = self._value_node_selector
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def tolerations(self) -> typing.Optional[typing.List["Toleration"]]:
+        '''tolerations are appended (excluding duplicates) to pods running with this RuntimeClass during admission, effectively unioning the set of nodes tolerated by the pod and the RuntimeClass.
+
+        :schema: io.k8s.api.node.v1.Scheduling#tolerations
+        '''
+        result = self._value_tolerations
+        return typing.cast(typing.Optional[typing.List["Toleration"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_node_selector is not None:
+            values["node_selector"] = self._value_node_selector
+        if self._value_tolerations is not None:
+            values["tolerations"] = self._value_tolerations
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Scheduling(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ec3f34534a8ab02cd430086d5367d2f94c6c0e7343339e7bfc16ee13ddc99d7a(
+    *,
+    node_selector: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    tolerations: typing.Optional[typing.Sequence[typing.Union[Toleration, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
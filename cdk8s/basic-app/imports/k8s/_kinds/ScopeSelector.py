@@ -0,0 +1,82 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ScopedResourceSelectorRequirement import ScopedResourceSelectorRequirement
+
+
+@jsii.data_type(
+    jsii_type="k8s.ScopeSelector",
+    jsii_struct_bases=[],
+    name_mapping={"match_expressions": "matchExpressions"},
+)
+class ScopeSelector(_base.Struct):
+    __slots__ = (
+        "_value_match_expressions",
+    )
+
+    def __init__(
+        self,
+        *,
+        match_expressions: typing.Optional[typing.Sequence[typing.Union["ScopedResourceSelectorRequirement", typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''A scope selector represents the AND of the selectors represented by the scoped-resource selector requirements.
+
+        :param match_expressions: A list of scope selector requirements by scope of the resources.
+
+        :schema: io.k8s.api.core.v1.ScopeSelector
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__9b4391c052c165b6256ea047b5596eab2fcecf19b0a9177b1c5aa1a8485a8d65)
+            check_type(argname="argument match_expressions", value=match_expressions, expected_type=type_hints["match_expressions"])
+        self._value_match_expressions = match_expressions
+
+    @builtins.property
+    def match_expressions(
+        self,
+    ) -> typing.Optional[typing.List["ScopedResourceSelectorRequirement"]]:
+        '''A list of scope selector requirements by scope of the resources.
+
+        :schema: io.k8s.api.core.v1.ScopeSelector#matchExpressions
+        '''
+        result = self._value_match_expressions
+        return typing.cast(typing.Optional[typing.List["ScopedResourceSelectorRequirement"]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_match_expressions is not None:
+            values["match_expressions"] = self._value_match_expressions
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ScopeSelector(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__9b4391c052c165b6256ea047b5596eab2fcecf19b0a9177b1c5aa1a8485a8d65(
+    *,
+    match_expressions: typing.Optional[typing.Sequence[typing.Union[ScopedResourceSelectorRequirement, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,122 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ScopedResourceSelectorRequirement",
+    jsii_struct_bases=[],
+    name_mapping={
+        "operator": "operator",
+        "scope_name": "scopeName",
+        "values": "values",
+    },
+)
+class ScopedResourceSelectorRequirement(_base.Struct):
+    __slots__ = (
+        "_value_operator",
+        "_value_scope_name",
+        "_value_values",
+    )
+
+    def __init__(
+        self,
+        *,
+        operator: builtins.str,
+        scope_name: builtins.str,
+        values: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ) -> None:
+        '''A scoped-resource selector requirement is a selector that contains values, a scope name, and an operator that relates the scope name and values.
+
+        :param operator: Represents a scope's relationship to a set of values. Valid operators are In, NotIn, Exists, DoesNotExist.
+        :param scope_name: The name of the scope that the selector applies to.
+        :param values: An array of string values. If the operator is In or NotIn, the values array must be non-empty. If the operator is Exists or DoesNotExist, the values array must be empty. This array is replaced during a strategic merge patch.
+
+        :schema: io.k8s.api.core.v1.ScopedResourceSelectorRequirement
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__25d2fa33badd5c55fedc6548e4a9811bdcfdd1569a40592b494f98dd2faa0d58)
+            check_type(argname="argument operator", value=operator, expected_type=type_hints["operator"])
+            check_type(argname="argument scope_name", value=scope_name, expected_type=type_hints["scope_name"])
+            check_type(argname="argument values", value=values, expected_type=type_hints["values"])
+        self._value_operator = operator
+        self._value_scope_name = scope_name
+        self._value_values = values
+
+    @builtins.property
+    def operator(self) -> builtins.str:
+        '''Represents a scope's relationship to a set of values.
+
+        Valid operators are In, NotIn, Exists, DoesNotExist.
+
+        :schema: io.k8s.api.core.v1.ScopedResourceSelectorRequirement#operator
+        '''
+        result = self._value_operator
+        assert result is not None, "Required property 'operator' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def scope_name(self) -> builtins.str:
+        '''The name of the scope that the selector applies to.
+
+        :schema: io.k8s.api.core.v1.ScopedResourceSelectorRequirement#scopeName
+        '''
+        result = self._value_scope_name
+        assert result is not None, "Required property 'scope_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def values(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''An array of string values.
+
+        If the operator is In or NotIn, the values array must be non-empty. If the operator is Exists or DoesNotExist, the values array must be empty. This array is replaced during a strategic merge patch.
+
+        :schema: io.k8s.api.core.v1.ScopedResourceSelectorRequirement#values
+        '''
+        result = self._value_values
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "operator": self._value_operator,
+            "scope_name": self._value_scope_name,
+        }
+        if self._value_values is not None:
+            values["values"] = self._value_values
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ScopedResourceSelectorRequirement(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__25d2fa33badd5c55fedc6548e4a9811bdcfdd1569a40592b494f98dd2faa0d58(
+    *,
+    operator: builtins.str,
+    scope_name: builtins.str,
+    values: typing.Optional[typing.Sequence[builtins.str]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,130 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.SeLinuxOptions",
+    jsii_struct_bases=[],
+    name_mapping={"level": "level", "role": "role", "type": "type", "user": "user"},
+)
+class SeLinuxOptions(_base.Struct):
+    __slots__ = (
+        "_value_level",
+        "_value_role",
+        "_value_type",
+        "_value_user",
+    )
+
+    def __init__(
+        self,
+        *,
+        level: typing.Optional[builtins.str] = None,
+        role: typing.Optional[builtins.str] = None,
+        type: typing.Optional[builtins.str] = None,
+        user: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''SELinuxOptions are the labels to be applied to the container.
+
+        :param level: Level is SELinux level label that applies to the container.
+        :param role: Role is a SELinux role label that applies to the container.
+        :param type: Type is a SELinux type label that applies to the container.
+        :param user: User is a SELinux user label that applies to the container.
+
+        :schema: io.k8s.api.core.v1.SELinuxOptions
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__83c2afea88042856c9e697502b222fdab3ba5aa314b8db7832e18390438f4cae)
+            check_type(argname="argument level", value=level, expected_type=type_hints["level"])
+            check_type(argname="argument role", value=role, expected_type=type_hints["role"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument user", value=user, expected_type=type_hints["user"])
+        self._value_level = level
+        self._value_role = role
+        self._value_type = type
+        self._value_user = user
+
+    @builtins.property
+    def level(self) -> typing.Optional[builtins.str]:
+        '''Level is SELinux level label that applies to the container.
+
+        :schema: io.k8s.api.core.v1.SELinuxOptions#level
+        '''
+        result = self._value_level
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def role(self) -> typing.Optional[builtins.str]:
+        '''Role is a SELinux role label that applies to the container.
+
+        :schema: io.k8s.api.core.v1.SELinuxOptions#role
+        '''
+        result = self._value_role
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def type(self) -> typing.Optional[builtins.str]:
+        '''Type is a SELinux type label that applies to the container.
+
+        :schema: io.k8s.api.core.v1.SELinuxOptions#type
+        '''
+        result = self._value_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def user(self) -> typing.Optional[builtins.str]:
+        '''User is a SELinux user label that applies to the container.
+
+        :schema: io.k8s.api.core.v1.SELinuxOptions#user
+        '''
+        result = self._value_user
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_level is not None:
+            values["level"] = self._value_level
+        if self._value_role is not None:
+            values["role"] = self._value_role
+        if self._value_type is not None:
+            values["type"] = self._value_type
+        if self._value_user is not None:
+            values["user"] = self._value_user
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SeLinuxOptions(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__83c2afea88042856c9e697502b222fdab3ba5aa314b8db7832e18390438f4cae(
+    *,
+    level: typing.Optional[builtins.str] = None,
+    role: typing.Optional[builtins.str] = None,
+    type: typing.Optional[builtins.str] = None,
+    user: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,103 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.SeccompProfile",
+    jsii_struct_bases=[],
+    name_mapping={"type": "type", "localhost_profile": "localhostProfile"},
+)
+class SeccompProfile(_base.Struct):
+    __slots__ = (
+        "_value_type",
+        "_value_localhost_profile",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: builtins.str,
+        localhost_profile: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''SeccompProfile defines a pod/container's seccomp profile settings.
+
+        Only one profile source may be set.
+
+        :param type: type indicates which kind of seccomp profile will be applied. Valid options are:. Localhost - a profile defined in a file on the node should be used. RuntimeDefault - the container runtime default profile should be used. Unconfined - no profile should be applied.
+        :param localhost_profile: localhostProfile indicates a profile defined in a file on the node should be used. The profile must be preconfigured on the node to work. Must be a descending path, relative to the kubelet's configured seccomp profile location. Must only be set if type is "Localhost".
+
+        :schema: io.k8s.api.core.v1.SeccompProfile
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__671e277701b07860347cc95c432e5605a89c2d148bebfccaead627a5b559eba4)
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+            check_type(argname="argument localhost_profile", value=localhost_profile, expected_type=type_hints["localhost_profile"])
+        self._value_type = type
+        self._value_localhost_profile = localhost_profile
+
+    @builtins.property
+    def type(self) -> builtins.str:
+        '''type indicates which kind of seccomp profile will be applied. Valid options are:.
+
+        Localhost - a profile defined in a file on the node should be used. RuntimeDefault - the container runtime default profile should be used. Unconfined - no profile should be applied.
+
+        :schema: io.k8s.api.core.v1.SeccompProfile#type
+        '''
+        result = self._value_type
+        assert result is not None, "Required property 'type' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def localhost_profile(self) -> typing.Optional[builtins.str]:
+        '''localhostProfile indicates a profile defined in a file on the node should be used.
+
+        The profile must be preconfigured on the node to work. Must be a descending path, relative to the kubelet's configured seccomp profile location. Must only be set if type is "Localhost".
+
+        :schema: io.k8s.api.core.v1.SeccompProfile#localhostProfile
+        '''
+        result = self._value_localhost_profile
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "type": self._value_type,
+        }
+        if self._value_localhost_profile is not None:
+            values["localhost_profile"] = self._value_localhost_profile
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SeccompProfile(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__671e277701b07860347cc95c432e5605a89c2d148bebfccaead627a5b559eba4(
+    *,
+    type: builtins.str,
+    localhost_profile: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
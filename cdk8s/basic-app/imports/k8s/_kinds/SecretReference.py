@@ -0,0 +1,98 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.SecretReference",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name", "namespace": "namespace"},
+)
+class SecretReference(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_namespace",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: typing.Optional[builtins.str] = None,
+        namespace: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''SecretReference represents a Secret Reference.
+
+        It has enough information to retrieve secret in any namespace
+
+        :param name: name is unique within a namespace to reference a secret resource.
+        :param namespace: namespace defines the space within which the secret name must be unique.
+
+        :schema: io.k8s.api.core.v1.SecretReference
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7a151e3e3fd089bf4b7fe70426a9c364c57d5a3d0a27a642e74873d5c32aba01)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+        self._value_name = name
+        self._value_namespace = namespace
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''name is unique within a namespace to reference a secret resource.
+
+        :schema: io.k8s.api.core.v1.SecretReference#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def namespace(self) -> typing.Optional[builtins.str]:
+        '''namespace defines the space within which the secret name must be unique.
+
+        :schema: io.k8s.api.core.v1.SecretReference#namespace
+        '''
+        result = self._value_namespace
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_namespace is not None:
+            values["namespace"] = self._value_namespace
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SecretReference(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7a151e3e3fd089bf4b7fe70426a9c364c57d5a3d0a27a642e74873d5c32aba01(
+    *,
+    name: typing.Optional[builtins.str] = None,
+    namespace: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
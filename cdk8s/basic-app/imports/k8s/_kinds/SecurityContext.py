@@ -0,0 +1,305 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .Capabilities import Capabilities
+from .SeLinuxOptions import SeLinuxOptions
+from .SeccompProfile import SeccompProfile
+from .WindowsSecurityContextOptions import WindowsSecurityContextOptions
+
+
+@jsii.data_type(
+    jsii_type="k8s.SecurityContext",
+    jsii_struct_bases=[],
+    name_mapping={
+        "allow_privilege_escalation": "allowPrivilegeEscalation",
+        "capabilities": "capabilities",
+        "privileged": "privileged",
+        "proc_mount": "procMount",
+        "read_only_root_filesystem": "readOnlyRootFilesystem",
+        "run_as_group": "runAsGroup",
+        "run_as_non_root": "runAsNonRoot",
+        "run_as_user": "runAsUser",
+        "seccomp_profile": "seccompProfile",
+        "se_linux_options": "seLinuxOptions",
+        "windows_options": "windowsOptions",
+    },
+)
+class SecurityContext(_base.Struct):
+    __slots__ = (
+        "_value_allow_privilege_escalation",
+        "_value_capabilities",
+        "_value_privileged",
+        "_value_proc_mount",
+        "_value_read_only_root_filesystem",
+        "_value_run_as_group",
+        "_value_run_as_non_root",
+        "_value_run_as_user",
+        "_value_seccomp_profile",
+        "_value_se_linux_options",
+        "_value_windows_options",
+    )
+
+    def __init__(
+        self,
+        *,
+        allow_privilege_escalation: typing.Optional[builtins.bool] = None,
+        capabilities: typing.Optional[typing.Union[Capabilities, typing.Dict[builtins.str, typing.Any]]] = None,
+        privileged: typing.Optional[builtins.bool] = None,
+        proc_mount: typing.Optional[builtins.str] = None,
+        read_only_root_filesystem: typing.Optional[builtins.bool] = None,
+        run_as_group: typing.Optional[jsii.Number] = None,
+        run_as_non_root: typing.Optional[builtins.bool] = None,
+        run_as_user: typing.Optional[jsii.Number] = None,
+        seccomp_profile: typing.Optional[typing.Union[SeccompProfile, typing.Dict[builtins.str, typing.Any]]] = None,
+        se_linux_options: typing.Optional[typing.Union[SeLinuxOptions, typing.Dict[builtins.str, typing.Any]]] = None,
+        windows_options: typing.Optional[typing.Union["WindowsSecurityContextOptions", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''SecurityContext holds security configuration that will be applied to a container.
+
+        Some fields are present in both SecurityContext and PodSecurityContext.  When both are set, the values in SecurityContext take precedence.
+
+        :param allow_privilege_escalation: AllowPrivilegeEscalation controls whether a process can gain more privileges than its parent process. This bool directly controls if the no_new_privs flag will be set on the container process. AllowPrivilegeEscalation is true always when the container is: 1) run as Privileged 2) has CAP_SYS_ADMIN Note that this field cannot be set when spec.os.name is windows.
+        :param capabilities: The capabilities to add/drop when running containers. Defaults to the default set of capabilities granted by the container runtime. Note that this field cannot be set when spec.os.name is windows. Default: the default set of capabilities granted by the container runtime. Note that this field cannot be set when spec.os.name is windows.
+        :param privileged: Run container in privileged mode. Processes in privileged containers are essentially equivalent to root on the host. Defaults to false. Note that this field cannot be set when spec.os.name is windows. Default: false. Note that this field cannot be set when spec.os.name is windows.
+        :param proc_mount: procMount denotes the type of proc mount to use for the containers. The default is DefaultProcMount which uses the container runtime defaults for readonly paths and masked paths. This requires the ProcMountType feature flag to be enabled. Note that this field cannot be set when spec.os.name is windows.
+        :param read_only_root_filesystem: Whether this container has a read-only root filesystem. Default is false. Note that this field cannot be set when spec.os.name is windows. Default: false. Note that this field cannot be set when spec.os.name is windows.
+        :param run_as_group: The GID to run the entrypoint of the container process. Uses runtime default if unset. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is windows.
+        :param run_as_non_root: Indicates that the container must run as a non-root user. If true, the Kubelet will validate the image at runtime to ensure that it does not run as UID 0 (root) and fail to start the container if it does. If unset or false, no such validation will be performed. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+        :param run_as_user: The UID to run the entrypoint of the container process. Defaults to user specified in image metadata if unspecified. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is windows. Default: user specified in image metadata if unspecified. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is windows.
+        :param seccomp_profile: The seccomp options to use by this container. If seccomp options are provided at both the pod & container level, the container options override the pod options. Note that this field cannot be set when spec.os.name is windows.
+        :param se_linux_options: The SELinux context to be applied to the container. If unspecified, the container runtime will allocate a random SELinux context for each container. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is windows.
+        :param windows_options: The Windows specific settings applied to all containers. If unspecified, the options from the PodSecurityContext will be used. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is linux.
+
+        :schema: io.k8s.api.core.v1.SecurityContext
+        '''
+        if isinstance(capabilities, dict):
+            capabilities = Capabilities(**capabilities)
+        if isinstance(seccomp_profile, dict):
+            seccomp_profile = SeccompProfile(**seccomp_profile)
+        if isinstance(se_linux_options, dict):
+            se_linux_options = SeLinuxOptions(**se_linux_options)
+        if isinstance(windows_options, dict):
+            windows_options = WindowsSecurityContextOptions(**windows_options)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__433d0b1cb870f05b48bfb6eeb4e8d9af769be17981b3d3465be0319c5fdcfe58)
+            check_type(argname="argument allow_privilege_escalation", value=allow_privilege_escalation, expected_type=type_hints["allow_privilege_escalation"])
+            check_type(argname="argument capabilities", value=capabilities, expected_type=type_hints["capabilities"])
+            check_type(argname="argument privileged", value=privileged, expected_type=type_hints["privileged"])
+            check_type(argname="argument proc_mount", value=proc_mount, expected_type=type_hints["proc_mount"])
+            check_type(argname="argument read_only_root_filesystem", value=read_only_root_filesystem, expected_type=type_hints["read_only_root_filesystem"])
+            check_type(argname="argument run_as_group", value=run_as_group, expected_type=type_hints["run_as_group"])
+            check_type(argname="argument run_as_non_root", value=run_as_non_root, expected_type=type_hints["run_as_non_root"])
+            check_type(argname="argument run_as_user", value=run_as_user, expected_type=type_hints["run_as_user"])
+            check_type(argname="argument seccomp_profile", value=seccomp_profile, expected_type=type_hints["seccomp_profile"])
+            check_type(argname="argument se_linux_options", value=se_linux_options, expected_type=type_hints["se_linux_options"])
+            check_type(argname="argument windows_options", value=windows_options, expected_type=type_hints["windows_options"])
+        self._value_allow_privilege_escalation = allow_privilege_escalation
+        self._value_capabilities = capabilities
+        self._value_privileged = privileged
+        self._value_proc_mount = proc_mount
+        self._value_read_only_root_filesystem = read_only_root_filesystem
+        self._value_run_as_group = run_as_group
+        self._value_run_as_non_root = run_as_non_root
+        self._value_run_as_user = run_as_user
+        self._value_seccomp_profile = seccomp_profile
+        self._value_se_linux_options = se_linux_options
+        self._value_windows_options = windows_options
+
+    @builtins.property
+    def allow_privilege_escalation(self) -> typing.Optional[builtins.bool]:
+        '''AllowPrivilegeEscalation controls whether a process can gain more privileges than its parent process.
+
+        This bool directly controls if the no_new_privs flag will be set on the container process. AllowPrivilegeEscalation is true always when the container is: 1) run as Privileged 2) has CAP_SYS_ADMIN Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#allowPrivilegeEscalation
+        '''
+        result = self._value_allow_privilege_escalation
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def capabilities(self) -> typing.Optional[Capabilities]:
+        '''The capabilities to add/drop when running containers.
+
+        Defaults to the default set of capabilities granted by the container runtime. Note that this field cannot be set when spec.os.name is windows.
+
+        :default: the default set of capabilities granted by the container runtime. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#capabilities
+        '''
+        result = self._value_capabilities
+        return typing.cast(typing.Optional[Capabilities], result)
+
+    @builtins.property
+    def privileged(self) -> typing.Optional[builtins.bool]:
+        '''Run container in privileged mode.
+
+        Processes in privileged containers are essentially equivalent to root on the host. Defaults to false. Note that this field cannot be set when spec.os.name is windows.
+
+        :default: false. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#privileged
+        '''
+        result = self._value_privileged
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def proc_mount(self) -> typing.Optional[builtins.str]:
+        '''procMount denotes the type of proc mount to use for the containers.
+
+        The default is DefaultProcMount which uses the container runtime defaults for readonly paths and masked paths. This requires the ProcMountType feature flag to be enabled. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#procMount
+        '''
+        result = self._value_proc_mount
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only_root_filesystem(self) -> typing.Optional[builtins.bool]:
+        '''Whether this container has a read-only root filesystem.
+
+        Default is false. Note that this field cannot be set when spec.os.name is windows.
+
+        :default: false. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#readOnlyRootFilesystem
+        '''
+        result = self._value_read_only_root_filesystem
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def run_as_group(self) -> typing.Optional[jsii.Number]:
+        '''The GID to run the entrypoint of the container process.
+
+        Uses runtime default if unset. May also be set in PodSecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#runAsGroup
+        '''
+        result = self._value_run_as_group
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def run_as_non_root(self) -> typing.Optional[builtins.bool]:
+        '''Indicates that the container must run as a non-root user.
+
+        If true, the Kubelet will validate the image at runtime to ensure that it does not run as UID 0 (root) and fail to start the container if it does. If unset or false, no such validation will be performed. May also be set in PodSecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#runAsNonRoot
+        '''
+        result = self._value_run_as_non_root
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def run_as_user(self) -> typing.Optional[jsii.Number]:
+        '''The UID to run the entrypoint of the container process.
+
+        Defaults to user specified in image metadata if unspecified. May also be set in PodSecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is windows.
+
+        :default: user specified in image metadata if unspecified. May also be set in PodSecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#runAsUser
+        '''
+        result = self._value_run_as_user
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def seccomp_profile(self) -> typing.Optional[SeccompProfile]:
+        '''The seccomp options to use by this container.
+
+        If seccomp options are provided at both the pod & container level, the container options override the pod options. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#seccompProfile
+        '''
+        result = self._value_seccomp_profile
+        return typing.cast(typing.Optional[SeccompProfile], result)
+
+    @builtins.property
+    def se_linux_options(self) -> typing.Optional[SeLinuxOptions]:
+        '''The SELinux context to be applied to the container.
+
+        If unspecified, the container runtime will allocate a random SELinux context for each container.  May also be set in PodSecurityContext.  If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is windows.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#seLinuxOptions
+        '''
+        result = self._value_se_linux_options
+        return typing.cast(typing.Optional[SeLinuxOptions], result)
+
+    @builtins.property
+    def windows_options(self) -> typing.Optional["WindowsSecurityContextOptions"]:
+        '''The Windows specific settings applied to all containers.
+
+        If unspecified, the options from the PodSecurityContext will be used. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Note that this field cannot be set when spec.os.name is linux.
+
+        :schema: io.k8s.api.core.v1.SecurityContext#windowsOptions
+        '''
+        result = self._value_windows_options
+        return typing.cast(typing.Optional["WindowsSecurityContextOptions"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_allow_privilege_escalation is not None:
+            values["allow_privilege_escalation"] = self._value_allow_privilege_escalation
+        if self._value_capabilities is not None:
+            values["capabilities"] = self._value_capabilities
+        if self._value_privileged is not None:
+            values["privileged"] = self._value_privileged
+        if self._value_proc_mount is not None:
+            values["proc_mount"] = self._value_proc_mount
+        if self._value_read_only_root_filesystem is not None:
+            values["read_only_root_filesystem"] = self._value_read_only_root_filesystem
+        if self._value_run_as_group is not None:
+            values["run_as_group"] = self._value_run_as_group
+        if self._value_run_as_non_root is not None:
+            values["run_as_non_root"] = self._value_run_as_non_root
+        if self._value_run_as_user is not None:
+            values["run_as_user"] = self._value_run_as_user
+        if self._value_seccomp_profile is not None:
+            values["seccomp_profile"] = self._value_seccomp_profile
+        if self._value_se_linux_options is not None:
+            values["se_linux_options"] = self._value_se_linux_options
+        if self._value_windows_options is not None:
+            values["windows_options"] = self._value_windows_options
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SecurityContext(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__433d0b1cb870f05b48bfb6eeb4e8d9af769be17981b3d3465be0319c5fdcfe58(
+    *,
+    allow_privilege_escalation: typing.Optional[builtins.bool] = None,
+    capabilities: typing.Optional[typing.Union[Capabilities, typing.Dict[builtins.str, typing.Any]]] = None,
+    privileged: typing.Optional[builtins.bool] = None,
+    proc_mount: typing.Optional[builtins.str] = None,
+    read_only_root_filesystem: typing.Optional[builtins.bool] = None,
+    run_as_group: typing.Optional[jsii.Number] = None,
+    run_as_non_root: typing.Optional[builtins.bool] = None,
+    run_as_user: typing.Optional[jsii.Number] = None,
+    seccomp_profile: typing.Optional[typing.Union[SeccompProfile, typing.Dict[builtins.str, typing.Any]]] = None,
+    se_linux_options: typing.Optional[typing.Union[SeLinuxOptions, typing.Dict[builtins.str, typing.Any]]] = None,
+    windows_options: typing.Optional[typing.Union[WindowsSecurityContextOptions, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
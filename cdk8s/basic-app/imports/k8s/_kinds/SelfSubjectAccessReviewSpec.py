@@ -0,0 +1,107 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NonResourceAttributes import NonResourceAttributes
+from .ResourceAttributes import ResourceAttributes
+
+
+@jsii.data_type(
+    jsii_type="k8s.SelfSubjectAccessReviewSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "non_resource_attributes": "nonResourceAttributes",
+        "resource_attributes": "resourceAttributes",
+    },
+)
+class SelfSubjectAccessReviewSpec(_base.Struct):
+    __slots__ = (
+        "_value_non_resource_attributes",
+        "_value_resource_attributes",
+    )
+
+    def __init__(
+        self,
+        *,
+        non_resource_attributes: typing.Optional[typing.Union[NonResourceAttributes, typing.Dict[builtins.str, typing.Any]]] = None,
+        resource_attributes: typing.Optional[typing.Union[ResourceAttributes, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''SelfSubjectAccessReviewSpec is a description of the access request.
+
+        Exactly one of ResourceAuthorizationAttributes and NonResourceAuthorizationAttributes must be set
+
+        :param non_resource_attributes: NonResourceAttributes describes information for a non-resource access request.
+        :param resource_attributes: ResourceAuthorizationAttributes describes information for a resource access request.
+
+        :schema: io.k8s.api.authorization.v1.SelfSubjectAccessReviewSpec
+        '''
+        if isinstance(non_resource_attributes, dict):
+            non_resource_attributes = NonResourceAttributes(**non_resource_attributes)
+        if isinstance(resource_attributes, dict):
+            resource_attributes = ResourceAttributes(**resource_attributes)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__e1c2bf0513f041ce3e18333d43a5849dff775b6c0bf8ea1391d425c73771a607)
+            check_type(argname="argument non_resource_attributes", value=non_resource_attributes, expected_type=type_hints["non_resource_attributes"])
+            check_type(argname="argument resource_attributes", value=resource_attributes, expected_type=type_hints["resource_attributes"])
+        self._value_non_resource_attributes = non_resource_attributes
+        self._value_resource_attributes = resource_attributes
+
+    @builtins.property
+    def non_resource_attributes(self) -> typing.Optional[NonResourceAttributes]:
+        '''NonResourceAttributes describes information for a non-resource access request.
+
+        :schema: io.k8s.api.authorization.v1.SelfSubjectAccessReviewSpec#nonResourceAttributes
+        '''
+        result = self._value_non_resource_attributes
+        return typing.cast(typing.Optional[NonResourceAttributes], result)
+
+    @builtins.property
+    def resource_attributes(self) -> typing.Optional[ResourceAttributes]:
+        '''ResourceAuthorizationAttributes describes information for a resource access request.
+
+        :schema: io.k8s.api.authorization.v1.SelfSubjectAccessReviewSpec#resourceAttributes
+        '''
+        result = self._value_resource_attributes
+        return typing.cast(typing.Optional[ResourceAttributes], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_non_resource_attributes is not None:
+            values["non_resource_attributes"] = self._value_non_resource_attributes
+        if self._value_resource_attributes is not None:
+            values["resource_attributes"] = self._value_resource_attributes
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SelfSubjectAccessReviewSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__e1c2bf0513f041ce3e18333d43a5849dff775b6c0bf8ea1391d425c73771a607(
+    *,
+    non_resource_attributes: typing.Optional[typing.Union[NonResourceAttributes, typing.Dict[builtins.str, typing.Any]]] = None,
+    resource_attributes: typing.Optional[typing.Union[ResourceAttributes, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
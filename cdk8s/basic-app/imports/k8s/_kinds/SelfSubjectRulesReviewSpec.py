@@ -0,0 +1,77 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.SelfSubjectRulesReviewSpec",
+    jsii_struct_bases=[],
+    name_mapping={"namespace": "namespace"},
+)
+class SelfSubjectRulesReviewSpec(_base.Struct):
+    __slots__ = (
+        "_value_namespace",
+    )
+
+    def __init__(self, *, namespace: typing.Optional[builtins.str] = None) -> None:
+        '''SelfSubjectRulesReviewSpec defines the specification for SelfSubjectRulesReview.
+
+        :param namespace: Namespace to evaluate rules for. Required.
+
+        :schema: io.k8s.api.authorization.v1.SelfSubjectRulesReviewSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__e8dd2a0d136f9e7e8480f73531aaae29fb249c5b4c11d47022b16354c78aace9)
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+        self._value_namespace = namespace
+
+    @builtins.property
+    def namespace(self) -> typing.Optional[builtins.str]:
+        '''Namespace to evaluate rules for.
+
+        Required.
+
+        :schema: io.k8s.api.authorization.v1.SelfSubjectRulesReviewSpec#namespace
+        '''
+        result = self._value_namespace
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_namespace is not None:
+            values["namespace"] = self._value_namespace
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SelfSubjectRulesReviewSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__e8dd2a0d136f9e7e8480f73531aaae29fb249c5b4c11d47022b16354c78aace9(
+    *,
+    namespace: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
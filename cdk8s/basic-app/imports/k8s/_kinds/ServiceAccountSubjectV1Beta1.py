@@ -0,0 +1,96 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ServiceAccountSubjectV1Beta1",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name", "namespace": "namespace"},
+)
+class ServiceAccountSubjectV1Beta1(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_namespace",
+    )
+
+    def __init__(self, *, name: builtins.str, namespace: builtins.str) -> None:
+        '''ServiceAccountSubject holds detailed information for service-account-kind subject.
+
+        :param name: ``name`` is the name of matching ServiceAccount objects, or "*" to match regardless of name. Required.
+        :param namespace: ``namespace`` is the namespace of matching ServiceAccount objects. Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.ServiceAccountSubject
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__61963d107ef57ef39479e4cedc8d798c8a5fe7c3cadd84f9e066a50fa37d75a1)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+        self._value_name = name
+        self._value_namespace = namespace
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''``name`` is the name of matching ServiceAccount objects, or "*" to match regardless of name.
+
+        Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.ServiceAccountSubject#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def namespace(self) -> builtins.str:
+        '''``namespace`` is the namespace of matching ServiceAccount objects.
+
+        Required.
+
+        :schema: io.k8s.api.flowcontrol.v1beta1.ServiceAccountSubject#namespace
+        '''
+        result = self._value_namespace
+        assert result is not None, "Required property 'namespace' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+            "namespace": self._value_namespace,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ServiceAccountSubjectV1Beta1(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__61963d107ef57ef39479e4cedc8d798c8a5fe7c3cadd84f9e066a50fa37d75a1(
+    *,
+    name: builtins.str,
+    namespace: builtins.str,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,126 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ServiceAccountTokenProjection",
+    jsii_struct_bases=[],
+    name_mapping={
+        "path": "path",
+        "audience": "audience",
+        "expiration_seconds": "expirationSeconds",
+    },
+)
+class ServiceAccountTokenProjection(_base.Struct):
+    __slots__ = (
+        "_value_path",
+        "_value_audience",
+        "_value_expiration_seconds",
+    )
+
+    def __init__(
+        self,
+        *,
+        path: builtins.str,
+        audience: typing.Optional[builtins.str] = None,
+        expiration_seconds: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''ServiceAccountTokenProjection represents a projected service account token volume.
+
+        This projection can be used to insert a service account token into the pods runtime filesystem for use against APIs (Kubernetes API Server or otherwise).
+
+        :param path: path is the path relative to the mount point of the file to project the token into.
+        :param audience: audience is the intended audience of the token. A recipient of a token must identify itself with an identifier specified in the audience of the token, and otherwise should reject the token. The audience defaults to the identifier of the apiserver.
+        :param expiration_seconds: expirationSeconds is the requested duration of validity of the service account token. As the token approaches expiration, the kubelet volume plugin will proactively rotate the service account token. The kubelet will start trying to rotate the token if the token is older than 80 percent of its time to live or if the token is older than 24 hours.Defaults to 1 hour and must be at least 10 minutes. Default: 1 hour and must be at least 10 minutes.
+
+        :schema: io.k8s.api.core.v1.ServiceAccountTokenProjection
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__eca876ebc0d31f3618cfee4eac3e898196a37c6e4c1f8a9e32ddf0170545dcb7)
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument audience", value=audience, expected_type=type_hints["audience"])
+            check_type(argname="argument expiration_seconds", value=expiration_seconds, expected_type=type_hints["expiration_seconds"])
+        self._value_path = path
+        self._value_audience = audience
+        self._value_expiration_seconds = expiration_seconds
+
+    @builtins.property
+    def path(self) -> builtins.str:
+        '''path is the path relative to the mount point of the file to project the token into.
+
+        :schema: io.k8s.api.core.v1.ServiceAccountTokenProjection#path
+        '''
+        result = self._value_path
+        assert result is not None, "Required property 'path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def audience(self) -> typing.Optional[builtins.str]:
+        '''audience is the intended audience of the token.
+
+        A recipient of a token must identify itself with an identifier specified in the audience of the token, and otherwise should reject the token. The audience defaults to the identifier of the apiserver.
+
+        :schema: io.k8s.api.core.v1.ServiceAccountTokenProjection#audience
+        '''
+        result = self._value_audience
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def expiration_seconds(self) -> typing.Optional[jsii.Number]:
+        '''expirationSeconds is the requested duration of validity of the service account token.
+
+        As the token approaches expiration, the kubelet volume plugin will proactively rotate the service account token. The kubelet will start trying to rotate the token if the token is older than 80 percent of its time to live or if the token is older than 24 hours.Defaults to 1 hour and must be at least 10 minutes.
+
+        :default: 1 hour and must be at least 10 minutes.
+
+        :schema: io.k8s.api.core.v1.ServiceAccountTokenProjection#expirationSeconds
+        '''
+        result = self._value_expiration_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "path": self._value_path,
+        }
+        if self._value_audience is not None:
+            values["audience"] = self._value_audience
+        if self._value_expiration_seconds is not None:
+            values["expiration_seconds"] = self._value_expiration_seconds
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ServiceAccountTokenProjection(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__eca876ebc0d31f3618cfee4eac3e898196a37c6e4c1f8a9e32ddf0170545dcb7(
+    *,
+    path: builtins.str,
+    audience: typing.Optional[builtins.str] = None,
+    expiration_seconds: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
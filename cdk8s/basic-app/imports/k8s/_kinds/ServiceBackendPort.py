@@ -0,0 +1,98 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ServiceBackendPort",
+    jsii_struct_bases=[],
+    name_mapping={"name": "name", "number": "number"},
+)
+class ServiceBackendPort(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_number",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: typing.Optional[builtins.str] = None,
+        number: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''ServiceBackendPort is the service port being referenced.
+
+        :param name: Name is the name of the port on the Service. This is a mutually exclusive setting with "Number".
+        :param number: Number is the numerical port number (e.g. 80) on the Service. This is a mutually exclusive setting with "Name".
+
+        :schema: io.k8s.api.networking.v1.ServiceBackendPort
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ccc9db063c0edd035d30aa78a916f1d768a960f314c38168ba4c4e95ca2ae99e)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument number", value=number, expected_type=type_hints["number"])
+        self._value_name = name
+        self._value_number = number
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''Name is the name of the port on the Service.
+
+        This is a mutually exclusive setting with "Number".
+
+        :schema: io.k8s.api.networking.v1.ServiceBackendPort#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def number(self) -> typing.Optional[jsii.Number]:
+        '''Number is the numerical port number (e.g. 80) on the Service. This is a mutually exclusive setting with "Name".
+
+        :schema: io.k8s.api.networking.v1.ServiceBackendPort#number
+        '''
+        result = self._value_number
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_number is not None:
+            values["number"] = self._value_number
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ServiceBackendPort(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ccc9db063c0edd035d30aa78a916f1d768a960f314c38168ba4c4e95ca2ae99e(
+    *,
+    name: typing.Optional[builtins.str] = None,
+    number: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,185 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IntOrString import IntOrString
+
+
+@jsii.data_type(
+    jsii_type="k8s.ServicePort",
+    jsii_struct_bases=[],
+    name_mapping={
+        "port": "port",
+        "app_protocol": "appProtocol",
+        "name": "name",
+        "node_port": "nodePort",
+        "protocol": "protocol",
+        "target_port": "targetPort",
+    },
+)
+class ServicePort(_base.Struct):
+    __slots__ = (
+        "_value_port",
+        "_value_app_protocol",
+        "_value_name",
+        "_value_node_port",
+        "_value_protocol",
+        "_value_target_port",
+    )
+
+    def __init__(
+        self,
+        *,
+        port: jsii.Number,
+        app_protocol: typing.Optional[builtins.str] = None,
+        name: typing.Optional[builtins.str] = None,
+        node_port: typing.Optional[jsii.Number] = None,
+        protocol: typing.Optional[builtins.str] = None,
+        target_port: typing.Optional[IntOrString] = None,
+    ) -> None:
+        '''ServicePort contains information on service's port.
+
+        :param port: The port that will be exposed by this service.
+        :param app_protocol: The application protocol for this port. This field follows standard Kubernetes label syntax. Un-prefixed names are reserved for IANA standard service names (as per RFC-6335 and https://www.iana.org/assignments/service-names). Non-standard protocols should use prefixed names such as mycompany.com/my-custom-protocol.
+        :param name: The name of this port within the service. This must be a DNS_LABEL. All ports within a ServiceSpec must have unique names. When considering the endpoints for a Service, this must match the 'name' field in the EndpointPort. Optional if only one ServicePort is defined on this service.
+        :param node_port: The port on each node on which this service is exposed when type is NodePort or LoadBalancer. Usually assigned by the system. If a value is specified, in-range, and not in use it will be used, otherwise the operation will fail. If not specified, a port will be allocated if this Service requires one. If this field is specified when creating a Service which does not need it, creation will fail. This field will be wiped when updating a Service to no longer need it (e.g. changing type from NodePort to ClusterIP). More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
+        :param protocol: The IP protocol for this port. Supports "TCP", "UDP", and "SCTP". Default is TCP. Default: TCP.
+        :param target_port: Number or name of the port to access on the pods targeted by the service. Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME. If this is a string, it will be looked up as a named port in the target Pod's container ports. If this is not specified, the value of the 'port' field is used (an identity map). This field is ignored for services with clusterIP=None, and should be omitted or set equal to the 'port' field. More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
+
+        :schema: io.k8s.api.core.v1.ServicePort
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__34bd12b0b5b5ee6a8e28438e78966717248ee25b5c7c6a0cadd99c8e5843ebb3)
+            check_type(argname="argument port", value=port, expected_type=type_hints["port"])
+            check_type(argname="argument app_protocol", value=app_protocol, expected_type=type_hints["app_protocol"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument node_port", value=node_port, expected_type=type_hints["node_port"])
+            check_type(argname="argument protocol", value=protocol, expected_type=type_hints["protocol"])
+            check_type(argname="argument target_port", value=target_port, expected_type=type_hints["target_port"])
+        self._value_port = port
+        self._value_app_protocol = app_protocol
+        self._value_name = name
+        self._value_node_port = node_port
+        self._value_protocol = protocol
+        self._value_target_port = target_port
+
+    @builtins.property
+    def port(self) -> jsii.Number:
+        '''The port that will be exposed by this service.
+
+        :schema: io.k8s.api.core.v1.ServicePort#port
+        '''
+        result = self._value_port
+        assert result is not None, "Required property 'port' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def app_protocol(self) -> typing.Optional[builtins.str]:
+        '''The application protocol for this port.
+
+        This field follows standard Kubernetes label syntax. Un-prefixed names are reserved for IANA standard service names (as per RFC-6335 and https://www.iana.org/assignments/service-names). Non-standard protocols should use prefixed names such as mycompany.com/my-custom-protocol.
+
+        :schema: io.k8s.api.core.v1.ServicePort#appProtocol
+        '''
+        result = self._value_app_protocol
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''The name of this port within the service.
+
+        This must be a DNS_LABEL. All ports within a ServiceSpec must have unique names. When considering the endpoints for a Service, this must match the 'name' field in the EndpointPort. Optional if only one ServicePort is defined on this service.
+
+        :schema: io.k8s.api.core.v1.ServicePort#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def node_port(self) -> typing.Optional[jsii.Number]:
+        '''The port on each node on which this service is exposed when type is NodePort or LoadBalancer.
+
+        Usually assigned by the system. If a value is specified, in-range, and not in use it will be used, otherwise the operation will fail.  If not specified, a port will be allocated if this Service requires one.  If this field is specified when creating a Service which does not need it, creation will fail. This field will be wiped when updating a Service to no longer need it (e.g. changing type from NodePort to ClusterIP). More info: https://kubernetes.io/docs/concepts/services-networking/service/#type-nodeport
+
+        :schema: io.k8s.api.core.v1.ServicePort#nodePort
+        '''
+        result = self._value_node_port
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def protocol(self) -> typing.Optional[builtins.str]:
+        '''The IP protocol for this port.
+
+        Supports "TCP", "UDP", and "SCTP". Default is TCP.
+
+        :default: TCP.
+
+        :schema: io.k8s.api.core.v1.ServicePort#protocol
+        '''
+        result = self._value_protocol
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def target_port(self) -> typing.Optional[IntOrString]:
+        '''Number or name of the port to access on the pods targeted by the service.
+
+        Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME. If this is a string, it will be looked up as a named port in the target Pod's container ports. If this is not specified, the value of the 'port' field is used (an identity map). This field is ignored for services with clusterIP=None, and should be omitted or set equal to the 'port' field. More info: https://kubernetes.io/docs/concepts/services-networking/service/#defining-a-service
+
+        :schema: io.k8s.api.core.v1.ServicePort#targetPort
+        '''
+        result = self._value_target_port
+        return typing.cast(typing.Optional[IntOrString], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "port": self._value_port,
+        }
+        if self._value_app_protocol is not None:
+            values["app_protocol"] = self._value_app_protocol
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_node_port is not None:
+            values["node_port"] = self._value_node_port
+        if self._value_protocol is not None:
+            values["protocol"] = self._value_protocol
+        if self._value_target_port is not None:
+            values["target_port"] = self._value_target_port
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ServicePort(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__34bd12b0b5b5ee6a8e28438e78966717248ee25b5c7c6a0cadd99c8e5843ebb3(
+    *,
+    port: jsii.Number,
+    app_protocol: typing.Optional[builtins.str] = None,
+    name: typing.Optional[builtins.str] = None,
+    node_port: typing.Optional[jsii.Number] = None,
+    protocol: typing.Optional[builtins.str] = None,
+    target_port: typing.Optional[IntOrString] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
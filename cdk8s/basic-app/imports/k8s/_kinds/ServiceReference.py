@@ -0,0 +1,144 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.ServiceReference",
+    jsii_struct_bases=[],
+    name_mapping={
+        "name": "name",
+        "namespace": "namespace",
+        "path": "path",
+        "port": "port",
+    },
+)
+class ServiceReference(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_namespace",
+        "_value_path",
+        "_value_port",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: builtins.str,
+        namespace: builtins.str,
+        path: typing.Optional[builtins.str] = None,
+        port: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''ServiceReference holds a reference to Service.legacy.k8s.io.
+
+        :param name: ``name`` is the name of the service. Required
+        :param namespace: ``namespace`` is the namespace of the service. Required
+        :param path: ``path`` is an optional URL path which will be sent in any request to this service.
+        :param port: If specified, the port on the service that hosting webhook. Default to 443 for backward compatibility. ``port`` should be a valid port number (1-65535, inclusive). Default: 443 for backward compatibility. ``port`` should be a valid port number (1-65535, inclusive).
+
+        :schema: io.k8s.api.admissionregistration.v1.ServiceReference
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__6d9ad2a01fb9e7ce732f776bc88e9c896a203ce950547fb864ef2833ae00ee24)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument namespace", value=namespace, expected_type=type_hints["namespace"])
+            check_type(argname="argument path", value=path, expected_type=type_hints["path"])
+            check_type(argname="argument port", value=port, expected_type=type_hints["port"])
+        self._value_name = name
+        self._value_namespace = namespace
+        self._value_path = path
+        self._value_port = port
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''``name`` is the name of the service.
+
+        Required
+
+        :schema: io.k8s.api.admissionregistration.v1.ServiceReference#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def namespace(self) -> builtins.str:
+        '''``namespace`` is the namespace of the service.
+
+        Required
+
+        :schema: io.k8s.api.admissionregistration.v1.ServiceReference#namespace
+        '''
+        result = self._value_namespace
+        assert result is not None, "Required property 'namespace' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def path(self) -> typing.Optional[builtins.str]:
+        '''``path`` is an optional URL path which will be sent in any request to this service.
+
+        :schema: io.k8s.api.admissionregistration.v1.ServiceReference#path
+        '''
+        result = self._value_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def port(self) -> typing.Optional[jsii.Number]:
+        '''If specified, the port on the service that hosting webhook.
+
+        Default to 443 for backward compatibility. ``port`` should be a valid port number (1-65535, inclusive).
+
+        :default: 443 for backward compatibility. ``port`` should be a valid port number (1-65535, inclusive).
+
+        :schema: io.k8s.api.admissionregistration.v1.ServiceReference#port
+        '''
+        result = self._value_port
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+            "namespace": self._value_namespace,
+        }
+        if self._value_path is not None:
+            values["path"] = self._value_path
+        if self._value_port is not None:
+            values["port"] = self._value_port
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ServiceReference(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__6d9ad2a01fb9e7ce732f776bc88e9c896a203ce950547fb864ef2833ae00ee24(
+    *,
+    name: builtins.str,
+    namespace: builtins.str,
+    path: typing.Optional[builtins.str] = None,
+    port: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
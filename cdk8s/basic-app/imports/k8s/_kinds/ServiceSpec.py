@@ -0,0 +1,451 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ServicePort import ServicePort
+from .SessionAffinityConfig import SessionAffinityConfig
+
+
+@jsii.data_type(
+    jsii_type="k8s.ServiceSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "allocate_load_balancer_node_ports": "allocateLoadBalancerNodePorts",
+        "cluster_ip": "clusterIp",
+        "cluster_i_ps": "clusterIPs",
+        "external_i_ps": "externalIPs",
+        "external_name": "externalName",
+        "external_traffic_policy": "externalTrafficPolicy",
+        "health_check_node_port": "healthCheckNodePort",
+        "internal_traffic_policy": "internalTrafficPolicy",
+        "ip_families": "ipFamilies",
+        "ip_family_policy": "ipFamilyPolicy",
+        "load_balancer_class": "loadBalancerClass",
+        "load_balancer_ip": "loadBalancerIp",
+        "load_balancer_source_ranges": "loadBalancerSourceRanges",
+        "ports": "ports",
+        "publish_not_ready_addresses": "publishNotReadyAddresses",
+        "selector": "selector",
+        "session_affinity": "sessionAffinity",
+        "session_affinity_config": "sessionAffinityConfig",
+        "type": "type",
+    },
+)
+class ServiceSpec(_base.Struct):
+    __slots__ = (
+        "_value_allocate_load_balancer_node_ports",
+        "_value_cluster_ip",
+        "_value_cluster_i_ps",
+        "_value_external_i_ps",
+        "_value_external_name",
+        "_value_external_traffic_policy",
+        "_value_health_check_node_port",
+        "_value_internal_traffic_policy",
+        "_value_ip_families",
+        "_value_ip_family_policy",
+        "_value_load_balancer_class",
+        "_value_load_balancer_ip",
+        "_value_load_balancer_source_ranges",
+        "_value_ports",
+        "_value_publish_not_ready_addresses",
+        "_value_selector",
+        "_value_session_affinity",
+        "_value_session_affinity_config",
+        "_value_type",
+    )
+
+    def __init__(
+        self,
+        *,
+        allocate_load_balancer_node_ports: typing.Optional[builtins.bool] = None,
+        cluster_ip: typing.Optional[builtins.str] = None,
+        cluster_i_ps: typing.Optional[typing.Sequence[builtins.str]] = None,
+        external_i_ps: typing.Optional[typing.Sequence[builtins.str]] = None,
+        external_name: typing.Optional[builtins.str] = None,
+        external_traffic_policy: typing.Optional[builtins.str] = None,
+        health_check_node_port: typing.Optional[jsii.Number] = None,
+        internal_traffic_policy: typing.Optional[builtins.str] = None,
+        ip_families: typing.Optional[typing.Sequence[builtins.str]] = None,
+        ip_family_policy: typing.Optional[builtins.str] = None,
+        load_balancer_class: typing.Optional[builtins.str] = None,
+        load_balancer_ip: typing.Optional[builtins.str] = None,
+        load_balancer_source_ranges: typing.Optional[typing.Sequence[builtins.str]] = None,
+        ports: typing.Optional[typing.Sequence[typing.Union[ServicePort, typing.Dict[builtins.str, typing.Any]]]] = None,
+        publish_not_ready_addresses: typing.Optional[builtins.bool] = None,
+        selector: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+        session_affinity: typing.Optional[builtins.str] = None,
+        session_affinity_config: typing.Optional[typing.Union["SessionAffinityConfig", typing.Dict[builtins.str, typing.Any]]] = None,
+        type: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''ServiceSpec describes the attributes that a user creates on a service.
+
+        :param allocate_load_balancer_node_ports: allocateLoadBalancerNodePorts defines if NodePorts will be automatically allocated for services with type LoadBalancer. Default is "true". It may be set to "false" if the cluster load-balancer does not rely on NodePorts. If the caller requests specific NodePorts (by specifying a value), those requests will be respected, regardless of this field. This field may only be set for services with type LoadBalancer and will be cleared if the type is changed to any other type. Default: true". It may be set to "false" if the cluster load-balancer does not rely on NodePorts. If the caller requests specific NodePorts (by specifying a value), those requests will be respected, regardless of this field. This field may only be set for services with type LoadBalancer and will be cleared if the type is changed to any other type.
+        :param cluster_ip: clusterIP is the IP address of the service and is usually assigned randomly. If an address is specified manually, is in-range (as per system configuration), and is not in use, it will be allocated to the service; otherwise creation of the service will fail. This field may not be changed through updates unless the type field is also being changed to ExternalName (which requires this field to be blank) or the type field is being changed from ExternalName (in which case this field may optionally be specified, as describe above). Valid values are "None", empty string (""), or a valid IP address. Setting this to "None" makes a "headless service" (no virtual IP), which is useful when direct endpoint connections are preferred and proxying is not required. Only applies to types ClusterIP, NodePort, and LoadBalancer. If this field is specified when creating a Service of type ExternalName, creation will fail. This field will be wiped when updating a Service to type ExternalName. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        :param cluster_i_ps: ClusterIPs is a list of IP addresses assigned to this service, and are usually assigned randomly. If an address is specified manually, is in-range (as per system configuration), and is not in use, it will be allocated to the service; otherwise creation of the service will fail. This field may not be changed through updates unless the type field is also being changed to ExternalName (which requires this field to be empty) or the type field is being changed from ExternalName (in which case this field may optionally be specified, as describe above). Valid values are "None", empty string (""), or a valid IP address. Setting this to "None" makes a "headless service" (no virtual IP), which is useful when direct endpoint connections are preferred and proxying is not required. Only applies to types ClusterIP, NodePort, and LoadBalancer. If this field is specified when creating a Service of type ExternalName, creation will fail. This field will be wiped when updating a Service to type ExternalName. If this field is not specified, it will be initialized from the clusterIP field. If this field is specified, clients must ensure that clusterIPs[0] and clusterIP have the same value. This field may hold a maximum of two entries (dual-stack IPs, in either order). These IPs must correspond to the values of the ipFamilies field. Both clusterIPs and ipFamilies are governed by the ipFamilyPolicy field. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        :param external_i_ps: externalIPs is a list of IP addresses for which nodes in the cluster will also accept traffic for this service. These IPs are not managed by Kubernetes. The user is responsible for ensuring that traffic arrives at a node with this IP. A common example is external load-balancers that are not part of the Kubernetes system.
+        :param external_name: externalName is the external reference that discovery mechanisms will return as an alias for this service (e.g. a DNS CNAME record). No proxying will be involved. Must be a lowercase RFC-1123 hostname (https://tools.ietf.org/html/rfc1123) and requires ``type`` to be "ExternalName".
+        :param external_traffic_policy: externalTrafficPolicy describes how nodes distribute service traffic they receive on one of the Service's "externally-facing" addresses (NodePorts, ExternalIPs, and LoadBalancer IPs). If set to "Local", the proxy will configure the service in a way that assumes that external load balancers will take care of balancing the service traffic between nodes, and so each node will deliver traffic only to the node-local endpoints of the service, without masquerading the client source IP. (Traffic mistakenly sent to a node with no endpoints will be dropped.) The default value, "Cluster", uses the standard behavior of routing to all endpoints evenly (possibly modified by topology and other features). Note that traffic sent to an External IP or LoadBalancer IP from within the cluster will always get "Cluster" semantics, but clients sending to a NodePort from within the cluster may need to take traffic policy into account when picking a node.
+        :param health_check_node_port: healthCheckNodePort specifies the healthcheck nodePort for the service. This only applies when type is set to LoadBalancer and externalTrafficPolicy is set to Local. If a value is specified, is in-range, and is not in use, it will be used. If not specified, a value will be automatically allocated. External systems (e.g. load-balancers) can use this port to determine if a given node holds endpoints for this service or not. If this field is specified when creating a Service which does not need it, creation will fail. This field will be wiped when updating a Service to no longer need it (e.g. changing type). This field cannot be updated once set.
+        :param internal_traffic_policy: InternalTrafficPolicy describes how nodes distribute service traffic they receive on the ClusterIP. If set to "Local", the proxy will assume that pods only want to talk to endpoints of the service on the same node as the pod, dropping the traffic if there are no local endpoints. The default value, "Cluster", uses the standard behavior of routing to all endpoints evenly (possibly modified by topology and other features).
+        :param ip_families: IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this service. This field is usually assigned automatically based on cluster configuration and the ipFamilyPolicy field. If this field is specified manually, the requested family is available in the cluster, and ipFamilyPolicy allows it, it will be used; otherwise creation of the service will fail. This field is conditionally mutable: it allows for adding or removing a secondary IP family, but it does not allow changing the primary IP family of the Service. Valid values are "IPv4" and "IPv6". This field only applies to Services of types ClusterIP, NodePort, and LoadBalancer, and does apply to "headless" services. This field will be wiped when updating a Service to type ExternalName. This field may hold a maximum of two entries (dual-stack families, in either order). These families must correspond to the values of the clusterIPs field, if specified. Both clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
+        :param ip_family_policy: IPFamilyPolicy represents the dual-stack-ness requested or required by this Service. If there is no value provided, then this field will be set to SingleStack. Services can be "SingleStack" (a single IP family), "PreferDualStack" (two IP families on dual-stack configured clusters or a single IP family on single-stack clusters), or "RequireDualStack" (two IP families on dual-stack configured clusters, otherwise fail). The ipFamilies and clusterIPs fields depend on the value of this field. This field will be wiped when updating a service to type ExternalName.
+        :param load_balancer_class: loadBalancerClass is the class of the load balancer implementation this Service belongs to. If specified, the value of this field must be a label-style identifier, with an optional prefix, e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users. This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load balancer implementation is used, today this is typically done through the cloud provider integration, but should apply for any default implementation. If set, it is assumed that a load balancer implementation is watching for Services with a matching class. Any default load balancer implementation (e.g. cloud providers) should ignore Services that set this field. This field can only be set when creating or updating a Service to type 'LoadBalancer'. Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
+        :param load_balancer_ip: Only applies to Service Type: LoadBalancer. This feature depends on whether the underlying cloud-provider supports specifying the loadBalancerIP when a load balancer is created. This field will be ignored if the cloud-provider does not support the feature. Deprecated: This field was under-specified and its meaning varies across implementations, and it cannot support dual-stack. As of Kubernetes v1.24, users are encouraged to use implementation-specific annotations when available. This field may be removed in a future API version.
+        :param load_balancer_source_ranges: If specified and supported by the platform, this will restrict traffic through the cloud-provider load-balancer will be restricted to the specified client IPs. This field will be ignored if the cloud-provider does not support the feature." More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
+        :param ports: The list of ports that are exposed by this service. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        :param publish_not_ready_addresses: publishNotReadyAddresses indicates that any agent which deals with endpoints for this Service should disregard any indications of ready/not-ready. The primary use case for setting this field is for a StatefulSet's Headless Service to propagate SRV DNS records for its Pods for the purpose of peer discovery. The Kubernetes controllers that generate Endpoints and EndpointSlice resources for Services interpret this to mean that all endpoints are considered "ready" even if the Pods themselves are not. Agents which consume only Kubernetes generated endpoints through the Endpoints or EndpointSlice resources can safely assume this behavior.
+        :param selector: Route service traffic to pods with label keys and values matching this selector. If empty or not present, the service is assumed to have an external process managing its endpoints, which Kubernetes will not modify. Only applies to types ClusterIP, NodePort, and LoadBalancer. Ignored if type is ExternalName. More info: https://kubernetes.io/docs/concepts/services-networking/service/
+        :param session_affinity: Supports "ClientIP" and "None". Used to maintain session affinity. Enable client IP based session affinity. Must be ClientIP or None. Defaults to None. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies Default: None. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+        :param session_affinity_config: sessionAffinityConfig contains the configurations of session affinity.
+        :param type: type determines how the Service is exposed. Defaults to ClusterIP. Valid options are ExternalName, ClusterIP, NodePort, and LoadBalancer. "ClusterIP" allocates a cluster-internal IP address for load-balancing to endpoints. Endpoints are determined by the selector or if that is not specified, by manual construction of an Endpoints object or EndpointSlice objects. If clusterIP is "None", no virtual IP is allocated and the endpoints are published as a set of endpoints rather than a virtual IP. "NodePort" builds on ClusterIP and allocates a port on every node which routes to the same endpoints as the clusterIP. "LoadBalancer" builds on NodePort and creates an external load-balancer (if supported in the current cloud) which routes to the same endpoints as the clusterIP. "ExternalName" aliases this service to the specified externalName. Several other fields do not apply to ExternalName services. More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types Default: ClusterIP. Valid options are ExternalName, ClusterIP, NodePort, and LoadBalancer. "ClusterIP" allocates a cluster-internal IP address for load-balancing to endpoints. Endpoints are determined by the selector or if that is not specified, by manual construction of an Endpoints object or EndpointSlice objects. If clusterIP is "None", no virtual IP is allocated and the endpoints are published as a set of endpoints rather than a virtual IP. "NodePort" builds on ClusterIP and allocates a port on every node which routes to the same endpoints as the clusterIP. "LoadBalancer" builds on NodePort and creates an external load-balancer (if supported in the current cloud) which routes to the same endpoints as the clusterIP. "ExternalName" aliases this service to the specified externalName. Several other fields do not apply to ExternalName services. More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
+
+        :schema: io.k8s.api.core.v1.ServiceSpec
+        '''
+        if isinstance(session_affinity_config, dict):
+            session_affinity_config = SessionAffinityConfig(**session_affinity_config)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__28a62a3352f8d0567f520784bd515250a02d7d2d6686265c9478416f87acb91e)
+            check_type(argname="argument allocate_load_balancer_node_ports", value=allocate_load_balancer_node_ports, expected_type=type_hints["allocate_load_balancer_node_ports"])
+            check_type(argname="argument cluster_ip", value=cluster_ip, expected_type=type_hints["cluster_ip"])
+            check_type(argname="argument cluster_i_ps", value=cluster_i_ps, expected_type=type_hints["cluster_i_ps"])
+            check_type(argname="argument external_i_ps", value=external_i_ps, expected_type=type_hints["external_i_ps"])
+            check_type(argname="argument external_name", value=external_name, expected_type=type_hints["external_name"])
+            check_type(argname="argument external_traffic_policy", value=external_traffic_policy, expected_type=type_hints["external_traffic_policy"])
+            check_type(argname="argument health_check_node_port", value=health_check_node_port, expected_type=type_hints["health_check_node_port"])
+            check_type(argname="argument internal_traffic_policy", value=internal_traffic_policy, expected_type=type_hints["internal_traffic_policy"])
+            check_type(argname="argument ip_families", value=ip_families, expected_type=type_hints["ip_families"])
+            check_type(argname="argument ip_family_policy", value=ip_family_policy, expected_type=type_hints["ip_family_policy"])
+            check_type(argname="argument load_balancer_class", value=load_balancer_class, expected_type=type_hints["load_balancer_class"])
+            check_type(argname="argument load_balancer_ip", value=load_balancer_ip, expected_type=type_hints["load_balancer_ip"])
+            check_type(argname="argument load_balancer_source_ranges", value=load_balancer_source_ranges, expected_type=type_hints["load_balancer_source_ranges"])
+            check_type(argname="argument ports", value=ports, expected_type=type_hints["ports"])
+            check_type(argname="argument publish_not_ready_addresses", value=publish_not_ready_addresses, expected_type=type_hints["publish_not_ready_addresses"])
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+            check_type(argname="argument session_affinity", value=session_affinity, expected_type=type_hints["session_affinity"])
+            check_type(argname="argument session_affinity_config", value=session_affinity_config, expected_type=type_hints["session_affinity_config"])
+            check_type(argname="argument type", value=type, expected_type=type_hints["type"])
+        self._value_allocate_load_balancer_node_ports = allocate_load_balancer_node_ports
+        self._value_cluster_ip = cluster_ip
+        self._value_cluster_i_ps = cluster_i_ps
+        self._value_external_i_ps = external_i_ps
+        self._value_external_name = external_name
+        self._value_external_traffic_policy = external_traffic_policy
+        self._value_health_check_node_port = health_check_node_port
+        self._value_internal_traffic_policy = internal_traffic_policy
+        self._value_ip_families = ip_families
+        self._value_ip_family_policy = ip_family_policy
+        self._value_load_balancer_class = load_balancer_class
+        self._value_load_balancer_ip = load_balancer_ip
+        self._value_load_balancer_source_ranges = load_balancer_source_ranges
+        self._value_ports = ports
+        self._value_publish_not_ready_addresses = publish_not_ready_addresses
+        self._value_selector = selector
+        self._value_session_affinity = session_affinity
+        self._value_session_affinity_config = session_affinity_config
+        self._value_type = type
+
+    @builtins.property
+    def allocate_load_balancer_node_ports(self) -> typing.Optional[builtins.bool]:
+        '''allocateLoadBalancerNodePorts defines if NodePorts will be automatically allocated for services with type LoadBalancer.
+
+        Default is "true". It may be set to "false" if the cluster load-balancer does not rely on NodePorts.  If the caller requests specific NodePorts (by specifying a value), those requests will be respected, regardless of this field. This field may only be set for services with type LoadBalancer and will be cleared if the type is changed to any other type.
+
+        :default: true". It may be set to "false" if the cluster load-balancer does not rely on NodePorts.  If the caller requests specific NodePorts (by specifying a value), those requests will be respected, regardless of this field. This field may only be set for services with type LoadBalancer and will be cleared if the type is changed to any other type.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#allocateLoadBalancerNodePorts
+        '''
+        result = self._value_allocate_load_balancer_node_ports
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def cluster_ip(self) -> typing.Optional[builtins.str]:
+        '''clusterIP is the IP address of the service and is usually assigned randomly.
+
+        If an address is specified manually, is in-range (as per system configuration), and is not in use, it will be allocated to the service; otherwise creation of the service will fail. This field may not be changed through updates unless the type field is also being changed to ExternalName (which requires this field to be blank) or the type field is being changed from ExternalName (in which case this field may optionally be specified, as describe above).  Valid values are "None", empty string (""), or a valid IP address. Setting this to "None" makes a "headless service" (no virtual IP), which is useful when direct endpoint connections are preferred and proxying is not required.  Only applies to types ClusterIP, NodePort, and LoadBalancer. If this field is specified when creating a Service of type ExternalName, creation will fail. This field will be wiped when updating a Service to type ExternalName. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#clusterIP
+        '''
+        result = self._value_cluster_ip
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def cluster_i_ps(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''ClusterIPs is a list of IP addresses assigned to this service, and are usually assigned randomly.
+
+        If an address is specified manually, is in-range (as per system configuration), and is not in use, it will be allocated to the service; otherwise creation of the service will fail. This field may not be changed through updates unless the type field is also being changed to ExternalName (which requires this field to be empty) or the type field is being changed from ExternalName (in which case this field may optionally be specified, as describe above).  Valid values are "None", empty string (""), or a valid IP address.  Setting this to "None" makes a "headless service" (no virtual IP), which is useful when direct endpoint connections are preferred and proxying is not required.  Only applies to types ClusterIP, NodePort, and LoadBalancer. If this field is specified when creating a Service of type ExternalName, creation will fail. This field will be wiped when updating a Service to type ExternalName.  If this field is not specified, it will be initialized from the clusterIP field.  If this field is specified, clients must ensure that clusterIPs[0] and clusterIP have the same value.
+
+        This field may hold a maximum of two entries (dual-stack IPs, in either order). These IPs must correspond to the values of the ipFamilies field. Both clusterIPs and ipFamilies are governed by the ipFamilyPolicy field. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#clusterIPs
+        '''
+        result = self._value_cluster_i_ps
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def external_i_ps(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''externalIPs is a list of IP addresses for which nodes in the cluster will also accept traffic for this service.
+
+        These IPs are not managed by Kubernetes.  The user is responsible for ensuring that traffic arrives at a node with this IP.  A common example is external load-balancers that are not part of the Kubernetes system.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#externalIPs
+        '''
+        result = self._value_external_i_ps
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def external_name(self) -> typing.Optional[builtins.str]:
+        '''externalName is the external reference that discovery mechanisms will return as an alias for this service (e.g. a DNS CNAME record). No proxying will be involved.  Must be a lowercase RFC-1123 hostname (https://tools.ietf.org/html/rfc1123) and requires ``type`` to be "ExternalName".
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#externalName
+        '''
+        result = self._value_external_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def external_traffic_policy(self) -> typing.Optional[builtins.str]:
+        '''externalTrafficPolicy describes how nodes distribute service traffic they receive on one of the Service's "externally-facing" addresses (NodePorts, ExternalIPs, and LoadBalancer IPs).
+
+        If set to "Local", the proxy will configure the service in a way that assumes that external load balancers will take care of balancing the service traffic between nodes, and so each node will deliver traffic only to the node-local endpoints of the service, without masquerading the client source IP. (Traffic mistakenly sent to a node with no endpoints will be dropped.) The default value, "Cluster", uses the standard behavior of routing to all endpoints evenly (possibly modified by topology and other features). Note that traffic sent to an External IP or LoadBalancer IP from within the cluster will always get "Cluster" semantics, but clients sending to a NodePort from within the cluster may need to take traffic policy into account when picking a node.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#externalTrafficPolicy
+        '''
+        result = self._value_external_traffic_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def health_check_node_port(self) -> typing.Optional[jsii.Number]:
+        '''healthCheckNodePort specifies the healthcheck nodePort for the service.
+
+        This only applies when type is set to LoadBalancer and externalTrafficPolicy is set to Local. If a value is specified, is in-range, and is not in use, it will be used.  If not specified, a value will be automatically allocated.  External systems (e.g. load-balancers) can use this port to determine if a given node holds endpoints for this service or not.  If this field is specified when creating a Service which does not need it, creation will fail. This field will be wiped when updating a Service to no longer need it (e.g. changing type). This field cannot be updated once set.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#healthCheckNodePort
+        '''
+        result = self._value_health_check_node_port
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def internal_traffic_policy(self) -> typing.Optional[builtins.str]:
+        '''InternalTrafficPolicy describes how nodes distribute service traffic they receive on the ClusterIP.
+
+        If set to "Local", the proxy will assume that pods only want to talk to endpoints of the service on the same node as the pod, dropping the traffic if there are no local endpoints. The default value, "Cluster", uses the standard behavior of routing to all endpoints evenly (possibly modified by topology and other features).
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#internalTrafficPolicy
+        '''
+        result = self._value_internal_traffic_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def ip_families(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''IPFamilies is a list of IP families (e.g. IPv4, IPv6) assigned to this service. This field is usually assigned automatically based on cluster configuration and the ipFamilyPolicy field. If this field is specified manually, the requested family is available in the cluster, and ipFamilyPolicy allows it, it will be used; otherwise creation of the service will fail. This field is conditionally mutable: it allows for adding or removing a secondary IP family, but it does not allow changing the primary IP family of the Service. Valid values are "IPv4" and "IPv6".  This field only applies to Services of types ClusterIP, NodePort, and LoadBalancer, and does apply to "headless" services. This field will be wiped when updating a Service to type ExternalName.
+
+        This field may hold a maximum of two entries (dual-stack families, in either order).  These families must correspond to the values of the clusterIPs field, if specified. Both clusterIPs and ipFamilies are governed by the ipFamilyPolicy field.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#ipFamilies
+        '''
+        result = self._value_ip_families
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def ip_family_policy(self) -> typing.Optional[builtins.str]:
+        '''IPFamilyPolicy represents the dual-stack-ness requested or required by this Service.
+
+        If there is no value provided, then this field will be set to SingleStack. Services can be "SingleStack" (a single IP family), "PreferDualStack" (two IP families on dual-stack configured clusters or a single IP family on single-stack clusters), or "RequireDualStack" (two IP families on dual-stack configured clusters, otherwise fail). The ipFamilies and clusterIPs fields depend on the value of this field. This field will be wiped when updating a service to type ExternalName.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#ipFamilyPolicy
+        '''
+        result = self._value_ip_family_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def load_balancer_class(self) -> typing.Optional[builtins.str]:
+        '''loadBalancerClass is the class of the load balancer implementation this Service belongs to.
+
+        If specified, the value of this field must be a label-style identifier, with an optional prefix, e.g. "internal-vip" or "example.com/internal-vip". Unprefixed names are reserved for end-users. This field can only be set when the Service type is 'LoadBalancer'. If not set, the default load balancer implementation is used, today this is typically done through the cloud provider integration, but should apply for any default implementation. If set, it is assumed that a load balancer implementation is watching for Services with a matching class. Any default load balancer implementation (e.g. cloud providers) should ignore Services that set this field. This field can only be set when creating or updating a Service to type 'LoadBalancer'. Once set, it can not be changed. This field will be wiped when a service is updated to a non 'LoadBalancer' type.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#loadBalancerClass
+        '''
+        result = self._value_load_balancer_class
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def load_balancer_ip(self) -> typing.Optional[builtins.str]:
+        '''Only applies to Service Type: LoadBalancer.
+
+        This feature depends on whether the underlying cloud-provider supports specifying the loadBalancerIP when a load balancer is created. This field will be ignored if the cloud-provider does not support the feature. Deprecated: This field was under-specified and its meaning varies across implementations, and it cannot support dual-stack. As of Kubernetes v1.24, users are encouraged to use implementation-specific annotations when available. This field may be removed in a future API version.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#loadBalancerIP
+        '''
+        result = self._value_load_balancer_ip
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def load_balancer_source_ranges(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''If specified and supported by the platform, this will restrict traffic through the cloud-provider load-balancer will be restricted to the specified client IPs.
+
+        This field will be ignored if the cloud-provider does not support the feature." More info: https://kubernetes.io/docs/tasks/access-application-cluster/create-external-load-balancer/
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#loadBalancerSourceRanges
+        '''
+        result = self._value_load_balancer_source_ranges
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def ports(self) -> typing.Optional[typing.List[ServicePort]]:
+        '''The list of ports that are exposed by this service.
+
+        More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#ports
+        '''
+        result = self._value_ports
+        return typing.cast(typing.Optional[typing.List[ServicePort]], result)
+
+    @builtins.property
+    def publish_not_ready_addresses(self) -> typing.Optional[builtins.bool]:
+        '''publishNotReadyAddresses indicates that any agent which deals with endpoints for this Service should disregard any indications of ready/not-ready.
+
+        The primary use case for setting this field is for a StatefulSet's Headless Service to propagate SRV DNS records for its Pods for the purpose of peer discovery. The Kubernetes controllers that generate Endpoints and EndpointSlice resources for Services interpret this to mean that all endpoints are considered "ready" even if the Pods themselves are not. Agents which consume only Kubernetes generated endpoints through the Endpoints or EndpointSlice resources can safely assume this behavior.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#publishNotReadyAddresses
+        '''
+        result = self._value_publish_not_ready_addresses
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def selector(self) -> typing.Optional[typing.Mapping[builtins.str, builtins.str]]:
+        '''Route service traffic to pods with label keys and values matching this selector.
+
+        If empty or not present, the service is assumed to have an external process managing its endpoints, which Kubernetes will not modify. Only applies to types ClusterIP, NodePort, and LoadBalancer. Ignored if type is ExternalName. More info: https://kubernetes.io/docs/concepts/services-networking/service/
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#selector
+        '''
+        result = self._value_selector
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, builtins.str]], result)
+
+    @builtins.property
+    def session_affinity(self) -> typing.Optional[builtins.str]:
+        '''Supports "ClientIP" and "None".
+
+        Used to maintain session affinity. Enable client IP based session affinity. Must be ClientIP or None. Defaults to None. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+
+        :default: None. More info: https://kubernetes.io/docs/concepts/services-networking/service/#virtual-ips-and-service-proxies
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#sessionAffinity
+        '''
+        result = self._value_session_affinity
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def session_affinity_config(self) -> typing.Optional["SessionAffinityConfig"]:
+        '''sessionAffinityConfig contains the configurations of session affinity.
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#sessionAffinityConfig
+        '''
+        result = self._value_session_affinity_config
+        return typing.cast(typing.Optional["SessionAffinityConfig"], result)
+
+    @builtins.property
+    def type(self) -> typing.Optional[builtins.str]:
+        '''type determines how the Service is exposed.
+
+        Defaults to ClusterIP. Valid options are ExternalName, ClusterIP, NodePort, and LoadBalancer. "ClusterIP" allocates a cluster-internal IP address for load-balancing to endpoints. Endpoints are determined by the selector or if that is not specified, by manual construction of an Endpoints object or EndpointSlice objects. If clusterIP is "None", no virtual IP is allocated and the endpoints are published as a set of endpoints rather than a virtual IP. "NodePort" builds on ClusterIP and allocates a port on every node which routes to the same endpoints as the clusterIP. "LoadBalancer" builds on NodePort and creates an external load-balancer (if supported in the current cloud) which routes to the same endpoints as the clusterIP. "ExternalName" aliases this service to the specified externalName. Several other fields do not apply to ExternalName services. More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
+
+        :default: ClusterIP. Valid options are ExternalName, ClusterIP, NodePort, and LoadBalancer. "ClusterIP" allocates a cluster-internal IP address for load-balancing to endpoints. Endpoints are determined by the selector or if that is not specified, by manual construction of an Endpoints object or EndpointSlice objects. If clusterIP is "None", no virtual IP is allocated and the endpoints are published as a set of endpoints rather than a virtual IP. "NodePort" builds on ClusterIP and allocates a port on every node which routes to the same endpoints as the clusterIP. "LoadBalancer" builds on NodePort and creates an external load-balancer (if supported in the current cloud) which routes to the same endpoints as the clusterIP. "ExternalName" aliases this service to the specified externalName. Several other fields do not apply to ExternalName services. More info: https://kubernetes.io/docs/concepts/services-networking/service/#publishing-services-service-types
+
+        :schema: io.k8s.api.core.v1.ServiceSpec#type
+        '''
+        result = self._value_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_allocate_load_balancer_node_ports is not None:
+            values["allocate_load_balancer_node_ports"] = self._value_allocate_load_balancer_node_ports
+        if self._value_cluster_ip is not None:
+            values["cluster_ip"] = self._value_cluster_ip
+        if self._value_cluster_i_ps is not None:
+            values["cluster_i_ps"] = self._value_cluster_i_ps
+        if self._value_external_i_ps is not None:
+            values["external_i_ps"] = self._value_external_i_ps
+        if self._value_external_name is not None:
+            values["external_name"] = self._value_external_name
+        if self._value_external_traffic_policy is not None:
+            values["external_traffic_policy"] = self._value_external_traffic_policy
+        if self._value_health_check_node_port is not None:
+            values["health_check_node_port"] = self._value_health_check_node_port
+        if self._value_internal_traffic_policy is not None:
+            values["internal_traffic_policy"] = self._value_internal_traffic_policy
+        if self._value_ip_families is not None:
+            values["ip_families"] = self._value_ip_families
+        if self._value_ip_family_policy is not None:
+            values["ip_family_policy"] = self._value_ip_family_policy
+        if self._value_load_balancer_class is not None:
+            values["load_balancer_class"] = self._value_load_balancer_class
+        if self._value_load_balancer_ip is not None:
+            values["load_balancer_ip"] = self._value_load_balancer_ip
+        if self._value_load_balancer_source_ranges is not None:
+            values["load_balancer_source_ranges"] = self._value_load_balancer_source_ranges
+        if self._value_ports is not None:
+            values["ports"] = self._value_ports
+        if self._value_publish_not_ready_addresses is not None:
+            values["publish_not_ready_addresses"] = self._value_publish_not_ready_addresses
+        if self._value_selector is not None:
+            values["selector"] = self._value_selector
+        if self._value_session_affinity is not None:
+            values["session_affinity"] = self._value_session_affinity
+        if self._value_session_affinity_config is not None:
+            values["session_affinity_config"] = self._value_session_affinity_config
+        if self._value_type is not None:
+            values["type"] = self._value_type
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ServiceSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__28a62a3352f8d0567f520784bd515250a02d7d2d6686265c9478416f87acb91e(
+    *,
+    allocate_load_balancer_node_ports: typing.Optional[builtins.bool] = None,
+    cluster_ip: typing.Optional[builtins.str] = None,
+    cluster_i_ps: typing.Optional[typing.Sequence[builtins.str]] = None,
+    external_i_ps: typing.Optional[typing.Sequence[builtins.str]] = None,
+    external_name: typing.Optional[builtins.str] = None,
+    external_traffic_policy: typing.Optional[builtins.str] = None,
+    health_check_node_port: typing.Optional[jsii.Number] = None,
+    internal_traffic_policy: typing.Optional[builtins.str] = None,
+    ip_families: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ip_family_policy: typing.Optional[builtins.str] = None,
+    load_balancer_class: typing.Optional[builtins.str] = None,
+    load_balancer_ip: typing.Optional[builtins.str] = None,
+    load_balancer_source_ranges: typing.Optional[typing.Sequence[builtins.str]] = None,
+    ports: typing.Optional[typing.Sequence[typing.Union[ServicePort, typing.Dict[builtins.str, typing.Any]]]] = None,
+    publish_not_ready_addresses: typing.Optional[builtins.bool] = None,
+    selector: typing.Optional[typing.Mapping[builtins.str, builtins.str]] = None,
+    session_affinity: typing.Optional[builtins.str] = None,
+    session_affinity_config: typing.Optional[typing.Union[SessionAffinityConfig, typing.Dict[builtins.str, typing.Any]]] = None,
+    type: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,82 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ClientIpConfig import ClientIpConfig
+
+
+@jsii.data_type(
+    jsii_type="k8s.SessionAffinityConfig",
+    jsii_struct_bases=[],
+    name_mapping={"client_ip": "clientIp"},
+)
+class SessionAffinityConfig(_base.Struct):
+    __slots__ = (
+        "_value_client_ip",
+    )
+
+    def __init__(
+        self,
+        *,
+        client_ip: typing.Optional[typing.Union[ClientIpConfig, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''SessionAffinityConfig represents the configurations of session affinity.
+
+        :param client_ip: clientIP contains the configurations of Client IP based session affinity.
+
+        :schema: io.k8s.api.core.v1.SessionAffinityConfig
+        '''
+        if isinstance(client_ip, dict):
+            client_ip = ClientIpConfig(**client_ip)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__41fa363df0cef39b3a21ee7d4b32e767f771c391235a46bf9ce8b369b1bcb705)
+            check_type(argname="argument client_ip", value=client_ip, expected_type=type_hints["client_ip"])
+        self._value_client_ip = client_ip
+
+    @builtins.property
+    def client_ip(self) -> typing.Optional[ClientIpConfig]:
+        '''clientIP contains the configurations of Client IP based session affinity.
+
+        :schema: io.k8s.api.core.v1.SessionAffinityConfig#clientIP
+        '''
+        result = self._value_client_ip
+        return typing.cast(typing.Optional[ClientIpConfig], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_client_ip is not None:
+            values["client_ip"] = self._value_client_ip
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SessionAffinityConfig(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__41fa363df0cef39b3a21ee7d4b32e767f771c391235a46bf9ce8b369b1bcb705(
+    *,
+    client_ip: typing.Optional[typing.Union[ClientIpConfig, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,100 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.StatefulSetPersistentVolumeClaimRetentionPolicy",
+    jsii_struct_bases=[],
+    name_mapping={"when_deleted": "whenDeleted", "when_scaled": "whenScaled"},
+)
+class StatefulSetPersistentVolumeClaimRetentionPolicy(_base.Struct):
+    __slots__ = (
+        "_value_when_deleted",
+        "_value_when_scaled",
+    )
+
+    def __init__(
+        self,
+        *,
+        when_deleted: typing.Optional[builtins.str] = None,
+        when_scaled: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''StatefulSetPersistentVolumeClaimRetentionPolicy describes the policy used for PVCs created from the StatefulSet VolumeClaimTemplates.
+
+        :param when_deleted: WhenDeleted specifies what happens to PVCs created from StatefulSet VolumeClaimTemplates when the StatefulSet is deleted. The default policy of ``Retain`` causes PVCs to not be affected by StatefulSet deletion. The ``Delete`` policy causes those PVCs to be deleted.
+        :param when_scaled: WhenScaled specifies what happens to PVCs created from StatefulSet VolumeClaimTemplates when the StatefulSet is scaled down. The default policy of ``Retain`` causes PVCs to not be affected by a scaledown. The ``Delete`` policy causes the associated PVCs for any excess pods above the replica count to be deleted.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetPersistentVolumeClaimRetentionPolicy
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__94098796780c55cdb42c5b053d638803027114010a1003ea7430353fd3179c5a)
+            check_type(argname="argument when_deleted", value=when_deleted, expected_type=type_hints["when_deleted"])
+            check_type(argname="argument when_scaled", value=when_scaled, expected_type=type_hints["when_scaled"])
+        self._value_when_deleted = when_deleted
+        self._value_when_scaled = when_scaled
+
+    @builtins.property
+    def when_deleted(self) -> typing.Optional[builtins.str]:
+        '''WhenDeleted specifies what happens to PVCs created from StatefulSet VolumeClaimTemplates when the StatefulSet is deleted.
+
+        The default policy of ``Retain`` causes PVCs to not be affected by StatefulSet deletion. The ``Delete`` policy causes those PVCs to be deleted.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetPersistentVolumeClaimRetentionPolicy#whenDeleted
+        '''
+        result = self._value_when_deleted
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def when_scaled(self) -> typing.Optional[builtins.str]:
+        '''WhenScaled specifies what happens to PVCs created from StatefulSet VolumeClaimTemplates when the StatefulSet is scaled down.
+
+        The default policy of ``Retain`` causes PVCs to not be affected by a scaledown. The ``Delete`` policy causes the associated PVCs for any excess pods above the replica count to be deleted.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetPersistentVolumeClaimRetentionPolicy#whenScaled
+        '''
+        result = self._value_when_scaled
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_when_deleted is not None:
+            values["when_deleted"] = self._value_when_deleted
+        if self._value_when_scaled is not None:
+            values["when_scaled"] = self._value_when_scaled
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "StatefulSetPersistentVolumeClaimRetentionPolicy(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__94098796780c55cdb42c5b053d638803027114010a1003ea7430353fd3179c5a(
+    *,
+    when_deleted: typing.Optional[builtins.str] = None,
+    when_scaled: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
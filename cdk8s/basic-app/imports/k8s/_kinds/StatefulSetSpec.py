@@ -0,0 +1,281 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .KubePersistentVolumeClaimProps import KubePersistentVolumeClaimProps
+from .LabelSelector import LabelSelector
+from .PodTemplateSpec import PodTemplateSpec
+from .StatefulSetPersistentVolumeClaimRetentionPolicy import StatefulSetPersistentVolumeClaimRetentionPolicy
+from .StatefulSetUpdateStrategy import StatefulSetUpdateStrategy
+
+
+@jsii.data_type(
+    jsii_type="k8s.StatefulSetSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "selector": "selector",
+        "service_name": "serviceName",
+        "template": "template",
+        "min_ready_seconds": "minReadySeconds",
+        "persistent_volume_claim_retention_policy": "persistentVolumeClaimRetentionPolicy",
+        "pod_management_policy": "podManagementPolicy",
+        "replicas": "replicas",
+        "revision_history_limit": "revisionHistoryLimit",
+        "update_strategy": "updateStrategy",
+        "volume_claim_templates": "volumeClaimTemplates",
+    },
+)
+class StatefulSetSpec(_base.Struct):
+    __slots__ = (
+        "_value_selector",
+        "_value_service_name",
+        "_value_template",
+        "_value_min_ready_seconds",
+        "_value_persistent_volume_claim_retention_policy",
+        "_value_pod_management_policy",
+        "_value_replicas",
+        "_value_revision_history_limit",
+        "_value_update_strategy",
+        "_value_volume_claim_templates",
+    )
+
+    def __init__(
+        self,
+        *,
+        selector: typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]],
+        service_name: builtins.str,
+        template: typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]],
+        min_ready_seconds: typing.Optional[jsii.Number] = None,
+        persistent_volume_claim_retention_policy: typing.Optional[typing.Union[StatefulSetPersistentVolumeClaimRetentionPolicy, typing.Dict[builtins.str, typing.Any]]] = None,
+        pod_management_policy: typing.Optional[builtins.str] = None,
+        replicas: typing.Optional[jsii.Number] = None,
+        revision_history_limit: typing.Optional[jsii.Number] = None,
+        update_strategy: typing.Optional[typing.Union["StatefulSetUpdateStrategy", typing.Dict[builtins.str, typing.Any]]] = None,
+        volume_claim_templates: typing.Optional[typing.Sequence[typing.Union[KubePersistentVolumeClaimProps, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''A StatefulSetSpec is the specification of a StatefulSet.
+
+        :param selector: selector is a label query over pods that should match the replica count. It must match the pod template's labels. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+        :param service_name: serviceName is the name of the service that governs this StatefulSet. This service must exist before the StatefulSet, and is responsible for the network identity of the set. Pods get DNS/hostnames that follow the pattern: pod-specific-string.serviceName.default.svc.cluster.local where "pod-specific-string" is managed by the StatefulSet controller.
+        :param template: template is the object that describes the pod that will be created if insufficient replicas are detected. Each pod stamped out by the StatefulSet will fulfill this Template, but have a unique identity from the rest of the StatefulSet.
+        :param min_ready_seconds: Minimum number of seconds for which a newly created pod should be ready without any of its container crashing for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready) Default: 0 (pod will be considered available as soon as it is ready)
+        :param persistent_volume_claim_retention_policy: persistentVolumeClaimRetentionPolicy describes the lifecycle of persistent volume claims created from volumeClaimTemplates. By default, all persistent volume claims are created as needed and retained until manually deleted. This policy allows the lifecycle to be altered, for example by deleting persistent volume claims when their stateful set is deleted, or when their pod is scaled down. This requires the StatefulSetAutoDeletePVC feature gate to be enabled, which is alpha. +optional
+        :param pod_management_policy: podManagementPolicy controls how pods are created during initial scale up, when replacing pods on nodes, or when scaling down. The default policy is ``OrderedReady``, where pods are created in increasing order (pod-0, then pod-1, etc) and the controller will wait until each pod is ready before continuing. When scaling down, the pods are removed in the opposite order. The alternative policy is ``Parallel`` which will create pods in parallel to match the desired scale without waiting, and on scale down will delete all pods at once.
+        :param replicas: replicas is the desired number of replicas of the given Template. These are replicas in the sense that they are instantiations of the same Template, but individual replicas also have a consistent identity. If unspecified, defaults to 1.
+        :param revision_history_limit: revisionHistoryLimit is the maximum number of revisions that will be maintained in the StatefulSet's revision history. The revision history consists of all revisions not represented by a currently applied StatefulSetSpec version. The default value is 10.
+        :param update_strategy: updateStrategy indicates the StatefulSetUpdateStrategy that will be employed to update Pods in the StatefulSet when a revision is made to Template.
+        :param volume_claim_templates: volumeClaimTemplates is a list of claims that pods are allowed to reference. The StatefulSet controller is responsible for mapping network identities to claims in a way that maintains the identity of a pod. Every claim in this list must have at least one matching (by name) volumeMount in one container in the template. A claim in this list takes precedence over any volumes in the template, with the same name.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec
+        '''
+        if isinstance(selector, dict):
+            selector = LabelSelector(**selector)
+        if isinstance(template, dict):
+            template = PodTemplateSpec(**template)
+        if isinstance(persistent_volume_claim_retention_policy, dict):
+            persistent_volume_claim_retention_policy = StatefulSetPersistentVolumeClaimRetentionPolicy(**persistent_volume_claim_retention_policy)
+        if isinstance(update_strategy, dict):
+            update_strategy = StatefulSetUpdateStrategy(**update_strategy)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__6b3479a4db27d16f25eff18cf9e8bad5d98c3cce86039a11df4bfd5a6c9d128f)
+            check_type(argname="argument selector", value=selector, expected_type=type_hints["selector"])
+            check_type(argname="argument service_name", value=service_name, expected_type=type_hints["service_name"])
+            check_type(argname="argument template", value=template, expected_type=type_hints["template"])
+            check_type(argname="argument min_ready_seconds", value=min_ready_seconds, expected_type=type_hints["min_ready_seconds"])
+            check_type(argname="argument persistent_volume_claim_retention_policy", value=persistent_volume_claim_retention_policy, expected_type=type_hints["persistent_volume_claim_retention_policy"])
+            check_type(argname="argument pod_management_policy", value=pod_management_policy, expected_type=type_hints["pod_management_policy"])
+            check_type(argname="argument replicas", value=replicas, expected_type=type_hints["replicas"])
+            check_type(argname="argument revision_history_limit", value=revision_history_limit, expected_type=type_hints["revision_history_limit"])
+            check_type(argname="argument update_strategy", value=update_strategy, expected_type=type_hints["update_strategy"])
+            check_type(argname="argument volume_claim_templates", value=volume_claim_templates, expected_type=type_hints["volume_claim_templates"])
+        self._value_selector = selector
+        self._value_service_name = service_name
+        self._value_template = template
+        self._value_min_ready_seconds = min_ready_seconds
+        self._value_persistent_volume_claim_retention_policy = persistent_volume_claim_retention_policy
+        self._value_pod_management_policy = pod_management_policy
+        self._value_replicas = replicas
+        self._value_revision_history_limit = revision_history_limit
+        self._value_update_strategy = update_strategy
+        self._value_volume_claim_templates = volume_claim_templates
+
+    @builtins.property
+    def selector(self) -> LabelSelector:
+        '''selector is a label query over pods that should match the replica count.
+
+        It must match the pod template's labels. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels/#label-selectors
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#selector
+        '''
+        result = self._value_selector
+        assert result is not None, "Required property 'selector' is missing"
+        return typing.cast(LabelSelector, result)
+
+    @builtins.property
+    def service_name(self) -> builtins.str:
+        '''serviceName is the name of the service that governs this StatefulSet.
+
+        This service must exist before the StatefulSet, and is responsible for the network identity of the set. Pods get DNS/hostnames that follow the pattern: pod-specific-string.serviceName.default.svc.cluster.local where "pod-specific-string" is managed by the StatefulSet controller.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#serviceName
+        '''
+        result = self._value_service_name
+        assert result is not None, "Required property 'service_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def template(self) -> PodTemplateSpec:
+        '''template is the object that describes the pod that will be created if insufficient replicas are detected.
+
+        Each pod stamped out by the StatefulSet will fulfill this Template, but have a unique identity from the rest of the StatefulSet.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#template
+        '''
+        result = self._value_template
+        assert result is not None, "Required property 'template' is missing"
+        return typing.cast(PodTemplateSpec, result)
+
+    @builtins.property
+    def min_ready_seconds(self) -> typing.Optional[jsii.Number]:
+        '''Minimum number of seconds for which a newly created pod should be ready without any of its container crashing for it to be considered available.
+
+        Defaults to 0 (pod will be considered available as soon as it is ready)
+
+        :default: 0 (pod will be considered available as soon as it is ready)
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#minReadySeconds
+        '''
+        result = self._value_min_ready_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def persistent_volume_claim_retention_policy(
+        self,
+    ) -> typing.Optional[StatefulSetPersistentVolumeClaimRetentionPolicy]:
+        '''persistentVolumeClaimRetentionPolicy describes the lifecycle of persistent volume claims created from volumeClaimTemplates.
+
+        By default, all persistent volume claims are created as needed and retained until manually deleted. This policy allows the lifecycle to be altered, for example by deleting persistent volume claims when their stateful set is deleted, or when their pod is scaled down. This requires the StatefulSetAutoDeletePVC feature gate to be enabled, which is alpha.  +optional
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#persistentVolumeClaimRetentionPolicy
+        '''
+        result = self._value_persistent_volume_claim_retention_policy
+        return typing.cast(typing.Optional[StatefulSetPersistentVolumeClaimRetentionPolicy], result)
+
+    @builtins.property
+    def pod_management_policy(self) -> typing.Optional[builtins.str]:
+        '''podManagementPolicy controls how pods are created during initial scale up, when replacing pods on nodes, or when scaling down.
+
+        The default policy is ``OrderedReady``, where pods are created in increasing order (pod-0, then pod-1, etc) and the controller will wait until each pod is ready before continuing. When scaling down, the pods are removed in the opposite order. The alternative policy is ``Parallel`` which will create pods in parallel to match the desired scale without waiting, and on scale down will delete all pods at once.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#podManagementPolicy
+        '''
+        result = self._value_pod_management_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def replicas(self) -> typing.Optional[jsii.Number]:
+        '''replicas is the desired number of replicas of the given Template.
+
+        These are replicas in the sense that they are instantiations of the same Template, but individual replicas also have a consistent identity. If unspecified, defaults to 1.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#replicas
+        '''
+        result = self._value_replicas
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def revision_history_limit(self) -> typing.Optional[jsii.Number]:
+        '''revisionHistoryLimit is the maximum number of revisions that will be maintained in the StatefulSet's revision history.
+
+        The revision history consists of all revisions not represented by a currently applied StatefulSetSpec version. The default value is 10.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#revisionHistoryLimit
+        '''
+        result = self._value_revision_history_limit
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def update_strategy(self) -> typing.Optional["StatefulSetUpdateStrategy"]:
+        '''updateStrategy indicates the StatefulSetUpdateStrategy that will be employed to update Pods in the StatefulSet when a revision is made to Template.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#updateStrategy
+        '''
+        result = self._value_update_strategy
+        return typing.cast(typing.Optional["StatefulSetUpdateStrategy"], result)
+
+    @builtins.property
+    def volume_claim_templates(
+        self,
+    ) -> typing.Optional[typing.List[KubePersistentVolumeClaimProps]]:
+        '''volumeClaimTemplates is a list of claims that pods are allowed to reference.
+
+        The StatefulSet controller is responsible for mapping network identities to claims in a way that maintains the identity of a pod. Every claim in this list must have at least one matching (by name) volumeMount in one container in the template. A claim in this list takes precedence over any volumes in the template, with the same name.
+
+        :schema: io.k8s.api.apps.v1.StatefulSetSpec#volumeClaimTemplates
+        '''
+        result = self._value_volume_claim_templates
+        return typing.cast(typing.Optional[typing.List[KubePersistentVolumeClaimProps]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "selector": self._value_selector,
+            "service_name": self._value_service_name,
+            "template": self._value_template,
+        }
+        if self._value_min_ready_seconds is not None:
+            values["min_ready_seconds"] = self._value_min_ready_seconds
+        if self._value_persistent_volume_claim_retention_policy is not None:
+            values["persistent_volume_claim_retention_policy"] = self._value_persistent_volume_claim_retention_policy
+        if self._value_pod_management_policy is not None:
+            values["pod_management_policy"] = self._value_pod_management_policy
+        if self._value_replicas is not None:
+            values["replicas"] = self._value_replicas
+        if self._value_revision_history_limit is not None:
+            values["revision_history_limit"] = self._value_revision_history_limit
+        if self._value_update_strategy is not None:
+            values["update_strategy"] = self._value_update_strategy
+        if self._value_volume_claim_templates is not None:
+            values["volume_claim_templates"] = self._value_volume_claim_templates
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "StatefulSetSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__6b3479a4db27d16f25eff18cf9e8bad5d98c3cce86039a11df4bfd5a6c9d128f(
+    *,
+    selector: typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]],
+    service_name: builtins.str,
+    template: typing.Union[PodTemplateSpec, typing.Dict[builtins.str, typing.Any]],
+    min_ready_seconds: typing.Optional[jsii.Number] = None,
+    persistent_volume_claim_retention_policy: typing.Optional[typing.Union[StatefulSetPersistentVolumeClaimRetentionPolicy, typing.Dict[builtins.str, typing.Any]]] = None,
+    pod_management_policy: typing.Optional[builtins.str] = None,
+    replicas: typing.Optional[jsii.Number] = None,
+    revision_history_limit: typing.Optional[jsii.Number] = None,
+    update_strategy: typing.Optional[typing.Union[StatefulSetUpdateStrategy, typing.Dict[builtins.str, typing.Any]]] = None,
+    volume_claim_templates: typing.Optional[typing.Sequence[typing.Union[KubePersistentVolumeClaimProps, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,123 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.StatusCause",
+    jsii_struct_bases=[],
+    name_mapping={"field": "field", "message": "message", "reason": "reason"},
+)
+class StatusCause(_base.Struct):
+    __slots__ = (
+        "_value_field",
+        "_value_message",
+        "_value_reason",
+    )
+
+    def __init__(
+        self,
+        *,
+        field: typing.Optional[builtins.str] = None,
+        message: typing.Optional[builtins.str] = None,
+        reason: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''StatusCause provides more information about an api.Status failure, including cases when multiple errors are encountered.
+
+        :param field: The field of the resource that has caused this error, as named by its JSON serialization. May include dot and postfix notation for nested attributes. Arrays are zero-indexed. Fields may appear more than once in an array of causes due to fields having multiple errors. Optional. Examples: "name" - the field "name" on the current resource "items[0].name" - the field "name" on the first array entry in "items"
+        :param message: A human-readable description of the cause of the error. This field may be presented as-is to a reader.
+        :param reason: A machine-readable description of the cause of the error. If this value is empty there is no information available.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusCause
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__9a84cad04e682eba7f45d6717bea7bd461527f9be5b61611af8ae5829ed76917)
+            check_type(argname="argument field", value=field, expected_type=type_hints["field"])
+            check_type(argname="argument message", value=message, expected_type=type_hints["message"])
+            check_type(argname="argument reason", value=reason, expected_type=type_hints["reason"])
+        self._value_field = field
+        self._value_message = message
+        self._value_reason = reason
+
+    @builtins.property
+    def field(self) -> typing.Optional[builtins.str]:
+        '''The field of the resource that has caused this error, as named by its JSON serialization.
+
+        May include dot and postfix notation for nested attributes. Arrays are zero-indexed.  Fields may appear more than once in an array of causes due to fields having multiple errors. Optional.
+
+        Examples:
+        "name" - the field "name" on the current resource
+        "items[0].name" - the field "name" on the first array entry in "items"
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusCause#field
+        '''
+        result = self._value_field
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def message(self) -> typing.Optional[builtins.str]:
+        '''A human-readable description of the cause of the error.
+
+        This field may be presented as-is to a reader.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusCause#message
+        '''
+        result = self._value_message
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def reason(self) -> typing.Optional[builtins.str]:
+        '''A machine-readable description of the cause of the error.
+
+        If this value is empty there is no information available.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusCause#reason
+        '''
+        result = self._value_reason
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_field is not None:
+            values["field"] = self._value_field
+        if self._value_message is not None:
+            values["message"] = self._value_message
+        if self._value_reason is not None:
+            values["reason"] = self._value_reason
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "StatusCause(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__9a84cad04e682eba7f45d6717bea7bd461527f9be5b61611af8ae5829ed76917(
+    *,
+    field: typing.Optional[builtins.str] = None,
+    message: typing.Optional[builtins.str] = None,
+    reason: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
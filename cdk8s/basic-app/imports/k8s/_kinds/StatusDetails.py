@@ -0,0 +1,182 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .StatusCause import StatusCause
+
+
+@jsii.data_type(
+    jsii_type="k8s.StatusDetails",
+    jsii_struct_bases=[],
+    name_mapping={
+        "causes": "causes",
+        "group": "group",
+        "kind": "kind",
+        "name": "name",
+        "retry_after_seconds": "retryAfterSeconds",
+        "uid": "uid",
+    },
+)
+class StatusDetails(_base.Struct):
+    __slots__ = (
+        "_value_causes",
+        "_value_group",
+        "_value_kind",
+        "_value_name",
+        "_value_retry_after_seconds",
+        "_value_uid",
+    )
+
+    def __init__(
+        self,
+        *,
+        causes: typing.Optional[typing.Sequence[typing.Union[StatusCause, typing.Dict[builtins.str, typing.Any]]]] = None,
+        group: typing.Optional[builtins.str] = None,
+        kind: typing.Optional[builtins.str] = None,
+        name: typing.Optional[builtins.str] = None,
+        retry_after_seconds: typing.Optional[jsii.Number] = None,
+        uid: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''StatusDetails is a set of additional properties that MAY be set by the server to provide additional information about a response.
+
+        The Reason field of a Status object defines what attributes will be set. Clients must ignore fields that do not match the defined type of each attribute, and should assume that any attribute may be empty, invalid, or under defined.
+
+        :param causes: The Causes array includes more details associated with the StatusReason failure. Not all StatusReasons may provide detailed causes.
+        :param group: The group attribute of the resource associated with the status StatusReason.
+        :param kind: The kind attribute of the resource associated with the status StatusReason. On some operations may differ from the requested resource Kind. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+        :param name: The name attribute of the resource associated with the status StatusReason (when there is a single name which can be described).
+        :param retry_after_seconds: If specified, the time in seconds before the operation should be retried. Some errors may indicate the client must take an alternate action - for those errors this field may indicate how long to wait before taking the alternate action.
+        :param uid: UID of the resource. (when there is a single resource which can be described). More info: http://kubernetes.io/docs/user-guide/identifiers#uids
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__86c96dd405073e5b3285a98f15293117917ec67b04be70820dcaf694a2ea1f98)
+            check_type(argname="argument causes", value=causes, expected_type=type_hints["causes"])
+            check_type(argname="argument group", value=group, expected_type=type_hints["group"])
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument retry_after_seconds", value=retry_after_seconds, expected_type=type_hints["retry_after_seconds"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+        self._value_causes = causes
+        self._value_group = group
+        self._value_kind = kind
+        self._value_name = name
+        self._value_retry_after_seconds = retry_after_seconds
+        self._value_uid = uid
+
+    @builtins.property
+    def causes(self) -> typing.Optional[typing.List[StatusCause]]:
+        '''The Causes array includes more details associated with the StatusReason failure.
+
+        Not all StatusReasons may provide detailed causes.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails#causes
+        '''
+        result = self._value_causes
+        return typing.cast(typing.Optional[typing.List[StatusCause]], result)
+
+    @builtins.property
+    def group(self) -> typing.Optional[builtins.str]:
+        '''The group attribute of the resource associated with the status StatusReason.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails#group
+        '''
+        result = self._value_group
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def kind(self) -> typing.Optional[builtins.str]:
+        '''The kind attribute of the resource associated with the status StatusReason.
+
+        On some operations may differ from the requested resource Kind. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#types-kinds
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails#kind
+        '''
+        result = self._value_kind
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def name(self) -> typing.Optional[builtins.str]:
+        '''The name attribute of the resource associated with the status StatusReason (when there is a single name which can be described).
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails#name
+        '''
+        result = self._value_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def retry_after_seconds(self) -> typing.Optional[jsii.Number]:
+        '''If specified, the time in seconds before the operation should be retried.
+
+        Some errors may indicate the client must take an alternate action - for those errors this field may indicate how long to wait before taking the alternate action.
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails#retryAfterSeconds
+        '''
+        result = self._value_retry_after_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def uid(self) -> typing.Optional[builtins.str]:
+        '''UID of the resource.
+
+        (when there is a single resource which can be described). More info: http://kubernetes.io/docs/user-guide/identifiers#uids
+
+        :schema: io.k8s.apimachinery.pkg.apis.meta.v1.StatusDetails#uid
+        '''
+        result = self._value_uid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_causes is not None:
+            values["causes"] = self._value_causes
+        if self._value_group is not None:
+            values["group"] = self._value_group
+        if self._value_kind is not None:
+            values["kind"] = self._value_kind
+        if self._value_name is not None:
+            values["name"] = self._value_name
+        if self._value_retry_after_seconds is not None:
+            values["retry_after_seconds"] = self._value_retry_after_seconds
+        if self._value_uid is not None:
+            values["uid"] = self._value_uid
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "StatusDetails(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__86c96dd405073e5b3285a98f15293117917ec67b04be70820dcaf694a2ea1f98(
+    *,
+    causes: typing.Optional[typing.Sequence[typing.Union[StatusCause, typing.Dict[builtins.str, typing.Any]]]] = None,
+    group: typing.Optional[builtins.str] = None,
+    kind: typing.Optional[builtins.str] = None,
+    name: typing.Optional[builtins.str] = None,
+    retry_after_seconds: typing.Optional[jsii.Number] = None,
+    uid: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
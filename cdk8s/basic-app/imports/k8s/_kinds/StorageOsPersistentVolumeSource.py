@@ -0,0 +1,166 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ObjectReference import ObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.StorageOsPersistentVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "fs_type": "fsType",
+        "read_only": "readOnly",
+        "secret_ref": "secretRef",
+        "volume_name": "volumeName",
+        "volume_namespace": "volumeNamespace",
+    },
+)
+class StorageOsPersistentVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_fs_type",
+        "_value_read_only",
+        "_value_secret_ref",
+        "_value_volume_name",
+        "_value_volume_namespace",
+    )
+
+    def __init__(
+        self,
+        *,
+        fs_type: typing.Optional[builtins.str] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        secret_ref: typing.Optional[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+        volume_name: typing.Optional[builtins.str] = None,
+        volume_namespace: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a StorageOS persistent volume resource.
+
+        :param fs_type: fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+        :param read_only: readOnly defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts.
+        :param secret_ref: secretRef specifies the secret to use for obtaining the StorageOS API credentials. If not specified, default values will be attempted.
+        :param volume_name: volumeName is the human-readable name of the StorageOS volume. Volume names are only unique within a namespace.
+        :param volume_namespace: volumeNamespace specifies the scope of the volume within StorageOS. If no namespace is specified then the Pod's namespace will be used. This allows the Kubernetes name scoping to be mirrored within StorageOS for tighter integration. Set VolumeName to any name to override the default behaviour. Set to "default" if you are not using namespaces within StorageOS. Namespaces that do not pre-exist within StorageOS will be created.
+
+        :schema: io.k8s.api.core.v1.StorageOSPersistentVolumeSource
+        '''
+        if isinstance(secret_ref, dict):
+            secret_ref = ObjectReference(**secret_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__dcb3feea41d91b4ceb6ebfb62e681f60b70439c9ca50095a408680f3be68ff39)
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument secret_ref", value=secret_ref, expected_type=type_hints["secret_ref"])
+            check_type(argname="argument volume_name", value=volume_name, expected_type=type_hints["volume_name"])
+            check_type(argname="argument volume_namespace", value=volume_namespace, expected_type=type_hints["volume_namespace"])
+        self._value_fs_type = fs_type
+        self._value_read_only = read_only
+        self._value_secret_ref = secret_ref
+        self._value_volume_name = volume_name
+        self._value_volume_namespace = volume_namespace
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is the filesystem type to mount.
+
+        Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+
+        :schema: io.k8s.api.core.v1.StorageOSPersistentVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''readOnly defaults to false (read/write).
+
+        ReadOnly here will force the ReadOnly setting in VolumeMounts.
+
+        :schema: io.k8s.api.core.v1.StorageOSPersistentVolumeSource#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def secret_ref(self) -> typing.Optional[ObjectReference]:
+        '''secretRef specifies the secret to use for obtaining the StorageOS API credentials.
+
+        If not specified, default values will be attempted.
+
+        :schema: io.k8s.api.core.v1.StorageOSPersistentVolumeSource#secretRef
+        '''
+        result = self._value_secret_ref
+        return typing.cast(typing.Optional[ObjectReference], result)
+
+    @builtins.property
+    def volume_name(self) -> typing.Optional[builtins.str]:
+        '''volumeName is the human-readable name of the StorageOS volume.
+
+        Volume names are only unique within a namespace.
+
+        :schema: io.k8s.api.core.v1.StorageOSPersistentVolumeSource#volumeName
+        '''
+        result = self._value_volume_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def volume_namespace(self) -> typing.Optional[builtins.str]:
+        '''volumeNamespace specifies the scope of the volume within StorageOS.
+
+        If no namespace is specified then the Pod's namespace will be used.  This allows the Kubernetes name scoping to be mirrored within StorageOS for tighter integration. Set VolumeName to any name to override the default behaviour. Set to "default" if you are not using namespaces within StorageOS. Namespaces that do not pre-exist within StorageOS will be created.
+
+        :schema: io.k8s.api.core.v1.StorageOSPersistentVolumeSource#volumeNamespace
+        '''
+        result = self._value_volume_namespace
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_secret_ref is not None:
+            values["secret_ref"] = self._value_secret_ref
+        if self._value_volume_name is not None:
+            values["volume_name"] = self._value_volume_name
+        if self._value_volume_namespace is not None:
+            values["volume_namespace"] = self._value_volume_namespace
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "StorageOsPersistentVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__dcb3feea41d91b4ceb6ebfb62e681f60b70439c9ca50095a408680f3be68ff39(
+    *,
+    fs_type: typing.Optional[builtins.str] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    secret_ref: typing.Optional[typing.Union[ObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    volume_name: typing.Optional[builtins.str] = None,
+    volume_namespace: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
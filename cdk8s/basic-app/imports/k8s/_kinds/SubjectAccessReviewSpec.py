@@ -0,0 +1,183 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NonResourceAttributes import NonResourceAttributes
+from .ResourceAttributes import ResourceAttributes
+
+
+@jsii.data_type(
+    jsii_type="k8s.SubjectAccessReviewSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "extra": "extra",
+        "groups": "groups",
+        "non_resource_attributes": "nonResourceAttributes",
+        "resource_attributes": "resourceAttributes",
+        "uid": "uid",
+        "user": "user",
+    },
+)
+class SubjectAccessReviewSpec(_base.Struct):
+    __slots__ = (
+        "_value_extra",
+        "_value_groups",
+        "_value_non_resource_attributes",
+        "_value_resource_attributes",
+        "_value_uid",
+        "_value_user",
+    )
+
+    def __init__(
+        self,
+        *,
+        extra: typing.Optional[typing.Mapping[builtins.str, typing.Sequence[builtins.str]]] = None,
+        groups: typing.Optional[typing.Sequence[builtins.str]] = None,
+        non_resource_attributes: typing.Optional[typing.Union[NonResourceAttributes, typing.Dict[builtins.str, typing.Any]]] = None,
+        resource_attributes: typing.Optional[typing.Union[ResourceAttributes, typing.Dict[builtins.str, typing.Any]]] = None,
+        uid: typing.Optional[builtins.str] = None,
+        user: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''SubjectAccessReviewSpec is a description of the access request.
+
+        Exactly one of ResourceAuthorizationAttributes and NonResourceAuthorizationAttributes must be set
+
+        :param extra: Extra corresponds to the user.Info.GetExtra() method from the authenticator. Since that is input to the authorizer it needs a reflection here.
+        :param groups: Groups is the groups you're testing for.
+        :param non_resource_attributes: NonResourceAttributes describes information for a non-resource access request.
+        :param resource_attributes: ResourceAuthorizationAttributes describes information for a resource access request.
+        :param uid: UID information about the requesting user.
+        :param user: User is the user you're testing for. If you specify "User" but not "Groups", then is it interpreted as "What if User were not a member of any groups
+
+        :schema: io.k8s.api.authorization.v1.SubjectAccessReviewSpec
+        '''
+        if isinstance(non_resource_attributes, dict):
+            non_resource_attributes = NonResourceAttributes(**non_resource_attributes)
+        if isinstance(resource_attributes, dict):
+            resource_attributes = ResourceAttributes(**resource_attributes)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__aecec73f519b5097699d859a6173cfe87c594463900289ecfb24c4a3c623ca4a)
+            check_type(argname="argument extra", value=extra, expected_type=type_hints["extra"])
+            check_type(argname="argument groups", value=groups, expected_type=type_hints["groups"])
+            check_type(argname="argument non_resource_attributes", value=non_resource_attributes, expected_type=type_hints["non_resource_attributes"])
+            check_type(argname="argument resource_attributes", value=resource_attributes, expected_type=type_hints["resource_attributes"])
+            check_type(argname="argument uid", value=uid, expected_type=type_hints["uid"])
+            check_type(argname="argument user", value=user, expected_type=type_hints["user"])
+        self._value_extra = extra
+        self._value_groups = groups
+        self._value_non_resource_attributes = non_resource_attributes
+        self._value_resource_attributes = resource_attributes
+        self._value_uid = uid
+        self._value_user = user
+
+    @builtins.property
+    def extra(
+        self,
+    ) -> typing.Optional[typing.Mapping[builtins.str, typing.List[builtins.str]]]:
+        '''Extra corresponds to the user.Info.GetExtra() method from the authenticator.  Since that is input to the authorizer it needs a reflection here.
+
+        :schema: io.k8s.api.authorization.v1.SubjectAccessReviewSpec#extra
+        '''
+        result = self._value_extra
+        return typing.cast(typing.Optional[typing.Mapping[builtins.str, typing.List[builtins.str]]], result)
+
+    @builtins.property
+    def groups(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Groups is the groups you're testing for.
+
+        :schema: io.k8s.api.authorization.v1.SubjectAccessReviewSpec#groups
+        '''
+        result = self._value_groups
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def non_resource_attributes(self) -> typing.Optional[NonResourceAttributes]:
+        '''NonResourceAttributes describes information for a non-resource access request.
+
+        :schema: io.k8s.api.authorization.v1.SubjectAccessReviewSpec#nonResourceAttributes
+        '''
+        result = self._value_non_resource_attributes
+        return typing.cast(typing.Optional[NonResourceAttributes], result)
+
+    @builtins.property
+    def resource_attributes(self) -> typing.Optional[ResourceAttributes]:
+        '''ResourceAuthorizationAttributes describes information for a resource access request.
+
+        :schema: io.k8s.api.authorization.v1.SubjectAccessReviewSpec#resourceAttributes
+        '''
+        result = self._value_resource_attributes
+        return typing.cast(typing.Optional[ResourceAttributes], result)
+
+    @builtins.property
+    def uid(self) -> typing.Optional[builtins.str]:
+        '''UID information about the requesting user.
+
+        :schema: io.k8s.api.authorization.v1.SubjectAccessReviewSpec#uid
+        '''
+        result = self._value_uid
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def user(self) -> typing.Optional[builtins.str]:
+        '''User is the user you're testing for.
+
+        If you specify "User" but not "Groups", then is it interpreted as "What if User were not a member of any groups
+
+        :schema: io.k8s.api.authorization.v1.SubjectAccessReviewSpec#user
+        '''
+        result = self._value_user
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_extra is not None:
+            values["extra"] = self._value_extra
+        if self._value_groups is not None:
+            values["groups"] = self._value_groups
+        if self._value_non_resource_attributes is not None:
+            values["non_resource_attributes"] = self._value_non_resource_attributes
+        if self._value_resource_attributes is not None:
+            values["resource_attributes"] = self._value_resource_attributes
+        if self._value_uid is not None:
+            values["uid"] = self._value_uid
+        if self._value_user is not None:
+            values["user"] = self._value_user
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SubjectAccessReviewSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__aecec73f519b5097699d859a6173cfe87c594463900289ecfb24c4a3c623ca4a(
+    *,
+    extra: typing.Optional[typing.Mapping[builtins.str, typing.Sequence[builtins.str]]] = None,
+    groups: typing.Optional[typing.Sequence[builtins.str]] = None,
+    non_resource_attributes: typing.Optional[typing.Union[NonResourceAttributes, typing.Dict[builtins.str, typing.Any]]] = None,
+    resource_attributes: typing.Optional[typing.Union[ResourceAttributes, typing.Dict[builtins.str, typing.Any]]] = None,
+    uid: typing.Optional[builtins.str] = None,
+    user: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,149 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .GroupSubjectV1Beta2 import GroupSubjectV1Beta2
+from .ServiceAccountSubjectV1Beta2 import ServiceAccountSubjectV1Beta2
+from .UserSubjectV1Beta2 import UserSubjectV1Beta2
+
+
+@jsii.data_type(
+    jsii_type="k8s.SubjectV1Beta2",
+    jsii_struct_bases=[],
+    name_mapping={
+        "kind": "kind",
+        "group": "group",
+        "service_account": "serviceAccount",
+        "user": "user",
+    },
+)
+class SubjectV1Beta2(_base.Struct):
+    __slots__ = (
+        "_value_kind",
+        "_value_group",
+        "_value_service_account",
+        "_value_user",
+    )
+
+    def __init__(
+        self,
+        *,
+        kind: builtins.str,
+        group: typing.Optional[typing.Union[GroupSubjectV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+        service_account: typing.Optional[typing.Union[ServiceAccountSubjectV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+        user: typing.Optional[typing.Union["UserSubjectV1Beta2", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Subject matches the originator of a request, as identified by the request authentication system.
+
+        There are three ways of matching an originator; by user, group, or service account.
+
+        :param kind: ``kind`` indicates which one of the other fields is non-empty. Required
+        :param group: ``group`` matches based on user group name.
+        :param service_account: ``serviceAccount`` matches ServiceAccounts.
+        :param user: ``user`` matches based on username.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.Subject
+        '''
+        if isinstance(group, dict):
+            group = GroupSubjectV1Beta2(**group)
+        if isinstance(service_account, dict):
+            service_account = ServiceAccountSubjectV1Beta2(**service_account)
+        if isinstance(user, dict):
+            user = UserSubjectV1Beta2(**user)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__65ada18dc9b20030468e8eb483d832680b97ad6e44b4cc62b86e84cd497f848d)
+            check_type(argname="argument kind", value=kind, expected_type=type_hints["kind"])
+            check_type(argname="argument group", value=group, expected_type=type_hints["group"])
+            check_type(argname="argument service_account", value=service_account, expected_type=type_hints["service_account"])
+            check_type(argname="argument user", value=user, expected_type=type_hints["user"])
+        self._value_kind = kind
+        self._value_group = group
+        self._value_service_account = service_account
+        self._value_user = user
+
+    @builtins.property
+    def kind(self) -> builtins.str:
+        '''``kind`` indicates which one of the other fields is non-empty.
+
+        Required
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.Subject#kind
+        '''
+        result = self._value_kind
+        assert result is not None, "Required property 'kind' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def group(self) -> typing.Optional[GroupSubjectV1Beta2]:
+        '''``group`` matches based on user group name.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.Subject#group
+        '''
+        result = self._value_group
+        return typing.cast(typing.Optional[GroupSubjectV1Beta2], result)
+
+    @builtins.property
+    def service_account(self) -> typing.Optional[ServiceAccountSubjectV1Beta2]:
+        '''``serviceAccount`` matches ServiceAccounts.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.Subject#serviceAccount
+        '''
+        result = self._value_service_account
+        return typing.cast(typing.Optional[ServiceAccountSubjectV1Beta2], result)
+
+    @builtins.property
+    def user(self) -> typing.Optional["UserSubjectV1Beta2"]:
+        '''``user`` matches based on username.
+
+        :schema: io.k8s.api.flowcontrol.v1beta2.Subject#user
+        '''
+        result = self._value_user
+        return typing.cast(typing.Optional["UserSubjectV1Beta2"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "kind": self._value_kind,
+        }
+        if self._value_group is not None:
+            values["group"] = self._value_group
+        if self._value_service_account is not None:
+            values["service_account"] = self._value_service_account
+        if self._value_user is not None:
+            values["user"] = self._value_user
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "SubjectV1Beta2(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__65ada18dc9b20030468e8eb483d832680b97ad6e44b4cc62b86e84cd497f848d(
+    *,
+    kind: builtins.str,
+    group: typing.Optional[typing.Union[GroupSubjectV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+    service_account: typing.Optional[typing.Union[ServiceAccountSubjectV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+    user: typing.Optional[typing.Union[UserSubjectV1Beta2, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
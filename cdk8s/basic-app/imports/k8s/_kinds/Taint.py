@@ -0,0 +1,142 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.Taint",
+    jsii_struct_bases=[],
+    name_mapping={
+        "effect": "effect",
+        "key": "key",
+        "time_added": "timeAdded",
+        "value": "value",
+    },
+)
+class Taint(_base.Struct):
+    __slots__ = (
+        "_value_effect",
+        "_value_key",
+        "_value_time_added",
+        "_value_value",
+    )
+
+    def __init__(
+        self,
+        *,
+        effect: builtins.str,
+        key: builtins.str,
+        time_added: typing.Optional[datetime.datetime] = None,
+        value: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''The node this Taint is attached to has the "effect" on any pod that does not tolerate the Taint.
+
+        :param effect: Required. The effect of the taint on pods that do not tolerate the taint. Valid effects are NoSchedule, PreferNoSchedule and NoExecute.
+        :param key: Required. The taint key to be applied to a node.
+        :param time_added: TimeAdded represents the time at which the taint was added. It is only written for NoExecute taints.
+        :param value: The taint value corresponding to the taint key.
+
+        :schema: io.k8s.api.core.v1.Taint
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c83d8efd7618c397938f355d9ce22e16abef5083f86d96444f7001334f075b74)
+            check_type(argname="argument effect", value=effect, expected_type=type_hints["effect"])
+            check_type(argname="argument key", value=key, expected_type=type_hints["key"])
+            check_type(argname="argument time_added", value=time_added, expected_type=type_hints["time_added"])
+            check_type(argname="argument value", value=value, expected_type=type_hints["value"])
+        self._value_effect = effect
+        self._value_key = key
+        self._value_time_added = time_added
+        self._value_value = value
+
+    @builtins.property
+    def effect(self) -> builtins.str:
+        '''Required.
+
+        The effect of the taint on pods that do not tolerate the taint. Valid effects are NoSchedule, PreferNoSchedule and NoExecute.
+
+        :schema: io.k8s.api.core.v1.Taint#effect
+        '''
+        result = self._value_effect
+        assert result is not None, "Required property 'effect' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def key(self) -> builtins.str:
+        '''Required.
+
+        The taint key to be applied to a node.
+
+        :schema: io.k8s.api.core.v1.Taint#key
+        '''
+        result = self._value_key
+        assert result is not None, "Required property 'key' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def time_added(self) -> typing.Optional[datetime.datetime]:
+        '''TimeAdded represents the time at which the taint was added.
+
+        It is only written for NoExecute taints.
+
+        :schema: io.k8s.api.core.v1.Taint#timeAdded
+        '''
+        result = self._value_time_added
+        return typing.cast(typing.Optional[datetime.datetime], result)
+
+    @builtins.property
+    def value(self) -> typing.Optional[builtins.str]:
+        '''The taint value corresponding to the taint key.
+
+        :schema: io.k8s.api.core.v1.Taint#value
+        '''
+        result = self._value_value
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "effect": self._value_effect,
+            "key": self._value_key,
+        }
+        if self._value_time_added is not None:
+            values["time_added"] = self._value_time_added
+        if self._value_value is not None:
+            values["value"] = self._value_value
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Taint(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c83d8efd7618c397938f355d9ce22e16abef5083f86d96444f7001334f075b74(
+    *,
+    effect: builtins.str,
+    key: builtins.str,
+    time_added: typing.Optional[datetime.datetime] = None,
+    value: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,100 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .IntOrString import IntOrString
+
+
+@jsii.data_type(
+    jsii_type="k8s.TcpSocketAction",
+    jsii_struct_bases=[],
+    name_mapping={"port": "port", "host": "host"},
+)
+class TcpSocketAction(_base.Struct):
+    __slots__ = (
+        "_value_port",
+        "_value_host",
+    )
+
+    def __init__(
+        self,
+        *,
+        port: IntOrString,
+        host: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''TCPSocketAction describes an action based on opening a socket.
+
+        :param port: Number or name of the port to access on the container. Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
+        :param host: Optional: Host name to connect to, defaults to the pod IP.
+
+        :schema: io.k8s.api.core.v1.TCPSocketAction
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__4153948139cfde3a540da2062fd40a5b8a03f099e85f3acd26bee80243897532)
+            check_type(argname="argument port", value=port, expected_type=type_hints["port"])
+            check_type(argname="argument host", value=host, expected_type=type_hints["host"])
+        self._value_port = port
+        self._value_host = host
+
+    @builtins.property
+    def port(self) -> IntOrString:
+        '''Number or name of the port to access on the container.
+
+        Number must be in the range 1 to 65535. Name must be an IANA_SVC_NAME.
+
+        :schema: io.k8s.api.core.v1.TCPSocketAction#port
+        '''
+        result = self._value_port
+        assert result is not None, "Required property 'port' is missing"
+        return typing.cast(IntOrString, result)
+
+    @builtins.property
+    def host(self) -> typing.Optional[builtins.str]:
+        '''Optional: Host name to connect to, defaults to the pod IP.
+
+        :schema: io.k8s.api.core.v1.TCPSocketAction#host
+        '''
+        result = self._value_host
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "port": self._value_port,
+        }
+        if self._value_host is not None:
+            values["host"] = self._value_host
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "TcpSocketAction(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__4153948139cfde3a540da2062fd40a5b8a03f099e85f3acd26bee80243897532(
+    *,
+    port: IntOrString,
+    host: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.TokenRequest",
+    jsii_struct_bases=[],
+    name_mapping={"audience": "audience", "expiration_seconds": "expirationSeconds"},
+)
+class TokenRequest(_base.Struct):
+    __slots__ = (
+        "_value_audience",
+        "_value_expiration_seconds",
+    )
+
+    def __init__(
+        self,
+        *,
+        audience: builtins.str,
+        expiration_seconds: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''TokenRequest contains parameters of a service account token.
+
+        :param audience: Audience is the intended audience of the token in "TokenRequestSpec". It will default to the audiences of kube apiserver.
+        :param expiration_seconds: ExpirationSeconds is the duration of validity of the token in "TokenRequestSpec". It has the same default value of "ExpirationSeconds" in "TokenRequestSpec".
+
+        :schema: io.k8s.api.storage.v1.TokenRequest
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__a2eca0bb8eadb510ffaf95db1104ca4195c2708f05a8a378b0cd66f7b398bee9)
+            check_type(argname="argument audience", value=audience, expected_type=type_hints["audience"])
+            check_type(argname="argument expiration_seconds", value=expiration_seconds, expected_type=type_hints["expiration_seconds"])
+        self._value_audience = audience
+        self._value_expiration_seconds = expiration_seconds
+
+    @builtins.property
+    def audience(self) -> builtins.str:
+        '''Audience is the intended audience of the token in "TokenRequestSpec".
+
+        It will default to the audiences of kube apiserver.
+
+        :schema: io.k8s.api.storage.v1.TokenRequest#audience
+        '''
+        result = self._value_audience
+        assert result is not None, "Required property 'audience' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def expiration_seconds(self) -> typing.Optional[jsii.Number]:
+        '''ExpirationSeconds is the duration of validity of the token in "TokenRequestSpec".
+
+        It has the same default value of "ExpirationSeconds" in "TokenRequestSpec".
+
+        :schema: io.k8s.api.storage.v1.TokenRequest#expirationSeconds
+        '''
+        result = self._value_expiration_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "audience": self._value_audience,
+        }
+        if self._value_expiration_seconds is not None:
+            values["expiration_seconds"] = self._value_expiration_seconds
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "TokenRequest(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__a2eca0bb8eadb510ffaf95db1104ca4195c2708f05a8a378b0cd66f7b398bee9(
+    *,
+    audience: builtins.str,
+    expiration_seconds: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,127 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .BoundObjectReference import BoundObjectReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.TokenRequestSpec",
+    jsii_struct_bases=[],
+    name_mapping={
+        "audiences": "audiences",
+        "bound_object_ref": "boundObjectRef",
+        "expiration_seconds": "expirationSeconds",
+    },
+)
+class TokenRequestSpec(_base.Struct):
+    __slots__ = (
+        "_value_audiences",
+        "_value_bound_object_ref",
+        "_value_expiration_seconds",
+    )
+
+    def __init__(
+        self,
+        *,
+        audiences: typing.Sequence[builtins.str],
+        bound_object_ref: typing.Optional[typing.Union[BoundObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+        expiration_seconds: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''TokenRequestSpec contains client provided parameters of a token request.
+
+        :param audiences: Audiences are the intendend audiences of the token. A recipient of a token must identify themself with an identifier in the list of audiences of the token, and otherwise should reject the token. A token issued for multiple audiences may be used to authenticate against any of the audiences listed but implies a high degree of trust between the target audiences.
+        :param bound_object_ref: BoundObjectRef is a reference to an object that the token will be bound to. The token will only be valid for as long as the bound object exists. NOTE: The API server's TokenReview endpoint will validate the BoundObjectRef, but other audiences may not. Keep ExpirationSeconds small if you want prompt revocation.
+        :param expiration_seconds: ExpirationSeconds is the requested duration of validity of the request. The token issuer may return a token with a different validity duration so a client needs to check the 'expiration' field in a response.
+
+        :schema: io.k8s.api.authentication.v1.TokenRequestSpec
+        '''
+        if isinstance(bound_object_ref, dict):
+            bound_object_ref = BoundObjectReference(**bound_object_ref)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__1c6ecf81dacd22a528a277c2eacd8c58c1bb9bead7fa63a6eb43b6ba97554708)
+            check_type(argname="argument audiences", value=audiences, expected_type=type_hints["audiences"])
+            check_type(argname="argument bound_object_ref", value=bound_object_ref, expected_type=type_hints["bound_object_ref"])
+            check_type(argname="argument expiration_seconds", value=expiration_seconds, expected_type=type_hints["expiration_seconds"])
+        self._value_audiences = audiences
+        self._value_bound_object_ref = bound_object_ref
+        self._value_expiration_seconds = expiration_seconds
+
+    @builtins.property
+    def audiences(self) -> typing.List[builtins.str]:
+        '''Audiences are the intendend audiences of the token.
+
+        A recipient of a token must identify themself with an identifier in the list of audiences of the token, and otherwise should reject the token. A token issued for multiple audiences may be used to authenticate against any of the audiences listed but implies a high degree of trust between the target audiences.
+
+        :schema: io.k8s.api.authentication.v1.TokenRequestSpec#audiences
+        '''
+        result = self._value_audiences
+        assert result is not None, "Required property 'audiences' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def bound_object_ref(self) -> typing.Optional[BoundObjectReference]:
+        '''BoundObjectRef is a reference to an object that the token will be bound to.
+
+        The token will only be valid for as long as the bound object exists. NOTE: The API server's TokenReview endpoint will validate the BoundObjectRef, but other audiences may not. Keep ExpirationSeconds small if you want prompt revocation.
+
+        :schema: io.k8s.api.authentication.v1.TokenRequestSpec#boundObjectRef
+        '''
+        result = self._value_bound_object_ref
+        return typing.cast(typing.Optional[BoundObjectReference], result)
+
+    @builtins.property
+    def expiration_seconds(self) -> typing.Optional[jsii.Number]:
+        '''ExpirationSeconds is the requested duration of validity of the request.
+
+        The token issuer may return a token with a different validity duration so a client needs to check the 'expiration' field in a response.
+
+        :schema: io.k8s.api.authentication.v1.TokenRequestSpec#expirationSeconds
+        '''
+        result = self._value_expiration_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "audiences": self._value_audiences,
+        }
+        if self._value_bound_object_ref is not None:
+            values["bound_object_ref"] = self._value_bound_object_ref
+        if self._value_expiration_seconds is not None:
+            values["expiration_seconds"] = self._value_expiration_seconds
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "TokenRequestSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__1c6ecf81dacd22a528a277c2eacd8c58c1bb9bead7fa63a6eb43b6ba97554708(
+    *,
+    audiences: typing.Sequence[builtins.str],
+    bound_object_ref: typing.Optional[typing.Union[BoundObjectReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    expiration_seconds: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,98 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.TokenReviewSpec",
+    jsii_struct_bases=[],
+    name_mapping={"audiences": "audiences", "token": "token"},
+)
+class TokenReviewSpec(_base.Struct):
+    __slots__ = (
+        "_value_audiences",
+        "_value_token",
+    )
+
+    def __init__(
+        self,
+        *,
+        audiences: typing.Optional[typing.Sequence[builtins.str]] = None,
+        token: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''TokenReviewSpec is a description of the token authentication request.
+
+        :param audiences: Audiences is a list of the identifiers that the resource server presented with the token identifies as. Audience-aware token authenticators will verify that the token was intended for at least one of the audiences in this list. If no audiences are provided, the audience will default to the audience of the Kubernetes apiserver.
+        :param token: Token is the opaque bearer token.
+
+        :schema: io.k8s.api.authentication.v1.TokenReviewSpec
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__9132ea931e42ff03246a2f8dce15a0589348550d3687a44aa8d9ba434d2757ce)
+            check_type(argname="argument audiences", value=audiences, expected_type=type_hints["audiences"])
+            check_type(argname="argument token", value=token, expected_type=type_hints["token"])
+        self._value_audiences = audiences
+        self._value_token = token
+
+    @builtins.property
+    def audiences(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''Audiences is a list of the identifiers that the resource server presented with the token identifies as.
+
+        Audience-aware token authenticators will verify that the token was intended for at least one of the audiences in this list. If no audiences are provided, the audience will default to the audience of the Kubernetes apiserver.
+
+        :schema: io.k8s.api.authentication.v1.TokenReviewSpec#audiences
+        '''
+        result = self._value_audiences
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def token(self) -> typing.Optional[builtins.str]:
+        '''Token is the opaque bearer token.
+
+        :schema: io.k8s.api.authentication.v1.TokenReviewSpec#token
+        '''
+        result = self._value_token
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_audiences is not None:
+            values["audiences"] = self._value_audiences
+        if self._value_token is not None:
+            values["token"] = self._value_token
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "TokenReviewSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__9132ea931e42ff03246a2f8dce15a0589348550d3687a44aa8d9ba434d2757ce(
+    *,
+    audiences: typing.Optional[typing.Sequence[builtins.str]] = None,
+    token: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,165 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.Toleration",
+    jsii_struct_bases=[],
+    name_mapping={
+        "effect": "effect",
+        "key": "key",
+        "operator": "operator",
+        "toleration_seconds": "tolerationSeconds",
+        "value": "value",
+    },
+)
+class Toleration(_base.Struct):
+    __slots__ = (
+        "_value_effect",
+        "_value_key",
+        "_value_operator",
+        "_value_toleration_seconds",
+        "_value_value",
+    )
+
+    def __init__(
+        self,
+        *,
+        effect: typing.Optional[builtins.str] = None,
+        key: typing.Optional[builtins.str] = None,
+        operator: typing.Optional[builtins.str] = None,
+        toleration_seconds: typing.Optional[jsii.Number] = None,
+        value: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''The pod this Toleration is attached to tolerates any taint that matches the triple <key,value,effect> using the matching operator .
+
+        :param effect: Effect indicates the taint effect to match. Empty means match all taint effects. When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
+        :param key: Key is the taint key that the toleration applies to. Empty means match all taint keys. If the key is empty, operator must be Exists; this combination means to match all values and all keys.
+        :param operator: Operator represents a key's relationship to the value. Valid operators are Exists and Equal. Defaults to Equal. Exists is equivalent to wildcard for value, so that a pod can tolerate all taints of a particular category. Default: Equal. Exists is equivalent to wildcard for value, so that a pod can tolerate all taints of a particular category.
+        :param toleration_seconds: TolerationSeconds represents the period of time the toleration (which must be of effect NoExecute, otherwise this field is ignored) tolerates the taint. By default, it is not set, which means tolerate the taint forever (do not evict). Zero and negative values will be treated as 0 (evict immediately) by the system.
+        :param value: Value is the taint value the toleration matches to. If the operator is Exists, the value should be empty, otherwise just a regular string.
+
+        :schema: io.k8s.api.core.v1.Toleration
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__fc64b64ca6a4e327627ef4fc0e43d3b9ed50e8e8d69828c2afe44f74a3b45f9f)
+            check_type(argname="argument effect", value=effect, expected_type=type_hints["effect"])
+            check_type(argname="argument key", value=key, expected_type=type_hints["key"])
+            check_type(argname="argument operator", value=operator, expected_type=type_hints["operator"])
+            check_type(argname="argument toleration_seconds", value=toleration_seconds, expected_type=type_hints["toleration_seconds"])
+            check_type(argname="argument value", value=value, expected_type=type_hints["value"])
+        self._value_effect = effect
+        self._value_key = key
+        self._value_operator = operator
+        self._value_toleration_seconds = toleration_seconds
+        self._value_value = value
+
+    @builtins.property
+    def effect(self) -> typing.Optional[builtins.str]:
+        '''Effect indicates the taint effect to match.
+
+        Empty means match all taint effects. When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute.
+
+        :schema: io.k8s.api.core.v1.Toleration#effect
+        '''
+        result = self._value_effect
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def key(self) -> typing.Optional[builtins.str]:
+        '''Key is the taint key that the toleration applies to.
+
+        Empty means match all taint keys. If the key is empty, operator must be Exists; this combination means to match all values and all keys.
+
+        :schema: io.k8s.api.core.v1.Toleration#key
+        '''
+        result = self._value_key
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def operator(self) -> typing.Optional[builtins.str]:
+        '''Operator represents a key's relationship to the value.
+
+        Valid operators are Exists and Equal. Defaults to Equal. Exists is equivalent to wildcard for value, so that a pod can tolerate all taints of a particular category.
+
+        :default: Equal. Exists is equivalent to wildcard for value, so that a pod can tolerate all taints of a particular category.
+
+        :schema: io.k8s.api.core.v1.Toleration#operator
+        '''
+        result = self._value_operator
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def toleration_seconds(self) -> typing.Optional[jsii.Number]:
+        '''TolerationSeconds represents the period of time the toleration (which must be of effect NoExecute, otherwise this field is ignored) tolerates the taint.
+
+        By default, it is not set, which means tolerate the taint forever (do not evict). Zero and negative values will be treated as 0 (evict immediately) by the system.
+
+        :schema: io.k8s.api.core.v1.Toleration#tolerationSeconds
+        '''
+        result = self._value_toleration_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def value(self) -> typing.Optional[builtins.str]:
+        '''Value is the taint value the toleration matches to.
+
+        If the operator is Exists, the value should be empty, otherwise just a regular string.
+
+        :schema: io.k8s.api.core.v1.Toleration#value
+        '''
+        result = self._value_value
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_effect is not None:
+            values["effect"] = self._value_effect
+        if self._value_key is not None:
+            values["key"] = self._value_key
+        if self._value_operator is not None:
+            values["operator"] = self._value_operator
+        if self._value_toleration_seconds is not None:
+            values["toleration_seconds"] = self._value_toleration_seconds
+        if self._value_value is not None:
+            values["value"] = self._value_value
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Toleration(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__fc64b64ca6a4e327627ef4fc0e43d3b9ed50e8e8d69828c2afe44f74a3b45f9f(
+    *,
+    effect: typing.Optional[builtins.str] = None,
+    key: typing.Optional[builtins.str] = None,
+    operator: typing.Optional[builtins.str] = None,
+    toleration_seconds: typing.Optional[jsii.Number] = None,
+    value: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,101 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.TopologySelectorLabelRequirement",
+    jsii_struct_bases=[],
+    name_mapping={"key": "key", "values": "values"},
+)
+class TopologySelectorLabelRequirement(_base.Struct):
+    __slots__ = (
+        "_value_key",
+        "_value_values",
+    )
+
+    def __init__(
+        self,
+        *,
+        key: builtins.str,
+        values: typing.Sequence[builtins.str],
+    ) -> None:
+        '''A topology selector requirement is a selector that matches given label.
+
+        This is an alpha feature and may change in the future.
+
+        :param key: The label key that the selector applies to.
+        :param values: An array of string values. One value must match the label to be selected. Each entry in Values is ORed.
+
+        :schema: io.k8s.api.core.v1.TopologySelectorLabelRequirement
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__25a9d23f38a251fc5c0330f0132bfd279ea0abef87090dfd767fb5044ec62263)
+            check_type(argname="argument key", value=key, expected_type=type_hints["key"])
+            check_type(argname="argument values", value=values, expected_type=type_hints["values"])
+        self._value_key = key
+        self._value_values = values
+
+    @builtins.property
+    def key(self) -> builtins.str:
+        '''The label key that the selector applies to.
+
+        :schema: io.k8s.api.core.v1.TopologySelectorLabelRequirement#key
+        '''
+        result = self._value_key
+        assert result is not None, "Required property 'key' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def values(self) -> typing.List[builtins.str]:
+        '''An array of string values.
+
+        One value must match the label to be selected. Each entry in Values is ORed.
+
+        :schema: io.k8s.api.core.v1.TopologySelectorLabelRequirement#values
+        '''
+        result = self._value_values
+        assert result is not None, "Required property 'values' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "key": self._value_key,
+            "values": self._value_values,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "TopologySelectorLabelRequirement(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__25a9d23f38a251fc5c0330f0132bfd279ea0abef87090dfd767fb5044ec62263(
+    *,
+    key: builtins.str,
+    values: typing.Sequence[builtins.str],
+) -> None:
+    """Type checking stubs"""
+    pass
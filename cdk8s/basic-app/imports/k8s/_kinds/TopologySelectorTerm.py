@@ -0,0 +1,84 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .TopologySelectorLabelRequirement import TopologySelectorLabelRequirement
+
+
+@jsii.data_type(
+    jsii_type="k8s.TopologySelectorTerm",
+    jsii_struct_bases=[],
+    name_mapping={"match_label_expressions": "matchLabelExpressions"},
+)
+class TopologySelectorTerm(_base.Struct):
+    __slots__ = (
+        "_value_match_label_expressions",
+    )
+
+    def __init__(
+        self,
+        *,
+        match_label_expressions: typing.Optional[typing.Sequence[typing.Union[TopologySelectorLabelRequirement, typing.Dict[builtins.str, typing.Any]]]] = None,
+    ) -> None:
+        '''A topology selector term represents the result of label queries.
+
+        A null or empty topology selector term matches no objects. The requirements of them are ANDed. It provides a subset of functionality as NodeSelectorTerm. This is an alpha feature and may change in the future.
+
+        :param match_label_expressions: A list of topology selector requirements by labels.
+
+        :schema: io.k8s.api.core.v1.TopologySelectorTerm
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__f598eb2ca65a39d9b8fc7d3e58cfab9e1b3f88e885b8823a74892071e3a7dfb5)
+            check_type(argname="argument match_label_expressions", value=match_label_expressions, expected_type=type_hints["match_label_expressions"])
+        self._value_match_label_expressions = match_label_expressions
+
+    @builtins.property
+    def match_label_expressions(
+        self,
+    ) -> typing.Optional[typing.List[TopologySelectorLabelRequirement]]:
+        '''A list of topology selector requirements by labels.
+
+        :schema: io.k8s.api.core.v1.TopologySelectorTerm#matchLabelExpressions
+        '''
+        result = self._value_match_label_expressions
+        return typing.cast(typing.Optional[typing.List[TopologySelectorLabelRequirement]], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_match_label_expressions is not None:
+            values["match_label_expressions"] = self._value_match_label_expressions
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "TopologySelectorTerm(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__f598eb2ca65a39d9b8fc7d3e58cfab9e1b3f88e885b8823a74892071e3a7dfb5(
+    *,
+    match_label_expressions: typing.Optional[typing.Sequence[typing.Union[TopologySelectorLabelRequirement, typing.Dict[builtins.str, typing.Any]]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
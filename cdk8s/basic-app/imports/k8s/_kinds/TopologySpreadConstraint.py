@@ -0,0 +1,238 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.TopologySpreadConstraint",
+    jsii_struct_bases=[],
+    name_mapping={
+        "max_skew": "maxSkew",
+        "topology_key": "topologyKey",
+        "when_unsatisfiable": "whenUnsatisfiable",
+        "label_selector": "labelSelector",
+        "match_label_keys": "matchLabelKeys",
+        "min_domains": "minDomains",
+        "node_affinity_policy": "nodeAffinityPolicy",
+        "node_taints_policy": "nodeTaintsPolicy",
+    },
+)
+class TopologySpreadConstraint(_base.Struct):
+    __slots__ = (
+        "_value_max_skew",
+        "_value_topology_key",
+        "_value_when_unsatisfiable",
+        "_value_label_selector",
+        "_value_match_label_keys",
+        "_value_min_domains",
+        "_value_node_affinity_policy",
+        "_value_node_taints_policy",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_skew: jsii.Number,
+        topology_key: builtins.str,
+        when_unsatisfiable: builtins.str,
+        label_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+        match_label_keys: typing.Optional[typing.Sequence[builtins.str]] = None,
+        min_domains: typing.Optional[jsii.Number] = None,
+        node_affinity_policy: typing.Optional[builtins.str] = None,
+        node_taints_policy: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''TopologySpreadConstraint specifies how to spread matching pods among the given topology.
+
+        :param max_skew: MaxSkew describes the degree to which pods may be unevenly distributed. When ``whenUnsatisfiable=DoNotSchedule``, it is the maximum permitted difference between the number of matching pods in the target topology and the global minimum. The global minimum is the minimum number of matching pods in an eligible domain or zero if the number of eligible domains is less than MinDomains. For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same labelSelector spread as 2/2/1: In this case, the global minimum is 1. | zone1 | zone2 | zone3 | | P P | P P | P | - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2; scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2) violate MaxSkew(1). - if MaxSkew is 2, incoming pod can be scheduled onto any zone. When ``whenUnsatisfiable=ScheduleAnyway``, it is used to give higher precedence to topologies that satisfy it. It's a required field. Default value is 1 and 0 is not allowed.
+        :param topology_key: TopologyKey is the key of node labels. Nodes that have a label with this key and identical values are considered to be in the same topology. We consider each <key, value> as a "bucket", and try to put balanced number of pods into each bucket. We define a domain as a particular instance of a topology. Also, we define an eligible domain as a domain whose nodes meet the requirements of nodeAffinityPolicy and nodeTaintsPolicy. e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology. And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology. It's a required field.
+        :param when_unsatisfiable: WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy the spread constraint. - DoNotSchedule (default) tells the scheduler not to schedule it. - ScheduleAnyway tells the scheduler to schedule the pod in any location, but giving higher precedence to topologies that would help reduce the skew. A constraint is considered "Unsatisfiable" for an incoming pod if and only if every possible node assignment for that pod would violate "MaxSkew" on some topology. For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same labelSelector spread as 3/1/1: | zone1 | zone2 | zone3 | | P P P | P | P | If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler won't make it *more* imbalanced. It's a required field.
+        :param label_selector: LabelSelector is used to find matching pods. Pods that match this label selector are counted to determine the number of pods in their corresponding topology domain.
+        :param match_label_keys: MatchLabelKeys is a set of pod label keys to select the pods over which spreading will be calculated. The keys are used to lookup values from the incoming pod labels, those key-value labels are ANDed with labelSelector to select the group of existing pods over which spreading will be calculated for the incoming pod. Keys that don't exist in the incoming pod labels will be ignored. A null or empty list means only match against labelSelector.
+        :param min_domains: MinDomains indicates a minimum number of eligible domains. When the number of eligible domains with matching topology keys is less than minDomains, Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed. And when the number of eligible domains with matching topology keys equals or greater than minDomains, this value has no effect on scheduling. As a result, when the number of eligible domains is less than minDomains, scheduler won't schedule more than maxSkew Pods to those domains. If value is nil, the constraint behaves as if MinDomains is equal to 1. Valid values are integers greater than 0. When value is not nil, WhenUnsatisfiable must be DoNotSchedule. For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same labelSelector spread as 2/2/2: | zone1 | zone2 | zone3 | | P P | P P | P P | The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0. In this situation, new pod with the same labelSelector cannot be scheduled, because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones, it will violate MaxSkew. This is a beta field and requires the MinDomainsInPodTopologySpread feature gate to be enabled (enabled by default).
+        :param node_affinity_policy: NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector when calculating pod topology spread skew. Options are: - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations. - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations. If this value is nil, the behavior is equivalent to the Honor policy. This is a alpha-level feature enabled by the NodeInclusionPolicyInPodTopologySpread feature flag.
+        :param node_taints_policy: NodeTaintsPolicy indicates how we will treat node taints when calculating pod topology spread skew. Options are: - Honor: nodes without taints, along with tainted nodes for which the incoming pod has a toleration, are included. - Ignore: node taints are ignored. All nodes are included. If this value is nil, the behavior is equivalent to the Ignore policy. This is a alpha-level feature enabled by the NodeInclusionPolicyInPodTopologySpread feature flag.
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint
+        '''
+        if isinstance(label_selector, dict):
+            label_selector = LabelSelector(**label_selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__d563e5e62c67208bafb547e16adedf3e17b27b1cb3c8cd46509e6398021dcef5)
+            check_type(argname="argument max_skew", value=max_skew, expected_type=type_hints["max_skew"])
+            check_type(argname="argument topology_key", value=topology_key, expected_type=type_hints["topology_key"])
+            check_type(argname="argument when_unsatisfiable", value=when_unsatisfiable, expected_type=type_hints["when_unsatisfiable"])
+            check_type(argname="argument label_selector", value=label_selector, expected_type=type_hints["label_selector"])
+            check_type(argname="argument match_label_keys", value=match_label_keys, expected_type=type_hints["match_label_keys"])
+            check_type(argname="argument min_domains", value=min_domains, expected_type=type_hints["min_domains"])
+            check_type(argname="argument node_affinity_policy", value=node_affinity_policy, expected_type=type_hints["node_affinity_policy"])
+            check_type(argname="argument node_taints_policy", value=node_taints_policy, expected_type=type_hints["node_taints_policy"])
+        self._value_max_skew = max_skew
+        self._value_topology_key = topology_key
+        self._value_when_unsatisfiable = when_unsatisfiable
+        self._value_label_selector = label_selector
+        self._value_match_label_keys = match_label_keys
+        self._value_min_domains = min_domains
+        self._value_node_affinity_policy = node_affinity_policy
+        self._value_node_taints_policy = node_taints_policy
+
+    @builtins.property
+    def max_skew(self) -> jsii.Number:
+        '''MaxSkew describes the degree to which pods may be unevenly distributed.
+
+        When ``whenUnsatisfiable=DoNotSchedule``, it is the maximum permitted difference between the number of matching pods in the target topology and the global minimum. The global minimum is the minimum number of matching pods in an eligible domain or zero if the number of eligible domains is less than MinDomains. For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same labelSelector spread as 2/2/1: In this case, the global minimum is 1. | zone1 | zone2 | zone3 | |  P P  |  P P  |   P   | - if MaxSkew is 1, incoming pod can only be scheduled to zone3 to become 2/2/2; scheduling it onto zone1(zone2) would make the ActualSkew(3-1) on zone1(zone2) violate MaxSkew(1). - if MaxSkew is 2, incoming pod can be scheduled onto any zone. When ``whenUnsatisfiable=ScheduleAnyway``, it is used to give higher precedence to topologies that satisfy it. It's a required field. Default value is 1 and 0 is not allowed.
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint#maxSkew
+        '''
+        result = self._value_max_skew
+        assert result is not None, "Required property 'max_skew' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def topology_key(self) -> builtins.str:
+        '''TopologyKey is the key of node labels.
+
+        Nodes that have a label with this key and identical values are considered to be in the same topology. We consider each <key, value> as a "bucket", and try to put balanced number of pods into each bucket. We define a domain as a particular instance of a topology. Also, we define an eligible domain as a domain whose nodes meet the requirements of nodeAffinityPolicy and nodeTaintsPolicy. e.g. If TopologyKey is "kubernetes.io/hostname", each Node is a domain of that topology. And, if TopologyKey is "topology.kubernetes.io/zone", each zone is a domain of that topology. It's a required field.
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint#topologyKey
+        '''
+        result = self._value_topology_key
+        assert result is not None, "Required property 'topology_key' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def when_unsatisfiable(self) -> builtins.str:
+        '''WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy the spread constraint.
+
+        - DoNotSchedule (default) tells the scheduler not to schedule it. - ScheduleAnyway tells the scheduler to schedule the pod in any location,
+          but giving higher precedence to topologies that would help reduce the
+          skew.
+          A constraint is considered "Unsatisfiable" for an incoming pod if and only if every possible node assignment for that pod would violate "MaxSkew" on some topology. For example, in a 3-zone cluster, MaxSkew is set to 1, and pods with the same labelSelector spread as 3/1/1: | zone1 | zone2 | zone3 | | P P P |   P   |   P   | If WhenUnsatisfiable is set to DoNotSchedule, incoming pod can only be scheduled to zone2(zone3) to become 3/2/1(3/1/2) as ActualSkew(2-1) on zone2(zone3) satisfies MaxSkew(1). In other words, the cluster can still be imbalanced, but scheduler won't make it *more* imbalanced. It's a required field.
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint#whenUnsatisfiable
+        '''
+        result = self._value_when_unsatisfiable
+        assert result is not None, "Required property 'when_unsatisfiable' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def label_selector(self) -> typing.Optional[LabelSelector]:
+        '''LabelSelector is used to find matching pods.
+
+        Pods that match this label selector are counted to determine the number of pods in their corresponding topology domain.
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint#labelSelector
+        '''
+        result = self._value_label_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def match_label_keys(self) -> typing.Optional[typing.List[builtins.str]]:
+        '''MatchLabelKeys is a set of pod label keys to select the pods over which spreading will be calculated.
+
+        The keys are used to lookup values from the incoming pod labels, those key-value labels are ANDed with labelSelector to select the group of existing pods over which spreading will be calculated for the incoming pod. Keys that don't exist in the incoming pod labels will be ignored. A null or empty list means only match against labelSelector.
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint#matchLabelKeys
+        '''
+        result = self._value_match_label_keys
+        return typing.cast(typing.Optional[typing.List[builtins.str]], result)
+
+    @builtins.property
+    def min_domains(self) -> typing.Optional[jsii.Number]:
+        '''MinDomains indicates a minimum number of eligible domains.
+
+        When the number of eligible domains with matching topology keys is less than minDomains, Pod Topology Spread treats "global minimum" as 0, and then the calculation of Skew is performed. And when the number of eligible domains with matching topology keys equals or greater than minDomains, this value has no effect on scheduling. As a result, when the number of eligible domains is less than minDomains, scheduler won't schedule more than maxSkew Pods to those domains. If value is nil, the constraint behaves as if MinDomains is equal to 1. Valid values are integers greater than 0. When value is not nil, WhenUnsatisfiable must be DoNotSchedule.
+
+        For example, in a 3-zone cluster, MaxSkew is set to 2, MinDomains is set to 5 and pods with the same labelSelector spread as 2/2/2: | zone1 | zone2 | zone3 | |  P P  |  P P  |  P P  | The number of domains is less than 5(MinDomains), so "global minimum" is treated as 0. In this situation, new pod with the same labelSelector cannot be scheduled, because computed skew will be 3(3 - 0) if new Pod is scheduled to any of the three zones, it will violate MaxSkew.
+
+        This is a beta field and requires the MinDomainsInPodTopologySpread feature gate to be enabled (enabled by default).
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint#minDomains
+        '''
+        result = self._value_min_domains
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def node_affinity_policy(self) -> typing.Optional[builtins.str]:
+        '''NodeAffinityPolicy indicates how we will treat Pod's nodeAffinity/nodeSelector when calculating pod topology spread skew.
+
+        Options are: - Honor: only nodes matching nodeAffinity/nodeSelector are included in the calculations. - Ignore: nodeAffinity/nodeSelector are ignored. All nodes are included in the calculations.
+
+        If this value is nil, the behavior is equivalent to the Honor policy. This is a alpha-level feature enabled by the NodeInclusionPolicyInPodTopologySpread feature flag.
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint#nodeAffinityPolicy
+        '''
+        result = self._value_node_affinity_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def node_taints_policy(self) -> typing.Optional[builtins.str]:
+        '''NodeTaintsPolicy indicates how we will treat node taints when calculating pod topology spread skew.
+
+        Options are: - Honor: nodes without taints, along with tainted nodes for which the incoming pod has a toleration, are included. - Ignore: node taints are ignored. All nodes are included.
+
+        If this value is nil, the behavior is equivalent to the Ignore policy. This is a alpha-level feature enabled by the NodeInclusionPolicyInPodTopologySpread feature flag.
+
+        :schema: io.k8s.api.core.v1.TopologySpreadConstraint#nodeTaintsPolicy
+        '''
+        result = self._value_node_taints_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "max_skew": self._value_max_skew,
+            "topology_key": self._value_topology_key,
+            "when_unsatisfiable": self._value_when_unsatisfiable,
+        }
+        if self._value_label_selector is not None:
+            values["label_selector"] = self._value_label_selector
+        if self._value_match_label_keys is not None:
+            values["match_label_keys"] = self._value_match_label_keys
+        if self._value_min_domains is not None:
+            values["min_domains"] = self._value_min_domains
+        if self._value_node_affinity_policy is not None:
+            values["node_affinity_policy"] = self._value_node_affinity_policy
+        if self._value_node_taints_policy is not None:
+            values["node_taints_policy"] = self._value_node_taints_policy
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "TopologySpreadConstraint(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__d563e5e62c67208bafb547e16adedf3e17b27b1cb3c8cd46509e6398021dcef5(
+    *,
+    max_skew: jsii.Number,
+    topology_key: builtins.str,
+    when_unsatisfiable: builtins.str,
+    label_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    match_label_keys: typing.Optional[typing.Sequence[builtins.str]] = None,
+    min_domains: typing.Optional[jsii.Number] = None,
+    node_affinity_policy: typing.Optional[builtins.str] = None,
+    node_taints_policy: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,316 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .LabelSelector import LabelSelector
+from .RuleWithOperations import RuleWithOperations
+from .WebhookClientConfig import WebhookClientConfig
+
+
+@jsii.data_type(
+    jsii_type="k8s.ValidatingWebhook",
+    jsii_struct_bases=[],
+    name_mapping={
+        "admission_review_versions": "admissionReviewVersions",
+        "client_config": "clientConfig",
+        "name": "name",
+        "side_effects": "sideEffects",
+        "failure_policy": "failurePolicy",
+        "match_policy": "matchPolicy",
+        "namespace_selector": "namespaceSelector",
+        "object_selector": "objectSelector",
+        "rules": "rules",
+        "timeout_seconds": "timeoutSeconds",
+    },
+)
+class ValidatingWebhook(_base.Struct):
+    __slots__ = (
+        "_value_admission_review_versions",
+        "_value_client_config",
+        "_value_name",
+        "_value_side_effects",
+        "_value_failure_policy",
+        "_value_match_policy",
+        "_value_namespace_selector",
+        "_value_object_selector",
+        "_value_rules",
+        "_value_timeout_seconds",
+    )
+
+    def __init__(
+        self,
+        *,
+        admission_review_versions: typing.Sequence[builtins.str],
+        client_config: typing.Union["WebhookClientConfig", typing.Dict[builtins.str, typing.Any]],
+        name: builtins.str,
+        side_effects: builtins.str,
+        failure_policy: typing.Optional[builtins.str] = None,
+        match_policy: typing.Optional[builtins.str] = None,
+        namespace_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+        object_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+        rules: typing.Optional[typing.Sequence[typing.Union[RuleWithOperations, typing.Dict[builtins.str, typing.Any]]]] = None,
+        timeout_seconds: typing.Optional[jsii.Number] = None,
+    ) -> None:
+        '''ValidatingWebhook describes an admission webhook and the resources and operations it applies to.
+
+        :param admission_review_versions: AdmissionReviewVersions is an ordered list of preferred ``AdmissionReview`` versions the Webhook expects. API server will try to use first version in the list which it supports. If none of the versions specified in this list supported by API server, validation will fail for this object. If a persisted webhook configuration specifies allowed versions and does not include any versions known to the API Server, calls to the webhook will fail and be subject to the failure policy.
+        :param client_config: ClientConfig defines how to communicate with the hook. Required
+        :param name: The name of the admission webhook. Name should be fully qualified, e.g., imagepolicy.kubernetes.io, where "imagepolicy" is the name of the webhook, and kubernetes.io is the name of the organization. Required.
+        :param side_effects: SideEffects states whether this webhook has side effects. Acceptable values are: None, NoneOnDryRun (webhooks created via v1beta1 may also specify Some or Unknown). Webhooks with side effects MUST implement a reconciliation system, since a request may be rejected by a future step in the admission chain and the side effects therefore need to be undone. Requests with the dryRun attribute will be auto-rejected if they match a webhook with sideEffects == Unknown or Some.
+        :param failure_policy: FailurePolicy defines how unrecognized errors from the admission endpoint are handled - allowed values are Ignore or Fail. Defaults to Fail. Default: Fail.
+        :param match_policy: matchPolicy defines how the "rules" list is used to match incoming requests. Allowed values are "Exact" or "Equivalent". - Exact: match a request only if it exactly matches a specified rule. For example, if deployments can be modified via apps/v1, apps/v1beta1, and extensions/v1beta1, but "rules" only included ``apiGroups:["apps"], apiVersions:["v1"], resources: ["deployments"]``, a request to apps/v1beta1 or extensions/v1beta1 would not be sent to the webhook. - Equivalent: match a request if modifies a resource listed in rules, even via another API group or version. For example, if deployments can be modified via apps/v1, apps/v1beta1, and extensions/v1beta1, and "rules" only included ``apiGroups:["apps"], apiVersions:["v1"], resources: ["deployments"]``, a request to apps/v1beta1 or extensions/v1beta1 would be converted to apps/v1 and sent to the webhook. Defaults to "Equivalent" Default: Equivalent"
+        :param namespace_selector: NamespaceSelector decides whether to run the webhook on an object based on whether the namespace for that object matches the selector. If the object itself is a namespace, the matching is performed on object.metadata.labels. If the object is another cluster scoped resource, it never skips the webhook. For example, to run the webhook on any objects whose namespace is not associated with "runlevel" of "0" or "1"; you will set the selector as follows: "namespaceSelector": { "matchExpressions": [ { "key": "runlevel", "operator": "NotIn", "values": [ "0", "1" ] } ] } If instead you want to only run the webhook on any objects whose namespace is associated with the "environment" of "prod" or "staging"; you will set the selector as follows: "namespaceSelector": { "matchExpressions": [ { "key": "environment", "operator": "In", "values": [ "prod", "staging" ] } ] } See https://kubernetes.io/docs/concepts/overview/working-with-objects/labels for more examples of label selectors. Default to the empty LabelSelector, which matches everything. Default: the empty LabelSelector, which matches everything.
+        :param object_selector: ObjectSelector decides whether to run the webhook based on if the object has matching labels. objectSelector is evaluated against both the oldObject and newObject that would be sent to the webhook, and is considered to match if either object matches the selector. A null object (oldObject in the case of create, or newObject in the case of delete) or an object that cannot have labels (like a DeploymentRollback or a PodProxyOptions object) is not considered to match. Use the object selector only if the webhook is opt-in, because end users may skip the admission webhook by setting the labels. Default to the empty LabelSelector, which matches everything. Default: the empty LabelSelector, which matches everything.
+        :param rules: Rules describes what operations on what resources/subresources the webhook cares about. The webhook cares about an operation if it matches *any* Rule. However, in order to prevent ValidatingAdmissionWebhooks and MutatingAdmissionWebhooks from putting the cluster in a state which cannot be recovered from without completely disabling the plugin, ValidatingAdmissionWebhooks and MutatingAdmissionWebhooks are never called on admission requests for ValidatingWebhookConfiguration and MutatingWebhookConfiguration objects.
+        :param timeout_seconds: TimeoutSeconds specifies the timeout for this webhook. After the timeout passes, the webhook call will be ignored or the API call will fail based on the failure policy. The timeout value must be between 1 and 30 seconds. Default to 10 seconds. Default: 10 seconds.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook
+        '''
+        if isinstance(client_config, dict):
+            client_config = WebhookClientConfig(**client_config)
+        if isinstance(namespace_selector, dict):
+            namespace_selector = LabelSelector(**namespace_selector)
+        if isinstance(object_selector, dict):
+            object_selector = LabelSelector(**object_selector)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__ac0bdffd3ae40593dcc946344a4b810ff63dcf95c9d059bc98c0876523b7dbc9)
+            check_type(argname="argument admission_review_versions", value=admission_review_versions, expected_type=type_hints["admission_review_versions"])
+            check_type(argname="argument client_config", value=client_config, expected_type=type_hints["client_config"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument side_effects", value=side_effects, expected_type=type_hints["side_effects"])
+            check_type(argname="argument failure_policy", value=failure_policy, expected_type=type_hints["failure_policy"])
+            check_type(argname="argument match_policy", value=match_policy, expected_type=type_hints["match_policy"])
+            check_type(argname="argument namespace_selector", value=namespace_selector, expected_type=type_hints["namespace_selector"])
+            check_type(argname="argument object_selector", value=object_selector, expected_type=type_hints["object_selector"])
+            check_type(argname="argument rules", value=rules, expected_type=type_hints["rules"])
+            check_type(argname="argument timeout_seconds", value=timeout_seconds, expected_type=type_hints["timeout_seconds"])
+        self._value_admission_review_versions = admission_review_versions
+        self._value_client_config = client_config
+        self._value_name = name
+        self._value_side_effects = side_effects
+        self._value_failure_policy = failure_policy
+        self._value_match_policy = match_policy
+        self._value_namespace_selector = namespace_selector
+        self._value_object_selector = object_selector
+        self._value_rules = rules
+        self._value_timeout_seconds = timeout_seconds
+
+    @builtins.property
+    def admission_review_versions(self) -> typing.List[builtins.str]:
+        '''AdmissionReviewVersions is an ordered list of preferred ``AdmissionReview`` versions the Webhook expects.
+
+        API server will try to use first version in the list which it supports. If none of the versions specified in this list supported by API server, validation will fail for this object. If a persisted webhook configuration specifies allowed versions and does not include any versions known to the API Server, calls to the webhook will fail and be subject to the failure policy.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#admissionReviewVersions
+        '''
+        result = self._value_admission_review_versions
+        assert result is not None, "Required property 'admission_review_versions' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def client_config(self) -> "WebhookClientConfig":
+        '''ClientConfig defines how to communicate with the hook.
+
+        Required
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#clientConfig
+        '''
+        result = self._value_client_config
+        assert result is not None, "Required property 'client_config' is missing"
+        return typing.cast("WebhookClientConfig", result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''The name of the admission webhook.
+
+        Name should be fully qualified, e.g., imagepolicy.kubernetes.io, where "imagepolicy" is the name of the webhook, and kubernetes.io is the name of the organization. Required.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def side_effects(self) -> builtins.str:
+        '''SideEffects states whether this webhook has side effects.
+
+        Acceptable values are: None, NoneOnDryRun (webhooks created via v1beta1 may also specify Some or Unknown). Webhooks with side effects MUST implement a reconciliation system, since a request may be rejected by a future step in the admission chain and the side effects therefore need to be undone. Requests with the dryRun attribute will be auto-rejected if they match a webhook with sideEffects == Unknown or Some.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#sideEffects
+        '''
+        result = self._value_side_effects
+        assert result is not None, "Required property 'side_effects' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def failure_policy(self) -> typing.Optional[builtins.str]:
+        '''FailurePolicy defines how unrecognized errors from the admission endpoint are handled - allowed values are Ignore or Fail.
+
+        Defaults to Fail.
+
+        :default: Fail.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#failurePolicy
+        '''
+        result = self._value_failure_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def match_policy(self) -> typing.Optional[builtins.str]:
+        '''matchPolicy defines how the "rules" list is used to match incoming requests. Allowed values are "Exact" or "Equivalent".
+
+        - Exact: match a request only if it exactly matches a specified rule. For example, if deployments can be modified via apps/v1, apps/v1beta1, and extensions/v1beta1, but "rules" only included ``apiGroups:["apps"], apiVersions:["v1"], resources: ["deployments"]``, a request to apps/v1beta1 or extensions/v1beta1 would not be sent to the webhook.
+        - Equivalent: match a request if modifies a resource listed in rules, even via another API group or version. For example, if deployments can be modified via apps/v1, apps/v1beta1, and extensions/v1beta1, and "rules" only included ``apiGroups:["apps"], apiVersions:["v1"], resources: ["deployments"]``, a request to apps/v1beta1 or extensions/v1beta1 would be converted to apps/v1 and sent to the webhook.
+
+        Defaults to "Equivalent"
+
+        :default: Equivalent"
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#matchPolicy
+        '''
+        result = self._value_match_policy
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def namespace_selector(self) -> typing.Optional[LabelSelector]:
+        '''NamespaceSelector decides whether to run the webhook on an object based on whether the namespace for that object matches the selector.
+
+        If the object itself is a namespace, the matching is performed on object.metadata.labels. If the object is another cluster scoped resource, it never skips the webhook.
+
+        For example, to run the webhook on any objects whose namespace is not associated with "runlevel" of "0" or "1";  you will set the selector as follows: "namespaceSelector": {
+        "matchExpressions": [
+        {
+        "key": "runlevel",
+        "operator": "NotIn",
+        "values": [
+        "0",
+        "1"
+        ]
+        }
+        ]
+        }
+
+        If instead you want to only run the webhook on any objects whose namespace is associated with the "environment" of "prod" or "staging"; you will set the selector as follows: "namespaceSelector": {
+        "matchExpressions": [
+        {
+        "key": "environment",
+        "operator": "In",
+        "values": [
+        "prod",
+        "staging"
+        ]
+        }
+        ]
+        }
+
+        See https://kubernetes.io/docs/concepts/overview/working-with-objects/labels for more examples of label selectors.
+
+        Default to the empty LabelSelector, which matches everything.
+
+        :default: the empty LabelSelector, which matches everything.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#namespaceSelector
+        '''
+        result = self._value_namespace_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def object_selector(self) -> typing.Optional[LabelSelector]:
+        '''ObjectSelector decides whether to run the webhook based on if the object has matching labels.
+
+        objectSelector is evaluated against both the oldObject and newObject that would be sent to the webhook, and is considered to match if either object matches the selector. A null object (oldObject in the case of create, or newObject in the case of delete) or an object that cannot have labels (like a DeploymentRollback or a PodProxyOptions object) is not considered to match. Use the object selector only if the webhook is opt-in, because end users may skip the admission webhook by setting the labels. Default to the empty LabelSelector, which matches everything.
+
+        :default: the empty LabelSelector, which matches everything.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#objectSelector
+        '''
+        result = self._value_object_selector
+        return typing.cast(typing.Optional[LabelSelector], result)
+
+    @builtins.property
+    def rules(self) -> typing.Optional[typing.List[RuleWithOperations]]:
+        '''Rules describes what operations on what resources/subresources the webhook cares about.
+
+        The webhook cares about an operation if it matches *any* Rule. However, in order to prevent ValidatingAdmissionWebhooks and MutatingAdmissionWebhooks from putting the cluster in a state which cannot be recovered from without completely disabling the plugin, ValidatingAdmissionWebhooks and MutatingAdmissionWebhooks are never called on admission requests for ValidatingWebhookConfiguration and MutatingWebhookConfiguration objects.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#rules
+        '''
+        result = self._value_rules
+        return typing.cast(typing.Optional[typing.List[RuleWithOperations]], result)
+
+    @builtins.property
+    def timeout_seconds(self) -> typing.Optional[jsii.Number]:
+        '''TimeoutSeconds specifies the timeout for this webhook.
+
+        After the timeout passes, the webhook call will be ignored or the API call will fail based on the failure policy. The timeout value must be between 1 and 30 seconds. Default to 10 seconds.
+
+        :default: 10 seconds.
+
+        :schema: io.k8s.api.admissionregistration.v1.ValidatingWebhook#timeoutSeconds
+        '''
+        result = self._value_timeout_seconds
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "admission_review_versions": self._value_admission_review_versions,
+            "client_config": self._value_client_config,
+            "name": self._value_name,
+            "side_effects": self._value_side_effects,
+        }
+        if self._value_failure_policy is not None:
+            values["failure_policy"] = self._value_failure_policy
+        if self._value_match_policy is not None:
+            values["match_policy"] = self._value_match_policy
+        if self._value_namespace_selector is not None:
+            values["namespace_selector"] = self._value_namespace_selector
+        if self._value_object_selector is not None:
+            values["object_selector"] = self._value_object_selector
+        if self._value_rules is not None:
+            values["rules"] = self._value_rules
+        if self._value_timeout_seconds is not None:
+            values["timeout_seconds"] = self._value_timeout_seconds
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "ValidatingWebhook(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__ac0bdffd3ae40593dcc946344a4b810ff63dcf95c9d059bc98c0876523b7dbc9(
+    *,
+    admission_review_versions: typing.Sequence[builtins.str],
+    client_config: typing.Union[WebhookClientConfig, typing.Dict[builtins.str, typing.Any]],
+    name: builtins.str,
+    side_effects: builtins.str,
+    failure_policy: typing.Optional[builtins.str] = None,
+    match_policy: typing.Optional[builtins.str] = None,
+    namespace_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    object_selector: typing.Optional[typing.Union[LabelSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    rules: typing.Optional[typing.Sequence[typing.Union[RuleWithOperations, typing.Dict[builtins.str, typing.Any]]]] = None,
+    timeout_seconds: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,738 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .AwsElasticBlockStoreVolumeSource import AwsElasticBlockStoreVolumeSource
+from .AzureDiskVolumeSource import AzureDiskVolumeSource
+from .AzureFileVolumeSource import AzureFileVolumeSource
+from .CephFsVolumeSource import CephFsVolumeSource
+from .CinderVolumeSource import CinderVolumeSource
+from .ConfigMapVolumeSource import ConfigMapVolumeSource
+from .CsiVolumeSource import CsiVolumeSource
+from .DownwardApiVolumeSource import DownwardApiVolumeSource
+from .EmptyDirVolumeSource import EmptyDirVolumeSource
+from .EphemeralVolumeSource import EphemeralVolumeSource
+from .FcVolumeSource import FcVolumeSource
+from .FlexVolumeSource import FlexVolumeSource
+from .FlockerVolumeSource import FlockerVolumeSource
+from .GcePersistentDiskVolumeSource import GcePersistentDiskVolumeSource
+from .GitRepoVolumeSource import GitRepoVolumeSource
+from .GlusterfsVolumeSource import GlusterfsVolumeSource
+from .HostPathVolumeSource import HostPathVolumeSource
+from .IscsiVolumeSource import IscsiVolumeSource
+from .NfsVolumeSource import NfsVolumeSource
+from .PersistentVolumeClaimVolumeSource import PersistentVolumeClaimVolumeSource
+from .PhotonPersistentDiskVolumeSource import PhotonPersistentDiskVolumeSource
+from .PortworxVolumeSource import PortworxVolumeSource
+from .ProjectedVolumeSource import ProjectedVolumeSource
+from .QuobyteVolumeSource import QuobyteVolumeSource
+from .RbdVolumeSource import RbdVolumeSource
+from .ScaleIoVolumeSource import ScaleIoVolumeSource
+from .SecretVolumeSource import SecretVolumeSource
+from .StorageOsVolumeSource import StorageOsVolumeSource
+from .VsphereVirtualDiskVolumeSource import VsphereVirtualDiskVolumeSource
+
+
+@jsii.data_type(
+    jsii_type="k8s.Volume",
+    jsii_struct_bases=[],
+    name_mapping={
+        "name": "name",
+        "aws_elastic_block_store": "awsElasticBlockStore",
+        "azure_disk": "azureDisk",
+        "azure_file": "azureFile",
+        "cephfs": "cephfs",
+        "cinder": "cinder",
+        "config_map": "configMap",
+        "csi": "csi",
+        "downward_api": "downwardApi",
+        "empty_dir": "emptyDir",
+        "ephemeral": "ephemeral",
+        "fc": "fc",
+        "flex_volume": "flexVolume",
+        "flocker": "flocker",
+        "gce_persistent_disk": "gcePersistentDisk",
+        "git_repo": "gitRepo",
+        "glusterfs": "glusterfs",
+        "host_path": "hostPath",
+        "iscsi": "iscsi",
+        "nfs": "nfs",
+        "persistent_volume_claim": "persistentVolumeClaim",
+        "photon_persistent_disk": "photonPersistentDisk",
+        "portworx_volume": "portworxVolume",
+        "projected": "projected",
+        "quobyte": "quobyte",
+        "rbd": "rbd",
+        "scale_io": "scaleIo",
+        "secret": "secret",
+        "storageos": "storageos",
+        "vsphere_volume": "vsphereVolume",
+    },
+)
+class Volume(_base.Struct):
+    __slots__ = (
+        "_value_name",
+        "_value_aws_elastic_block_store",
+        "_value_azure_disk",
+        "_value_azure_file",
+        "_value_cephfs",
+        "_value_cinder",
+        "_value_config_map",
+        "_value_csi",
+        "_value_downward_api",
+        "_value_empty_dir",
+        "_value_ephemeral",
+        "_value_fc",
+        "_value_flex_volume",
+        "_value_flocker",
+        "_value_gce_persistent_disk",
+        "_value_git_repo",
+        "_value_glusterfs",
+        "_value_host_path",
+        "_value_iscsi",
+        "_value_nfs",
+        "_value_persistent_volume_claim",
+        "_value_photon_persistent_disk",
+        "_value_portworx_volume",
+        "_value_projected",
+        "_value_quobyte",
+        "_value_rbd",
+        "_value_scale_io",
+        "_value_secret",
+        "_value_storageos",
+        "_value_vsphere_volume",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: builtins.str,
+        aws_elastic_block_store: typing.Optional[typing.Union[AwsElasticBlockStoreVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        azure_disk: typing.Optional[typing.Union[AzureDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        azure_file: typing.Optional[typing.Union[AzureFileVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        cephfs: typing.Optional[typing.Union[CephFsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        cinder: typing.Optional[typing.Union[CinderVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        config_map: typing.Optional[typing.Union[ConfigMapVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        csi: typing.Optional[typing.Union[CsiVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        downward_api: typing.Optional[typing.Union[DownwardApiVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        empty_dir: typing.Optional[typing.Union[EmptyDirVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        ephemeral: typing.Optional[typing.Union[EphemeralVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        fc: typing.Optional[typing.Union[FcVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        flex_volume: typing.Optional[typing.Union[FlexVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        flocker: typing.Optional[typing.Union[FlockerVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        gce_persistent_disk: typing.Optional[typing.Union[GcePersistentDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        git_repo: typing.Optional[typing.Union[GitRepoVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        glusterfs: typing.Optional[typing.Union[GlusterfsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        host_path: typing.Optional[typing.Union[HostPathVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        iscsi: typing.Optional[typing.Union[IscsiVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        nfs: typing.Optional[typing.Union[NfsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        persistent_volume_claim: typing.Optional[typing.Union[PersistentVolumeClaimVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        photon_persistent_disk: typing.Optional[typing.Union[PhotonPersistentDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        portworx_volume: typing.Optional[typing.Union[PortworxVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        projected: typing.Optional[typing.Union[ProjectedVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        quobyte: typing.Optional[typing.Union[QuobyteVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        rbd: typing.Optional[typing.Union[RbdVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        scale_io: typing.Optional[typing.Union[ScaleIoVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        secret: typing.Optional[typing.Union[SecretVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        storageos: typing.Optional[typing.Union[StorageOsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+        vsphere_volume: typing.Optional[typing.Union["VsphereVirtualDiskVolumeSource", typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Volume represents a named volume in a pod that may be accessed by any container in the pod.
+
+        :param name: name of the volume. Must be a DNS_LABEL and unique within the pod. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+        :param aws_elastic_block_store: awsElasticBlockStore represents an AWS Disk resource that is attached to a kubelet's host machine and then exposed to the pod. More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+        :param azure_disk: azureDisk represents an Azure Data Disk mount on the host and bind mount to the pod.
+        :param azure_file: azureFile represents an Azure File Service mount on the host and bind mount to the pod.
+        :param cephfs: cephFS represents a Ceph FS mount on the host that shares a pod's lifetime.
+        :param cinder: cinder represents a cinder volume attached and mounted on kubelets host machine. More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+        :param config_map: configMap represents a configMap that should populate this volume.
+        :param csi: csi (Container Storage Interface) represents ephemeral storage that is handled by certain external CSI drivers (Beta feature).
+        :param downward_api: downwardAPI represents downward API about the pod that should populate this volume.
+        :param empty_dir: emptyDir represents a temporary directory that shares a pod's lifetime. More info: https://kubernetes.io/docs/concepts/storage/volumes#emptydir
+        :param ephemeral: ephemeral represents a volume that is handled by a cluster storage driver. The volume's lifecycle is tied to the pod that defines it - it will be created before the pod starts, and deleted when the pod is removed. Use this if: a) the volume is only needed while the pod runs, b) features of normal volumes like restoring from snapshot or capacity tracking are needed, c) the storage driver is specified through a storage class, and d) the storage driver supports dynamic volume provisioning through a PersistentVolumeClaim (see EphemeralVolumeSource for more information on the connection between this volume type and PersistentVolumeClaim). Use PersistentVolumeClaim or one of the vendor-specific APIs for volumes that persist for longer than the lifecycle of an individual pod. Use CSI for light-weight local ephemeral volumes if the CSI driver is meant to be used that way - see the documentation of the driver for more information. A pod can use both types of ephemeral volumes and persistent volumes at the same time.
+        :param fc: fc represents a Fibre Channel resource that is attached to a kubelet's host machine and then exposed to the pod.
+        :param flex_volume: flexVolume represents a generic volume resource that is provisioned/attached using an exec based plugin.
+        :param flocker: flocker represents a Flocker volume attached to a kubelet's host machine. This depends on the Flocker control service being running
+        :param gce_persistent_disk: gcePersistentDisk represents a GCE Disk resource that is attached to a kubelet's host machine and then exposed to the pod. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+        :param git_repo: gitRepo represents a git repository at a particular revision. DEPRECATED: GitRepo is deprecated. To provision a container with a git repo, mount an EmptyDir into an InitContainer that clones the repo using git, then mount the EmptyDir into the Pod's container.
+        :param glusterfs: glusterfs represents a Glusterfs mount on the host that shares a pod's lifetime. More info: https://examples.k8s.io/volumes/glusterfs/README.md
+        :param host_path: hostPath represents a pre-existing file or directory on the host machine that is directly exposed to the container. This is generally used for system agents or other privileged things that are allowed to see the host machine. Most containers will NOT need this. More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath
+        :param iscsi: iscsi represents an ISCSI Disk resource that is attached to a kubelet's host machine and then exposed to the pod. More info: https://examples.k8s.io/volumes/iscsi/README.md
+        :param nfs: nfs represents an NFS mount on the host that shares a pod's lifetime More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs.
+        :param persistent_volume_claim: persistentVolumeClaimVolumeSource represents a reference to a PersistentVolumeClaim in the same namespace. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims
+        :param photon_persistent_disk: photonPersistentDisk represents a PhotonController persistent disk attached and mounted on kubelets host machine.
+        :param portworx_volume: portworxVolume represents a portworx volume attached and mounted on kubelets host machine.
+        :param projected: projected items for all in one resources secrets, configmaps, and downward API.
+        :param quobyte: quobyte represents a Quobyte mount on the host that shares a pod's lifetime.
+        :param rbd: rbd represents a Rados Block Device mount on the host that shares a pod's lifetime. More info: https://examples.k8s.io/volumes/rbd/README.md
+        :param scale_io: scaleIO represents a ScaleIO persistent volume attached and mounted on Kubernetes nodes.
+        :param secret: secret represents a secret that should populate this volume. More info: https://kubernetes.io/docs/concepts/storage/volumes#secret
+        :param storageos: storageOS represents a StorageOS volume attached and mounted on Kubernetes nodes.
+        :param vsphere_volume: vsphereVolume represents a vSphere volume attached and mounted on kubelets host machine.
+
+        :schema: io.k8s.api.core.v1.Volume
+        '''
+        if isinstance(aws_elastic_block_store, dict):
+            aws_elastic_block_store = AwsElasticBlockStoreVolumeSource(**aws_elastic_block_store)
+        if isinstance(azure_disk, dict):
+            azure_disk = AzureDiskVolumeSource(**azure_disk)
+        if isinstance(azure_file, dict):
+            azure_file = AzureFileVolumeSource(**azure_file)
+        if isinstance(cephfs, dict):
+            cephfs = CephFsVolumeSource(**cephfs)
+        if isinstance(cinder, dict):
+            cinder = CinderVolumeSource(**cinder)
+        if isinstance(config_map, dict):
+            config_map = ConfigMapVolumeSource(**config_map)
+        if isinstance(csi, dict):
+            csi = CsiVolumeSource(**csi)
+        if isinstance(downward_api, dict):
+            downward_api = DownwardApiVolumeSource(**downward_api)
+        if isinstance(empty_dir, dict):
+            empty_dir = EmptyDirVolumeSource(**empty_dir)
+        if isinstance(ephemeral, dict):
+            ephemeral = EphemeralVolumeSource(**ephemeral)
+        if isinstance(fc, dict):
+            fc = FcVolumeSource(**fc)
+        if isinstance(flex_volume, dict):
+            flex_volume = FlexVolumeSource(**flex_volume)
+        if isinstance(flocker, dict):
+            flocker = FlockerVolumeSource(**flocker)
+        if isinstance(gce_persistent_disk, dict):
+            gce_persistent_disk = GcePersistentDiskVolumeSource(**gce_persistent_disk)
+        if isinstance(git_repo, dict):
+            git_repo = GitRepoVolumeSource(**git_repo)
+        if isinstance(glusterfs, dict):
+            glusterfs = GlusterfsVolumeSource(**glusterfs)
+        if isinstance(host_path, dict):
+            host_path = HostPathVolumeSource(**host_path)
+        if isinstance(iscsi, dict):
+            iscsi = IscsiVolumeSource(**iscsi)
+        if isinstance(nfs, dict):
+            nfs = NfsVolumeSource(**nfs)
+        if isinstance(persistent_volume_claim, dict):
+            persistent_volume_claim = PersistentVolumeClaimVolumeSource(**persistent_volume_claim)
+        if isinstance(photon_persistent_disk, dict):
+            photon_persistent_disk = PhotonPersistentDiskVolumeSource(**photon_persistent_disk)
+        if isinstance(portworx_volume, dict):
+            portworx_volume = PortworxVolumeSource(**portworx_volume)
+        if isinstance(projected, dict):
+            projected = ProjectedVolumeSource(**projected)
+        if isinstance(quobyte, dict):
+            quobyte = QuobyteVolumeSource(**quobyte)
+        if isinstance(rbd, dict):
+            rbd = RbdVolumeSource(**rbd)
+        if isinstance(scale_io, dict):
+            scale_io = ScaleIoVolumeSource(**scale_io)
+        if isinstance(secret, dict):
+            secret = SecretVolumeSource(**secret)
+        if isinstance(storageos, dict):
+            storageos = StorageOsVolumeSource(**storageos)
+        if isinstance(vsphere_volume, dict):
+            vsphere_volume = VsphereVirtualDiskVolumeSource(**vsphere_volume)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b0baec088296b673c4c879b5ee48b961991a0c2bba4add80d27e32c59d57f145)
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument aws_elastic_block_store", value=aws_elastic_block_store, expected_type=type_hints["aws_elastic_block_store"])
+            check_type(argname="argument azure_disk", value=azure_disk, expected_type=type_hints["azure_disk"])
+            check_type(argname="argument azure_file", value=azure_file, expected_type=type_hints["azure_file"])
+            check_type(argname="argument cephfs", value=cephfs, expected_type=type_hints["cephfs"])
+            check_type(argname="argument cinder", value=cinder, expected_type=type_hints["cinder"])
+            check_type(argname="argument config_map", value=config_map, expected_type=type_hints["config_map"])
+            check_type(argname="argument csi", value=csi, expected_type=type_hints["csi"])
+            check_type(argname="argument downward_api", value=downward_api, expected_type=type_hints["downward_api"])
+            check_type(argname="argument empty_dir", value=empty_dir, expected_type=type_hints["empty_dir"])
+            check_type(argname="argument ephemeral", value=ephemeral, expected_type=type_hints["ephemeral"])
+            check_type(argname="argument fc", value=fc, expected_type=type_hints["fc"])
+            check_type(argname="argument flex_volume", value=flex_volume, expected_type=type_hints["flex_volume"])
+            check_type(argname="argument flocker", value=flocker, expected_type=type_hints["flocker"])
+            check_type(argname="argument gce_persistent_disk", value=gce_persistent_disk, expected_type=type_hints["gce_persistent_disk"])
+            check_type(argname="argument git_repo", value=git_repo, expected_type=type_hints["git_repo"])
+            check_type(argname="argument glusterfs", value=glusterfs, expected_type=type_hints["glusterfs"])
+            check_type(argname="argument host_path", value=host_path, expected_type=type_hints["host_path"])
+            check_type(argname="argument iscsi", value=iscsi, expected_type=type_hints["iscsi"])
+            check_type(argname="argument nfs", value=nfs, expected_type=type_hints["nfs"])
+            check_type(argname="argument persistent_volume_claim", value=persistent_volume_claim, expected_type=type_hints["persistent_volume_claim"])
+            check_type(argname="argument photon_persistent_disk", value=photon_persistent_disk, expected_type=type_hints["photon_persistent_disk"])
+            check_type(argname="argument portworx_volume", value=portworx_volume, expected_type=type_hints["portworx_volume"])
+            check_type(argname="argument projected", value=projected, expected_type=type_hints["projected"])
+            check_type(argname="argument quobyte", value=quobyte, expected_type=type_hints["quobyte"])
+            check_type(argname="argument rbd", value=rbd, expected_type=type_hints["rbd"])
+            check_type(argname="argument scale_io", value=scale_io, expected_type=type_hints["scale_io"])
+            check_type(argname="argument secret", value=secret, expected_type=type_hints["secret"])
+            check_type(argname="argument storageos", value=storageos, expected_type=type_hints["storageos"])
+            check_type(argname="argument vsphere_volume", value=vsphere_volume, expected_type=type_hints["vsphere_volume"])
+        self._value_name = name
+        self._value_aws_elastic_block_store = aws_elastic_block_store
+        self._value_azure_disk = azure_disk
+        self._value_azure_file = azure_file
+        self._value_cephfs = cephfs
+        self._value_cinder = cinder
+        self._value_config_map = config_map
+        self._value_csi = csi
+        self._value_downward_api = downward_api
+        self._value_empty_dir = empty_dir
+        self._value_ephemeral = ephemeral
+        self._value_fc = fc
+        self._value_flex_volume = flex_volume
+        self._value_flocker = flocker
+        self._value_gce_persistent_disk = gce_persistent_disk
+        self._value_git_repo = git_repo
+        self._value_glusterfs = glusterfs
+        self._value_host_path = host_path
+        self._value_iscsi = iscsi
+        self._value_nfs = nfs
+        self._value_persistent_volume_claim = persistent_volume_claim
+        self._value_photon_persistent_disk = photon_persistent_disk
+        self._value_portworx_volume = portworx_volume
+        self._value_projected = projected
+        self._value_quobyte = quobyte
+        self._value_rbd = rbd
+        self._value_scale_io = scale_io
+        self._value_secret = secret
+        self._value_storageos = storageos
+        self._value_vsphere_volume = vsphere_volume
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''name of the volume.
+
+        Must be a DNS_LABEL and unique within the pod. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
+
+        :schema: io.k8s.api.core.v1.Volume#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def aws_elastic_block_store(
+        self,
+    ) -> typing.Optional[AwsElasticBlockStoreVolumeSource]:
+        '''awsElasticBlockStore represents an AWS Disk resource that is attached to a kubelet's host machine and then exposed to the pod.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore
+
+        :schema: io.k8s.api.core.v1.Volume#awsElasticBlockStore
+        '''
+        result = self._value_aws_elastic_block_store
+        return typing.cast(typing.Optional[AwsElasticBlockStoreVolumeSource], result)
+
+    @builtins.property
+    def azure_disk(self) -> typing.Optional[AzureDiskVolumeSource]:
+        '''azureDisk represents an Azure Data Disk mount on the host and bind mount to the pod.
+
+        :schema: io.k8s.api.core.v1.Volume#azureDisk
+        '''
+        result = self._value_azure_disk
+        return typing.cast(typing.Optional[AzureDiskVolumeSource], result)
+
+    @builtins.property
+    def azure_file(self) -> typing.Optional[AzureFileVolumeSource]:
+        '''azureFile represents an Azure File Service mount on the host and bind mount to the pod.
+
+        :schema: io.k8s.api.core.v1.Volume#azureFile
+        '''
+        result = self._value_azure_file
+        return typing.cast(typing.Optional[AzureFileVolumeSource], result)
+
+    @builtins.property
+    def cephfs(self) -> typing.Optional[CephFsVolumeSource]:
+        '''cephFS represents a Ceph FS mount on the host that shares a pod's lifetime.
+
+        :schema: io.k8s.api.core.v1.Volume#cephfs
+        '''
+        result = self._value_cephfs
+        return typing.cast(typing.Optional[CephFsVolumeSource], result)
+
+    @builtins.property
+    def cinder(self) -> typing.Optional[CinderVolumeSource]:
+        '''cinder represents a cinder volume attached and mounted on kubelets host machine.
+
+        More info: https://examples.k8s.io/mysql-cinder-pd/README.md
+
+        :schema: io.k8s.api.core.v1.Volume#cinder
+        '''
+        result = self._value_cinder
+        return typing.cast(typing.Optional[CinderVolumeSource], result)
+
+    @builtins.property
+    def config_map(self) -> typing.Optional[ConfigMapVolumeSource]:
+        '''configMap represents a configMap that should populate this volume.
+
+        :schema: io.k8s.api.core.v1.Volume#configMap
+        '''
+        result = self._value_config_map
+        return typing.cast(typing.Optional[ConfigMapVolumeSource], result)
+
+    @builtins.property
+    def csi(self) -> typing.Optional[CsiVolumeSource]:
+        '''csi (Container Storage Interface) represents ephemeral storage that is handled by certain external CSI drivers (Beta feature).
+
+        :schema: io.k8s.api.core.v1.Volume#csi
+        '''
+        result = self._value_csi
+        return typing.cast(typing.Optional[CsiVolumeSource], result)
+
+    @builtins.property
+    def downward_api(self) -> typing.Optional[DownwardApiVolumeSource]:
+        '''downwardAPI represents downward API about the pod that should populate this volume.
+
+        :schema: io.k8s.api.core.v1.Volume#downwardAPI
+        '''
+        result = self._value_downward_api
+        return typing.cast(typing.Optional[DownwardApiVolumeSource], result)
+
+    @builtins.property
+    def empty_dir(self) -> typing.Optional[EmptyDirVolumeSource]:
+        '''emptyDir represents a temporary directory that shares a pod's lifetime.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#emptydir
+
+        :schema: io.k8s.api.core.v1.Volume#emptyDir
+        '''
+        result = self._value_empty_dir
+        return typing.cast(typing.Optional[EmptyDirVolumeSource], result)
+
+    @builtins.property
+    def ephemeral(self) -> typing.Optional[EphemeralVolumeSource]:
+        '''ephemeral represents a volume that is handled by a cluster storage driver.
+
+        The volume's lifecycle is tied to the pod that defines it - it will be created before the pod starts, and deleted when the pod is removed.
+
+        Use this if: a) the volume is only needed while the pod runs, b) features of normal volumes like restoring from snapshot or capacity
+        tracking are needed,
+        c) the storage driver is specified through a storage class, and d) the storage driver supports dynamic volume provisioning through
+        a PersistentVolumeClaim (see EphemeralVolumeSource for more
+        information on the connection between this volume type
+        and PersistentVolumeClaim).
+
+        Use PersistentVolumeClaim or one of the vendor-specific APIs for volumes that persist for longer than the lifecycle of an individual pod.
+
+        Use CSI for light-weight local ephemeral volumes if the CSI driver is meant to be used that way - see the documentation of the driver for more information.
+
+        A pod can use both types of ephemeral volumes and persistent volumes at the same time.
+
+        :schema: io.k8s.api.core.v1.Volume#ephemeral
+        '''
+        result = self._value_ephemeral
+        return typing.cast(typing.Optional[EphemeralVolumeSource], result)
+
+    @builtins.property
+    def fc(self) -> typing.Optional[FcVolumeSource]:
+        '''fc represents a Fibre Channel resource that is attached to a kubelet's host machine and then exposed to the pod.
+
+        :schema: io.k8s.api.core.v1.Volume#fc
+        '''
+        result = self._value_fc
+        return typing.cast(typing.Optional[FcVolumeSource], result)
+
+    @builtins.property
+    def flex_volume(self) -> typing.Optional[FlexVolumeSource]:
+        '''flexVolume represents a generic volume resource that is provisioned/attached using an exec based plugin.
+
+        :schema: io.k8s.api.core.v1.Volume#flexVolume
+        '''
+        result = self._value_flex_volume
+        return typing.cast(typing.Optional[FlexVolumeSource], result)
+
+    @builtins.property
+    def flocker(self) -> typing.Optional[FlockerVolumeSource]:
+        '''flocker represents a Flocker volume attached to a kubelet's host machine.
+
+        This depends on the Flocker control service being running
+
+        :schema: io.k8s.api.core.v1.Volume#flocker
+        '''
+        result = self._value_flocker
+        return typing.cast(typing.Optional[FlockerVolumeSource], result)
+
+    @builtins.property
+    def gce_persistent_disk(self) -> typing.Optional[GcePersistentDiskVolumeSource]:
+        '''gcePersistentDisk represents a GCE Disk resource that is attached to a kubelet's host machine and then exposed to the pod.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk
+
+        :schema: io.k8s.api.core.v1.Volume#gcePersistentDisk
+        '''
+        result = self._value_gce_persistent_disk
+        return typing.cast(typing.Optional[GcePersistentDiskVolumeSource], result)
+
+    @builtins.property
+    def git_repo(self) -> typing.Optional[GitRepoVolumeSource]:
+        '''gitRepo represents a git repository at a particular revision.
+
+        DEPRECATED: GitRepo is deprecated. To provision a container with a git repo, mount an EmptyDir into an InitContainer that clones the repo using git, then mount the EmptyDir into the Pod's container.
+
+        :schema: io.k8s.api.core.v1.Volume#gitRepo
+        '''
+        result = self._value_git_repo
+        return typing.cast(typing.Optional[GitRepoVolumeSource], result)
+
+    @builtins.property
+    def glusterfs(self) -> typing.Optional[GlusterfsVolumeSource]:
+        '''glusterfs represents a Glusterfs mount on the host that shares a pod's lifetime.
+
+        More info: https://examples.k8s.io/volumes/glusterfs/README.md
+
+        :schema: io.k8s.api.core.v1.Volume#glusterfs
+        '''
+        result = self._value_glusterfs
+        return typing.cast(typing.Optional[GlusterfsVolumeSource], result)
+
+    @builtins.property
+    def host_path(self) -> typing.Optional[HostPathVolumeSource]:
+        '''hostPath represents a pre-existing file or directory on the host machine that is directly exposed to the container.
+
+        This is generally used for system agents or other privileged things that are allowed to see the host machine. Most containers will NOT need this. More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath
+
+        :schema: io.k8s.api.core.v1.Volume#hostPath
+        '''
+        result = self._value_host_path
+        return typing.cast(typing.Optional[HostPathVolumeSource], result)
+
+    @builtins.property
+    def iscsi(self) -> typing.Optional[IscsiVolumeSource]:
+        '''iscsi represents an ISCSI Disk resource that is attached to a kubelet's host machine and then exposed to the pod.
+
+        More info: https://examples.k8s.io/volumes/iscsi/README.md
+
+        :schema: io.k8s.api.core.v1.Volume#iscsi
+        '''
+        result = self._value_iscsi
+        return typing.cast(typing.Optional[IscsiVolumeSource], result)
+
+    @builtins.property
+    def nfs(self) -> typing.Optional[NfsVolumeSource]:
+        '''nfs represents an NFS mount on the host that shares a pod's lifetime More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs.
+
+        :schema: io.k8s.api.core.v1.Volume#nfs
+        '''
+        result = self._value_nfs
+        return typing.cast(typing.Optional[NfsVolumeSource], result)
+
+    @builtins.property
+    def persistent_volume_claim(
+        self,
+    ) -> typing.Optional[PersistentVolumeClaimVolumeSource]:
+        '''persistentVolumeClaimVolumeSource represents a reference to a PersistentVolumeClaim in the same namespace.
+
+        More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims
+
+        :schema: io.k8s.api.core.v1.Volume#persistentVolumeClaim
+        '''
+        result = self._value_persistent_volume_claim
+        return typing.cast(typing.Optional[PersistentVolumeClaimVolumeSource], result)
+
+    @builtins.property
+    def photon_persistent_disk(
+        self,
+    ) -> typing.Optional[PhotonPersistentDiskVolumeSource]:
+        '''photonPersistentDisk represents a PhotonController persistent disk attached and mounted on kubelets host machine.
+
+        :schema: io.k8s.api.core.v1.Volume#photonPersistentDisk
+        '''
+        result = self._value_photon_persistent_disk
+        return typing.cast(typing.Optional[PhotonPersistentDiskVolumeSource], result)
+
+    @builtins.property
+    def portworx_volume(self) -> typing.Optional[PortworxVolumeSource]:
+        '''portworxVolume represents a portworx volume attached and mounted on kubelets host machine.
+
+        :schema: io.k8s.api.core.v1.Volume#portworxVolume
+        '''
+        result = self._value_portworx_volume
+        return typing.cast(typing.Optional[PortworxVolumeSource], result)
+
+    @builtins.property
+    def projected(self) -> typing.Optional[ProjectedVolumeSource]:
+        '''projected items for all in one resources secrets, configmaps, and downward API.
+
+        :schema: io.k8s.api.core.v1.Volume#projected
+        '''
+        result = self._value_projected
+        return typing.cast(typing.Optional[ProjectedVolumeSource], result)
+
+    @builtins.property
+    def quobyte(self) -> typing.Optional[QuobyteVolumeSource]:
+        '''quobyte represents a Quobyte mount on the host that shares a pod's lifetime.
+
+        :schema: io.k8s.api.core.v1.Volume#quobyte
+        '''
+        result = self._value_quobyte
+        return typing.cast(typing.Optional[QuobyteVolumeSource], result)
+
+    @builtins.property
+    def rbd(self) -> typing.Optional[RbdVolumeSource]:
+        '''rbd represents a Rados Block Device mount on the host that shares a pod's lifetime.
+
+        More info: https://examples.k8s.io/volumes/rbd/README.md
+
+        :schema: io.k8s.api.core.v1.Volume#rbd
+        '''
+        result = self._value_rbd
+        return typing.cast(typing.Optional[RbdVolumeSource], result)
+
+    @builtins.property
+    def scale_io(self) -> typing.Optional[ScaleIoVolumeSource]:
+        '''scaleIO represents a ScaleIO persistent volume attached and mounted on Kubernetes nodes.
+
+        :schema: io.k8s.api.core.v1.Volume#scaleIO
+        '''
+        result = self._value_scale_io
+        return typing.cast(typing.Optional[ScaleIoVolumeSource], result)
+
+    @builtins.property
+    def secret(self) -> typing.Optional[SecretVolumeSource]:
+        '''secret represents a secret that should populate this volume.
+
+        More info: https://kubernetes.io/docs/concepts/storage/volumes#secret
+
+        :schema: io.k8s.api.core.v1.Volume#secret
+        '''
+        result = self._value_secret
+        return typing.cast(typing.Optional[SecretVolumeSource], result)
+
+    @builtins.property
+    def storageos(self) -> typing.Optional[StorageOsVolumeSource]:
+        '''storageOS represents a StorageOS volume attached and mounted on Kubernetes nodes.
+
+        :schema: io.k8s.api.core.v1.Volume#storageos
+        '''
+        result = self._value_storageos
+        return typing.cast(typing.Optional[StorageOsVolumeSource], result)
+
+    @builtins.property
+    def vsphere_volume(self) -> typing.Optional["VsphereVirtualDiskVolumeSource"]:
+        '''vsphereVolume represents a vSphere volume attached and mounted on kubelets host machine.
+
+        :schema: io.k8s.api.core.v1.Volume#vsphereVolume
+        '''
+        result = self._value_vsphere_volume
+        return typing.cast(typing.Optional["VsphereVirtualDiskVolumeSource"], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "name": self._value_name,
+        }
+        if self._value_aws_elastic_block_store is not None:
+            values["aws_elastic_block_store"] = self._value_aws_elastic_block_store
+        if self._value_azure_disk is not None:
+            values["azure_disk"] = self._value_azure_disk
+        if self._value_azure_file is not None:
+            values["azure_file"] = self._value_azure_file
+        if self._value_cephfs is not None:
+            values["cephfs"] = self._value_cephfs
+        if self._value_cinder is not None:
+            values["cinder"] = self._value_cinder
+        if self._value_config_map is not None:
+            values["config_map"] = self._value_config_map
+        if self._value_csi is not None:
+            values["csi"] = self._value_csi
+        if self._value_downward_api is not None:
+            values["downward_api"] = self._value_downward_api
+        if self._value_empty_dir is not None:
+            values["empty_dir"] = self._value_empty_dir
+        if self._value_ephemeral is not None:
+            values["ephemeral"] = self._value_ephemeral
+        if self._value_fc is not None:
+            values["fc"] = self._value_fc
+        if self._value_flex_volume is not None:
+            values["flex_volume"] = self._value_flex_volume
+        if self._value_flocker is not None:
+            values["flocker"] = self._value_flocker
+        if self._value_gce_persistent_disk is not None:
+            values["gce_persistent_disk"] = self._value_gce_persistent_disk
+        if self._value_git_repo is not None:
+            values["git_repo"] = self._value_git_repo
+        if self._value_glusterfs is not None:
+            values["glusterfs"] = self._value_glusterfs
+        if self._value_host_path is not None:
+            values["host_path"] = self._value_host_path
+        if self._value_iscsi is not None:
+            values["iscsi"] = self._value_iscsi
+        if self._value_nfs is not None:
+            values["nfs"] = self._value_nfs
+        if self._value_persistent_volume_claim is not None:
+            values["persistent_volume_claim"] = self._value_persistent_volume_claim
+        if self._value_photon_persistent_disk is not None:
+            values["photon_persistent_disk"] = self._value_photon_persistent_disk
+        if self._value_portworx_volume is not None:
+            values["portworx_volume"] = self._value_portworx_volume
+        if self._value_projected is not None:
+            values["projected"] = self._value_projected
+        if self._value_quobyte is not None:
+            values["quobyte"] = self._value_quobyte
+        if self._value_rbd is not None:
+            values["rbd"] = self._value_rbd
+        if self._value_scale_io is not None:
+            values["scale_io"] = self._value_scale_io
+        if self._value_secret is not None:
+            values["secret"] = self._value_secret
+        if self._value_storageos is not None:
+            values["storageos"] = self._value_storageos
+        if self._value_vsphere_volume is not None:
+            values["vsphere_volume"] = self._value_vsphere_volume
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "Volume(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b0baec088296b673c4c879b5ee48b961991a0c2bba4add80d27e32c59d57f145(
+    *,
+    name: builtins.str,
+    aws_elastic_block_store: typing.Optional[typing.Union[AwsElasticBlockStoreVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    azure_disk: typing.Optional[typing.Union[AzureDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    azure_file: typing.Optional[typing.Union[AzureFileVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    cephfs: typing.Optional[typing.Union[CephFsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    cinder: typing.Optional[typing.Union[CinderVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    config_map: typing.Optional[typing.Union[ConfigMapVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    csi: typing.Optional[typing.Union[CsiVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    downward_api: typing.Optional[typing.Union[DownwardApiVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    empty_dir: typing.Optional[typing.Union[EmptyDirVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    ephemeral: typing.Optional[typing.Union[EphemeralVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    fc: typing.Optional[typing.Union[FcVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    flex_volume: typing.Optional[typing.Union[FlexVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    flocker: typing.Optional[typing.Union[FlockerVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    gce_persistent_disk: typing.Optional[typing.Union[GcePersistentDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    git_repo: typing.Optional[typing.Union[GitRepoVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    glusterfs: typing.Optional[typing.Union[GlusterfsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    host_path: typing.Optional[typing.Union[HostPathVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    iscsi: typing.Optional[typing.Union[IscsiVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    nfs: typing.Optional[typing.Union[NfsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    persistent_volume_claim: typing.Optional[typing.Union[PersistentVolumeClaimVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    photon_persistent_disk: typing.Optional[typing.Union[PhotonPersistentDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    portworx_volume: typing.Optional[typing.Union[PortworxVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    projected: typing.Optional[typing.Union[ProjectedVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    quobyte: typing.Optional[typing.Union[QuobyteVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    rbd: typing.Optional[typing.Union[RbdVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    scale_io: typing.Optional[typing.Union[ScaleIoVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    secret: typing.Optional[typing.Union[SecretVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    storageos: typing.Optional[typing.Union[StorageOsVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+    vsphere_volume: typing.Optional[typing.Union[VsphereVirtualDiskVolumeSource, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,106 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .PersistentVolumeSpec import PersistentVolumeSpec
+
+
+@jsii.data_type(
+    jsii_type="k8s.VolumeAttachmentSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "inline_volume_spec": "inlineVolumeSpec",
+        "persistent_volume_name": "persistentVolumeName",
+    },
+)
+class VolumeAttachmentSource(_base.Struct):
+    __slots__ = (
+        "_value_inline_volume_spec",
+        "_value_persistent_volume_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        inline_volume_spec: typing.Optional[typing.Union[PersistentVolumeSpec, typing.Dict[builtins.str, typing.Any]]] = None,
+        persistent_volume_name: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''VolumeAttachmentSource represents a volume that should be attached.
+
+        Right now only PersistenVolumes can be attached via external attacher, in future we may allow also inline volumes in pods. Exactly one member can be set.
+
+        :param inline_volume_spec: inlineVolumeSpec contains all the information necessary to attach a persistent volume defined by a pod's inline VolumeSource. This field is populated only for the CSIMigration feature. It contains translated fields from a pod's inline VolumeSource to a PersistentVolumeSpec. This field is beta-level and is only honored by servers that enabled the CSIMigration feature.
+        :param persistent_volume_name: Name of the persistent volume to attach.
+
+        :schema: io.k8s.api.storage.v1.VolumeAttachmentSource
+        '''
+        if isinstance(inline_volume_spec, dict):
+            inline_volume_spec = PersistentVolumeSpec(**inline_volume_spec)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__b3f9952d5e8dadf3ded289f1651a13c30397c804b078b1918f7e368a400af926)
+            check_type(argname="argument inline_volume_spec", value=inline_volume_spec, expected_type=type_hints["inline_volume_spec"])
+            check_type(argname="argument persistent_volume_name", value=persistent_volume_name, expected_type=type_hints["persistent_volume_name"])
+        self._value_inline_volume_spec = inline_volume_spec
+        self._value_persistent_volume_name = persistent_volume_name
+
+    @builtins.property
+    def inline_volume_spec(self) -> typing.Optional[PersistentVolumeSpec]:
+        '''inlineVolumeSpec contains all the information necessary to attach a persistent volume defined by a pod's inline VolumeSource.
+
+        This field is populated only for the CSIMigration feature. It contains translated fields from a pod's inline VolumeSource to a PersistentVolumeSpec. This field is beta-level and is only honored by servers that enabled the CSIMigration feature.
+
+        :schema: io.k8s.api.storage.v1.VolumeAttachmentSource#inlineVolumeSpec
+        '''
+        result = self._value_inline_volume_spec
+        return typing.cast(typing.Optional[PersistentVolumeSpec], result)
+
+    @builtins.property
+    def persistent_volume_name(self) -> typing.Optional[builtins.str]:
+        '''Name of the persistent volume to attach.
+
+        :schema: io.k8s.api.storage.v1.VolumeAttachmentSource#persistentVolumeName
+        '''
+        result = self._value_persistent_volume_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_inline_volume_spec is not None:
+            values["inline_volume_spec"] = self._value_inline_volume_spec
+        if self._value_persistent_volume_name is not None:
+            values["persistent_volume_name"] = self._value_persistent_volume_name
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "VolumeAttachmentSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__b3f9952d5e8dadf3ded289f1651a13c30397c804b078b1918f7e368a400af926(
+    *,
+    inline_volume_spec: typing.Optional[typing.Union[PersistentVolumeSpec, typing.Dict[builtins.str, typing.Any]]] = None,
+    persistent_volume_name: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
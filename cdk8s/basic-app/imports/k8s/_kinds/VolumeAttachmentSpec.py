@@ -0,0 +1,119 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .VolumeAttachmentSource import VolumeAttachmentSource
+
+
+@jsii.data_type(
+    jsii_type="k8s.VolumeAttachmentSpec",
+    jsii_struct_bases=[],
+    name_mapping={"attacher": "attacher", "node_name": "nodeName", "source": "source"},
+)
+class VolumeAttachmentSpec(_base.Struct):
+    __slots__ = (
+        "_value_attacher",
+        "_value_node_name",
+        "_value_source",
+    )
+
+    def __init__(
+        self,
+        *,
+        attacher: builtins.str,
+        node_name: builtins.str,
+        source: typing.Union[VolumeAttachmentSource, typing.Dict[builtins.str, typing.Any]],
+    ) -> None:
+        '''VolumeAttachmentSpec is the specification of a VolumeAttachment request.
+
+        :param attacher: Attacher indicates the name of the volume driver that MUST handle this request. This is the name returned by GetPluginName().
+        :param node_name: The node that the volume should be attached to.
+        :param source: Source represents the volume that should be attached.
+
+        :schema: io.k8s.api.storage.v1.VolumeAttachmentSpec
+        '''
+        if isinstance(source, dict):
+            source = VolumeAttachmentSource(**source)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__c4b9cc875951c45fbf95df095c19992e6e0cb9bae73892b27970af014c9ef130)
+            check_type(argname="argument attacher", value=attacher, expected_type=type_hints["attacher"])
+            check_type(argname="argument node_name", value=node_name, expected_type=type_hints["node_name"])
+            check_type(argname="argument source", value=source, expected_type=type_hints["source"])
+        self._value_attacher = attacher
+        self._value_node_name = node_name
+        self._value_source = source
+
+    @builtins.property
+    def attacher(self) -> builtins.str:
+        '''Attacher indicates the name of the volume driver that MUST handle this request.
+
+        This is the name returned by GetPluginName().
+
+        :schema: io.k8s.api.storage.v1.VolumeAttachmentSpec#attacher
+        '''
+        result = self._value_attacher
+        assert result is not None, "Required property 'attacher' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def node_name(self) -> builtins.str:
+        '''The node that the volume should be attached to.
+
+        :schema: io.k8s.api.storage.v1.VolumeAttachmentSpec#nodeName
+        '''
+        result = self._value_node_name
+        assert result is not None, "Required property 'node_name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def source(self) -> VolumeAttachmentSource:
+        '''Source represents the volume that should be attached.
+
+        :schema: io.k8s.api.storage.v1.VolumeAttachmentSpec#source
+        '''
+        result = self._value_source
+        assert result is not None, "Required property 'source' is missing"
+        return typing.cast(VolumeAttachmentSource, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "attacher": self._value_attacher,
+            "node_name": self._value_node_name,
+            "source": self._value_source,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "VolumeAttachmentSpec(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__c4b9cc875951c45fbf95df095c19992e6e0cb9bae73892b27970af014c9ef130(
+    *,
+    attacher: builtins.str,
+    node_name: builtins.str,
+    source: typing.Union[VolumeAttachmentSource, typing.Dict[builtins.str, typing.Any]],
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,92 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.VolumeDevice",
+    jsii_struct_bases=[],
+    name_mapping={"device_path": "devicePath", "name": "name"},
+)
+class VolumeDevice(_base.Struct):
+    __slots__ = (
+        "_value_device_path",
+        "_value_name",
+    )
+
+    def __init__(self, *, device_path: builtins.str, name: builtins.str) -> None:
+        '''volumeDevice describes a mapping of a raw block device within a container.
+
+        :param device_path: devicePath is the path inside of the container that the device will be mapped to.
+        :param name: name must match the name of a persistentVolumeClaim in the pod.
+
+        :schema: io.k8s.api.core.v1.VolumeDevice
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__79302810697edefbd8389c6b329719eb591c59ac9f35d9046bda0be521703345)
+            check_type(argname="argument device_path", value=device_path, expected_type=type_hints["device_path"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+        self._value_device_path = device_path
+        self._value_name = name
+
+    @builtins.property
+    def device_path(self) -> builtins.str:
+        '''devicePath is the path inside of the container that the device will be mapped to.
+
+        :schema: io.k8s.api.core.v1.VolumeDevice#devicePath
+        '''
+        result = self._value_device_path
+        assert result is not None, "Required property 'device_path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''name must match the name of a persistentVolumeClaim in the pod.
+
+        :schema: io.k8s.api.core.v1.VolumeDevice#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "device_path": self._value_device_path,
+            "name": self._value_name,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "VolumeDevice(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__79302810697edefbd8389c6b329719eb591c59ac9f35d9046bda0be521703345(
+    *,
+    device_path: builtins.str,
+    name: builtins.str,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,188 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.VolumeMount",
+    jsii_struct_bases=[],
+    name_mapping={
+        "mount_path": "mountPath",
+        "name": "name",
+        "mount_propagation": "mountPropagation",
+        "read_only": "readOnly",
+        "sub_path": "subPath",
+        "sub_path_expr": "subPathExpr",
+    },
+)
+class VolumeMount(_base.Struct):
+    __slots__ = (
+        "_value_mount_path",
+        "_value_name",
+        "_value_mount_propagation",
+        "_value_read_only",
+        "_value_sub_path",
+        "_value_sub_path_expr",
+    )
+
+    def __init__(
+        self,
+        *,
+        mount_path: builtins.str,
+        name: builtins.str,
+        mount_propagation: typing.Optional[builtins.str] = None,
+        read_only: typing.Optional[builtins.bool] = None,
+        sub_path: typing.Optional[builtins.str] = None,
+        sub_path_expr: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''VolumeMount describes a mounting of a Volume within a container.
+
+        :param mount_path: Path within the container at which the volume should be mounted. Must not contain ':'.
+        :param name: This must match the Name of a Volume.
+        :param mount_propagation: mountPropagation determines how mounts are propagated from the host to container and the other way around. When not set, MountPropagationNone is used. This field is beta in 1.10.
+        :param read_only: Mounted read-only if true, read-write otherwise (false or unspecified). Defaults to false. Default: false.
+        :param sub_path: Path within the volume from which the container's volume should be mounted. Defaults to "" (volume's root). Default: volume's root).
+        :param sub_path_expr: Expanded path within the volume from which the container's volume should be mounted. Behaves similarly to SubPath but environment variable references $(VAR_NAME) are expanded using the container's environment. Defaults to "" (volume's root). SubPathExpr and SubPath are mutually exclusive. Default: volume's root). SubPathExpr and SubPath are mutually exclusive.
+
+        :schema: io.k8s.api.core.v1.VolumeMount
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7bc86759e585609a7ca09f49d33b128e9d64f2504bc6d8b9cd2b329582357e17)
+            check_type(argname="argument mount_path", value=mount_path, expected_type=type_hints["mount_path"])
+            check_type(argname="argument name", value=name, expected_type=type_hints["name"])
+            check_type(argname="argument mount_propagation", value=mount_propagation, expected_type=type_hints["mount_propagation"])
+            check_type(argname="argument read_only", value=read_only, expected_type=type_hints["read_only"])
+            check_type(argname="argument sub_path", value=sub_path, expected_type=type_hints["sub_path"])
+            check_type(argname="argument sub_path_expr", value=sub_path_expr, expected_type=type_hints["sub_path_expr"])
+        self._value_mount_path = mount_path
+        self._value_name = name
+        self._value_mount_propagation = mount_propagation
+        self._value_read_only = read_only
+        self._value_sub_path = sub_path
+        self._value_sub_path_expr = sub_path_expr
+
+    @builtins.property
+    def mount_path(self) -> builtins.str:
+        '''Path within the container at which the volume should be mounted.
+
+        Must not contain ':'.
+
+        :schema: io.k8s.api.core.v1.VolumeMount#mountPath
+        '''
+        result = self._value_mount_path
+        assert result is not None, "Required property 'mount_path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def name(self) -> builtins.str:
+        '''This must match the Name of a Volume.
+
+        :schema: io.k8s.api.core.v1.VolumeMount#name
+        '''
+        result = self._value_name
+        assert result is not None, "Required property 'name' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def mount_propagation(self) -> typing.Optional[builtins.str]:
+        '''mountPropagation determines how mounts are propagated from the host to container and the other way around.
+
+        When not set, MountPropagationNone is used. This field is beta in 1.10.
+
+        :schema: io.k8s.api.core.v1.VolumeMount#mountPropagation
+        '''
+        result = self._value_mount_propagation
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def read_only(self) -> typing.Optional[builtins.bool]:
+        '''Mounted read-only if true, read-write otherwise (false or unspecified).
+
+        Defaults to false.
+
+        :default: false.
+
+        :schema: io.k8s.api.core.v1.VolumeMount#readOnly
+        '''
+        result = self._value_read_only
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def sub_path(self) -> typing.Optional[builtins.str]:
+        '''Path within the volume from which the container's volume should be mounted.
+
+        Defaults to "" (volume's root).
+
+        :default: volume's root).
+
+        :schema: io.k8s.api.core.v1.VolumeMount#subPath
+        '''
+        result = self._value_sub_path
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def sub_path_expr(self) -> typing.Optional[builtins.str]:
+        '''Expanded path within the volume from which the container's volume should be mounted.
+
+        Behaves similarly to SubPath but environment variable references $(VAR_NAME) are expanded using the container's environment. Defaults to "" (volume's root). SubPathExpr and SubPath are mutually exclusive.
+
+        :default: volume's root). SubPathExpr and SubPath are mutually exclusive.
+
+        :schema: io.k8s.api.core.v1.VolumeMount#subPathExpr
+        '''
+        result = self._value_sub_path_expr
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "mount_path": self._value_mount_path,
+            "name": self._value_name,
+        }
+        if self._value_mount_propagation is not None:
+            values["mount_propagation"] = self._value_mount_propagation
+        if self._value_read_only is not None:
+            values["read_only"] = self._value_read_only
+        if self._value_sub_path is not None:
+            values["sub_path"] = self._value_sub_path
+        if self._value_sub_path_expr is not None:
+            values["sub_path_expr"] = self._value_sub_path_expr
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "VolumeMount(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7bc86759e585609a7ca09f49d33b128e9d64f2504bc6d8b9cd2b329582357e17(
+    *,
+    mount_path: builtins.str,
+    name: builtins.str,
+    mount_propagation: typing.Optional[builtins.str] = None,
+    read_only: typing.Optional[builtins.bool] = None,
+    sub_path: typing.Optional[builtins.str] = None,
+    sub_path_expr: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,82 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .NodeSelector import NodeSelector
+
+
+@jsii.data_type(
+    jsii_type="k8s.VolumeNodeAffinity",
+    jsii_struct_bases=[],
+    name_mapping={"required": "required"},
+)
+class VolumeNodeAffinity(_base.Struct):
+    __slots__ = (
+        "_value_required",
+    )
+
+    def __init__(
+        self,
+        *,
+        required: typing.Optional[typing.Union[NodeSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''VolumeNodeAffinity defines constraints that limit what nodes this volume can be accessed from.
+
+        :param required: required specifies hard node constraints that must be met.
+
+        :schema: io.k8s.api.core.v1.VolumeNodeAffinity
+        '''
+        if isinstance(required, dict):
+            required = NodeSelector(**required)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__7c2f59acda00c7a6490c99644a0f6c1d5b9c7c0ca5e955d2d1c906c4defb4ade)
+            check_type(argname="argument required", value=required, expected_type=type_hints["required"])
+        self._value_required = required
+
+    @builtins.property
+    def required(self) -> typing.Optional[NodeSelector]:
+        '''required specifies hard node constraints that must be met.
+
+        :schema: io.k8s.api.core.v1.VolumeNodeAffinity#required
+        '''
+        result = self._value_required
+        return typing.cast(typing.Optional[NodeSelector], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_required is not None:
+            values["required"] = self._value_required
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "VolumeNodeAffinity(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__7c2f59acda00c7a6490c99644a0f6c1d5b9c7c0ca5e955d2d1c906c4defb4ade(
+    *,
+    required: typing.Optional[typing.Union[NodeSelector, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,77 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.VolumeNodeResources",
+    jsii_struct_bases=[],
+    name_mapping={"count": "count"},
+)
+class VolumeNodeResources(_base.Struct):
+    __slots__ = (
+        "_value_count",
+    )
+
+    def __init__(self, *, count: typing.Optional[jsii.Number] = None) -> None:
+        '''VolumeNodeResources is a set of resource limits for scheduling of volumes.
+
+        :param count: Maximum number of unique volumes managed by the CSI driver that can be used on a node. A volume that is both attached and mounted on a node is considered to be used once, not twice. The same rule applies for a unique volume that is shared among multiple pods on the same node. If this field is not specified, then the supported number of volumes on this node is unbounded.
+
+        :schema: io.k8s.api.storage.v1.VolumeNodeResources
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__2a5c11cd7f903e3f4b9668bb558dbf7b284d3be245138a41dc7978f947084911)
+            check_type(argname="argument count", value=count, expected_type=type_hints["count"])
+        self._value_count = count
+
+    @builtins.property
+    def count(self) -> typing.Optional[jsii.Number]:
+        '''Maximum number of unique volumes managed by the CSI driver that can be used on a node.
+
+        A volume that is both attached and mounted on a node is considered to be used once, not twice. The same rule applies for a unique volume that is shared among multiple pods on the same node. If this field is not specified, then the supported number of volumes on this node is unbounded.
+
+        :schema: io.k8s.api.storage.v1.VolumeNodeResources#count
+        '''
+        result = self._value_count
+        return typing.cast(typing.Optional[jsii.Number], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_count is not None:
+            values["count"] = self._value_count
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "VolumeNodeResources(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__2a5c11cd7f903e3f4b9668bb558dbf7b284d3be245138a41dc7978f947084911(
+    *,
+    count: typing.Optional[jsii.Number] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,147 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ConfigMapProjection import ConfigMapProjection
+from .DownwardApiProjection import DownwardApiProjection
+from .SecretProjection import SecretProjection
+from .ServiceAccountTokenProjection import ServiceAccountTokenProjection
+
+
+@jsii.data_type(
+    jsii_type="k8s.VolumeProjection",
+    jsii_struct_bases=[],
+    name_mapping={
+        "config_map": "configMap",
+        "downward_api": "downwardApi",
+        "secret": "secret",
+        "service_account_token": "serviceAccountToken",
+    },
+)
+class VolumeProjection(_base.Struct):
+    __slots__ = (
+        "_value_config_map",
+        "_value_downward_api",
+        "_value_secret",
+        "_value_service_account_token",
+    )
+
+    def __init__(
+        self,
+        *,
+        config_map: typing.Optional[typing.Union[ConfigMapProjection, typing.Dict[builtins.str, typing.Any]]] = None,
+        downward_api: typing.Optional[typing.Union[DownwardApiProjection, typing.Dict[builtins.str, typing.Any]]] = None,
+        secret: typing.Optional[typing.Union[SecretProjection, typing.Dict[builtins.str, typing.Any]]] = None,
+        service_account_token: typing.Optional[typing.Union[ServiceAccountTokenProjection, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''Projection that may be projected along with other supported volume types.
+
+        :param config_map: configMap information about the configMap data to project.
+        :param downward_api: downwardAPI information about the downwardAPI data to project.
+        :param secret: secret information about the secret data to project.
+        :param service_account_token: serviceAccountToken is information about the serviceAccountToken data to project.
+
+        :schema: io.k8s.api.core.v1.VolumeProjection
+        '''
+        if isinstance(config_map, dict):
+            config_map = ConfigMapProjection(**config_map)
+        if isinstance(downward_api, dict):
+            downward_api = DownwardApiProjection(**downward_api)
+        if isinstance(secret, dict):
+            secret = SecretProjection(**secret)
+        if isinstance(service_account_token, dict):
+            service_account_token = ServiceAccountTokenProjection(**service_account_token)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__21035918b928e2f804e2bbaaf7f50d5c4b3eb354a5e4a66e639edff79f735bfc)
+            check_type(argname="argument config_map", value=config_map, expected_type=type_hints["config_map"])
+            check_type(argname="argument downward_api", value=downward_api, expected_type=type_hints["downward_api"])
+            check_type(argname="argument secret", value=secret, expected_type=type_hints["secret"])
+            check_type(argname="argument service_account_token", value=service_account_token, expected_type=type_hints["service_account_token"])
+        self._value_config_map = config_map
+        self._value_downward_api = downward_api
+        self._value_secret = secret
+        self._value_service_account_token = service_account_token
+
+    @builtins.property
+    def config_map(self) -> typing.Optional[ConfigMapProjection]:
+        '''configMap information about the configMap data to project.
+
+        :schema: io.k8s.api.core.v1.VolumeProjection#configMap
+        '''
+        result = self._value_config_map
+        return typing.cast(typing.Optional[ConfigMapProjection], result)
+
+    @builtins.property
+    def downward_api(self) -> typing.Optional[DownwardApiProjection]:
+        '''downwardAPI information about the downwardAPI data to project.
+
+        :schema: io.k8s.api.core.v1.VolumeProjection#downwardAPI
+        '''
+        result = self._value_downward_api
+        return typing.cast(typing.Optional[DownwardApiProjection], result)
+
+    @builtins.property
+    def secret(self) -> typing.Optional[SecretProjection]:
+        '''secret information about the secret data to project.
+
+        :schema: io.k8s.api.core.v1.VolumeProjection#secret
+        '''
+        result = self._value_secret
+        return typing.cast(typing.Optional[SecretProjection], result)
+
+    @builtins.property
+    def service_account_token(self) -> typing.Optional[ServiceAccountTokenProjection]:
+        '''serviceAccountToken is information about the serviceAccountToken data to project.
+
+        :schema: io.k8s.api.core.v1.VolumeProjection#serviceAccountToken
+        '''
+        result = self._value_service_account_token
+        return typing.cast(typing.Optional[ServiceAccountTokenProjection], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_config_map is not None:
+            values["config_map"] = self._value_config_map
+        if self._value_downward_api is not None:
+            values["downward_api"] = self._value_downward_api
+        if self._value_secret is not None:
+            values["secret"] = self._value_secret
+        if self._value_service_account_token is not None:
+            values["service_account_token"] = self._value_service_account_token
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "VolumeProjection(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__21035918b928e2f804e2bbaaf7f50d5c4b3eb354a5e4a66e639edff79f735bfc(
+    *,
+    config_map: typing.Optional[typing.Union[ConfigMapProjection, typing.Dict[builtins.str, typing.Any]]] = None,
+    downward_api: typing.Optional[typing.Union[DownwardApiProjection, typing.Dict[builtins.str, typing.Any]]] = None,
+    secret: typing.Optional[typing.Union[SecretProjection, typing.Dict[builtins.str, typing.Any]]] = None,
+    service_account_token: typing.Optional[typing.Union[ServiceAccountTokenProjection, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
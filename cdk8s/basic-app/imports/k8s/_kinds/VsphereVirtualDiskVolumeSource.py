@@ -0,0 +1,138 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.VsphereVirtualDiskVolumeSource",
+    jsii_struct_bases=[],
+    name_mapping={
+        "volume_path": "volumePath",
+        "fs_type": "fsType",
+        "storage_policy_id": "storagePolicyId",
+        "storage_policy_name": "storagePolicyName",
+    },
+)
+class VsphereVirtualDiskVolumeSource(_base.Struct):
+    __slots__ = (
+        "_value_volume_path",
+        "_value_fs_type",
+        "_value_storage_policy_id",
+        "_value_storage_policy_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        volume_path: builtins.str,
+        fs_type: typing.Optional[builtins.str] = None,
+        storage_policy_id: typing.Optional[builtins.str] = None,
+        storage_policy_name: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''Represents a vSphere volume resource.
+
+        :param volume_path: volumePath is the path that identifies vSphere volume vmdk.
+        :param fs_type: fsType is filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+        :param storage_policy_id: storagePolicyID is the storage Policy Based Management (SPBM) profile ID associated with the StoragePolicyName.
+        :param storage_policy_name: storagePolicyName is the storage Policy Based Management (SPBM) profile name.
+
+        :schema: io.k8s.api.core.v1.VsphereVirtualDiskVolumeSource
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__2746f4a6c4d559e6cea852caa195b0acdbccb5fcc65b72211461db64e954a2e0)
+            check_type(argname="argument volume_path", value=volume_path, expected_type=type_hints["volume_path"])
+            check_type(argname="argument fs_type", value=fs_type, expected_type=type_hints["fs_type"])
+            check_type(argname="argument storage_policy_id", value=storage_policy_id, expected_type=type_hints["storage_policy_id"])
+            check_type(argname="argument storage_policy_name", value=storage_policy_name, expected_type=type_hints["storage_policy_name"])
+        self._value_volume_path = volume_path
+        self._value_fs_type = fs_type
+        self._value_storage_policy_id = storage_policy_id
+        self._value_storage_policy_name = storage_policy_name
+
+    @builtins.property
+    def volume_path(self) -> builtins.str:
+        '''volumePath is the path that identifies vSphere volume vmdk.
+
+        :schema: io.k8s.api.core.v1.VsphereVirtualDiskVolumeSource#volumePath
+        '''
+        result = self._value_volume_path
+        assert result is not None, "Required property 'volume_path' is missing"
+        return typing.cast(builtins.str, result)
+
+    @builtins.property
+    def fs_type(self) -> typing.Optional[builtins.str]:
+        '''fsType is filesystem type to mount.
+
+        Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified.
+
+        :schema: io.k8s.api.core.v1.VsphereVirtualDiskVolumeSource#fsType
+        '''
+        result = self._value_fs_type
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def storage_policy_id(self) -> typing.Optional[builtins.str]:
+        '''storagePolicyID is the storage Policy Based Management (SPBM) profile ID associated with the StoragePolicyName.
+
+        :schema: io.k8s.api.core.v1.VsphereVirtualDiskVolumeSource#storagePolicyID
+        '''
+        result = self._value_storage_policy_id
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def storage_policy_name(self) -> typing.Optional[builtins.str]:
+        '''storagePolicyName is the storage Policy Based Management (SPBM) profile name.
+
+        :schema: io.k8s.api.core.v1.VsphereVirtualDiskVolumeSource#storagePolicyName
+        '''
+        result = self._value_storage_policy_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "volume_path": self._value_volume_path,
+        }
+        if self._value_fs_type is not None:
+            values["fs_type"] = self._value_fs_type
+        if self._value_storage_policy_id is not None:
+            values["storage_policy_id"] = self._value_storage_policy_id
+        if self._value_storage_policy_name is not None:
+            values["storage_policy_name"] = self._value_storage_policy_name
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "VsphereVirtualDiskVolumeSource(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__2746f4a6c4d559e6cea852caa195b0acdbccb5fcc65b72211461db64e954a2e0(
+    *,
+    volume_path: builtins.str,
+    fs_type: typing.Optional[builtins.str] = None,
+    storage_policy_id: typing.Optional[builtins.str] = None,
+    storage_policy_name: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
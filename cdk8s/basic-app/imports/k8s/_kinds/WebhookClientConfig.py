@@ -0,0 +1,132 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .ServiceReference import ServiceReference
+
+
+@jsii.data_type(
+    jsii_type="k8s.WebhookClientConfig",
+    jsii_struct_bases=[],
+    name_mapping={"ca_bundle": "caBundle", "service": "service", "url": "url"},
+)
+class WebhookClientConfig(_base.Struct):
+    __slots__ = (
+        "_value_ca_bundle",
+        "_value_service",
+        "_value_url",
+    )
+
+    def __init__(
+        self,
+        *,
+        ca_bundle: typing.Optional[builtins.str] = None,
+        service: typing.Optional[typing.Union[ServiceReference, typing.Dict[builtins.str, typing.Any]]] = None,
+        url: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''WebhookClientConfig contains the information to make a TLS connection with the webhook.
+
+        :param ca_bundle: ``caBundle`` is a PEM encoded CA bundle which will be used to validate the webhook's server certificate. If unspecified, system trust roots on the apiserver are used.
+        :param service: ``service`` is a reference to the service for this webhook. Either ``service`` or ``url`` must be specified. If the webhook is running within the cluster, then you should use ``service``.
+        :param url: ``url`` gives the location of the webhook, in standard URL form (``scheme://host:port/path``). Exactly one of ``url`` or ``service`` must be specified. The ``host`` should not refer to a service running in the cluster; use the ``service`` field instead. The host might be resolved via external DNS in some apiservers (e.g., ``kube-apiserver`` cannot resolve in-cluster DNS as that would be a layering violation). ``host`` may also be an IP address. Please note that using ``localhost`` or ``127.0.0.1`` as a ``host`` is risky unless you take great care to run this webhook on all hosts which run an apiserver which might need to make calls to this webhook. Such installs are likely to be non-portable, i.e., not easy to turn up in a new cluster. The scheme must be "https"; the URL must begin with "https://". A path is optional, and if present may be any string permissible in a URL. You may use the path to pass an arbitrary string to the webhook, for example, a cluster identifier. Attempting to use a user or basic auth e.g. "user:password@" is not allowed. Fragments ("#...") and query parameters ("?...") are not allowed, either.
+
+        :schema: io.k8s.api.admissionregistration.v1.WebhookClientConfig
+        '''
+        if isinstance(service, dict):
+            service = ServiceReference(**service)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__01a4d6ecbc5d3180d6159e848cb27db4b9411ca07eae56bb4a7c0ea53622d2a9)
+            check_type(argname="argument ca_bundle", value=ca_bundle, expected_type=type_hints["ca_bundle"])
+            check_type(argname="argument service", value=service, expected_type=type_hints["service"])
+            check_type(argname="argument url", value=url, expected_type=type_hints["url"])
+        self._value_ca_bundle = ca_bundle
+        self._value_service = service
+        self._value_url = url
+
+    @builtins.property
+    def ca_bundle(self) -> typing.Optional[builtins.str]:
+        '''``caBundle`` is a PEM encoded CA bundle which will be used to validate the webhook's server certificate.
+
+        If unspecified, system trust roots on the apiserver are used.
+
+        :schema: io.k8s.api.admissionregistration.v1.WebhookClientConfig#caBundle
+        '''
+        result = self._value_ca_bundle
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def service(self) -> typing.Optional[ServiceReference]:
+        '''``service`` is a reference to the service for this webhook. Either ``service`` or ``url`` must be specified.
+
+        If the webhook is running within the cluster, then you should use ``service``.
+
+        :schema: io.k8s.api.admissionregistration.v1.WebhookClientConfig#service
+        '''
+        result = self._value_service
+        return typing.cast(typing.Optional[ServiceReference], result)
+
+    @builtins.property
+    def url(self) -> typing.Optional[builtins.str]:
+        '''``url`` gives the location of the webhook, in standard URL form (``scheme://host:port/path``).
+
+        Exactly one of ``url`` or ``service`` must be specified.
+
+        The ``host`` should not refer to a service running in the cluster; use the ``service`` field instead. The host might be resolved via external DNS in some apiservers (e.g., ``kube-apiserver`` cannot resolve in-cluster DNS as that would be a layering violation). ``host`` may also be an IP address.
+
+        Please note that using ``localhost`` or ``127.0.0.1`` as a ``host`` is risky unless you take great care to run this webhook on all hosts which run an apiserver which might need to make calls to this webhook. Such installs are likely to be non-portable, i.e., not easy to turn up in a new cluster.
+
+        The scheme must be "https"; the URL must begin with "https://".
+
+        A path is optional, and if present may be any string permissible in a URL. You may use the path to pass an arbitrary string to the webhook, for example, a cluster identifier.
+
+        Attempting to use a user or basic auth e.g. "user:password@" is not allowed. Fragments ("#...") and query parameters ("?...") are not allowed, either.
+
+        :schema: io.k8s.api.admissionregistration.v1.WebhookClientConfig#url
+        '''
+        result = self._value_url
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_ca_bundle is not None:
+            values["ca_bundle"] = self._value_ca_bundle
+        if self._value_service is not None:
+            values["service"] = self._value_service
+        if self._value_url is not None:
+            values["url"] = self._value_url
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "WebhookClientConfig(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__01a4d6ecbc5d3180d6159e848cb27db4b9411ca07eae56bb4a7c0ea53622d2a9(
+    *,
+    ca_bundle: typing.Optional[builtins.str] = None,
+    service: typing.Optional[typing.Union[ServiceReference, typing.Dict[builtins.str, typing.Any]]] = None,
+    url: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,105 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .WebhookClientConfig import WebhookClientConfig
+
+
+@jsii.data_type(
+    jsii_type="k8s.WebhookConversion",
+    jsii_struct_bases=[],
+    name_mapping={
+        "conversion_review_versions": "conversionReviewVersions",
+        "client_config": "clientConfig",
+    },
+)
+class WebhookConversion(_base.Struct):
+    __slots__ = (
+        "_value_conversion_review_versions",
+        "_value_client_config",
+    )
+
+    def __init__(
+        self,
+        *,
+        conversion_review_versions: typing.Sequence[builtins.str],
+        client_config: typing.Optional[typing.Union[WebhookClientConfig, typing.Dict[builtins.str, typing.Any]]] = None,
+    ) -> None:
+        '''WebhookConversion describes how to call a conversion webhook.
+
+        :param conversion_review_versions: conversionReviewVersions is an ordered list of preferred ``ConversionReview`` versions the Webhook expects. The API server will use the first version in the list which it supports. If none of the versions specified in this list are supported by API server, conversion will fail for the custom resource. If a persisted Webhook configuration specifies allowed versions and does not include any versions known to the API Server, calls to the webhook will fail.
+        :param client_config: clientConfig is the instructions for how to call the webhook if strategy is ``Webhook``.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.WebhookConversion
+        '''
+        if isinstance(client_config, dict):
+            client_config = WebhookClientConfig(**client_config)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__39d792294d4b2186ea27ff788c8be1ec22d2503757195afb3bd815d2f0d57bdf)
+            check_type(argname="argument conversion_review_versions", value=conversion_review_versions, expected_type=type_hints["conversion_review_versions"])
+            check_type(argname="argument client_config", value=client_config, expected_type=type_hints["client_config"])
+        self._value_conversion_review_versions = conversion_review_versions
+        self._value_client_config = client_config
+
+    @builtins.property
+    def conversion_review_versions(self) -> typing.List[builtins.str]:
+        '''conversionReviewVersions is an ordered list of preferred ``ConversionReview`` versions the Webhook expects.
+
+        The API server will use the first version in the list which it supports. If none of the versions specified in this list are supported by API server, conversion will fail for the custom resource. If a persisted Webhook configuration specifies allowed versions and does not include any versions known to the API Server, calls to the webhook will fail.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.WebhookConversion#conversionReviewVersions
+        '''
+        result = self._value_conversion_review_versions
+        assert result is not None, "Required property 'conversion_review_versions' is missing"
+        return typing.cast(typing.List[builtins.str], result)
+
+    @builtins.property
+    def client_config(self) -> typing.Optional[WebhookClientConfig]:
+        '''clientConfig is the instructions for how to call the webhook if strategy is ``Webhook``.
+
+        :schema: io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1.WebhookConversion#clientConfig
+        '''
+        result = self._value_client_config
+        return typing.cast(typing.Optional[WebhookClientConfig], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "conversion_review_versions": self._value_conversion_review_versions,
+        }
+        if self._value_client_config is not None:
+            values["client_config"] = self._value_client_config
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "WebhookConversion(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__39d792294d4b2186ea27ff788c8be1ec22d2503757195afb3bd815d2f0d57bdf(
+    *,
+    conversion_review_versions: typing.Sequence[builtins.str],
+    client_config: typing.Optional[typing.Union[WebhookClientConfig, typing.Dict[builtins.str, typing.Any]]] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,102 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+from .PodAffinityTerm import PodAffinityTerm
+
+
+@jsii.data_type(
+    jsii_type="k8s.WeightedPodAffinityTerm",
+    jsii_struct_bases=[],
+    name_mapping={"pod_affinity_term": "podAffinityTerm", "weight": "weight"},
+)
+class WeightedPodAffinityTerm(_base.Struct):
+    __slots__ = (
+        "_value_pod_affinity_term",
+        "_value_weight",
+    )
+
+    def __init__(
+        self,
+        *,
+        pod_affinity_term: typing.Union[PodAffinityTerm, typing.Dict[builtins.str, typing.Any]],
+        weight: jsii.Number,
+    ) -> None:
+        '''The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most preferred node(s).
+
+        :param pod_affinity_term: Required. A pod affinity term, associated with the corresponding weight.
+        :param weight: weight associated with matching the corresponding podAffinityTerm, in the range 1-100.
+
+        :schema: io.k8s.api.core.v1.WeightedPodAffinityTerm
+        '''
+        if isinstance(pod_affinity_term, dict):
+            pod_affinity_term = PodAffinityTerm(**pod_affinity_term)
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__889aca33f8b0538629ceed10073db78bcf15ce67a8d28c641286fa3ca92dd955)
+            check_type(argname="argument pod_affinity_term", value=pod_affinity_term, expected_type=type_hints["pod_affinity_term"])
+            check_type(argname="argument weight", value=weight, expected_type=type_hints["weight"])
+        self._value_pod_affinity_term = pod_affinity_term
+        self._value_weight = weight
+
+    @builtins.property
+    def pod_affinity_term(self) -> PodAffinityTerm:
+        '''Required.
+
+        A pod affinity term, associated with the corresponding weight.
+
+        :schema: io.k8s.api.core.v1.WeightedPodAffinityTerm#podAffinityTerm
+        '''
+        result = self._value_pod_affinity_term
+        assert result is not None, "Required property 'pod_affinity_term' is missing"
+        return typing.cast(PodAffinityTerm, result)
+
+    @builtins.property
+    def weight(self) -> jsii.Number:
+        '''weight associated with matching the corresponding podAffinityTerm, in the range 1-100.
+
+        :schema: io.k8s.api.core.v1.WeightedPodAffinityTerm#weight
+        '''
+        result = self._value_weight
+        assert result is not None, "Required property 'weight' is missing"
+        return typing.cast(jsii.Number, result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {
+            "pod_affinity_term": self._value_pod_affinity_term,
+            "weight": self._value_weight,
+        }
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "WeightedPodAffinityTerm(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__889aca33f8b0538629ceed10073db78bcf15ce67a8d28c641286fa3ca92dd955(
+    *,
+    pod_affinity_term: typing.Union[PodAffinityTerm, typing.Dict[builtins.str, typing.Any]],
+    weight: jsii.Number,
+) -> None:
+    """Type checking stubs"""
+    pass
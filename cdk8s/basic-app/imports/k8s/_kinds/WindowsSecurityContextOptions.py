@@ -0,0 +1,141 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+from .. import _base
+from .._base import (
+    abc,
+    builtins,
+    datetime,
+    enum,
+    typing,
+    jsii,
+    publication,
+    typing_extensions,
+    typeguard,
+    _metadata_package_version,
+    TYPEGUARD_MAJOR_VERSION,
+    check_type,
+    _cdk8s_d3d9af27,
+    _constructs_77d1e7e8,
+)
+
+
+@jsii.data_type(
+    jsii_type="k8s.WindowsSecurityContextOptions",
+    jsii_struct_bases=[],
+    name_mapping={
+        "gmsa_credential_spec": "gmsaCredentialSpec",
+        "gmsa_credential_spec_name": "gmsaCredentialSpecName",
+        "host_process": "hostProcess",
+        "run_as_user_name": "runAsUserName",
+    },
+)
+class WindowsSecurityContextOptions(_base.Struct):
+    __slots__ = (
+        "_value_gmsa_credential_spec",
+        "_value_gmsa_credential_spec_name",
+        "_value_host_process",
+        "_value_run_as_user_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        gmsa_credential_spec: typing.Optional[builtins.str] = None,
+        gmsa_credential_spec_name: typing.Optional[builtins.str] = None,
+        host_process: typing.Optional[builtins.bool] = None,
+        run_as_user_name: typing.Optional[builtins.str] = None,
+    ) -> None:
+        '''WindowsSecurityContextOptions contain Windows-specific options and credentials.
+
+        :param gmsa_credential_spec: GMSACredentialSpec is where the GMSA admission webhook (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the GMSA credential spec named by the GMSACredentialSpecName field.
+        :param gmsa_credential_spec_name: GMSACredentialSpecName is the name of the GMSA credential spec to use.
+        :param host_process: HostProcess determines if a container should be run as a 'Host Process' container. This field is alpha-level and will only be honored by components that enable the WindowsHostProcessContainers feature flag. Setting this field without the feature flag will result in errors when validating the Pod. All of a Pod's containers must have the same effective HostProcess value (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers). In addition, if HostProcess is true then HostNetwork must also be set to true.
+        :param run_as_user_name: The UserName in Windows to run the entrypoint of the container process. Defaults to the user specified in image metadata if unspecified. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence. Default: the user specified in image metadata if unspecified. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+
+        :schema: io.k8s.api.core.v1.WindowsSecurityContextOptions
+        '''
+        if _base.TYPECHECK:
+            type_hints = typing.get_type_hints(_typecheckingstub__8f8f55e98c07892c190b8b23ad570c48466b356f369032020c69a96f2ea2d0ea)
+            check_type(argname="argument gmsa_credential_spec", value=gmsa_credential_spec, expected_type=type_hints["gmsa_credential_spec"])
+            check_type(argname="argument gmsa_credential_spec_name", value=gmsa_credential_spec_name, expected_type=type_hints["gmsa_credential_spec_name"])
+            check_type(argname="argument host_process", value=host_process, expected_type=type_hints["host_process"])
+            check_type(argname="argument run_as_user_name", value=run_as_user_name, expected_type=type_hints["run_as_user_name"])
+        self._value_gmsa_credential_spec = gmsa_credential_spec
+        self._value_gmsa_credential_spec_name = gmsa_credential_spec_name
+        self._value_host_process = host_process
+        self._value_run_as_user_name = run_as_user_name
+
+    @builtins.property
+    def gmsa_credential_spec(self) -> typing.Optional[builtins.str]:
+        '''GMSACredentialSpec is where the GMSA admission webhook (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the GMSA credential spec named by the GMSACredentialSpecName field.
+
+        :schema: io.k8s.api.core.v1.WindowsSecurityContextOptions#gmsaCredentialSpec
+        '''
+        result = self._value_gmsa_credential_spec
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def gmsa_credential_spec_name(self) -> typing.Optional[builtins.str]:
+        '''GMSACredentialSpecName is the name of the GMSA credential spec to use.
+
+        :schema: io.k8s.api.core.v1.WindowsSecurityContextOptions#gmsaCredentialSpecName
+        '''
+        result = self._value_gmsa_credential_spec_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def host_process(self) -> typing.Optional[builtins.bool]:
+        '''HostProcess determines if a container should be run as a 'Host Process' container.
+
+        This field is alpha-level and will only be honored by components that enable the WindowsHostProcessContainers feature flag. Setting this field without the feature flag will result in errors when validating the Pod. All of a Pod's containers must have the same effective HostProcess value (it is not allowed to have a mix of HostProcess containers and non-HostProcess containers).  In addition, if HostProcess is true then HostNetwork must also be set to true.
+
+        :schema: io.k8s.api.core.v1.WindowsSecurityContextOptions#hostProcess
+        '''
+        result = self._value_host_process
+        return typing.cast(typing.Optional[builtins.bool], result)
+
+    @builtins.property
+    def run_as_user_name(self) -> typing.Optional[builtins.str]:
+        '''The UserName in Windows to run the entrypoint of the container process.
+
+        Defaults to the user specified in image metadata if unspecified. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+
+        :default: the user specified in image metadata if unspecified. May also be set in PodSecurityContext. If set in both SecurityContext and PodSecurityContext, the value specified in SecurityContext takes precedence.
+
+        :schema: io.k8s.api.core.v1.WindowsSecurityContextOptions#runAsUserName
+        '''
+        result = self._value_run_as_user_name
+        return typing.cast(typing.Optional[builtins.str], result)
+
+    @builtins.property
+    def _values(self) -> typing.Dict[builtins.str, typing.Any]:
+        values: typing.Dict[builtins.str, typing.Any] = {}
+        if self._value_gmsa_credential_spec is not None:
+            values["gmsa_credential_spec"] = self._value_gmsa_credential_spec
+        if self._value_gmsa_credential_spec_name is not None:
+            values["gmsa_credential_spec_name"] = self._value_gmsa_credential_spec_name
+        if self._value_host_process is not None:
+            values["host_process"] = self._value_host_process
+        if self._value_run_as_user_name is not None:
+            values["run_as_user_name"] = self._value_run_as_user_name
+        return values
+
+    def __eq__(self, rhs: typing.Any) -> builtins.bool:
+        return isinstance(rhs, self.__class__) and rhs._values == self._values
+
+    def __ne__(self, rhs: typing.Any) -> builtins.bool:
+        return not (rhs == self)
+
+    def __repr__(self) -> str:
+        return "WindowsSecurityContextOptions(%s)" % ", ".join(
+            k + "=" + repr(v) for k, v in self._values.items()
+        )
+
+def _typecheckingstub__8f8f55e98c07892c190b8b23ad570c48466b356f369032020c69a96f2ea2d0ea(
+    *,
+    gmsa_credential_spec: typing.Optional[builtins.str] = None,
+    gmsa_credential_spec_name: typing.Optional[builtins.str] = None,
+    host_process: typing.Optional[builtins.bool] = None,
+    run_as_user_name: typing.Optional[builtins.str] = None,
+) -> None:
+    """Type checking stubs"""
+    pass
@@ -0,0 +1,2363 @@
+# Generated by tools/k8s_codegen.py, do not edit.
+#
+# The JSON the JavaScript side of these bindings renders, for lib/emitter.py:
+# the apiVersion and kind of every API object, and the fields of every struct
+# in the order its toJson converter writes them, each with the struct the
+# field holds ("Struct", "Struct[]" for arrays, "Struct{}" for maps) or "".
+
+GVK = {
+    "KubeApiService": ("apiregistration.k8s.io/v1", "APIService"),
+    "KubeApiServiceList": ("apiregistration.k8s.io/v1", "APIServiceList"),
+    "KubeBinding": ("v1", "Binding"),
+    "KubeCertificateSigningRequest": ("certificates.k8s.io/v1", "CertificateSigningRequest"),
+    "KubeCertificateSigningRequestList": ("certificates.k8s.io/v1", "CertificateSigningRequestList"),
+    "KubeClusterCidrListV1Alpha1": ("networking.k8s.io/v1alpha1", "ClusterCIDRList"),
+    "KubeClusterCidrv1Alpha1": ("networking.k8s.io/v1alpha1", "ClusterCIDR"),
+    "KubeClusterRole": ("rbac.authorization.k8s.io/v1", "ClusterRole"),
+    "KubeClusterRoleBinding": ("rbac.authorization.k8s.io/v1", "ClusterRoleBinding"),
+    "KubeClusterRoleBindingList": ("rbac.authorization.k8s.io/v1", "ClusterRoleBindingList"),
+    "KubeClusterRoleList": ("rbac.authorization.k8s.io/v1", "ClusterRoleList"),
+    "KubeComponentStatus": ("v1", "ComponentStatus"),
+    "KubeComponentStatusList": ("v1", "ComponentStatusList"),
+    "KubeConfigMap": ("v1", "ConfigMap"),
+    "KubeConfigMapList": ("v1", "ConfigMapList"),
+    "KubeControllerRevision": ("apps/v1", "ControllerRevision"),
+    "KubeControllerRevisionList": ("apps/v1", "ControllerRevisionList"),
+    "KubeCronJob": ("batch/v1", "CronJob"),
+    "KubeCronJobList": ("batch/v1", "CronJobList"),
+    "KubeCsiDriver": ("storage.k8s.io/v1", "CSIDriver"),
+    "KubeCsiDriverList": ("storage.k8s.io/v1", "CSIDriverList"),
+    "KubeCsiNode": ("storage.k8s.io/v1", "CSINode"),
+    "KubeCsiNodeList": ("storage.k8s.io/v1", "CSINodeList"),
+    "KubeCsiStorageCapacity": ("storage.k8s.io/v1", "CSIStorageCapacity"),
+    "KubeCsiStorageCapacityList": ("storage.k8s.io/v1", "CSIStorageCapacityList"),
+    "KubeCsiStorageCapacityListV1Beta1": ("storage.k8s.io/v1beta1", "CSIStorageCapacityList"),
+    "KubeCsiStorageCapacityV1Beta1": ("storage.k8s.io/v1beta1", "CSIStorageCapacity"),
+    "KubeCustomResourceDefinition": ("apiextensions.k8s.io/v1", "CustomResourceDefinition"),
+    "KubeCustomResourceDefinitionList": ("apiextensions.k8s.io/v1", "CustomResourceDefinitionList"),
+    "KubeDaemonSet": ("apps/v1", "DaemonSet"),
+    "KubeDaemonSetList": ("apps/v1", "DaemonSetList"),
+    "KubeDeployment": ("apps/v1", "Deployment"),
+    "KubeDeploymentList": ("apps/v1", "DeploymentList"),
+    "KubeEndpointSlice": ("discovery.k8s.io/v1", "EndpointSlice"),
+    "KubeEndpointSliceList": ("discovery.k8s.io/v1", "EndpointSliceList"),
+    "KubeEndpoints": ("v1", "Endpoints"),
+    "KubeEndpointsList": ("v1", "EndpointsList"),
+    "KubeEvent": ("events.k8s.io/v1", "Event"),
+    "KubeEventList": ("events.k8s.io/v1", "EventList"),
+    "KubeEviction": ("policy/v1", "Eviction"),
+    "KubeFlowSchemaListV1Beta1": ("flowcontrol.apiserver.k8s.io/v1beta1", "FlowSchemaList"),
+    "KubeFlowSchemaListV1Beta2": ("flowcontrol.apiserver.k8s.io/v1beta2", "FlowSchemaList"),
+    "KubeFlowSchemaV1Beta1": ("flowcontrol.apiserver.k8s.io/v1beta1", "FlowSchema"),
+    "KubeFlowSchemaV1Beta2": ("flowcontrol.apiserver.k8s.io/v1beta2", "FlowSchema"),
+    "KubeHorizontalPodAutoscaler": ("autoscaling/v1", "HorizontalPodAutoscaler"),
+    "KubeHorizontalPodAutoscalerList": ("autoscaling/v1", "HorizontalPodAutoscalerList"),
+    "KubeHorizontalPodAutoscalerListV2": ("autoscaling/v2", "HorizontalPodAutoscalerList"),
+    "KubeHorizontalPodAutoscalerListV2Beta2": ("autoscaling/v2beta2", "HorizontalPodAutoscalerList"),
+    "KubeHorizontalPodAutoscalerV2": ("autoscaling/v2", "HorizontalPodAutoscaler"),
+    "KubeHorizontalPodAutoscalerV2Beta2": ("autoscaling/v2beta2", "HorizontalPodAutoscaler"),
+    "KubeIngress": ("networking.k8s.io/v1", "Ingress"),
+    "KubeIngressClass": ("networking.k8s.io/v1", "IngressClass"),
+    "KubeIngressClassList": ("networking.k8s.io/v1", "IngressClassList"),
+    "KubeIngressList": ("networking.k8s.io/v1", "IngressList"),
+    "KubeJob": ("batch/v1", "Job"),
+    "KubeJobList": ("batch/v1", "JobList"),
+    "KubeLease": ("coordination.k8s.io/v1", "Lease"),
+    "KubeLeaseList": ("coordination.k8s.io/v1", "LeaseList"),
+    "KubeLimitRange": ("v1", "LimitRange"),
+    "KubeLimitRangeList": ("v1", "LimitRangeList"),
+    "KubeLocalSubjectAccessReview": ("authorization.k8s.io/v1", "LocalSubjectAccessReview"),
+    "KubeMutatingWebhookConfiguration": ("admissionregistration.k8s.io/v1", "MutatingWebhookConfiguration"),
+    "KubeMutatingWebhookConfigurationList": ("admissionregistration.k8s.io/v1", "MutatingWebhookConfigurationList"),
+    "KubeNamespace": ("v1", "Namespace"),
+    "KubeNamespaceList": ("v1", "NamespaceList"),
+    "KubeNetworkPolicy": ("networking.k8s.io/v1", "NetworkPolicy"),
+    "KubeNetworkPolicyList": ("networking.k8s.io/v1", "NetworkPolicyList"),
+    "KubeNode": ("v1", "Node"),
+    "KubeNodeList": ("v1", "NodeList"),
+    "KubePersistentVolume": ("v1", "PersistentVolume"),
+    "KubePersistentVolumeClaim": ("v1", "PersistentVolumeClaim"),
+    "KubePersistentVolumeClaimList": ("v1", "PersistentVolumeClaimList"),
+    "KubePersistentVolumeList": ("v1", "PersistentVolumeList"),
+    "KubePod": ("v1", "Pod"),
+    "KubePodDisruptionBudget": ("policy/v1", "PodDisruptionBudget"),
+    "KubePodDisruptionBudgetList": ("policy/v1", "PodDisruptionBudgetList"),
+    "KubePodList": ("v1", "PodList"),
+    "KubePodTemplate": ("v1", "PodTemplate"),
+    "KubePodTemplateList": ("v1", "PodTemplateList"),
+    "KubePriorityClass": ("scheduling.k8s.io/v1", "PriorityClass"),
+    "KubePriorityClassList": ("scheduling.k8s.io/v1", "PriorityClassList"),
+    "KubePriorityLevelConfigurationListV1Beta1": ("flowcontrol.apiserver.k8s.io/v1beta1", "PriorityLevelConfigurationList"),
+    "KubePriorityLevelConfigurationListV1Beta2": ("flowcontrol.apiserver.k8s.io/v1beta2", "PriorityLevelConfigurationList"),
+    "KubePriorityLevelConfigurationV1Beta1": ("flowcontrol.apiserver.k8s.io/v1beta1", "PriorityLevelConfiguration"),
+    "KubePriorityLevelConfigurationV1Beta2": ("flowcontrol.apiserver.k8s.io/v1beta2", "PriorityLevelConfiguration"),
+    "KubeReplicaSet": ("apps/v1", "ReplicaSet"),
+    "KubeReplicaSetList": ("apps/v1", "ReplicaSetList"),
+    "KubeReplicationController": ("v1", "ReplicationController"),
+    "KubeReplicationControllerList": ("v1", "ReplicationControllerList"),
+    "KubeResourceQuota": ("v1", "ResourceQuota"),
+    "KubeResourceQuotaList": ("v1", "ResourceQuotaList"),
+    "KubeRole": ("rbac.authorization.k8s.io/v1", "Role"),
+    "KubeRoleBinding": ("rbac.authorization.k8s.io/v1", "RoleBinding"),
+    "KubeRoleBindingList": ("rbac.authorization.k8s.io/v1", "RoleBindingList"),
+    "KubeRoleList": ("rbac.authorization.k8s.io/v1", "RoleList"),
+    "KubeRuntimeClass": ("node.k8s.io/v1", "RuntimeClass"),
+    "KubeRuntimeClassList": ("node.k8s.io/v1", "RuntimeClassList"),
+    "KubeScale": ("autoscaling/v1", "Scale"),
+    "KubeSecret": ("v1", "Secret"),
+    "KubeSecretList": ("v1", "SecretList"),
+    "KubeSelfSubjectAccessReview": ("authorization.k8s.io/v1", "SelfSubjectAccessReview"),
+    "KubeSelfSubjectRulesReview": ("authorization.k8s.io/v1", "SelfSubjectRulesReview"),
+    "KubeService": ("v1", "Service"),
+    "KubeServiceAccount": ("v1", "ServiceAccount"),
+    "KubeServiceAccountList": ("v1", "ServiceAccountList"),
+    "KubeServiceList": ("v1", "ServiceList"),
+    "KubeStatefulSet": ("apps/v1", "StatefulSet"),
+    "KubeStatefulSetList": ("apps/v1", "StatefulSetList"),
+    "KubeStatus": ("v1", "Status"),
+    "KubeStorageClass": ("storage.k8s.io/v1", "StorageClass"),
+    "KubeStorageClassList": ("storage.k8s.io/v1", "StorageClassList"),
+    "KubeStorageVersionListV1Alpha1": ("internal.apiserver.k8s.io/v1alpha1", "StorageVersionList"),
+    "KubeStorageVersionV1Alpha1": ("internal.apiserver.k8s.io/v1alpha1", "StorageVersion"),
+    "KubeSubjectAccessReview": ("authorization.k8s.io/v1", "SubjectAccessReview"),
+    "KubeTokenRequest": ("authentication.k8s.io/v1", "TokenRequest"),
+    "KubeTokenReview": ("authentication.k8s.io/v1", "TokenReview"),
+    "KubeValidatingWebhookConfiguration": ("admissionregistration.k8s.io/v1", "ValidatingWebhookConfiguration"),
+    "KubeValidatingWebhookConfigurationList": ("admissionregistration.k8s.io/v1", "ValidatingWebhookConfigurationList"),
+    "KubeVolumeAttachment": ("storage.k8s.io/v1", "VolumeAttachment"),
+    "KubeVolumeAttachmentList": ("storage.k8s.io/v1", "VolumeAttachmentList"),
+}
+
+FIELDS = {
+    "Affinity": (
+        ("nodeAffinity", "NodeAffinity"),
+        ("podAffinity", "PodAffinity"),
+        ("podAntiAffinity", "PodAntiAffinity"),
+    ),
+    "AggregationRule": (
+        ("clusterRoleSelectors", "LabelSelector[]"),
+    ),
+    "ApiServiceSpec": (
+        ("caBundle", ""),
+        ("group", ""),
+        ("groupPriorityMinimum", ""),
+        ("insecureSkipTLSVerify", ""),
+        ("service", "ServiceReference"),
+        ("version", ""),
+        ("versionPriority", ""),
+    ),
+    "AwsElasticBlockStoreVolumeSource": (
+        ("fsType", ""),
+        ("partition", ""),
+        ("readOnly", ""),
+        ("volumeID", ""),
+    ),
+    "AzureDiskVolumeSource": (
+        ("cachingMode", ""),
+        ("diskName", ""),
+        ("diskURI", ""),
+        ("fsType", ""),
+        ("kind", ""),
+        ("readOnly", ""),
+    ),
+    "AzureFilePersistentVolumeSource": (
+        ("readOnly", ""),
+        ("secretName", ""),
+        ("secretNamespace", ""),
+        ("shareName", ""),
+    ),
+    "AzureFileVolumeSource": (
+        ("readOnly", ""),
+        ("secretName", ""),
+        ("shareName", ""),
+    ),
+    "BoundObjectReference": (
+        ("apiVersion", ""),
+        ("kind", ""),
+        ("name", ""),
+        ("uid", ""),
+    ),
+    "Capabilities": (
+        ("add", ""),
+        ("drop", ""),
+    ),
+    "CephFsPersistentVolumeSource": (
+        ("monitors", ""),
+        ("path", ""),
+        ("readOnly", ""),
+        ("secretFile", ""),
+        ("secretRef", "SecretReference"),
+        ("user", ""),
+    ),
+    "CephFsVolumeSource": (
+        ("monitors", ""),
+        ("path", ""),
+        ("readOnly", ""),
+        ("secretFile", ""),
+        ("secretRef", "LocalObjectReference"),
+        ("user", ""),
+    ),
+    "CertificateSigningRequestSpec": (
+        ("expirationSeconds", ""),
+        ("extra", ""),
+        ("groups", ""),
+        ("request", ""),
+        ("signerName", ""),
+        ("uid", ""),
+        ("usages", ""),
+        ("username", ""),
+    ),
+    "CinderPersistentVolumeSource": (
+        ("fsType", ""),
+        ("readOnly", ""),
+        ("secretRef", "SecretReference"),
+        ("volumeID", ""),
+    ),
+    "CinderVolumeSource": (
+        ("fsType", ""),
+        ("readOnly", ""),
+        ("secretRef", "LocalObjectReference"),
+        ("volumeID", ""),
+    ),
+    "ClientIpConfig": (
+        ("timeoutSeconds", ""),
+    ),
+    "ClusterCidrSpecV1Alpha1": (
+        ("ipv4", ""),
+        ("ipv6", ""),
+        ("nodeSelector", "NodeSelector"),
+        ("perNodeHostBits", ""),
+    ),
+    "ComponentCondition": (
+        ("error", ""),
+        ("message", ""),
+        ("status", ""),
+        ("type", ""),
+    ),
+    "ConfigMapEnvSource": (
+        ("name", ""),
+        ("optional", ""),
+    ),
+    "ConfigMapKeySelector": (
+        ("key", ""),
+        ("name", ""),
+        ("optional", ""),
+    ),
+    "ConfigMapNodeConfigSource": (
+        ("kubeletConfigKey", ""),
+        ("name", ""),
+        ("namespace", ""),
+        ("resourceVersion", ""),
+        ("uid", ""),
+    ),
+    "ConfigMapProjection": (
+        ("items", "KeyToPath[]"),
+        ("name", ""),
+        ("optional", ""),
+    ),
+    "ConfigMapVolumeSource": (
+        ("defaultMode", ""),
+        ("items", "KeyToPath[]"),
+        ("name", ""),
+        ("optional", ""),
+    ),
+    "Container": (
+        ("args", ""),
+        ("command", ""),
+        ("env", "EnvVar[]"),
+        ("envFrom", "EnvFromSource[]"),
+        ("image", ""),
+        ("imagePullPolicy", ""),
+        ("lifecycle", "Lifecycle"),
+        ("livenessProbe", "Probe"),
+        ("name", ""),
+        ("ports", "ContainerPort[]"),
+        ("readinessProbe", "Probe"),
+        ("resources", "ResourceRequirements"),
+        ("securityContext", "SecurityContext"),
+        ("startupProbe", "Probe"),
+        ("stdin", ""),
+        ("stdinOnce", ""),
+        ("terminationMessagePath", ""),
+        ("terminationMessagePolicy", ""),
+        ("tty", ""),
+        ("volumeDevices", "VolumeDevice[]"),
+        ("volumeMounts", "VolumeMount[]"),
+        ("workingDir", ""),
+    ),
+    "ContainerPort": (
+        ("containerPort", ""),
+        ("hostIP", ""),
+        ("hostPort", ""),
+        ("name", ""),
+        ("protocol", ""),
+    ),
+    "ContainerResourceMetricSourceV2": (
+        ("container", ""),
+        ("name", ""),
+        ("target", "MetricTargetV2"),
+    ),
+    "ContainerResourceMetricSourceV2Beta2": (
+        ("container", ""),
+        ("name", ""),
+        ("target", "MetricTargetV2Beta2"),
+    ),
+    "CronJobSpec": (
+        ("concurrencyPolicy", ""),
+        ("failedJobsHistoryLimit", ""),
+        ("jobTemplate", "JobTemplateSpec"),
+        ("schedule", ""),
+        ("startingDeadlineSeconds", ""),
+        ("successfulJobsHistoryLimit", ""),
+        ("suspend", ""),
+        ("timeZone", ""),
+    ),
+    "CrossVersionObjectReference": (
+        ("apiVersion", ""),
+        ("kind", ""),
+        ("name", ""),
+    ),
+    "CrossVersionObjectReferenceV2": (
+        ("apiVersion", ""),
+        ("kind", ""),
+        ("name", ""),
+    ),
+    "CrossVersionObjectReferenceV2Beta2": (
+        ("apiVersion", ""),
+        ("kind", ""),
+        ("name", ""),
+    ),
+    "CsiDriverSpec": (
+        ("attachRequired", ""),
+        ("fsGroupPolicy", ""),
+        ("podInfoOnMount", ""),
+        ("requiresRepublish", ""),
+        ("seLinuxMount", ""),
+        ("storageCapacity", ""),
+        ("tokenRequests", "TokenRequest[]"),
+        ("volumeLifecycleModes", ""),
+    ),
+    "CsiNodeDriver": (
+        ("allocatable", "VolumeNodeResources"),
+        ("name", ""),
+        ("nodeID", ""),
+        ("topologyKeys", ""),
+    ),
+    "CsiNodeSpec": (
+        ("drivers", "CsiNodeDriver[]"),
+    ),
+    "CsiPersistentVolumeSource": (
+        ("controllerExpandSecretRef", "SecretReference"),
+        ("controllerPublishSecretRef", "SecretReference"),
+        ("driver", ""),
+        ("fsType", ""),
+        ("nodeExpandSecretRef", "SecretReference"),
+        ("nodePublishSecretRef", "SecretReference"),
+        ("nodeStageSecretRef", "SecretReference"),
+        ("readOnly", ""),
+        ("volumeAttributes", ""),
+        ("volumeHandle", ""),
+    ),
+    "CsiVolumeSource": (
+        ("driver", ""),
+        ("fsType", ""),
+        ("nodePublishSecretRef", "LocalObjectReference"),
+        ("readOnly", ""),
+        ("volumeAttributes", ""),
+    ),
+    "CustomResourceColumnDefinition": (
+        ("description", ""),
+        ("format", ""),
+        ("jsonPath", ""),
+        ("name", ""),
+        ("priority", ""),
+        ("type", ""),
+    ),
+    "CustomResourceConversion": (
+        ("strategy", ""),
+        ("webhook", "WebhookConversion"),
+    ),
+    "CustomResourceDefinitionNames": (
+        ("categories", ""),
+        ("kind", ""),
+        ("listKind", ""),
+        ("plural", ""),
+        ("shortNames", ""),
+        ("singular", ""),
+    ),
+    "CustomResourceDefinitionSpec": (
+        ("conversion", "CustomResourceConversion"),
+        ("group", ""),
+        ("names", "CustomResourceDefinitionNames"),
+        ("preserveUnknownFields", ""),
+        ("scope", ""),
+        ("versions", "CustomResourceDefinitionVersion[]"),
+    ),
+    "CustomResourceDefinitionVersion": (
+        ("additionalPrinterColumns", "CustomResourceColumnDefinition[]"),
+        ("deprecated", ""),
+        ("deprecationWarning", ""),
+        ("name", ""),
+        ("schema", "CustomResourceValidation"),
+        ("served", ""),
+        ("storage", ""),
+        ("subresources", "CustomResourceSubresources"),
+    ),
+    "CustomResourceSubresourceScale": (
+        ("labelSelectorPath", ""),
+        ("specReplicasPath", ""),
+        ("statusReplicasPath", ""),
+    ),
+    "CustomResourceSubresources": (
+        ("scale", "CustomResourceSubresourceScale"),
+        ("status", ""),
+    ),
+    "CustomResourceValidation": (
+        ("openAPIV3Schema", "JsonSchemaProps"),
+    ),
+    "DaemonSetSpec": (
+        ("minReadySeconds", ""),
+        ("revisionHistoryLimit", ""),
+        ("selector", "LabelSelector"),
+        ("template", "PodTemplateSpec"),
+        ("updateStrategy", "DaemonSetUpdateStrategy"),
+    ),
+    "DaemonSetUpdateStrategy": (
+        ("rollingUpdate", "RollingUpdateDaemonSet"),
+        ("type", ""),
+    ),
+    "DeleteOptions": (
+        ("apiVersion", ""),
+        ("dryRun", ""),
+        ("gracePeriodSeconds", ""),
+        ("kind", ""),
+        ("orphanDependents", ""),
+        ("preconditions", "Preconditions"),
+        ("propagationPolicy", ""),
+    ),
+    "DeploymentSpec": (
+        ("minReadySeconds", ""),
+        ("paused", ""),
+        ("progressDeadlineSeconds", ""),
+        ("replicas", ""),
+        ("revisionHistoryLimit", ""),
+        ("selector", "LabelSelector"),
+        ("strategy", "DeploymentStrategy"),
+        ("template", "PodTemplateSpec"),
+    ),
+    "DeploymentStrategy": (
+        ("rollingUpdate", "RollingUpdateDeployment"),
+        ("type", ""),
+    ),
+    "DownwardApiProjection": (
+        ("items", "DownwardApiVolumeFile[]"),
+    ),
+    "DownwardApiVolumeFile": (
+        ("fieldRef", "ObjectFieldSelector"),
+        ("mode", ""),
+        ("path", ""),
+        ("resourceFieldRef", "ResourceFieldSelector"),
+    ),
+    "DownwardApiVolumeSource": (
+        ("defaultMode", ""),
+        ("items", "DownwardApiVolumeFile[]"),
+    ),
+    "EmptyDirVolumeSource": (
+        ("medium", ""),
+        ("sizeLimit", ""),
+    ),
+    "Endpoint": (
+        ("addresses", ""),
+        ("conditions", "EndpointConditions"),
+        ("deprecatedTopology", ""),
+        ("hints", "EndpointHints"),
+        ("hostname", ""),
+        ("nodeName", ""),
+        ("targetRef", "ObjectReference"),
+        ("zone", ""),
+    ),
+    "EndpointAddress": (
+        ("hostname", ""),
+        ("ip", ""),
+        ("nodeName", ""),
+        ("targetRef", "ObjectReference"),
+    ),
+    "EndpointConditions": (
+        ("ready", ""),
+        ("serving", ""),
+        ("terminating", ""),
+    ),
+    "EndpointHints": (
+        ("forZones", "ForZone[]"),
+    ),
+    "EndpointPort": (
+        ("appProtocol", ""),
+        ("name", ""),
+        ("port", ""),
+        ("protocol", ""),
+    ),
+    "EndpointSubset": (
+        ("addresses", "EndpointAddress[]"),
+        ("notReadyAddresses", "EndpointAddress[]"),
+        ("ports", "EndpointPort[]"),
+    ),
+    "EnvFromSource": (
+        ("configMapRef", "ConfigMapEnvSource"),
+        ("prefix", ""),
+        ("secretRef", "SecretEnvSource"),
+    ),
+    "EnvVar": (
+        ("name", ""),
+        ("value", ""),
+        ("valueFrom", "EnvVarSource"),
+    ),
+    "EnvVarSource": (
+        ("configMapKeyRef", "ConfigMapKeySelector"),
+        ("fieldRef", "ObjectFieldSelector"),
+        ("resourceFieldRef", "ResourceFieldSelector"),
+        ("secretKeyRef", "SecretKeySelector"),
+    ),
+    "EphemeralContainer": (
+        ("args", ""),
+        ("command", ""),
+        ("env", "EnvVar[]"),
+        ("envFrom", "EnvFromSource[]"),
+        ("image", ""),
+        ("imagePullPolicy", ""),
+        ("lifecycle", "Lifecycle"),
+        ("livenessProbe", "Probe"),
+        ("name", ""),
+        ("ports", "ContainerPort[]"),
+        ("readinessProbe", "Probe"),
+        ("resources", "ResourceRequirements"),
+        ("securityContext", "SecurityContext"),
+        ("startupProbe", "Probe"),
+        ("stdin", ""),
+        ("stdinOnce", ""),
+        ("targetContainerName", ""),
+        ("terminationMessagePath", ""),
+        ("terminationMessagePolicy", ""),
+        ("tty", ""),
+        ("volumeDevices", "VolumeDevice[]"),
+        ("volumeMounts", "VolumeMount[]"),
+        ("workingDir", ""),
+    ),
+    "EphemeralVolumeSource": (
+        ("volumeClaimTemplate", "PersistentVolumeClaimTemplate"),
+    ),
+    "EventSeries": (
+        ("count", ""),
+        ("lastObservedTime", ""),
+    ),
+    "EventSource": (
+        ("component", ""),
+        ("host", ""),
+    ),
+    "ExecAction": (
+        ("command", ""),
+    ),
+    "ExternalDocumentation": (
+        ("description", ""),
+        ("url", ""),
+    ),
+    "ExternalMetricSourceV2": (
+        ("metric", "MetricIdentifierV2"),
+        ("target", "MetricTargetV2"),
+    ),
+    "ExternalMetricSourceV2Beta2": (
+        ("metric", "MetricIdentifierV2Beta2"),
+        ("target", "MetricTargetV2Beta2"),
+    ),
+    "FcVolumeSource": (
+        ("fsType", ""),
+        ("lun", ""),
+        ("readOnly", ""),
+        ("targetWWNs", ""),
+        ("wwids", ""),
+    ),
+    "FlexPersistentVolumeSource": (
+        ("driver", ""),
+        ("fsType", ""),
+        ("options", ""),
+        ("readOnly", ""),
+        ("secretRef", "SecretReference"),
+    ),
+    "FlexVolumeSource": (
+        ("driver", ""),
+        ("fsType", ""),
+        ("options", ""),
+        ("readOnly", ""),
+        ("secretRef", "LocalObjectReference"),
+    ),
+    "FlockerVolumeSource": (
+        ("datasetName", ""),
+        ("datasetUUID", ""),
+    ),
+    "FlowDistinguisherMethodV1Beta1": (
+        ("type", ""),
+    ),
+    "FlowDistinguisherMethodV1Beta2": (
+        ("type", ""),
+    ),
+    "FlowSchemaSpecV1Beta1": (
+        ("distinguisherMethod", "FlowDistinguisherMethodV1Beta1"),
+        ("matchingPrecedence", ""),
+        ("priorityLevelConfiguration", "PriorityLevelConfigurationReferenceV1Beta1"),
+        ("rules", "PolicyRulesWithSubjectsV1Beta1[]"),
+    ),
+    "FlowSchemaSpecV1Beta2": (
+        ("distinguisherMethod", "FlowDistinguisherMethodV1Beta2"),
+        ("matchingPrecedence", ""),
+        ("priorityLevelConfiguration", "PriorityLevelConfigurationReferenceV1Beta2"),
+        ("rules", "PolicyRulesWithSubjectsV1Beta2[]"),
+    ),
+    "ForZone": (
+        ("name", ""),
+    ),
+    "GcePersistentDiskVolumeSource": (
+        ("fsType", ""),
+        ("partition", ""),
+        ("pdName", ""),
+        ("readOnly", ""),
+    ),
+    "GitRepoVolumeSource": (
+        ("directory", ""),
+        ("repository", ""),
+        ("revision", ""),
+    ),
+    "GlusterfsPersistentVolumeSource": (
+        ("endpoints", ""),
+        ("endpointsNamespace", ""),
+        ("path", ""),
+        ("readOnly", ""),
+    ),
+    "GlusterfsVolumeSource": (
+        ("endpoints", ""),
+        ("path", ""),
+        ("readOnly", ""),
+    ),
+    "GroupSubjectV1Beta1": (
+        ("name", ""),
+    ),
+    "GroupSubjectV1Beta2": (
+        ("name", ""),
+    ),
+    "GrpcAction": (
+        ("port", ""),
+        ("service", ""),
+    ),
+    "HorizontalPodAutoscalerBehaviorV2": (
+        ("scaleDown", "HpaScalingRulesV2"),
+        ("scaleUp", "HpaScalingRulesV2"),
+    ),
+    "HorizontalPodAutoscalerBehaviorV2Beta2": (
+        ("scaleDown", "HpaScalingRulesV2Beta2"),
+        ("scaleUp", "HpaScalingRulesV2Beta2"),
+    ),
+    "HorizontalPodAutoscalerSpec": (
+        ("maxReplicas", ""),
+        ("minReplicas", ""),
+        ("scaleTargetRef", "CrossVersionObjectReference"),
+        ("targetCPUUtilizationPercentage", ""),
+    ),
+    "HorizontalPodAutoscalerSpecV2": (
+        ("behavior", "HorizontalPodAutoscalerBehaviorV2"),
+        ("maxReplicas", ""),
+        ("metrics", "MetricSpecV2[]"),
+        ("minReplicas", ""),
+        ("scaleTargetRef", "CrossVersionObjectReferenceV2"),
+    ),
+    "HorizontalPodAutoscalerSpecV2Beta2": (
+        ("behavior", "HorizontalPodAutoscalerBehaviorV2Beta2"),
+        ("maxReplicas", ""),
+        ("metrics", "MetricSpecV2Beta2[]"),
+        ("minReplicas", ""),
+        ("scaleTargetRef", "CrossVersionObjectReferenceV2Beta2"),
+    ),
+    "HostAlias": (
+        ("hostnames", ""),
+        ("ip", ""),
+    ),
+    "HostPathVolumeSource": (
+        ("path", ""),
+        ("type", ""),
+    ),
+    "HpaScalingPolicyV2": (
+        ("periodSeconds", ""),
+        ("type", ""),
+        ("value", ""),
+    ),
+    "HpaScalingPolicyV2Beta2": (
+        ("periodSeconds", ""),
+        ("type", ""),
+        ("value", ""),
+    ),
+    "HpaScalingRulesV2": (
+        ("policies", "HpaScalingPolicyV2[]"),
+        ("selectPolicy", ""),
+        ("stabilizationWindowSeconds", ""),
+    ),
+    "HpaScalingRulesV2Beta2": (
+        ("policies", "HpaScalingPolicyV2Beta2[]"),
+        ("selectPolicy", ""),
+        ("stabilizationWindowSeconds", ""),
+    ),
+    "HttpGetAction": (
+        ("host", ""),
+        ("httpHeaders", "HttpHeader[]"),
+        ("path", ""),
+        ("port", ""),
+        ("scheme", ""),
+    ),
+    "HttpHeader": (
+        ("name", ""),
+        ("value", ""),
+    ),
+    "HttpIngressPath": (
+        ("backend", "IngressBackend"),
+        ("path", ""),
+        ("pathType", ""),
+    ),
+    "HttpIngressRuleValue": (
+        ("paths", "HttpIngressPath[]"),
+    ),
+    "IngressBackend": (
+        ("resource", "TypedLocalObjectReference"),
+        ("service", "IngressServiceBackend"),
+    ),
+    "IngressClassParametersReference": (
+        ("apiGroup", ""),
+        ("kind", ""),
+        ("name", ""),
+        ("namespace", ""),
+        ("scope", ""),
+    ),
+    "IngressClassSpec": (
+        ("controller", ""),
+        ("parameters", "IngressClassParametersReference"),
+    ),
+    "IngressRule": (
+        ("host", ""),
+        ("http", "HttpIngressRuleValue"),
+    ),
+    "IngressServiceBackend": (
+        ("name", ""),
+        ("port", "ServiceBackendPort"),
+    ),
+    "IngressSpec": (
+        ("defaultBackend", "IngressBackend"),
+        ("ingressClassName", ""),
+        ("rules", "IngressRule[]"),
+        ("tls", "IngressTls[]"),
+    ),
+    "IngressTls": (
+        ("hosts", ""),
+        ("secretName", ""),
+    ),
+    "IpBlock": (
+        ("cidr", ""),
+        ("except", ""),
+    ),
+    "IscsiPersistentVolumeSource": (
+        ("chapAuthDiscovery", ""),
+        ("chapAuthSession", ""),
+        ("fsType", ""),
+        ("initiatorName", ""),
+        ("iqn", ""),
+        ("iscsiInterface", ""),
+        ("lun", ""),
+        ("portals", ""),
+        ("readOnly", ""),
+        ("secretRef", "SecretReference"),
+        ("targetPortal", ""),
+    ),
+    "IscsiVolumeSource": (
+        ("chapAuthDiscovery", ""),
+        ("chapAuthSession", ""),
+        ("fsType", ""),
+        ("initiatorName", ""),
+        ("iqn", ""),
+        ("iscsiInterface", ""),
+        ("lun", ""),
+        ("portals", ""),
+        ("readOnly", ""),
+        ("secretRef", "LocalObjectReference"),
+        ("targetPortal", ""),
+    ),
+    "JobSpec": (
+        ("activeDeadlineSeconds", ""),
+        ("backoffLimit", ""),
+        ("completionMode", ""),
+        ("completions", ""),
+        ("manualSelector", ""),
+        ("parallelism", ""),
+        ("podFailurePolicy", "PodFailurePolicy"),
+        ("selector", "LabelSelector"),
+        ("suspend", ""),
+        ("template", "PodTemplateSpec"),
+        ("ttlSecondsAfterFinished", ""),
+    ),
+    "JobTemplateSpec": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "JobSpec"),
+    ),
+    "JsonSchemaProps": (
+        ("$ref", ""),
+        ("$schema", ""),
+        ("additionalItems", ""),
+        ("additionalProperties", ""),
+        ("allOf", "JsonSchemaProps[]"),
+        ("anyOf", "JsonSchemaProps[]"),
+        ("default", ""),
+        ("definitions", "JsonSchemaProps{}"),
+        ("dependencies", ""),
+        ("description", ""),
+        ("enum", ""),
+        ("example", ""),
+        ("exclusiveMaximum", ""),
+        ("exclusiveMinimum", ""),
+        ("externalDocs", "ExternalDocumentation"),
+        ("format", ""),
+        ("id", ""),
+        ("items", ""),
+        ("maxItems", ""),
+        ("maxLength", ""),
+        ("maxProperties", ""),
+        ("maximum", ""),
+        ("minItems", ""),
+        ("minLength", ""),
+        ("minProperties", ""),
+        ("minimum", ""),
+        ("multipleOf", ""),
+        ("not", "JsonSchemaProps"),
+        ("nullable", ""),
+        ("oneOf", "JsonSchemaProps[]"),
+        ("pattern", ""),
+        ("patternProperties", "JsonSchemaProps{}"),
+        ("properties", "JsonSchemaProps{}"),
+        ("required", ""),
+        ("title", ""),
+        ("type", ""),
+        ("uniqueItems", ""),
+        ("x-kubernetes-embedded-resource", ""),
+        ("x-kubernetes-int-or-string", ""),
+        ("x-kubernetes-list-map-keys", ""),
+        ("x-kubernetes-list-type", ""),
+        ("x-kubernetes-map-type", ""),
+        ("x-kubernetes-preserve-unknown-fields", ""),
+        ("x-kubernetes-validations", "ValidationRule[]"),
+    ),
+    "KeyToPath": (
+        ("key", ""),
+        ("mode", ""),
+        ("path", ""),
+    ),
+    "KubeApiServiceListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeApiServiceProps[]"),
+    ),
+    "KubeApiServiceProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "ApiServiceSpec"),
+    ),
+    "KubeBindingProps": (
+        ("metadata", "ObjectMeta"),
+        ("target", "ObjectReference"),
+    ),
+    "KubeCertificateSigningRequestListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeCertificateSigningRequestProps[]"),
+    ),
+    "KubeCertificateSigningRequestProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "CertificateSigningRequestSpec"),
+    ),
+    "KubeClusterCidrListV1Alpha1Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeClusterCidrv1Alpha1Props[]"),
+    ),
+    "KubeClusterCidrv1Alpha1Props": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "ClusterCidrSpecV1Alpha1"),
+    ),
+    "KubeClusterRoleBindingListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeClusterRoleBindingProps[]"),
+    ),
+    "KubeClusterRoleBindingProps": (
+        ("metadata", "ObjectMeta"),
+        ("roleRef", "RoleRef"),
+        ("subjects", "Subject[]"),
+    ),
+    "KubeClusterRoleListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeClusterRoleProps[]"),
+    ),
+    "KubeClusterRoleProps": (
+        ("metadata", "ObjectMeta"),
+        ("aggregationRule", "AggregationRule"),
+        ("rules", "PolicyRule[]"),
+    ),
+    "KubeComponentStatusListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeComponentStatusProps[]"),
+    ),
+    "KubeComponentStatusProps": (
+        ("metadata", "ObjectMeta"),
+        ("conditions", "ComponentCondition[]"),
+    ),
+    "KubeConfigMapListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeConfigMapProps[]"),
+    ),
+    "KubeConfigMapProps": (
+        ("metadata", "ObjectMeta"),
+        ("binaryData", ""),
+        ("data", ""),
+        ("immutable", ""),
+    ),
+    "KubeControllerRevisionListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeControllerRevisionProps[]"),
+    ),
+    "KubeControllerRevisionProps": (
+        ("metadata", "ObjectMeta"),
+        ("data", ""),
+        ("revision", ""),
+    ),
+    "KubeCronJobListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeCronJobProps[]"),
+    ),
+    "KubeCronJobProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "CronJobSpec"),
+    ),
+    "KubeCsiDriverListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeCsiDriverProps[]"),
+    ),
+    "KubeCsiDriverProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "CsiDriverSpec"),
+    ),
+    "KubeCsiNodeListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeCsiNodeProps[]"),
+    ),
+    "KubeCsiNodeProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "CsiNodeSpec"),
+    ),
+    "KubeCsiStorageCapacityListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeCsiStorageCapacityProps[]"),
+    ),
+    "KubeCsiStorageCapacityListV1Beta1Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeCsiStorageCapacityV1Beta1Props[]"),
+    ),
+    "KubeCsiStorageCapacityProps": (
+        ("metadata", "ObjectMeta"),
+        ("capacity", ""),
+        ("maximumVolumeSize", ""),
+        ("nodeTopology", "LabelSelector"),
+        ("storageClassName", ""),
+    ),
+    "KubeCsiStorageCapacityV1Beta1Props": (
+        ("metadata", "ObjectMeta"),
+        ("capacity", ""),
+        ("maximumVolumeSize", ""),
+        ("nodeTopology", "LabelSelector"),
+        ("storageClassName", ""),
+    ),
+    "KubeCustomResourceDefinitionListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeCustomResourceDefinitionProps[]"),
+    ),
+    "KubeCustomResourceDefinitionProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "CustomResourceDefinitionSpec"),
+    ),
+    "KubeDaemonSetListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeDaemonSetProps[]"),
+    ),
+    "KubeDaemonSetProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "DaemonSetSpec"),
+    ),
+    "KubeDeploymentListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeDeploymentProps[]"),
+    ),
+    "KubeDeploymentProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "DeploymentSpec"),
+    ),
+    "KubeEndpointSliceListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeEndpointSliceProps[]"),
+    ),
+    "KubeEndpointSliceProps": (
+        ("metadata", "ObjectMeta"),
+        ("addressType", ""),
+        ("endpoints", "Endpoint[]"),
+        ("ports", "EndpointPort[]"),
+    ),
+    "KubeEndpointsListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeEndpointsProps[]"),
+    ),
+    "KubeEndpointsProps": (
+        ("metadata", "ObjectMeta"),
+        ("subsets", "EndpointSubset[]"),
+    ),
+    "KubeEventListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeEventProps[]"),
+    ),
+    "KubeEventProps": (
+        ("metadata", "ObjectMeta"),
+        ("action", ""),
+        ("deprecatedCount", ""),
+        ("deprecatedFirstTimestamp", ""),
+        ("deprecatedLastTimestamp", ""),
+        ("deprecatedSource", "EventSource"),
+        ("eventTime", ""),
+        ("note", ""),
+        ("reason", ""),
+        ("regarding", "ObjectReference"),
+        ("related", "ObjectReference"),
+        ("reportingController", ""),
+        ("reportingInstance", ""),
+        ("series", "EventSeries"),
+        ("type", ""),
+    ),
+    "KubeEvictionProps": (
+        ("metadata", "ObjectMeta"),
+        ("deleteOptions", "DeleteOptions"),
+    ),
+    "KubeFlowSchemaListV1Beta1Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeFlowSchemaV1Beta1Props[]"),
+    ),
+    "KubeFlowSchemaListV1Beta2Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeFlowSchemaV1Beta2Props[]"),
+    ),
+    "KubeFlowSchemaV1Beta1Props": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "FlowSchemaSpecV1Beta1"),
+    ),
+    "KubeFlowSchemaV1Beta2Props": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "FlowSchemaSpecV1Beta2"),
+    ),
+    "KubeHorizontalPodAutoscalerListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeHorizontalPodAutoscalerProps[]"),
+    ),
+    "KubeHorizontalPodAutoscalerListV2Beta2Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeHorizontalPodAutoscalerV2Beta2Props[]"),
+    ),
+    "KubeHorizontalPodAutoscalerListV2Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeHorizontalPodAutoscalerV2Props[]"),
+    ),
+    "KubeHorizontalPodAutoscalerProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "HorizontalPodAutoscalerSpec"),
+    ),
+    "KubeHorizontalPodAutoscalerV2Beta2Props": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "HorizontalPodAutoscalerSpecV2Beta2"),
+    ),
+    "KubeHorizontalPodAutoscalerV2Props": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "HorizontalPodAutoscalerSpecV2"),
+    ),
+    "KubeIngressClassListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeIngressClassProps[]"),
+    ),
+    "KubeIngressClassProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "IngressClassSpec"),
+    ),
+    "KubeIngressListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeIngressProps[]"),
+    ),
+    "KubeIngressProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "IngressSpec"),
+    ),
+    "KubeJobListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeJobProps[]"),
+    ),
+    "KubeJobProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "JobSpec"),
+    ),
+    "KubeLeaseListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeLeaseProps[]"),
+    ),
+    "KubeLeaseProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "LeaseSpec"),
+    ),
+    "KubeLimitRangeListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeLimitRangeProps[]"),
+    ),
+    "KubeLimitRangeProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "LimitRangeSpec"),
+    ),
+    "KubeLocalSubjectAccessReviewProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "SubjectAccessReviewSpec"),
+    ),
+    "KubeMutatingWebhookConfigurationListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeMutatingWebhookConfigurationProps[]"),
+    ),
+    "KubeMutatingWebhookConfigurationProps": (
+        ("metadata", "ObjectMeta"),
+        ("webhooks", "MutatingWebhook[]"),
+    ),
+    "KubeNamespaceListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeNamespaceProps[]"),
+    ),
+    "KubeNamespaceProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "NamespaceSpec"),
+    ),
+    "KubeNetworkPolicyListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeNetworkPolicyProps[]"),
+    ),
+    "KubeNetworkPolicyProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "NetworkPolicySpec"),
+    ),
+    "KubeNodeListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeNodeProps[]"),
+    ),
+    "KubeNodeProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "NodeSpec"),
+    ),
+    "KubePersistentVolumeClaimListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubePersistentVolumeClaimProps[]"),
+    ),
+    "KubePersistentVolumeClaimProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "PersistentVolumeClaimSpec"),
+    ),
+    "KubePersistentVolumeListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubePersistentVolumeProps[]"),
+    ),
+    "KubePersistentVolumeProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "PersistentVolumeSpec"),
+    ),
+    "KubePodDisruptionBudgetListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubePodDisruptionBudgetProps[]"),
+    ),
+    "KubePodDisruptionBudgetProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "PodDisruptionBudgetSpec"),
+    ),
+    "KubePodListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubePodProps[]"),
+    ),
+    "KubePodProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "PodSpec"),
+    ),
+    "KubePodTemplateListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubePodTemplateProps[]"),
+    ),
+    "KubePodTemplateProps": (
+        ("metadata", "ObjectMeta"),
+        ("template", "PodTemplateSpec"),
+    ),
+    "KubePriorityClassListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubePriorityClassProps[]"),
+    ),
+    "KubePriorityClassProps": (
+        ("metadata", "ObjectMeta"),
+        ("description", ""),
+        ("globalDefault", ""),
+        ("preemptionPolicy", ""),
+        ("value", ""),
+    ),
+    "KubePriorityLevelConfigurationListV1Beta1Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubePriorityLevelConfigurationV1Beta1Props[]"),
+    ),
+    "KubePriorityLevelConfigurationListV1Beta2Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubePriorityLevelConfigurationV1Beta2Props[]"),
+    ),
+    "KubePriorityLevelConfigurationV1Beta1Props": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "PriorityLevelConfigurationSpecV1Beta1"),
+    ),
+    "KubePriorityLevelConfigurationV1Beta2Props": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "PriorityLevelConfigurationSpecV1Beta2"),
+    ),
+    "KubeReplicaSetListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeReplicaSetProps[]"),
+    ),
+    "KubeReplicaSetProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "ReplicaSetSpec"),
+    ),
+    "KubeReplicationControllerListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeReplicationControllerProps[]"),
+    ),
+    "KubeReplicationControllerProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "ReplicationControllerSpec"),
+    ),
+    "KubeResourceQuotaListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeResourceQuotaProps[]"),
+    ),
+    "KubeResourceQuotaProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "ResourceQuotaSpec"),
+    ),
+    "KubeRoleBindingListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeRoleBindingProps[]"),
+    ),
+    "KubeRoleBindingProps": (
+        ("metadata", "ObjectMeta"),
+        ("roleRef", "RoleRef"),
+        ("subjects", "Subject[]"),
+    ),
+    "KubeRoleListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeRoleProps[]"),
+    ),
+    "KubeRoleProps": (
+        ("metadata", "ObjectMeta"),
+        ("rules", "PolicyRule[]"),
+    ),
+    "KubeRuntimeClassListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeRuntimeClassProps[]"),
+    ),
+    "KubeRuntimeClassProps": (
+        ("metadata", "ObjectMeta"),
+        ("handler", ""),
+        ("overhead", "Overhead"),
+        ("scheduling", "Scheduling"),
+    ),
+    "KubeScaleProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "ScaleSpec"),
+    ),
+    "KubeSecretListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeSecretProps[]"),
+    ),
+    "KubeSecretProps": (
+        ("metadata", "ObjectMeta"),
+        ("data", ""),
+        ("immutable", ""),
+        ("stringData", ""),
+        ("type", ""),
+    ),
+    "KubeSelfSubjectAccessReviewProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "SelfSubjectAccessReviewSpec"),
+    ),
+    "KubeSelfSubjectRulesReviewProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "SelfSubjectRulesReviewSpec"),
+    ),
+    "KubeServiceAccountListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeServiceAccountProps[]"),
+    ),
+    "KubeServiceAccountProps": (
+        ("metadata", "ObjectMeta"),
+        ("automountServiceAccountToken", ""),
+        ("imagePullSecrets", "LocalObjectReference[]"),
+        ("secrets", "ObjectReference[]"),
+    ),
+    "KubeServiceListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeServiceProps[]"),
+    ),
+    "KubeServiceProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "ServiceSpec"),
+    ),
+    "KubeStatefulSetListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeStatefulSetProps[]"),
+    ),
+    "KubeStatefulSetProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "StatefulSetSpec"),
+    ),
+    "KubeStatusProps": (
+        ("metadata", "ListMeta"),
+        ("code", ""),
+        ("details", "StatusDetails"),
+        ("message", ""),
+        ("reason", ""),
+    ),
+    "KubeStorageClassListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeStorageClassProps[]"),
+    ),
+    "KubeStorageClassProps": (
+        ("metadata", "ObjectMeta"),
+        ("allowVolumeExpansion", ""),
+        ("allowedTopologies", "TopologySelectorTerm[]"),
+        ("mountOptions", ""),
+        ("parameters", ""),
+        ("provisioner", ""),
+        ("reclaimPolicy", ""),
+        ("volumeBindingMode", ""),
+    ),
+    "KubeStorageVersionListV1Alpha1Props": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeStorageVersionV1Alpha1Props[]"),
+    ),
+    "KubeStorageVersionV1Alpha1Props": (
+        ("metadata", "ObjectMeta"),
+        ("spec", ""),
+    ),
+    "KubeSubjectAccessReviewProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "SubjectAccessReviewSpec"),
+    ),
+    "KubeTokenRequestProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "TokenRequestSpec"),
+    ),
+    "KubeTokenReviewProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "TokenReviewSpec"),
+    ),
+    "KubeValidatingWebhookConfigurationListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeValidatingWebhookConfigurationProps[]"),
+    ),
+    "KubeValidatingWebhookConfigurationProps": (
+        ("metadata", "ObjectMeta"),
+        ("webhooks", "ValidatingWebhook[]"),
+    ),
+    "KubeVolumeAttachmentListProps": (
+        ("metadata", "ListMeta"),
+        ("items", "KubeVolumeAttachmentProps[]"),
+    ),
+    "KubeVolumeAttachmentProps": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "VolumeAttachmentSpec"),
+    ),
+    "LabelSelector": (
+        ("matchExpressions", "LabelSelectorRequirement[]"),
+        ("matchLabels", ""),
+    ),
+    "LabelSelectorRequirement": (
+        ("key", ""),
+        ("operator", ""),
+        ("values", ""),
+    ),
+    "LeaseSpec": (
+        ("acquireTime", ""),
+        ("holderIdentity", ""),
+        ("leaseDurationSeconds", ""),
+        ("leaseTransitions", ""),
+        ("renewTime", ""),
+    ),
+    "Lifecycle": (
+        ("postStart", "LifecycleHandler"),
+        ("preStop", "LifecycleHandler"),
+    ),
+    "LifecycleHandler": (
+        ("exec", "ExecAction"),
+        ("httpGet", "HttpGetAction"),
+        ("tcpSocket", "TcpSocketAction"),
+    ),
+    "LimitRangeItem": (
+        ("default", ""),
+        ("defaultRequest", ""),
+        ("max", ""),
+        ("maxLimitRequestRatio", ""),
+        ("min", ""),
+        ("type", ""),
+    ),
+    "LimitRangeSpec": (
+        ("limits", "LimitRangeItem[]"),
+    ),
+    "LimitResponseV1Beta1": (
+        ("queuing", "QueuingConfigurationV1Beta1"),
+        ("type", ""),
+    ),
+    "LimitResponseV1Beta2": (
+        ("queuing", "QueuingConfigurationV1Beta2"),
+        ("type", ""),
+    ),
+    "LimitedPriorityLevelConfigurationV1Beta1": (
+        ("assuredConcurrencyShares", ""),
+        ("limitResponse", "LimitResponseV1Beta1"),
+    ),
+    "LimitedPriorityLevelConfigurationV1Beta2": (
+        ("assuredConcurrencyShares", ""),
+        ("limitResponse", "LimitResponseV1Beta2"),
+    ),
+    "ListMeta": (
+        ("continue", ""),
+        ("remainingItemCount", ""),
+        ("resourceVersion", ""),
+        ("selfLink", ""),
+    ),
+    "LocalObjectReference": (
+        ("name", ""),
+    ),
+    "LocalVolumeSource": (
+        ("fsType", ""),
+        ("path", ""),
+    ),
+    "ManagedFieldsEntry": (
+        ("apiVersion", ""),
+        ("fieldsType", ""),
+        ("fieldsV1", ""),
+        ("manager", ""),
+        ("operation", ""),
+        ("subresource", ""),
+        ("time", ""),
+    ),
+    "MetricIdentifierV2": (
+        ("name", ""),
+        ("selector", "LabelSelector"),
+    ),
+    "MetricIdentifierV2Beta2": (
+        ("name", ""),
+        ("selector", "LabelSelector"),
+    ),
+    "MetricSpecV2": (
+        ("containerResource", "ContainerResourceMetricSourceV2"),
+        ("external", "ExternalMetricSourceV2"),
+        ("object", "ObjectMetricSourceV2"),
+        ("pods", "PodsMetricSourceV2"),
+        ("resource", "ResourceMetricSourceV2"),
+        ("type", ""),
+    ),
+    "MetricSpecV2Beta2": (
+        ("containerResource", "ContainerResourceMetricSourceV2Beta2"),
+        ("external", "ExternalMetricSourceV2Beta2"),
+        ("object", "ObjectMetricSourceV2Beta2"),
+        ("pods", "PodsMetricSourceV2Beta2"),
+        ("resource", "ResourceMetricSourceV2Beta2"),
+        ("type", ""),
+    ),
+    "MetricTargetV2": (
+        ("averageUtilization", ""),
+        ("averageValue", ""),
+        ("type", ""),
+        ("value", ""),
+    ),
+    "MetricTargetV2Beta2": (
+        ("averageUtilization", ""),
+        ("averageValue", ""),
+        ("type", ""),
+        ("value", ""),
+    ),
+    "MutatingWebhook": (
+        ("admissionReviewVersions", ""),
+        ("clientConfig", "WebhookClientConfig"),
+        ("failurePolicy", ""),
+        ("matchPolicy", ""),
+        ("name", ""),
+        ("namespaceSelector", "LabelSelector"),
+        ("objectSelector", "LabelSelector"),
+        ("reinvocationPolicy", ""),
+        ("rules", "RuleWithOperations[]"),
+        ("sideEffects", ""),
+        ("timeoutSeconds", ""),
+    ),
+    "NamespaceSpec": (
+        ("finalizers", ""),
+    ),
+    "NetworkPolicyEgressRule": (
+        ("ports", "NetworkPolicyPort[]"),
+        ("to", "NetworkPolicyPeer[]"),
+    ),
+    "NetworkPolicyIngressRule": (
+        ("from", "NetworkPolicyPeer[]"),
+        ("ports", "NetworkPolicyPort[]"),
+    ),
+    "NetworkPolicyPeer": (
+        ("ipBlock", "IpBlock"),
+        ("namespaceSelector", "LabelSelector"),
+        ("podSelector", "LabelSelector"),
+    ),
+    "NetworkPolicyPort": (
+        ("endPort", ""),
+        ("port", ""),
+        ("protocol", ""),
+    ),
+    "NetworkPolicySpec": (
+        ("egress", "NetworkPolicyEgressRule[]"),
+        ("ingress", "NetworkPolicyIngressRule[]"),
+        ("podSelector", "LabelSelector"),
+        ("policyTypes", ""),
+    ),
+    "NfsVolumeSource": (
+        ("path", ""),
+        ("readOnly", ""),
+        ("server", ""),
+    ),
+    "NodeAffinity": (
+        ("preferredDuringSchedulingIgnoredDuringExecution", "PreferredSchedulingTerm[]"),
+        ("requiredDuringSchedulingIgnoredDuringExecution", "NodeSelector"),
+    ),
+    "NodeConfigSource": (
+        ("configMap", "ConfigMapNodeConfigSource"),
+    ),
+    "NodeSelector": (
+        ("nodeSelectorTerms", "NodeSelectorTerm[]"),
+    ),
+    "NodeSelectorRequirement": (
+        ("key", ""),
+        ("operator", ""),
+        ("values", ""),
+    ),
+    "NodeSelectorTerm": (
+        ("matchExpressions", "NodeSelectorRequirement[]"),
+        ("matchFields", "NodeSelectorRequirement[]"),
+    ),
+    "NodeSpec": (
+        ("configSource", "NodeConfigSource"),
+        ("externalID", ""),
+        ("podCIDR", ""),
+        ("podCIDRs", ""),
+        ("providerID", ""),
+        ("taints", "Taint[]"),
+        ("unschedulable", ""),
+    ),
+    "NonResourceAttributes": (
+        ("path", ""),
+        ("verb", ""),
+    ),
+    "NonResourcePolicyRuleV1Beta1": (
+        ("nonResourceURLs", ""),
+        ("verbs", ""),
+    ),
+    "NonResourcePolicyRuleV1Beta2": (
+        ("nonResourceURLs", ""),
+        ("verbs", ""),
+    ),
+    "ObjectFieldSelector": (
+        ("apiVersion", ""),
+        ("fieldPath", ""),
+    ),
+    "ObjectMeta": (
+        ("annotations", ""),
+        ("creationTimestamp", ""),
+        ("deletionGracePeriodSeconds", ""),
+        ("deletionTimestamp", ""),
+        ("finalizers", ""),
+        ("generateName", ""),
+        ("generation", ""),
+        ("labels", ""),
+        ("managedFields", "ManagedFieldsEntry[]"),
+        ("name", ""),
+        ("namespace", ""),
+        ("ownerReferences", "OwnerReference[]"),
+        ("resourceVersion", ""),
+        ("selfLink", ""),
+        ("uid", ""),
+    ),
+    "ObjectMetricSourceV2": (
+        ("describedObject", "CrossVersionObjectReferenceV2"),
+        ("metric", "MetricIdentifierV2"),
+        ("target", "MetricTargetV2"),
+    ),
+    "ObjectMetricSourceV2Beta2": (
+        ("describedObject", "CrossVersionObjectReferenceV2Beta2"),
+        ("metric", "MetricIdentifierV2Beta2"),
+        ("target", "MetricTargetV2Beta2"),
+    ),
+    "ObjectReference": (
+        ("apiVersion", ""),
+        ("fieldPath", ""),
+        ("kind", ""),
+        ("name", ""),
+        ("namespace", ""),
+        ("resourceVersion", ""),
+        ("uid", ""),
+    ),
+    "Overhead": (
+        ("podFixed", ""),
+    ),
+    "OwnerReference": (
+        ("apiVersion", ""),
+        ("blockOwnerDeletion", ""),
+        ("controller", ""),
+        ("kind", ""),
+        ("name", ""),
+        ("uid", ""),
+    ),
+    "PersistentVolumeClaimSpec": (
+        ("accessModes", ""),
+        ("dataSource", "TypedLocalObjectReference"),
+        ("dataSourceRef", "TypedLocalObjectReference"),
+        ("resources", "ResourceRequirements"),
+        ("selector", "LabelSelector"),
+        ("storageClassName", ""),
+        ("volumeMode", ""),
+        ("volumeName", ""),
+    ),
+    "PersistentVolumeClaimTemplate": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "PersistentVolumeClaimSpec"),
+    ),
+    "PersistentVolumeClaimVolumeSource": (
+        ("claimName", ""),
+        ("readOnly", ""),
+    ),
+    "PersistentVolumeSpec": (
+        ("accessModes", ""),
+        ("awsElasticBlockStore", "AwsElasticBlockStoreVolumeSource"),
+        ("azureDisk", "AzureDiskVolumeSource"),
+        ("azureFile", "AzureFilePersistentVolumeSource"),
+        ("capacity", ""),
+        ("cephfs", "CephFsPersistentVolumeSource"),
+        ("cinder", "CinderPersistentVolumeSource"),
+        ("claimRef", "ObjectReference"),
+        ("csi", "CsiPersistentVolumeSource"),
+        ("fc", "FcVolumeSource"),
+        ("flexVolume", "FlexPersistentVolumeSource"),
+        ("flocker", "FlockerVolumeSource"),
+        ("gcePersistentDisk", "GcePersistentDiskVolumeSource"),
+        ("glusterfs", "GlusterfsPersistentVolumeSource"),
+        ("hostPath", "HostPathVolumeSource"),
+        ("iscsi", "IscsiPersistentVolumeSource"),
+        ("local", "LocalVolumeSource"),
+        ("mountOptions", ""),
+        ("nfs", "NfsVolumeSource"),
+        ("nodeAffinity", "VolumeNodeAffinity"),
+        ("persistentVolumeReclaimPolicy", ""),
+        ("photonPersistentDisk", "PhotonPersistentDiskVolumeSource"),
+        ("portworxVolume", "PortworxVolumeSource"),
+        ("quobyte", "QuobyteVolumeSource"),
+        ("rbd", "RbdPersistentVolumeSource"),
+        ("scaleIO", "ScaleIoPersistentVolumeSource"),
+        ("storageClassName", ""),
+        ("storageos", "StorageOsPersistentVolumeSource"),
+        ("volumeMode", ""),
+        ("vsphereVolume", "VsphereVirtualDiskVolumeSource"),
+    ),
+    "PhotonPersistentDiskVolumeSource": (
+        ("fsType", ""),
+        ("pdID", ""),
+    ),
+    "PodAffinity": (
+        ("preferredDuringSchedulingIgnoredDuringExecution", "WeightedPodAffinityTerm[]"),
+        ("requiredDuringSchedulingIgnoredDuringExecution", "PodAffinityTerm[]"),
+    ),
+    "PodAffinityTerm": (
+        ("labelSelector", "LabelSelector"),
+        ("namespaceSelector", "LabelSelector"),
+        ("namespaces", ""),
+        ("topologyKey", ""),
+    ),
+    "PodAntiAffinity": (
+        ("preferredDuringSchedulingIgnoredDuringExecution", "WeightedPodAffinityTerm[]"),
+        ("requiredDuringSchedulingIgnoredDuringExecution", "PodAffinityTerm[]"),
+    ),
+    "PodDisruptionBudgetSpec": (
+        ("maxUnavailable", ""),
+        ("minAvailable", ""),
+        ("selector", "LabelSelector"),
+    ),
+    "PodDnsConfig": (
+        ("nameservers", ""),
+        ("options", "PodDnsConfigOption[]"),
+        ("searches", ""),
+    ),
+    "PodDnsConfigOption": (
+        ("name", ""),
+        ("value", ""),
+    ),
+    "PodFailurePolicy": (
+        ("rules", "PodFailurePolicyRule[]"),
+    ),
+    "PodFailurePolicyOnExitCodesRequirement": (
+        ("containerName", ""),
+        ("operator", ""),
+        ("values", ""),
+    ),
+    "PodFailurePolicyOnPodConditionsPattern": (
+        ("status", ""),
+        ("type", ""),
+    ),
+    "PodFailurePolicyRule": (
+        ("action", ""),
+        ("onExitCodes", "PodFailurePolicyOnExitCodesRequirement"),
+        ("onPodConditions", "PodFailurePolicyOnPodConditionsPattern[]"),
+    ),
+    "PodOs": (
+        ("name", ""),
+    ),
+    "PodReadinessGate": (
+        ("conditionType", ""),
+    ),
+    "PodSecurityContext": (
+        ("fsGroup", ""),
+        ("fsGroupChangePolicy", ""),
+        ("runAsGroup", ""),
+        ("runAsNonRoot", ""),
+        ("runAsUser", ""),
+        ("seLinuxOptions", "SeLinuxOptions"),
+        ("seccompProfile", "SeccompProfile"),
+        ("supplementalGroups", ""),
+        ("sysctls", "Sysctl[]"),
+        ("windowsOptions", "WindowsSecurityContextOptions"),
+    ),
+    "PodSpec": (
+        ("activeDeadlineSeconds", ""),
+        ("affinity", "Affinity"),
+        ("automountServiceAccountToken", ""),
+        ("containers", "Container[]"),
+        ("dnsConfig", "PodDnsConfig"),
+        ("dnsPolicy", ""),
+        ("enableServiceLinks", ""),
+        ("ephemeralContainers", "EphemeralContainer[]"),
+        ("hostAliases", "HostAlias[]"),
+        ("hostIPC", ""),
+        ("hostNetwork", ""),
+        ("hostPID", ""),
+        ("hostUsers", ""),
+        ("hostname", ""),
+        ("imagePullSecrets", "LocalObjectReference[]"),
+        ("initContainers", "Container[]"),
+        ("nodeName", ""),
+        ("nodeSelector", ""),
+        ("os", "PodOs"),
+        ("overhead", ""),
+        ("preemptionPolicy", ""),
+        ("priority", ""),
+        ("priorityClassName", ""),
+        ("readinessGates", "PodReadinessGate[]"),
+        ("restartPolicy", ""),
+        ("runtimeClassName", ""),
+        ("schedulerName", ""),
+        ("securityContext", "PodSecurityContext"),
+        ("serviceAccount", ""),
+        ("serviceAccountName", ""),
+        ("setHostnameAsFQDN", ""),
+        ("shareProcessNamespace", ""),
+        ("subdomain", ""),
+        ("terminationGracePeriodSeconds", ""),
+        ("tolerations", "Toleration[]"),
+        ("topologySpreadConstraints", "TopologySpreadConstraint[]"),
+        ("volumes", "Volume[]"),
+    ),
+    "PodTemplateSpec": (
+        ("metadata", "ObjectMeta"),
+        ("spec", "PodSpec"),
+    ),
+    "PodsMetricSourceV2": (
+        ("metric", "MetricIdentifierV2"),
+        ("target", "MetricTargetV2"),
+    ),
+    "PodsMetricSourceV2Beta2": (
+        ("metric", "MetricIdentifierV2Beta2"),
+        ("target", "MetricTargetV2Beta2"),
+    ),
+    "PolicyRule": (
+        ("apiGroups", ""),
+        ("nonResourceURLs", ""),
+        ("resourceNames", ""),
+        ("resources", ""),
+        ("verbs", ""),
+    ),
+    "PolicyRulesWithSubjectsV1Beta1": (
+        ("nonResourceRules", "NonResourcePolicyRuleV1Beta1[]"),
+        ("resourceRules", "ResourcePolicyRuleV1Beta1[]"),
+        ("subjects", "SubjectV1Beta1[]"),
+    ),
+    "PolicyRulesWithSubjectsV1Beta2": (
+        ("nonResourceRules", "NonResourcePolicyRuleV1Beta2[]"),
+        ("resourceRules", "ResourcePolicyRuleV1Beta2[]"),
+        ("subjects", "SubjectV1Beta2[]"),
+    ),
+    "PortworxVolumeSource": (
+        ("fsType", ""),
+        ("readOnly", ""),
+        ("volumeID", ""),
+    ),
+    "Preconditions": (
+        ("resourceVersion", ""),
+        ("uid", ""),
+    ),
+    "PreferredSchedulingTerm": (
+        ("preference", "NodeSelectorTerm"),
+        ("weight", ""),
+    ),
+    "PriorityLevelConfigurationReferenceV1Beta1": (
+        ("name", ""),
+    ),
+    "PriorityLevelConfigurationReferenceV1Beta2": (
+        ("name", ""),
+    ),
+    "PriorityLevelConfigurationSpecV1Beta1": (
+        ("limited", "LimitedPriorityLevelConfigurationV1Beta1"),
+        ("type", ""),
+    ),
+    "PriorityLevelConfigurationSpecV1Beta2": (
+        ("limited", "LimitedPriorityLevelConfigurationV1Beta2"),
+        ("type", ""),
+    ),
+    "Probe": (
+        ("exec", "ExecAction"),
+        ("failureThreshold", ""),
+        ("grpc", "GrpcAction"),
+        ("httpGet", "HttpGetAction"),
+        ("initialDelaySeconds", ""),
+        ("periodSeconds", ""),
+        ("successThreshold", ""),
+        ("tcpSocket", "TcpSocketAction"),
+        ("terminationGracePeriodSeconds", ""),
+        ("timeoutSeconds", ""),
+    ),
+    "ProjectedVolumeSource": (
+        ("defaultMode", ""),
+        ("sources", "VolumeProjection[]"),
+    ),
+    "QueuingConfigurationV1Beta1": (
+        ("handSize", ""),
+        ("queueLengthLimit", ""),
+        ("queues", ""),
+    ),
+    "QueuingConfigurationV1Beta2": (
+        ("handSize", ""),
+        ("queueLengthLimit", ""),
+        ("queues", ""),
+    ),
+    "QuobyteVolumeSource": (
+        ("group", ""),
+        ("readOnly", ""),
+        ("registry", ""),
+        ("tenant", ""),
+        ("user", ""),
+        ("volume", ""),
+    ),
+    "RbdPersistentVolumeSource": (
+        ("fsType", ""),
+        ("image", ""),
+        ("keyring", ""),
+        ("monitors", ""),
+        ("pool", ""),
+        ("readOnly", ""),
+        ("secretRef", "SecretReference"),
+        ("user", ""),
+    ),
+    "RbdVolumeSource": (
+        ("fsType", ""),
+        ("image", ""),
+        ("keyring", ""),
+        ("monitors", ""),
+        ("pool", ""),
+        ("readOnly", ""),
+        ("secretRef", "LocalObjectReference"),
+        ("user", ""),
+    ),
+    "ReplicaSetSpec": (
+        ("minReadySeconds", ""),
+        ("replicas", ""),
+        ("selector", "LabelSelector"),
+        ("template", "PodTemplateSpec"),
+    ),
+    "ReplicationControllerSpec": (
+        ("minReadySeconds", ""),
+        ("replicas", ""),
+        ("selector", ""),
+        ("template", "PodTemplateSpec"),
+    ),
+    "ResourceAttributes": (
+        ("group", ""),
+        ("name", ""),
+        ("namespace", ""),
+        ("resource", ""),
+        ("subresource", ""),
+        ("verb", ""),
+        ("version", ""),
+    ),
+    "ResourceFieldSelector": (
+        ("containerName", ""),
+        ("divisor", ""),
+        ("resource", ""),
+    ),
+    "ResourceMetricSourceV2": (
+        ("name", ""),
+        ("target", "MetricTargetV2"),
+    ),
+    "ResourceMetricSourceV2Beta2": (
+        ("name", ""),
+        ("target", "MetricTargetV2Beta2"),
+    ),
+    "ResourcePolicyRuleV1Beta1": (
+        ("apiGroups", ""),
+        ("clusterScope", ""),
+        ("namespaces", ""),
+        ("resources", ""),
+        ("verbs", ""),
+    ),
+    "ResourcePolicyRuleV1Beta2": (
+        ("apiGroups", ""),
+        ("clusterScope", ""),
+        ("namespaces", ""),
+        ("resources", ""),
+        ("verbs", ""),
+    ),
+    "ResourceQuotaSpec": (
+        ("hard", ""),
+        ("scopeSelector", "ScopeSelector"),
+        ("scopes", ""),
+    ),
+    "ResourceRequirements": (
+        ("limits", ""),
+        ("requests", ""),
+    ),
+    "RoleRef": (
+        ("apiGroup", ""),
+        ("kind", ""),
+        ("name", ""),
+    ),
+    "RollingUpdateDaemonSet": (
+        ("maxSurge", ""),
+        ("maxUnavailable", ""),
+    ),
+    "RollingUpdateDeployment": (
+        ("maxSurge", ""),
+        ("maxUnavailable", ""),
+    ),
+    "RollingUpdateStatefulSetStrategy": (
+        ("maxUnavailable", ""),
+        ("partition", ""),
+    ),
+    "RuleWithOperations": (
+        ("apiGroups", ""),
+        ("apiVersions", ""),
+        ("operations", ""),
+        ("resources", ""),
+        ("scope", ""),
+    ),
+    "ScaleIoPersistentVolumeSource": (
+        ("fsType", ""),
+        ("gateway", ""),
+        ("protectionDomain", ""),
+        ("readOnly", ""),
+        ("secretRef", "SecretReference"),
+        ("sslEnabled", ""),
+        ("storageMode", ""),
+        ("storagePool", ""),
+        ("system", ""),
+        ("volumeName", ""),
+    ),
+    "ScaleIoVolumeSource": (
+        ("fsType", ""),
+        ("gateway", ""),
+        ("protectionDomain", ""),
+        ("readOnly", ""),
+        ("secretRef", "LocalObjectReference"),
+        ("sslEnabled", ""),
+        ("storageMode", ""),
+        ("storagePool", ""),
+        ("system", ""),
+        ("volumeName", ""),
+    ),
+    "ScaleSpec": (
+        ("replicas", ""),
+    ),
+    "Scheduling": (
+        ("nodeSelector", ""),
+        ("tolerations", "Toleration[]"),
+    ),
+    "ScopeSelector": (
+        ("matchExpressions", "ScopedResourceSelectorRequirement[]"),
+    ),
+    "ScopedResourceSelectorRequirement": (
+        ("operator", ""),
+        ("scopeName", ""),
+        ("values", ""),
+    ),
+    "SeLinuxOptions": (
+        ("level", ""),
+        ("role", ""),
+        ("type", ""),
+        ("user", ""),
+    ),
+    "SeccompProfile": (
+        ("localhostProfile", ""),
+        ("type", ""),
+    ),
+    "SecretEnvSource": (
+        ("name", ""),
+        ("optional", ""),
+    ),
+    "SecretKeySelector": (
+        ("key", ""),
+        ("name", ""),
+        ("optional", ""),
+    ),
+    "SecretProjection": (
+        ("items", "KeyToPath[]"),
+        ("name", ""),
+        ("optional", ""),
+    ),
+    "SecretReference": (
+        ("name", ""),
+        ("namespace", ""),
+    ),
+    "SecretVolumeSource": (
+        ("defaultMode", ""),
+        ("items", "KeyToPath[]"),
+        ("optional", ""),
+        ("secretName", ""),
+    ),
+    "SecurityContext": (
+        ("allowPrivilegeEscalation", ""),
+        ("capabilities", "Capabilities"),
+        ("privileged", ""),
+        ("procMount", ""),
+        ("readOnlyRootFilesystem", ""),
+        ("runAsGroup", ""),
+        ("runAsNonRoot", ""),
+        ("runAsUser", ""),
+        ("seLinuxOptions", "SeLinuxOptions"),
+        ("seccompProfile", "SeccompProfile"),
+        ("windowsOptions", "WindowsSecurityContextOptions"),
+    ),
+    "SelfSubjectAccessReviewSpec": (
+        ("nonResourceAttributes", "NonResourceAttributes"),
+        ("resourceAttributes", "ResourceAttributes"),
+    ),
+    "SelfSubjectRulesReviewSpec": (
+        ("namespace", ""),
+    ),
+    "ServiceAccountSubjectV1Beta1": (
+        ("name", ""),
+        ("namespace", ""),
+    ),
+    "ServiceAccountSubjectV1Beta2": (
+        ("name", ""),
+        ("namespace", ""),
+    ),
+    "ServiceAccountTokenProjection": (
+        ("audience", ""),
+        ("expirationSeconds", ""),
+        ("path", ""),
+    ),
+    "ServiceBackendPort": (
+        ("name", ""),
+        ("number", ""),
+    ),
+    "ServicePort": (
+        ("appProtocol", ""),
+        ("name", ""),
+        ("nodePort", ""),
+        ("port", ""),
+        ("protocol", ""),
+        ("targetPort", ""),
+    ),
+    "ServiceReference": (
+        ("name", ""),
+        ("namespace", ""),
+        ("path", ""),
+        ("port", ""),
+    ),
+    "ServiceSpec": (
+        ("allocateLoadBalancerNodePorts", ""),
+        ("clusterIP", ""),
+        ("clusterIPs", ""),
+        ("externalIPs", ""),
+        ("externalName", ""),
+        ("externalTrafficPolicy", ""),
+        ("healthCheckNodePort", ""),
+        ("internalTrafficPolicy", ""),
+        ("ipFamilies", ""),
+        ("ipFamilyPolicy", ""),
+        ("loadBalancerClass", ""),
+        ("loadBalancerIP", ""),
+        ("loadBalancerSourceRanges", ""),
+        ("ports", "ServicePort[]"),
+        ("publishNotReadyAddresses", ""),
+        ("selector", ""),
+        ("sessionAffinity", ""),
+        ("sessionAffinityConfig", "SessionAffinityConfig"),
+        ("type", ""),
+    ),
+    "SessionAffinityConfig": (
+        ("clientIP", "ClientIpConfig"),
+    ),
+    "StatefulSetPersistentVolumeClaimRetentionPolicy": (
+        ("whenDeleted", ""),
+        ("whenScaled", ""),
+    ),
+    "StatefulSetSpec": (
+        ("minReadySeconds", ""),
+        ("persistentVolumeClaimRetentionPolicy", "StatefulSetPersistentVolumeClaimRetentionPolicy"),
+        ("podManagementPolicy", ""),
+        ("replicas", ""),
+        ("revisionHistoryLimit", ""),
+        ("selector", "LabelSelector"),
+        ("serviceName", ""),
+        ("template", "PodTemplateSpec"),
+        ("updateStrategy", "StatefulSetUpdateStrategy"),
+        ("volumeClaimTemplates", "KubePersistentVolumeClaimProps[]"),
+    ),
+    "StatefulSetUpdateStrategy": (
+        ("rollingUpdate", "RollingUpdateStatefulSetStrategy"),
+        ("type", ""),
+    ),
+    "StatusCause": (
+        ("field", ""),
+        ("message", ""),
+        ("reason", ""),
+    ),
+    "StatusDetails": (
+        ("causes", "StatusCause[]"),
+        ("group", ""),
+        ("kind", ""),
+        ("name", ""),
+        ("retryAfterSeconds", ""),
+        ("uid", ""),
+    ),
+    "StorageOsPersistentVolumeSource": (
+        ("fsType", ""),
+        ("readOnly", ""),
+        ("secretRef", "ObjectReference"),
+        ("volumeName", ""),
+        ("volumeNamespace", ""),
+    ),
+    "StorageOsVolumeSource": (
+        ("fsType", ""),
+        ("readOnly", ""),
+        ("secretRef", "LocalObjectReference"),
+        ("volumeName", ""),
+        ("volumeNamespace", ""),
+    ),
+    "Subject": (
+        ("apiGroup", ""),
+        ("kind", ""),
+        ("name", ""),
+        ("namespace", ""),
+    ),
+    "SubjectAccessReviewSpec": (
+        ("extra", ""),
+        ("groups", ""),
+        ("nonResourceAttributes", "NonResourceAttributes"),
+        ("resourceAttributes", "ResourceAttributes"),
+        ("uid", ""),
+        ("user", ""),
+    ),
+    "SubjectV1Beta1": (
+        ("group", "GroupSubjectV1Beta1"),
+        ("kind", ""),
+        ("serviceAccount", "ServiceAccountSubjectV1Beta1"),
+        ("user", "UserSubjectV1Beta1"),
+    ),
+    "SubjectV1Beta2": (
+        ("group", "GroupSubjectV1Beta2"),
+        ("kind", ""),
+        ("serviceAccount", "ServiceAccountSubjectV1Beta2"),
+        ("user", "UserSubjectV1Beta2"),
+    ),
+    "Sysctl": (
+        ("name", ""),
+        ("value", ""),
+    ),
+    "Taint": (
+        ("effect", ""),
+        ("key", ""),
+        ("timeAdded", ""),
+        ("value", ""),
+    ),
+    "TcpSocketAction": (
+        ("host", ""),
+        ("port", ""),
+    ),
+    "TokenRequest": (
+        ("audience", ""),
+        ("expirationSeconds", ""),
+    ),
+    "TokenRequestSpec": (
+        ("audiences", ""),
+        ("boundObjectRef", "BoundObjectReference"),
+        ("expirationSeconds", ""),
+    ),
+    "TokenReviewSpec": (
+        ("audiences", ""),
+        ("token", ""),
+    ),
+    "Toleration": (
+        ("effect", ""),
+        ("key", ""),
+        ("operator", ""),
+        ("tolerationSeconds", ""),
+        ("value", ""),
+    ),
+    "TopologySelectorLabelRequirement": (
+        ("key", ""),
+        ("values", ""),
+    ),
+    "TopologySelectorTerm": (
+        ("matchLabelExpressions", "TopologySelectorLabelRequirement[]"),
+    ),
+    "TopologySpreadConstraint": (
+        ("labelSelector", "LabelSelector"),
+        ("matchLabelKeys", ""),
+        ("maxSkew", ""),
+        ("minDomains", ""),
+        ("nodeAffinityPolicy", ""),
+        ("nodeTaintsPolicy", ""),
+        ("topologyKey", ""),
+        ("whenUnsatisfiable", ""),
+    ),
+    "TypedLocalObjectReference": (
+        ("apiGroup", ""),
+        ("kind", ""),
+        ("name", ""),
+    ),
+    "UserSubjectV1Beta1": (
+        ("name", ""),
+    ),
+    "UserSubjectV1Beta2": (
+        ("name", ""),
+    ),
+    "ValidatingWebhook": (
+        ("admissionReviewVersions", ""),
+        ("clientConfig", "WebhookClientConfig"),
+        ("failurePolicy", ""),
+        ("matchPolicy", ""),
+        ("name", ""),
+        ("namespaceSelector", "LabelSelector"),
+        ("objectSelector", "LabelSelector"),
+        ("rules", "RuleWithOperations[]"),
+        ("sideEffects", ""),
+        ("timeoutSeconds", ""),
+    ),
+    "ValidationRule": (
+        ("message", ""),
+        ("rule", ""),
+    ),
+    "Volume": (
+        ("awsElasticBlockStore", "AwsElasticBlockStoreVolumeSource"),
+        ("azureDisk", "AzureDiskVolumeSource"),
+        ("azureFile", "AzureFileVolumeSource"),
+        ("cephfs", "CephFsVolumeSource"),
+        ("cinder", "CinderVolumeSource"),
+        ("configMap", "ConfigMapVolumeSource"),
+        ("csi", "CsiVolumeSource"),
+        ("downwardAPI", "DownwardApiVolumeSource"),
+        ("emptyDir", "EmptyDirVolumeSource"),
+        ("ephemeral", "EphemeralVolumeSource"),
+        ("fc", "FcVolumeSource"),
+        ("flexVolume", "FlexVolumeSource"),
+        ("flocker", "FlockerVolumeSource"),
+        ("gcePersistentDisk", "GcePersistentDiskVolumeSource"),
+        ("gitRepo", "GitRepoVolumeSource"),
+        ("glusterfs", "GlusterfsVolumeSource"),
+        ("hostPath", "HostPathVolumeSource"),
+        ("iscsi", "IscsiVolumeSource"),
+        ("name", ""),
+        ("nfs", "NfsVolumeSource"),
+        ("persistentVolumeClaim", "PersistentVolumeClaimVolumeSource"),
+        ("photonPersistentDisk", "PhotonPersistentDiskVolumeSource"),
+        ("portworxVolume", "PortworxVolumeSource"),
+        ("projected", "ProjectedVolumeSource"),
+        ("quobyte", "QuobyteVolumeSource"),
+        ("rbd", "RbdVolumeSource"),
+        ("scaleIO", "ScaleIoVolumeSource"),
+        ("secret", "SecretVolumeSource"),
+        ("storageos", "StorageOsVolumeSource"),
+        ("vsphereVolume", "VsphereVirtualDiskVolumeSource"),
+    ),
+    "VolumeAttachmentSource": (
+        ("inlineVolumeSpec", "PersistentVolumeSpec"),
+        ("persistentVolumeName", ""),
+    ),
+    "VolumeAttachmentSpec": (
+        ("attacher", ""),
+        ("nodeName", ""),
+        ("source", "VolumeAttachmentSource"),
+    ),
+    "VolumeDevice": (
+        ("devicePath", ""),
+        ("name", ""),
+    ),
+    "VolumeMount": (
+        ("mountPath", ""),
+        ("mountPropagation", ""),
+        ("name", ""),
+        ("readOnly", ""),
+        ("subPath", ""),
+        ("subPathExpr", ""),
+    ),
+    "VolumeNodeAffinity": (
+        ("required", "NodeSelector"),
+    ),
+    "VolumeNodeResources": (
+        ("count", ""),
+    ),
+    "VolumeProjection": (
+        ("configMap", "ConfigMapProjection"),
+        ("downwardAPI", "DownwardApiProjection"),
+        ("secret", "SecretProjection"),
+        ("serviceAccountToken", "ServiceAccountTokenProjection"),
+    ),
+    "VsphereVirtualDiskVolumeSource": (
+        ("fsType", ""),
+        ("storagePolicyID", ""),
+        ("storagePolicyName", ""),
+        ("volumePath", ""),
+    ),
+    "WebhookClientConfig": (
+        ("caBundle", ""),
+        ("service", "ServiceReference"),
+        ("url", ""),
+    ),
+    "WebhookConversion": (
+        ("clientConfig", "WebhookClientConfig"),
+        ("conversionReviewVersions", ""),
+    ),
+    "WeightedPodAffinityTerm": (
+        ("podAffinityTerm", "PodAffinityTerm"),
+        ("weight", ""),
+    ),
+    "WindowsSecurityContextOptions": (
+        ("gmsaCredentialSpec", ""),
+        ("gmsaCredentialSpecName", ""),
+        ("hostProcess", ""),
+        ("runAsUserName", ""),
+    ),
+}
@@ -0,0 +1,152 @@
+"""Capacity planning for Deployments from their traffic and latency SLOs.
+
+plan_capacity sizes any number of services in one call. Each is described by
+the requests per second it has to serve, what one pod serves and how long a
+request takes on an idle pod, and the latency it has to stay under:
+
+    plans = plan_capacity([ServiceSlo("web", target_rps=600, pod_rps=300, service_ms=5,
+                                      latency_slo_ms=50, cpu_ms_per_request=1, memory_mib=64)])
+
+A pod is treated as a single queue, whose response time grows as
+service_ms / (1 - utilization), so the latency SLO holds up to a utilization of
+1 - service_ms / latency_slo_ms. Pods are planned at that utilization or at
+target_utilization, whichever is lower, which leaves headroom for spikes until
+the HorizontalPodAutoscaler reacts:
+
+- replicas serve target_rps at that utilization, and are the HPA's minimum; the
+  Deployment has no replicas of its own, the HPA sets them
+- the HPA scales up to peak_factor times that traffic, on CPU utilization
+- the CPU request is what a pod uses at pod_rps, so that CPU utilization is the
+  share of pod_rps a pod serves; the limit is cpu_limit_factor times that, and
+  memory is requested and limited at memory_mib
+- the PodDisruptionBudget lets as many pods go as can be missing while the rest
+  serve target_rps within the latency SLO, one at least
+
+PlannedDeployment adds the Deployment, HPA and PodDisruptionBudget of a plan to
+a chart, and spreads the pods as an availability profile of lib/placement.py
+says.
+"""
+import math
+import typing
+
+import numpy as np
+from constructs import Construct
+
+from imports import k8s
+from lib.placement import AvailabilityProfile, pod_placement
+
+# so that float error does not add a pod, 2.0000000000000004 pods are 2
+_EPSILON = 1e-9
+
+
+class ServiceSlo(typing.NamedTuple):
+    name: str
+    # requests per second the service has to serve
+    target_rps: float
+    # requests per second one pod serves, using all of its CPU request
+    pod_rps: float
+    # latency of a request on an idle pod, and the latency SLO
+    service_ms: float
+    latency_slo_ms: float
+    # CPU time one request takes
+    cpu_ms_per_request: float
+    memory_mib: int
+    # the HPA scales up to this many times target_rps
+    peak_factor: float = 2.0
+
+
+class CapacityPlan(typing.NamedTuple):
+    name: str
+    replicas: int
+    max_replicas: int
+    # the HPA's target, percent of the CPU request
+    cpu_utilization: int
+    cpu_millicores: int
+    cpu_limit_millicores: int
+    memory_mib: int
+    max_unavailable: int
+
+
+def plan_capacity(services: typing.Sequence[ServiceSlo], *, target_utilization: float = 0.7,
+                  min_replicas: int = 2, cpu_limit_factor: float = 2.0) -> typing.List[CapacityPlan]:
+    """Plans every service in services, see the module docstring. Raises
+    ValueError naming every service whose SLO cannot be met or whose numbers
+    are not positive."""
+    # computed a column at a time over all services as NumPy arrays, rather
+    # than service by service, so thousands of them are planned in one pass
+    names = [service.name for service in services]
+    columns = np.array([service[1:] for service in services], dtype=float).reshape(-1, len(ServiceSlo._fields) - 1)
+    target_rps, pod_rps, service_ms, latency_slo_ms, cpu_ms_per_request, memory_mib, peak_factor = columns.T
+    invalid = columns.min(axis=1, initial=math.inf) <= 0
+    if invalid.any():
+        raise ValueError(f"services need positive numbers: {', '.join(_named(names, invalid))}")
+    slo_utilization = 1 - service_ms / latency_slo_ms
+    unmet = slo_utilization <= 0
+    if unmet.any():
+        raise ValueError(f"latency SLO is below the latency of an idle pod: {', '.join(_named(names, unmet))}")
+
+    # whole percent, as the HPA takes it, and the rest of the plan follows it
+    percent = np.floor(np.minimum(target_utilization, slo_utilization) * 100 + _EPSILON)
+    planned_rps = pod_rps * percent / 100
+    replicas = np.maximum(min_replicas, _ceil(target_rps / planned_rps))
+    max_replicas = np.maximum(replicas, _ceil(target_rps * peak_factor / planned_rps))
+    needed = _ceil(target_rps / (pod_rps * slo_utilization))
+    max_unavailable = np.maximum(1, replicas - needed)
+    cpu = _ceil(pod_rps * cpu_ms_per_request)
+    cpu_limit = _ceil(cpu * cpu_limit_factor)
+    # tolist, for ints of Python that jsii serializes
+    return [CapacityPlan(*row) for row in zip(names, *(column.astype(int).tolist() for column in (
+        replicas, max_replicas, percent, cpu, cpu_limit, memory_mib, max_unavailable)))]
+
+
+def _ceil(values: np.ndarray) -> np.ndarray:
+    return np.ceil(values - _EPSILON)
+
+
+def _named(names: typing.List[str], mask: np.ndarray) -> typing.List[str]:
+    return [name for name, masked in zip(names, mask) if masked]
+
+
+class PlannedDeployment(Construct):
+    """A Deployment of one container sized by plan, with its
+    HorizontalPodAutoscaler and PodDisruptionBudget. With availability, its
+    pods are spread over zones, only those in zones if given, and nodes."""
+
+    def __init__(self, scope: Construct, id: str, *, plan: CapacityPlan, labels: typing.Mapping[str, str],
+                 name: str, image: str, port: typing.Optional[int] = None,
+                 availability: typing.Optional[AvailabilityProfile] = None, zones: typing.Sequence[str] = ()):
+        super().__init__(scope, id)
+        placement = pod_placement(availability, labels, plan.replicas, zones) if availability is not None else None
+        cpu = k8s.Quantity.from_string(f"{plan.cpu_millicores}m")
+        memory = k8s.Quantity.from_string(f"{plan.memory_mib}Mi")
+        # no replicas, the HPA owns them from its minReplicas on, and an apply
+        # would scale the Deployment back to a fixed count; "Default" keeps the
+        # name a Deployment with the id of this construct has
+        self.deployment = k8s.KubeDeployment(self, "Default", spec=k8s.DeploymentSpec(
+            selector=k8s.LabelSelector(match_labels=labels),
+            template=k8s.PodTemplateSpec(
+                metadata=k8s.ObjectMeta(labels=labels),
+                spec=k8s.PodSpec(containers=[k8s.Container(
+                    name=name,
+                    image=image,
+                    ports=[k8s.ContainerPort(container_port=port)] if port is not None else None,
+                    resources=k8s.ResourceRequirements(
+                        requests={"cpu": cpu, "memory": memory},
+                        limits={"cpu": k8s.Quantity.from_string(f"{plan.cpu_limit_millicores}m"),
+                                "memory": memory}),
+                )],
+                    affinity=placement.affinity if placement else None,
+                    topology_spread_constraints=placement.topology_spread_constraints if placement else None))))
+        utilization = k8s.MetricTargetV2(type="Utilization", average_utilization=plan.cpu_utilization)
+        self.autoscaler = k8s.KubeHorizontalPodAutoscalerV2(
+            self, "autoscaler", spec=k8s.HorizontalPodAutoscalerSpecV2(
+                scale_target_ref=k8s.CrossVersionObjectReferenceV2(
+                    api_version="apps/v1", kind="Deployment", name=self.deployment.name),
+                min_replicas=plan.replicas,
+                max_replicas=plan.max_replicas,
+                metrics=[k8s.MetricSpecV2(
+                    type="Resource", resource=k8s.ResourceMetricSourceV2(name="cpu", target=utilization))]))
+        self.disruption_budget = k8s.KubePodDisruptionBudget(
+            self, "disruption-budget", spec=k8s.PodDisruptionBudgetSpec(
+                max_unavailable=k8s.IntOrString.from_number(plan.max_unavailable),
+                selector=k8s.LabelSelector(match_labels=labels)))
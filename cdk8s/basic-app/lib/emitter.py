@@ -0,0 +1,414 @@
+"""A pure Python backend for charts built from the imports/k8s bindings.
+
+cdk8s.App, cdk8s.Chart and the generated Kube* classes live in the jsii kernel,
+so every API object is a round trip to node, and so is every object again when
+app.synth() renders it. The classes here build the same construct tree in
+Python and render it without the kernel, to the same bytes cdk8s writes:
+
+    app = emitter.App()
+    chart = emitter.Chart(app, "getting-started")
+    emitter.kinds.KubeDeployment(chart, "my-deployment", spec=k8s.DeploymentSpec(...))
+    app.synth()
+
+The structs passed in are the generated k8s data types, which are plain Python
+already. IntOrString and Quantity are jsii objects whose value is read from the
+kernel, so use int_or_string() and quantity() instead of their from_number and
+from_string to stay off it.
+
+Not supported: json patches, dependencies between constructs, charts nested in
+charts, Lazy values and the FILE_PER_RESOURCE output types; use cdk8s for those.
+"""
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import typing
+
+from imports import k8s
+from imports.k8s import _manifest
+from lib import yaml_writer
+
+_DNS_LABEL = re.compile(r"^[0-9a-z-]+$")
+_NOT_DNS_CHARACTER = re.compile(r"[^0-9a-zA-Z\-_.]")
+_INDEX_KEY = re.compile(r"^(?:0|[1-9][0-9]*)$")
+_MAX_NAME_LENGTH = 63
+_HASH_LENGTH = 8
+
+# apiVersion, kind, props type, props and metadata of an ApiObject
+_RenderArgs = typing.Tuple[str, str, str, typing.Dict[str, typing.Any], typing.Dict[str, typing.Any]]
+
+
+class Construct:
+    """A node of the construct tree, as constructs.Construct."""
+
+    def __init__(self, scope: typing.Optional["Construct"], id: str):
+        self.scope = scope
+        self.id = id.replace("/", "--")
+        self.children: typing.List[Construct] = []
+        self._child_ids: typing.Set[str] = set()
+        self._stream: typing.Optional[_Stream] = None
+        if scope is not None:
+            if self.id in scope._child_ids:
+                raise ValueError(f"There is already a Construct with name '{self.id}' in {type(scope).__name__}"
+                                 f" [{scope.path or 'App'}]")
+            scope._child_ids.add(self.id)
+            self._stream = scope._stream
+            if self._stream is None:
+                scope.children.append(self)
+            else:
+                # a streamed file is written in the order cdk8s walks the
+                # tree, so nothing can be added to a subtree already left
+                if scope not in self._stream.last.scopes:
+                    raise ValueError(f"cannot add '{self.id}' to [{scope.path or 'App'}] after "
+                                     f"[{self._stream.last.path}]: a streaming App writes objects as they are "
+                                     f"added, so build the tree depth first")
+                self._stream.last = self
+
+    @property
+    def app(self) -> "App":
+        return typing.cast(App, self.scopes[0])
+
+    @property
+    def scopes(self) -> typing.List["Construct"]:
+        scopes = []
+        node: typing.Optional[Construct] = self
+        while node is not None:
+            scopes.insert(0, node)
+            node = node.scope
+        return scopes
+
+    @property
+    def path(self) -> str:
+        return "/".join(scope.id for scope in self.scopes if scope.id)
+
+    @property
+    def addr(self) -> str:
+        digest = hashlib.sha1()
+        for scope in self.scopes:
+            if scope.id != "Default":
+                digest.update(scope.id.encode() + b"\n")
+        return "c8" + digest.hexdigest()
+
+    def find_all(self) -> typing.Iterator["Construct"]:
+        yield self
+        for child in self.children:
+            yield from child.find_all()
+
+
+class _Stream:
+    # one output file of a streaming App, and the construct added to it last
+    def __init__(self, path: str, last: Construct):
+        self.path = path
+        self.last = last
+        self.documents = 0
+        self.created = False
+
+
+class App(Construct):
+    """The root of the tree.
+
+    With stream=True, every object is rendered and appended to the file of its
+    chart as soon as it is created, and is not kept in the tree, so memory
+    stays flat however many objects the charts have. The files are the same,
+    provided the tree is built depth first, i.e. nothing is added to a
+    construct once a sibling after it was added; synth() then only closes them.
+    Streamed objects are not in the tree, so chart.api_objects, chart.to_json()
+    and synth_yaml() do not have them, and lib.validation.check_schema refuses
+    a streaming App.
+    """
+
+    def __init__(self, outdir: typing.Optional[str] = None, output_file_extension: str = ".k8s.yaml",
+                 yaml_output_type: str = "FILE_PER_CHART", stream: bool = False):
+        super().__init__(None, "")
+        if yaml_output_type not in ("FILE_PER_CHART", "FILE_PER_APP"):
+            raise NotImplementedError(f"yaml_output_type {yaml_output_type}")
+        self.outdir = outdir or os.environ.get("CDK8S_OUTDIR") or "dist"
+        self.output_file_extension = output_file_extension
+        self.yaml_output_type = yaml_output_type
+        self.stream = stream
+        self._file: typing.Optional[typing.TextIO] = None
+        self._resources: typing.Dict[str, typing.Dict[str, str]] = {}
+        if stream:
+            os.makedirs(self.outdir, exist_ok=True)
+            if yaml_output_type == "FILE_PER_APP":
+                self._stream = _Stream(os.path.join(self.outdir, f"app{output_file_extension}"), self)
+
+    @property
+    def charts(self) -> typing.List["Chart"]:
+        return [node for node in self.find_all() if isinstance(node, Chart)]
+
+    def synth(self, workers: typing.Optional[int] = None) -> None:
+        """Writes the charts to outdir.
+
+        With workers, the charts are rendered in a pool of that many processes.
+        Charts cannot refer to each other here, so any of them can be rendered
+        anywhere; the files are written by this process in chart order and are
+        the same as without workers.
+        """
+        if self.stream:
+            if workers:
+                raise ValueError("a streaming App has written its objects already")
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._write_metadata(self._resources)
+            return
+        os.makedirs(self.outdir, exist_ok=True)
+        charts = self.charts
+        rendered = self._render(charts, workers)
+        if self.yaml_output_type == "FILE_PER_APP":
+            if charts:
+                self._write(f"app{self.output_file_extension}", "---\n".join(text for text in rendered if text))
+        else:
+            for chart, text in zip(charts, rendered):
+                self._write(to_dns_label(chart) + self.output_file_extension, text)
+        self._write_metadata({obj.name: {"path": obj.path} for chart in charts for obj in chart.api_objects})
+
+    def synth_yaml(self) -> str:
+        return yaml_writer.dump_all(manifest for chart in self.charts for manifest in chart.to_json())
+
+    def _render(self, charts: typing.List["Chart"], workers: typing.Optional[int]) -> typing.List[str]:
+        jobs = [[api_object.render_args() for api_object in chart.api_objects] for chart in charts]
+        if not workers or workers < 2 or len(jobs) < 2:
+            return [_render_chart(job) for job in jobs]
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            # a few chunks per worker, so that big charts even out
+            return list(pool.map(_render_chart, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    def _write(self, name: str, text: str) -> None:
+        with open(os.path.join(self.outdir, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _write_metadata(self, resources: typing.Dict[str, typing.Dict[str, str]]) -> None:
+        if os.environ.get("CDK8S_RECORD_CONSTRUCT_METADATA") == "true":
+            with open(os.path.join(self.outdir, "construct-metadata.json"), "w") as f:
+                f.write(json.dumps({"version": "1.0.0", "resources": resources},
+                                   ensure_ascii=False, separators=(",", ":")))
+
+    def _append(self, stream: _Stream, api_object: typing.Optional["ApiObject"] = None) -> None:
+        # one file is open at a time; charts are mostly written one after another
+        if self._file is None or self._file.name != stream.path:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(stream.path, "a" if stream.created else "w", encoding="utf-8")
+            stream.created = True
+        if api_object is not None:
+            if stream.documents:
+                self._file.write("---\n")
+            self._file.write(yaml_writer.dump(api_object.to_json()))
+            stream.documents += 1
+            if os.environ.get("CDK8S_RECORD_CONSTRUCT_METADATA") == "true":
+                self._resources[api_object.name] = {"path": api_object.path}
+
+
+class Chart(Construct):
+    def __init__(self, scope: Construct, id: str, *, namespace: typing.Optional[str] = None,
+                 labels: typing.Optional[typing.Mapping[str, str]] = None,
+                 disable_resource_name_hashes: bool = False):
+        if any(isinstance(node, Chart) for node in scope.scopes):
+            raise NotImplementedError("charts nested in charts")
+        super().__init__(scope, id)
+        self.namespace = namespace
+        self.labels = dict(labels or {})
+        self.disable_resource_name_hashes = disable_resource_name_hashes
+        app = self.app
+        if app.stream:
+            if self._stream is None:
+                self._stream = _Stream(os.path.join(app.outdir, to_dns_label(self) + app.output_file_extension),
+                                       self)
+            # cdk8s writes a file for a chart without objects too
+            app._append(self._stream)
+
+    @property
+    def api_objects(self) -> typing.List["ApiObject"]:
+        return [node for node in self.find_all() if isinstance(node, ApiObject)]
+
+    def generate_object_name(self, api_object: "ApiObject") -> str:
+        return to_dns_label(api_object, include_hash=not self.disable_resource_name_hashes,
+                            max_length=52 if api_object.kind == "CronJob" else _MAX_NAME_LENGTH)
+
+    def to_json(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        return [api_object.to_json() for api_object in self.api_objects]
+
+
+class ApiObject(Construct):
+    """An object of one of the generated Kube* kinds, e.g. "KubeDeployment",
+    with its <Kind>Props struct."""
+
+    def __init__(self, scope: Construct, id: str, kind: str, props: typing.Any):
+        super().__init__(scope, id)
+        self.chart = next((node for node in reversed(self.scopes) if isinstance(node, Chart)), None)
+        if self.chart is None:
+            raise ValueError("cannot find a parent chart (directly or indirectly)")
+        self.api_version, self.kind = _manifest.GVK[kind]
+        self.props_type = kind + "Props"
+        self.props = _to_json(props)
+        metadata = self.props.get("metadata") or {}
+        name = metadata.get("name")
+        self.name = name if name is not None else self.chart.generate_object_name(self)
+        namespace = metadata.get("namespace")
+        self.metadata = dict(metadata, name=self.name,
+                             namespace=namespace if namespace is not None else self.chart.namespace,
+                             labels={**self.chart.labels, **(metadata.get("labels") or {})})
+        if self._stream is not None:
+            self.app._append(self._stream, self)
+
+    def to_json(self) -> typing.Dict[str, typing.Any]:
+        return _render(self.render_args())
+
+    def render_args(self) -> _RenderArgs:
+        """What rendering the object needs, without the tree it is in."""
+        return self.api_version, self.kind, self.props_type, self.props, self.metadata
+
+
+class _Kinds:
+    # emitter.kinds.KubeDeployment(scope, id, **props) for every generated kind
+    def __getattr__(self, kind: str) -> typing.Callable[..., ApiObject]:
+        if kind not in _manifest.GVK:
+            raise AttributeError(kind)
+        props_type = getattr(k8s, kind + "Props")
+
+        def create(scope: Construct, id: str, **props: typing.Any) -> ApiObject:
+            return ApiObject(scope, id, kind, props_type(**props))
+
+        create.__name__ = kind
+        setattr(self, kind, create)
+        return create
+
+
+kinds = _Kinds()
+
+
+class _IntOrString(k8s.IntOrString):
+    # holds its value in Python rather than in the kernel
+    @property
+    def value(self) -> typing.Union[str, int, float]:
+        return self._value
+
+
+class _Quantity(k8s.Quantity):
+    @property
+    def value(self) -> typing.Union[str, int, float]:
+        return self._value
+
+
+def int_or_string(value: typing.Union[str, int, float]) -> k8s.IntOrString:
+    """A k8s.IntOrString for this backend, which cdk8s cannot serialize."""
+    result = object.__new__(_IntOrString)
+    result._value = value
+    return result
+
+
+def quantity(value: typing.Union[str, int, float]) -> k8s.Quantity:
+    """A k8s.Quantity for this backend, which cdk8s cannot serialize."""
+    result = object.__new__(_Quantity)
+    result._value = value
+    return result
+
+
+def to_dns_label(node: Construct, include_hash: bool = True, max_length: int = _MAX_NAME_LENGTH) -> str:
+    """cdk8s.Names.to_dns_label."""
+    components = node.path.split("/")
+    if len(components) == 1 and _DNS_LABEL.match(components[0]) and len(components[0]) <= max_length:
+        return components[0]
+    components = [_NOT_DNS_CHARACTER.sub("", component.lower())[:max_length] for component in components]
+    if include_hash:
+        if os.environ.get("CDK8S_LEGACY_HASH"):
+            components.append(hashlib.sha256(node.path.encode()).hexdigest()[:_HASH_LENGTH])
+        else:
+            components.append(node.addr[:_HASH_LENGTH])
+    return _human_form(components, "-", max_length)
+
+
+def _human_form(components: typing.List[str], delimiter: str, max_length: int) -> str:
+    # keeps the last components when the name is too long
+    components = components[::-1]
+    deduplicated = [c for i, c in enumerate(components) if i == 0 or c != components[i - 1]]
+    kept = "/".join(deduplicated)[:max_length].split("/")[::-1]
+    parts = delimiter.join(c for c in kept if c).split(delimiter)
+    return delimiter.join(p for p in parts if p and p.lower() not in ("resource", "default"))
+
+
+def _render(args: _RenderArgs) -> typing.Dict[str, typing.Any]:
+    # as ApiObject.toJson and the generated Kube<Kind>.toJson: sort and drop
+    # nulls, empty values too in the metadata, then let the converters put
+    # the fields of every struct in their order
+    api_version, kind, props_type, props, metadata = args
+    sort_keys = not os.environ.get("CDK8S_DISABLE_SORT")
+    data = {"apiVersion": api_version, "kind": kind, **props,
+            "metadata": _sanitize(metadata, True, filter_empty=True)}
+    data = _sanitize(data, sort_keys, filter_empty=False)
+    manifest = {"apiVersion": api_version, "kind": kind}
+    manifest.update(_convert(props_type, data))
+    return manifest
+
+
+def _render_chart(objects: typing.List[_RenderArgs]) -> str:
+    # runs in the worker processes of App.synth
+    return yaml_writer.dump_all(_render(args) for args in objects)
+
+
+def _to_json(value: typing.Any) -> typing.Any:
+    # the JSON jsii hands the kernel for a value, in any key order
+    if value is None:
+        return None
+    mapping = getattr(type(value), "__jsii_name_mapping__", None)
+    if mapping is not None:
+        return {mapping[name]: _to_json(item) for name, item in value._values.items()}
+    if isinstance(value, (k8s.IntOrString, k8s.Quantity)):
+        return value.value
+    if isinstance(value, dict):
+        return {str(key): _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if not isinstance(value, (str, int, float)):
+        # cdk8s fails on these too, e.g. a datetime is a Date in the kernel
+        raise TypeError(f"can't render non-simple object of type '{type(value).__name__}'")
+    return value
+
+
+def _js_keys(keys: typing.Iterable[str], sort: bool) -> typing.List[str]:
+    # JavaScript objects list array index keys first, in numeric order
+    keys = list(keys)
+    indexes = sorted((key for key in keys if _INDEX_KEY.match(key) and int(key) < 2 ** 32 - 1), key=int)
+    others = [key for key in keys if not (_INDEX_KEY.match(key) and int(key) < 2 ** 32 - 1)]
+    if sort:
+        others.sort(key=lambda key: key.encode("utf-16-be", "surrogatepass"))
+    return indexes + others
+
+
+def _sanitize(value: typing.Any, sort: bool, filter_empty: bool) -> typing.Any:
+    # cdk8s' sanitizeValue: drops nulls and, with filter_empty, empty arrays and
+    # objects; keys are sorted with sort
+    if isinstance(value, list):
+        if filter_empty and not value:
+            return None
+        return [_sanitize(item, sort, filter_empty) for item in value]
+    if isinstance(value, dict):
+        result = {}
+        for key in _js_keys(value, sort):
+            item = _sanitize(value[key], sort, filter_empty)
+            if item is not None:
+                result[key] = item
+        if filter_empty and not result:
+            return None
+        return result
+    return value
+
+
+def _convert(struct: str, data: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    # the toJson_<struct> converter: its fields in its order, unknown ones dropped
+    result = {}
+    for field, held in _manifest.FIELDS[struct]:
+        value = data.get(field)
+        if value is None:
+            continue
+        if held.endswith("[]"):
+            value = [_convert(held[:-2], item) for item in value]
+        elif held.endswith("{}"):
+            value = {key: _convert(held[:-2], item) for key, item in value.items()}
+        elif held:
+            value = _convert(held, value)
+        result[field] = value
+    return result
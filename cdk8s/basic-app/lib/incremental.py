@@ -0,0 +1,239 @@
+"""Incremental synth: only the charts whose inputs changed are built again.
+
+    app = IncrementalApp(cdk8s.App)
+    app.add_chart(MyChart, "getting-started", app_label="my-app")
+    app.synth()
+
+A chart's inputs are the arguments it is created with, the source of the
+module that defines it, of every module of the project (any file under APP_DIR
+outside the k8s bindings) loaded at synth or when the chart was last built, and
+of any other files listed in sources, the CDK8S_* environment variables, the
+version of cdk8s and the contents of the k8s bindings. When these and the files the chart wrote last time are unchanged,
+the chart is not constructed at all and its files are left alone. Otherwise it
+is built in an App of its own and synthesized, and a file is only replaced if
+its content changed. Files of charts that are gone, or no longer written, are
+deleted. After synth(), constructed maps the id of every chart that was built
+to what creating it returned, e.g. the Chart, to report on it.
+
+The fingerprints are kept in outdir/.synth-hashes. It has no .yaml or .json
+extension, so `kubectl apply -f dist/` skips it. Works with cdk8s.App and
+lib.emitter.App, as long as charts do not refer to each other and the app
+writes one file per chart.
+"""
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import sys
+import tempfile
+import typing
+
+from lib.jsii_startup import APP_DIR
+
+HASHES_FILE = ".synth-hashes"
+
+# the generated k8s bindings, and the backend that renders charts without cdk8s
+_BINDINGS = os.path.join(APP_DIR, "imports", "k8s")
+_EMITTER = [os.path.join(APP_DIR, "lib", name) for name in ("emitter.py", "yaml_writer.py")]
+
+# the environment of the synth, not an input
+_IGNORED_ENV = ("CDK8S_OUTDIR", "CDK8S_INCREMENTAL")
+
+
+class SynthResult(typing.NamedTuple):
+    written: typing.List[str]
+    unchanged: typing.List[str]
+    removed: typing.List[str]
+    built: typing.List[str]
+
+
+class _ChartSpec(typing.NamedTuple):
+    chart: typing.Callable[..., typing.Any]
+    id: str
+    args: typing.Tuple[typing.Any, ...]
+    kwargs: typing.Dict[str, typing.Any]
+
+
+class IncrementalApp:
+    def __init__(self, app_type: typing.Callable[..., typing.Any], outdir: typing.Optional[str] = None,
+                 enabled: bool = True, sources: typing.Sequence[str] = ()):
+        self.app_type = app_type
+        self.outdir = outdir or os.environ.get("CDK8S_OUTDIR") or "dist"
+        self.enabled = enabled
+        self.sources = list(sources)
+        self._charts: typing.List[_ChartSpec] = []
+        self.constructed: typing.Dict[str, typing.Any] = {}
+
+    def add_chart(self, chart: typing.Callable[..., typing.Any], id: str, *args: typing.Any,
+                  **kwargs: typing.Any) -> None:
+        """Adds chart(app, id, *args, **kwargs) to the app; chart is a Chart
+        class, or any function that adds charts to app."""
+        if any(spec.id == id for spec in self._charts):
+            raise ValueError(f"There is already a chart with id '{id}'")
+        self._charts.append(_ChartSpec(chart, id, args, kwargs))
+
+    def synth(self) -> SynthResult:
+        os.makedirs(self.outdir, exist_ok=True)
+        self.constructed = {}
+        if not self.enabled:
+            app = self.app_type(outdir=self.outdir)
+            for spec in self._charts:
+                self.constructed[spec.id] = spec.chart(app, spec.id, *spec.args, **spec.kwargs)
+            app.synth()
+            return SynthResult([], [], [], [spec.id for spec in self._charts])
+
+        previous = self._load_hashes()
+        toolchain = _toolchain()
+        charts: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        written: typing.List[str] = []
+        unchanged: typing.List[str] = []
+        built: typing.List[str] = []
+        for spec in self._charts:
+            entry = previous.get(spec.id)
+            # a module the chart imports while it is built is not loaded yet
+            # in a new process, the last build recorded it
+            modules = _project_modules(entry.get("modules", []) if entry is not None else [])
+            inputs = self._fingerprint(spec, toolchain, modules)
+            if entry is not None and entry["inputs"] == inputs and self._intact(entry["files"]):
+                charts[spec.id] = entry
+                unchanged.extend(entry["files"])
+                continue
+            files, resources = self._build(spec, written, unchanged)
+            for other, other_entry in charts.items():
+                for name in set(files) & set(other_entry["files"]):
+                    raise ValueError(f"charts {other} and {spec.id} both write {name}")
+            modules = _project_modules(modules)
+            charts[spec.id] = {"inputs": self._fingerprint(spec, toolchain, modules), "files": files,
+                               "resources": resources, "modules": modules}
+            built.append(spec.id)
+
+        kept = {name for entry in charts.values() for name in entry["files"]}
+        removed = []
+        for entry in previous.values():
+            for name in entry["files"]:
+                if name not in kept and os.path.exists(os.path.join(self.outdir, name)):
+                    os.remove(os.path.join(self.outdir, name))
+                    removed.append(name)
+        self._write_hashes(charts)
+        if os.environ.get("CDK8S_RECORD_CONSTRUCT_METADATA") == "true":
+            resources = {name: value for entry in charts.values() for name, value in entry["resources"].items()}
+            with open(os.path.join(self.outdir, "construct-metadata.json"), "w") as f:
+                f.write(json.dumps({"version": "1.0.0", "resources": resources},
+                                   ensure_ascii=False, separators=(",", ":")))
+        return SynthResult(written, unchanged, sorted(removed), built)
+
+    def _build(self, spec: _ChartSpec, written: typing.List[str],
+               unchanged: typing.List[str]) -> typing.Tuple[typing.Dict[str, str], typing.Dict[str, typing.Any]]:
+        files = {}
+        resources = {}
+        # in outdir, so that files can be moved into place
+        with tempfile.TemporaryDirectory(prefix=".synth-", dir=self.outdir) as tmp:
+            app = self.app_type(outdir=tmp)
+            self.constructed[spec.id] = spec.chart(app, spec.id, *spec.args, **spec.kwargs)
+            app.synth()
+            for name in sorted(os.listdir(tmp)):
+                path = os.path.join(tmp, name)
+                if os.path.isdir(path):
+                    raise NotImplementedError(f"chart {spec.id} wrote the directory {name}; incremental synth "
+                                              f"needs one file per chart")
+                if name == "construct-metadata.json":
+                    with open(path) as f:
+                        resources = json.load(f)["resources"]
+                    continue
+                files[name] = _sha256(path)
+                target = os.path.join(self.outdir, name)
+                if os.path.exists(target) and _sha256(target) == files[name]:
+                    unchanged.append(name)
+                else:
+                    os.replace(path, target)
+                    written.append(name)
+        return files, resources
+
+    def _fingerprint(self, spec: _ChartSpec, toolchain: str, modules: typing.List[str]) -> str:
+        digest = hashlib.sha256(toolchain.encode())
+        chart = spec.chart
+        digest.update(f"{chart.__module__}.{chart.__qualname__}\n".encode())
+        module = sys.modules.get(chart.__module__)
+        sources = [inspect.getsourcefile(module)] if module is not None else []
+        for path in sources + self.sources:
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        for name in modules:
+            path = os.path.join(APP_DIR, name)
+            # a module that was deleted is a change too
+            digest.update(f"{name} {_sha256(path) if os.path.exists(path) else '-'}\n".encode())
+        # objects without a stable repr make the chart rebuild every time,
+        # rather than never
+        digest.update(json.dumps([spec.id, spec.args, spec.kwargs], sort_keys=True, default=repr).encode())
+        env = sorted((key, value) for key, value in os.environ.items()
+                     if key.startswith("CDK8S_") and key not in _IGNORED_ENV)
+        digest.update(json.dumps(env).encode())
+        return digest.hexdigest()
+
+    def _intact(self, files: typing.Dict[str, str]) -> bool:
+        for name, sha in files.items():
+            path = os.path.join(self.outdir, name)
+            if not os.path.exists(path) or _sha256(path) != sha:
+                return False
+        return True
+
+    def _load_hashes(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        try:
+            with open(os.path.join(self.outdir, HASHES_FILE)) as f:
+                return json.load(f)["charts"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _write_hashes(self, charts: typing.Dict[str, typing.Dict[str, typing.Any]]) -> None:
+        path = os.path.join(self.outdir, HASHES_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"version": 1, "charts": charts}, f, indent=1, sort_keys=True)
+        os.replace(path + ".tmp", path)
+
+
+def _toolchain() -> str:
+    # what renders the charts, besides their own code
+    parts = []
+    for distribution in ("cdk8s", "constructs", "jsii"):
+        try:
+            parts.append(f"{distribution}=={importlib.metadata.version(distribution)}")
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    # the version loaded, which may not be the one installed in the metadata
+    cdk8s = sys.modules.get("cdk8s")
+    if cdk8s is not None:
+        parts.append(f"cdk8s {getattr(cdk8s, '__version__', '')}")
+    # `cdk8s import` writes the same file names every time, so the contents
+    # count, of the assembly and of the generated modules alike
+    for directory, dirs, files in os.walk(_BINDINGS):
+        dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+        for name in sorted(files):
+            path = os.path.join(directory, name)
+            parts.append(f"{os.path.relpath(path, _BINDINGS)} {_sha256(path)}")
+    for path in _EMITTER:
+        parts.append(_sha256(path))
+    return "\n".join(parts)
+
+
+def _project_modules(known: typing.Iterable[str]) -> typing.List[str]:
+    # the loaded modules of the project, relative to APP_DIR, and known
+    modules = set(known)
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if not path or not path.endswith(".py"):
+            continue
+        path = os.path.realpath(path)
+        if os.path.commonpath([path, APP_DIR]) != APP_DIR or os.path.commonpath([path, _BINDINGS]) == _BINDINGS \
+                or "site-packages" in path.split(os.sep):
+            continue
+        modules.add(os.path.relpath(path, APP_DIR))
+    return sorted(modules)
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,103 @@
+"""Startup of the jsii kernel, the node process that runs the JavaScript side of
+constructs, cdk8s and the imports/k8s bindings.
+
+The first jsii call of a process starts the kernel, and importing each of those
+packages loads its assembly tarball into it. The kernel extracts a tarball into
+a package cache keyed by its content hash, and a background thread adds an index
+of the assembly's types, so later runs map the extracted package and its index
+instead of untarring and parsing the assembly again. use_package_cache turns
+that cache on and keeps it in .jsii-cache next to the app, where it survives in
+CI caches and containers without a writable home directory. The index is only
+written if the process lives long enough, which a short synth may not, so
+wait_for_index waits for it. time_startup measures what is left:
+
+    timings = time_startup()
+    import cdk8s
+    from imports import k8s
+    print(timings.report())
+
+This module must not import jsii packages itself, both have to run before the
+kernel starts.
+"""
+import glob
+import os
+import sys
+import time
+import typing
+import warnings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+CACHE_DIR = os.path.join(APP_DIR, ".jsii-cache")
+
+
+def _kernel_started() -> bool:
+    # every jsii package loads its assembly when its _jsii module is imported
+    return any(name.endswith("._jsii") for name in sys.modules)
+
+
+def use_package_cache(root: str = CACHE_DIR) -> None:
+    """Enables the kernel's package cache in root. JSII_RUNTIME_PACKAGE_CACHE and
+    JSII_RUNTIME_PACKAGE_CACHE_ROOT in the environment take precedence."""
+    if _kernel_started() and "JSII_RUNTIME_PACKAGE_CACHE_ROOT" not in os.environ:
+        warnings.warn("use_package_cache has no effect once a jsii package is imported", stacklevel=2)
+    os.environ.setdefault("JSII_RUNTIME_PACKAGE_CACHE", "enabled")
+    os.environ.setdefault("JSII_RUNTIME_PACKAGE_CACHE_ROOT", root)
+
+
+def wait_for_index(names: typing.Iterable[str], timeout: float = 30.0) -> typing.List[str]:
+    """Waits until the kernel has indexed the cached packages of the named
+    assemblies, returns the names it gave up on after timeout seconds."""
+    root = os.environ.get("JSII_RUNTIME_PACKAGE_CACHE_ROOT", CACHE_DIR)
+    pending = set(names)
+    deadline = time.monotonic() + timeout
+    while pending and time.monotonic() < deadline:
+        pending = {name for name in pending
+                   if not glob.glob(os.path.join(root, name, "*", "*", ".jsii.runtime-index.v*"))}
+        if pending:
+            time.sleep(0.1)
+    return sorted(pending)
+
+
+class StartupTimings:
+    """Seconds spent starting the kernel and loading each assembly into it."""
+
+    def __init__(self):
+        self.kernel = 0.0
+        self.assemblies: typing.Dict[str, float] = {}
+
+    @property
+    def total(self) -> float:
+        return self.kernel + sum(self.assemblies.values())
+
+    def report(self) -> str:
+        lines = [f"{'kernel start':<16}{self.kernel * 1000:>8.0f} ms"]
+        lines += [f"{name:<16}{seconds * 1000:>8.0f} ms" for name, seconds in self.assemblies.items()]
+        lines.append(f"{'total':<16}{self.total * 1000:>8.0f} ms")
+        return "\n".join(lines)
+
+
+def time_startup() -> StartupTimings:
+    """Records the kernel start and assembly loads of this process from here on."""
+    if _kernel_started():
+        warnings.warn("time_startup misses the assemblies that are already loaded", stacklevel=2)
+    from jsii._kernel import Kernel
+    from jsii._kernel.providers.process import _NodeProcess
+
+    timings = StartupTimings()
+    load, start = Kernel.load, _NodeProcess.start
+
+    def timed_start(process: _NodeProcess) -> None:
+        began = time.perf_counter()
+        start(process)
+        timings.kernel += time.perf_counter() - began
+
+    def timed_load(kernel: Kernel, name: str, version: str, tarball: str) -> None:
+        # the first load starts the kernel, which is counted separately
+        kernel_before = timings.kernel
+        began = time.perf_counter()
+        load(kernel, name, version, tarball)
+        timings.assemblies[name] = time.perf_counter() - began - (timings.kernel - kernel_before)
+
+    Kernel.load = timed_load
+    _NodeProcess.start = timed_start
+    return timings
@@ -0,0 +1,323 @@
+"""Validation of rendered manifests against the Kubernetes OpenAPI schema.
+
+Every generated k8s class names the OpenAPI definition it was generated from
+(`:schema: io.k8s.api.apps.v1.Deployment`). load_schema reads those definitions
+once per process, from a swagger.json (`kubectl get --raw /openapi/v2`) or, by
+default, from the jsii assembly of the bindings, which carries them too, and
+compiles each definition into a function that checks a JSON value against it.
+validate_manifests runs them over any number of manifests and returns every
+error it finds, keyed by the index of the manifest:
+
+    errors = validate_manifests(manifests, workers=4)
+    for index, messages in errors.items():
+        print(manifests[index]["kind"], messages)
+
+The checks are those of the schema: the JSON type of every field, required and
+unknown fields, and enums. Manifests whose apiVersion and kind the schema does
+not define, custom resources for one, are not checked.
+
+This module must not import jsii packages, so that worker processes stay off
+the kernel.
+"""
+import concurrent.futures
+import functools
+import glob
+import json
+import os
+import re
+import runpy
+import tarfile
+import typing
+
+from lib.jsii_startup import APP_DIR
+
+# checks value at path, appends "<path>: <error>" to errors
+_Check = typing.Callable[[typing.Any, str, typing.List[str]], None]
+# the exact types a field accepts (None for any), the check of its content
+# and how errors name what was expected
+_Field = typing.Tuple[typing.Optional[typing.FrozenSet[type]], typing.Optional[_Check], str]
+
+_TYPES = {
+    "string": frozenset((str,)),
+    "integer": frozenset((int,)),
+    "number": frozenset((int, float)),
+    "boolean": frozenset((bool,)),
+    "object": frozenset((dict,)),
+    "array": frozenset((list,)),
+}
+_JSON_TYPES = {str: "string", int: "integer", float: "number", bool: "boolean", dict: "object", list: "array",
+               type(None): "null"}
+# typed "string" in the schema, but the API server takes numbers for them too
+# and IntOrString.from_number and Quantity.from_number render numbers
+_INT_OR_STRING = frozenset((str, int))
+_QUANTITY = "io.k8s.apimachinery.pkg.api.resource.Quantity"
+
+_JSII_PRIMITIVES = {
+    "string": {"type": "string"},
+    "number": {"type": "number"},
+    "boolean": {"type": "boolean"},
+    "date": {"type": "string", "format": "date-time"},
+    "any": {},
+}
+_JSII_CLASSES = {
+    "io.k8s.apimachinery.pkg.util.intstr.IntOrString": {"type": "string", "format": "int-or-string"},
+    _QUANTITY: {"type": "string"},
+}
+# an enum member in the compiled TypeScript of the bindings
+_ENUM_MEMBER = re.compile(r'^\s*(\w+)\["(\w+)"\] = ("(?:[^"\\]|\\.)*");$', re.MULTILINE)
+
+
+class Schema:
+    """The compiled validators of a set of OpenAPI definitions."""
+
+    def __init__(self, definitions: typing.Mapping[str, typing.Mapping[str, typing.Any]], ref_prefix: str):
+        self.definitions = definitions
+        self.ref_prefix = ref_prefix
+        self._fields: typing.Dict[str, _Field] = {}
+        self.kinds: typing.Dict[typing.Tuple[str, str], _Check] = {}
+        for name, definition in definitions.items():
+            for gvk in definition.get("x-kubernetes-group-version-kind", ()):
+                api_version = f"{gvk['group']}/{gvk['version']}" if gvk["group"] else gvk["version"]
+                check = self._definition(name)[1]
+                if check is not None:
+                    self.kinds[(api_version, gvk["kind"])] = check
+
+    def validate(self, manifest: typing.Any) -> typing.List[str]:
+        """Returns one "<field>: <error>" message per error in manifest, none if
+        the schema does not define its apiVersion and kind."""
+        errors: typing.List[str] = []
+        if type(manifest) is not dict:
+            return [f"expected object, got {_json_type(manifest)}"]
+        check = self.kinds.get((manifest.get("apiVersion"), manifest.get("kind")))
+        if check is not None:
+            check(manifest, "", errors)
+        return errors
+
+    def _definition(self, name: str) -> _Field:
+        field = self._fields.get(name)
+        if field is None:
+            field = self._fields[name] = self._compile_type(self.definitions[name], name)
+        return field
+
+    def _compile(self, schema: typing.Mapping[str, typing.Any]) -> _Field:
+        ref = schema.get("$ref")
+        if ref is None and len(schema.get("allOf", ())) == 1:
+            # how OpenAPI v3 puts a description next to a $ref
+            ref = schema["allOf"][0].get("$ref")
+        if ref is not None:
+            name = ref[len(self.ref_prefix):] if ref.startswith(self.ref_prefix) else ref
+            if name not in self.definitions:
+                return None, None, "any"
+            return self._definition(name)
+        return self._compile_type(schema, None)
+
+    def _compile_type(self, schema: typing.Mapping[str, typing.Any], name: typing.Optional[str]) -> _Field:
+        kind = schema.get("type")
+        if kind is None and "properties" in schema:
+            kind = "object"
+        if name == _QUANTITY:
+            return frozenset((str, int, float)), None, "string or number"
+        if schema.get("format") == "int-or-string" or schema.get("x-kubernetes-int-or-string"):
+            return _INT_OR_STRING, None, "string or integer"
+        if kind is None or schema.get("x-kubernetes-preserve-unknown-fields") and kind != "object":
+            return None, None, "any"
+        types = _TYPES[kind]
+        if "enum" in schema:
+            return types, _enum(schema["enum"]), kind
+        if kind == "array":
+            if "items" not in schema:
+                return types, None, kind
+            return types, self._array(schema["items"]), kind
+        if kind == "object":
+            return types, self._object(schema), kind
+        return types, None, kind
+
+    def _array(self, items: typing.Mapping[str, typing.Any]) -> typing.Optional[_Check]:
+        if _is_any(items):
+            return None
+        # compiled on first use, the items may refer to the definition being
+        # compiled, JSONSchemaProps does
+        field: typing.List[_Field] = []
+
+        def check(value: typing.List[typing.Any], path: str, errors: typing.List[str]) -> None:
+            if not field:
+                field.append(self._compile(items))
+            types, deeper, expected = field[0]
+            if deeper is None and types is not None and all(type(item) in types for item in value):
+                return
+            for i, item in enumerate(value):
+                if types is not None and type(item) not in types:
+                    errors.append(f"{path}[{i}]: expected {expected}, got {_json_type(item)}")
+                elif deeper is not None:
+                    deeper(item, f"{path}[{i}]", errors)
+
+        return check
+
+    def _object(self, schema: typing.Mapping[str, typing.Any]) -> typing.Optional[_Check]:
+        properties = schema.get("properties") or {}
+        additional = schema.get("additionalProperties")
+        if not properties and (additional is None or additional is True or _is_any(additional)):
+            return None
+        required = tuple(schema.get("required", ()))
+        fields: typing.Dict[str, _Field] = {}
+        other: typing.List[typing.Optional[_Field]] = []
+
+        def check(value: typing.Dict[str, typing.Any], path: str, errors: typing.List[str]) -> None:
+            if not other:
+                fields.update((key, self._compile(field)) for key, field in properties.items())
+                if isinstance(additional, dict):
+                    other.append(self._compile(additional))
+                else:
+                    # free-form objects of preserve-unknown-fields take any key
+                    free = additional is True or schema.get("x-kubernetes-preserve-unknown-fields")
+                    other.append((None, None, "any") if free else None)
+            for key in required:
+                if key not in value:
+                    errors.append(f"{_join(path, key)}: required field is missing")
+            for key, item in value.items():
+                field = fields.get(key) or other[0]
+                if field is None:
+                    errors.append(f"{_join(path, key)}: unknown field")
+                    continue
+                types, deeper, expected = field
+                if types is not None and type(item) not in types:
+                    errors.append(f"{_join(path, key)}: expected {expected}, got {_json_type(item)}")
+                elif deeper is not None:
+                    deeper(item, _join(path, key), errors)
+
+        return check
+
+
+def load_schema(path: typing.Optional[str] = None) -> Schema:
+    """Compiles the OpenAPI v2 or v3 document at path, or the definitions of
+    the imports/k8s bindings without one. Cached per path and process."""
+    return _load_schema(os.path.abspath(path) if path else None)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_schema(path: typing.Optional[str]) -> Schema:
+    if path is None:
+        return Schema(definitions_from_assembly(), "#/definitions/")
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    if "definitions" in document:
+        return Schema(document["definitions"], "#/definitions/")
+    return Schema(document.get("components", {}).get("schemas", {}), "#/components/schemas/")
+
+
+def definitions_from_assembly(k8s_dir: str = os.path.join(APP_DIR, "imports", "k8s")) -> typing.Dict[str, typing.Any]:
+    """The OpenAPI definitions the bindings in k8s_dir were generated from, as
+    far as their jsii assembly records them: every struct with its :schema:
+    name, its fields under their JSON names and whether they are optional, the
+    values of every enum, and the apiVersion and kind of every API object."""
+    tarballs = glob.glob(os.path.join(k8s_dir, "_jsii", "*.jsii.tgz"))
+    if len(tarballs) != 1:
+        raise FileNotFoundError(f"expected one jsii assembly in {k8s_dir}/_jsii, found {len(tarballs)}")
+    with tarfile.open(tarballs[0]) as tar:
+        types = json.load(tar.extractfile("package/.jsii"))["types"]
+        # the values of enum members are only in the generated code, as
+        # Kind["MEMBER"] = "value";
+        enums: typing.Dict[str, typing.Dict[str, str]] = {}
+        for enum_name, member, value in _ENUM_MEMBER.findall(tar.extractfile("package/k8s.js").read().decode()):
+            enums.setdefault(f"k8s.{enum_name}", {})[member] = json.loads(value)
+
+    definitions: typing.Dict[str, typing.Any] = {}
+    for jsii_type in types.values():
+        if not jsii_type.get("datatype"):
+            continue
+        properties = {}
+        required = []
+        for prop in jsii_type.get("properties", ()):
+            # the fields are documented as "<definition>#<JSON name>"
+            key = prop["docs"]["custom"]["schema"].partition("#")[2]
+            properties[key] = _from_jsii(prop["type"], types, enums)
+            if not prop.get("optional"):
+                required.append(key)
+        definition: typing.Dict[str, typing.Any] = {"type": "object", "properties": properties}
+        if required:
+            definition["required"] = required
+        definitions[jsii_type["docs"]["custom"]["schema"]] = definition
+    # the classes IntOrString and Quantity, defined as in the swagger.json
+    definitions.update(_JSII_CLASSES)
+
+    gvk = runpy.run_path(os.path.join(k8s_dir, "_manifest.py"))["GVK"]
+    for class_name, (api_version, kind) in gvk.items():
+        definition = definitions[types[f"k8s.{class_name}"]["docs"]["custom"]["schema"]]
+        group, _, version = api_version.rpartition("/")
+        definition["properties"].update(apiVersion={"type": "string"}, kind={"type": "string"})
+        definition["x-kubernetes-group-version-kind"] = [{"group": group, "version": version, "kind": kind}]
+    return definitions
+
+
+def _from_jsii(jsii: typing.Mapping[str, typing.Any], types: typing.Mapping[str, typing.Any],
+               enums: typing.Mapping[str, typing.Mapping[str, str]]) -> typing.Dict[str, typing.Any]:
+    if "primitive" in jsii:
+        return dict(_JSII_PRIMITIVES[jsii["primitive"]])
+    if "collection" in jsii:
+        element = _from_jsii(jsii["collection"]["elementtype"], types, enums)
+        if jsii["collection"]["kind"] == "array":
+            return {"type": "array", "items": element}
+        return {"type": "object", "additionalProperties": element}
+    target = types[jsii["fqn"]]
+    name = target["docs"]["custom"]["schema"]
+    if target["kind"] == "enum":
+        values = enums.get(jsii["fqn"], {})
+        missing = [member["name"] for member in target["members"] if member["name"] not in values]
+        if missing:
+            raise ValueError(f"no value for {jsii['fqn']} {', '.join(missing)} in the generated code")
+        return {"type": "string", "enum": [values[member["name"]] for member in target["members"]]}
+    return {"$ref": f"#/definitions/{name}"}
+
+
+def validate_manifests(manifests: typing.Sequence[typing.Any], schema: typing.Optional[str] = None,
+                       workers: typing.Optional[int] = None) -> typing.Dict[int, typing.List[str]]:
+    """Validates manifests against the schema load_schema(schema) compiles and
+    returns the errors of every invalid one, keyed by its index.
+
+    With workers, the manifests are validated in a pool of that many processes,
+    each of which compiles the schema once."""
+    if not workers or workers < 2 or len(manifests) < 2:
+        return _validate_chunk(schema, 0, manifests)
+    # a few chunks per worker, so that big manifests even out
+    size = max(1, -(-len(manifests) // (workers * 4)))
+    chunks = [(schema, start, manifests[start:start + size]) for start in range(0, len(manifests), size)]
+    errors: typing.Dict[int, typing.List[str]] = {}
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        for found in pool.map(_validate_chunk, *zip(*chunks)):
+            errors.update(found)
+    return errors
+
+
+def _validate_chunk(schema: typing.Optional[str], start: int,
+                    manifests: typing.Sequence[typing.Any]) -> typing.Dict[int, typing.List[str]]:
+    # runs in the worker processes of validate_manifests
+    validate = load_schema(schema).validate
+    errors = {}
+    for i, manifest in enumerate(manifests, start):
+        found = validate(manifest)
+        if found:
+            errors[i] = found
+    return errors
+
+
+def _enum(values: typing.Sequence[typing.Any]) -> _Check:
+    allowed = frozenset(values)
+
+    def check(value: typing.Any, path: str, errors: typing.List[str]) -> None:
+        if value not in allowed:
+            errors.append(f"{path}: expected one of {', '.join(map(json.dumps, values))}, got {json.dumps(value)}")
+
+    return check
+
+
+def _is_any(schema: typing.Any) -> bool:
+    return isinstance(schema, dict) and not schema.keys() & {"type", "$ref", "allOf", "properties", "enum",
+                                                             "format", "x-kubernetes-int-or-string"}
+
+
+def _json_type(value: typing.Any) -> str:
+    return _JSON_TYPES.get(type(value), type(value).__name__)
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
@@ -0,0 +1,88 @@
+"""Pod placement derived from an availability profile.
+
+pod_placement turns a profile into the topology spread constraints and the
+affinity of a pod template, so that the replicas of a workload spread over the
+zones of the cluster and its nodes:
+
+    placement = pod_placement(HIGH_AVAILABILITY, {"app": "web"}, replicas=3,
+                              zones=["eu-west-1a", "eu-west-1b", "eu-west-1c"])
+    k8s.PodSpec(containers=[...], affinity=placement.affinity,
+                topology_spread_constraints=placement.topology_spread_constraints)
+
+A profile says how strictly pods spread over zones and over nodes, "required"
+(the scheduler leaves a pod pending rather than skew the spread by more than
+one pod), "preferred" (it spreads as far as it can) or None, and how much weight
+a soft anti-affinity gives to nodes that run no pod of the workload yet, which
+keeps replicas off each other's nodes for tail latency. With zones, the zones
+of the EKS node groups, pods only run in those zones and a required zone spread
+waits for nodes in all of them, up to one zone per replica, instead of packing
+pods into the zones that have nodes right now.
+"""
+import typing
+
+from imports import k8s
+
+ZONE_KEY = "topology.kubernetes.io/zone"
+NODE_KEY = "kubernetes.io/hostname"
+
+_WHEN_UNSATISFIABLE = {"required": "DoNotSchedule", "preferred": "ScheduleAnyway"}
+
+
+class AvailabilityProfile(typing.NamedTuple):
+    # "required", "preferred" or None
+    zones: typing.Optional[str]
+    nodes: typing.Optional[str]
+    # weight of the soft anti-affinity, 1 to 100, 0 for none
+    anti_affinity: int = 0
+
+
+# spread over zones where there is room, nothing else
+BEST_EFFORT = AvailabilityProfile(zones="preferred", nodes=None)
+# survive the loss of a zone, and of a node without losing two pods
+HIGH_AVAILABILITY = AvailabilityProfile(zones="required", nodes="preferred", anti_affinity=50)
+# as HIGH_AVAILABILITY, and no two pods on a node while there are nodes to spare
+LATENCY_ISOLATED = AvailabilityProfile(zones="required", nodes="required", anti_affinity=100)
+
+
+class Placement(typing.NamedTuple):
+    affinity: typing.Optional[k8s.Affinity]
+    topology_spread_constraints: typing.Optional[typing.List[k8s.TopologySpreadConstraint]]
+
+
+def pod_placement(profile: AvailabilityProfile, labels: typing.Mapping[str, str], replicas: int,
+                  zones: typing.Sequence[str] = ()) -> Placement:
+    """The placement of the pods of a workload whose pods carry labels, for
+    profile. A single replica has nothing to spread, only the zones apply."""
+    for name, spread in (("zones", profile.zones), ("nodes", profile.nodes)):
+        if spread is not None and spread not in _WHEN_UNSATISFIABLE:
+            raise ValueError(f"{name} must be 'required', 'preferred' or None, not {spread!r}")
+    if not 0 <= profile.anti_affinity <= 100:
+        raise ValueError(f"anti_affinity must be between 0 and 100, not {profile.anti_affinity}")
+
+    selector = k8s.LabelSelector(match_labels=dict(labels))
+    constraints = []
+    if replicas > 1:
+        for key, spread in ((ZONE_KEY, profile.zones), (NODE_KEY, profile.nodes)):
+            if spread is None:
+                continue
+            # only counted while the scheduler cannot see that many zones, and
+            # only allowed with DoNotSchedule
+            min_domains = min(len(zones), replicas) if key == ZONE_KEY and spread == "required" else 0
+            constraints.append(k8s.TopologySpreadConstraint(
+                max_skew=1, topology_key=key, when_unsatisfiable=_WHEN_UNSATISFIABLE[spread],
+                label_selector=selector, min_domains=min_domains if min_domains > 1 else None))
+
+    node_affinity = None
+    if zones:
+        node_affinity = k8s.NodeAffinity(required_during_scheduling_ignored_during_execution=k8s.NodeSelector(
+            node_selector_terms=[k8s.NodeSelectorTerm(match_expressions=[
+                k8s.NodeSelectorRequirement(key=ZONE_KEY, operator="In", values=list(zones))])]))
+    pod_anti_affinity = None
+    if profile.anti_affinity and replicas > 1:
+        pod_anti_affinity = k8s.PodAntiAffinity(preferred_during_scheduling_ignored_during_execution=[
+            k8s.WeightedPodAffinityTerm(weight=profile.anti_affinity, pod_affinity_term=k8s.PodAffinityTerm(
+                topology_key=NODE_KEY, label_selector=selector))])
+    affinity = None
+    if node_affinity is not None or pod_anti_affinity is not None:
+        affinity = k8s.Affinity(node_affinity=node_affinity, pod_anti_affinity=pod_anti_affinity)
+    return Placement(affinity, constraints or None)
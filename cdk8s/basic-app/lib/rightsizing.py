@@ -0,0 +1,290 @@
+"""Resource requests and limits from recorded usage.
+
+load_usage reads CPU and memory usage samples of containers, e.g. exported
+from Prometheus, from a CSV file with a header row, or a Parquet file with
+pyarrow installed:
+
+    namespace,workload,container,cpu,memory
+    default,getting-started-my-deployment-c85252a6,app-container,0.112,53477376
+
+cpu is in cores and memory in bytes, other columns such as a timestamp are
+ignored. recommend computes the percentiles of the samples of all containers at
+once, with NumPy, and sizes requests and limits from them: the CPU request at
+the cpu_percentile, the memory request at the memory_percentile, both with
+headroom, the CPU limit a multiple of its request and the memory limit at the
+peak with headroom. Rightsizing sets them on the containers of every workload
+in its scope that has samples, and reports how many nodes the requests of all
+replicas take before and after, counting a workload an HPA scales at its
+minReplicas:
+
+    Rightsizing(chart, "rightsizing", usage=load_usage("usage.csv"))
+
+It reads the workloads when it is created, so create it after them.
+"""
+import math
+import typing
+
+import numpy as np
+from cdk8s import ApiObject, JsonPatch
+from constructs import Construct
+
+# (namespace, workload, container)
+ContainerKey = typing.Tuple[str, str, str]
+
+_COLUMNS = ("namespace", "workload", "container", "cpu", "memory")
+# where the pod spec of each workload kind is
+_POD_SPEC = {
+    "Deployment": ("spec", "template", "spec"),
+    "StatefulSet": ("spec", "template", "spec"),
+    "ReplicaSet": ("spec", "template", "spec"),
+    "DaemonSet": ("spec", "template", "spec"),
+    "Job": ("spec", "template", "spec"),
+    "CronJob": ("spec", "jobTemplate", "spec", "template", "spec"),
+}
+_EPSILON = 1e-6
+_MEMORY_UNITS = {"Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40, "k": 10 ** 3, "M": 10 ** 6,
+                 "G": 10 ** 9, "T": 10 ** 12}
+
+
+class Usage(typing.NamedTuple):
+    keys: typing.List[ContainerKey]
+    # per sample: the index of its container in keys, cores and bytes
+    codes: np.ndarray
+    cpu: np.ndarray
+    memory: np.ndarray
+
+
+class SizingPolicy(typing.NamedTuple):
+    cpu_percentile: float = 90
+    memory_percentile: float = 99
+    # requests are the percentiles times this
+    headroom: float = 1.15
+    cpu_limit_factor: float = 2.0
+    min_cpu_millicores: int = 10
+    min_memory_mib: int = 16
+    # containers with fewer samples are left as they are
+    min_samples: int = 100
+
+
+class Recommendation(typing.NamedTuple):
+    cpu_millicores: int
+    cpu_limit_millicores: int
+    memory_mib: int
+    memory_limit_mib: int
+    samples: int
+
+
+class NodeShape(typing.NamedTuple):
+    # roughly what EKS leaves allocatable on an m5.large
+    name: str = "m5.large"
+    cpu_millicores: int = 1930
+    memory_mib: int = 7100
+
+
+class ContainerSizing(typing.NamedTuple):
+    key: ContainerKey
+    replicas: int
+    # requests per replica, None where there were none
+    cpu_before: typing.Optional[int]
+    memory_before: typing.Optional[int]
+    recommendation: typing.Optional[Recommendation]
+
+
+def load_usage(path: str) -> Usage:
+    """Reads the samples in the CSV or, for a .parquet path, Parquet file at
+    path."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet  # not a dependency of the app, only needed for Parquet
+
+        table = pyarrow.parquet.read_table(path, columns=list(_COLUMNS))
+        names = np.stack([np.char.encode(table.column(column).to_numpy(zero_copy_only=False).astype(str))
+                          for column in _COLUMNS[:3]], axis=1)
+        cpu = table.column("cpu").to_numpy(zero_copy_only=False).astype(np.float64)
+        memory = table.column("memory").to_numpy(zero_copy_only=False).astype(np.float64)
+    else:
+        with open(path, encoding="utf-8") as f:
+            header = f.readline().strip().split(",")
+        missing = [column for column in _COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"{path} has no {', '.join(missing)} column")
+        columns = [header.index(column) for column in _COLUMNS]
+        values = np.loadtxt(path, delimiter=",", skiprows=1, usecols=columns[3:], dtype=np.float64, ndmin=2)
+        names = np.loadtxt(path, delimiter=",", skiprows=1, usecols=columns[:3], dtype=bytes, ndmin=2)
+        cpu, memory = values[:, 0], values[:, 1]
+    first, codes = _factorize(names)
+    keys = [tuple(name.decode() for name in row) for row in names[first].tolist()]
+    return Usage(keys, codes, cpu, memory)
+
+
+def _factorize(rows: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+    # the first row of every distinct row of fixed width byte strings and the
+    # index of each row among those. sorting millions of strings is slow, so
+    # each row is hashed to a number and the numbers are sorted instead; a
+    # hash collision, checked for, falls back to sorting the strings
+    rows = np.ascontiguousarray(rows)
+    size = rows.itemsize * rows.shape[1]
+    raw = rows.view(np.uint8).reshape(len(rows), size)
+    width = -(-size // 8) * 8
+    if width != size:
+        raw = np.pad(raw, ((0, 0), (0, width - size)))
+    multipliers = np.random.default_rng(0).integers(1, 2 ** 63, size=width // 8, dtype=np.uint64) | np.uint64(1)
+    hashes = (raw.view(np.uint64) * multipliers).sum(axis=1, dtype=np.uint64)
+    _, first, codes = np.unique(hashes, return_index=True, return_inverse=True)
+    if not (raw == raw[first][codes]).all():
+        _, first, codes = np.unique(rows.view(f"V{size}").reshape(-1), return_index=True, return_inverse=True)
+    return first, codes.reshape(-1)
+
+
+def recommend(usage: Usage, policy: SizingPolicy = SizingPolicy()) -> typing.Dict[ContainerKey, Recommendation]:
+    """The requests and limits of every container with at least
+    policy.min_samples samples."""
+    groups = len(usage.keys)
+    samples = np.bincount(usage.codes, minlength=groups)
+    cpu = _percentiles(usage.codes, usage.cpu, samples, [policy.cpu_percentile])[0]
+    memory_percentile, peak = _percentiles(usage.codes, usage.memory, samples, [policy.memory_percentile, 100])
+    cpu_request = np.maximum(_ceil(cpu * policy.headroom * 1000), policy.min_cpu_millicores)
+    cpu_limit = _ceil(cpu_request * policy.cpu_limit_factor)
+    memory_request = np.maximum(_ceil(memory_percentile * policy.headroom / 2 ** 20), policy.min_memory_mib)
+    memory_limit = np.maximum(_ceil(peak * policy.headroom / 2 ** 20), memory_request)
+    return {
+        key: Recommendation(*row)
+        for key, *row in zip(usage.keys, cpu_request.astype(int).tolist(), cpu_limit.astype(int).tolist(),
+                             memory_request.astype(int).tolist(), memory_limit.astype(int).tolist(),
+                             samples.tolist())
+        if row[-1] >= policy.min_samples
+    }
+
+
+def _ceil(values: np.ndarray) -> np.ndarray:
+    return np.ceil(values - _EPSILON)
+
+
+def _percentiles(codes: np.ndarray, values: np.ndarray, counts: np.ndarray,
+                 percentiles: typing.Sequence[float]) -> typing.List[np.ndarray]:
+    # one sort for all groups: by value, then stably by group, which numpy
+    # radix sorts when the codes fit in 16 bits. each group's percentiles are
+    # then interpolated between two positions in its run, as np.percentile
+    # does for one group. every group has a sample
+    order = np.argsort(values)
+    order = order[np.argsort(codes[order].astype(np.min_scalar_type(len(counts))), kind="stable")]
+    ordered = values[order]
+    starts = np.cumsum(counts) - counts
+    result = []
+    for percentile in percentiles:
+        position = starts + (counts - 1) * (percentile / 100)
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, starts + counts - 1)
+        result.append(ordered[low] + (ordered[high] - ordered[low]) * (position - low))
+    return result
+
+
+class SavingsReport(typing.NamedTuple):
+    containers: typing.List[ContainerSizing]
+    node: NodeShape
+
+    def nodes(self, after: bool) -> int:
+        """The nodes the requests of all replicas fill at least, before or
+        after rightsizing."""
+        cpu = memory = 0
+        for sizing in self.containers:
+            recommendation = sizing.recommendation if after else None
+            cpu += sizing.replicas * (recommendation.cpu_millicores if recommendation else sizing.cpu_before or 0)
+            memory += sizing.replicas * (recommendation.memory_mib if recommendation else sizing.memory_before or 0)
+        return max(math.ceil(cpu / self.node.cpu_millicores), math.ceil(memory / self.node.memory_mib))
+
+    def format(self) -> str:
+        lines = [f"{'container':<48}{'replicas':>9}{'cpu':>16}{'memory':>18}{'samples':>10}"]
+        for sizing in self.containers:
+            name = "/".join(sizing.key)
+            if len(name) > 46:
+                name = "..." + name[-43:]
+            recommendation = sizing.recommendation
+            cpu = memory = "-"
+            if recommendation is not None:
+                cpu = f"{_or_none(sizing.cpu_before, 'm')} > {recommendation.cpu_millicores}m"
+                memory = f"{_or_none(sizing.memory_before, 'Mi')} > {recommendation.memory_mib}Mi"
+            samples = recommendation.samples if recommendation else 0
+            lines.append(f"{name:<48}{sizing.replicas:>9}{cpu:>16}{memory:>18}{samples:>10}")
+        before, after = self.nodes(False), self.nodes(True)
+        lines.append(f"{self.node.name} nodes for the requests: {before} before, {after} after, "
+                     f"{before - after} saved")
+        return "\n".join(lines)
+
+
+class Rightsizing(Construct):
+    """Sets the requests and limits of the containers of every workload under
+    scope that usage has samples of, see the module docstring. report holds
+    every container and what changed."""
+
+    def __init__(self, scope: Construct, id: str, *, usage: Usage, policy: SizingPolicy = SizingPolicy(),
+                 node: NodeShape = NodeShape()):
+        super().__init__(scope, id)
+        recommendations = recommend(usage, policy)
+        containers = []
+        objects = [construct for construct in scope.node.find_all() if isinstance(construct, ApiObject)]
+        # workloads scaled by an HPA have no replicas of their own, they run
+        # minReplicas at least
+        scaled = {}
+        for construct in objects:
+            if construct.kind == "HorizontalPodAutoscaler":
+                manifest = construct.to_json()
+                target = manifest["spec"]["scaleTargetRef"]
+                namespace = manifest["metadata"].get("namespace") or "default"
+                scaled[(namespace, target["kind"], target["name"])] = manifest["spec"].get("minReplicas", 1)
+        for construct in objects:
+            if construct.kind not in _POD_SPEC:
+                continue
+            manifest = construct.to_json()
+            pod_spec = manifest
+            for key in _POD_SPEC[construct.kind]:
+                pod_spec = pod_spec.get(key) or {}
+            namespace = manifest["metadata"].get("namespace") or "default"
+            # a DaemonSet runs once per node, counted as one here
+            replicas = manifest.get("spec", {}).get("replicas") if construct.kind != "CronJob" else 1
+            if replicas is None:
+                replicas = scaled.get((namespace, construct.kind, manifest["metadata"]["name"]), 1)
+            for i, container in enumerate(pod_spec.get("containers", [])):
+                key = (namespace, manifest["metadata"]["name"], container["name"])
+                requests = (container.get("resources") or {}).get("requests") or {}
+                recommendation = recommendations.get(key)
+                if recommendation is not None:
+                    path = "/" + "/".join(_POD_SPEC[construct.kind]) + f"/containers/{i}/resources"
+                    construct.add_json_patch(JsonPatch.add(path, _resources(recommendation, type(construct))))
+                containers.append(ContainerSizing(
+                    key, replicas, _millicores(requests.get("cpu")), _mebibytes(requests.get("memory")),
+                    recommendation))
+        self.report = SavingsReport(containers, node)
+
+
+def _resources(recommendation: Recommendation, kind: type) -> typing.Dict[str, typing.Any]:
+    resources = {
+        "limits": {"cpu": f"{recommendation.cpu_limit_millicores}m", "memory": f"{recommendation.memory_limit_mib}Mi"},
+        "requests": {"cpu": f"{recommendation.cpu_millicores}m", "memory": f"{recommendation.memory_mib}Mi"},
+    }
+    if kind is ApiObject:
+        return resources
+    # the classes generated by cdk8s import render their props again after the
+    # patches, reading the value of every Quantity
+    return {name: {resource: {"value": value} for resource, value in values.items()}
+            for name, values in resources.items()}
+
+
+def _millicores(quantity: typing.Any) -> typing.Optional[int]:
+    if quantity is None:
+        return None
+    text = str(quantity)
+    return math.ceil(float(text[:-1])) if text.endswith("m") else math.ceil(float(text) * 1000)
+
+
+def _mebibytes(quantity: typing.Any) -> typing.Optional[int]:
+    if quantity is None:
+        return None
+    text = str(quantity)
+    for suffix in sorted(_MEMORY_UNITS, key=len, reverse=True):
+        if text.endswith(suffix):
+            return math.ceil(float(text[:-len(suffix)]) * _MEMORY_UNITS[suffix] / 2 ** 20)
+    return math.ceil(float(text) / 2 ** 20)
+
+
+def _or_none(value: typing.Optional[int], unit: str) -> str:
+    return f"{value}{unit}" if value is not None else "none"
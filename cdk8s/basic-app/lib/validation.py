@@ -0,0 +1,172 @@
+"""Validation passes over a finished construct tree.
+
+With CDK8S_TYPECHECK=0 (or k8s.set_typecheck(False)) the generated constructors
+skip their typeguard checks, which is most of the time it takes to build a large
+chart. check_types runs the same checks afterwards, once per object, from the
+manifests the objects render:
+
+    app = App()
+    MyChart(app, "getting-started", app_label="my-app")
+    errors = check_types(app)
+    if errors:
+        raise SystemExit("\\n".join(errors))
+    app.synth()
+
+check_schema does the same from the OpenAPI schema in lib/openapi.py instead of
+the generated classes: it renders the manifests of all charts and validates
+them in one pass, optionally in a pool of worker processes. It is much faster,
+reports missing required fields too and also works for lib.emitter apps:
+
+    errors = check_schema(app, workers=4)
+"""
+import collections.abc
+import enum
+import sys
+import typing
+
+from cdk8s import ApiObject
+from constructs import Construct
+
+from imports.k8s import _base
+from lib import openapi
+
+_hints: typing.Dict[type, typing.Dict[str, typing.Any]] = {}
+
+
+def check_types(scope: Construct) -> typing.List[str]:
+    """Type checks the manifest of every generated ApiObject under scope, returns
+    one "<construct path>: <field>: <error>" message per invalid field.
+
+    Manifests are rendered after json patches are applied, so this also covers
+    what patches change. Objects of classes that were not generated by
+    `cdk8s import`, e.g. cdk8s.Include, are not checked."""
+    errors: typing.List[str] = []
+    enabled = _base.TYPECHECK
+    # fields are checked one by one below, so every error is reported rather
+    # than only the first one a constructor finds
+    _base.set_typecheck(False)
+    try:
+        for construct in scope.node.find_all():
+            if not isinstance(construct, ApiObject):
+                continue
+            props = _props_class(type(construct))
+            if props is None:
+                continue
+            try:
+                manifest = dict(construct.to_json())
+            except RuntimeError as e:
+                # raised by the jsii kernel for errors in the JavaScript code
+                errors.append(f"{construct.node.path}: cannot render manifest: {e}")
+                continue
+            manifest.pop("apiVersion", None)
+            manifest.pop("kind", None)
+            found: typing.List[str] = []
+            _build(props, manifest, "", found)
+            errors.extend(f"{construct.node.path}: {error}" for error in found)
+    finally:
+        _base.set_typecheck(enabled)
+    return errors
+
+
+def check_schema(app: typing.Any, schema: typing.Optional[str] = None,
+                 workers: typing.Optional[int] = None) -> typing.List[str]:
+    """Validates the manifests of every chart of app, a cdk8s.App or an
+    lib.emitter.App, against the OpenAPI schema lib.openapi.load_schema(schema)
+    compiles, returns one "<chart path>: <kind> <name>: <field>: <error>"
+    message per error. Raises ValueError for a streaming lib.emitter.App,
+    which has written its objects without keeping them."""
+    if getattr(app, "stream", False):
+        raise ValueError("a streaming App keeps no objects to validate, check the charts with stream=False")
+    errors: typing.List[str] = []
+    labels: typing.List[str] = []
+    manifests: typing.List[typing.Any] = []
+    for chart in app.charts:
+        path = chart.node.path if hasattr(chart, "node") else chart.path
+        try:
+            rendered = chart.to_json()
+        except RuntimeError as e:
+            # raised by the jsii kernel for errors in the JavaScript code
+            errors.append(f"{path}: cannot render manifests: {e}")
+            continue
+        for manifest in rendered:
+            labels.append(f"{path}: {manifest.get('kind')} {manifest.get('metadata', {}).get('name')}")
+            manifests.append(manifest)
+    found = openapi.validate_manifests(manifests, schema, workers)
+    errors.extend(f"{labels[i]}: {error}" for i in sorted(found) for error in found[i])
+    return errors
+
+
+def _props_class(cls: type) -> typing.Optional[type]:
+    # the <Kind>Props struct is imported by the module that defines <Kind>
+    return getattr(sys.modules.get(cls.__module__), f"{cls.__name__}Props", None)
+
+
+def _build(cls: type, data: typing.Mapping[str, typing.Any], path: str,
+           errors: typing.List[str]) -> typing.Any:
+    python_names = {json_name: name for name, json_name in cls.__jsii_name_mapping__.items()}
+    hints = _hints.get(cls)
+    if hints is None:
+        hints = _hints[cls] = typing.get_type_hints(cls.__init__)
+    kwargs = {}
+    for key, value in data.items():
+        name = python_names.get(key)
+        if name is None:
+            errors.append(f"{_join(path, key)}: unknown field for {cls.__name__}")
+            continue
+        value = _convert(hints[name], value, _join(path, key), errors)
+        try:
+            _base.check_type(argname=name, value=value, expected_type=hints[name])
+        except Exception as e:
+            # TypeError on typeguard 2, typeguard.TypeCheckError after that
+            errors.append(f"{_join(path, key)}: {e}")
+            continue
+        kwargs[name] = value
+    return cls(**kwargs)
+
+
+def _convert(expected: typing.Any, value: typing.Any, path: str, errors: typing.List[str]) -> typing.Any:
+    """Turns a JSON value back into what the constructor of a generated class
+    takes for an argument of type expected."""
+    origin = typing.get_origin(expected)
+    args = typing.get_args(expected)
+    if origin is typing.Union:
+        # structs are typed Union[Struct, Dict[str, Any]], try the struct first
+        for arg in sorted(args, key=lambda arg: not _is_struct(arg)):
+            if arg is not type(None) and _accepts(arg, value):
+                return _convert(arg, value, path, errors)
+        return value
+    if origin in (list, collections.abc.Sequence) and isinstance(value, list):
+        return [_convert(args[0], item, f"{path}[{i}]", errors) for i, item in enumerate(value)]
+    if origin in (dict, collections.abc.Mapping) and isinstance(value, dict):
+        return {key: _convert(args[1], item, _join(path, key), errors) for key, item in value.items()}
+    if _is_struct(expected) and isinstance(value, dict):
+        return _build(expected, value, path, errors)
+    if isinstance(expected, type) and issubclass(expected, enum.Enum):
+        try:
+            return expected(value)
+        except ValueError:
+            return value
+    if isinstance(expected, type) and hasattr(expected, "from_number") and hasattr(expected, "from_string"):
+        # IntOrString and Quantity render as a plain number or string
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return expected.from_number(value)
+        if isinstance(value, str):
+            return expected.from_string(value)
+    return value
+
+
+def _is_struct(expected: typing.Any) -> bool:
+    return isinstance(expected, type) and hasattr(expected, "__jsii_name_mapping__")
+
+
+def _accepts(expected: typing.Any, value: typing.Any) -> bool:
+    origin = typing.get_origin(expected) or expected
+    if _is_struct(expected) or origin in (dict, collections.abc.Mapping):
+        return isinstance(value, dict)
+    if origin in (list, collections.abc.Sequence):
+        return isinstance(value, list)
+    return True
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
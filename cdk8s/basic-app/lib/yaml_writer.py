@@ -0,0 +1,269 @@
+"""YAML output byte for byte the way cdk8s writes it.
+
+cdk8s renders manifests with the `yaml` npm package (2.x), as YAML 1.1 with
+lineWidth 0 (no folding) and otherwise default options. This is a port of the
+parts of its stringifier that JSON-like documents reach: block maps and
+sequences, flow `{}` and `[]` for empty ones, numbers formatted like
+JavaScript, and its rules for when a string is written plain, single or double
+quoted, or as a literal block.
+"""
+import decimal
+import functools
+import json
+import re
+import typing
+
+INDENT_STEP = "  "
+
+# keys longer than this are written as explicit "? key" entries, which
+# manifests never need
+MAX_IMPLICIT_KEY = 1024
+
+_CONTROL = re.compile("[\x00-\x08\x0b-\x1f\x7f-\x9f\ud800-\udfff]")
+_NOT_PLAIN = re.compile(r"\A[\n\t ,\[\]{}#&*!|>'\"%@`]|\A[?-]\Z|\A[?-][ \t]|[\n:][ \t]|[ \t]\n|[\n\t ]#|[\n\t :]\Z")
+_DOCUMENT_MARKER = re.compile("(?:\\A|(?<=[\n\r\u2028\u2029]))(?:%|---|\\.\\.\\.)")
+_JS_WHITESPACE = re.compile("[\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff]*\\Z")
+_BLOCK_END_NEWLINES = re.compile(r"(\A|(?<!\n))\n+(?!\n|\Z)")
+_SURROGATE = re.compile("[\ud800-\udfff]")
+
+# strings that YAML 1.1 would read back as something else: null, booleans,
+# ints, floats, sexagesimal numbers and timestamps; not "<<", the merge key is
+# only a tag of the schema with the merge option, which cdk8s does not set
+_TAG_TEST = re.compile("|".join(f"(?:{pattern})" for pattern in (
+    r"\A(?:~|[Nn]ull|NULL)?\Z",
+    r"\A(?:Y|y|[Yy]es|YES|[Tt]rue|TRUE|[Oo]n|ON)\Z",
+    r"\A(?:N|n|[Nn]o|NO|[Ff]alse|FALSE|[Oo]ff|OFF)\Z",
+    r"\A[-+]?0b[0-1_]+\Z",
+    r"\A[-+]?0[0-7_]+\Z",
+    r"\A[-+]?[0-9][0-9_]*\Z",
+    r"\A[-+]?0x[0-9a-fA-F_]+\Z",
+    r"\A(?:[-+]?\.(?:inf|Inf|INF)|\.nan|\.NaN|\.NAN)\Z",
+    r"\A[-+]?(?:[0-9][0-9_]*)?(?:\.[0-9_]*)?[eE][-+]?[0-9]+\Z",
+    r"\A[-+]?(?:[0-9][0-9_]*)?\.[0-9_]*\Z",
+    r"\A[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\Z",
+    r"\A[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\.[0-9_]*\Z",
+    r"\A([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})"
+    r"(?:(?:t|T|[ \t]+)([0-9]{1,2}):([0-9]{1,2}):([0-9]{1,2}(\.[0-9]+)?)"
+    r"(?:[ \t]*(?:Z|[-+][012]?[0-9](?::[0-9]{2})?))?)?\Z",
+)))
+
+_DOUBLE_QUOTED_MIN_MULTILINE = 40
+_ESCAPES = {"0000": "\\0", "0007": "\\a", "000b": "\\v", "001b": "\\e",
+            "0085": "\\N", "00a0": "\\_", "2028": "\\L", "2029": "\\P"}
+
+
+def dump(document: typing.Any) -> str:
+    """One YAML document, as yaml.stringify(document) writes it."""
+    return _node(document, "") + "\n"
+
+
+def dump_all(documents: typing.Iterable[typing.Any]) -> str:
+    """Documents separated by ---, as cdk8s' Yaml.stringify writes them."""
+    return "---\n".join(dump(document) for document in documents)
+
+
+def js_number(value: typing.Union[int, float]) -> str:
+    """A number the way JSON.stringify writes it."""
+    if isinstance(value, int) and abs(value) <= 2 ** 53:
+        return str(value)
+    value = float(value)
+    if value != value or value in (float("inf"), float("-inf")):
+        return ".nan" if value != value else ".inf" if value > 0 else "-.inf"
+    if value == 0:
+        return "0"
+    # the shortest digits that round trip, as in Number.prototype.toString
+    sign, digits, exponent = decimal.Decimal(repr(value)).normalize().as_tuple()
+    digits_text = "".join(map(str, digits))
+    k, n = len(digits_text), len(digits_text) + exponent
+    if k <= n <= 21:
+        text = digits_text + "0" * (n - k)
+    elif 0 < n <= 21:
+        text = digits_text[:n] + "." + digits_text[n:]
+    elif -6 < n <= 0:
+        text = "0." + "0" * -n + digits_text
+    else:
+        mantissa = digits_text[0] + ("." + digits_text[1:] if k > 1 else "")
+        text = f"{mantissa}e{'+' if n - 1 >= 0 else '-'}{abs(n - 1)}"
+    return ("-" if sign else "") + text
+
+
+def _js_length(text: str) -> int:
+    # JavaScript counts UTF-16 code units
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
+
+
+def _node(value: typing.Any, indent: str) -> str:
+    if isinstance(value, dict):
+        return _map(value, indent)
+    if isinstance(value, list):
+        return _seq(value, indent)
+    return _scalar(value, indent, implicit_key=False)
+
+
+def _scalar(value: typing.Any, indent: str, implicit_key: bool) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return js_number(value)
+    return _string(str(value), indent, implicit_key)
+
+
+def _map(value: typing.Dict[str, typing.Any], indent: str) -> str:
+    if not value:
+        return "{}"
+    return f"\n{indent}".join(_pair(key, item, indent) for key, item in value.items())
+
+
+def _seq(value: typing.List[typing.Any], indent: str) -> str:
+    if not value:
+        return "[]"
+    item_indent = indent + "  "
+    return f"\n{indent}".join("- " + _node(item, item_indent) for item in value)
+
+
+def _pair(key: str, value: typing.Any, indent: str) -> str:
+    inner = indent + INDENT_STEP
+    key_text = _string(str(key), inner, implicit_key=True)
+    if len(key_text) > MAX_IMPLICIT_KEY:
+        raise ValueError(f"map key longer than {MAX_IMPLICIT_KEY} characters: {key[:40]}...")
+    value_text = _node(value, inner)
+    if isinstance(value, (dict, list)):
+        separator = f"\n{inner}" if value else " "
+    elif value_text == "" or value_text[0] == "\n":
+        separator = ""
+    else:
+        separator = " "
+    return f"{key_text}:{separator}{value_text}"
+
+
+# manifests repeat the same keys and values over and over
+@functools.lru_cache(maxsize=65536)
+def _string(value: str, indent: str, implicit_key: bool) -> str:
+    if _CONTROL.search(value):
+        return _double_quoted(value, indent, implicit_key)
+    return _plain(value, indent, implicit_key)
+
+
+def _plain(value: str, indent: str, implicit_key: bool) -> str:
+    if implicit_key and "\n" in value:
+        return _quoted(value, indent, implicit_key)
+    if _NOT_PLAIN.search(value):
+        if implicit_key or "\n" not in value:
+            return _quoted(value, indent, implicit_key)
+        return _block(value, indent, implicit_key)
+    if not implicit_key and "\n" in value:
+        return _block(value, indent, implicit_key)
+    if _DOCUMENT_MARKER.search(value):
+        if indent == "":
+            return _block(value, indent, implicit_key, force_indent=True)
+        if implicit_key and indent == INDENT_STEP:
+            return _quoted(value, indent, implicit_key)
+    text = re.sub(r"\n+", lambda match: match.group() + "\n" + indent, value) if "\n" in value else value
+    if _TAG_TEST.match(text):
+        return _quoted(value, indent, implicit_key)
+    return text
+
+
+def _quoted(value: str, indent: str, implicit_key: bool) -> str:
+    if '"' in value and "'" not in value:
+        return _single_quoted(value, indent, implicit_key)
+    return _double_quoted(value, indent, implicit_key)
+
+
+def _single_quoted(value: str, indent: str, implicit_key: bool) -> str:
+    if (implicit_key and "\n" in value) or re.search(r"[ \t]\n|\n[ \t]", value):
+        return _double_quoted(value, indent, implicit_key)
+    indent = indent or ("  " if _DOCUMENT_MARKER.search(value) else "")
+    return "'" + re.sub(r"\n+", lambda match: match.group() + "\n" + indent, value.replace("'", "''")) + "'"
+
+
+def _double_quoted(value: str, indent: str, implicit_key: bool) -> str:
+    text = _SURROGATE.sub(lambda match: f"\\u{ord(match.group()):04x}", json.dumps(value, ensure_ascii=False))
+    indent = indent or ("  " if _DOCUMENT_MARKER.search(value) else "")
+    out = []
+    start = 0
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == " " and text[i + 1:i + 3] == "\\n":
+            # space before newline needs to be escaped to not be folded
+            out.append(text[start:i] + "\\ ")
+            i += 1
+            start = i
+            ch = "\\"
+        if ch == "\\":
+            escaped = text[i + 1:i + 2]
+            if escaped == "u":
+                out.append(text[start:i])
+                code = text[i + 2:i + 6]
+                if code in _ESCAPES:
+                    out.append(_ESCAPES[code])
+                elif code.startswith("00"):
+                    out.append("\\x" + code[2:])
+                else:
+                    out.append(text[i:i + 6])
+                i += 5
+                start = i + 1
+            elif escaped == "n":
+                if implicit_key or text[i + 2:i + 3] == '"' or _js_length(text) < _DOUBLE_QUOTED_MIN_MULTILINE:
+                    i += 1
+                else:
+                    # written as a line break, which the reader folds into "\n"
+                    out.append(text[start:i] + "\n\n")
+                    while text[i + 2:i + 3] == "\\" and text[i + 3:i + 4] == "n" and text[i + 4:i + 5] != '"':
+                        out.append("\n")
+                        i += 2
+                    out.append(indent)
+                    if text[i + 2:i + 3] == " ":
+                        out.append("\\")
+                    i += 1
+                    start = i + 1
+            else:
+                i += 1
+        i += 1
+    return "".join(out) + text[start:] if start else text
+
+
+def _block(value: str, indent: str, implicit_key: bool, force_indent: bool = False) -> str:
+    if re.search(r"\n[\t ]+\Z", value) or _JS_WHITESPACE.match(value):
+        return _quoted(value, indent, implicit_key)
+    indent = indent or ("  " if force_indent or _DOCUMENT_MARKER.search(value) else "")
+
+    # chomping indicator from the whitespace at the end
+    end_start = len(value)
+    while end_start > 0 and value[end_start - 1] in "\n\t ":
+        end_start -= 1
+    end = value[end_start:]
+    newline = end.find("\n")
+    if newline == -1:
+        chomp = "-"
+    elif value == end or newline != len(end) - 1:
+        chomp = "+"
+    else:
+        chomp = ""
+    if end:
+        value = value[:-len(end)]
+        if end.endswith("\n"):
+            end = end[:-1]
+        end = _BLOCK_END_NEWLINES.sub(lambda match: match.group() + indent, end)
+
+    # indentation indicator from the whitespace at the start
+    starts_with_space = False
+    start_newline = -1
+    for i, ch in enumerate(value):
+        if ch == " ":
+            starts_with_space = True
+        elif ch == "\n":
+            start_newline = i
+        else:
+            break
+    start = value[:start_newline + 1]
+    if start:
+        value = value[len(start):]
+        start = re.sub(r"\n+", lambda match: match.group() + indent, start)
+
+    header = ("2" if indent else "1") + chomp if starts_with_space else chomp
+    value = re.sub(r"\n+", lambda match: match.group() + indent, value)
+    return f"|{header}\n{indent}{start}{value}{end}"
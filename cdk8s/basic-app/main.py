@@ -1,32 +1,59 @@
 #!/usr/bin/env python
+import os
+import sys
+
+from lib.jsii_startup import use_package_cache
+
+# before the first jsii import, which starts the kernel
+use_package_cache()
+
 from cdk8s import App, Chart
 from constructs import Construct
-from imports import k8s
+from lib import rightsizing
+from lib.capacity import PlannedDeployment, ServiceSlo, plan_capacity
+from lib.incremental import IncrementalApp
+from lib.placement import HIGH_AVAILABILITY
+
+
+# what the nginx Deployment is sized for, see lib/capacity.py
+NGINX_SLO = ServiceSlo("app-container", target_rps=600, pod_rps=300, service_ms=5, latency_slo_ms=50,
+                       cpu_ms_per_request=0.5, memory_mib=64)
+# the zones of the cluster's node groups, e.g. CDK8S_ZONES=us-east-1a,us-east-1b,us-east-1c
+ZONES = [zone for zone in os.environ.get("CDK8S_ZONES", "").split(",") if zone]
+# a CSV or Parquet export of the containers' CPU and memory usage to size their
+# requests and limits from instead, see lib/rightsizing.py
+USAGE = os.environ.get("CDK8S_USAGE")
 
 
 class MyChart(Chart):
-   def __init__(self, scope: Construct, ns: str, app_label: str):
+   def __init__(self, scope: Construct, ns: str, app_label: str, usage: str = None):
        super().__init__(scope, ns)
 
-       # Define a Kubernetes Deployment
-       k8s.KubeDeployment(self, "my-deployment",
-                       spec=k8s.DeploymentSpec(
-                           replicas=3,
-                           selector=k8s.LabelSelector(match_labels={"app": app_label}),
-                           template=k8s.PodTemplateSpec(
-                               metadata=k8s.ObjectMeta(labels={"app": app_label}),
-                               spec=k8s.PodSpec(containers=[
-                                   k8s.Container(
-                                       name="app-container",
-                                       image="nginx:1.19.10", # Using public nginx image
-                                       ports=[k8s.ContainerPort(container_port=80)] # Nginx listens on port 80 by default
-                                   )
-                               ])
-                           )
-                       )
-                   )
-
-app = App()
-MyChart(app, "getting-started", app_label="my-app")
-
-app.synth()
\ No newline at end of file
+       # Define a Kubernetes Deployment, with its HorizontalPodAutoscaler and
+       # PodDisruptionBudget, and spread its pods over zones and nodes
+       plan = plan_capacity([NGINX_SLO])[0]
+       PlannedDeployment(self, "my-deployment",
+                         plan=plan,
+                         labels={"app": app_label},
+                         name="app-container",
+                         image="nginx:1.19.10", # Using public nginx image
+                         port=80, # Nginx listens on port 80 by default
+                         availability=HIGH_AVAILABILITY,
+                         zones=ZONES)
+
+       # what rightsizing saves, reported once the app is synthesized
+       self.savings = None
+       if usage:
+           sizing = rightsizing.Rightsizing(self, "rightsizing", usage=rightsizing.load_usage(usage))
+           self.savings = sizing.report
+
+# CDK8S_INCREMENTAL=1 only builds the charts whose inputs changed since the
+# last synth into dist/
+app = IncrementalApp(App, enabled=os.environ.get("CDK8S_INCREMENTAL") == "1", sources=[USAGE] if USAGE else [])
+app.add_chart(MyChart, "getting-started", app_label="my-app", usage=USAGE)
+
+app.synth()
+# only for a chart built by this synth, one whose inputs are unchanged is not
+for chart in app.constructed.values():
+    if chart.savings is not None:
+        print(chart.savings.format(), file=sys.stderr)
@@ -0,0 +1,107 @@
+import socket
+
+import pytest
+
+from tools.apply_batches import apply_batches, pack
+from tools.fake_apiserver import FakeApiServer
+
+CRD = {"apiVersion": "apiextensions.k8s.io/v1", "kind": "CustomResourceDefinition",
+       "metadata": {"name": "widgets.example.com"},
+       "spec": {"group": "example.com", "scope": "Namespaced", "versions": [{"name": "v1"}],
+                "names": {"kind": "Widget", "plural": "widgets"}}}
+NAMESPACE = {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": "shop"}}
+ACCOUNT = {"apiVersion": "v1", "kind": "ServiceAccount", "metadata": {"name": "web", "namespace": "shop"}}
+ROLE = {"apiVersion": "rbac.authorization.k8s.io/v1", "kind": "ClusterRole",
+        "metadata": {"name": "reader", "namespace": "kube-system"}, "rules": []}
+WIDGET = {"apiVersion": "example.com/v1", "kind": "Widget", "metadata": {"name": "w", "namespace": "shop"}}
+
+
+def deployment(name, namespace="shop"):
+    return {"apiVersion": "apps/v1", "kind": "Deployment", "metadata": {"name": name, "namespace": namespace},
+            "spec": {"template": {"spec": {"containers": [{"name": "web", "image": "nginx:1.25"}]}}}}
+
+
+def config(name):
+    return {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": name, "namespace": "shop"},
+            "data": {"key": "x" * 200}}
+
+
+def test_levels():
+    batches = pack([WIDGET, deployment("web"), config("settings"), ACCOUNT, ROLE, NAMESPACE, CRD])
+
+    assert [(batch.level, [m["kind"] for m in batch.manifests]) for batch in batches] == [
+        ("crds", ["CustomResourceDefinition"]),
+        ("namespaces", ["Namespace"]),
+        ("rbac", ["ServiceAccount", "ClusterRole"]),
+        ("workloads", ["ConfigMap", "Deployment"]),
+        ("custom resources", ["Widget"]),
+    ]
+
+
+def test_max_bytes():
+    manifests = [config(f"c-{i}") for i in range(10)]
+
+    batches = pack(manifests, max_bytes=1000)
+
+    # about 300 bytes each, 3 fit in a batch
+    assert [len(batch.manifests) for batch in batches] == [3, 3, 3, 1]
+    assert all(batch.size <= 1000 for batch in batches)
+    with pytest.raises(ValueError, match="ConfigMap shop/c-0 is"):
+        pack(manifests, max_bytes=100)
+
+
+def test_apply():
+    manifests = [WIDGET, deployment("web"), deployment("api"), config("settings"), ACCOUNT, ROLE, NAMESPACE, CRD]
+
+    with FakeApiServer(establish_delay=0.2) as server:
+        result = apply_batches(pack(manifests), server.url, workers=4)
+
+    assert (result.applied, result.errors) == (8, [])
+    assert ("example.com", "widgets", "shop", "w") in server.objects
+    # the ClusterRole is cluster scoped, its namespace is dropped
+    assert ("rbac.authorization.k8s.io", "clusterroles", "", "reader") in server.objects
+    patches = [path for method, path in server.requests if method == "PATCH"]
+    discovery = {path for method, path in server.requests if method == "GET" and "/namespaces/" not in path
+                 and "customresourcedefinitions/" not in path}
+    assert len(patches) == 8
+    assert discovery == {"/api/v1", "/apis/apiextensions.k8s.io/v1", "/apis/rbac.authorization.k8s.io/v1",
+                         "/apis/apps/v1", "/apis/example.com/v1"}
+    assert result.requests == len(server.requests)
+
+
+def test_failed_level_stops():
+    manifests = [deployment("web", namespace="missing"), deployment("api"), NAMESPACE, CRD, WIDGET]
+
+    with FakeApiServer() as server:
+        result = apply_batches(pack(manifests), server.url)
+
+    assert result.errors == ['Deployment missing/web: 404 namespaces "missing" not found']
+    assert result.applied == 3
+    assert ("example.com", "widgets", "shop", "w") not in server.objects
+
+
+def test_conflicts_need_force():
+    batches = pack([NAMESPACE, deployment("web")])
+
+    with FakeApiServer() as server:
+        apply_batches(batches, server.url, field_manager="kubectl")
+        result = apply_batches(batches, server.url)
+        forced = apply_batches(batches, server.url, force_conflicts=True)
+
+    assert result.errors == ['Namespace shop: 409 Apply failed with 1 conflict: conflict with "kubectl"']
+    assert (forced.applied, forced.errors) == (2, [])
+    assert server.managers[("apps", "deployments", "shop", "web")] == "cdk8s"
+
+
+def test_unreachable_server():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    refused = apply_batches(pack([NAMESPACE]), f"http://127.0.0.1:{port}")
+    with FakeApiServer(latency=0.5) as server:
+        timed_out = apply_batches(pack([NAMESPACE, deployment("web")]), server.url, timeout=0.1)
+
+    error, = refused.errors
+    assert error.startswith("Namespace shop: ") and "refused" in error
+    # the level with errors stops the apply
+    assert timed_out.errors == ["Namespace shop: timed out"]
@@ -0,0 +1,79 @@
+import re
+
+import pytest
+from cdk8s import App, Chart
+
+from lib.capacity import CapacityPlan, PlannedDeployment, ServiceSlo, plan_capacity
+
+SERVICES = [
+    # latency allows 90% utilization, the 70% target wins
+    ServiceSlo("web", target_rps=600, pod_rps=300, service_ms=5, latency_slo_ms=50, cpu_ms_per_request=0.5,
+               memory_mib=64),
+    # the latency SLO only holds up to 50%
+    ServiceSlo("search", target_rps=1000, pod_rps=100, service_ms=20, latency_slo_ms=40, cpu_ms_per_request=8,
+               memory_mib=512, peak_factor=2),
+    # two pods at least, however little traffic
+    ServiceSlo("cron", target_rps=10, pod_rps=100, service_ms=10, latency_slo_ms=100, cpu_ms_per_request=1,
+               memory_mib=128),
+    # 21 of 29 pods still meet the SLO, 8 may go at once
+    ServiceSlo("api", target_rps=2000, pod_rps=100, service_ms=2, latency_slo_ms=200, cpu_ms_per_request=2,
+               memory_mib=256, peak_factor=2),
+    # 630 requests at 210 per pod are 3 pods, not 4
+    ServiceSlo("exact", target_rps=630, pod_rps=300, service_ms=5, latency_slo_ms=50, cpu_ms_per_request=1,
+               memory_mib=64, peak_factor=1),
+]
+
+
+def test_plans_match_expected_sizing():
+    assert plan_capacity(SERVICES) == [
+        CapacityPlan("web", replicas=3, max_replicas=6, cpu_utilization=70, cpu_millicores=150,
+                     cpu_limit_millicores=300, memory_mib=64, max_unavailable=1),
+        CapacityPlan("search", replicas=20, max_replicas=40, cpu_utilization=50, cpu_millicores=800,
+                     cpu_limit_millicores=1600, memory_mib=512, max_unavailable=1),
+        CapacityPlan("cron", replicas=2, max_replicas=2, cpu_utilization=70, cpu_millicores=100,
+                     cpu_limit_millicores=200, memory_mib=128, max_unavailable=1),
+        CapacityPlan("api", replicas=29, max_replicas=58, cpu_utilization=70, cpu_millicores=200,
+                     cpu_limit_millicores=400, memory_mib=256, max_unavailable=8),
+        CapacityPlan("exact", replicas=3, max_replicas=3, cpu_utilization=70, cpu_millicores=300,
+                     cpu_limit_millicores=600, memory_mib=64, max_unavailable=1),
+    ]
+
+
+def test_many_services_plan_as_one_by_one():
+    services = [SERVICES[i % len(SERVICES)]._replace(name=f"svc-{i}", target_rps=50 + i) for i in range(5000)]
+
+    plans = plan_capacity(services, target_utilization=0.6, min_replicas=3)
+
+    assert len(plans) == len(services)
+    assert plans[::997] == [plan_capacity([service], target_utilization=0.6, min_replicas=3)[0]
+                            for service in services[::997]]
+    assert min(plan.replicas for plan in plans) == 3
+
+
+def test_unmet_slos_are_all_reported():
+    services = [SERVICES[0]._replace(name="slow", service_ms=60), SERVICES[1],
+                SERVICES[2]._replace(name="slower", latency_slo_ms=10)]
+
+    with pytest.raises(ValueError, match="idle pod: slow, slower$"):
+        plan_capacity(services)
+    with pytest.raises(ValueError, match="positive numbers: idle$"):
+        plan_capacity([SERVICES[0]._replace(name="idle", target_rps=0)])
+
+
+def test_planned_deployment():
+    chart = Chart(App(), "test")
+    plan = plan_capacity(SERVICES[:1])[0]
+    PlannedDeployment(chart, "web", plan=plan, labels={"app": "web"}, name="web", image="nginx", port=80)
+
+    deployment, autoscaler, budget = chart.to_json()
+
+    # named as a KubeDeployment "web" would be, and the HPA sets the replicas
+    assert re.fullmatch("test-web-[0-9a-f]{8}", deployment["metadata"]["name"])
+    assert "replicas" not in deployment["spec"]
+    assert deployment["spec"]["template"]["spec"]["containers"][0]["resources"] == {
+        "limits": {"cpu": "300m", "memory": "64Mi"}, "requests": {"cpu": "150m", "memory": "64Mi"}}
+    assert autoscaler["kind"] == "HorizontalPodAutoscaler"
+    assert autoscaler["spec"]["scaleTargetRef"]["name"] == deployment["metadata"]["name"]
+    assert (autoscaler["spec"]["minReplicas"], autoscaler["spec"]["maxReplicas"]) == (3, 6)
+    assert autoscaler["spec"]["metrics"][0]["resource"]["target"]["averageUtilization"] == 70
+    assert budget["spec"] == {"maxUnavailable": 1, "selector": {"matchLabels": {"app": "web"}}}
@@ -0,0 +1,92 @@
+import cdk8s
+import pytest
+import yaml
+
+from lib import emitter, yaml_writer
+from lib.validation import check_schema
+from tools import bench_emitter
+
+# strings YAML 1.1 reads as null, booleans, numbers or timestamps
+TAG_LIKE = ["", "~", "null", "Null", "NULL", "y", "Y", "yes", "No", "ON", "off", "true", "True", "FALSE",
+            "0b101", "0755", "0o17", "0x1F", "+12", "1_000", "1e3", "-1.5E-3", ".5", "1.", ".inf", "-.Inf", ".NaN",
+            "1:30", "190:20:30.15", "2001-12-14", "2001-12-14t21:59:43.10-05:00", "2001-12-14 21:59:43.10 -5"]
+MULTILINE = ["a\nb", "a\nb\n", "a\nb\n\n", "\n", "\n\nleading", "  indented\nblock\n", "trailing space \nx", "x\n ",
+             "tab\n\tindent", "---\nkey: value", "...\nend", "%TAG\nx", "# not a comment\nx", "a: b\nc",
+             "#!/bin/sh\nset -e\necho done\n", "a long line of text, " * 4 + "\nand more\n\n\nafter blank lines"]
+CONTROL = ["\x00", "bell\x07", "esc\x1b[0m", "\x7f", "\x85next", "nb\xa0sp", " ", "a\tb", "a\rb",
+           "a control \x01 character in a string longer than forty characters\nover two lines"]
+NUMBERS = [0, 1, -1, 2 ** 53, 2 ** 53 + 1, 2 ** 64, 10 ** 21, 10 ** 22, 1.5, -0.0, 0.1, 1e-7, 1e-6, 123456789.123,
+           1e21, 2.5e-10, 1.7976931348623157e308, 5e-324]
+
+
+def test_emitter_writes_what_cdk8s_writes(tmp_path):
+    bench_emitter.synth_cdk8s(str(tmp_path / "cdk8s"), 30)
+    bench_emitter.synth_emitter(str(tmp_path / "emitter"), 30)
+
+    written = sorted(path.name for path in (tmp_path / "cdk8s").iterdir())
+    assert written == sorted(path.name for path in (tmp_path / "emitter").iterdir())
+    for name in written:
+        assert (tmp_path / "emitter" / name).read_bytes() == (tmp_path / "cdk8s" / name).read_bytes()
+
+
+@pytest.mark.parametrize("values", [TAG_LIKE, MULTILINE, CONTROL, NUMBERS], ids=["tag-like", "multiline", "control",
+                                                                                 "numbers"])
+def test_yaml_writer_matches_cdk8s(values):
+    documents = [
+        {f"key-{i}": value for i, value in enumerate(values)},
+        {"nested": {"list": values, "maps": [{"value": value} for value in values]}},
+        values,
+    ]
+    if all(isinstance(value, str) for value in values):
+        documents.append({value: "key" for value in values})
+
+    text = yaml_writer.dump_all(documents)
+
+    assert text == cdk8s.Yaml.stringify(*documents)
+    if values in (TAG_LIKE, MULTILINE):
+        # and a YAML 1.1 reader reads the strings back; PyYAML rejects the
+        # unescaped DEL and C1 characters that cdk8s writes
+        assert list(yaml.safe_load_all(text)) == documents
+
+
+def test_merge_key_is_plain():
+    # PyYAML reads "<<" as a merge key, cdk8s writes it plain all the same
+    document = {"<<": "<<", "list": ["<<"]}
+
+    assert yaml_writer.dump(document) == cdk8s.Yaml.stringify(document) == "<<: <<\nlist:\n  - <<\n"
+
+
+def synth_emitter(outdir, workers=None, **options):
+    app = emitter.App(outdir=str(outdir), **options)
+    for i in range(3):
+        chart = emitter.Chart(app, f"tenant-{i}", namespace=f"tenant-{i}")
+        bench_emitter.build(chart, lambda name: getattr(emitter.kinds, name), 12, emitter.int_or_string,
+                            emitter.quantity)
+    app.synth(workers=workers)
+    return {path.name: path.read_bytes() for path in outdir.iterdir()}
+
+
+@pytest.mark.parametrize("yaml_output_type, files", [("FILE_PER_CHART", 3), ("FILE_PER_APP", 1)])
+def test_stream_writes_what_synth_writes(tmp_path, yaml_output_type, files):
+    written = synth_emitter(tmp_path / "memory", yaml_output_type=yaml_output_type)
+
+    assert len(written) == files
+    assert synth_emitter(tmp_path / "stream", yaml_output_type=yaml_output_type, stream=True) == written
+
+
+def test_stream_is_not_validated(tmp_path):
+    app = emitter.App(outdir=str(tmp_path), stream=True)
+    chart = emitter.Chart(app, "tenant")
+    emitter.kinds.KubeConfigMap(chart, "config", data={"key": "value"})
+
+    # written, and not kept
+    assert chart.api_objects == []
+    with pytest.raises(ValueError, match="streaming App"):
+        check_schema(app)
+
+
+@pytest.mark.parametrize("yaml_output_type", ["FILE_PER_CHART", "FILE_PER_APP"])
+def test_workers_write_what_synth_writes(tmp_path, yaml_output_type):
+    written = synth_emitter(tmp_path / "memory", yaml_output_type=yaml_output_type)
+
+    assert synth_emitter(tmp_path / "pool", workers=2, yaml_output_type=yaml_output_type) == written
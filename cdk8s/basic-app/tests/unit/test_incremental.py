@@ -0,0 +1,117 @@
+import importlib
+import json
+import shutil
+import sys
+
+from lib import emitter, incremental
+from lib.incremental import HASHES_FILE, IncrementalApp
+
+
+def config_chart(app, id, value):
+    chart = emitter.Chart(app, id)
+    emitter.kinds.KubeConfigMap(chart, "config", data={"value": value})
+
+
+def synth(outdir, charts, sources=()):
+    app = IncrementalApp(emitter.App, outdir=str(outdir), sources=sources)
+    for id, value in charts.items():
+        app.add_chart(config_chart, id, value)
+    return app.synth()
+
+
+def test_cold_then_unchanged(tmp_path):
+    cold = synth(tmp_path, {"a": "1", "b": "2"})
+    again = synth(tmp_path, {"a": "1", "b": "2"})
+
+    assert (cold.built, cold.written) == (["a", "b"], ["a.k8s.yaml", "b.k8s.yaml"])
+    assert (again.built, again.written, again.unchanged) == ([], [], ["a.k8s.yaml", "b.k8s.yaml"])
+    assert sorted(json.loads((tmp_path / HASHES_FILE).read_text())["charts"]) == ["a", "b"]
+
+
+def test_rebuilds_what_changed(tmp_path):
+    source = tmp_path / "settings.txt"
+    source.write_text("one")
+    synth(tmp_path / "dist", {"a": "1", "b": "2"}, sources=[str(source)])
+
+    changed = synth(tmp_path / "dist", {"a": "1", "b": "3"}, sources=[str(source)])
+    assert (changed.built, changed.written) == (["b"], ["b.k8s.yaml"])
+    assert "value: \"3\"" in (tmp_path / "dist" / "b.k8s.yaml").read_text()
+
+    source.write_text("two")
+    # rebuilt, but the YAML is the same and the file is left alone
+    changed = synth(tmp_path / "dist", {"a": "1", "b": "3"}, sources=[str(source)])
+    assert (changed.built, changed.written) == (["a", "b"], [])
+
+    (tmp_path / "dist" / "a.k8s.yaml").write_text("edited by hand\n")
+    changed = synth(tmp_path / "dist", {"a": "1", "b": "3"}, sources=[str(source)])
+    assert (changed.built, changed.written) == (["a"], ["a.k8s.yaml"])
+
+
+def test_removed_charts_are_deleted(tmp_path):
+    synth(tmp_path, {"a": "1", "b": "2"})
+
+    result = synth(tmp_path, {"a": "1"})
+
+    assert result.removed == ["b.k8s.yaml"]
+    assert not (tmp_path / "b.k8s.yaml").exists()
+    assert list(json.loads((tmp_path / HASHES_FILE).read_text())["charts"]) == ["a"]
+
+
+def test_bindings_are_an_input(tmp_path, monkeypatch):
+    bindings = tmp_path / "k8s"
+    shutil.copytree(incremental._BINDINGS, bindings, ignore=shutil.ignore_patterns("__pycache__", "_jsii"))
+    monkeypatch.setattr(incremental, "_BINDINGS", str(bindings))
+    synth(tmp_path / "dist", {"a": "1"})
+
+    # `cdk8s import` writes the same file names with new contents
+    with open(bindings / "_manifest.py", "a") as f:
+        f.write("\n# regenerated\n")
+    result = synth(tmp_path / "dist", {"a": "1"})
+
+    assert result.built == ["a"]
+
+
+def test_constructed_charts(tmp_path):
+    for built in (["a"], []):
+        app = IncrementalApp(emitter.App, outdir=str(tmp_path))
+        app.add_chart(emitter.Chart, "a")
+        app.synth()
+
+        assert list(app.constructed) == built
+        assert all(isinstance(chart, emitter.Chart) for chart in app.constructed.values())
+
+
+def settings_chart(app, id):
+    # imported while the chart is built, as a lazy import would be
+    settings = importlib.import_module("settings")
+    config_chart(app, id, settings.VALUE)
+
+
+def test_project_modules_are_inputs(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "settings.py").write_text("VALUE = '1'\n")
+    monkeypatch.setattr(incremental, "APP_DIR", str(project))
+    monkeypatch.syspath_prepend(str(project))
+
+    def synth_settings():
+        # a new process, where the chart has not imported settings yet
+        sys.modules.pop("settings", None)
+        app = IncrementalApp(emitter.App, outdir=str(tmp_path / "dist"))
+        app.add_chart(settings_chart, "a")
+        return app.synth()
+
+    assert synth_settings().built == ["a"]
+    assert synth_settings().built == []
+    (project / "settings.py").write_text("VALUE = '2'\n")
+    importlib.invalidate_caches()
+    assert synth_settings().built == ["a"]
+    assert "value: \"2\"" in (tmp_path / "dist" / "a.k8s.yaml").read_text()
+
+
+def test_disabled_builds_everything(tmp_path):
+    app = IncrementalApp(emitter.App, outdir=str(tmp_path), enabled=False)
+    app.add_chart(config_chart, "a", "1")
+
+    assert app.synth().built == ["a"]
+    assert not (tmp_path / HASHES_FILE).exists()
@@ -0,0 +1,54 @@
+import compileall
+import os
+import shutil
+import subprocess
+import sys
+
+from tools import bench_import, k8s_codegen
+
+APP_DIR = bench_import.APP_DIR
+
+
+def slim_imports(tmp_path, *paths, kinds=()):
+    imports = tmp_path / "slim-package" / "imports"
+    shutil.copytree(os.path.join(APP_DIR, "imports"), imports, ignore=shutil.ignore_patterns("__pycache__"))
+    package = k8s_codegen.LazyPackage(str(imports / "k8s"))
+    roots = (k8s_codegen.used_names(paths) & package.module_of.keys()) | set(kinds)
+    k8s_codegen.write_slim(package, package.closure(roots))
+    return str(imports)
+
+
+def synth(workdir):
+    env = dict(os.environ, JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION="1")
+    env.pop("CDK8S_OUTDIR", None)
+    subprocess.run([sys.executable, "main.py"], cwd=workdir, env=env, check=True)
+    with open(os.path.join(workdir, "dist", "getting-started.k8s.yaml")) as f:
+        return f.read()
+
+
+def test_slim_keeps_what_main_uses(tmp_path):
+    imports = slim_imports(tmp_path, os.path.join(APP_DIR, "main.py"), os.path.join(APP_DIR, "lib"))
+    kinds = os.listdir(os.path.join(imports, "k8s", "_kinds"))
+
+    assert "KubeDeployment.py" in kinds
+    assert "KubeApiService.py" not in kinds
+    assert len(kinds) < len(os.listdir(os.path.join(APP_DIR, "imports", "k8s", "_kinds"))) / 3
+    assert compileall.compile_dir(imports, quiet=1)
+
+
+def test_slim_synthesizes_the_same(tmp_path):
+    imports = slim_imports(tmp_path, os.path.join(APP_DIR, "main.py"), os.path.join(APP_DIR, "lib"))
+
+    full = synth(bench_import.workdir_for(os.path.join(APP_DIR, "imports"), str(tmp_path), "full"))
+    slim = synth(bench_import.workdir_for(imports, str(tmp_path), "slim"))
+
+    assert slim == full
+
+
+def test_slim_keeps_allowlisted_kinds(tmp_path):
+    imports = slim_imports(tmp_path, kinds=["KubeService"])
+    manifest = k8s_codegen.Converters.from_manifest(os.path.join(imports, "k8s", "_manifest.py"))
+
+    assert set(manifest.gvk) == {"KubeService"}
+    assert "ServiceSpec" in manifest.fields
+    assert "DeploymentSpec" not in manifest.fields
@@ -0,0 +1,81 @@
+from tools import manifest_diff
+
+DEPLOYMENT = b"""apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+  namespace: shop
+spec:
+  replicas: 3
+  template:
+    spec:
+      containers:
+        - image: nginx:1.25
+          name: web
+        - image: envoy:1.29
+          name: proxy
+"""
+SERVICE = b"""apiVersion: v1
+kind: Service
+metadata:
+  name: web
+  namespace: shop
+spec:
+  ports:
+    - port: 80
+"""
+CONFIG = b"""apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: settings
+data:
+  mode: fast
+"""
+
+
+def write(path, *documents):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"---\n".join(documents))
+
+
+def plan(tmp_path, old, new):
+    write(tmp_path / "old" / "app.k8s.yaml", *old)
+    write(tmp_path / "new" / "app.k8s.yaml", *new)
+    return manifest_diff.diff_documents(manifest_diff.read_documents(str(tmp_path / "old")),
+                                        manifest_diff.read_documents(str(tmp_path / "new")))
+
+
+def test_only_changed_fields_are_reported(tmp_path):
+    changed = DEPLOYMENT.replace(b"replicas: 3", b"replicas: 4").replace(b"envoy:1.29", b"envoy:1.30")
+
+    result = plan(tmp_path, [DEPLOYMENT, SERVICE], [SERVICE, changed])
+
+    step, = result.steps
+    assert (step.action, step.kind, step.namespace, step.name) == ("update", "Deployment", "shop", "web")
+    assert step.changes == [
+        manifest_diff.Change("spec.replicas", 3, 4),
+        manifest_diff.Change("spec.template.spec.containers[name=proxy].image", "envoy:1.29", "envoy:1.30"),
+    ]
+    assert result.unchanged == 1
+
+
+def test_reformatting_is_not_a_change(tmp_path):
+    reordered = b"""kind: Service
+apiVersion: v1
+spec: {ports: [{port: 80}]}
+metadata: {namespace: shop, name: web}
+"""
+
+    result = plan(tmp_path, [SERVICE], [reordered])
+
+    assert (result.steps, result.unchanged) == ([], 1)
+
+
+def test_plan_order(tmp_path):
+    namespace = b"apiVersion: v1\nkind: Namespace\nmetadata:\n  name: shop\n"
+
+    result = plan(tmp_path, [SERVICE], [DEPLOYMENT, CONFIG, namespace])
+
+    assert [(step.action, step.kind) for step in result.steps] == [
+        ("create", "Namespace"), ("create", "ConfigMap"), ("create", "Deployment"), ("delete", "Service")]
+    assert manifest_diff.format_plan(result).splitlines()[-1] == "3 to create, 0 to update, 1 to delete, 0 unchanged"
@@ -0,0 +1,113 @@
+import glob
+import io
+import json
+import os
+import shutil
+import tarfile
+
+from lib import openapi
+
+
+def deployment(**spec):
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "web", "labels": {"app": "web"}},
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": {"app": "web"}},
+            "template": {
+                "metadata": {"labels": {"app": "web"}},
+                "spec": {"containers": [{
+                    "name": "web", "image": "nginx:1.25",
+                    "ports": [{"containerPort": 80}],
+                    "resources": {"limits": {"cpu": 1, "memory": "256Mi"}},
+                    "readinessProbe": {"httpGet": {"path": "/", "port": "http"}},
+                }]},
+            },
+            **spec,
+        },
+    }
+
+
+def test_valid_manifests_pass():
+    manifests = [deployment(), {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "c"},
+                                "data": {"key": "value"}}]
+
+    assert openapi.validate_manifests(manifests) == {}
+
+
+def test_every_error_is_reported():
+    manifest = deployment(replicas="3", paused=1, bogus=True)
+    container = manifest["spec"]["template"]["spec"]["containers"][0]
+    del container["name"]
+    container["ports"].append({"containerPort": 81, "hostIP": 0})
+
+    errors = openapi.validate_manifests([deployment(), manifest])
+
+    assert sorted(errors[1]) == [
+        "spec.bogus: unknown field",
+        "spec.paused: expected boolean, got integer",
+        "spec.replicas: expected number, got string",
+        "spec.template.spec.containers[0].name: required field is missing",
+        "spec.template.spec.containers[0].ports[1].hostIP: expected string, got integer",
+    ]
+    assert list(errors) == [1]
+
+
+def test_unknown_kinds_are_not_checked():
+    assert openapi.load_schema().validate({"apiVersion": "example.com/v1", "kind": "Widget", "spec": 1}) == []
+
+
+def test_swagger_json(tmp_path):
+    path = tmp_path / "swagger.json"
+    path.write_text(json.dumps({"definitions": {
+        "io.k8s.api.core.v1.ConfigMap": {
+            "type": "object",
+            "properties": {
+                "apiVersion": {"type": "string"},
+                "kind": {"type": "string"},
+                "data": {"type": "object", "additionalProperties": {"type": "string"}},
+                "metadata": {"$ref": "#/definitions/io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta"},
+            },
+            "x-kubernetes-group-version-kind": [{"group": "", "version": "v1", "kind": "ConfigMap"}],
+        },
+        "io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+        },
+    }}))
+    manifest = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": 1}, "data": {"a": "b", "c": 2}}
+
+    assert openapi.validate_manifests([manifest], str(path)) == {0: ["metadata.name: expected string, got integer",
+                                                                     "data.c: expected string, got integer"]}
+
+
+def test_workers_find_the_same_errors():
+    manifests = [deployment(replicas=str(i)) if i % 3 == 0 else deployment() for i in range(20)]
+
+    assert openapi.validate_manifests(manifests, workers=2) == openapi.validate_manifests(manifests)
+
+
+def test_enum_values_come_from_the_code(tmp_path):
+    # the docs of an enum member are not its value, and may change
+    source = os.path.join(openapi.APP_DIR, "imports", "k8s")
+    (tmp_path / "_jsii").mkdir()
+    shutil.copy(os.path.join(source, "_manifest.py"), tmp_path)
+    tarball, = glob.glob(os.path.join(source, "_jsii", "*.jsii.tgz"))
+    with tarfile.open(tarball) as old, tarfile.open(tmp_path / "_jsii" / os.path.basename(tarball), "w:gz") as new:
+        for member in old.getmembers():
+            data = old.extractfile(member).read()
+            if member.name == "package/.jsii":
+                assembly = json.loads(data)
+                for jsii_type in assembly["types"].values():
+                    for enum_member in jsii_type.get("members", ()):
+                        enum_member["docs"] = {"summary": "Reworded."}
+                data = json.dumps(assembly).encode()
+                member.size = len(data)
+            new.addfile(member, io.BytesIO(data))
+
+    definitions = openapi.definitions_from_assembly(str(tmp_path))
+
+    kind = definitions["io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions"]["properties"]["kind"]
+    assert kind == {"type": "string", "enum": ["DeleteOptions"]}
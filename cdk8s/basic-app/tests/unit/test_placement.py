@@ -0,0 +1,61 @@
+import pytest
+from cdk8s import App, Chart
+
+from lib.capacity import PlannedDeployment, ServiceSlo, plan_capacity
+from lib.placement import (BEST_EFFORT, HIGH_AVAILABILITY, LATENCY_ISOLATED, NODE_KEY, ZONE_KEY,
+                           AvailabilityProfile, pod_placement)
+from lib.validation import check_schema
+
+ZONES = ["eu-west-1a", "eu-west-1b", "eu-west-1c"]
+
+
+def spread(placement):
+    return [(c.topology_key, c.when_unsatisfiable, c.min_domains) for c in placement.topology_spread_constraints or []]
+
+
+def test_profiles():
+    assert spread(pod_placement(BEST_EFFORT, {"app": "web"}, 3)) == [(ZONE_KEY, "ScheduleAnyway", None)]
+    assert spread(pod_placement(HIGH_AVAILABILITY, {"app": "web"}, 3, ZONES)) == [
+        (ZONE_KEY, "DoNotSchedule", 3), (NODE_KEY, "ScheduleAnyway", None)]
+    assert spread(pod_placement(LATENCY_ISOLATED, {"app": "web"}, 2, ZONES)) == [
+        (ZONE_KEY, "DoNotSchedule", 2), (NODE_KEY, "DoNotSchedule", None)]
+
+
+def test_affinity():
+    placement = pod_placement(LATENCY_ISOLATED, {"app": "web"}, 3, ZONES)
+
+    term, = placement.affinity.pod_anti_affinity.preferred_during_scheduling_ignored_during_execution
+    assert (term.weight, term.pod_affinity_term.topology_key) == (100, NODE_KEY)
+    assert term.pod_affinity_term.label_selector.match_labels == {"app": "web"}
+    requirement, = placement.affinity.node_affinity.required_during_scheduling_ignored_during_execution \
+        .node_selector_terms[0].match_expressions
+    assert (requirement.key, requirement.operator, requirement.values) == (ZONE_KEY, "In", ZONES)
+    assert pod_placement(BEST_EFFORT, {"app": "web"}, 3).affinity is None
+
+
+def test_single_replica_only_keeps_the_zones():
+    placement = pod_placement(LATENCY_ISOLATED, {"app": "web"}, 1, ZONES)
+
+    assert placement.topology_spread_constraints is None
+    assert placement.affinity.pod_anti_affinity is None
+    assert placement.affinity.node_affinity is not None
+
+
+def test_invalid_profiles():
+    with pytest.raises(ValueError, match="zones must be"):
+        pod_placement(AvailabilityProfile(zones="always", nodes=None), {"app": "web"}, 3)
+    with pytest.raises(ValueError, match="anti_affinity must be"):
+        pod_placement(AvailabilityProfile(zones=None, nodes=None, anti_affinity=200), {"app": "web"}, 3)
+
+
+def test_many_workloads_are_valid():
+    app = App()
+    chart = Chart(app, "platform")
+    slos = [ServiceSlo(f"svc-{i}", target_rps=100 * (i % 7 + 1), pod_rps=150, service_ms=4, latency_slo_ms=40,
+                       cpu_ms_per_request=2, memory_mib=128) for i in range(60)]
+    profiles = [BEST_EFFORT, HIGH_AVAILABILITY, LATENCY_ISOLATED]
+    for i, plan in enumerate(plan_capacity(slos)):
+        PlannedDeployment(chart, plan.name, plan=plan, labels={"app": plan.name}, name="app", image="nginx",
+                          availability=profiles[i % 3], zones=ZONES if i % 2 else ())
+
+    assert check_schema(app) == []
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from cdk8s import ApiObject, App, Chart, JsonPatch
+
+from lib.capacity import PlannedDeployment, ServiceSlo, plan_capacity
+from lib.rightsizing import NodeShape, Recommendation, Rightsizing, SizingPolicy, Usage, load_usage, recommend
+from lib.validation import check_schema
+
+
+def write_usage(path, rows, header="timestamp,container,memory,workload,cpu,namespace"):
+    columns = header.split(",")
+    lines = [header] + [",".join(str(row.get(column, 0)) for column in columns) for row in rows]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_percentiles_of_every_container(tmp_path):
+    random = np.random.default_rng(7)
+    workloads = random.integers(0, 40, 20000)
+    cpu = random.gamma(2, 0.05, len(workloads)).round(4)
+    memory = random.integers(10 ** 7, 10 ** 9, len(workloads))
+    path = write_usage(tmp_path / "usage.csv", [
+        {"namespace": f"ns-{w % 3}", "workload": f"web-{w}", "container": "app", "cpu": c, "memory": m}
+        for w, c, m in zip(workloads.tolist(), cpu.tolist(), memory.tolist())])
+
+    usage = load_usage(path)
+    result = recommend(usage, SizingPolicy(headroom=1, min_cpu_millicores=0, min_memory_mib=0, min_samples=0))
+
+    assert len(usage.keys) == 40
+    for w in range(40):
+        sample = workloads == w
+        recommendation = result[(f"ns-{w % 3}", f"web-{w}", "app")]
+        assert recommendation.samples == sample.sum()
+        assert recommendation.cpu_millicores == pytest.approx(np.percentile(cpu[sample], 90) * 1000, abs=1)
+        assert recommendation.memory_mib == pytest.approx(np.percentile(memory[sample], 99) / 2 ** 20, abs=1)
+        assert recommendation.memory_limit_mib == np.ceil(memory[sample].max() / 2 ** 20)
+
+
+def test_policy():
+    usage = Usage([("default", "web", "app"), ("default", "batch", "app")], np.array([0] * 100 + [1] * 10),
+                  np.concatenate([np.linspace(0, 0.2, 100), np.ones(10)]),
+                  np.concatenate([np.full(99, 100 * 2 ** 20), [400 * 2 ** 20], np.ones(10)]))
+
+    result = recommend(usage)
+
+    # p90 of 0..0.2 is 0.18 cores, the memory p99 is 1% of the way from 100 to 400 MiB
+    assert result == {("default", "web", "app"): Recommendation(
+        cpu_millicores=207, cpu_limit_millicores=414, memory_mib=119, memory_limit_mib=460, samples=100)}
+
+
+def test_rightsizing_patches_workloads():
+    app = App()
+    chart = Chart(app, "shop")
+    slo = ServiceSlo("web", target_rps=3000, pod_rps=300, service_ms=5, latency_slo_ms=50, cpu_ms_per_request=2,
+                     memory_mib=512)
+    PlannedDeployment(chart, "web", plan=plan_capacity([slo])[0], labels={"app": "web"}, name="web", image="nginx")
+    batch = ApiObject(chart, "batch", api_version="apps/v1", kind="Deployment", metadata={"name": "batch"})
+    batch.add_json_patch(JsonPatch.add("/spec", {
+        "replicas": 2, "selector": {"matchLabels": {"app": "batch"}},
+        "template": {"metadata": {"labels": {"app": "batch"}},
+                     "spec": {"containers": [{"name": "worker", "image": "worker"}]}}}))
+    deployment, = [o.to_json() for o in chart.node.find_all() if isinstance(o, ApiObject) and o.name != "batch"
+                   and o.kind == "Deployment"]
+    name = deployment["metadata"]["name"]
+    usage = Usage([("default", name, "web"), ("default", "batch", "worker")], np.repeat([0, 1], 1000),
+                  np.full(2000, 0.1), np.full(2000, 100 * 2 ** 20))
+
+    sizing = Rightsizing(chart, "rightsizing", usage=usage, node=NodeShape("small", 1000, 4000))
+
+    resources = {"limits": {"cpu": "230m", "memory": "115Mi"}, "requests": {"cpu": "115m", "memory": "115Mi"}}
+    for o in chart.node.find_all():
+        if isinstance(o, ApiObject) and o.kind == "Deployment":
+            assert o.to_json()["spec"]["template"]["spec"]["containers"][0]["resources"] == resources
+    web, batch = sorted(sizing.report.containers, key=lambda c: c.key[1] == "batch")
+    assert (web.replicas, web.memory_before, batch.cpu_before) == (15, 512, None)
+    # 15 replicas of 600m before; 17 of 115m after, the batch pods had no requests
+    assert (sizing.report.nodes(False), sizing.report.nodes(True)) == (9, 2)
+    assert check_schema(app) == []
+
+
+def test_missing_column(tmp_path):
+    path = write_usage(tmp_path / "usage.csv", [], header="namespace,workload,cpu")
+
+    with pytest.raises(ValueError, match="has no container, memory column"):
+        load_usage(path)
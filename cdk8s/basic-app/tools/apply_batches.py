@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+"""Packs synthesized manifests into server-side apply batches, level by level.
+
+Sorts the objects of the YAML files under DIST into levels that only depend on
+the levels before them: CRDs, namespaces, RBAC (service accounts, roles and
+their bindings), workloads with everything else built into Kubernetes, and
+custom resources last, one batch per level. The batches are printed, written
+to one file each for `kubectl apply --server-side` (--out), or applied with
+server-side apply through an API server that needs no credentials, such as
+`kubectl proxy` (--server):
+
+    python -m tools.apply_batches dist
+    python -m tools.apply_batches dist --out batches --max-bytes 200000
+    python -m tools.apply_batches dist --server http://127.0.0.1:8001
+
+--max-bytes splits levels into as few batches as fit, for --out files that
+something applies as one request with a size limit, such as the Lambda behind
+an EKS add_manifest. Server-side apply has no request for many objects, so
+--server sends one PATCH per object whatever the batches, concurrently within
+a batch; it saves requests and time only by looking up every API group version
+once and keeping its connections open, where kubectl apply of one file at a
+time runs discovery and opens a connection for every object. Custom resources
+wait until their CRDs are established. A level with errors stops the apply,
+since the levels after it depend on it. Fields another field manager owns are
+conflicts, which fail the object unless --force-conflicts takes them over, as
+with kubectl. tools/fake_apiserver.py stands in for the API server in tests.
+"""
+import argparse
+import concurrent.futures
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+import typing
+import urllib.parse
+
+import yaml
+
+from tools.manifest_diff import LOADER, kind_rank, read_documents
+
+LEVELS = ("crds", "namespaces", "rbac", "workloads", "custom resources")
+
+_RBAC_KINDS = {"ServiceAccount", "ClusterRole", "ClusterRoleBinding", "Role", "RoleBinding"}
+# the API groups Kubernetes serves itself, all others are defined by CRDs
+_BUILTIN_GROUPS = {
+    "", "apps", "batch", "autoscaling", "policy", "networking.k8s.io", "rbac.authorization.k8s.io",
+    "storage.k8s.io", "scheduling.k8s.io", "apiextensions.k8s.io", "admissionregistration.k8s.io",
+    "apiregistration.k8s.io", "coordination.k8s.io", "discovery.k8s.io", "node.k8s.io", "certificates.k8s.io",
+    "flowcontrol.apiserver.k8s.io", "events.k8s.io", "resource.k8s.io", "storagemigration.k8s.io",
+}
+_CRDS = "/apis/apiextensions.k8s.io/v1/customresourcedefinitions"
+# what a request can fail with before it has a response: timeouts, refused and
+# reset connections and malformed responses
+_NETWORK_ERRORS = (OSError, http.client.HTTPException)
+
+
+class Batch(typing.NamedTuple):
+    level: str
+    manifests: typing.List[typing.Dict[str, typing.Any]]
+    # of the manifests as JSON
+    size: int
+
+
+class ApplyResult(typing.NamedTuple):
+    applied: int
+    requests: int
+    errors: typing.List[str]
+
+
+def read_manifests(root: str) -> typing.List[typing.Dict[str, typing.Any]]:
+    """The objects in the YAML files under root, in file order."""
+    manifests = []
+    for document in read_documents(root):
+        manifest = yaml.load(document, Loader=LOADER)
+        if manifest is None:
+            continue
+        if not isinstance(manifest, dict):
+            raise ValueError(f"not a Kubernetes object: {document[:80]!r}")
+        manifests.append(manifest)
+    return manifests
+
+
+def pack(manifests: typing.Iterable[typing.Dict[str, typing.Any]],
+         max_bytes: typing.Optional[int] = None) -> typing.List[Batch]:
+    """The batches of manifests, level by level, see the module docstring.
+    Levels larger than max_bytes are split first fit decreasing, which needs
+    at most 11/9 as many batches as the fewest possible plus one."""
+    manifests = list(manifests)
+    custom = {(crd["spec"]["group"], crd["spec"]["names"]["kind"]) for crd in manifests
+              if crd.get("kind") == "CustomResourceDefinition" and _group(crd) == "apiextensions.k8s.io"}
+    levels: typing.List[typing.List[typing.Tuple[int, typing.Dict[str, typing.Any]]]] = [[] for _ in LEVELS]
+    for manifest in manifests:
+        levels[_level(manifest, custom)].append((len(json.dumps(manifest)), manifest))
+
+    batches = []
+    for level, items in zip(LEVELS, levels):
+        if not items:
+            continue
+        if max_bytes is None:
+            bins = [items]
+        else:
+            bins = []
+            sizes: typing.List[int] = []
+            for size, manifest in sorted(items, key=lambda item: -item[0]):
+                if size > max_bytes:
+                    raise ValueError(f"{_label(manifest)} is {size} bytes, more than {max_bytes}")
+                for i, used in enumerate(sizes):
+                    if used + size <= max_bytes:
+                        bins[i].append((size, manifest))
+                        sizes[i] += size
+                        break
+                else:
+                    bins.append([(size, manifest)])
+                    sizes.append(size)
+        for items in bins:
+            items = sorted(items, key=lambda item: _order(item[1]))
+            batches.append(Batch(level, [manifest for _, manifest in items], sum(size for size, _ in items)))
+    return batches
+
+
+def apply_batches(batches: typing.Sequence[Batch], server: str, *, field_manager: str = "cdk8s", workers: int = 8,
+                  timeout: float = 60.0, force_conflicts: bool = False) -> ApplyResult:
+    """Applies batches in order with server-side apply through the API server
+    at server, see the module docstring. An object the server cannot be
+    reached for, or does not answer for within timeout, is an error."""
+    client = _Client(server, timeout)
+    applied = 0
+    errors: typing.List[str] = []
+    crds: typing.List[str] = []
+    with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+        for i, batch in enumerate(batches):
+            if batch.level == "custom resources" and crds:
+                errors.extend(_wait_established(client, crds, timeout))
+                crds = []
+                if errors:
+                    break
+            # discovery first, so the workers do not look up the same group version at once; a failed lookup
+            # is tried again by _apply, which reports it
+            for manifest in batch.manifests:
+                try:
+                    client.resource(str(manifest.get("apiVersion", "")), str(manifest.get("kind", "")))
+                except _NETWORK_ERRORS:
+                    pass
+            results = list(pool.map(lambda manifest: _apply(client, manifest, field_manager, force_conflicts),
+                                    batch.manifests))
+            errors.extend(error for error in results if error is not None)
+            applied += results.count(None)
+            if batch.level == "crds":
+                crds.extend(str(manifest["metadata"]["name"]) for manifest, error in zip(batch.manifests, results)
+                            if error is None)
+            last_of_level = i + 1 == len(batches) or batches[i + 1].level != batch.level
+            if errors and last_of_level:
+                break
+    return ApplyResult(applied, client.requests, errors)
+
+
+def format_batches(batches: typing.Sequence[Batch]) -> str:
+    lines = []
+    for i, batch in enumerate(batches):
+        lines.append(f"{i:>3} {batch.level:<17}{len(batch.manifests):>7} objects{batch.size / 1024:>10.1f} KiB")
+        for manifest in batch.manifests:
+            lines.append(f"      {manifest.get('apiVersion')}/{_label(manifest)}")
+    return "\n".join(lines)
+
+
+def write_batches(batches: typing.Sequence[Batch], out: str) -> typing.List[str]:
+    """Writes each batch to a YAML file in out, named for its position and
+    level, and returns their paths."""
+    os.makedirs(out, exist_ok=True)
+    paths = []
+    for i, batch in enumerate(batches):
+        path = os.path.join(out, f"{i:02d}-{batch.level.replace(' ', '-')}.yaml")
+        with open(path, "w") as f:
+            yaml.safe_dump_all(batch.manifests, f, sort_keys=False)
+        paths.append(path)
+    return paths
+
+
+def _level(manifest: typing.Dict[str, typing.Any], custom: typing.Set[typing.Tuple[str, str]]) -> int:
+    kind, group = manifest.get("kind"), _group(manifest)
+    if (group, kind) in custom or group not in _BUILTIN_GROUPS:
+        return LEVELS.index("custom resources")
+    if kind == "CustomResourceDefinition":
+        return LEVELS.index("crds")
+    if kind == "Namespace":
+        return LEVELS.index("namespaces")
+    if kind in _RBAC_KINDS:
+        return LEVELS.index("rbac")
+    return LEVELS.index("workloads")
+
+
+def _group(manifest: typing.Dict[str, typing.Any]) -> str:
+    return str(manifest.get("apiVersion", "")).rpartition("/")[0]
+
+
+def _order(manifest: typing.Dict[str, typing.Any]) -> typing.Tuple[int, str, str]:
+    metadata = manifest.get("metadata") or {}
+    return kind_rank(str(manifest.get("kind", ""))), str(metadata.get("namespace") or ""), str(metadata.get("name", ""))
+
+
+def _label(manifest: typing.Dict[str, typing.Any]) -> str:
+    metadata = manifest.get("metadata") or {}
+    name = "/".join(str(part) for part in (metadata.get("namespace"), metadata.get("name")) if part)
+    return f"{manifest.get('kind')} {name}"
+
+
+def _apply(client: "_Client", manifest: typing.Dict[str, typing.Any], field_manager: str,
+           force_conflicts: bool) -> typing.Optional[str]:
+    try:
+        return _patch(client, manifest, field_manager, force_conflicts)
+    except _NETWORK_ERRORS as e:
+        return f"{_label(manifest)}: {e or type(e).__name__}"
+
+
+def _patch(client: "_Client", manifest: typing.Dict[str, typing.Any], field_manager: str,
+           force_conflicts: bool) -> typing.Optional[str]:
+    api_version, kind = str(manifest.get("apiVersion", "")), str(manifest.get("kind", ""))
+    resource = client.resource(api_version, kind)
+    if resource is None:
+        return f"{_label(manifest)}: the server has no {kind} in {api_version}"
+    plural, namespaced = resource
+    metadata = manifest.get("metadata") or {}
+    path = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+    if namespaced:
+        path += f"/namespaces/{metadata.get('namespace') or 'default'}"
+    query = urllib.parse.urlencode({"fieldManager": field_manager, **({"force": "true"} if force_conflicts else {})})
+    status, body = client.request("PATCH", f"{path}/{plural}/{metadata.get('name')}?{query}",
+                                  json.dumps(manifest).encode(), "application/apply-patch+yaml")
+    if status >= 300:
+        return f"{_label(manifest)}: {status} {body.get('message', '')}".rstrip()
+    return None
+
+
+def _wait_established(client: "_Client", names: typing.Sequence[str], timeout: float) -> typing.List[str]:
+    deadline = time.monotonic() + timeout
+    pending = list(names)
+    while pending:
+        waiting = []
+        for name in pending:
+            try:
+                status, body = client.request("GET", f"{_CRDS}/{name}")
+            except _NETWORK_ERRORS:
+                # not known to be established yet
+                status, body = 0, {}
+            conditions = (body.get("status") or {}).get("conditions") or []
+            if not any(c.get("type") == "Established" and c.get("status") == "True" for c in conditions):
+                waiting.append(name)
+        pending = waiting
+        if pending and time.monotonic() > deadline:
+            return [f"CustomResourceDefinition {name}: not established after {timeout:g}s" for name in pending]
+        if pending:
+            time.sleep(0.1)
+    return []
+
+
+class _Client:
+    """JSON requests to the API server, over one kept alive connection per
+    thread, and the resources of every API group version, looked up once."""
+
+    def __init__(self, server: str, timeout: float):
+        url = urllib.parse.urlsplit(server)
+        self._connection = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        self._host, self._prefix, self._timeout = url.netloc, url.path.rstrip("/"), timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._resources: typing.Dict[str, typing.Dict[str, typing.Tuple[str, bool]]] = {}
+        self.requests = 0
+
+    def resource(self, api_version: str, kind: str) -> typing.Optional[typing.Tuple[str, bool]]:
+        """The plural name of kind in api_version and whether it is
+        namespaced, None if the server does not have it."""
+        resources = self._resources.get(api_version)
+        if resources is None or kind not in resources:
+            # a group version that is not found is looked up again, it may
+            # come with a CRD applied since
+            status, body = self.request("GET", "/api/v1" if api_version == "v1" else f"/apis/{api_version}")
+            resources = {r["kind"]: (r["name"], r["namespaced"]) for r in body.get("resources", [])
+                         if "/" not in r["name"]} if status == 200 else {}
+            self._resources[api_version] = resources
+        return resources.get(kind)
+
+    def request(self, method: str, path: str, body: typing.Optional[bytes] = None,
+                content_type: str = "application/json") -> typing.Tuple[int, typing.Dict[str, typing.Any]]:
+        with self._lock:
+            self.requests += 1
+        headers = {"Accept": "application/json", "Content-Type": content_type}
+        for attempt in range(2):
+            connection = getattr(self._local, "connection", None)
+            if connection is None:
+                connection = self._local.connection = self._connection(self._host, timeout=self._timeout)
+            try:
+                connection.request(method, self._prefix + path, body, headers)
+                response = connection.getresponse()
+                data = response.read()
+                break
+            except _NETWORK_ERRORS as e:
+                connection.close()
+                self._local.connection = None
+                # the server closed a kept alive connection, once is fine
+                if attempt or not isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError,
+                                                 BrokenPipeError)):
+                    raise
+        try:
+            return response.status, json.loads(data) if data else {}
+        except ValueError:
+            return response.status, {"message": data.decode(errors="replace")[:200]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dist", help="directory of the synthesized manifests")
+    parser.add_argument("--max-bytes", type=int, help="largest batch, as JSON, of the --out files")
+    parser.add_argument("--out", help="write the batches to this directory")
+    parser.add_argument("--server", help="apply the batches through this API server, e.g. kubectl proxy")
+    parser.add_argument("--field-manager", default="cdk8s")
+    parser.add_argument("--force-conflicts", action="store_true",
+                        help="take over fields that other field managers own")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent requests")
+    args = parser.parse_args()
+    if args.max_bytes and args.server:
+        parser.error("--max-bytes only sizes the --out files, --server sends one request per object")
+
+    batches = pack(read_manifests(args.dist), args.max_bytes)
+    if args.out:
+        for path in write_batches(batches, args.out):
+            print(path)
+    elif args.server:
+        start = time.perf_counter()
+        result = apply_batches(batches, args.server, field_manager=args.field_manager, workers=args.workers,
+                               force_conflicts=args.force_conflicts)
+        for error in result.errors:
+            print(error, file=sys.stderr)
+        print(f"{result.applied} applied in {len(batches)} batches, {result.requests} requests, "
+              f"{time.perf_counter() - start:.2f}s")
+        if result.errors:
+            sys.exit(1)
+    else:
+        print(format_batches(batches))
+
+
+if __name__ == "__main__":
+    main()
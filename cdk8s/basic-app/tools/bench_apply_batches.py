@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Benchmark for tools/apply_batches.py.
+
+Applies the objects of --tenants tenants to a tools/fake_apiserver.py server
+that takes --latency seconds per request. Each tenant is a namespace with a
+service account, a role and its binding, a ConfigMap, a Deployment, a Service
+and a custom resource, whose CRD all tenants share. They are applied one object
+at a time, looking up its API group version each time as kubectl apply of one
+file does, and then in batches by level with one worker and with --workers:
+
+    python -m tools.bench_apply_batches --tenants 50 --latency 0.005 --workers 8
+"""
+import argparse
+import time
+import typing
+
+from tools.apply_batches import Batch, apply_batches, pack
+from tools.fake_apiserver import FakeApiServer
+
+_CRD = {"apiVersion": "apiextensions.k8s.io/v1", "kind": "CustomResourceDefinition",
+        "metadata": {"name": "widgets.example.com"},
+        "spec": {"group": "example.com", "scope": "Namespaced", "versions": [{"name": "v1"}],
+                 "names": {"kind": "Widget", "plural": "widgets"}}}
+
+
+def tenant(name: str) -> typing.List[typing.Dict[str, typing.Any]]:
+    metadata = {"name": "web", "namespace": name}
+    labels = {"app": "web"}
+    return [
+        {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": name}},
+        {"apiVersion": "v1", "kind": "ServiceAccount", "metadata": metadata},
+        {"apiVersion": "rbac.authorization.k8s.io/v1", "kind": "Role", "metadata": metadata,
+         "rules": [{"apiGroups": [""], "resources": ["configmaps"], "verbs": ["get", "list", "watch"]}]},
+        {"apiVersion": "rbac.authorization.k8s.io/v1", "kind": "RoleBinding", "metadata": metadata,
+         "roleRef": {"apiGroup": "rbac.authorization.k8s.io", "kind": "Role", "name": "web"},
+         "subjects": [{"kind": "ServiceAccount", "name": "web", "namespace": name}]},
+        {"apiVersion": "v1", "kind": "ConfigMap", "metadata": metadata, "data": {"mode": "fast"}},
+        {"apiVersion": "apps/v1", "kind": "Deployment", "metadata": metadata,
+         "spec": {"replicas": 3, "selector": {"matchLabels": labels}, "template": {
+             "metadata": {"labels": labels},
+             "spec": {"serviceAccountName": "web", "containers": [{"name": "web", "image": "nginx:1.25"}]}}}},
+        {"apiVersion": "v1", "kind": "Service", "metadata": metadata,
+         "spec": {"selector": labels, "ports": [{"port": 80}]}},
+        {"apiVersion": "example.com/v1", "kind": "Widget", "metadata": metadata, "spec": {"size": 1}},
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds per request")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    manifests = [_CRD] + [manifest for i in range(args.tenants) for manifest in tenant(f"tenant-{i}")]
+    batches = pack(manifests)
+    print(f"{'apply':<20}{'seconds':>9}{'requests':>10}   ({len(manifests)} objects, {len(batches)} batches, "
+          f"{args.latency * 1000:g}ms a request)")
+    runs = [
+        ("one at a time", lambda url: [apply_batches([Batch(batch.level, [manifest], 0)], url, workers=1)
+                                       for batch in batches for manifest in batch.manifests]),
+        ("batches, 1 worker", lambda url: [apply_batches(batches, url, workers=1)]),
+        (f"batches, {args.workers} workers", lambda url: [apply_batches(batches, url, workers=args.workers)]),
+    ]
+    for name, run in runs:
+        with FakeApiServer(latency=args.latency) as server:
+            start = time.perf_counter()
+            results = run(server.url)
+            seconds = time.perf_counter() - start
+        errors = [error for result in results for error in result.errors]
+        if errors:
+            raise SystemExit("\n".join(errors))
+        print(f"{name:<20}{seconds:>9.2f}{len(server.requests):>10}")
+
+
+if __name__ == "__main__":
+    main()
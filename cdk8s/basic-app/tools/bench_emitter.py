@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""Benchmark for lib/emitter.py against cdk8s.
+
+Builds the same chart of --count objects (Deployments, Services and ConfigMaps,
+with strings YAML has to quote or write as blocks) with cdk8s and with the
+pure Python backend, synthesizes both, and fails unless they wrote the same
+bytes:
+
+    python -m tools.bench_emitter --count 5000
+"""
+import argparse
+import filecmp
+import os
+import sys
+import tempfile
+import time
+import typing
+
+from lib.jsii_startup import use_package_cache
+
+use_package_cache()
+
+import cdk8s  # noqa: E402
+from imports import k8s  # noqa: E402
+from lib import emitter  # noqa: E402
+
+# values that exercise the quoting rules of the YAML writer
+_DATA = {
+    "boolean": "yes",
+    "number": "0755",
+    "float": "1e3",
+    "empty": "",
+    "colon": "host: port",
+    "comment": "a #comment",
+    "leading-space": " padded",
+    "quote": "it's",
+    "double-quote": 'say "hi"',
+    "script": "#!/bin/sh\nset -e\necho done\n",
+    "trailing": "line\n\n",
+    "unicode": "café ☃",
+    "tab": "a\tb",
+    "document": "---\nkey: value",
+    "123": "numeric key",
+}
+
+
+def build(chart: typing.Any, kind: typing.Callable[..., typing.Any], count: int,
+          int_or_string: typing.Callable[[typing.Any], k8s.IntOrString],
+          quantity: typing.Callable[[typing.Any], k8s.Quantity]) -> None:
+    for i in range(count // 3):
+        labels = {"app": f"web-{i}", "tier": "frontend" if i % 2 else "backend"}
+        kind("KubeDeployment")(
+            chart, f"deployment-{i}",
+            metadata=k8s.ObjectMeta(annotations={"checksum/config": f"{i:040x}", "note": _DATA["colon"]}),
+            spec=k8s.DeploymentSpec(
+                replicas=i % 5 or None,
+                selector=k8s.LabelSelector(match_labels=labels),
+                strategy=k8s.DeploymentStrategy(rolling_update=k8s.RollingUpdateDeployment(
+                    max_surge=int_or_string("25%"), max_unavailable=int_or_string(0))),
+                template=k8s.PodTemplateSpec(
+                    metadata=k8s.ObjectMeta(labels=labels),
+                    spec=k8s.PodSpec(containers=[k8s.Container(
+                        name="web", image=f"nginx:1.{i % 30}",
+                        args=["--port", "8080", "--flag=on"] if i % 4 == 0 else None,
+                        env=[k8s.EnvVar(name="MODE", value=_DATA["boolean"]),
+                             k8s.EnvVar(name="SCRIPT", value=_DATA["script"])],
+                        ports=[k8s.ContainerPort(container_port=8080, name="http")],
+                        resources=k8s.ResourceRequirements(
+                            limits={"cpu": quantity("500m"), "memory": quantity("256Mi")},
+                            requests={"cpu": quantity(0.25)}),
+                        readiness_probe=k8s.Probe(http_get=k8s.HttpGetAction(
+                            path="/healthz", port=int_or_string("http")), period_seconds=10),
+                    )]),
+                ),
+            ),
+        )
+        kind("KubeService")(
+            chart, f"service-{i}",
+            spec=k8s.ServiceSpec(
+                selector=labels,
+                ports=[k8s.ServicePort(port=80, target_port=int_or_string(8080), protocol="TCP")]),
+        )
+        kind("KubeConfigMap")(
+            chart, f"config-{i}",
+            metadata=k8s.ObjectMeta(name=f"config-{i}", labels={"generated": "true"}),
+            data=dict(_DATA, index=str(i), ratio=f"{i / 7:.3f}"),
+        )
+
+
+def synth_cdk8s(outdir: str, count: int) -> typing.Tuple[float, float]:
+    start = time.perf_counter()
+    app = cdk8s.App(outdir=outdir)
+    chart = cdk8s.Chart(app, "bench", labels={"team": "platform"})
+    build(chart, lambda name: getattr(k8s, name), count, int_or_string_of, quantity_of)
+    built = time.perf_counter()
+    app.synth()
+    return built - start, time.perf_counter() - built
+
+
+def synth_emitter(outdir: str, count: int) -> typing.Tuple[float, float]:
+    start = time.perf_counter()
+    app = emitter.App(outdir=outdir)
+    chart = emitter.Chart(app, "bench", labels={"team": "platform"})
+    build(chart, lambda name: getattr(emitter.kinds, name), count, emitter.int_or_string, emitter.quantity)
+    built = time.perf_counter()
+    app.synth()
+    return built - start, time.perf_counter() - built
+
+
+def int_or_string_of(value: typing.Union[str, int]) -> k8s.IntOrString:
+    return k8s.IntOrString.from_string(value) if isinstance(value, str) else k8s.IntOrString.from_number(value)
+
+
+def quantity_of(value: typing.Union[str, int, float]) -> k8s.Quantity:
+    return k8s.Quantity.from_string(value) if isinstance(value, str) else k8s.Quantity.from_number(value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000, help="number of API objects")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outdirs = {name: os.path.join(tmp, name) for name in ("cdk8s", "emitter")}
+        results = {"cdk8s": synth_cdk8s(outdirs["cdk8s"], args.count),
+                   "emitter": synth_emitter(outdirs["emitter"], args.count)}
+        print(f"{'backend':<12}{'construct':>10}{'synth':>10}{'total':>10}   (s, {args.count // 3 * 3} objects)")
+        for name, (construct, synth) in results.items():
+            print(f"{name:<12}{construct:>10.2f}{synth:>10.2f}{construct + synth:>10.2f}")
+        _, mismatch, errors = filecmp.cmpfiles(outdirs["cdk8s"], outdirs["emitter"], os.listdir(outdirs["cdk8s"]),
+                                               shallow=False)
+        if mismatch or errors:
+            sys.exit(f"output differs: {', '.join(mismatch + errors)}")
+        print("output identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Startup benchmark for `python main.py`.
+
+Reports how long importing cdk8s and the imports/k8s bindings take, and the
+total time to run main.py, as medians over --runs fresh interpreters. With
+--compare, the imports directory of another git revision is benchmarked too,
+e.g. to see the effect of `python -m tools.k8s_codegen lazy`:
+
+    python -m tools.bench_import --compare HEAD~1
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import typing
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SNIPPET = """
+import json, runpy, time
+from lib.jsii_startup import use_package_cache
+use_package_cache()
+start = time.perf_counter()
+import cdk8s
+cdk8s_loaded = time.perf_counter()
+from imports import k8s
+k8s_loaded = time.perf_counter()
+runpy.run_path("main.py", run_name="__main__")
+done = time.perf_counter()
+print(json.dumps({"cdk8s": cdk8s_loaded - start, "k8s": k8s_loaded - cdk8s_loaded,
+                  "main": done - k8s_loaded, "total": done - start}))
+"""
+
+
+def run(workdir: str, runs: int) -> typing.Dict[str, float]:
+    samples = []
+    env = dict(os.environ, JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION="1")
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", _SNIPPET], cwd=workdir, env=env)
+        samples.append(json.loads(output.decode().strip().splitlines()[-1]))
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def workdir_for(imports: str, tmp: str, name: str) -> str:
+    # main.py writes to dist/ in the working directory, so every variant runs
+    # in a scratch directory of its own
+    workdir = os.path.join(tmp, name)
+    os.makedirs(workdir)
+    shutil.copy(os.path.join(APP_DIR, "main.py"), workdir)
+    os.symlink(os.path.join(APP_DIR, "lib"), os.path.join(workdir, "lib"))
+    os.symlink(imports, os.path.join(workdir, "imports"))
+    return workdir
+
+
+def checkout_imports(rev: str, tmp: str) -> str:
+    target = os.path.join(tmp, "rev-imports")
+    os.makedirs(target)
+    archive = subprocess.check_output(["git", "archive", "--format=tar", rev, "imports"], cwd=APP_DIR)
+    subprocess.run(["tar", "-x", "-C", target], input=archive, check=True)
+    return os.path.join(target, "imports")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--compare", metavar="REV", help="also benchmark the imports of this git revision")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = [("working tree", workdir_for(os.path.join(APP_DIR, "imports"), tmp, "current"))]
+        if args.compare:
+            variants.insert(0, (args.compare, workdir_for(checkout_imports(args.compare, tmp), tmp, "rev")))
+        print(f"{'imports':<16}{'cdk8s':>10}{'k8s':>10}{'main.py':>10}{'total':>10}   (ms, median of {args.runs})")
+        for name, workdir in variants:
+            result = run(workdir, args.runs)
+            print(f"{name:<16}" + "".join(f"{result[key] * 1000:>10.0f}" for key in ("cdk8s", "k8s", "main", "total")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Benchmark for lib/incremental.py.
+
+Synthesizes an app of --charts tenant charts into a scratch dist/ three
+times: from scratch, again without changes, and with the arguments of one
+chart changed. It reports how long each run took and how many charts were
+built and files written:
+
+    python -m tools.bench_incremental --charts 100 --backend cdk8s
+"""
+import argparse
+import os
+import tempfile
+import time
+import typing
+
+from lib.jsii_startup import use_package_cache
+
+use_package_cache()
+
+import cdk8s  # noqa: E402
+from lib import emitter  # noqa: E402
+from lib.incremental import IncrementalApp  # noqa: E402
+from tools import bench_emitter  # noqa: E402
+
+
+def tenant_chart(scope: typing.Any, id: str, objects: int) -> None:
+    if isinstance(scope, emitter.App):
+        chart = emitter.Chart(scope, id, namespace=id)
+        bench_emitter.build(chart, lambda name: getattr(emitter.kinds, name), objects,
+                            emitter.int_or_string, emitter.quantity)
+    else:
+        chart = cdk8s.Chart(scope, id, namespace=id)
+        bench_emitter.build(chart, lambda name: getattr(bench_emitter.k8s, name), objects,
+                            bench_emitter.int_or_string_of, bench_emitter.quantity_of)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--charts", type=int, default=100)
+    parser.add_argument("--objects", type=int, default=30, help="objects per chart")
+    parser.add_argument("--backend", choices=("cdk8s", "emitter"), default="cdk8s")
+    args = parser.parse_args()
+
+    app_type = cdk8s.App if args.backend == "cdk8s" else emitter.App
+    with tempfile.TemporaryDirectory() as outdir:
+        print(f"{'run':<16}{'seconds':>10}{'built':>8}{'written':>9}   ({args.charts} charts, {args.backend})")
+        for run, changed in (("cold", None), ("no change", None), ("one changed", args.charts // 2)):
+            app = IncrementalApp(app_type, outdir=outdir)
+            for i in range(args.charts):
+                app.add_chart(tenant_chart, f"tenant-{i}", args.objects + (3 if i == changed else 0))
+            start = time.perf_counter()
+            result = app.synth()
+            elapsed = time.perf_counter() - start
+            print(f"{run:<16}{elapsed:>10.2f}{len(result.built):>8}{len(result.written):>9}")
+        assert len(os.listdir(outdir)) == args.charts + 1
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Benchmark for tools/manifest_diff.py.
+
+Synthesizes --charts charts of the objects of tools/bench_emitter.py into a
+scratch dist/, copies it and changes the image of --changed Deployments in the
+copy. Then it compares the two with manifest_diff, with a diff that parses
+every manifest, and with `diff -r`, and reports how long each took:
+
+    python -m tools.bench_manifest_diff --charts 100 --objects 300 --changed 10
+"""
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+
+from lib.jsii_startup import use_package_cache
+
+use_package_cache()
+
+os.environ.setdefault("CDK8S_TYPECHECK", "0")
+
+from lib import emitter  # noqa: E402
+from tools import manifest_diff  # noqa: E402
+from tools.bench_emitter import build  # noqa: E402
+
+_IMAGE = re.compile(rb"image: nginx:1\.")
+
+
+def change_images(root: str, count: int) -> int:
+    """Changes the image of the first count Deployments under root, one per
+    file, returns how many it changed."""
+    changed = 0
+    for name in sorted(os.listdir(root)):
+        if changed == count:
+            break
+        path = os.path.join(root, name)
+        with open(path, "rb") as f:
+            text = f.read()
+        text, found = _IMAGE.subn(b"image: nginx:2.", text, count=1)
+        if found:
+            with open(path, "wb") as f:
+                f.write(text)
+            changed += 1
+    return changed
+
+
+def parse_all(old: str, new: str) -> int:
+    # what a diff that parses everything does: every manifest, by key
+    def objects(root: str):
+        return {manifest_diff._step("", manifest, [])[1:5]: manifest
+                for document in manifest_diff.read_documents(root)
+                for manifest in [manifest_diff.yaml.load(document, Loader=manifest_diff.LOADER)]}
+
+    before, after = objects(old), objects(new)
+    return sum(1 for key in before.keys() | after.keys() if before.get(key) != after.get(key))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--charts", type=int, default=100)
+    parser.add_argument("--objects", type=int, default=300, help="objects per chart")
+    parser.add_argument("--changed", type=int, default=10, help="Deployments to change")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old, new = os.path.join(tmp, "old"), os.path.join(tmp, "new")
+        app = emitter.App(outdir=old)
+        for i in range(args.charts):
+            build(emitter.Chart(app, f"tenant-{i}", namespace=f"tenant-{i}"), lambda name: getattr(emitter.kinds, name),
+                  args.objects, emitter.int_or_string, emitter.quantity)
+        app.synth()
+        shutil.copytree(old, new)
+        changed = change_images(new, args.changed)
+        size = sum(os.path.getsize(os.path.join(old, name)) for name in os.listdir(old))
+
+        print(f"{'diff':<16}{'seconds':>9}{'changed':>9}   ({size / 2 ** 20:.0f} MB, "
+              f"{args.charts * (args.objects // 3 * 3)} objects, {changed} changed)")
+        start = time.perf_counter()
+        plan = manifest_diff.diff_documents(manifest_diff.read_documents(old), manifest_diff.read_documents(new))
+        print(f"{'manifest_diff':<16}{time.perf_counter() - start:>9.2f}{len(plan.steps):>9}")
+        start = time.perf_counter()
+        found = parse_all(old, new)
+        print(f"{'parse all':<16}{time.perf_counter() - start:>9.2f}{found:>9}")
+        start = time.perf_counter()
+        output = subprocess.run(["diff", "-r", old, new], stdout=subprocess.PIPE).stdout
+        print(f"{'diff -r':<16}{time.perf_counter() - start:>9.2f}{output.count(b'---'):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Speedup of emitter.App.synth(workers=N) over the number of processes.
+
+Builds --charts charts of --objects objects each (the objects of
+tools/bench_emitter.py, one chart per namespace), synthesizes them with every
+--workers count, checks that every run wrote the same files as the first one,
+and reports the time and speedup of each:
+
+    python -m tools.bench_parallel --charts 300 --workers 1 2 4 8
+"""
+import argparse
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+from lib.jsii_startup import use_package_cache
+
+use_package_cache()
+
+os.environ.setdefault("CDK8S_TYPECHECK", "0")
+
+from lib import emitter  # noqa: E402
+from tools.bench_emitter import build  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--charts", type=int, default=300)
+    parser.add_argument("--objects", type=int, default=30, help="objects per chart")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, 8, os.cpu_count() or 1} & set(range(1, (os.cpu_count() or 1) + 1))))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = emitter.App(outdir=tmp)
+        for i in range(args.charts):
+            build(emitter.Chart(app, f"tenant-{i}", namespace=f"tenant-{i}"), lambda name: getattr(emitter.kinds, name),
+                  args.objects, emitter.int_or_string, emitter.quantity)
+
+        print(f"{'workers':>8}{'synth s':>10}{'speedup':>10}   ({args.charts} charts, {os.cpu_count()} cores)")
+        baseline = None
+        for workers in args.workers:
+            app.outdir = os.path.join(tmp, f"workers-{workers}")
+            start = time.perf_counter()
+            app.synth(workers=workers)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = (app.outdir, elapsed)
+            else:
+                files = os.listdir(baseline[0])
+                _, mismatch, errors = filecmp.cmpfiles(baseline[0], app.outdir, files, shallow=False)
+                if mismatch or errors or len(os.listdir(app.outdir)) != len(files):
+                    sys.exit(f"output of {workers} workers differs: {', '.join(mismatch + errors)}")
+            print(f"{workers:>8}{elapsed:>10.2f}{baseline[1] / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Benchmark for lib/rightsizing.py.
+
+Writes a CSV of --samples usage samples of --workloads Deployments, which
+each request 500m and 512Mi, then reads it with load_usage, computes the
+requests and limits with recommend and sets them on a chart of those
+Deployments with Rightsizing, and reports how long each step took and the
+projected nodes:
+
+    python -m tools.bench_rightsizing --samples 3000000 --workloads 300
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from lib.jsii_startup import use_package_cache
+
+use_package_cache()
+
+os.environ.setdefault("CDK8S_TYPECHECK", "0")
+
+import numpy as np  # noqa: E402
+from cdk8s import App, Chart  # noqa: E402
+
+from imports import k8s  # noqa: E402
+from lib.rightsizing import Rightsizing, load_usage, recommend  # noqa: E402
+
+
+def write_usage(path: str, samples: int, workloads: int) -> None:
+    random = np.random.default_rng(0)
+    workload = random.integers(0, workloads, samples)
+    # every workload has its own load around its own mean
+    cpu = random.gamma(2, 0.01 + workload % 50 * 0.002)
+    memory = random.normal(100 + workload % 50 * 4, 5) * 2 ** 20
+    with open(path, "w") as f:
+        f.write("timestamp,namespace,workload,container,cpu,memory\n")
+        for start in range(0, samples, 1000000):
+            rows = slice(start, start + 1000000)
+            np.savetxt(f, np.column_stack([
+                1700000000 + np.arange(samples)[rows] * 15, np.char.add("ns-", (workload[rows] % 7).astype(str)),
+                np.char.add("web-", workload[rows].astype(str)), np.full(len(workload[rows]), "app"),
+                cpu[rows].round(4), memory[rows].astype(np.int64)]), fmt="%s", delimiter=",")
+
+
+def deployment(chart: Chart, i: int) -> None:
+    labels = {"app": f"web-{i}"}
+    resources = k8s.ResourceRequirements(requests={"cpu": k8s.Quantity.from_string("500m"),
+                                                   "memory": k8s.Quantity.from_string("512Mi")})
+    k8s.KubeDeployment(chart, f"web-{i}", metadata=k8s.ObjectMeta(name=f"web-{i}", namespace=f"ns-{i % 7}"),
+                       spec=k8s.DeploymentSpec(
+                           replicas=3,
+                           selector=k8s.LabelSelector(match_labels=labels),
+                           template=k8s.PodTemplateSpec(
+                               metadata=k8s.ObjectMeta(labels=labels),
+                               spec=k8s.PodSpec(containers=[
+                                   k8s.Container(name="app", image="nginx", resources=resources)]))))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=3000000)
+    parser.add_argument("--workloads", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "usage.csv")
+        write_usage(path, args.samples, args.workloads)
+        size = os.path.getsize(path)
+
+        app = App(outdir=tmp)
+        chart = Chart(app, "bench")
+        for i in range(args.workloads):
+            deployment(chart, i)
+
+        print(f"{'step':<16}{'seconds':>9}   ({args.samples} samples, {size / 2 ** 20:.0f} MB, "
+              f"{args.workloads} workloads)")
+        start = time.perf_counter()
+        usage = load_usage(path)
+        print(f"{'load_usage':<16}{time.perf_counter() - start:>9.2f}")
+        start = time.perf_counter()
+        recommend(usage)
+        print(f"{'recommend':<16}{time.perf_counter() - start:>9.2f}")
+        start = time.perf_counter()
+        sizing = Rightsizing(chart, "rightsizing", usage=usage)
+        print(f"{'Rightsizing':<16}{time.perf_counter() - start:>9.2f}")
+        print(sizing.report.format().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    main()
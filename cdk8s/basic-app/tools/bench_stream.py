@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""Peak memory of lib/emitter.py synth, with and without stream=True.
+
+Each run builds and synthesizes the chart of tools/bench_emitter.py with
+--count objects in a fresh interpreter, and reports its peak RSS:
+
+    python -m tools.bench_stream --count 10000 30000 90000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import typing
+
+_SNIPPET = """
+import json, os, resource, sys, time
+os.environ.setdefault("CDK8S_TYPECHECK", "0")
+from lib.jsii_startup import use_package_cache
+use_package_cache()
+from lib import emitter
+from tools.bench_emitter import build
+outdir, count, stream = sys.argv[1], int(sys.argv[2]), sys.argv[3] == "stream"
+start = time.perf_counter()
+app = emitter.App(outdir=outdir, stream=stream)
+build(emitter.Chart(app, "bench"), lambda name: getattr(emitter.kinds, name), count,
+      emitter.int_or_string, emitter.quantity)
+app.synth()
+print(json.dumps({"rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+                  "seconds": time.perf_counter() - start}))
+"""
+
+
+def run(count: int, mode: str) -> typing.Dict[str, float]:
+    env = dict(os.environ, JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION="1")
+    with tempfile.TemporaryDirectory() as outdir:
+        output = subprocess.check_output([sys.executable, "-c", _SNIPPET, outdir, str(count), mode], env=env)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, nargs="+", default=[10000, 30000, 90000], help="numbers of objects")
+    args = parser.parse_args()
+
+    print(f"{'objects':>8}{'memory MB':>12}{'s':>7}{'stream MB':>12}{'s':>7}")
+    for count in args.count:
+        results = [run(count, mode) for mode in ("memory", "stream")]
+        print(f"{count:>8}" + "".join(f"{r['rss'] / 2 ** 20:>12.0f}{r['seconds']:>7.1f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Memory benchmark for the generated k8s structs.
+
+Builds --count pod templates and keeps them, as an app that assembles its
+charts from precomputed props would. Every template has a metadata of its own,
+and its pod spec is one of --variants, built anew each time. Reports the memory
+they take and the time it takes to build them, for the imports in the working
+tree with and without CDK8S_INTERN=1 and, with --compare, for the imports of
+another git revision:
+
+    python -m tools.bench_structs --compare HEAD~1
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import typing
+
+from tools.bench_import import checkout_imports, workdir_for
+
+_SNIPPET = """
+import json, sys, time, tracemalloc
+from lib.jsii_startup import use_package_cache
+use_package_cache()
+from imports import k8s
+count, variants, trace = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3] == "trace"
+port = k8s.IntOrString.from_number(8080)
+cpu, memory = k8s.Quantity.from_string("250m"), k8s.Quantity.from_string("256Mi")
+
+
+def template(i):
+    variant = f"tenant-{i % variants}"
+    return k8s.PodTemplateSpec(
+        metadata=k8s.ObjectMeta(labels={"app": variant, "pod": f"pod-{i}"}),
+        spec=k8s.PodSpec(containers=[k8s.Container(
+            name="web", image="nginx:1.25",
+            env=[k8s.EnvVar(name="TENANT", value=variant)],
+            ports=[k8s.ContainerPort(container_port=8080, name="http")],
+            resources=k8s.ResourceRequirements(limits={"cpu": cpu, "memory": memory}, requests={"cpu": cpu}),
+            readiness_probe=k8s.Probe(http_get=k8s.HttpGetAction(path="/healthz", port=port)),
+        )]),
+    )
+
+
+template(0)
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+templates = [template(i) for i in range(count)]
+elapsed = time.perf_counter() - start
+print(json.dumps({"bytes": tracemalloc.get_traced_memory()[0], "seconds": elapsed}))
+"""
+
+
+def run(workdir: str, count: int, variants: int, intern: bool) -> typing.Dict[str, float]:
+    # tracemalloc slows allocations down, so the time comes from a run without
+    env = dict(os.environ, JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION="1", CDK8S_TYPECHECK="0",
+               CDK8S_INTERN="1" if intern else "0")
+    results = []
+    for mode in ("trace", "time"):
+        output = subprocess.check_output([sys.executable, "-c", _SNIPPET, str(count), str(variants), mode],
+                                         cwd=workdir, env=env)
+        results.append(json.loads(output.decode().strip().splitlines()[-1]))
+    return {"bytes": results[0]["bytes"], "seconds": results[1]["seconds"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50000, help="pod templates")
+    parser.add_argument("--variants", type=int, default=100, help="distinct pod specs among them")
+    parser.add_argument("--compare", metavar="REV", help="also benchmark the imports of this git revision")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        current = workdir_for(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "imports"),
+                              tmp, "current")
+        variants = [("working tree", current, False), ("CDK8S_INTERN=1", current, True)]
+        if args.compare:
+            variants.insert(0, (args.compare, workdir_for(checkout_imports(args.compare, tmp), tmp, "rev"), False))
+        print(f"{'imports':<16}{'MB':>8}{'bytes/pod':>11}{'seconds':>9}   ({args.count} pod templates)")
+        for name, workdir, intern in variants:
+            result = run(workdir, args.count, args.variants, intern)
+            print(f"{name:<16}{result['bytes'] / 2 ** 20:>8.1f}{result['bytes'] / args.count:>11.0f}"
+                  f"{result['seconds']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
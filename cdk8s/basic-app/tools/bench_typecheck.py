@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Synth benchmark for the constructor type checks in imports/k8s.
+
+Builds a chart of --count Deployments shaped like the one in main.py and
+synthesizes it, once with the typeguard checks on (the default) and then with
+CDK8S_TYPECHECK=0, where the chart is checked afterwards with
+lib.validation.check_types or, in one pass over all manifests, with
+lib.validation.check_schema instead. Each mode runs in a fresh interpreter:
+
+    python -m tools.bench_typecheck --count 10000 --workers 4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import typing
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SNIPPET = """
+import json, sys, time
+from cdk8s import App, Chart
+from imports import k8s
+from lib.validation import check_schema, check_types
+
+count, outdir, validate, workers = int(sys.argv[1]), sys.argv[2], sys.argv[3], int(sys.argv[4])
+start = time.perf_counter()
+app = App(outdir=outdir)
+chart = Chart(app, "bench")
+for i in range(count):
+    labels = {"app": f"app-{i}"}
+    k8s.KubeDeployment(chart, f"deployment-{i}", spec=k8s.DeploymentSpec(
+        replicas=3,
+        selector=k8s.LabelSelector(match_labels=labels),
+        template=k8s.PodTemplateSpec(
+            metadata=k8s.ObjectMeta(labels=labels),
+            spec=k8s.PodSpec(containers=[k8s.Container(
+                name="app-container", image="nginx:1.19.10", ports=[k8s.ContainerPort(container_port=80)])]))))
+built = time.perf_counter()
+if validate == "types":
+    errors = check_types(app)
+elif validate == "schema":
+    errors = check_schema(app, workers=workers)
+else:
+    errors = []
+validated = time.perf_counter()
+app.synth()
+done = time.perf_counter()
+print(json.dumps({"construct": built - start, "validate": validated - built,
+                  "synth": done - validated, "total": done - start, "errors": len(errors)}))
+"""
+
+
+def run(count: int, validate: str, outdir: str, workers: int = 0) -> typing.Dict[str, float]:
+    env = dict(os.environ, JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION="1",
+               CDK8S_TYPECHECK="1" if validate == "none" else "0", PYTHONPATH=APP_DIR)
+    output = subprocess.check_output([sys.executable, "-c", _SNIPPET, str(count), outdir, validate, str(workers)],
+                                     cwd=APP_DIR, env=env)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10000, help="Deployments to synthesize (default: %(default)s)")
+    parser.add_argument("--workers", type=int, nargs="*", default=[],
+                        help="also run check_schema in pools of these sizes")
+    args = parser.parse_args()
+
+    print(f"{'mode':<28}{'construct':>10}{'validate':>10}{'synth':>10}{'total':>10}   (s, {args.count} Deployments)")
+    with tempfile.TemporaryDirectory() as tmp:
+        modes = [("typecheck", "none", 0), ("CDK8S_TYPECHECK=0 + check", "types", 0),
+                 ("CDK8S_TYPECHECK=0 + schema", "schema", 0)]
+        modes.extend((f"  ... {workers} workers", "schema", workers) for workers in args.workers)
+        for name, validate, workers in modes:
+            result = run(args.count, validate, os.path.join(tmp, f"{validate}-{workers}"), workers)
+            if result["errors"]:
+                raise SystemExit(f"{name} reported {result['errors']} errors")
+            print(f"{name:<28}" + "".join(f"{result[key]:>10.2f}" for key in ("construct", "validate", "synth", "total")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+"""A fake Kubernetes API server, for tests and benchmarks of tools/apply_batches.py.
+
+Keeps objects in memory and serves what apply_batches uses: discovery of the
+built-in kinds and of established CRDs, server-side apply (a PATCH of
+application/apply-patch+yaml) and GET of single objects. Like a real API
+server, it rejects objects in namespaces that do not exist and custom
+resources of CRDs that are not established. It keeps the field manager of
+every object, and an apply by another manager is a conflict unless it forces,
+as if the two managers set the same fields. A CRD is established
+establish_delay seconds after it is applied, and every response waits latency
+seconds, to stand in for the round trip to a cluster:
+
+    with FakeApiServer(latency=0.005) as server:
+        apply_batches(pack(manifests), server.url)
+
+It also runs on its own, for a try of apply_batches without a cluster:
+
+    python -m tools.fake_apiserver --port 8001
+"""
+import argparse
+import http.server
+import json
+import threading
+import time
+import typing
+import urllib.parse
+
+# (group version, kind, plural, namespaced)
+_BUILTIN = [
+    ("v1", "Namespace", "namespaces", False), ("v1", "ConfigMap", "configmaps", True),
+    ("v1", "Secret", "secrets", True), ("v1", "Service", "services", True),
+    ("v1", "ServiceAccount", "serviceaccounts", True), ("v1", "Pod", "pods", True),
+    ("v1", "PersistentVolume", "persistentvolumes", False),
+    ("v1", "PersistentVolumeClaim", "persistentvolumeclaims", True), ("v1", "LimitRange", "limitranges", True),
+    ("v1", "ResourceQuota", "resourcequotas", True),
+    ("apps/v1", "Deployment", "deployments", True), ("apps/v1", "StatefulSet", "statefulsets", True),
+    ("apps/v1", "DaemonSet", "daemonsets", True), ("apps/v1", "ReplicaSet", "replicasets", True),
+    ("batch/v1", "Job", "jobs", True), ("batch/v1", "CronJob", "cronjobs", True),
+    ("autoscaling/v2", "HorizontalPodAutoscaler", "horizontalpodautoscalers", True),
+    ("policy/v1", "PodDisruptionBudget", "poddisruptionbudgets", True),
+    ("networking.k8s.io/v1", "Ingress", "ingresses", True),
+    ("networking.k8s.io/v1", "IngressClass", "ingressclasses", False),
+    ("networking.k8s.io/v1", "NetworkPolicy", "networkpolicies", True),
+    ("rbac.authorization.k8s.io/v1", "ClusterRole", "clusterroles", False),
+    ("rbac.authorization.k8s.io/v1", "ClusterRoleBinding", "clusterrolebindings", False),
+    ("rbac.authorization.k8s.io/v1", "Role", "roles", True),
+    ("rbac.authorization.k8s.io/v1", "RoleBinding", "rolebindings", True),
+    ("storage.k8s.io/v1", "StorageClass", "storageclasses", False),
+    ("scheduling.k8s.io/v1", "PriorityClass", "priorityclasses", False),
+    ("apiextensions.k8s.io/v1", "CustomResourceDefinition", "customresourcedefinitions", False),
+]
+_APPLY = "application/apply-patch+yaml"
+
+# (group, plural, namespace, name), namespace "" for cluster scoped objects
+ObjectKey = typing.Tuple[str, str, str, str]
+
+
+class FakeApiServer:
+    """See the module docstring. requests lists the method and path of every
+    request, objects every object applied and managers their field managers."""
+
+    def __init__(self, latency: float = 0.0, establish_delay: float = 0.0, port: int = 0):
+        self.latency = latency
+        self.establish_delay = establish_delay
+        self.requests: typing.List[typing.Tuple[str, str]] = []
+        self.objects: typing.Dict[ObjectKey, typing.Dict[str, typing.Any]] = {}
+        self.managers: typing.Dict[ObjectKey, str] = {}
+        # group version -> plural -> (kind, namespaced)
+        self._resources: typing.Dict[str, typing.Dict[str, typing.Tuple[str, bool]]] = {}
+        for group_version, kind, plural, namespaced in _BUILTIN:
+            self._resources.setdefault(group_version, {})[plural] = (kind, namespaced)
+        # CRD name -> when it is established
+        self._establishing: typing.Dict[str, float] = {}
+        self._lock = threading.Lock()
+        for name in ("default", "kube-system"):
+            self.objects[("", "namespaces", "", name)] = {
+                "apiVersion": "v1", "kind": "Namespace", "metadata": {"name": name}}
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", port), _handler(self))
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def __enter__(self) -> "FakeApiServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: typing.Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def handle(self, method: str, url: str, content_type: str,
+               body: bytes) -> typing.Tuple[int, typing.Dict[str, typing.Any]]:
+        time.sleep(self.latency)
+        path, _, query = url.partition("?")
+        with self._lock:
+            self.requests.append((method, path))
+            self._establish()
+            parts = [urllib.parse.unquote(part) for part in path.strip("/").split("/")]
+            if parts[:2] == ["api", "v1"]:
+                group_version, rest = "v1", parts[2:]
+            elif parts[:1] == ["apis"] and len(parts) >= 3:
+                group_version, rest = "/".join(parts[1:3]), parts[3:]
+            else:
+                return _status(404, f"the server could not find the requested resource {path}")
+            resources = self._resources.get(group_version)
+            if resources is None:
+                return _status(404, f"the server could not find the requested resource {path}")
+            if not rest and method == "GET":
+                return 200, {"kind": "APIResourceList", "groupVersion": group_version, "resources": [
+                    {"name": plural, "kind": kind, "namespaced": namespaced}
+                    for plural, (kind, namespaced) in resources.items()]}
+            namespace = ""
+            if len(rest) == 4 and rest[0] == "namespaces":
+                namespace, rest = rest[1], rest[2:]
+            if len(rest) != 2 or rest[0] not in resources:
+                return _status(404, f"the server could not find the requested resource {path}")
+            (kind, namespaced), (plural, name) = resources[rest[0]], rest
+            if namespaced != bool(namespace):
+                return _status(404, f"the server could not find the requested resource {path}")
+            key = (group_version.rpartition("/")[0], plural, namespace, name)
+            if method == "GET":
+                if key not in self.objects:
+                    return _status(404, f'{plural} "{name}" not found')
+                return 200, self.objects[key]
+            if method != "PATCH":
+                return _status(405, f"{method} is not supported")
+            return self._apply(key, kind, group_version, content_type, urllib.parse.parse_qs(query), body)
+
+    def _apply(self, key: ObjectKey, kind: str, group_version: str, content_type: str,
+               query: typing.Dict[str, typing.List[str]],
+               body: bytes) -> typing.Tuple[int, typing.Dict[str, typing.Any]]:
+        group, plural, namespace, name = key
+        if content_type != _APPLY:
+            return _status(415, f"the body of the request was in an unknown format - accepted media types include: "
+                                f"{_APPLY}")
+        if not query.get("fieldManager"):
+            return _status(422, "fieldManager is required for apply requests")
+        manager = query["fieldManager"][0]
+        if key in self.managers and self.managers[key] != manager and query.get("force") != ["true"]:
+            return _status(409, f'Apply failed with 1 conflict: conflict with "{self.managers[key]}"')
+        try:
+            manifest = json.loads(body)
+        except ValueError:
+            return _status(400, "the request body is not JSON")
+        metadata = manifest.get("metadata") or {}
+        if not namespace:
+            # cluster scoped, the namespace of the object is ignored
+            metadata.pop("namespace", None)
+        if manifest.get("apiVersion") != group_version or manifest.get("kind") != kind or \
+                metadata.get("name") != name or (metadata.get("namespace") or namespace) != namespace:
+            return _status(400, f"the object does not match {group_version} {kind} {namespace}/{name}")
+        if namespace and ("", "namespaces", "", namespace) not in self.objects:
+            return _status(404, f'namespaces "{namespace}" not found')
+        created = key not in self.objects
+        self.objects[key] = manifest
+        self.managers[key] = manager
+        if kind == "CustomResourceDefinition" and created:
+            self._establishing[name] = time.monotonic() + self.establish_delay
+            self._establish()
+        return (201 if created else 200), manifest
+
+    def _establish(self) -> None:
+        now = time.monotonic()
+        for name, when in list(self._establishing.items()):
+            if when > now:
+                continue
+            del self._establishing[name]
+            crd = self.objects[("apiextensions.k8s.io", "customresourcedefinitions", "", name)]
+            spec = crd["spec"]
+            for version in spec.get("versions", []):
+                self._resources.setdefault(f"{spec['group']}/{version['name']}", {})[spec["names"]["plural"]] = (
+                    spec["names"]["kind"], spec.get("scope") == "Namespaced")
+            crd["status"] = {"conditions": [{"type": "Established", "status": "True"}]}
+
+
+def _status(code: int, message: str) -> typing.Tuple[int, typing.Dict[str, typing.Any]]:
+    return code, {"kind": "Status", "apiVersion": "v1", "status": "Failure", "message": message, "code": code}
+
+
+def _handler(server: FakeApiServer) -> typing.Type[http.server.BaseHTTPRequestHandler]:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        # keeps connections open, as a real API server does; without Nagle's
+        # algorithm, or the body written after the headers waits for a
+        # delayed ACK
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _serve(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            status, response = server.handle(self.command, self.path, self.headers.get("Content-Type", ""), body)
+            data = json.dumps(response).encode()
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            except (BrokenPipeError, ConnectionResetError):
+                # the client timed out and closed the connection
+                self.close_connection = True
+
+        do_GET = do_PATCH = do_POST = do_PUT = do_DELETE = _serve
+
+        def log_message(self, *args: typing.Any) -> None:
+            pass
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args()
+
+    server = FakeApiServer(latency=args.latency, port=args.port)
+    print(f"serving on {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Maintenance of the jsii package cache in .jsii-cache, see lib/jsii_startup.py.
+
+`warm` loads every assembly main.py uses and waits until the kernel has cached
+and indexed them, e.g. after `pipenv install`, `cdk8s import`, or restoring the
+directory from a CI cache. `timings` reports how long a fresh process spends
+starting the kernel and loading each assembly, as medians over --runs runs:
+
+    python -m tools.jsii_cache warm
+    python -m tools.jsii_cache timings
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_WARM = """
+import sys
+from lib.jsii_startup import use_package_cache, wait_for_index
+use_package_cache()
+import cdk8s
+from imports import k8s
+missing = wait_for_index(["constructs", "cdk8s", "k8s"])
+if missing:
+    sys.exit(f"timed out indexing {', '.join(missing)}")
+"""
+
+_TIMINGS = """
+import json
+from lib.jsii_startup import time_startup, use_package_cache
+use_package_cache()
+timings = time_startup()
+import cdk8s
+from imports import k8s
+print(json.dumps(dict(timings.assemblies, kernel=timings.kernel)))
+"""
+
+
+def run(snippet: str) -> str:
+    env = dict(os.environ, JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION="1", PYTHONPATH=APP_DIR)
+    return subprocess.check_output([sys.executable, "-c", snippet], cwd=APP_DIR, env=env).decode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("warm", help="cache and index the assemblies main.py loads")
+    timings = commands.add_parser("timings", help="report kernel start and assembly load times")
+    timings.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == "warm":
+        run(_WARM)
+        return
+    samples = [json.loads(run(_TIMINGS).strip().splitlines()[-1]) for _ in range(args.runs)]
+    medians = {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+    print(f"{'kernel start':<16}{medians.pop('kernel') * 1000:>8.0f} ms")
+    for name, seconds in medians.items():
+        print(f"{name:<16}{seconds * 1000:>8.0f} ms")
+    print(f"(median of {args.runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,575 @@
+#!/usr/bin/env python
+"""Post-processing for the Python bindings `cdk8s import` generates in imports/k8s.
+
+`cdk8s import` writes every Kubernetes type into a single module, so
+`from imports import k8s` executes all of it even when a chart only uses a
+handful of kinds. The `lazy` command splits that module into one submodule per
+class under imports/k8s/_kinds, each importing only the classes it references,
+and replaces imports/k8s/__init__.py with a module level __getattr__ that
+imports a class the first time it is used:
+
+    cdk8s import && python -m tools.k8s_codegen lazy
+
+The `slim` command then removes every class that the chart sources do not
+reference, directly or through the classes they do, along with the modules
+that hold them:
+
+    python -m tools.k8s_codegen slim main.py lib --kinds KubeService
+
+The `if __debug__:` type checks in the generated constructors are rewritten to
+test imports.k8s._base.TYPECHECK instead, so they can be turned off without
+python -O, see _TYPECHECK. Structs keep their fields in __slots__ rather than a
+dict per instance and can be interned, see _slotted and _STRUCT.
+imports/k8s/_manifest.py describes the JSON the
+JavaScript side renders for lib/emitter.py, see Converters.
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import re
+import shutil
+import tarfile
+import typing
+
+# Marks modules written by this tool, so they are never used as a source
+GENERATED_MARKER = "# Generated by tools/k8s_codegen.py"
+
+
+class Bindings:
+    """The top level statements of a generated bindings module, by kind."""
+
+    def __init__(self, source: str):
+        tree = ast.parse(source)
+        lines = source.splitlines()
+
+        def segment(node: ast.stmt) -> str:
+            start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+            return "\n".join(lines[start - 1:node.end_lineno])
+
+        self.preamble: typing.List[str] = []
+        self.classes: typing.Dict[str, str] = {}
+        self.stubs: typing.Dict[str, str] = {}
+        self.all: typing.List[str] = []
+        refs: typing.Dict[str, typing.Set[str]] = {}
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.classes[node.name] = segment(node)
+                refs[node.name] = _references(node)
+            elif isinstance(node, ast.FunctionDef) and node.name.startswith("_typecheckingstub__"):
+                self.stubs[node.name] = segment(node)
+                refs[node.name] = _references(node)
+            elif isinstance(node, ast.Assign) and _target(node) == "__all__":
+                self.all = ast.literal_eval(node.value)
+            elif not self.classes:
+                self.preamble.append(segment(node))
+
+        # each stub belongs to the one class whose constructor checks against it
+        self.class_stubs: typing.Dict[str, typing.List[str]] = {
+            name: [stub for stub in self.stubs if stub in refs[name]] for name in self.classes
+        }
+        self.dependencies: typing.Dict[str, typing.Set[str]] = {}
+        for name in self.classes:
+            names = set(refs[name])
+            for stub in self.class_stubs[name]:
+                names |= refs[stub]
+            self.dependencies[name] = (names & self.classes.keys()) - {name}
+
+    @classmethod
+    def load(cls, path: str) -> "Bindings":
+        with open(path) as f:
+            source = f.read()
+        if source.startswith(GENERATED_MARKER):
+            raise SystemExit(f"{path} was written by this tool, run `cdk8s import` first "
+                             "or pass the module it generated with --source")
+        return cls(source)
+
+    def base_names(self) -> typing.List[str]:
+        """Names the preamble defines, which every class module imports."""
+        names = []
+        for statement in self.preamble:
+            for node in ast.parse(statement).body:
+                if isinstance(node, (ast.Import, ast.ImportFrom)):
+                    if isinstance(node, ast.ImportFrom) and (node.level or node.module == "pkgutil"):
+                        continue
+                    names.extend((alias.asname or alias.name).split(".")[0] for alias in node.names)
+                elif isinstance(node, ast.FunctionDef):
+                    names.append(node.name)
+                elif isinstance(node, ast.Assign) and _target(node) != "__path__":
+                    names.append(_target(node))
+        return names
+
+    def dependencies_of(self, group: typing.List[str]) -> typing.Set[str]:
+        return {dep for name in group for dep in self.dependencies[name]} - set(group)
+
+    def groups(self) -> typing.List[typing.List[str]]:
+        """Classes that have to share a module because they reference each other,
+        in an order where every group comes after the groups it depends on."""
+        order = {name: i for i, name in enumerate(self.classes)}
+        return [sorted(group, key=order.__getitem__)
+                for group in _strongly_connected(self.classes, self.dependencies)]
+
+
+class Converters:
+    """What the toJson_<Struct> functions of the JavaScript module in the assembly
+    tarball write: the JSON fields of every struct in order, each with the
+    struct it holds, and the apiVersion and kind of every API object."""
+
+    _FUNCTION = re.compile(r"^function toJson_(\w+)\(obj\) \{\n(.*?)^\}", re.M | re.S)
+    _FIELD = re.compile(r"^        '([^']+)': (.*),$", re.M)
+    _GVK = re.compile(r"^(\w+)\.GVK = \{\n    apiVersion: '([^']*)',\n    kind: '([^']*)',\n\};", re.M)
+
+    def __init__(self, script: str):
+        self.fields: typing.Dict[str, typing.List[typing.Tuple[str, str]]] = {}
+        for function in self._FUNCTION.finditer(script):
+            self.fields[function.group(1)] = [(name, _field_type(expression))
+                                              for name, expression in self._FIELD.findall(function.group(2))]
+        self.gvk = {match.group(1): (match.group(2), match.group(3)) for match in self._GVK.finditer(script)}
+
+    @classmethod
+    def load(cls, tarball: str) -> "Converters":
+        with tarfile.open(tarball) as archive:
+            package = json.load(archive.extractfile("package/package.json"))
+            script = archive.extractfile(os.path.normpath(os.path.join("package", package["main"]))).read()
+        return cls(script.decode())
+
+    @classmethod
+    def from_manifest(cls, path: str) -> "Converters":
+        """The converters a _manifest.py written by write_manifest describes."""
+        converters = cls("")
+        with open(path) as f:
+            for node in ast.parse(f.read()).body:
+                if isinstance(node, ast.Assign) and _target(node) == "GVK":
+                    converters.gvk = ast.literal_eval(node.value)
+                elif isinstance(node, ast.Assign) and _target(node) == "FIELDS":
+                    converters.fields = {name: list(fields) for name, fields in ast.literal_eval(node.value).items()}
+        return converters
+
+
+class LazyPackage:
+    """A package written by write_lazy: the module of every class, and the
+    modules every module imports from."""
+
+    def __init__(self, out: str):
+        self.out = out
+        with open(os.path.join(out, "__init__.py")) as f:
+            source = f.read()
+        if not source.startswith(GENERATED_MARKER):
+            raise SystemExit(f"{out} was not written by this tool, run `python -m tools.k8s_codegen lazy` first")
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.Assign) and _target(node) == "_KINDS":
+                self.module_of: typing.Dict[str, str] = ast.literal_eval(node.value)
+            elif isinstance(node, ast.Assign) and _target(node) == "__all__":
+                self.all: typing.List[str] = ast.literal_eval(node.value)
+        self.imports: typing.Dict[str, typing.Set[str]] = {}
+        for module in set(self.module_of.values()):
+            with open(self.path_of(module)) as f:
+                tree = ast.parse(f.read())
+            self.imports[module] = {node.module for node in tree.body
+                                    if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module}
+
+    def path_of(self, module: str) -> str:
+        return os.path.join(self.out, "_kinds", f"{module}.py")
+
+    def closure(self, names: typing.Iterable[str]) -> typing.Set[str]:
+        """The classes in the modules that names need, names included."""
+        todo = [self.module_of[name] for name in names]
+        modules: typing.Set[str] = set()
+        while todo:
+            module = todo.pop()
+            if module not in modules:
+                modules.add(module)
+                todo.extend(self.imports[module])
+        return {name for name, module in self.module_of.items() if module in modules}
+
+
+def used_names(paths: typing.Iterable[str]) -> typing.Set[str]:
+    """Every name and attribute in the Python files under paths, e.g.
+    KubeDeployment for k8s.KubeDeployment or emitter.kinds.KubeDeployment."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(glob.glob(os.path.join(path, "**", "*.py"), recursive=True))
+        else:
+            files.append(path)
+    names = set()
+    for path in files:
+        with open(path) as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute):
+                names.add(node.attr)
+            elif isinstance(node, ast.Name):
+                names.add(node.id)
+            elif isinstance(node, ast.alias):
+                names.add(node.asname or node.name)
+    return names
+
+
+def _field_type(expression: str) -> str:
+    # "Struct", "Struct[]" or "Struct{}" for fields the converter recurses into
+    match = re.search(r"toJson_(\w+)\(", expression)
+    if match is None:
+        return ""
+    if expression.startswith("obj.") and "?.map(" in expression:
+        return match.group(1) + "[]"
+    if expression.startswith("((obj."):
+        return match.group(1) + "{}"
+    return match.group(1)
+
+
+def _target(node: ast.Assign) -> typing.Optional[str]:
+    target = node.targets[0]
+    return target.id if isinstance(target, ast.Name) else None
+
+
+def _references(node: ast.AST) -> typing.Set[str]:
+    # names, plus the forward references generated code quotes in annotations
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            names.add(child.id)
+        elif isinstance(child, ast.Constant) and isinstance(child.value, str) and child.value.isidentifier():
+            names.add(child.value)
+    return names
+
+
+def _strongly_connected(nodes: typing.Iterable[str],
+                        edges: typing.Dict[str, typing.Set[str]]) -> typing.List[typing.List[str]]:
+    # iterative Tarjan, components come out dependencies first
+    index: typing.Dict[str, int] = {}
+    low: typing.Dict[str, int] = {}
+    stack: typing.List[str] = []
+    on_stack: typing.Set[str] = set()
+    components = []
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(sorted(edges[root])))]
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(sorted(edges[child]))))
+                elif child in on_stack:
+                    low[node] = min(low[node], index[child])
+                continue
+            work.pop()
+            if work:
+                low[work[-1][0]] = min(low[work[-1][0]], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def _import_from(module: str, names: typing.List[str]) -> str:
+    if len(names) == 1:
+        return f"from {module} import {names[0]}\n"
+    return f"from {module} import (\n" + "".join(f"    {name},\n" for name in names) + ")\n"
+
+
+def write_manifest(converters: Converters, out: str) -> None:
+    with open(os.path.join(out, "_manifest.py"), "w") as f:
+        f.write(_MANIFEST.format(
+            marker=GENERATED_MARKER,
+            gvk="".join(f'    "{name}": ("{api_version}", "{kind}"),\n'
+                        for name, (api_version, kind) in sorted(converters.gvk.items())),
+            fields="".join(f'    "{name}": (\n' + "".join(f'        ("{field}", "{held}"),\n' for field, held in fields) + "    ),\n"
+                           for name, fields in sorted(converters.fields.items())),
+        ))
+
+
+_MANIFEST = '''{marker}, do not edit.
+#
+# The JSON the JavaScript side of these bindings renders, for lib/emitter.py:
+# the apiVersion and kind of every API object, and the fields of every struct
+# in the order its toJson converter writes them, each with the struct the
+# field holds ("Struct", "Struct[]" for arrays, "Struct{{}}" for maps) or "".
+
+GVK = {{
+{gvk}}}
+
+FIELDS = {{
+{fields}}}
+'''
+
+
+def write_lazy(bindings: Bindings, out: str) -> int:
+    """Writes the bindings as a lazily loaded package to out, returns the
+    number of class modules written."""
+    kinds_dir = os.path.join(out, "_kinds")
+    if os.path.isdir(kinds_dir):
+        shutil.rmtree(kinds_dir)
+    os.makedirs(kinds_dir)
+
+    base_names = bindings.base_names()
+    with open(os.path.join(out, "_base.py"), "w") as f:
+        f.write(f"{GENERATED_MARKER}, shared by the modules in _kinds.\n")
+        for statement in bindings.preamble:
+            if "pkgutil" in statement or "__path__" in statement or statement.startswith("from ."):
+                continue
+            f.write(statement + "\n")
+        f.write(_TYPECHECK)
+        f.write(_STRUCT)
+    with open(os.path.join(kinds_dir, "__init__.py"), "w") as f:
+        f.write("")
+
+    module_of: typing.Dict[str, str] = {}
+    groups = bindings.groups()
+    for group in groups:
+        module = group[0]
+        for name in group:
+            module_of[name] = module
+        imports = sorted({module_of[dep] for dep in bindings.dependencies_of(group)})
+        with open(os.path.join(kinds_dir, f"{module}.py"), "w") as f:
+            f.write(f"{GENERATED_MARKER}, do not edit.\n")
+            f.write("from .. import _base\n")
+            f.write(_import_from(".._base", base_names))
+            for dep_module in imports:
+                names = sorted(n for n in bindings.dependencies_of(group) if module_of[n] == dep_module)
+                f.write(_import_from(f".{dep_module}", names))
+            for name in group:
+                segment = _typecheck_switch(bindings.classes[name])
+                if segment.startswith("@jsii.data_type("):
+                    segment = _slotted(name, segment)
+                f.write("\n\n" + segment + "\n")
+            for name in group:
+                for stub in bindings.class_stubs[name]:
+                    f.write("\n" + bindings.stubs[stub] + "\n")
+
+    with open(os.path.join(out, "__init__.py"), "w") as f:
+        f.write(_LAZY_INIT.format(
+            marker=GENERATED_MARKER,
+            kinds="\n".join(f'    "{name}": "{module_of[name]}",' for name in bindings.classes),
+            all="\n".join(f'    "{name}",' for name in bindings.all),
+            type_checking="\n".join(f"    from ._kinds.{module_of[name]} import {name} as {name}"
+                                    for name in bindings.classes),
+        ))
+    return len(groups)
+
+
+def write_slim(package: LazyPackage, keep: typing.Set[str]) -> None:
+    """Removes every class but keep, which has to be a closure, from package."""
+    modules = {package.module_of[name] for name in keep}
+    for module in set(package.module_of.values()) - modules:
+        os.remove(package.path_of(module))
+    kinds = [name for name in package.module_of if name in keep]
+    with open(os.path.join(package.out, "__init__.py"), "w") as f:
+        f.write(_LAZY_INIT.format(
+            marker=GENERATED_MARKER,
+            kinds="\n".join(f'    "{name}": "{package.module_of[name]}",' for name in kinds),
+            all="\n".join(f'    "{name}",' for name in package.all if name in keep),
+            type_checking="\n".join(f"    from ._kinds.{package.module_of[name]} import {name} as {name}"
+                                    for name in kinds),
+        ))
+    manifest = os.path.join(package.out, "_manifest.py")
+    if os.path.exists(manifest):
+        converters = Converters.from_manifest(manifest)
+        converters.gvk = {name: gvk for name, gvk in converters.gvk.items() if name in keep}
+        converters.fields = {name: fields for name, fields in converters.fields.items() if name in keep}
+        write_manifest(converters, package.out)
+
+
+def _typecheck_switch(segment: str) -> str:
+    # the flag is read from the module on every call, so set_typecheck applies
+    # to classes that are already imported
+    return segment.replace("if __debug__:", "if _base.TYPECHECK:")
+
+
+_VALUES = re.compile(
+    r"^        self\._values: typing\.Dict\[builtins\.str, typing\.Any\] = "
+    r"\{(?:\}|\n((?:            \"\w+\": \w+,\n)*)        \})\n"
+    r"((?:        if \w+ is not None:\n            self\._values\[\"\w+\"\] = \w+\n)*)", re.M)
+
+
+def _slotted(name: str, segment: str) -> str:
+    # a slot per field instead of the _values dict, which becomes a property;
+    # slots are prefixed, as the properties have the field names
+    match = _VALUES.search(segment)
+    if match is None or segment.count(f"\nclass {name}:\n") != 1:
+        raise SystemExit(f"{name} does not look like a generated struct")
+    required = re.findall(r"\"(\w+)\": \w+,", match.group(1) or "")
+    optional = re.findall(r"self\._values\[\"(\w+)\"\]", match.group(2))
+    fields = required + optional
+    slots = "".join(f'        "_value_{field}",\n' for field in fields)
+    assignments = "".join(f"        self._value_{field} = {field}\n" for field in fields)
+    values = (
+        "    @builtins.property\n"
+        "    def _values(self) -> typing.Dict[builtins.str, typing.Any]:\n"
+        "        values: typing.Dict[builtins.str, typing.Any] = {"
+        + ("\n" + "".join(f'            "{field}": self._value_{field},\n' for field in required) + "        }\n"
+           if required else "}\n")
+        + "".join(f"        if self._value_{field} is not None:\n"
+                  f'            values["{field}"] = self._value_{field}\n' for field in optional)
+        + "        return values\n\n"
+    )
+    segment = segment[:match.start()] + assignments + segment[match.end():]
+    segment = re.sub(r'self\._values\.get\("(\w+)"\)', r"self._value_\1", segment)
+    segment = segment.replace(f"\nclass {name}:\n",
+                              f"\nclass {name}(_base.Struct):\n    __slots__ = (\n{slots}    )\n\n", 1)
+    return segment.replace("    def __eq__(", values + "    def __eq__(", 1)
+
+
+_TYPECHECK = '''
+import os
+
+# Whether constructors check their arguments with typeguard. Off under python -O,
+# with CDK8S_TYPECHECK=0 in the environment, or after set_typecheck(False).
+TYPECHECK = __debug__ and os.environ.get("CDK8S_TYPECHECK", "1") != "0"
+
+
+def set_typecheck(enabled: bool) -> None:
+    global TYPECHECK
+    TYPECHECK = enabled
+'''
+
+
+_STRUCT = '''
+
+# Whether structs are interned: constructing a struct equal to one constructed
+# before returns that instance, so the same selector, port or probe repeated
+# across a chart is kept once. Off unless CDK8S_INTERN=1 or set_interning(True).
+# Interned structs are shared, so lists and maps passed to them must not be
+# changed afterwards.
+INTERN = os.environ.get("CDK8S_INTERN") == "1"
+
+_interned: typing.Dict[typing.Any, typing.Any] = {}
+
+
+def set_interning(enabled: bool) -> None:
+    global INTERN
+    INTERN = enabled
+
+
+def clear_interned() -> None:
+    """Forgets the interned structs, which are kept until then otherwise."""
+    _interned.clear()
+
+
+def _intern_key(value: typing.Any) -> typing.Any:
+    # equal for equal values; anything else, e.g. a struct, is compared by
+    # identity, which for interned structs is the same as by value
+    kind = type(value)
+    if kind is str:
+        return value
+    if kind is list or kind is tuple:
+        return list, tuple([_intern_key(item) for item in value])
+    if kind is dict:
+        return dict, tuple([(key, _intern_key(item)) for key, item in value.items()])
+    if kind is int or kind is float or kind is bool or isinstance(value, enum.Enum):
+        return kind, value
+    return id(value)
+
+
+class Struct:
+    """Base of the generated structs, which keep their fields in __slots__."""
+
+    __slots__ = ()
+
+    def __new__(cls, **kwargs: typing.Any) -> typing.Any:
+        if not INTERN:
+            return super().__new__(cls)
+        key: typing.List[typing.Any] = [cls]
+        for name in sorted(kwargs):
+            value = kwargs[name]
+            if value is not None:
+                key.append(name)
+                key.append(_intern_key(value))
+        instance = _interned.get(tuple(key))
+        if instance is None:
+            instance = _interned[tuple(key)] = super().__new__(cls)
+        return instance
+'''
+
+
+_LAZY_INIT = '''{marker}, do not edit.
+#
+# Every class lives in its own module under _kinds and is imported the first time
+# it is accessed, so a chart only pays for the kinds it uses.
+from pkgutil import extend_path
+__path__ = extend_path(__path__, __name__)
+
+import importlib
+import typing
+
+from ._jsii import *
+from ._base import clear_interned, set_interning, set_typecheck
+
+_KINDS = {{
+{kinds}
+}}
+
+__all__ = [
+{all}
+]
+
+if typing.TYPE_CHECKING:
+{type_checking}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _KINDS.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(f"{{__name__}}._kinds.{{module}}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
+'''
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    lazy = commands.add_parser("lazy", help="split the bindings into lazily imported modules")
+    lazy.add_argument("--source", default="imports/k8s/__init__.py",
+                      help="module generated by `cdk8s import` (default: %(default)s)")
+    lazy.add_argument("--out", default="imports/k8s",
+                      help="package to write (default: %(default)s)")
+    slim = commands.add_parser("slim", help="remove the classes the chart sources do not use")
+    slim.add_argument("paths", nargs="*", default=["main.py", "lib"],
+                      help="Python files or directories using the bindings (default: main.py lib)")
+    slim.add_argument("--kinds", type=lambda value: value.split(","), default=[],
+                      help="comma separated classes to keep too, e.g. ones only looked up with getattr")
+    slim.add_argument("--out", default="imports/k8s",
+                      help="package written by the lazy command (default: %(default)s)")
+    args = parser.parse_args()
+
+    if args.command == "slim":
+        package = LazyPackage(args.out)
+        unknown = sorted(set(args.kinds) - package.module_of.keys())
+        if unknown:
+            raise SystemExit(f"not in {args.out}: {', '.join(unknown)}")
+        roots = (used_names(args.paths) & package.module_of.keys()) | set(args.kinds)
+        keep = package.closure(roots)
+        write_slim(package, keep)
+        print(f"kept {len(keep)} of {len(package.module_of)} classes, used directly: {', '.join(sorted(roots))}")
+        return
+
+    bindings = Bindings.load(args.source)
+    count = write_lazy(bindings, args.out)
+    for tarball in glob.glob(os.path.join(args.out, "_jsii", "*.jsii.tgz")):
+        write_manifest(Converters.load(tarball), args.out)
+    print(f"wrote {len(bindings.classes)} classes in {count} modules to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+"""Semantic diff of two synthesized dist/ directories, as a deploy plan.
+
+Compares the manifests in the YAML files under OLD and NEW object by object,
+keyed by API group, kind, namespace and name, and lists what a deploy has to
+create, update and delete, with the fields that change in every update. OLD
+can also be a git revision of NEW (--rev), e.g. the last deployed commit:
+
+    python -m tools.manifest_diff --rev HEAD~1 dist
+    python -m tools.manifest_diff old-dist dist --json > plan.json
+
+Every YAML document is hashed as it is, without parsing it. Documents found on
+both sides are unchanged and never parsed, so the time it takes after reading
+the files grows with the number of changed objects, not with the size of
+dist/. Changed documents are parsed into trees in which every subtree has a
+Merkle hash, the hash of its keys and the hashes of its children, and the diff
+only walks into subtrees whose hashes differ. Formatting and key order do not
+count as changes; lists of objects with a name, such as containers, are
+matched by name rather than position.
+
+The plan lists creates and updates in the order Helm installs kinds in
+(namespaces and CRDs first, workloads after their config), then deletes in the
+reverse order. With --json it is a list of steps, each with the manifest to
+apply.
+"""
+import argparse
+import collections
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import typing
+
+import yaml
+
+_SEPARATOR = re.compile(rb"^---[ \t]*\r?\n", re.MULTILINE)
+# the C loader of PyYAML when it is built with libyaml
+LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# as Helm's InstallOrder; kinds not listed go last
+_KIND_ORDER = [
+    "PriorityClass", "Namespace", "NetworkPolicy", "ResourceQuota", "LimitRange", "PodSecurityPolicy",
+    "PodDisruptionBudget", "ServiceAccount", "Secret", "SecretList", "ConfigMap", "StorageClass",
+    "PersistentVolume", "PersistentVolumeClaim", "CustomResourceDefinition", "ClusterRole", "ClusterRoleList",
+    "ClusterRoleBinding", "ClusterRoleBindingList", "Role", "RoleList", "RoleBinding", "RoleBindingList",
+    "Service", "DaemonSet", "Pod", "ReplicationController", "ReplicaSet", "Deployment",
+    "HorizontalPodAutoscaler", "StatefulSet", "Job", "CronJob", "IngressClass", "Ingress", "APIService",
+]
+_KIND_RANK = {kind: i for i, kind in enumerate(_KIND_ORDER)}
+
+# (API group, kind, namespace, name)
+ObjectKey = typing.Tuple[str, str, str, str]
+
+
+class Change(typing.NamedTuple):
+    path: str
+    # None for a field that is added or removed
+    old: typing.Any
+    new: typing.Any
+
+
+class Step(typing.NamedTuple):
+    action: str
+    api_version: str
+    kind: str
+    namespace: str
+    name: str
+    changes: typing.List[Change]
+    # the manifest to apply, or the one to delete
+    manifest: typing.Any
+
+
+class Plan(typing.NamedTuple):
+    steps: typing.List[Step]
+    unchanged: int
+
+
+def read_documents(root: str) -> typing.List[bytes]:
+    """The YAML documents of every .yaml and .yml file under root, in file
+    order."""
+    documents = []
+    for directory, dirs, files in os.walk(root):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith((".yaml", ".yml")):
+                with open(os.path.join(directory, name), "rb") as f:
+                    text = f.read()
+                # cdk8s separates documents with bare "---" lines, which
+                # bytes.split finds much faster than the regular expression
+                parts = (b"\n" + text).split(b"\n---\n") if b"\r" not in text else _SEPARATOR.split(text)
+                # the last document of a file ends in a line break, the others not
+                documents.extend(part.strip(b"\r\n") for part in parts if part.strip())
+    return documents
+
+
+def diff_documents(old: typing.Sequence[bytes], new: typing.Sequence[bytes]) -> Plan:
+    """The plan that turns the objects of the documents old into those of the
+    documents new."""
+    old_digests = [hashlib.blake2b(document, digest_size=16).digest() for document in old]
+    new_digests = [hashlib.blake2b(document, digest_size=16).digest() for document in new]
+    # a document on both sides is unchanged, as often as it is on both sides
+    common = collections.Counter(old_digests) & collections.Counter(new_digests)
+    old_changed = _parse(_unmatched(old, old_digests, common.copy()))
+    new_changed = _parse(_unmatched(new, new_digests, common.copy()))
+    unchanged = sum(common.values())
+
+    steps = []
+    for key, manifest in new_changed.items():
+        previous = old_changed.pop(key, None)
+        if previous is None:
+            steps.append(_step("create", manifest, []))
+            continue
+        changes: typing.List[Change] = []
+        _diff(previous, manifest, "", _Hashes(), changes)
+        if changes:
+            steps.append(_step("update", manifest, changes))
+        else:
+            # reformatted, the same object
+            unchanged += 1
+    steps.sort(key=lambda step: (kind_rank(step.kind), step.namespace, step.name))
+    deletes = [_step("delete", manifest, []) for manifest in old_changed.values()]
+    deletes.sort(key=lambda step: (-kind_rank(step.kind), step.namespace, step.name))
+    return Plan(steps + deletes, unchanged)
+
+
+def format_plan(plan: Plan) -> str:
+    lines = []
+    symbols = {"create": "+", "update": "~", "delete": "-"}
+    for step in plan.steps:
+        target = f"{step.namespace}/{step.name}" if step.namespace else step.name
+        lines.append(f"{symbols[step.action]} {step.action:<7} {step.api_version}/{step.kind} {target}")
+        for change in step.changes:
+            if change.old is None:
+                lines.append(f"    {change.path}: + {_show(change.new)}")
+            elif change.new is None:
+                lines.append(f"    {change.path}: - {_show(change.old)}")
+            else:
+                lines.append(f"    {change.path}: {_show(change.old)} -> {_show(change.new)}")
+    counts = collections.Counter(step.action for step in plan.steps)
+    lines.append(f"{counts['create']} to create, {counts['update']} to update, {counts['delete']} to delete, "
+                 f"{plan.unchanged} unchanged")
+    return "\n".join(lines)
+
+
+def plan_json(plan: Plan) -> typing.Dict[str, typing.Any]:
+    return {
+        "unchanged": plan.unchanged,
+        "steps": [{
+            "action": step.action, "apiVersion": step.api_version, "kind": step.kind,
+            "namespace": step.namespace, "name": step.name,
+            "changes": [{"path": change.path, "old": change.old, "new": change.new} for change in step.changes],
+            "manifest": step.manifest,
+        } for step in plan.steps],
+    }
+
+
+def checkout_dist(rev: str, path: str, tmp: str) -> str:
+    """Extracts path, a directory of the working tree, as of git revision rev
+    into tmp and returns where it is there."""
+    toplevel = subprocess.check_output(["git", "rev-parse", "--show-toplevel"], cwd=path).decode().strip()
+    relative = os.path.relpath(os.path.realpath(path), os.path.realpath(toplevel))
+    archive = subprocess.check_output(["git", "archive", "--format=tar", rev, relative], cwd=toplevel)
+    subprocess.run(["tar", "-x", "-C", tmp], input=archive, check=True)
+    return os.path.join(tmp, relative)
+
+
+def _unmatched(documents: typing.Sequence[bytes], digests: typing.Sequence[bytes],
+               common: typing.Counter[bytes]) -> typing.Iterator[bytes]:
+    for document, digest in zip(documents, digests):
+        if common[digest]:
+            common[digest] -= 1
+        else:
+            yield document
+
+
+def _parse(documents: typing.Iterable[bytes]) -> typing.Dict[ObjectKey, typing.Any]:
+    objects: typing.Dict[ObjectKey, typing.Any] = {}
+    for document in documents:
+        manifest = yaml.load(document, Loader=LOADER)
+        if manifest is None:
+            continue
+        if not isinstance(manifest, dict):
+            raise ValueError(f"not a Kubernetes object: {document[:80]!r}")
+        metadata = manifest.get("metadata") or {}
+        group = str(manifest.get("apiVersion", "")).rpartition("/")[0]
+        key = (group, str(manifest.get("kind", "")), str(metadata.get("namespace") or ""),
+               str(metadata.get("name", "")))
+        if key in objects:
+            raise ValueError(f"{key[1]} {'/'.join(filter(None, key[2:]))} is defined twice")
+        objects[key] = manifest
+    return objects
+
+
+def _step(action: str, manifest: typing.Any, changes: typing.List[Change]) -> Step:
+    metadata = manifest.get("metadata") or {}
+    return Step(action, str(manifest.get("apiVersion", "")), str(manifest.get("kind", "")),
+                str(metadata.get("namespace") or ""), str(metadata.get("name", "")), changes, manifest)
+
+
+def kind_rank(kind: str) -> int:
+    """Where kind comes in Helm's install order."""
+    return _KIND_RANK.get(kind, len(_KIND_ORDER))
+
+
+class _Hashes:
+    """Merkle hashes of the subtrees of parsed manifests, computed once per
+    subtree."""
+
+    def __init__(self) -> None:
+        self._hashes: typing.Dict[int, bytes] = {}
+        # keeps the hashed subtrees alive, so their ids stay theirs
+        self._nodes: typing.List[typing.Any] = []
+
+    def __call__(self, node: typing.Any) -> bytes:
+        digest = self._hashes.get(id(node))
+        if digest is not None:
+            return digest
+        h = hashlib.blake2b(digest_size=16)
+        if isinstance(node, dict):
+            h.update(b"{")
+            for key in sorted(node, key=str):
+                h.update(json.dumps(str(key)).encode())
+                h.update(self(node[key]))
+        elif isinstance(node, list):
+            h.update(b"[")
+            for item in node:
+                h.update(self(item))
+        else:
+            # the type too, 1 and "1" differ
+            h.update(f"{type(node).__name__}:{node!r}".encode())
+        digest = self._hashes[id(node)] = h.digest()
+        self._nodes.append(node)
+        return digest
+
+
+def _diff(old: typing.Any, new: typing.Any, path: str, hashes: _Hashes, changes: typing.List[Change]) -> None:
+    if hashes(old) == hashes(new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in sorted(old.keys() | new.keys(), key=str):
+            child = f"{path}.{key}" if path else str(key)
+            if key not in new:
+                changes.append(Change(child, old[key], None))
+            elif key not in old:
+                changes.append(Change(child, None, new[key]))
+            else:
+                _diff(old[key], new[key], child, hashes, changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        old_names, new_names = _names(old), _names(new)
+        if old_names is not None and new_names is not None:
+            # containers, ports, env and the like, matched by name
+            for name in sorted(old_names.keys() | new_names.keys()):
+                child = f"{path}[name={name}]"
+                if name not in new_names:
+                    changes.append(Change(child, old_names[name], None))
+                elif name not in old_names:
+                    changes.append(Change(child, None, new_names[name]))
+                else:
+                    _diff(old_names[name], new_names[name], child, hashes, changes)
+            return
+        for i in range(max(len(old), len(new))):
+            child = f"{path}[{i}]"
+            if i >= len(new):
+                changes.append(Change(child, old[i], None))
+            elif i >= len(old):
+                changes.append(Change(child, None, new[i]))
+            else:
+                _diff(old[i], new[i], child, hashes, changes)
+    else:
+        changes.append(Change(path, old, new))
+
+
+def _names(items: typing.List[typing.Any]) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    if not items or not all(isinstance(item, dict) and isinstance(item.get("name"), str) for item in items):
+        return None
+    names = {item["name"]: item for item in items}
+    return names if len(names) == len(items) else None
+
+
+def _show(value: typing.Any) -> str:
+    text = json.dumps(value, sort_keys=True, default=str)
+    return text if len(text) <= 80 else text[:77] + "..."
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old", nargs="?", help="directory of the manifests deployed now")
+    parser.add_argument("new", help="directory of the manifests to deploy")
+    parser.add_argument("--rev", help="compare with NEW as of this git revision, instead of OLD")
+    parser.add_argument("--json", action="store_true", help="print the plan as JSON")
+    parser.add_argument("--exit-code", action="store_true", help="exit with 1 if there are changes")
+    args = parser.parse_args()
+    if (args.old is None) == (args.rev is None):
+        parser.error("give either OLD or --rev")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old = checkout_dist(args.rev, args.new, tmp) if args.rev else args.old
+        plan = diff_documents(read_documents(old), read_documents(args.new))
+    if args.json:
+        json.dump(plan_json(plan), sys.stdout, indent=1, default=str)
+        print()
+    else:
+        print(format_plan(plan))
+    if args.exit_code and plan.steps:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# bench_crhelper.py
+#
+# Measures the overhead crhelper itself adds to an invocation, on a cold
+# container (fresh interpreter) and on warm ones. Handlers are no-ops and
+# responses go to a local ResponseURL stand-in, so only helper time is counted.
+#
+#     $ python bench_crhelper.py [--invocations 200]
+#
+##################################################################################################
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+INVOCATION = '''
+import json, logging, sys, time
+start = time.perf_counter()
+import crhelper
+from local_cfn import LambdaContext, make_event
+imported = time.perf_counter()
+# the metric lines would go to stdout, where the result is printed
+crhelper.METRICS_ENABLED = False
+
+schema = {'Name': str, 'Count': int, 'Enabled': (bool, False), 'Subnets': (list, [])}
+create = lambda event, context: ('my-id', {})
+url, invocations = sys.argv[1], int(sys.argv[2])
+logging.disable(logging.CRITICAL)
+
+timings = []
+for i in range(invocations):
+    event = make_event(url, request_id='request-{}'.format(i),
+                       properties={'Name': 'x', 'Count': '3', 'Subnets': '["a", "b"]'})
+    t0 = time.perf_counter()
+    logger = crhelper.log_config(event)
+    crhelper.parse_properties(event, schema)
+    crhelper.cfn_handler(event, LambdaContext(), create, create, create, logger, False)
+    timings.append(time.perf_counter() - t0)
+
+print(json.dumps({'import': imported - start, 'timings': timings}))
+'''
+
+
+# Runs invocations invocations in a fresh interpreter and returns how long
+# importing crhelper and each invocation took, in seconds
+def run(invocations):
+    from local_cfn import ResponseEndpoint
+
+    with ResponseEndpoint() as endpoint:
+        output = subprocess.check_output([sys.executable, '-c', INVOCATION,
+                                          endpoint.url(), str(invocations)])
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='crhelper cold and warm invocation overhead')
+    parser.add_argument('--invocations', type=int, default=200)
+    args = parser.parse_args()
+    if args.invocations < 2:
+        parser.error('--invocations must be at least 2, a cold one and a warm one')
+
+    result = run(args.invocations)
+    cold, warm = result['timings'][0], sorted(result['timings'][1:])
+
+    print('import crhelper      {:8.2f} ms'.format(result['import'] * 1000))
+    print('cold invocation      {:8.2f} ms'.format(cold * 1000))
+    print('warm invocation p50  {:8.2f} ms'.format(warm[len(warm) // 2] * 1000))
+    print('warm invocation p99  {:8.2f} ms'.format(warm[int(len(warm) * 0.99)] * 1000))
+
+
+if __name__ == '__main__':
+    main()
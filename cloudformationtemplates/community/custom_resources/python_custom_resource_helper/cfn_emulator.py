@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# cfn_emulator.py
+#
+# Drives custom resource handlers through crhelper.cfn_handler the way
+# CloudFormation would, without deploying anything. Every emulated resource
+# goes through a Create, Update and Delete request, responses are collected by
+# a local ResponseURL stand-in, and the run is repeated at each concurrency
+# level to report throughput, latency percentiles and the timeout rate.
+#
+#     $ python cfn_emulator.py --handler lambda_function --resources 200 \
+#           --concurrency 1 8 32 --timeout 30 --max-p99 2.5
+#
+# --handler names a module with create, update and delete functions, as in the
+# usage example in README.md. Without it, sample handlers that sleep for
+# --latency seconds are used. --max-p99 makes the run exit non-zero when the
+# p99 latency of any concurrency level is above it, for use in CI.
+#
+##################################################################################################
+
+import argparse
+import importlib
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import crhelper
+from local_cfn import LambdaContext, ResponseEndpoint, make_event
+
+
+def sample_handlers(latency):
+    def create(event, context):
+        time.sleep(latency)
+        return 'sample-{}'.format(event['LogicalResourceId']), {'Name': event['LogicalResourceId']}
+
+    def update(event, context):
+        time.sleep(latency)
+        return event['PhysicalResourceId'], {'Name': event['LogicalResourceId']}
+
+    def delete(event, context):
+        time.sleep(latency)
+
+    return create, update, delete
+
+
+def lifecycle(endpoint, run, resource, properties, handlers, timeout):
+    # Create, Update and Delete one resource in order, the way CloudFormation
+    # does across a stack create, update and delete. Returns (latency, status)
+    # for each request
+    create, update, delete = handlers
+    logical_id = 'Resource{}'.format(resource)
+    physical_id = None
+    results = []
+    for request_type in ('Create', 'Update', 'Delete'):
+        request_id = '{}-{}-{}'.format(run, logical_id, request_type)
+        new_properties = dict(properties, Revision=str(len(results)))
+        event = make_event(endpoint.url('/{}'.format(request_id)), request_type=request_type,
+                           request_id=request_id, logical_id=logical_id,
+                           properties=new_properties, physical_id=physical_id,
+                           old_properties=properties if request_type == 'Update' else None)
+        properties = new_properties
+        logger = logging.LoggerAdapter(logging.getLogger(), {'requestid': request_id})
+        start = time.perf_counter()
+        try:
+            crhelper.cfn_handler(event, LambdaContext(timeout=timeout), create, update, delete,
+                                 logger, False)
+        except Exception:
+            pass
+        latency = time.perf_counter() - start
+        response = endpoint.by_request.get(request_id)
+        if response is None:
+            status = 'NO_RESPONSE'
+        elif response['Status'] == 'FAILED' and 'timed out' in response['Reason']:
+            status = 'TIMEOUT'
+        else:
+            status = response['Status']
+        results.append((latency, status))
+        if response and response['Status'] == 'SUCCESS':
+            physical_id = response['PhysicalResourceId']
+    return results
+
+
+def percentile(values, fraction):
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def run_level(endpoint, concurrency, resources, properties, handlers, timeout):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        lifecycles = list(pool.map(
+            lambda resource: lifecycle(endpoint, concurrency, resource, properties, handlers, timeout),
+            range(resources)))
+    elapsed = time.perf_counter() - start
+    results = [result for requests in lifecycles for result in requests]
+    latencies = sorted(latency for latency, status in results)
+    statuses = [status for latency, status in results]
+    return {
+        'concurrency': concurrency,
+        'requests': len(results),
+        'throughput': len(results) / elapsed,
+        'p50': percentile(latencies, 0.50),
+        'p99': percentile(latencies, 0.99),
+        'timeout_rate': statuses.count('TIMEOUT') / float(len(results)),
+        'failure_rate': (len(statuses) - statuses.count('SUCCESS')) / float(len(results))
+    }
+
+
+def report(levels):
+    print('{:>11} {:>9} {:>10} {:>9} {:>9} {:>9} {:>9}'.format(
+        'concurrency', 'requests', 'req/s', 'p50 ms', 'p99 ms', 'timeout', 'failed'))
+    for level in levels:
+        print('{concurrency:>11} {requests:>9} {throughput:>10.1f} {p50_ms:>9.1f} {p99_ms:>9.1f} '
+              '{timeout_rate:>9.1%} {failure_rate:>9.1%}'.format(
+                  p50_ms=level['p50'] * 1000, p99_ms=level['p99'] * 1000, **level))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Local CloudFormation custom resource emulator')
+    parser.add_argument('--handler', help='module with create, update and delete functions')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='seconds the sample handlers take, when no --handler is given')
+    parser.add_argument('--resources', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--timeout', type=float, default=30,
+                        help='lambda timeout, in seconds, of every emulated invocation')
+    parser.add_argument('--response-latency', type=float, default=0,
+                        help='seconds the ResponseURL stand-in takes to answer')
+    parser.add_argument('--property', action='append', default=[], metavar='NAME=VALUE',
+                        help='ResourceProperties passed to every resource')
+    parser.add_argument('--max-p99', type=float,
+                        help='exit non-zero when a p99 latency, in seconds, is above this')
+    args = parser.parse_args(argv)
+
+    if args.handler:
+        module = importlib.import_module(args.handler)
+        handlers = module.create, module.update, module.delete
+    else:
+        handlers = sample_handlers(args.latency)
+    properties = dict(prop.split('=', 1) for prop in args.property)
+    logging.getLogger().setLevel(logging.CRITICAL)
+    crhelper.METRICS_ENABLED = False
+
+    with ResponseEndpoint(latency=args.response_latency) as endpoint:
+        levels = [run_level(endpoint, concurrency, args.resources, properties, handlers, args.timeout)
+                  for concurrency in args.concurrency]
+    report(levels)
+
+    if args.max_p99 is not None and any(level['p99'] > args.max_p99 for level in levels):
+        print('p99 latency above {}s'.format(args.max_p99))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -19,11 +19,67 @@
 
 from __future__ import print_function
 
+import hashlib
+import heapq
+import itertools
 import json
 import logging
+import os
+import random
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from botocore.vendored import requests
+import urllib3
+
+# Response delivery tuning, the overall deadline is derived from the time the
+# lambda has left, less SEND_DEADLINE_MARGIN seconds
+SEND_MAX_ATTEMPTS = 5
+SEND_BACKOFF_BASE = 0.2
+SEND_BACKOFF_CAP = 3.0
+SEND_ATTEMPT_TIMEOUT = 10.0
+SEND_DEADLINE_MARGIN = 0.2
+
+# Size of the executor async handlers get for blocking calls, e.g. boto3 clients
+# wrapped with loop.run_in_executor(None, ...) or asyncio.to_thread(...)
+ASYNC_MAX_WORKERS = 64
+
+# Batched dispatch tuning, queue polling stops once the lambda has less than
+# POLL_MIN_REMAINING_MILLIS left so in-flight events can still respond
+BATCH_MAX_WORKERS = 16
+POLL_MIN_REMAINING_MILLIS = 30000
+
+# Minutes between completion checks of long running requests in poll mode
+POLL_INTERVAL_MINUTES = 2
+
+# Compiled property schemas kept per container, least recently used first out,
+# so a schema built anew on every invocation does not grow the cache
+PROPERTY_PARSERS_MAX = 64
+
+# CloudFormation rejects response bodies larger than RESPONSE_MAX_BYTES. Response
+# data that doesn't fit is written to OVERFLOW_STORE (e.g. an S3Overflow) and
+# replaced with a pointer to it, plus whichever scalar attributes still fit
+RESPONSE_MAX_BYTES = 4096
+OVERFLOW_STORE = None
+
+# Per request phase timings are written to the log as CloudWatch embedded metric
+# format lines under this namespace, set METRICS_ENABLED to False to turn off
+METRICS_NAMESPACE = 'crhelper'
+METRICS_ENABLED = True
+
+# Shared across warm invocations so responses to the same S3 endpoint reuse an
+# open keep-alive connection instead of paying a TLS handshake per send. Sized
+# so every batch worker can hold its own connection.
+http_pool = urllib3.PoolManager(num_pools=4, maxsize=BATCH_MAX_WORKERS, retries=False)
+
+
+# Per container state, set up on the first invocation and reused by warm ones
+log_state = {'levels': None, 'handler': None}
+clients = {}
+clients_lock = threading.Lock()
+property_parsers = OrderedDict()
+property_parsers_lock = threading.Lock()
 
 
 def log_config(event, loglevel=None, botolevel=None):
@@ -31,26 +87,91 @@ def log_config(event, loglevel=None, botolevel=None):
         if 'loglevel' in event['ResourceProperties'] and not loglevel:
             loglevel = event['ResourceProperties']['loglevel']
         if 'botolevel' in event['ResourceProperties'] and not botolevel:
-            loglevel = event['ResourceProperties']['botolevel']
+            botolevel = event['ResourceProperties']['botolevel']
     if not loglevel:
         loglevel = 'WARNING'
     if not botolevel:
         botolevel = 'ERROR'
-    # Set log verbosity levels
-    loglevel = getattr(logging, loglevel.upper(), 20)
-    botolevel = getattr(logging, botolevel.upper(), 40)
     mainlogger = logging.getLogger()
-    mainlogger.setLevel(loglevel)
-    logging.getLogger('boto3').setLevel(botolevel)
-    logging.getLogger('botocore').setLevel(botolevel)
-    # Set log message format
-    logfmt = '[%(requestid)s][%(asctime)s][%(levelname)s] %(message)s \n'
-    mainlogger.handlers[0].setFormatter(logging.Formatter(logfmt))
+    # Set log verbosity levels, only when they differ from the last invocation
+    if log_state['levels'] != (loglevel, botolevel):
+        mainlogger.setLevel(getattr(logging, loglevel.upper(), 20))
+        logging.getLogger('boto3').setLevel(getattr(logging, botolevel.upper(), 40))
+        logging.getLogger('botocore').setLevel(getattr(logging, botolevel.upper(), 40))
+        log_state['levels'] = (loglevel, botolevel)
+    # Set log message format, once per handler. Outside of lambda the root
+    # logger may not have a handler yet
+    if not mainlogger.handlers:
+        mainlogger.addHandler(logging.StreamHandler())
+    if log_state['handler'] is not mainlogger.handlers[0]:
+        logfmt = '[%(requestid)s][%(asctime)s][%(levelname)s] %(message)s \n'
+        mainlogger.handlers[0].setFormatter(logging.Formatter(logfmt))
+        log_state['handler'] = mainlogger.handlers[0]
     return logging.LoggerAdapter(mainlogger, {'requestid': event['RequestId']})
 
 
+# Returns a boto3 client, created on first use and reused by warm invocations.
+# Clients are keyed on the service name and any client keyword arguments
+def client(service_name, **kwargs):
+    key = (service_name, tuple(sorted(kwargs.items())))
+    if key not in clients:
+        with clients_lock:
+            if key not in clients:
+                import boto3
+                clients[key] = boto3.client(service_name, **kwargs)
+    return clients[key]
+
+
+# Converts the string values CloudFormation passes in ResourceProperties.
+# schema maps property names to a type (bool, int, float, str, list or dict), or
+# a (type, default) tuple for optional properties. Schemas are compiled once per
+# container and reused by warm invocations; define them at module level, a
+# schema built inside the handler is compiled again on every invocation
+def parse_properties(event, schema):
+    with property_parsers_lock:
+        parser = property_parsers.get(id(schema))
+        if parser is None or parser[0] is not schema:
+            parser = (schema, compile_schema(schema))
+            property_parsers[id(schema)] = parser
+            while len(property_parsers) > PROPERTY_PARSERS_MAX:
+                property_parsers.popitem(last=False)
+        property_parsers.move_to_end(id(schema))
+    return parser[1](event.get('ResourceProperties', {}))
+
+
+def compile_schema(schema):
+    missing = object()
+    fields = []
+    for name, spec in schema.items():
+        kind, default = spec if isinstance(spec, tuple) else (spec, missing)
+        fields.append((name, converter(kind), default))
+
+    def parse(properties):
+        parsed = {}
+        for name, convert, default in fields:
+            if name in properties:
+                parsed[name] = convert(properties[name])
+            elif default is missing:
+                raise ValueError("Missing required property: {}".format(name))
+            else:
+                parsed[name] = default
+        return parsed
+
+    return parse
+
+
+def converter(kind):
+    if kind is bool:
+        return lambda value: value if isinstance(value, bool) else str(value).lower() in ('true', 'yes', '1')
+    if kind in (list, dict):
+        return lambda value: value if isinstance(value, kind) else kind(json.loads(value))
+    return kind
+
+
 def send(event, context, response_status, response_data, physical_resource_id,
-         logger, reason=None):
+         logger, reason=None, deadline=None, metrics=None):
+    metrics = metrics or PhaseTimer(event)
+    start = time.perf_counter()
     response_url = event['ResponseURL']
     logger.debug("CFN response URL: {}".format(response_url))
 
@@ -65,10 +186,9 @@ def send(event, context, response_status, response_data, physical_resource_id,
     response_body['StackId'] = event['StackId']
     response_body['RequestId'] = event['RequestId']
     response_body['LogicalResourceId'] = event['LogicalResourceId']
-    if response_data and response_data != {} and response_data != [] and isinstance(response_data, dict):
-        response_body['Data'] = response_data
 
-    json_response_body = json.dumps(response_body)
+    json_response_body = serialize_response(event, response_body, response_data, logger)
+    metrics.record('Serialize', start)
 
     logger.debug("Response body:\n{}".format(json_response_body))
 
@@ -77,25 +197,369 @@ def send(event, context, response_status, response_data, physical_resource_id,
         'content-length': str(len(json_response_body))
     }
 
+    if deadline is None:
+        deadline = send_deadline(context)
+    start = time.perf_counter()
+    try:
+        put_response(response_url, json_response_body, headers, deadline, logger, metrics)
+    finally:
+        metrics.record('Send', start)
+
+
+def serialize_response(event, response_body, response_data, logger):
+    # Compact separators, and the data is serialized once then spliced into the
+    # body so its size is known before deciding whether it has to overflow.
+    # Default json output is ascii, so string length is the size in bytes
+    json_response_body = json.dumps(response_body, separators=(',', ':'))
+    if not response_data or not isinstance(response_data, dict):
+        return json_response_body
+    json_data = json.dumps(response_data, separators=(',', ':'))
+    budget = RESPONSE_MAX_BYTES - len(json_response_body) - len(',"Data":')
+    if len(json_data) > budget:
+        # CloudFormation ignores the data of failed requests, so it is dropped
+        # rather than failing the failure response too
+        if response_body['Status'] != 'SUCCESS':
+            logger.warning("Dropping {} bytes of response data from the failure response".format(len(json_data)))
+            return json_response_body
+        json_data = overflow_data(event, response_data, json_data, budget, logger)
+    return '{},"Data":{}}}'.format(json_response_body[:-1], json_data)
+
+
+def overflow_data(event, response_data, json_data, budget, logger):
+    if OVERFLOW_STORE is None:
+        raise ValueError("Response data is {} bytes, more than the {} bytes that fit in the "
+                         "response, set crhelper.OVERFLOW_STORE to store it elsewhere".format(
+                             len(json_data), budget))
+    bucket, key = OVERFLOW_STORE.put(event, json_data)
+    logger.info("Response data is {} bytes, stored in s3://{}/{}".format(len(json_data), bucket, key))
+    pointer = OrderedDict([('DataBucket', bucket), ('DataKey', key)])
+    used = len(json.dumps(pointer, separators=(',', ':')))
+    # keep as many scalar attributes as fit, smallest first, so Fn::GetAtt on
+    # them keeps working
+    attributes = sorted((len(json.dumps({name: value}, separators=(',', ':'))), name, value)
+                        for name, value in response_data.items()
+                        if not isinstance(value, (dict, list)))
+    for size, name, value in attributes:
+        # size includes the braces, which stand in for the separating comma
+        if used + size - 1 > budget:
+            break
+        pointer[name] = value
+        used += size - 1
+    return json.dumps(pointer, separators=(',', ':'))
+
+
+# Stores response data that is too large for the response body in S3 as json
+class S3Overflow(object):
+    def __init__(self, bucket, prefix='crhelper/', s3=None):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.s3 = s3 or client('s3')
+
+    def put(self, event, json_data):
+        key = '{}{}/{}.json'.format(self.prefix, event['LogicalResourceId'], event['RequestId'])
+        self.s3.put_object(Bucket=self.bucket, Key=key, Body=json_data.encode('utf-8'),
+                           ContentType='application/json')
+        return self.bucket, key
+
+
+def send_deadline(context):
+    remaining = context.get_remaining_time_in_millis() / 1000.00
+    return time.monotonic() + max(remaining - SEND_DEADLINE_MARGIN, 0)
+
+
+def retryable(status):
+    return status == 429 or status >= 500
+
+
+def put_response(url, body, headers, deadline, logger, metrics):
+    # PUT the response body, retrying connection errors and 5xx/429 replies with
+    # full jitter backoff until SEND_MAX_ATTEMPTS or the deadline is reached.
+    # At least one attempt is always made, even if the deadline has passed.
+    attempt = 0
+    while True:
+        attempt += 1
+        budget = deadline - time.monotonic()
+        timeout = max(min(SEND_ATTEMPT_TIMEOUT, budget), 0.1)
+        try:
+            response = http_pool.request('PUT', url, body=body, headers=headers,
+                                         timeout=timeout)
+            logger.info("CloudFormation returned status code: {}".format(response.reason))
+            if not retryable(response.status):
+                return response
+            error = "HTTP {} {}".format(response.status, response.reason)
+        except urllib3.exceptions.HTTPError as e:
+            error = e
+        delay = random.uniform(0, min(SEND_BACKOFF_CAP, SEND_BACKOFF_BASE * 2 ** (attempt - 1)))
+        if attempt >= SEND_MAX_ATTEMPTS or time.monotonic() + delay >= deadline:
+            logger.error("send(..) failed after {} attempt(s): {}".format(attempt, error))
+            raise Exception("Failed to send response to CloudFormation: {}".format(error))
+        logger.warning("send(..) attempt {} failed, retrying in {:.2f}s: {}".format(attempt, delay, error))
+        metrics.count('Retries')
+        time.sleep(delay)
+
+
+# CloudFormation retries requests it did not get a response for in time. With an
+# idempotency store the result of a completed request is kept, and a retry of the
+# same request replays it instead of running the handler again
+def idempotency_key(event):
+    return '{}|{}|{}'.format(event['StackId'], event['LogicalResourceId'], event['RequestId'])
+
+
+# A store that cannot be read runs the handler as if the request were new, and a
+# replayed response that cannot be sent is reported as FAILED, so CloudFormation
+# always gets a response before its own timeout
+def replay(event, context, store, logger):
+    if store is None:
+        return False
     try:
-        response = requests.put(response_url,
-                                data=json_response_body,
-                                headers=headers)
-        logger.info("CloudFormation returned status code: {}".format(response.reason))
+        record = store.get(idempotency_key(event))
+        if record is None:
+            return False
+        physical_resource_id, response_data = record['PhysicalResourceId'], record['Data']
     except Exception as e:
-        logger.error("send(..) failed executing requests.put(..): {}".format(e))
-        raise
+        logger.warning("Failed to read request from the idempotency store: {}".format(e))
+        return False
+    logger.info("Request already completed, replaying response to cfn")
+    try:
+        send(event, context, "SUCCESS", response_data, physical_resource_id, logger=logger)
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        send(event, context, "FAILED", {}, physical_resource_id, logger=logger, reason=e)
+        raise Exception('FAILED')
+    return True
+
+
+def remember(event, store, physical_resource_id, response_data, logger):
+    if store is None:
+        return
+    try:
+        store.put(idempotency_key(event), {'PhysicalResourceId': physical_resource_id,
+                                           'Data': response_data})
+    except Exception as e:
+        logger.warning("Failed to save request to the idempotency store: {}".format(e))
+
+
+# In memory idempotency store, only sees requests handled by this container
+class MemoryStore(object):
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.records = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.records:
+                return None
+            self.records.move_to_end(key)
+            return self.records[key]
+
+    def put(self, key, record):
+        with self.lock:
+            self.records[key] = record
+            self.records.move_to_end(key)
+            while len(self.records) > self.max_entries:
+                self.records.popitem(last=False)
+
+
+# Idempotency store keeping one json file per request, e.g. on /tmp which
+# survives as long as the container does
+class FileStore(object):
+    def __init__(self, path='/tmp/crhelper-idempotency'):
+        self.path = path
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def filename(self, key):
+        return os.path.join(self.path, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, key):
+        try:
+            with open(self.filename(key)) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def put(self, key, record):
+        filename = self.filename(key)
+        with open(filename + '.tmp', 'w') as f:
+            json.dump(record, f)
+        os.replace(filename + '.tmp', filename)
+
+
+# Idempotency store in a DynamoDB table with a string hash key named "Key",
+# shared by every container. Records expire after ttl seconds when the table
+# has TTL enabled on the "ExpiresAt" attribute
+class DynamoDBStore(object):
+    def __init__(self, table_name, dynamodb=None, ttl=86400):
+        self.table_name = table_name
+        self.dynamodb = dynamodb or client('dynamodb')
+        self.ttl = ttl
+
+    def get(self, key):
+        item = self.dynamodb.get_item(TableName=self.table_name, Key={'Key': {'S': key}},
+                                      ConsistentRead=True).get('Item')
+        return json.loads(item['Record']['S']) if item else None
+
+    def put(self, key, record):
+        self.dynamodb.put_item(TableName=self.table_name, Item={
+            'Key': {'S': key},
+            'Record': {'S': json.dumps(record)},
+            'ExpiresAt': {'N': str(int(time.time() + self.ttl))}
+        })
 
 
 # Function that executes just before lambda execution times out
-def timeout(event, context, logger):
+def timeout(event, context, logger, metrics=None, guard=None):
+    if guard is not None and not guard.claim():
+        return
     logger.error("Execution is about to time out, sending failure message")
-    send(event, context, "FAILED", {}, None, reason="Execution timed out",
-         logger=logger)
+    metrics = metrics or PhaseTimer(event)
+    metrics.count('Timeouts')
+    try:
+        send(event, context, "FAILED", {}, None, reason="Execution timed out",
+             logger=logger, metrics=metrics)
+    finally:
+        metrics.emit()
+
+
+# Makes sure a single response is sent per request, whichever of the handler
+# or the timeout gets to claim it first
+class ResponseGuard(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sent = False
+
+    def claim(self):
+        with self.lock:
+            if self.sent:
+                return False
+            self.sent = True
+            return True
+
+
+# Runs callbacks at monotonic deadlines for every in-flight request from a heap
+# serviced by a single thread, instead of one timer thread per request.
+# Cancelled entries are dropped lazily, or all at once when they make up half
+# of the heap. Callbacks that fire get their own thread so a slow timeout
+# response doesn't hold up the other deadlines
+class DeadlineScheduler(object):
+    def __init__(self):
+        self.heap = []
+        self.cancelled = 0
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def schedule(self, deadline, callback, *args):
+        entry = [deadline, next(self.sequence), callback, args]
+        with self.condition:
+            heapq.heappush(self.heap, entry)
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name='crhelper-deadlines')
+                self.thread.daemon = True
+                self.thread.start()
+            if self.heap[0] is entry:
+                self.condition.notify()
+        return entry
+
+    def cancel(self, entry):
+        with self.condition:
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self.cancelled += 1
+            if self.cancelled > len(self.heap) // 2:
+                self.heap = [live for live in self.heap if live[2] is not None]
+                heapq.heapify(self.heap)
+                self.cancelled = 0
+
+    def run(self):
+        with self.condition:
+            while True:
+                while self.heap and self.heap[0][2] is None:
+                    heapq.heappop(self.heap)
+                    self.cancelled -= 1
+                if not self.heap:
+                    self.condition.wait()
+                    continue
+                wait = self.heap[0][0] - time.monotonic()
+                if wait > 0:
+                    self.condition.wait(wait)
+                    continue
+                entry = heapq.heappop(self.heap)
+                callback, args = entry[2], entry[3]
+                entry[2] = None
+                thread = threading.Thread(target=callback, args=args)
+                thread.daemon = True
+                thread.start()
+
+
+deadlines = DeadlineScheduler()
+
+
+def schedule_timeout(context, callback, *args):
+    # Fire 0.5s before the lambda times out
+    deadline = time.monotonic() + (context.get_remaining_time_in_millis() / 1000.00) - 0.5
+    return deadlines.schedule(deadline, callback, *args)
+
+
+# Records how long each phase of a request takes (Init, Handler, Serialize and
+# Send, in milliseconds) along with timeout and send retry counts, and writes
+# them to the log once as a CloudWatch embedded metric format line with the
+# RequestType and ResourceType as dimensions
+class PhaseTimer(object):
+    def __init__(self, event):
+        self.event = event
+        self.phases = OrderedDict()
+        self.counts = OrderedDict([('Timeouts', 0), ('Retries', 0)])
+        self.lock = threading.Lock()
+        self.emitted = False
+
+    def record(self, phase, start):
+        elapsed = (time.perf_counter() - start) * 1000
+        with self.lock:
+            self.phases[phase] = self.phases.get(phase, 0) + elapsed
+
+    def count(self, name):
+        with self.lock:
+            self.counts[name] += 1
+
+    def document(self):
+        with self.lock:
+            values = OrderedDict(self.phases)
+            values.update(self.counts)
+        metrics = [{'Name': name, 'Unit': 'Milliseconds' if name in self.phases else 'Count'}
+                   for name in values]
+        document = OrderedDict([
+            ('_aws', {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': METRICS_NAMESPACE,
+                    'Dimensions': [['RequestType', 'ResourceType']],
+                    'Metrics': metrics
+                }]
+            }),
+            ('RequestType', self.event.get('RequestType', 'Unknown')),
+            ('ResourceType', self.event.get('ResourceType', 'Unknown')),
+            ('RequestId', self.event.get('RequestId')),
+            ('LogicalResourceId', self.event.get('LogicalResourceId'))
+        ])
+        document.update(values)
+        return document
+
+    def emit(self):
+        with self.lock:
+            if self.emitted:
+                return
+            self.emitted = True
+        if METRICS_ENABLED:
+            # embedded metric format lines must be bare json, so they bypass the
+            # log formatter
+            print(json.dumps(self.document()))
 
 
 # Handler function
-def cfn_handler(event, context, create, update, delete, logger, init_failed):
+def cfn_handler(event, context, create, update, delete, logger, init_failed, store=None):
     logger.info("Lambda RequestId: {} CloudFormation RequestId: {}".format(context.aws_request_id, event['RequestId']))
 
     # Define an object to place any response information you would like to send
@@ -113,32 +577,324 @@ def cfn_handler(event, context, create, update, delete, logger, init_failed):
         send(event, context, "FAILED", response_data, physical_resource_id, logger, init_failed)
         raise Exception('FAILED')
 
-    # Setup timer to catch timeouts
-    t = threading.Timer((context.get_remaining_time_in_millis() / 1000.00) - 0.5,
-                        timeout, args=[event, context, logger])
-    t.start()
+    # Replay the response of a request that already completed
+    if replay(event, context, store, logger):
+        return
+
+    metrics = PhaseTimer(event)
+    start = time.perf_counter()
+
+    # Setup deadline to catch timeouts
+    guard = ResponseGuard()
+    claimed = False
+    t = schedule_timeout(context, timeout, event, context, logger, metrics, guard)
 
     try:
+        metrics.record('Init', start)
+        start = time.perf_counter()
         # Execute custom resource handlers
+        logger.info("Received a {} Request".format(event['RequestType']))
+        try:
+            if event['RequestType'] == 'Create':
+                physical_resource_id, response_data = create(event, context)
+            elif event['RequestType'] == 'Update':
+                physical_resource_id, response_data = update(event, context)
+            elif event['RequestType'] == 'Delete':
+                delete(event, context)
+        finally:
+            metrics.record('Handler', start)
+        remember(event, store, physical_resource_id, response_data, logger)
+
+        # Send response back to CloudFormation, unless the timeout already did
+        claimed = guard.claim()
+        if not claimed:
+            raise Exception("Completed after the timeout response was sent")
+        logger.info("Completed successfully, sending response to cfn")
+        send(event, context, "SUCCESS", response_data, physical_resource_id,
+             logger=logger, metrics=metrics)
+
+    # Catch any exceptions, log the stacktrace, send a failure back to
+    # CloudFormation (if no response was sent yet) and then raise an exception
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        if claimed or guard.claim():
+            send(event, context, "FAILED", response_data, physical_resource_id, logger=logger,
+                 reason=e, metrics=metrics)
+        raise Exception('FAILED')
+    finally:
+        # Cancel deadline before exit
+        deadlines.cancel(t)
+        metrics.emit()
+
+
+# Async handler function, create/update/delete are coroutine functions
+def async_cfn_handler(event, context, create, update, delete, logger, init_failed, store=None):
+    # asyncio is imported on first use, it is a large part of the import time
+    # of this module and only needed by async handlers
+    import asyncio
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=ASYNC_MAX_WORKERS))
+    try:
+        return loop.run_until_complete(
+            async_cfn_dispatch(event, context, create, update, delete, logger, init_failed, store))
+    finally:
+        # Closing the loop does not wait on executor threads still running
+        # blocking calls from a handler that timed out
+        loop.close()
+
+
+async def async_cfn_dispatch(event, context, create, update, delete, logger, init_failed,
+                             store=None):
+    import asyncio
+    logger.info("Lambda RequestId: {} CloudFormation RequestId: {}".format(context.aws_request_id, event['RequestId']))
+
+    response_data = {}
+    physical_resource_id = None
+
+    logger.debug("EVENT: {}".format(event))
+    # handle init failures
+    if init_failed:
+        send(event, context, "FAILED", response_data, physical_resource_id, logger, init_failed)
+        raise Exception('FAILED')
+
+    # Replay the response of a request that already completed
+    if replay(event, context, store, logger):
+        return
+
+    metrics = PhaseTimer(event)
+    start = time.perf_counter()
+
+    async def run_handler():
         logger.info("Received a {} Request".format(event['RequestType']))
         if event['RequestType'] == 'Create':
-            physical_resource_id, response_data = create(event, context)
+            return await create(event, context)
         elif event['RequestType'] == 'Update':
-            physical_resource_id, response_data = update(event, context)
+            return await update(event, context)
         elif event['RequestType'] == 'Delete':
-            delete(event, context)
+            await delete(event, context)
+        return physical_resource_id, response_data
 
-        # Send response back to CloudFormation
+    # wait_for cancels the handler at the deadline instead of racing a timer
+    # thread, so exactly one response is sent whichever way the handler ends
+    metrics.record('Init', start)
+    start = time.perf_counter()
+    handler = asyncio.ensure_future(run_handler())
+    error = None
+    try:
+        physical_resource_id, response_data = await asyncio.wait_for(
+            handler, (context.get_remaining_time_in_millis() / 1000.00) - 0.5)
+    except asyncio.TimeoutError as e:
+        # also the TimeoutError of the handler itself on Python 3.11+, the
+        # deadline only passed if wait_for cancelled the handler
+        if handler.cancelled():
+            metrics.record('Handler', start)
+            timeout(event, context, logger, metrics)
+            raise Exception('FAILED')
+        error = e
+    except Exception as e:
+        error = e
+    if error is not None:
+        metrics.record('Handler', start)
+        logger.error(error, exc_info=error)
+        try:
+            send(event, context, "FAILED", response_data, physical_resource_id, logger=logger,
+                 reason=error, metrics=metrics)
+        finally:
+            metrics.emit()
+        raise Exception('FAILED')
+    metrics.record('Handler', start)
+    remember(event, store, physical_resource_id, response_data, logger)
+
+    logger.info("Completed successfully, sending response to cfn")
+    try:
+        send(event, context, "SUCCESS", response_data, physical_resource_id,
+             logger=logger, metrics=metrics)
+    finally:
+        metrics.emit()
+
+
+# Batched handler function for SNS-backed custom resources delivered through an
+# SQS event source, every record is a separate custom resource request
+def batch_cfn_handler(event, context, create, update, delete, logger, init_failed, store=None):
+    events = [unwrap_message(record['body']) for record in event['Records']]
+    return dispatch_batch(events, context, create, update, delete, logger, init_failed, store)
+
+
+# Pull custom resource requests from an SQS queue in batches until it is drained
+# or the lambda is close to timing out. sqs is a boto3 SQS client or anything
+# with the same receive_message/delete_message interface
+def poll_queue(sqs, queue_url, context, create, update, delete, logger, init_failed,
+               batch_size=10, wait_time=1, store=None):
+    results = []
+    while context.get_remaining_time_in_millis() > POLL_MIN_REMAINING_MILLIS:
+        messages = sqs.receive_message(QueueUrl=queue_url,
+                                       MaxNumberOfMessages=batch_size,
+                                       WaitTimeSeconds=wait_time).get('Messages', [])
+        if not messages:
+            break
+        events = [unwrap_message(message['Body']) for message in messages]
+        results.extend(dispatch_batch(events, context, create, update, delete, logger,
+                                      init_failed, store))
+        # every event has been answered, successfully or not, so none are redelivered
+        for message in messages:
+            sqs.delete_message(QueueUrl=queue_url, ReceiptHandle=message['ReceiptHandle'])
+    return results
+
+
+def unwrap_message(body):
+    message = json.loads(body)
+    # SNS notifications wrap the request unless raw message delivery is enabled
+    if 'RequestType' not in message and 'Message' in message:
+        message = json.loads(message['Message'])
+    return message
+
+
+def dispatch_batch(events, context, create, update, delete, logger, init_failed, store=None):
+    mainlogger = logger.logger if isinstance(logger, logging.LoggerAdapter) else logger
+
+    def run(event):
+        event_logger = logging.LoggerAdapter(mainlogger, {'requestid': event['RequestId']})
+        start = time.monotonic()
+        status = "SUCCESS"
+        try:
+            cfn_handler(event, context, create, update, delete, event_logger, init_failed, store)
+        except Exception:
+            status = "FAILED"
+        return {
+            'RequestId': event['RequestId'],
+            'LogicalResourceId': event['LogicalResourceId'],
+            'RequestType': event['RequestType'],
+            'Status': status,
+            'Latency': time.monotonic() - start
+        }
+
+    if not events:
+        return []
+    with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(events))) as pool:
+        results = list(pool.map(run, events))
+    for result in results:
+        logger.info("{RequestType} {LogicalResourceId} ({RequestId}) {Status} in {Latency:.3f}s".format(**result))
+    return results
+
+
+# Re-invokes the lambda on a CloudWatch Events schedule while a poll mode
+# request is in progress. The request and the handler's in-progress state are
+# persisted in the rule's target input, so no other store is needed
+class EventsScheduler(object):
+
+    def __init__(self, interval=POLL_INTERVAL_MINUTES):
+        self.interval = interval
+        self.events = client('events')
+        self.awslambda = client('lambda')
+
+    def rule_name(self, event):
+        digest = hashlib.sha1(event['RequestId'].encode('utf-8')).hexdigest()
+        return 'crhelper-{}-{}'.format(event['LogicalResourceId'][:32], digest[:20])
+
+    def schedule(self, event, context, state):
+        name = self.rule_name(event)
+        poll_event = dict(event, CrHelperPoll={'Rule': name, 'State': state})
+        expression = 'rate({} minute{})'.format(self.interval, 's' if self.interval > 1 else '')
+        rule = self.events.put_rule(Name=name, ScheduleExpression=expression, State='ENABLED')
+        self.awslambda.add_permission(FunctionName=context.invoked_function_arn,
+                                      StatementId=name,
+                                      Action='lambda:InvokeFunction',
+                                      Principal='events.amazonaws.com',
+                                      SourceArn=rule['RuleArn'])
+        self.events.put_targets(Rule=name, Targets=[{
+            'Id': '1',
+            'Arn': context.invoked_function_arn,
+            'Input': json.dumps(poll_event)
+        }])
+
+    def cancel(self, event, context):
+        name = event['CrHelperPoll']['Rule']
+        self.events.remove_targets(Rule=name, Ids=['1'])
+        self.events.delete_rule(Name=name)
+        self.awslambda.remove_permission(FunctionName=context.invoked_function_arn,
+                                         StatementId=name)
+
+
+# Poll mode handler function, create/update/delete start the operation and
+# return a json serializable in-progress state. is_complete(event, context, state)
+# is then called on a schedule and returns None while the operation is running,
+# or (physical_resource_id, response_data) once it is done (anything other than
+# None for Delete). A response is only sent to CloudFormation once done.
+def poll_cfn_handler(event, context, create, update, delete, is_complete, logger,
+                     init_failed, scheduler=None):
+    logger.info("Lambda RequestId: {} CloudFormation RequestId: {}".format(context.aws_request_id, event['RequestId']))
+
+    response_data = {}
+    physical_resource_id = None
+    poll = event.get('CrHelperPoll')
+
+    logger.debug("EVENT: {}".format(event))
+    # handle init failures
+    if init_failed:
+        send(event, context, "FAILED", response_data, physical_resource_id, logger, init_failed)
+        raise Exception('FAILED')
+
+    if scheduler is None:
+        scheduler = EventsScheduler()
+
+    def stop_polling():
+        if poll:
+            try:
+                scheduler.cancel(event, context)
+            except Exception as e:
+                logger.error("Failed to remove poll schedule: {}".format(e))
+
+    def poll_timeout():
+        if guard.claim():
+            stop_polling()
+            timeout(event, context, logger)
+
+    # Setup deadline to catch timeouts
+    guard = ResponseGuard()
+    claimed = False
+    t = schedule_timeout(context, poll_timeout)
+
+    try:
+        if not poll:
+            logger.info("Received a {} Request".format(event['RequestType']))
+            state = None
+            if event['RequestType'] == 'Create':
+                state = create(event, context)
+            elif event['RequestType'] == 'Update':
+                state = update(event, context)
+            elif event['RequestType'] == 'Delete':
+                state = delete(event, context)
+            if guard.sent:
+                raise Exception("Started after the timeout response was sent")
+            logger.info("Request in progress, scheduling completion checks")
+            scheduler.schedule(event, context, state)
+            return
+
+        logger.info("Checking completion of {} Request".format(event['RequestType']))
+        result = is_complete(event, context, poll['State'])
+        if result is None:
+            logger.info("Request still in progress")
+            return
+        if event['RequestType'] != 'Delete':
+            physical_resource_id, response_data = result
+
+        claimed = guard.claim()
+        if not claimed:
+            raise Exception("Completed after the timeout response was sent")
+        stop_polling()
         logger.info("Completed successfully, sending response to cfn")
         send(event, context, "SUCCESS", response_data, physical_resource_id,
              logger=logger)
 
-    # Catch any exceptions, log the stacktrace, send a failure back to
-    # CloudFormation and then raise an exception
+    # Catch any exceptions, log the stacktrace, stop polling, send a failure
+    # back to CloudFormation (if no response was sent yet) and then raise an
+    # exception
     except Exception as e:
         logger.error(e, exc_info=True)
-        send(event, context, "FAILED", response_data, physical_resource_id, logger=logger, reason=e)
+        if claimed or guard.claim():
+            stop_polling()
+            send(event, context, "FAILED", response_data, physical_resource_id, logger=logger, reason=e)
         raise Exception('FAILED')
     finally:
-        # Cancel timer before exit
-        t.cancel()
+        # Cancel deadline before exit
+        deadlines.cancel(t)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+#
+# local_cfn.py
+#
+# Local stand-ins for the CloudFormation side of a custom resource, used to
+# exercise crhelper without deploying a stack.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##################################################################################################
+
+import io
+import itertools
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class ResponseEndpoint(object):
+    """
+    Stand-in for the presigned S3 ResponseURL CloudFormation hands out.
+
+    Every PUT is recorded in `responses` as (path, parsed body), and by RequestId
+    in `by_request`. `latency` seconds
+    are slept before answering and `failures` is a list of status codes returned,
+    in order, before the endpoint starts answering 200.
+    """
+
+    def __init__(self, latency=0, failures=None):
+        self.latency = latency
+        self.failures = list(failures or [])
+        self.responses = []
+        self.by_request = {}
+        self.attempts = 0
+        self.connections = set()
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler_class(),
+                                          bind_and_activate=False)
+        # the default listen backlog of 5 stalls concurrent senders on SYN retries
+        self.server.request_queue_size = 128
+        self.server.server_bind()
+        self.server.server_activate()
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+
+    def handler_class(self):
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_PUT(self):
+                body = self.rfile.read(int(self.headers.get('content-length', 0)))
+                with endpoint.lock:
+                    endpoint.attempts += 1
+                    endpoint.connections.add(self.client_address)
+                    status = endpoint.failures.pop(0) if endpoint.failures else 200
+                    if status == 200:
+                        response = json.loads(body)
+                        endpoint.responses.append((self.path, response))
+                        endpoint.by_request[response['RequestId']] = response
+                if endpoint.latency:
+                    time.sleep(endpoint.latency)
+                self.send_response(status)
+                self.send_header('content-length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def url(self, path='/response'):
+        return 'http://127.0.0.1:{}{}'.format(self.server.server_address[1], path)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class LambdaContext(object):
+    """
+    Minimal stand-in for the lambda context object, the remaining time counts
+    down from `timeout` seconds after creation.
+    """
+
+    def __init__(self, timeout=30, aws_request_id='local-request'):
+        self.aws_request_id = aws_request_id
+        self.log_stream_name = 'local/log-stream'
+        self.function_name = 'local-function'
+        self.invoked_function_arn = 'arn:aws:lambda:us-east-1:123456789012:function:local-function'
+        self.deadline = time.monotonic() + timeout
+
+    def get_remaining_time_in_millis(self):
+        return int(max(self.deadline - time.monotonic(), 0) * 1000)
+
+
+def make_event(response_url, request_type='Create', request_id='request-1',
+               logical_id='MyResource', properties=None, physical_id=None,
+               old_properties=None):
+    event = {
+        'RequestType': request_type,
+        'ResponseURL': response_url,
+        'StackId': 'arn:aws:cloudformation:us-east-1:123456789012:stack/local/0000',
+        'RequestId': request_id,
+        'ResourceType': 'Custom::Local',
+        'LogicalResourceId': logical_id,
+        'ResourceProperties': dict(properties or {}),
+    }
+    if physical_id:
+        event['PhysicalResourceId'] = physical_id
+    if old_properties is not None:
+        event['OldResourceProperties'] = dict(old_properties)
+    return event
+
+
+def sns_envelope(event):
+    return json.dumps({
+        'Type': 'Notification',
+        'TopicArn': 'arn:aws:sns:us-east-1:123456789012:local',
+        'Message': json.dumps(event),
+    })
+
+
+class LocalQueue(object):
+    """
+    In-memory stand-in for the subset of the boto3 SQS client crhelper uses.
+    Received messages stay in flight until they are deleted.
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.in_flight = {}
+        self.receipts = itertools.count()
+        self.lock = threading.Lock()
+
+    def send_message(self, QueueUrl, MessageBody):
+        with self.lock:
+            self.messages.append(MessageBody)
+        return {}
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages=1, WaitTimeSeconds=0):
+        with self.lock:
+            batch = self.messages[:MaxNumberOfMessages]
+            del self.messages[:MaxNumberOfMessages]
+            received = []
+            for body in batch:
+                handle = 'receipt-{}'.format(next(self.receipts))
+                self.in_flight[handle] = body
+                received.append({'Body': body, 'ReceiptHandle': handle})
+        return {'Messages': received} if received else {}
+
+    def delete_message(self, QueueUrl, ReceiptHandle):
+        with self.lock:
+            del self.in_flight[ReceiptHandle]
+        return {}
+
+
+class LocalScheduler(object):
+    """
+    Stand-in for crhelper.EventsScheduler, pending() returns the events the
+    schedule would re-invoke the lambda with.
+    """
+
+    def __init__(self):
+        self.rules = {}
+
+    def schedule(self, event, context, state):
+        name = 'rule-{}'.format(event['RequestId'])
+        self.rules[name] = dict(event, CrHelperPoll={'Rule': name, 'State': state})
+
+    def cancel(self, event, context):
+        del self.rules[event['CrHelperPoll']['Rule']]
+
+    def pending(self):
+        return list(self.rules.values())
+
+
+class LocalDynamoDB(object):
+    """
+    In-memory stand-in for the get_item/put_item calls of the boto3 DynamoDB
+    client, keyed on the table's "Key" attribute.
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self.lock = threading.Lock()
+
+    def get_item(self, TableName, Key, ConsistentRead=False):
+        with self.lock:
+            item = self.tables.get(TableName, {}).get(Key['Key']['S'])
+        return {'Item': item} if item else {}
+
+    def put_item(self, TableName, Item):
+        with self.lock:
+            self.tables.setdefault(TableName, {})[Item['Key']['S']] = Item
+        return {}
+
+
+class LocalS3(object):
+    """
+    In-memory stand-in for the put_object/get_object calls of the boto3 S3 client.
+    """
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[(Bucket, Key)] = Body
+        return {}
+
+    def get_object(self, Bucket, Key):
+        return {'Body': io.BytesIO(self.objects[(Bucket, Key)])}
@@ -0,0 +1,490 @@
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import bench_crhelper
+import cfn_emulator
+import crhelper
+from local_cfn import (LambdaContext, LocalDynamoDB, LocalQueue, LocalS3, LocalScheduler,
+                       ResponseEndpoint, make_event, sns_envelope)
+
+logger = logging.getLogger('test')
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(crhelper, 'SEND_BACKOFF_BASE', 0.01)
+    monkeypatch.setattr(crhelper, 'SEND_BACKOFF_CAP', 0.05)
+
+
+def test_send_reuses_connection():
+    with ResponseEndpoint() as endpoint:
+        context = LambdaContext()
+        for i in range(3):
+            event = make_event(endpoint.url(), request_id='request-{}'.format(i))
+            crhelper.send(event, context, 'SUCCESS', {'Key': 'Value'}, 'my-id', logger)
+
+    assert len(endpoint.responses) == 3
+    assert len(endpoint.connections) == 1
+    body = endpoint.responses[0][1]
+    assert body['Status'] == 'SUCCESS'
+    assert body['PhysicalResourceId'] == 'my-id'
+    assert body['Data'] == {'Key': 'Value'}
+
+
+def test_send_retries_server_errors():
+    with ResponseEndpoint(failures=[503, 500]) as endpoint:
+        event = make_event(endpoint.url())
+        crhelper.send(event, LambdaContext(), 'SUCCESS', {}, 'my-id', logger)
+
+    assert endpoint.attempts == 3
+    assert len(endpoint.responses) == 1
+
+
+def test_send_does_not_retry_client_errors():
+    with ResponseEndpoint(failures=[403]) as endpoint:
+        event = make_event(endpoint.url())
+        crhelper.send(event, LambdaContext(), 'SUCCESS', {}, 'my-id', logger)
+
+    assert endpoint.attempts == 1
+    assert endpoint.responses == []
+
+
+def test_send_gives_up_after_max_attempts():
+    failures = [500] * crhelper.SEND_MAX_ATTEMPTS
+    with ResponseEndpoint(failures=failures) as endpoint:
+        event = make_event(endpoint.url())
+        with pytest.raises(Exception):
+            crhelper.send(event, LambdaContext(), 'SUCCESS', {}, 'my-id', logger)
+
+    assert endpoint.attempts == crhelper.SEND_MAX_ATTEMPTS
+
+
+def test_send_respects_deadline():
+    with ResponseEndpoint(latency=0.3, failures=[500] * 10) as endpoint:
+        event = make_event(endpoint.url())
+        with pytest.raises(Exception):
+            crhelper.send(event, LambdaContext(timeout=0.5), 'SUCCESS', {}, 'my-id', logger)
+
+    assert endpoint.attempts < crhelper.SEND_MAX_ATTEMPTS
+
+
+async def fan_out_create(event, context):
+    async def describe(i):
+        await asyncio.sleep(0.2)
+        return i
+
+    results = await asyncio.gather(*[describe(i) for i in range(50)])
+    return 'my-id', {'Count': len(results)}
+
+
+async def slow_create(event, context):
+    await asyncio.sleep(10)
+    return 'my-id', {}
+
+
+async def failing_create(event, context):
+    raise ValueError('boom')
+
+
+async def noop(event, context):
+    return 'unused', {}
+
+
+def test_async_handler_runs_calls_concurrently():
+    with ResponseEndpoint() as endpoint:
+        start = time.monotonic()
+        crhelper.async_cfn_handler(make_event(endpoint.url()), LambdaContext(),
+                                   fan_out_create, noop, noop, logger, False)
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 1
+    assert endpoint.responses[0][1]['Status'] == 'SUCCESS'
+    assert endpoint.responses[0][1]['Data'] == {'Count': 50}
+
+
+def test_async_handler_times_out_with_single_response():
+    with ResponseEndpoint() as endpoint:
+        with pytest.raises(Exception, match='FAILED'):
+            crhelper.async_cfn_handler(make_event(endpoint.url()), LambdaContext(timeout=1),
+                                       slow_create, noop, noop, logger, False)
+
+    assert len(endpoint.responses) == 1
+    assert endpoint.responses[0][1]['Status'] == 'FAILED'
+    assert 'timed out' in endpoint.responses[0][1]['Reason']
+
+
+async def upstream_timeout_create(event, context):
+    raise TimeoutError('the upstream API did not answer')
+
+
+def test_async_handler_timeout_error_is_a_handler_error():
+    with ResponseEndpoint() as endpoint:
+        with pytest.raises(Exception, match='FAILED'):
+            crhelper.async_cfn_handler(make_event(endpoint.url()), LambdaContext(),
+                                       upstream_timeout_create, noop, noop, logger, False)
+
+    (path, body), = endpoint.responses
+    assert body['Status'] == 'FAILED'
+    assert body['Reason'].startswith('the upstream API did not answer')
+
+
+def test_async_handler_reports_handler_errors():
+    with ResponseEndpoint() as endpoint:
+        with pytest.raises(Exception, match='FAILED'):
+            crhelper.async_cfn_handler(make_event(endpoint.url()), LambdaContext(),
+                                       failing_create, noop, noop, logger, False)
+
+    assert len(endpoint.responses) == 1
+    assert endpoint.responses[0][1]['Status'] == 'FAILED'
+    assert 'boom' in endpoint.responses[0][1]['Reason']
+
+
+def slow_sync_create(event, context):
+    time.sleep(0.2)
+    if event['ResourceProperties'].get('Fail'):
+        raise ValueError('boom')
+    return event['LogicalResourceId'], {}
+
+
+def sync_noop(event, context):
+    return event.get('PhysicalResourceId'), {}
+
+
+def test_batch_handler_dispatches_sqs_records_concurrently():
+    with ResponseEndpoint() as endpoint:
+        records = [{'body': sns_envelope(make_event(endpoint.url('/{}'.format(i)),
+                                                    request_id='request-{}'.format(i),
+                                                    logical_id='Resource{}'.format(i),
+                                                    properties={'Fail': i == 3}))}
+                   for i in range(12)]
+        start = time.monotonic()
+        results = crhelper.batch_cfn_handler({'Records': records}, LambdaContext(),
+                                             slow_sync_create, sync_noop, sync_noop, logger, False)
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 1
+    assert len(endpoint.responses) == 12
+    assert sorted(path for path, body in endpoint.responses) == sorted('/{}'.format(i) for i in range(12))
+    assert [result['Status'] for result in results].count('FAILED') == 1
+    assert results[3]['Status'] == 'FAILED'
+    assert all(result['Latency'] >= 0.2 for result in results)
+
+
+def test_poll_queue_drains_queue(monkeypatch):
+    monkeypatch.setattr(crhelper, 'POLL_MIN_REMAINING_MILLIS', 0)
+    queue = LocalQueue()
+    with ResponseEndpoint() as endpoint:
+        for i in range(25):
+            event = make_event(endpoint.url(), request_id='request-{}'.format(i))
+            queue.send_message(QueueUrl='local', MessageBody=json.dumps(event))
+        results = crhelper.poll_queue(queue, 'local', LambdaContext(),
+                                      slow_sync_create, sync_noop, sync_noop, logger, False)
+
+    assert len(results) == 25
+    assert len(endpoint.responses) == 25
+    assert queue.messages == [] and queue.in_flight == {}
+
+
+def start_create(event, context):
+    return {'ClusterName': 'my-cluster', 'Checks': 2}
+
+
+def check_complete(event, context, state):
+    checks = context.checks = getattr(context, 'checks', 0) + 1
+    if checks < state['Checks']:
+        return None
+    return state['ClusterName'], {'Endpoint': 'https://my-cluster'}
+
+
+def test_poll_handler_only_responds_when_complete():
+    scheduler = LocalScheduler()
+    context = LambdaContext()
+    with ResponseEndpoint() as endpoint:
+        crhelper.poll_cfn_handler(make_event(endpoint.url()), context, start_create,
+                                  sync_noop, sync_noop, check_complete, logger, False, scheduler)
+        assert endpoint.responses == []
+        poll_event, = scheduler.pending()
+        assert poll_event['CrHelperPoll']['State']['ClusterName'] == 'my-cluster'
+
+        crhelper.poll_cfn_handler(poll_event, context, start_create,
+                                  sync_noop, sync_noop, check_complete, logger, False, scheduler)
+        assert endpoint.responses == []
+        assert scheduler.pending() == [poll_event]
+
+        crhelper.poll_cfn_handler(poll_event, context, start_create,
+                                  sync_noop, sync_noop, check_complete, logger, False, scheduler)
+
+    assert scheduler.pending() == []
+    body, = [body for path, body in endpoint.responses]
+    assert body['Status'] == 'SUCCESS'
+    assert body['PhysicalResourceId'] == 'my-cluster'
+    assert body['Data'] == {'Endpoint': 'https://my-cluster'}
+
+
+def test_poll_handler_stops_polling_on_failure():
+    scheduler = LocalScheduler()
+
+    def failing_check(event, context, state):
+        raise ValueError('boom')
+
+    with ResponseEndpoint() as endpoint:
+        crhelper.poll_cfn_handler(make_event(endpoint.url()), LambdaContext(), start_create,
+                                  sync_noop, sync_noop, failing_check, logger, False, scheduler)
+        with pytest.raises(Exception, match='FAILED'):
+            crhelper.poll_cfn_handler(scheduler.pending()[0], LambdaContext(), start_create,
+                                      sync_noop, sync_noop, failing_check, logger, False, scheduler)
+
+    assert scheduler.pending() == []
+    body, = [body for path, body in endpoint.responses]
+    assert body['Status'] == 'FAILED'
+
+
+def test_log_config_adds_missing_handler_and_configures_once(monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, 'handlers', [])
+    monkeypatch.setitem(crhelper.log_state, 'handler', None)
+
+    crhelper.log_config({'RequestId': 'one', 'ResourceProperties': {'botolevel': 'debug'}})
+    handler = root.handlers[0]
+    formatter = handler.formatter
+    crhelper.log_config({'RequestId': 'two'})
+
+    assert root.handlers == [handler]
+    assert handler.formatter is formatter
+    assert crhelper.log_state['levels'] == ('WARNING', 'ERROR')
+
+
+def test_parse_properties_converts_and_caches():
+    schema = {'Name': str, 'Count': int, 'Enabled': (bool, False), 'Subnets': (list, [])}
+    event = {'ResourceProperties': {'Name': 'x', 'Count': '3', 'Subnets': '["a", "b"]'}}
+
+    assert crhelper.parse_properties(event, schema) == {
+        'Name': 'x', 'Count': 3, 'Enabled': False, 'Subnets': ['a', 'b']}
+    parser = crhelper.property_parsers[id(schema)]
+    crhelper.parse_properties(event, schema)
+    assert crhelper.property_parsers[id(schema)] is parser
+
+    with pytest.raises(ValueError, match='Count'):
+        crhelper.parse_properties({'ResourceProperties': {'Name': 'x'}}, schema)
+
+
+def test_parse_properties_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(crhelper, 'PROPERTY_PARSERS_MAX', 4)
+    schema = {'Count': int}
+    event = {'ResourceProperties': {'Count': '3'}}
+    crhelper.parse_properties(event, schema)
+
+    for i in range(10):
+        # a schema built on every invocation
+        assert crhelper.parse_properties(event, {'Count': int}) == {'Count': 3}
+        crhelper.parse_properties(event, schema)
+
+    assert len(crhelper.property_parsers) == 4
+    assert id(schema) in crhelper.property_parsers
+
+
+@pytest.fixture(params=['memory', 'file', 'dynamodb'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        return crhelper.MemoryStore()
+    if request.param == 'file':
+        return crhelper.FileStore(str(tmp_path))
+    return crhelper.DynamoDBStore('idempotency', dynamodb=LocalDynamoDB())
+
+
+def test_retried_request_is_replayed(store):
+    calls = []
+
+    def create(event, context):
+        calls.append(event['RequestId'])
+        return 'my-id-{}'.format(len(calls)), {'Call': len(calls)}
+
+    with ResponseEndpoint() as endpoint:
+        for request_id in ['request-1', 'request-1', 'request-2']:
+            event = make_event(endpoint.url(), request_id=request_id)
+            crhelper.cfn_handler(event, LambdaContext(), create, sync_noop, sync_noop,
+                                 logger, False, store)
+
+    assert calls == ['request-1', 'request-2']
+    bodies = [body for path, body in endpoint.responses]
+    assert [body['PhysicalResourceId'] for body in bodies] == ['my-id-1', 'my-id-1', 'my-id-2']
+    assert bodies[1]['Data'] == {'Call': 1}
+
+
+class BrokenStore(object):
+    def get(self, key):
+        raise IOError('throttled')
+
+    def put(self, key, record):
+        raise IOError('throttled')
+
+
+def test_unreadable_store_runs_the_handler():
+    with ResponseEndpoint() as endpoint:
+        crhelper.cfn_handler(make_event(endpoint.url()), LambdaContext(), sync_noop, sync_noop,
+                             sync_noop, logger, False, BrokenStore())
+
+    (path, body), = endpoint.responses
+    assert body['Status'] == 'SUCCESS'
+
+
+def test_unsendable_replay_fails():
+    store = crhelper.MemoryStore()
+    with ResponseEndpoint() as endpoint:
+        event = make_event(endpoint.url())
+        store.put(crhelper.idempotency_key(event), {'PhysicalResourceId': 'my-id', 'Data': {'Key': object()}})
+        with pytest.raises(Exception, match='FAILED'):
+            crhelper.cfn_handler(event, LambdaContext(), sync_noop, sync_noop, sync_noop, logger,
+                                 False, store)
+
+    (path, body), = endpoint.responses
+    assert (body['Status'], body['PhysicalResourceId']) == ('FAILED', 'my-id')
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = crhelper.MemoryStore(max_entries=2)
+    store.put('a', 1)
+    store.put('b', 2)
+    store.get('a')
+    store.put('c', 3)
+
+    assert store.get('b') is None
+    assert store.get('a') == 1 and store.get('c') == 3
+
+
+def emitted_metrics(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()
+            if line.startswith('{"_aws"')]
+
+
+def test_handler_emits_phase_timings(capsys):
+    with ResponseEndpoint(failures=[503]) as endpoint:
+        crhelper.cfn_handler(make_event(endpoint.url()), LambdaContext(), slow_sync_create,
+                             sync_noop, sync_noop, logger, False)
+
+    document, = emitted_metrics(capsys)
+    definition, = document['_aws']['CloudWatchMetrics']
+    assert definition['Dimensions'] == [['RequestType', 'ResourceType']]
+    assert document['RequestType'] == 'Create'
+    assert document['ResourceType'] == 'Custom::Local'
+    assert document['Handler'] >= 200
+    assert set(['Init', 'Serialize', 'Send']) <= set(document)
+    assert document['Retries'] == 1
+    assert document['Timeouts'] == 0
+
+
+def test_timed_out_handler_emits_timeout(capsys):
+    with ResponseEndpoint() as endpoint:
+        with pytest.raises(Exception, match='FAILED'):
+            crhelper.async_cfn_handler(make_event(endpoint.url()), LambdaContext(timeout=1),
+                                       slow_create, noop, noop, logger, False)
+
+    document, = emitted_metrics(capsys)
+    assert document['Timeouts'] == 1
+
+
+def create_subnet_map(event, context):
+    subnets = dict(('subnet-{:04d}'.format(i), '10.0.{}.0/24'.format(i)) for i in range(200))
+    return 'my-id', {'VpcId': 'vpc-1234', 'Subnets': subnets, 'Count': len(subnets)}
+
+
+def test_large_response_data_overflows_to_s3(monkeypatch):
+    s3 = LocalS3()
+    monkeypatch.setattr(crhelper, 'OVERFLOW_STORE', crhelper.S3Overflow('my-bucket', s3=s3))
+    with ResponseEndpoint() as endpoint:
+        crhelper.cfn_handler(make_event(endpoint.url()), LambdaContext(), create_subnet_map,
+                             sync_noop, sync_noop, logger, False)
+
+    body = endpoint.responses[0][1]
+    assert body['Status'] == 'SUCCESS'
+    assert len(json.dumps(body, separators=(',', ':'))) <= crhelper.RESPONSE_MAX_BYTES
+    assert body['Data']['VpcId'] == 'vpc-1234'
+    assert body['Data']['Count'] == 200
+    assert 'Subnets' not in body['Data']
+    stored = s3.get_object(Bucket=body['Data']['DataBucket'], Key=body['Data']['DataKey'])
+    assert json.loads(stored['Body'].read())['Subnets']['subnet-0199'] == '10.0.199.0/24'
+
+
+def test_large_response_data_without_store_fails_early():
+    with ResponseEndpoint() as endpoint:
+        with pytest.raises(Exception, match='FAILED'):
+            crhelper.cfn_handler(make_event(endpoint.url()), LambdaContext(), create_subnet_map,
+                                 sync_noop, sync_noop, logger, False)
+
+    body = endpoint.responses[0][1]
+    assert body['Status'] == 'FAILED'
+    assert 'OVERFLOW_STORE' in body['Reason']
+
+
+def test_handler_finishing_after_timeout_sends_single_response():
+    def late_create(event, context):
+        time.sleep(0.4)
+        return 'my-id', {}
+
+    with ResponseEndpoint() as endpoint:
+        with pytest.raises(Exception, match='FAILED'):
+            crhelper.cfn_handler(make_event(endpoint.url()), LambdaContext(timeout=0.7),
+                                 late_create, sync_noop, sync_noop, logger, False)
+        time.sleep(0.1)
+
+    body, = [body for path, body in endpoint.responses]
+    assert body['Status'] == 'FAILED'
+    assert 'timed out' in body['Reason']
+
+
+def test_deadline_scheduler_stress():
+    scheduler = crhelper.DeadlineScheduler()
+    sent = Counter()
+    lock = threading.Lock()
+    threads = []
+
+    def respond(request_id, guard, outcome):
+        if guard.claim():
+            with lock:
+                sent[request_id, outcome] += 1
+
+    def complete(request_id):
+        guard = crhelper.ResponseGuard()
+        entry = scheduler.schedule(time.monotonic() + random.uniform(0, 0.05),
+                                   respond, request_id, guard, 'timeout')
+        time.sleep(random.uniform(0, 0.05))
+        respond(request_id, guard, 'success')
+        scheduler.cancel(entry)
+        threads.append(threading.active_count())
+
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        list(pool.map(complete, range(5000)))
+    time.sleep(0.1)
+
+    per_request = Counter(request_id for request_id, outcome in sent.elements())
+    assert len(per_request) == 5000
+    assert set(per_request.values()) == {1}
+    assert {outcome for request_id, outcome in sent} == {'timeout', 'success'}
+    assert max(threads) < 200
+    assert scheduler.heap == []
+
+
+def test_emulator_reports_latency_and_timeouts():
+    with ResponseEndpoint() as endpoint:
+        fast = cfn_emulator.run_level(endpoint, 4, 8, {}, cfn_emulator.sample_handlers(0.01), 30)
+        slow = cfn_emulator.run_level(endpoint, 4, 4, {}, cfn_emulator.sample_handlers(0.6), 1)
+
+    assert fast['requests'] == 24
+    assert fast['failure_rate'] == 0
+    assert 0.01 <= fast['p50'] <= fast['p99']
+    assert slow['timeout_rate'] == 1
+
+
+def test_bench_runs():
+    result = bench_crhelper.run(3)
+
+    assert len(result['timings']) == 3
+    assert result['import'] > 0